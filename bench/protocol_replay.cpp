@@ -0,0 +1,341 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+// Replays recorded server responses through test_stream, exercising the whole
+// read path (message_parser, deserialize_row, row_impl, static parsing) and the
+// write path for the request (message_writer). Reports rows/s, bytes/s and
+// heap allocations per row as JSON, for:
+//   - text (query) vs binary (prepared statement) protocol
+//   - dynamic (results) vs static (static_results) interface
+//   - small vs large rows
+
+#include <boost/mysql/detail/config.hpp>
+
+#ifdef BOOST_MYSQL_CXX14
+
+#include <boost/mysql/buffer_params.hpp>
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/statement.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/any_execution_request.hpp>
+#include <boost/mysql/detail/execution_processor/execution_processor.hpp>
+#include <boost/mysql/detail/execution_processor/results_impl.hpp>
+#include <boost/mysql/detail/execution_processor/static_results_impl.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/execute.hpp>
+
+#include <boost/describe/class.hpp>
+
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <new>
+#include <string>
+#include <vector>
+
+#include "test_unit/create_channel.hpp"
+#include "test_unit/create_coldef_frame.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/create_meta.hpp"
+#include "test_unit/create_ok.hpp"
+#include "test_unit/create_ok_frame.hpp"
+#include "test_unit/create_statement.hpp"
+#include "test_unit/test_stream.hpp"
+
+using namespace boost::mysql;
+using namespace boost::mysql::test;
+using detail::any_execution_request;
+using detail::channel;
+using detail::execution_processor;
+using detail::resultset_encoding;
+
+// Allocation tracking. Only allocations performed while counting is enabled are recorded
+namespace {
+bool counting_allocations = false;
+std::size_t num_allocations = 0;
+}  // namespace
+
+void* operator new(std::size_t size)
+{
+    if (counting_allocations)
+        ++num_allocations;
+    if (void* res = std::malloc(size ? size : 1))
+        return res;
+    throw std::bad_alloc();
+}
+
+void operator delete(void* ptr) noexcept { std::free(ptr); }
+void operator delete(void* ptr, std::size_t) noexcept { std::free(ptr); }
+
+namespace {
+
+constexpr std::size_t num_rows = 10000;
+constexpr std::size_t num_repetitions = 10;
+
+// Row types. Small rows are typical of OLTP queries; large rows have long strings,
+// spanning several reads and requiring buffer growth
+struct small_row
+{
+    std::int64_t id;
+    std::int32_t count;
+    double value;
+    std::string name;
+};
+BOOST_DESCRIBE_STRUCT(small_row, (), (id, count, value, name))
+
+struct large_row
+{
+    std::int64_t id;
+    double value;
+    std::string payload1;
+    std::string payload2;
+    std::string payload3;
+};
+BOOST_DESCRIBE_STRUCT(large_row, (), (id, value, payload1, payload2, payload3))
+
+std::vector<detail::coldef_view> small_row_meta()
+{
+    return {
+        meta_builder().type(column_type::bigint).name("id").nullable(false).build_coldef(),
+        meta_builder().type(column_type::int_).name("count").nullable(false).build_coldef(),
+        meta_builder().type(column_type::double_).name("value").nullable(false).build_coldef(),
+        meta_builder().type(column_type::varchar).name("name").nullable(false).build_coldef(),
+    };
+}
+
+std::vector<detail::coldef_view> large_row_meta()
+{
+    return {
+        meta_builder().type(column_type::bigint).name("id").nullable(false).build_coldef(),
+        meta_builder().type(column_type::double_).name("value").nullable(false).build_coldef(),
+        meta_builder().type(column_type::text).name("payload1").nullable(false).build_coldef(),
+        meta_builder().type(column_type::text).name("payload2").nullable(false).build_coldef(),
+        meta_builder().type(column_type::text).name("payload3").nullable(false).build_coldef(),
+    };
+}
+
+std::string make_string(std::size_t i, std::size_t size)
+{
+    std::string res(size, 'a');
+    for (std::size_t j = 0; j < size; ++j)
+        res[j] = static_cast<char>('a' + (i + j) % 26);
+    return res;
+}
+
+// Row serialization. Lengths are always < 2^16
+void add_lenenc(std::vector<std::uint8_t>& to, const std::string& value)
+{
+    if (value.size() < 251u)
+    {
+        to.push_back(static_cast<std::uint8_t>(value.size()));
+    }
+    else
+    {
+        to.push_back(0xfc);
+        to.push_back(static_cast<std::uint8_t>(value.size() & 0xff));
+        to.push_back(static_cast<std::uint8_t>(value.size() >> 8));
+    }
+    to.insert(to.end(), value.begin(), value.end());
+}
+
+template <class T>
+void add_fixed(std::vector<std::uint8_t>& to, T value)
+{
+    std::uint8_t buff[sizeof(T)];
+    std::memcpy(buff, &value, sizeof(T));  // assumes a little endian host
+    to.insert(to.end(), buff, buff + sizeof(T));
+}
+
+std::vector<std::uint8_t> small_row_body(resultset_encoding enc, std::size_t i)
+{
+    auto id = static_cast<std::int64_t>(i * 1000003);
+    auto count = static_cast<std::int32_t>(i % 1000);
+    double value = static_cast<double>(i) + 0.25;
+    auto name = make_string(i, 16);
+    if (enc == resultset_encoding::text)
+    {
+        std::vector<std::uint8_t> res;
+        add_lenenc(res, std::to_string(id));
+        add_lenenc(res, std::to_string(count));
+        add_lenenc(res, std::to_string(value));
+        add_lenenc(res, name);
+        return res;
+    }
+
+    std::vector<std::uint8_t> res{0x00, 0x00};  // header, null bitmap
+    add_fixed(res, id);
+    add_fixed(res, count);
+    add_fixed(res, value);
+    add_lenenc(res, name);
+    return res;
+}
+
+std::vector<std::uint8_t> large_row_body(resultset_encoding enc, std::size_t i)
+{
+    auto id = static_cast<std::int64_t>(i * 1000003);
+    double value = static_cast<double>(i) + 0.25;
+    auto p1 = make_string(i, 300);
+    auto p2 = make_string(i + 1, 1000);
+    auto p3 = make_string(i + 2, 3000);
+    if (enc == resultset_encoding::text)
+    {
+        std::vector<std::uint8_t> res;
+        add_lenenc(res, std::to_string(id));
+        add_lenenc(res, std::to_string(value));
+        add_lenenc(res, p1);
+        add_lenenc(res, p2);
+        add_lenenc(res, p3);
+        return res;
+    }
+
+    std::vector<std::uint8_t> res{0x00, 0x00};  // header, null bitmap
+    add_fixed(res, id);
+    add_fixed(res, value);
+    add_lenenc(res, p1);
+    add_lenenc(res, p2);
+    add_lenenc(res, p3);
+    return res;
+}
+
+// The bytes a server would send in response to the execution request
+std::vector<std::uint8_t> record_response(
+    resultset_encoding enc,
+    const std::vector<detail::coldef_view>& meta,
+    std::vector<std::uint8_t> (*row_body)(resultset_encoding, std::size_t)
+)
+{
+    std::uint8_t seqnum = 1;
+    auto res = create_frame(seqnum++, {static_cast<std::uint8_t>(meta.size())});
+    for (const auto& col : meta)
+    {
+        auto frame = create_coldef_frame(seqnum++, col);
+        res.insert(res.end(), frame.begin(), frame.end());
+    }
+    for (std::size_t i = 0; i < num_rows; ++i)
+    {
+        auto frame = create_frame(seqnum++, row_body(enc, i));
+        res.insert(res.end(), frame.begin(), frame.end());
+    }
+    auto frame = create_eof_frame(seqnum, ok_builder().build());
+    res.insert(res.end(), frame.begin(), frame.end());
+    return res;
+}
+
+struct bench_result
+{
+    double rows_per_second;
+    double bytes_per_second;
+    double allocations_per_row;
+};
+
+bench_result run(resultset_encoding enc, const std::vector<std::uint8_t>& response, execution_processor& proc)
+{
+    using clock = std::chrono::steady_clock;
+
+    auto stmt = statement_builder().id(1).num_params(0).build();
+    any_execution_request req = enc == resultset_encoding::text ? any_execution_request("SELECT * FROM bench")
+                                                                : any_execution_request(stmt, {});
+    double best = 1e300;
+    std::size_t allocs = 0;
+
+    for (std::size_t rep = 0; rep < num_repetitions; ++rep)
+    {
+        // Setup is not measured
+        channel chan = create_channel(buffer_params::default_initial_read_size);
+        get_stream(chan).add_bytes(response);
+        error_code err;
+        diagnostics diag;
+
+        num_allocations = 0;
+        counting_allocations = true;
+        auto start = clock::now();
+        detail::execute_impl(chan, req, proc, err, diag);
+        std::chrono::duration<double> elapsed = clock::now() - start;
+        counting_allocations = false;
+
+        if (err)
+        {
+            std::fprintf(stderr, "Error executing: %s\n", err.message().c_str());
+            std::exit(1);
+        }
+        if (elapsed.count() < best)
+        {
+            best = elapsed.count();
+            allocs = num_allocations;
+        }
+    }
+
+    return {
+        num_rows / best,
+        response.size() / best,
+        static_cast<double>(allocs) / num_rows,
+    };
+}
+
+bool first_result = true;
+
+void report(const char* protocol, const char* interface, const char* row_size, const bench_result& r)
+{
+    std::printf(
+        "%s  {\"protocol\": \"%s\", \"interface\": \"%s\", \"row_size\": \"%s\", \"rows_per_second\": %.0f, "
+        "\"bytes_per_second\": %.0f, \"allocations_per_row\": %.3f}",
+        first_result ? "" : ",\n",
+        protocol,
+        interface,
+        row_size,
+        r.rows_per_second,
+        r.bytes_per_second,
+        r.allocations_per_row
+    );
+    first_result = false;
+}
+
+template <class StaticRow>
+void run_row_size(
+    const char* row_size,
+    const std::vector<detail::coldef_view>& meta,
+    std::vector<std::uint8_t> (*row_body)(resultset_encoding, std::size_t)
+)
+{
+    const resultset_encoding encodings[] = {resultset_encoding::text, resultset_encoding::binary};
+    for (auto enc : encodings)
+    {
+        const char* protocol = enc == resultset_encoding::text ? "text" : "binary";
+        auto response = record_response(enc, meta, row_body);
+
+        detail::results_impl dynamic_proc;
+        report(protocol, "dynamic", row_size, run(enc, response, dynamic_proc));
+
+        detail::static_results_impl<StaticRow> static_proc;
+        report(protocol, "static", row_size, run(enc, response, static_proc.get_interface()));
+    }
+}
+
+}  // namespace
+
+int main()
+{
+    std::printf("[\n");
+    run_row_size<small_row>("small", small_row_meta(), &small_row_body);
+    run_row_size<large_row>("large", large_row_meta(), &large_row_body);
+    std::printf("\n]\n");
+}
+
+#else
+
+#include <cstdio>
+
+int main() { std::printf("This benchmark requires C++14\n"); }
+
+#endif
@@ -0,0 +1,233 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+// Compares the two ways static_execution_state and static_results can decode rows:
+//   - fields: deserialize the message into a field_view vector, then parse the
+//     vector into the row type through the pos_map (used when columns are reordered).
+//   - direct: deserialize each field and parse it straight into the row type
+//     (used when columns are in the same order as the row type's members).
+
+#include <boost/mysql/detail/config.hpp>
+
+#ifdef BOOST_MYSQL_CXX14
+
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/field_view.hpp>
+#include <boost/mysql/metadata.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/coldef_view.hpp>
+#include <boost/mysql/detail/flags.hpp>
+#include <boost/mysql/detail/resultset_encoding.hpp>
+#include <boost/mysql/detail/row_field_reader.hpp>
+#include <boost/mysql/detail/row_impl.hpp>
+#include <boost/mysql/detail/typing/row_traits.hpp>
+
+#include <boost/mysql/impl/internal/protocol/protocol.hpp>
+
+#include <boost/core/span.hpp>
+#include <boost/describe/class.hpp>
+
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <string>
+#include <vector>
+
+using namespace boost::mysql;
+using boost::span;
+using detail::resultset_encoding;
+
+namespace {
+
+// A narrow row, typical of high-rate queries
+struct bench_row
+{
+    std::int64_t id;
+    std::int32_t count;
+    double value;
+    std::string name;
+};
+BOOST_DESCRIBE_STRUCT(bench_row, (), (id, count, value, name))
+
+constexpr std::size_t num_rows = 1000;
+constexpr std::size_t num_iterations = 2000;
+constexpr std::size_t num_repetitions = 5;
+
+metadata make_meta(column_type type, string_view name)
+{
+    detail::coldef_view coldef{};
+    coldef.name = name;
+    coldef.collation_id = 33;  // utf8_general_ci
+    coldef.type = type;
+    coldef.flags = detail::column_flags::not_null;
+    return detail::access::construct<metadata>(coldef, false);
+}
+
+std::vector<metadata> make_meta()
+{
+    return {
+        make_meta(column_type::bigint, "id"),
+        make_meta(column_type::int_, "count"),
+        make_meta(column_type::double_, "value"),
+        make_meta(column_type::varchar, "name"),
+    };
+}
+
+// Message serialization. Lengths are always < 251, so they fit in a single byte
+void add_lenenc(std::vector<std::uint8_t>& to, const std::string& value)
+{
+    to.push_back(static_cast<std::uint8_t>(value.size()));
+    to.insert(to.end(), value.begin(), value.end());
+}
+
+template <class T>
+void add_fixed(std::vector<std::uint8_t>& to, T value)
+{
+    std::uint8_t buff[sizeof(T)];
+    std::memcpy(buff, &value, sizeof(T));  // assumes a little endian host
+    to.insert(to.end(), buff, buff + sizeof(T));
+}
+
+std::string make_name(std::size_t i) { return "user_name_" + std::to_string(i); }
+
+std::vector<std::uint8_t> make_text_row(std::size_t i)
+{
+    std::vector<std::uint8_t> res;
+    add_lenenc(res, std::to_string(i * 1000003));
+    add_lenenc(res, std::to_string(i % 1000));
+    add_lenenc(res, std::to_string(i) + ".25");
+    add_lenenc(res, make_name(i));
+    return res;
+}
+
+std::vector<std::uint8_t> make_binary_row(std::size_t i)
+{
+    std::vector<std::uint8_t> res{0x00, 0x00};  // header, null bitmap
+    add_fixed(res, static_cast<std::int64_t>(i * 1000003));
+    add_fixed(res, static_cast<std::int32_t>(i % 1000));
+    add_fixed(res, static_cast<double>(i) + 0.25);
+    add_lenenc(res, make_name(i));
+    return res;
+}
+
+// The two decoding strategies
+struct fields_decoder
+{
+    const std::vector<metadata>& meta;
+    std::size_t pos_map[4];
+    std::vector<field_view> fields;
+
+    error_code decode(resultset_encoding enc, span<const std::uint8_t> msg, bench_row& to)
+    {
+        fields.clear();
+        auto storage = detail::add_fields(fields, meta.size());
+        auto err = detail::deserialize_row(enc, msg, meta, storage);
+        if (err)
+            return err;
+        return detail::parse(pos_map, storage, to);
+    }
+};
+
+struct direct_decoder
+{
+    const std::vector<metadata>& meta;
+
+    error_code decode(resultset_encoding enc, span<const std::uint8_t> msg, bench_row& to)
+    {
+        detail::row_field_reader reader(enc, msg, meta);
+        auto err = reader.start();
+        if (err)
+            return err;
+        return detail::parse_direct(reader, to);
+    }
+};
+
+// Returns the best time per row, in nanoseconds
+template <class Decoder>
+double run(Decoder& decoder, resultset_encoding enc, const std::vector<std::vector<std::uint8_t>>& msgs)
+{
+    using clock = std::chrono::steady_clock;
+    bench_row row{};
+    std::int64_t checksum = 0;
+    double best = 1e300;
+
+    for (std::size_t rep = 0; rep < num_repetitions; ++rep)
+    {
+        auto start = clock::now();
+        for (std::size_t it = 0; it < num_iterations; ++it)
+        {
+            for (const auto& msg : msgs)
+            {
+                auto err = decoder.decode(enc, msg, row);
+                if (err)
+                {
+                    std::fprintf(stderr, "Error decoding row: %s\n", err.message().c_str());
+                    std::exit(1);
+                }
+                checksum += row.id + row.count + static_cast<std::int64_t>(row.name.size());
+            }
+        }
+        std::chrono::duration<double, std::nano> elapsed = clock::now() - start;
+        double per_row = elapsed.count() / (num_iterations * msgs.size());
+        if (per_row < best)
+            best = per_row;
+    }
+
+    // Prevent the compiler from optimizing the loop away
+    if (checksum == 0)
+        std::fprintf(stderr, "Unexpected checksum\n");
+
+    return best;
+}
+
+void run_encoding(resultset_encoding enc, const char* enc_name, bool is_last)
+{
+    auto meta = make_meta();
+    std::vector<std::vector<std::uint8_t>> msgs;
+    msgs.reserve(num_rows);
+    for (std::size_t i = 0; i < num_rows; ++i)
+        msgs.push_back(enc == resultset_encoding::text ? make_text_row(i) : make_binary_row(i));
+
+    fields_decoder fields{meta, {0, 1, 2, 3}, {}};
+    direct_decoder direct{meta};
+    double fields_ns = run(fields, enc, msgs);
+    double direct_ns = run(direct, enc, msgs);
+
+    std::printf(
+        "  {\"encoding\": \"%s\", \"fields_ns_per_row\": %.2f, \"direct_ns_per_row\": %.2f, \"speedup\": "
+        "%.3f}%s\n",
+        enc_name,
+        fields_ns,
+        direct_ns,
+        fields_ns / direct_ns,
+        is_last ? "" : ","
+    );
+}
+
+}  // namespace
+
+int main()
+{
+    std::printf("[\n");
+    run_encoding(resultset_encoding::text, "text", false);
+    run_encoding(resultset_encoding::binary, "binary", true);
+    std::printf("]\n");
+}
+
+#else
+
+#include <cstdio>
+
+int main() { std::printf("This benchmark requires C++14\n"); }
+
+#endif
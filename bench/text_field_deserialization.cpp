@@ -0,0 +1,165 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+// Measures the time it takes to deserialize a single text protocol field,
+// for each column type that requires parsing. Only uses deserialize_text_field,
+// so it can be run against older versions of the library to compare results.
+
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/field_view.hpp>
+#include <boost/mysql/metadata.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/coldef_view.hpp>
+#include <boost/mysql/detail/flags.hpp>
+
+#include <boost/mysql/impl/internal/protocol/deserialize_text_field.hpp>
+
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <string>
+#include <vector>
+
+using namespace boost::mysql;
+
+namespace {
+
+constexpr std::size_t num_values = 1000;
+constexpr std::size_t num_iterations = 2000;
+constexpr std::size_t num_repetitions = 5;
+
+metadata make_meta(column_type type, bool is_unsigned = false, unsigned decimals = 0)
+{
+    detail::coldef_view coldef{};
+    coldef.name = "f";
+    coldef.collation_id = 63;  // binary
+    coldef.type = type;
+    coldef.flags = detail::column_flags::not_null;
+    if (is_unsigned)
+        coldef.flags |= detail::column_flags::unsigned_;
+    coldef.decimals = static_cast<std::uint8_t>(decimals);
+    return detail::access::construct<metadata>(coldef, false);
+}
+
+std::string pad2(std::size_t v)
+{
+    v %= 100;
+    return std::string(1, static_cast<char>('0' + v / 10)) + static_cast<char>('0' + v % 10);
+}
+
+// Generates num_values different values, so branch predictors don't learn the input
+struct bench_case
+{
+    const char* name;
+    metadata meta;
+    std::string (*generate)(std::size_t i);
+};
+
+std::string gen_tinyint(std::size_t i) { return std::to_string(static_cast<int>(i % 256) - 128); }
+std::string gen_int(std::size_t i) { return std::to_string(static_cast<std::int32_t>(i * 2654435761u)); }
+std::string gen_bigint(std::size_t i)
+{
+    return std::to_string(static_cast<std::int64_t>(i * 0x9e3779b97f4a7c15u));
+}
+std::string gen_bigint_unsigned(std::size_t i) { return std::to_string(i * 0x9e3779b97f4a7c15u); }
+std::string gen_float(std::size_t i) { return std::to_string(static_cast<float>(i) * 1.25f) + "e-3"; }
+std::string gen_double(std::size_t i) { return std::to_string(static_cast<double>(i) * 3.14159) + "e10"; }
+std::string gen_date(std::size_t i)
+{
+    return std::to_string(1000 + i % 9000) + "-" + pad2(i % 12 + 1) + "-" + pad2(i % 28 + 1);
+}
+std::string gen_datetime(std::size_t i)
+{
+    return gen_date(i) + " " + pad2(i % 24) + ":" + pad2(i % 60) + ":" + pad2(i % 59);
+}
+std::string gen_datetime6(std::size_t i)
+{
+    return gen_datetime(i) + "." + std::to_string(100000 + i % 900000);
+}
+std::string gen_time(std::size_t i)
+{
+    return (i % 2 ? "-" : "") + pad2(i % 100) + ":" + pad2(i % 60) + ":" + pad2(i % 59);
+}
+std::string gen_time6(std::size_t i) { return gen_time(i) + "." + std::to_string(100000 + i % 900000); }
+
+// Returns the best time per field, in nanoseconds
+double run(const bench_case& c)
+{
+    using clock = std::chrono::steady_clock;
+
+    std::vector<std::string> values;
+    values.reserve(num_values);
+    for (std::size_t i = 0; i < num_values; ++i)
+        values.push_back(c.generate(i));
+
+    field_view output;
+    std::size_t checksum = 0;
+    double best = 1e300;
+
+    for (std::size_t rep = 0; rep < num_repetitions; ++rep)
+    {
+        auto start = clock::now();
+        for (std::size_t it = 0; it < num_iterations; ++it)
+        {
+            for (const auto& value : values)
+            {
+                auto err = detail::deserialize_text_field(value, c.meta, output);
+                if (err != detail::deserialize_errc::ok)
+                {
+                    std::fprintf(stderr, "Error deserializing %s value '%s'\n", c.name, value.c_str());
+                    std::exit(1);
+                }
+                checksum += static_cast<std::size_t>(output.kind());
+            }
+        }
+        std::chrono::duration<double, std::nano> elapsed = clock::now() - start;
+        double per_field = elapsed.count() / (num_iterations * values.size());
+        if (per_field < best)
+            best = per_field;
+    }
+
+    // Prevent the compiler from optimizing the loop away
+    if (checksum == 0)
+        std::fprintf(stderr, "Unexpected checksum\n");
+
+    return best;
+}
+
+}  // namespace
+
+int main()
+{
+    const bench_case cases[] = {
+        {"tinyint",         make_meta(column_type::tinyint),           gen_tinyint        },
+        {"int",             make_meta(column_type::int_),              gen_int            },
+        {"bigint",          make_meta(column_type::bigint),            gen_bigint         },
+        {"bigint_unsigned", make_meta(column_type::bigint, true),      gen_bigint_unsigned},
+        {"float",           make_meta(column_type::float_),            gen_float          },
+        {"double",          make_meta(column_type::double_),           gen_double         },
+        {"date",            make_meta(column_type::date),              gen_date           },
+        {"datetime",        make_meta(column_type::datetime),          gen_datetime       },
+        {"datetime_6",      make_meta(column_type::datetime, false, 6), gen_datetime6      },
+        {"time",            make_meta(column_type::time),              gen_time           },
+        {"time_6",          make_meta(column_type::time, false, 6),    gen_time6          },
+    };
+
+    std::printf("[\n");
+    for (std::size_t i = 0; i < sizeof(cases) / sizeof(cases[0]); ++i)
+    {
+        std::printf(
+            "  {\"type\": \"%s\", \"ns_per_field\": %.2f}%s\n",
+            cases[i].name,
+            run(cases[i]),
+            i + 1 == sizeof(cases) / sizeof(cases[0]) ? "" : ","
+        );
+    }
+    std::printf("]\n");
+}
@@ -9,13 +9,23 @@
 #define BOOST_MYSQL_HPP
 
 #include <boost/mysql/bad_field_access.hpp>
+#include <boost/mysql/batch_params.hpp>
 #include <boost/mysql/blob.hpp>
 #include <boost/mysql/blob_view.hpp>
 #include <boost/mysql/buffer_params.hpp>
+#include <boost/mysql/buffer_stats.hpp>
+#include <boost/mysql/bulk_execution_result.hpp>
 #include <boost/mysql/client_errc.hpp>
 #include <boost/mysql/column_type.hpp>
+#include <boost/mysql/column_view.hpp>
+#include <boost/mysql/columnar_results.hpp>
+#include <boost/mysql/columnar_resultset_view.hpp>
 #include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/compression_mode.hpp>
 #include <boost/mysql/connection.hpp>
+#include <boost/mysql/connection_observer.hpp>
+#include <boost/mysql/connection_pool.hpp>
+#include <boost/mysql/deadline_params.hpp>
 #include <boost/mysql/date.hpp>
 #include <boost/mysql/datetime.hpp>
 #include <boost/mysql/days.hpp>
@@ -25,9 +35,13 @@
 #include <boost/mysql/error_with_diagnostics.hpp>
 #include <boost/mysql/execution_state.hpp>
 #include <boost/mysql/field.hpp>
+#include <boost/mysql/field_chunk.hpp>
 #include <boost/mysql/field_kind.hpp>
+#include <boost/mysql/field_stream_params.hpp>
 #include <boost/mysql/field_view.hpp>
 #include <boost/mysql/handshake_params.hpp>
+#include <boost/mysql/host_list.hpp>
+#include <boost/mysql/load_data_source.hpp>
 #include <boost/mysql/mariadb_collations.hpp>
 #include <boost/mysql/mariadb_server_errc.hpp>
 #include <boost/mysql/metadata.hpp>
@@ -35,14 +49,19 @@
 #include <boost/mysql/metadata_mode.hpp>
 #include <boost/mysql/mysql_collations.hpp>
 #include <boost/mysql/mysql_server_errc.hpp>
+#include <boost/mysql/pipeline.hpp>
+#include <boost/mysql/pool_params.hpp>
+#include <boost/mysql/resolver_cache.hpp>
 #include <boost/mysql/results.hpp>
 #include <boost/mysql/resultset.hpp>
 #include <boost/mysql/resultset_view.hpp>
 #include <boost/mysql/row.hpp>
+#include <boost/mysql/row_stream.hpp>
 #include <boost/mysql/row_view.hpp>
 #include <boost/mysql/rows.hpp>
 #include <boost/mysql/rows_view.hpp>
 #include <boost/mysql/ssl_mode.hpp>
+#include <boost/mysql/ssl_session_cache.hpp>
 #include <boost/mysql/statement.hpp>
 #include <boost/mysql/static_execution_state.hpp>
 #include <boost/mysql/static_results.hpp>
@@ -0,0 +1,78 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_BATCH_PARAMS_HPP
+#define BOOST_MYSQL_BATCH_PARAMS_HPP
+
+#include <cstddef>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief Size targets for the batches returned by \ref connection::read_some_rows.
+ * \details
+ * By default, `read_some_rows` performs a single read on the stream and returns the rows
+ * contained in it, so the batch size depends on the read buffer size and on how the network
+ * delivers the data. Passing an object of this type makes `read_some_rows` keep reading
+ * until the batch contains at least \ref min_rows rows, stopping as soon as it contains \ref max_rows
+ * rows or \ref max_bytes bytes of row messages. Reading always stops when the current resultset ends.
+ * \n
+ * Messages that don't fit in a batch are kept in the connection's read buffer and returned by
+ * the next `read_some_rows` call, without performing any I/O.
+ */
+class batch_params
+{
+    std::size_t min_rows_;
+    std::size_t max_rows_{no_limit};
+    std::size_t max_bytes_{no_limit};
+
+public:
+    /// Value used by size limits to represent that no limit should be applied.
+    static constexpr std::size_t no_limit = static_cast<std::size_t>(-1);
+
+    /**
+     * \brief Initializing constructor.
+     * \param min_rows The minimum number of rows to read, unless the resultset ends first
+     * or any of the maximum limits is reached.
+     */
+    constexpr explicit batch_params(std::size_t min_rows = 1) noexcept : min_rows_(min_rows) {}
+
+    /// Gets the minimum number of rows that a batch should contain.
+    constexpr std::size_t min_rows() const noexcept { return min_rows_; }
+
+    /// Sets the minimum number of rows that a batch should contain.
+    void set_min_rows(std::size_t v) noexcept { min_rows_ = v; }
+
+    /**
+     * \brief Gets the maximum number of rows that a batch may contain.
+     * \details
+     * Takes precedence over \ref min_rows. When using the static interface, the span size
+     * also limits the number of rows. Defaults to \ref no_limit.
+     */
+    constexpr std::size_t max_rows() const noexcept { return max_rows_; }
+
+    /// Sets the maximum number of rows that a batch may contain.
+    void set_max_rows(std::size_t v) noexcept { max_rows_ = v; }
+
+    /**
+     * \brief Gets the number of bytes after which a batch is considered complete.
+     * \details
+     * Reading stops once the row messages in the batch add up to at least this size. A batch contains
+     * at least one row, even if it exceeds this limit. Takes precedence over \ref min_rows.
+     * Defaults to \ref no_limit.
+     */
+    constexpr std::size_t max_bytes() const noexcept { return max_bytes_; }
+
+    /// Sets the number of bytes after which a batch is considered complete.
+    void set_max_bytes(std::size_t v) noexcept { max_bytes_ = v; }
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -15,15 +15,34 @@ namespace mysql {
 
 /**
  * \brief Buffer configuration parameters for a connection.
+ * \details
+ * The read buffer starts with \ref initial_read_size bytes and grows when a message
+ * doesn't fit in it. By default, it never shrinks back and its size is only limited by
+ * available memory. You can use this class to limit both the peak and the retained
+ * buffer size, which is useful for long-lived connections (e.g. in a pool) that
+ * occasionally read very big messages.
  */
 class buffer_params
 {
     std::size_t initial_read_size_;
+    std::size_t max_read_size_{no_limit};
+    std::size_t max_retained_read_size_{no_limit};
+    std::size_t shrink_after_reads_{default_shrink_after_reads};
+    double read_growth_factor_{default_read_growth_factor};
 
 public:
+    /// Value used by size limits to represent that no limit should be applied.
+    static constexpr std::size_t no_limit = static_cast<std::size_t>(-1);
+
     /// The default value of \ref initial_read_size.
     static constexpr std::size_t default_initial_read_size = 1024;
 
+    /// The default value of \ref shrink_after_reads.
+    static constexpr std::size_t default_shrink_after_reads = 8;
+
+    /// The default value of \ref read_growth_factor.
+    static constexpr double default_read_growth_factor = 1.0;
+
     /**
      * \brief Initializing constructor.
      * \param initial_read_size Initial size of the read buffer. A bigger read buffer
@@ -39,6 +58,58 @@ public:
 
     /// Sets the initial size of the read buffer.
     void set_initial_read_size(std::size_t v) noexcept { initial_read_size_ = v; }
+
+    /**
+     * \brief Gets the maximum size of the read buffer.
+     * \details
+     * The read buffer will never grow past this size. Reading a message that requires
+     * a bigger buffer fails with \ref client_errc::max_buffer_size_exceeded.
+     * Defaults to \ref no_limit.
+     */
+    constexpr std::size_t max_read_size() const noexcept { return max_read_size_; }
+
+    /// Sets the maximum size of the read buffer.
+    void set_max_read_size(std::size_t v) noexcept { max_read_size_ = v; }
+
+    /**
+     * \brief Gets the maximum size that the read buffer retains when idle.
+     * \details
+     * If the read buffer has grown past this size to accomodate a big message, it will be
+     * shrunk back to this size after \ref shrink_after_reads consecutive read
+     * operations that didn't need the extra space. Defaults to \ref no_limit,
+     * which disables shrinking.
+     */
+    constexpr std::size_t max_retained_read_size() const noexcept { return max_retained_read_size_; }
+
+    /// Sets the maximum size that the read buffer retains when idle.
+    void set_max_retained_read_size(std::size_t v) noexcept { max_retained_read_size_ = v; }
+
+    /**
+     * \brief Gets the number of idle read operations after which the read buffer is shrunk.
+     * \details
+     * A read operation is considered idle if all the data it handled fitted in
+     * \ref max_retained_read_size bytes. Only relevant if \ref max_retained_read_size
+     * has been set. A value of zero shrinks the buffer as soon as possible.
+     */
+    constexpr std::size_t shrink_after_reads() const noexcept { return shrink_after_reads_; }
+
+    /// Sets the number of idle read operations after which the read buffer is shrunk.
+    void set_shrink_after_reads(std::size_t v) noexcept { shrink_after_reads_ = v; }
+
+    /**
+     * \brief Gets the factor used to grow the read buffer.
+     * \details
+     * When the read buffer needs more space, its size is multiplied by this factor,
+     * or increased to the required size, whichever is bigger. Geometric growth
+     * reduces the number of reallocations and copies when reading big messages
+     * in several chunks, at the cost of holding more memory than required.
+     * Values less or equal than 1 grow the buffer to the required size, only.
+     * Defaults to 1, so geometric growth is opt-in.
+     */
+    constexpr double read_growth_factor() const noexcept { return read_growth_factor_; }
+
+    /// Sets the factor used to grow the read buffer.
+    void set_read_growth_factor(double v) noexcept { read_growth_factor_ = v; }
 };
 
 }  // namespace mysql
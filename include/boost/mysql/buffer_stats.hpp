@@ -0,0 +1,42 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_BUFFER_STATS_HPP
+#define BOOST_MYSQL_BUFFER_STATS_HPP
+
+#include <cstddef>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief Memory usage counters for the internal buffers of a connection.
+ * \details
+ * Returned by \ref connection::buffer_usage. Sizes are expressed in bytes.
+ */
+struct buffer_stats
+{
+    /// The current size of the read buffer.
+    std::size_t read_buffer_size{};
+
+    /// The biggest size that the read buffer has ever had.
+    std::size_t peak_read_buffer_size{};
+
+    /// The current capacity of the write buffer.
+    std::size_t write_buffer_size{};
+
+    /// The number of times the read buffer has been reallocated to a bigger size.
+    std::size_t num_read_buffer_grows{};
+
+    /// The number of times the read buffer has been shrunk, as configured by \ref buffer_params.
+    std::size_t num_read_buffer_shrinks{};
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
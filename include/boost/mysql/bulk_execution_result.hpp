@@ -0,0 +1,41 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_BULK_EXECUTION_RESULT_HPP
+#define BOOST_MYSQL_BULK_EXECUTION_RESULT_HPP
+
+#include <cstdint>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief The outcome of executing a statement once per row of parameters.
+ * \details
+ * Populated by \ref connection::execute_bulk. Values aggregate all the executions,
+ * regardless of whether they were performed by a single `COM_STMT_BULK_EXECUTE` command
+ * or by several `COM_STMT_EXECUTE` commands.
+ */
+struct bulk_execution_result
+{
+    /// The total number of rows affected by all the executions.
+    std::uint64_t affected_rows{};
+
+    /**
+     * \brief The first ID generated by an `AUTO_INCREMENT` column, or zero if none was generated.
+     * \details As with multi-row `INSERT` statements, this is the ID generated for the first inserted row.
+     */
+    std::uint64_t last_insert_id{};
+
+    /// The total number of warnings generated by all the executions.
+    unsigned warning_count{};
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
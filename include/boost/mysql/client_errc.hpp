@@ -67,6 +67,30 @@ enum class client_errc : int
 
     /// The static interface encountered an error when parsing a field into a C++ data structure.
     static_row_parsing_error,
+
+    /// The server requested the contents of a file for a `LOAD DATA LOCAL INFILE` statement,
+    /// but the statement wasn't run using \ref connection::load_data_local.
+    unexpected_local_infile_request,
+
+    /// Reading a message would require growing the read buffer past \ref buffer_params::max_read_size.
+    max_buffer_size_exceeded,
+
+    /// The server omitted the metadata of a resultset, and the client doesn't have
+    /// a copy of it. This can happen if the server's `resultset_metadata` variable is set to `NONE`.
+    metadata_unavailable,
+
+    /// Values sent by \ref connection::send_long_data are pending for the statement, and it was
+    /// executed using \ref connection::execute_pipeline or \ref connection::execute_bulk,
+    /// which don't support them.
+    pending_long_data,
+
+    /// The operation didn't complete before the deadline configured by \ref connection::set_deadlines.
+    deadline_exceeded,
+
+    /// The statement was prepared in a session that has since ended (e.g. by
+    /// \ref connection::reset_connection or \ref connection::change_user),
+    /// so it doesn't exist in the server anymore.
+    stale_statement,
 };
 
 BOOST_MYSQL_DECL
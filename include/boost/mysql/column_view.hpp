@@ -0,0 +1,339 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_COLUMN_VIEW_HPP
+#define BOOST_MYSQL_COLUMN_VIEW_HPP
+
+#include <boost/mysql/bad_field_access.hpp>
+#include <boost/mysql/blob_view.hpp>
+#include <boost/mysql/date.hpp>
+#include <boost/mysql/datetime.hpp>
+#include <boost/mysql/field_kind.hpp>
+#include <boost/mysql/field_view.hpp>
+#include <boost/mysql/string_view.hpp>
+#include <boost/mysql/time.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/execution_processor/columnar_results_impl.hpp>
+
+#include <boost/assert.hpp>
+#include <boost/core/ignore_unused.hpp>
+#include <boost/core/span.hpp>
+#include <boost/throw_exception.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief A non-owning reference to a column within a \ref columnar_results.
+ * \details
+ * Values are stored in a contiguous array whose type depends on the column's type, as
+ * given by \ref kind. For instance, a `BIGINT` column has `this->kind() == field_kind::int64`,
+ * and its values can be accessed as a `span<const std::int64_t>` using \ref as_int64.
+ * Strings and blobs are stored contiguously, and are accessed one at a time
+ * using \ref as_string and \ref as_blob.
+ * \n
+ * `NULL` values are tracked separately, in a bitmap. The typed array holds a default-constructed
+ * value for each `NULL`. Use \ref is_null or \ref null_bitmap to tell them apart.
+ * \n
+ * A `column_view` points to memory owned by an external object, usually a \ref columnar_results.
+ * The view and any other reference type obtained from it are valid as long as the
+ * object they point to is alive.
+ */
+class column_view
+{
+public:
+    /**
+     * \brief Returns the kind of this column's non-NULL values.
+     * \details
+     * This is determined by the column's metadata, and never `field_kind::null`.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    field_kind kind() const noexcept { return impl_->kind; }
+
+    /**
+     * \brief Returns the number of values (rows) in this column.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t size() const noexcept { return impl_->num_rows; }
+
+    /**
+     * \brief Returns `true` if the column has no values.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool empty() const noexcept { return size() == 0; }
+
+    /**
+     * \brief Returns the number of `NULL` values in this column.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t null_count() const noexcept { return impl_->num_nulls; }
+
+    /**
+     * \brief Returns whether the i-th value is `NULL`.
+     * \par Preconditions
+     * `i < this->size()`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool is_null(std::size_t i) const noexcept { return impl_->is_null(i); }
+
+    /**
+     * \brief Returns the `NULL` bitmap for this column.
+     * \details
+     * Bit `i % 8` of byte `i / 8` is set if and only if the i-th value is `NULL`.
+     * The bitmap has `(this->size() + 7) / 8` bytes.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The returned span is valid as long as the object that `*this` points to is alive.
+     */
+    span<const std::uint8_t> null_bitmap() const noexcept
+    {
+        return span<const std::uint8_t>(impl_->null_bitmap.data(), impl_->null_bitmap.size());
+    }
+
+    /**
+     * \brief Returns the i-th value as a `field_view`.
+     * \details
+     * Returns a `NULL` `field_view` for `NULL` values. Strings and blobs point into
+     * the object that `*this` points to.
+     *
+     * \par Preconditions
+     * `i < this->size()`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    field_view operator[](std::size_t i) const noexcept
+    {
+        BOOST_ASSERT(i < size());
+        return impl_->at(i);
+    }
+
+    /**
+     * \brief Returns the i-th value as a `field_view`, checking bounds.
+     * \par Exception safety
+     * Strong guarantee.
+     * \throws std::out_of_range `i >= this->size()`
+     */
+    field_view at(std::size_t i) const
+    {
+        if (i >= size())
+            BOOST_THROW_EXCEPTION(std::out_of_range("column_view::at: out of range"));
+        return impl_->at(i);
+    }
+
+    /**
+     * \brief Returns the values of an integer column.
+     * \par Exception safety
+     * Strong guarantee.
+     * \throws bad_field_access If `this->kind() != field_kind::int64`
+     */
+    span<const std::int64_t> as_int64() const { return checked(field_kind::int64, impl_->int64_values); }
+
+    /**
+     * \brief Returns the values of an unsigned integer column.
+     * \par Exception safety
+     * Strong guarantee.
+     * \throws bad_field_access If `this->kind() != field_kind::uint64`
+     */
+    span<const std::uint64_t> as_uint64() const
+    {
+        return checked(field_kind::uint64, impl_->uint64_values);
+    }
+
+    /**
+     * \brief Returns the values of a `FLOAT` column.
+     * \par Exception safety
+     * Strong guarantee.
+     * \throws bad_field_access If `this->kind() != field_kind::float_`
+     */
+    span<const float> as_float() const { return checked(field_kind::float_, impl_->float_values); }
+
+    /**
+     * \brief Returns the values of a `DOUBLE` column.
+     * \par Exception safety
+     * Strong guarantee.
+     * \throws bad_field_access If `this->kind() != field_kind::double_`
+     */
+    span<const double> as_double() const { return checked(field_kind::double_, impl_->double_values); }
+
+    /**
+     * \brief Returns the values of a `DATE` column.
+     * \par Exception safety
+     * Strong guarantee.
+     * \throws bad_field_access If `this->kind() != field_kind::date`
+     */
+    span<const date> as_date() const { return checked(field_kind::date, impl_->date_values); }
+
+    /**
+     * \brief Returns the values of a `DATETIME` or `TIMESTAMP` column.
+     * \par Exception safety
+     * Strong guarantee.
+     * \throws bad_field_access If `this->kind() != field_kind::datetime`
+     */
+    span<const datetime> as_datetime() const
+    {
+        return checked(field_kind::datetime, impl_->datetime_values);
+    }
+
+    /**
+     * \brief Returns the values of a `TIME` column.
+     * \par Exception safety
+     * Strong guarantee.
+     * \throws bad_field_access If `this->kind() != field_kind::time`
+     */
+    span<const time> as_time() const { return checked(field_kind::time, impl_->time_values); }
+
+    /**
+     * \brief Returns the i-th value of a string column.
+     * \details Returns an empty string for `NULL` values.
+     * \par Preconditions
+     * `i < this->size()`
+     *
+     * \par Exception safety
+     * Strong guarantee.
+     * \throws bad_field_access If `this->kind() != field_kind::string`
+     */
+    string_view as_string(std::size_t i) const
+    {
+        check_kind(field_kind::string);
+        return get_string(i);
+    }
+
+    /**
+     * \brief Returns the i-th value of a blob column.
+     * \details Returns an empty blob for `NULL` values.
+     * \par Preconditions
+     * `i < this->size()`
+     *
+     * \par Exception safety
+     * Strong guarantee.
+     * \throws bad_field_access If `this->kind() != field_kind::blob`
+     */
+    blob_view as_blob(std::size_t i) const
+    {
+        check_kind(field_kind::blob);
+        return get_blob(i);
+    }
+
+    /// \copydoc as_int64
+    /// \details Unchecked access. Requires `this->kind() == field_kind::int64`.
+    span<const std::int64_t> get_int64() const noexcept
+    {
+        return unchecked(field_kind::int64, impl_->int64_values);
+    }
+
+    /// \copydoc as_uint64
+    /// \details Unchecked access. Requires `this->kind() == field_kind::uint64`.
+    span<const std::uint64_t> get_uint64() const noexcept
+    {
+        return unchecked(field_kind::uint64, impl_->uint64_values);
+    }
+
+    /// \copydoc as_float
+    /// \details Unchecked access. Requires `this->kind() == field_kind::float_`.
+    span<const float> get_float() const noexcept
+    {
+        return unchecked(field_kind::float_, impl_->float_values);
+    }
+
+    /// \copydoc as_double
+    /// \details Unchecked access. Requires `this->kind() == field_kind::double_`.
+    span<const double> get_double() const noexcept
+    {
+        return unchecked(field_kind::double_, impl_->double_values);
+    }
+
+    /// \copydoc as_date
+    /// \details Unchecked access. Requires `this->kind() == field_kind::date`.
+    span<const date> get_date() const noexcept { return unchecked(field_kind::date, impl_->date_values); }
+
+    /// \copydoc as_datetime
+    /// \details Unchecked access. Requires `this->kind() == field_kind::datetime`.
+    span<const datetime> get_datetime() const noexcept
+    {
+        return unchecked(field_kind::datetime, impl_->datetime_values);
+    }
+
+    /// \copydoc as_time
+    /// \details Unchecked access. Requires `this->kind() == field_kind::time`.
+    span<const time> get_time() const noexcept { return unchecked(field_kind::time, impl_->time_values); }
+
+    /// \copydoc as_string
+    /// \details Unchecked access. Requires `this->kind() == field_kind::string`.
+    string_view get_string(std::size_t i) const noexcept
+    {
+        BOOST_ASSERT(kind() == field_kind::string);
+        auto blob = get_bytes(i);
+        return string_view(reinterpret_cast<const char*>(blob.data()), blob.size());
+    }
+
+    /// \copydoc as_blob
+    /// \details Unchecked access. Requires `this->kind() == field_kind::blob`.
+    blob_view get_blob(std::size_t i) const noexcept
+    {
+        BOOST_ASSERT(kind() == field_kind::blob);
+        return get_bytes(i);
+    }
+
+private:
+    const detail::column_data* impl_;
+
+    column_view(const detail::column_data& impl) noexcept : impl_(&impl) {}
+
+    void check_kind(field_kind expected) const
+    {
+        if (kind() != expected)
+            BOOST_THROW_EXCEPTION(bad_field_access());
+    }
+
+    template <class T>
+    span<const T> checked(field_kind expected, const std::vector<T>& values) const
+    {
+        check_kind(expected);
+        return span<const T>(values.data(), values.size());
+    }
+
+    template <class T>
+    span<const T> unchecked(field_kind expected, const std::vector<T>& values) const noexcept
+    {
+        BOOST_ASSERT(kind() == expected);
+        boost::ignore_unused(expected);
+        return span<const T>(values.data(), values.size());
+    }
+
+    blob_view get_bytes(std::size_t i) const noexcept
+    {
+        BOOST_ASSERT(i < size());
+        const auto& offsets = impl_->string_offsets;
+        return blob_view(impl_->string_data.data() + offsets[i], offsets[i + 1] - offsets[i]);
+    }
+
+#ifndef BOOST_MYSQL_DOXYGEN
+    friend struct detail::access;
+#endif
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -0,0 +1,256 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_COLUMNAR_RESULTS_HPP
+#define BOOST_MYSQL_COLUMNAR_RESULTS_HPP
+
+#include <boost/mysql/column_view.hpp>
+#include <boost/mysql/columnar_resultset_view.hpp>
+#include <boost/mysql/metadata_collection_view.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/execution_processor/columnar_results_impl.hpp>
+
+#include <boost/assert.hpp>
+#include <boost/throw_exception.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief Holds the results of a SQL query, stored by columns.
+ * \details
+ * Like \ref results, but rather than storing rows as a sequence of \ref field_view objects,
+ * each column is stored in a contiguous array of the column's native type
+ * (e.g. `std::int64_t` for `BIGINT`, \ref date for `DATE`), plus a `NULL` bitmap.
+ * Strings and blobs are stored contiguously within each column.
+ * This is more compact and cache-friendly for large results that are processed column by column.
+ * See \ref column_view for details.
+ * \n
+ * This object can store the results of single and multi resultset queries.
+ * For the former, you use \ref meta, \ref column, \ref affected_rows and so on.
+ * For the latter, use \ref at or `operator[]` to access each resultset.
+ * \n
+ * \par Thread safety
+ * Distinct objects: safe. \n
+ * Shared objects: unsafe. \n
+ */
+class columnar_results
+{
+public:
+    /**
+     * \brief Default constructor.
+     * \details Constructs an empty object, with `this->has_value() == false`.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    columnar_results() = default;
+
+    /**
+     * \brief Returns whether the object holds a valid result.
+     * \details Having `this->has_value()` is a precondition to call all data accessors.
+     * Objects populated by \ref connection::execute and \ref connection::async_execute
+     * are guaranteed to have `this->has_value() == true`.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool has_value() const noexcept { return impl_.is_complete(); }
+
+    /**
+     * \brief Returns the number of rows retrieved by the SQL query.
+     * \details
+     * For operations returning more than one resultset, returns the
+     * number of rows in the first resultset.
+     *
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t num_rows() const noexcept { return front().num_rows(); }
+
+    /**
+     * \brief Returns the i-th column retrieved by the SQL query (unchecked access).
+     * \details
+     * For operations returning more than one resultset, returns
+     * columns in the first resultset.
+     *
+     * \par Preconditions
+     * `this->has_value() == true && i < this->meta().size()`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The returned view points into memory owned by `*this`, and will be valid as long as `*this`
+     * or an object move-constructed from `*this` are alive.
+     */
+    column_view column(std::size_t i) const noexcept { return front().column(i); }
+
+    /**
+     * \brief Returns metadata about the columns in the query.
+     * \details
+     * For operations returning more than one resultset, returns metadata
+     * for the first resultset.
+     *
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    metadata_collection_view meta() const noexcept { return front().meta(); }
+
+    /**
+     * \brief Returns the number of rows affected by the executed SQL statement.
+     * \details
+     * For operations returning more than one resultset, returns the
+     * first resultset's affected rows.
+     *
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::uint64_t affected_rows() const noexcept { return front().affected_rows(); }
+
+    /**
+     * \brief Returns the last insert ID produced by the executed SQL statement.
+     * \details
+     * For operations returning more than one resultset, returns the
+     * first resultset's last insert ID.
+     *
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::uint64_t last_insert_id() const noexcept { return front().last_insert_id(); }
+
+    /**
+     * \brief Returns the number of warnings produced by the executed SQL statement.
+     * \details
+     * For operations returning more than one resultset, returns the
+     * first resultset's warning count.
+     *
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    unsigned warning_count() const noexcept { return front().warning_count(); }
+
+    /**
+     * \brief Returns additional text information about the execution of the SQL statement.
+     * \details
+     * For operations returning more than one resultset, returns the
+     * first resultset's info.
+     *
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    string_view info() const noexcept { return front().info(); }
+
+    /**
+     * \brief Returns the i-th resultset or throws an exception.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * Strong guarantee. Throws on invalid input.
+     * \throws std::out_of_range `i >= this->size()`
+     *
+     * \par Object lifetimes
+     * The returned view and any other references obtained from it are valid as long as
+     * `*this` is alive. Move operations invalidate references.
+     */
+    columnar_resultset_view at(std::size_t i) const
+    {
+        BOOST_ASSERT(has_value());
+        if (i >= size())
+            BOOST_THROW_EXCEPTION(std::out_of_range("columnar_results::at: out of range"));
+        return detail::access::construct<columnar_resultset_view>(impl_, i);
+    }
+
+    /**
+     * \brief Returns the i-th resultset (unchecked access).
+     * \par Preconditions
+     * `this->has_value() == true && i < this->size()`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The returned view and any other references obtained from it are valid as long as
+     * `*this` is alive. Move operations invalidate references.
+     */
+    columnar_resultset_view operator[](std::size_t i) const noexcept
+    {
+        BOOST_ASSERT(has_value());
+        BOOST_ASSERT(i < size());
+        return detail::access::construct<columnar_resultset_view>(impl_, i);
+    }
+
+    /**
+     * \brief Returns the first resultset.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    columnar_resultset_view front() const noexcept { return (*this)[0]; }
+
+    /**
+     * \brief Returns the last resultset.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    columnar_resultset_view back() const noexcept { return (*this)[size() - 1]; }
+
+    /**
+     * \brief Returns the number of resultsets that this object contains.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t size() const noexcept
+    {
+        BOOST_ASSERT(has_value());
+        return impl_.num_resultsets();
+    }
+
+private:
+    detail::columnar_results_impl impl_;
+#ifndef BOOST_MYSQL_DOXYGEN
+    friend struct detail::access;
+#endif
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -0,0 +1,229 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_COLUMNAR_RESULTSET_VIEW_HPP
+#define BOOST_MYSQL_COLUMNAR_RESULTSET_VIEW_HPP
+
+#include <boost/mysql/column_view.hpp>
+#include <boost/mysql/metadata_collection_view.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/execution_processor/columnar_results_impl.hpp>
+
+#include <boost/assert.hpp>
+#include <boost/throw_exception.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief A non-owning reference to a resultset stored by columns.
+ * \details
+ * A `columnar_resultset_view` points to memory owned by an external object, usually a
+ * \ref columnar_results. The view and any other reference type obtained from it are valid as long as the
+ * object they point to is alive.
+ */
+class columnar_resultset_view
+{
+public:
+    /**
+     * \brief Constructs a view with `this->has_value() == false`.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    columnar_resultset_view() = default;
+
+    /**
+     * \brief Returns whether this is a null view or not.
+     * \details
+     * Only returns true for default-constructed views.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool has_value() const noexcept { return impl_ != nullptr; }
+
+    /**
+     * \brief Returns the number of rows in this resultset.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t num_rows() const noexcept
+    {
+        BOOST_ASSERT(has_value());
+        return impl_->get_num_rows(index_);
+    }
+
+    /**
+     * \brief Returns the number of columns in this resultset.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t num_columns() const noexcept { return meta().size(); }
+
+    /**
+     * \brief Returns the i-th column (unchecked access).
+     * \par Preconditions
+     * `this->has_value() == true && i < this->num_columns()`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The returned view and any other references obtained from it are valid as long as
+     * the object that `*this` points to is alive.
+     */
+    column_view column(std::size_t i) const noexcept
+    {
+        BOOST_ASSERT(has_value());
+        return detail::access::construct<column_view>(impl_->get_column(index_, i));
+    }
+
+    /**
+     * \brief Returns the i-th column or throws an exception.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * Strong guarantee.
+     * \throws std::out_of_range `i >= this->num_columns()`
+     *
+     * \par Object lifetimes
+     * The returned view and any other references obtained from it are valid as long as
+     * the object that `*this` points to is alive.
+     */
+    column_view column_at(std::size_t i) const
+    {
+        if (i >= num_columns())
+            BOOST_THROW_EXCEPTION(std::out_of_range("columnar_resultset_view::column_at: out of range"));
+        return column(i);
+    }
+
+    /**
+     * \brief Returns metadata for this resultset.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The returned reference and any other references obtained from it are valid as long as
+     * the object that `*this` points to is alive.
+     */
+    metadata_collection_view meta() const noexcept
+    {
+        BOOST_ASSERT(has_value());
+        return impl_->get_meta(index_);
+    }
+
+    /**
+     * \brief Returns the number of affected rows for this resultset.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::uint64_t affected_rows() const noexcept
+    {
+        BOOST_ASSERT(has_value());
+        return impl_->get_affected_rows(index_);
+    }
+
+    /**
+     * \brief Returns the last insert ID for this resultset.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::uint64_t last_insert_id() const noexcept
+    {
+        BOOST_ASSERT(has_value());
+        return impl_->get_last_insert_id(index_);
+    }
+
+    /**
+     * \brief Returns the number of warnings for this resultset.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    unsigned warning_count() const noexcept
+    {
+        BOOST_ASSERT(has_value());
+        return impl_->get_warning_count(index_);
+    }
+
+    /**
+     * \brief Returns additional information for this resultset.
+     * \details
+     * The returned string always uses ASCII encoding, regardless of the connection's character set.
+     *
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The returned reference and any other references obtained from it are valid as long as
+     * the object that `*this` points to is alive.
+     */
+    string_view info() const noexcept
+    {
+        BOOST_ASSERT(has_value());
+        return impl_->get_info(index_);
+    }
+
+    /**
+     * \brief Returns whether this resultset represents a procedure OUT params.
+     * \par Preconditions
+     * `this->has_value() == true`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool is_out_params() const noexcept
+    {
+        BOOST_ASSERT(has_value());
+        return impl_->get_is_out_params(index_);
+    }
+
+private:
+    const detail::columnar_results_impl* impl_{};
+    std::size_t index_{};
+
+    columnar_resultset_view(const detail::columnar_results_impl& impl, std::size_t index) noexcept
+        : impl_(&impl), index_(index)
+    {
+    }
+
+#ifndef BOOST_MYSQL_DOXYGEN
+    friend struct detail::access;
+#endif
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -0,0 +1,34 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_COMPRESSION_MODE_HPP
+#define BOOST_MYSQL_COMPRESSION_MODE_HPP
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief Determines whether to use the compressed protocol with the server.
+ * \details
+ * Compression support must be enabled at build time by defining `BOOST_MYSQL_ENABLE_ZLIB`
+ * and/or `BOOST_MYSQL_ENABLE_ZSTD` (and linking to the corresponding libraries).
+ * If none of them is defined, compression is never used.
+ */
+enum class compression_mode
+{
+    /// Never use compression.
+    disable,
+
+    /// Use compression if the server supports it, fall back to an uncompressed connection if it does not.
+    /// zstd is preferred over zlib when both the server and the library support it.
+    enable
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -8,13 +8,23 @@
 #ifndef BOOST_MYSQL_CONNECTION_HPP
 #define BOOST_MYSQL_CONNECTION_HPP
 
+#include <boost/mysql/batch_params.hpp>
 #include <boost/mysql/buffer_params.hpp>
+#include <boost/mysql/buffer_stats.hpp>
+#include <boost/mysql/bulk_execution_result.hpp>
+#include <boost/mysql/connection_observer.hpp>
+#include <boost/mysql/deadline_params.hpp>
 #include <boost/mysql/diagnostics.hpp>
 #include <boost/mysql/error_code.hpp>
 #include <boost/mysql/execution_state.hpp>
+#include <boost/mysql/field_stream_params.hpp>
 #include <boost/mysql/handshake_params.hpp>
+#include <boost/mysql/host_list.hpp>
+#include <boost/mysql/load_data_source.hpp>
 #include <boost/mysql/metadata_mode.hpp>
+#include <boost/mysql/pipeline.hpp>
 #include <boost/mysql/results.hpp>
+#include <boost/mysql/row_view.hpp>
 #include <boost/mysql/rows_view.hpp>
 #include <boost/mysql/statement.hpp>
 #include <boost/mysql/string_view.hpp>
@@ -22,6 +32,7 @@
 #include <boost/mysql/detail/access.hpp>
 #include <boost/mysql/detail/any_stream_impl.hpp>
 #include <boost/mysql/detail/channel_ptr.hpp>
+#include <boost/mysql/detail/connect_hosts.hpp>
 #include <boost/mysql/detail/execution_concepts.hpp>
 #include <boost/mysql/detail/network_algorithms.hpp>
 #include <boost/mysql/detail/rebind_executor.hpp>
@@ -31,6 +42,8 @@
 
 #include <boost/assert.hpp>
 
+#include <cstddef>
+#include <cstdint>
 #include <type_traits>
 #include <utility>
 
@@ -62,9 +75,9 @@ class static_execution_state;
 template <class Stream>
 class connection
 {
-    detail::channel_ptr channel_;
+    detail::channel_ptr impl_;
 
-    diagnostics& shared_diag() noexcept { return channel_.shared_diag(); }
+    diagnostics& shared_diag() noexcept { return impl_.shared_diag(); }
 
 #ifndef BOOST_MYSQL_DOXYGEN
     friend struct detail::access;
@@ -98,17 +111,18 @@ public:
      * Basic guarantee. Throws if the `Stream` constructor throws
      * or if memory allocation for internal state fails.
      *
-     * \param buff_params Specifies initial sizes for internal buffers.
+     * \param buff_params Specifies sizes and growth policies for internal buffers.
      * \param args Arguments to be forwarded to the `Stream` constructor.
      */
     template <
         class... Args,
         class EnableIf = typename std::enable_if<std::is_constructible<Stream, Args...>::value>::type>
     connection(const buffer_params& buff_params, Args&&... args)
-        : channel_(
-              buff_params.initial_read_size(),
-              std::unique_ptr<detail::any_stream>(new detail::any_stream_impl<Stream>(std::forward<Args>(args
-              )...))
+        : impl_(
+              buff_params,
+              std::unique_ptr<detail::any_stream>(
+                  new detail::any_stream_impl<Stream>(std::forward<Args>(args)...)
+              )
           )
     {
     }
@@ -144,7 +158,7 @@ public:
      * \par Exception safety
      * No-throw guarantee.
      */
-    Stream& stream() noexcept { return detail::cast<Stream>(channel_.stream()); }
+    Stream& stream() noexcept { return detail::cast<Stream>(impl_.stream()); }
 
     /**
      * \brief Retrieves the underlying Stream object.
@@ -153,7 +167,7 @@ public:
      * \par Exception safety
      * No-throw guarantee.
      */
-    const Stream& stream() const noexcept { return detail::cast<Stream>(channel_.stream()); }
+    const Stream& stream() const noexcept { return detail::cast<Stream>(impl_.stream()); }
 
     /**
      * \brief Returns whether the connection negotiated the use of SSL or not.
@@ -172,7 +186,26 @@ public:
      *
      * \returns Whether the connection is using SSL.
      */
-    bool uses_ssl() const noexcept { return channel_.stream().ssl_active(); }
+    bool uses_ssl() const noexcept { return impl_.stream().ssl_active(); }
+
+    /**
+     * \brief Returns whether the connection negotiated the use of the compressed protocol or not.
+     * \details
+     * Compression is used if it was requested using \ref handshake_params::compression,
+     * the server supports it and the library was built with support for a
+     * compression algorithm supported by the server.
+     * \n
+     * This function always returns `false`
+     * for connections that haven't been
+     * established yet (handshake not run yet). If the handshake fails,
+     * the return value is undefined.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \returns Whether the connection is using compression.
+     */
+    bool uses_compression() const noexcept { return impl_.uses_compression(); }
 
     /**
      * \brief Returns the current metadata mode that this connection is using.
@@ -182,7 +215,7 @@ public:
      *
      * \returns The matadata mode that will be used for queries and statement executions.
      */
-    metadata_mode meta_mode() const noexcept { return channel_.meta_mode(); }
+    metadata_mode meta_mode() const noexcept { return impl_.meta_mode(); }
 
     /**
      * \brief Sets the metadata mode.
@@ -197,7 +230,179 @@ public:
      *
      * \param v The new metadata mode.
      */
-    void set_meta_mode(metadata_mode v) noexcept { channel_.set_meta_mode(v); }
+    void set_meta_mode(metadata_mode v) noexcept { impl_.set_meta_mode(v); }
+
+    /**
+     * \brief Returns counters describing the memory held by the connection's internal buffers.
+     * \details
+     * The read buffer grows to accomodate the biggest message read by the connection.
+     * You can use this function to monitor memory usage, and \ref buffer_params
+     * to limit it.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    buffer_stats buffer_usage() const noexcept { return impl_.buffer_usage(); }
+
+    /**
+     * \brief Returns the observer installed in this connection, or `nullptr` if there is none.
+     * \details
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    connection_observer* observer() const noexcept { return impl_.observer(); }
+
+    /**
+     * \brief Installs an observer to receive protocol-level events from this connection.
+     * \details
+     * The observer will be notified of any operations performed after the call.
+     * See \ref connection_observer for more info. Pass `nullptr` to remove the
+     * current observer.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Preconditions
+     * No asynchronous operation should be outstanding when this function is called.
+     *
+     * \par Object lifetimes
+     * The connection doesn't take ownership of the observer, which must be kept alive
+     * while it's installed in the connection.
+     */
+    void set_observer(connection_observer* obs) noexcept { impl_.set_observer(obs); }
+
+    /**
+     * \brief Returns the maximum number of prepared statements kept by the statement cache.
+     * \details
+     * Zero means that the statement cache is disabled, which is the default.
+     * See \ref set_statement_cache_capacity for more info.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t statement_cache_capacity() const noexcept { return impl_.statement_cache_capacity(); }
+
+    /**
+     * \brief Enables or disables the prepared statement cache.
+     * \details
+     * If `v` is not zero, the connection keeps up to `v` prepared statements in a cache,
+     * keyed by their SQL text. \ref prepare_statement returns the cached statement for a given
+     * SQL text, if any, without any network round-trip. \ref close_statement does nothing for
+     * statements held by the cache. When the cache is full, preparing a new statement closes the least
+     * recently used one, in the same network write that prepares the new statement.
+     * \n
+     * The cache is emptied when the session ends: on \ref connect, \ref handshake and when the
+     * session state is reset. If preparing a statement fails because the server-wide
+     * `max_prepared_stmt_count` limit has been reached, the cache capacity is lowered to the number
+     * of statements it holds, one statement is evicted and the operation is retried.
+     * \n
+     * Passing zero disables the cache. Statements held by the cache will be closed by the next
+     * call to \ref prepare_statement or \ref close_statement that involves them.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Preconditions
+     * No asynchronous operation should be outstanding when this function is called.
+     *
+     * \par Object lifetimes
+     * A statement returned by \ref prepare_statement while the cache is enabled may be closed
+     * by subsequent calls to \ref prepare_statement, when evicted from the cache.
+     * Set a capacity big enough to hold all the statements your application uses concurrently.
+     */
+    void set_statement_cache_capacity(std::size_t v) noexcept { impl_.set_statement_cache_capacity(v); }
+
+    /**
+     * \brief Returns the number of prepared statements currently held by the statement cache.
+     * \details
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t num_cached_statements() const noexcept { return impl_.num_cached_statements(); }
+
+    /**
+     * \brief Returns the ID that the server assigned to the current session.
+     * \details
+     * This is the value returned by the `CONNECTION_ID()` SQL function, and the one
+     * that `KILL` statements expect. Returns zero if the connection
+     * hasn't been established yet (handshake not run yet).
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::uint32_t connection_id() const noexcept { return impl_.connection_id(); }
+
+    /**
+     * \brief Returns the deadline configuration that this connection is using.
+     * \details
+     * See \ref set_deadlines for more info.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    deadline_params deadlines() const noexcept { return impl_.deadlines(); }
+
+    /**
+     * \brief Sets the deadline configuration.
+     * \details
+     * If `v.timeout()` is positive, the asynchronous versions of \ref connect, \ref execute,
+     * \ref start_execution and \ref read_some_rows fail with \ref client_errc::deadline_exceeded
+     * if they don't complete within the timeout. Each operation gets its own deadline,
+     * starting when it's initiated. Sync functions are not affected.
+     * \n
+     * When an \ref execute, \ref start_execution or \ref read_some_rows operation
+     * exceeds its deadline, the connection installed by \ref set_kill_connection is used to run
+     * `KILL QUERY` for this connection's session. The operation then reads the error
+     * sent by the server for the interrupted query, so this connection
+     * can still be used afterwards. If there is no kill connection or
+     * `KILL QUERY` fails, the underlying stream is closed instead, and the connection needs
+     * to be re-established. Expired \ref connect operations always close the stream.
+     * \n
+     * If the operation completes successfully while `KILL QUERY` is in flight,
+     * no error is reported, but the server may interrupt the rows
+     * pending to be read by the next \ref read_some_rows.
+     * \n
+     * Optionally, `MAX_EXECUTION_TIME` optimizer hints can be added to `SELECT` text queries,
+     * so the server itself enforces the timeout.
+     * See \ref deadline_params::max_execution_time_hint.
+     * \n
+     * Deadlines are disabled by default.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Preconditions
+     * No asynchronous operation should be outstanding when this function is called.
+     *
+     * \param v The new deadline configuration.
+     */
+    void set_deadlines(const deadline_params& v) noexcept { impl_.set_deadlines(v); }
+
+    /**
+     * \brief Installs the connection used to run `KILL QUERY` when an operation exceeds its deadline.
+     * \details
+     * `conn` should be an established connection to the same server, authenticated as a user
+     * that can kill this connection's queries (e.g. the same user). It is only used when
+     * a deadline expires, and shouldn't be used by anything else while this happens. If several
+     * connections might expire concurrently, install a different kill connection in each of them.
+     * Pass `nullptr` to remove the current kill connection. See \ref set_deadlines for more info.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Preconditions
+     * No asynchronous operation should be outstanding when this function is called.
+     * `conn != this`.
+     *
+     * \par Object lifetimes
+     * The connection doesn't take ownership of `conn`, which must be kept alive
+     * while it's installed in this connection.
+     */
+    void set_kill_connection(connection* conn) noexcept
+    {
+        BOOST_ASSERT(conn != this);
+        impl_.set_kill_channel(conn ? &conn->impl_ : nullptr);
+    }
 
     /**
      * \brief Establishes a connection to a MySQL server.
@@ -225,7 +430,7 @@ public:
             detail::is_socket_stream<Stream>::value,
             "connect can only be used if Stream satisfies the SocketStream concept"
         );
-        detail::connect_interface<Stream>(channel_.get(), endpoint, params, ec, diag);
+        detail::connect_interface<Stream>(impl_.get(), endpoint, params, ec, diag);
     }
 
     /// \copydoc connect
@@ -288,7 +493,7 @@ public:
             "async_connect can only be used if Stream satisfies the SocketStream concept"
         );
         return detail::async_connect_interface<Stream>(
-            channel_.get(),
+            impl_.get(),
             endpoint,
             params,
             diag,
@@ -296,6 +501,89 @@ public:
         );
     }
 
+    /**
+     * \brief Establishes a connection to one of several MySQL servers.
+     * \details
+     * This function is only available if `Stream` satisfies the
+     * `SocketStream` concept and uses TCP.
+     * \n
+     * Resolves the hostnames in `hosts`, ordering them by priority and weight, and connects
+     * to the first address that accepts a TCP connection. Hosts that can't be resolved are skipped.
+     * The handshake is then performed with that server. The underlying stream is closed in case
+     * of error. If no address could be connected to, the error from the last attempt is reported.
+     * \n
+     * This function tries addresses one after another. The async version runs staggered
+     * attempts, as described in \ref host_list.
+     */
+    void connect(const host_list& hosts, const handshake_params& params, error_code& ec, diagnostics& diag)
+    {
+        static_assert(
+            detail::is_socket_stream<Stream>::value,
+            "connect can only be used if Stream satisfies the SocketStream concept"
+        );
+        detail::connect_hosts_interface(impl_.get(), stream(), hosts, params, ec, diag);
+    }
+
+    /// \copydoc connect(const host_list&,const handshake_params&,error_code&,diagnostics&)
+    void connect(const host_list& hosts, const handshake_params& params)
+    {
+        error_code err;
+        diagnostics diag;
+        connect(hosts, params, err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+    }
+
+    /**
+     * \copydoc connect(const host_list&,const handshake_params&,error_code&,diagnostics&)
+     * \par Object lifetimes
+     * The strings pointed to by `params` should be kept alive by the caller
+     * until the operation completes, as no copy is made by the library.
+     * `hosts` is copied as required and doesn't need to be kept alive.
+     * The \ref resolver_cache installed in `hosts`, if any, must be kept alive
+     * until the operation completes.
+     *
+     * \par Handler signature
+     * The handler signature for this operation is `void(boost::mysql::error_code)`.
+     */
+    template <
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_connect(
+        const host_list& hosts,
+        const handshake_params& params,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return async_connect(hosts, params, this->shared_diag(), std::forward<CompletionToken>(token));
+    }
+
+    /// \copydoc async_connect(const host_list&,const handshake_params&,CompletionToken&&)
+    template <
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_connect(
+        const host_list& hosts,
+        const handshake_params& params,
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        static_assert(
+            detail::is_socket_stream<Stream>::value,
+            "async_connect can only be used if Stream satisfies the SocketStream concept"
+        );
+        return detail::async_connect_hosts_interface(
+            impl_.get(),
+            stream(),
+            hosts,
+            params,
+            diag,
+            std::forward<CompletionToken>(token)
+        );
+    }
+
     /**
      * \brief Performs the MySQL-level handshake.
      * \details
@@ -307,7 +595,7 @@ public:
      */
     void handshake(const handshake_params& params, error_code& ec, diagnostics& diag)
     {
-        detail::handshake_interface(channel_.get(), params, ec, diag);
+        detail::handshake_interface(impl_.get(), params, ec, diag);
     }
 
     /// \copydoc handshake
@@ -350,7 +638,7 @@ public:
     )
     {
         return detail::async_handshake_interface(
-            channel_.get(),
+            impl_.get(),
             params,
             diag,
             std::forward<CompletionToken>(token)
@@ -375,7 +663,7 @@ public:
     template <BOOST_MYSQL_EXECUTION_REQUEST ExecutionRequest, BOOST_MYSQL_RESULTS_TYPE ResultsType>
     void execute(const ExecutionRequest& req, ResultsType& result, error_code& err, diagnostics& diag)
     {
-        detail::execute_interface(channel_.get(), req, result, err, diag);
+        detail::execute_interface(impl_.get(), req, result, err, diag);
     }
 
     /// \copydoc execute
@@ -440,7 +728,7 @@ public:
     )
     {
         return detail::async_execute_interface(
-            channel_.get(),
+            impl_.get(),
             std::forward<ExecutionRequest>(req),
             result,
             diag,
@@ -448,6 +736,380 @@ public:
         );
     }
 
+    /**
+     * \brief Executes several text queries and prepared statements using pipelining.
+     * \details
+     * Sends all the requests in `req` to the server in a single write, and then reads
+     * the responses, in order, into `res`. This saves one round-trip per request, compared
+     * to calling \ref execute once per request.
+     * \n
+     * Errors are isolated per request: if the server reports an error for a request,
+     * it is stored in `res` and subsequent requests are processed normally. Use
+     * \ref pipeline_response::error to check the outcome of each request.
+     * In this case, this function reports success.
+     * \n
+     * If a fatal error occurs (e.g. a network error), processing stops and this function
+     * fails. Any request that couldn't be completed will report this error in `res`.
+     * \n
+     * Note that requests are executed in order but are not transactional: a failed request
+     * doesn't prevent the following ones from being executed.
+     */
+    void execute_pipeline(
+        const pipeline_request& req,
+        pipeline_response& res,
+        error_code& err,
+        diagnostics& diag
+    )
+    {
+        detail::execute_pipeline_interface(impl_.get(), req, res, err, diag);
+    }
+
+    /// \copydoc execute_pipeline
+    void execute_pipeline(const pipeline_request& req, pipeline_response& res)
+    {
+        error_code err;
+        diagnostics diag;
+        execute_pipeline(req, res, err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+    }
+
+    /**
+     * \copydoc execute_pipeline
+     * \par Object lifetimes
+     * The caller must keep `req` and `res` alive until the operation completes.
+     *
+     * \par Handler signature
+     * The handler signature for this operation is `void(boost::mysql::error_code)`.
+     */
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_execute_pipeline(
+        const pipeline_request& req,
+        pipeline_response& res,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return async_execute_pipeline(req, res, shared_diag(), std::forward<CompletionToken>(token));
+    }
+
+    /// \copydoc async_execute_pipeline
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_execute_pipeline(
+        const pipeline_request& req,
+        pipeline_response& res,
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return detail::async_execute_pipeline_interface(
+            impl_.get(),
+            req,
+            res,
+            diag,
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /**
+     * \brief Executes a prepared statement once per row of parameters.
+     * \details
+     * Each element in `param_rows` must be a `WritableFieldTuple` (e.g. a `std::tuple`) holding
+     * the parameters for one execution of `stmt`. The total number of affected rows, the first
+     * generated `AUTO_INCREMENT` ID and the total number of warnings are stored in `result`.
+     * \n
+     * This is intended for `INSERT`, `UPDATE` and `DELETE` statements. `stmt` must not return
+     * resultsets. Any string parameters should be encoded using the connection's character set.
+     * \n
+     * If the server is MariaDB and supports bulk operations, all the rows are sent in a single
+     * `COM_STMT_BULK_EXECUTE` command, which is much more efficient than executing the statement
+     * several times. This requires `stmt` to have at least one parameter, and all non-NULL values
+     * passed for a given parameter to have the same \ref field_kind. If these conditions don't hold,
+     * or the server is MySQL, the statement is executed once per row, stopping at the first error.
+     * \n
+     * In both cases, executions are not transactional: if an error is reported, rows prior
+     * to the one that caused it may have been processed. Wrap this call in a transaction
+     * if you need atomicity.
+     * \n
+     * If any row has a number of parameters different from `stmt.num_params()`, fails with
+     * \ref client_errc::wrong_num_params without communicating with the server. Likewise, if values
+     * sent by \ref send_long_data are pending for `stmt`, fails with \ref client_errc::pending_long_data.
+     * If `param_rows` is empty, this function does nothing.
+     */
+    template <BOOST_MYSQL_WRITABLE_FIELD_TUPLE_RANGE WritableFieldTupleRange>
+    void execute_bulk(
+        const statement& stmt,
+        const WritableFieldTupleRange& param_rows,
+        bulk_execution_result& result,
+        error_code& err,
+        diagnostics& diag
+    )
+    {
+        detail::execute_bulk_interface(impl_.get(), stmt, param_rows, result, err, diag);
+    }
+
+    /// \copydoc execute_bulk
+    template <BOOST_MYSQL_WRITABLE_FIELD_TUPLE_RANGE WritableFieldTupleRange>
+    void execute_bulk(
+        const statement& stmt,
+        const WritableFieldTupleRange& param_rows,
+        bulk_execution_result& result
+    )
+    {
+        error_code err;
+        diagnostics diag;
+        execute_bulk(stmt, param_rows, result, err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+    }
+
+    /**
+     * \copydoc execute_bulk
+     * \par Object lifetimes
+     * The caller must keep `param_rows`, any values referenced by its elements (e.g. strings
+     * passed as `string_view`) and `result` alive until the operation completes.
+     *
+     * \par Handler signature
+     * The handler signature for this operation is `void(boost::mysql::error_code)`.
+     */
+    template <
+        BOOST_MYSQL_WRITABLE_FIELD_TUPLE_RANGE WritableFieldTupleRange,
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_execute_bulk(
+        const statement& stmt,
+        const WritableFieldTupleRange& param_rows,
+        bulk_execution_result& result,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return async_execute_bulk(
+            stmt,
+            param_rows,
+            result,
+            shared_diag(),
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /// \copydoc async_execute_bulk
+    template <
+        BOOST_MYSQL_WRITABLE_FIELD_TUPLE_RANGE WritableFieldTupleRange,
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_execute_bulk(
+        const statement& stmt,
+        const WritableFieldTupleRange& param_rows,
+        bulk_execution_result& result,
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return detail::async_execute_bulk_interface(
+            impl_.get(),
+            stmt,
+            param_rows,
+            result,
+            diag,
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /**
+     * \brief Runs a `LOAD DATA LOCAL INFILE` statement, streaming the data from `source`.
+     * \details
+     * Sends `query` to the server for execution. When the server requests the file contents,
+     * `source` is read in chunks, and each chunk is sent to the server as soon as it's read.
+     * The whole data is never held in memory. The server response is read into `result`, which
+     * may be either a \ref results or \ref static_results object.
+     * \n
+     * The file name in `query` is ignored by the client: the data sent is always the one
+     * provided by `source`. `query` must be encoded using the connection's character set.
+     * \n
+     * This function requires `LOAD DATA LOCAL INFILE` support to be enabled in the server and
+     * in the connection, using \ref handshake_params::set_local_infile.
+     * \n
+     * If reading from `source` fails, the transfer is terminated, the server response
+     * is read, and the operation fails with the error reported by `source`. Note that the server
+     * may have already loaded the data sent before the failure. If reading the server response
+     * also fails, that error is reported instead.
+     */
+    template <BOOST_MYSQL_RESULTS_TYPE ResultsType>
+    void load_data_local(
+        string_view query,
+        load_data_source source,
+        ResultsType& result,
+        error_code& err,
+        diagnostics& diag
+    )
+    {
+        detail::load_data_local_interface(impl_.get(), query, source, result, err, diag);
+    }
+
+    /// \copydoc load_data_local
+    template <BOOST_MYSQL_RESULTS_TYPE ResultsType>
+    void load_data_local(string_view query, load_data_source source, ResultsType& result)
+    {
+        error_code err;
+        diagnostics diag;
+        load_data_local(query, std::move(source), result, err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+    }
+
+    /**
+     * \copydoc load_data_local
+     * \par Object lifetimes
+     * If `CompletionToken` is a deferred completion token (e.g. `use_awaitable`), the string
+     * pointed to by `query` must be kept alive by the caller until the operation is initiated.
+     * Objects referenced by `source` (like streams) must be kept alive until the operation completes.
+     *
+     * \par Handler signature
+     * The handler signature for this operation is `void(boost::mysql::error_code)`.
+     */
+    template <
+        BOOST_MYSQL_RESULTS_TYPE ResultsType,
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_load_data_local(
+        string_view query,
+        load_data_source source,
+        ResultsType& result,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return async_load_data_local(
+            query,
+            std::move(source),
+            result,
+            shared_diag(),
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /// \copydoc async_load_data_local
+    template <
+        BOOST_MYSQL_RESULTS_TYPE ResultsType,
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_load_data_local(
+        string_view query,
+        load_data_source source,
+        ResultsType& result,
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return detail::async_load_data_local_interface(
+            impl_.get(),
+            query,
+            std::move(source),
+            result,
+            diag,
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /**
+     * \brief Streams the value of a prepared statement parameter to the server, in chunks.
+     * \details
+     * Reads `source` in chunks and sends each of them to the server in a `COM_STMT_SEND_LONG_DATA`
+     * message, as soon as it's read. The server doesn't reply to these messages, so chunks are written
+     * back to back, and the whole value is never held in memory. The server stores the value
+     * until the statement is executed.
+     * \n
+     * The value is used by the next \ref execute or \ref start_execution call for `stmt`, in place
+     * of the one passed for the parameter at position `param_index` (zero-based), which is not sent.
+     * This placeholder value must be a string or a blob, which determines the parameter type.
+     * Calling this function several times for the same parameter before executing the statement
+     * appends the data. Values are discarded when the statement is executed or closed.
+     * Executing `stmt` using \ref execute_pipeline or \ref execute_bulk while values are pending
+     * is not supported, and fails with \ref client_errc::pending_long_data.
+     * \n
+     * If reading from `source` fails, the statement is reset using `COM_STMT_RESET`, which discards
+     * the values sent for all of its parameters and closes any cursor open for it. The operation then
+     * fails with the error reported by `source`.
+     *
+     * \par Preconditions
+     * `stmt.valid() == true` \n
+     * `param_index < stmt.num_params()` \n
+     * `source.valid() == true`
+     */
+    void send_long_data(
+        const statement& stmt,
+        std::size_t param_index,
+        load_data_source source,
+        error_code& err,
+        diagnostics& diag
+    )
+    {
+        detail::send_long_data_interface(impl_.get(), stmt, param_index, source, err, diag);
+    }
+
+    /// \copydoc send_long_data
+    void send_long_data(const statement& stmt, std::size_t param_index, load_data_source source)
+    {
+        error_code err;
+        diagnostics diag;
+        send_long_data(stmt, param_index, std::move(source), err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+    }
+
+    /**
+     * \copydoc send_long_data
+     * \par Object lifetimes
+     * Objects referenced by `source` (like streams) must be kept alive until the operation completes.
+     *
+     * \par Handler signature
+     * The handler signature for this operation is `void(boost::mysql::error_code)`.
+     */
+    template <
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_send_long_data(
+        const statement& stmt,
+        std::size_t param_index,
+        load_data_source source,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return async_send_long_data(
+            stmt,
+            param_index,
+            std::move(source),
+            shared_diag(),
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /// \copydoc async_send_long_data
+    template <
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_send_long_data(
+        const statement& stmt,
+        std::size_t param_index,
+        load_data_source source,
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return detail::async_send_long_data_interface(
+            impl_.get(),
+            stmt,
+            param_index,
+            std::move(source),
+            diag,
+            std::forward<CompletionToken>(token)
+        );
+    }
+
     /**
      * \brief Starts a SQL execution as a multi-function operation.
      * \details
@@ -482,7 +1144,7 @@ public:
         diagnostics& diag
     )
     {
-        detail::start_execution_interface(channel_.get(), req, st, err, diag);
+        detail::start_execution_interface(impl_.get(), req, st, err, diag);
     }
 
     /// \copydoc start_execution
@@ -549,7 +1211,7 @@ public:
     )
     {
         return detail::async_start_execution_interface(
-            channel_.get(),
+            impl_.get(),
             std::forward<ExecutionRequest>(req),
             st,
             diag,
@@ -691,10 +1353,13 @@ public:
      * `stmt` should be encoded using the connection's character set.
      * \n
      * The returned statement has `valid() == true`.
+     * \n
+     * If the statement cache is enabled (see \ref set_statement_cache_capacity) and holds
+     * a statement for `stmt`, it's returned without performing any network operation.
      */
     statement prepare_statement(string_view stmt, error_code& err, diagnostics& diag)
     {
-        return detail::prepare_statement_interface(channel_.get(), stmt, err, diag);
+        return detail::prepare_statement_interface(impl_.get(), stmt, err, diag);
     }
 
     /// \copydoc prepare_statement
@@ -740,7 +1405,7 @@ public:
     )
     {
         return detail::async_prepare_statement_interface(
-            channel_.get(),
+            impl_.get(),
             stmt,
             diag,
             std::forward<CompletionToken>(token)
@@ -1041,150 +1706,309 @@ public:
         );
     }
 
-    /// \copydoc async_start_statement_execution(const statement&,FieldViewFwdIterator,FieldViewFwdIterator,execution_state&,CompletionToken&&)
-    template <
-        BOOST_MYSQL_FIELD_VIEW_FORWARD_ITERATOR FieldViewFwdIterator,
-        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
-            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
-    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
-    async_start_statement_execution(
-        const statement& stmt,
-        FieldViewFwdIterator params_first,
-        FieldViewFwdIterator params_last,
+    /// \copydoc async_start_statement_execution(const statement&,FieldViewFwdIterator,FieldViewFwdIterator,execution_state&,CompletionToken&&)
+    template <
+        BOOST_MYSQL_FIELD_VIEW_FORWARD_ITERATOR FieldViewFwdIterator,
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_start_statement_execution(
+        const statement& stmt,
+        FieldViewFwdIterator params_first,
+        FieldViewFwdIterator params_last,
+        execution_state& st,
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return async_start_execution(
+            stmt.bind(params_first, params_last),
+            st,
+            diag,
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /**
+     * \brief Closes a statement, deallocating it from the server.
+     * \details
+     * After this operation succeeds, `stmt` must not be used again for execution.
+     * \n
+     * If the statement cache is enabled (see \ref set_statement_cache_capacity) and holds `stmt`,
+     * the statement is kept open for reuse and no network operation is performed.
+     * \n
+     * \par Preconditions
+     *    `stmt.valid() == true`
+     */
+    void close_statement(const statement& stmt, error_code& err, diagnostics& diag)
+    {
+        detail::close_statement_interface(impl_.get(), stmt, err, diag);
+    }
+
+    /// \copydoc close_statement
+    void close_statement(const statement& stmt)
+    {
+        error_code err;
+        diagnostics diag;
+        close_statement(stmt, err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+    }
+
+    /**
+     * \copydoc close_statement
+     * \details
+     * \par Object lifetimes
+     * It is not required to keep `stmt` alive, as copies are made by the implementation as required.
+     *
+     * \par Handler signature
+     * The handler signature for this operation is `void(boost::mysql::error_code)`.
+     */
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_close_statement(
+        const statement& stmt,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return async_close_statement(stmt, shared_diag(), std::forward<CompletionToken>(token));
+    }
+
+    /// \copydoc async_close_statement
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_close_statement(
+        const statement& stmt,
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return detail::async_close_statement_interface(
+            impl_.get(),
+            stmt,
+            diag,
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /**
+     * \brief Reads a batch of rows.
+     * \details
+     * The number of rows that will be read is unspecified. If the operation represented by `st`
+     * has still rows to read, at least one will be read. If there are no more rows, or
+     * `st.should_read_rows() == false`, returns an empty `rows_view`.
+     * \n
+     * The number of rows that will be read depends on the input buffer size. The bigger the buffer,
+     * the greater the batch size (up to a maximum). You can set the initial buffer size in `connection`'s
+     * constructor, using \ref buffer_params::initial_read_size. The buffer may be
+     * grown bigger by other read operations, if required.
+     * \n
+     * The returned view points into memory owned by `*this`. It will be valid until
+     * `*this` performs the next network operation or is destroyed.
+     */
+    rows_view read_some_rows(execution_state& st, error_code& err, diagnostics& diag)
+    {
+        return detail::read_some_rows_dynamic_interface(impl_.get(), st, batch_params(), err, diag);
+    }
+
+    /// \copydoc read_some_rows(execution_state&,error_code&,diagnostics&)
+    rows_view read_some_rows(execution_state& st)
+    {
+        error_code err;
+        diagnostics diag;
+        rows_view res = read_some_rows(st, err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+        return res;
+    }
+
+    /**
+     * \copydoc read_some_rows(execution_state&,error_code&,diagnostics&)
+     * \details
+     * \par Handler signature
+     * The handler signature for this operation is
+     * `void(boost::mysql::error_code, boost::mysql::rows_view)`.
+     */
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::rows_view))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, rows_view))
+    async_read_some_rows(
+        execution_state& st,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return async_read_some_rows(st, shared_diag(), std::forward<CompletionToken>(token));
+    }
+
+    /// \copydoc async_read_some_rows(execution_state&,CompletionToken&&)
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::rows_view))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, rows_view))
+    async_read_some_rows(
         execution_state& st,
         diagnostics& diag,
         CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
     )
     {
-        return async_start_execution(
-            stmt.bind(params_first, params_last),
+        return detail::async_read_some_rows_dynamic_interface(
+            impl_.get(),
             st,
+            batch_params(),
             diag,
             std::forward<CompletionToken>(token)
         );
     }
 
     /**
-     * \brief Closes a statement, deallocating it from the server.
+     * \brief Reads a batch of rows, with a size target.
      * \details
-     * After this operation succeeds, `stmt` must not be used again for execution.
+     * Like \ref read_some_rows(execution_state&,error_code&,diagnostics&), but keeps reading from
+     * the server until the batch satisfies the limits specified by `params`, or the current
+     * resultset ends. Messages that don't fit into the batch are kept in the connection's
+     * read buffer, and are returned by subsequent `read_some_rows` calls.
      * \n
-     * \par Preconditions
-     *    `stmt.valid() == true`
+     * If there are rows to be read, at least one will be read. If there are no more rows,
+     * or `st.should_read_rows() == false`, returns an empty `rows_view`.
+     * \n
+     * The returned view points into memory owned by `*this`. It will be valid until
+     * `*this` performs the next network operation or is destroyed. Batches spanning
+     * several network reads copy the strings of the rows read first into a buffer
+     * owned by `*this`.
      */
-    void close_statement(const statement& stmt, error_code& err, diagnostics& diag)
+    rows_view read_some_rows(
+        execution_state& st,
+        const batch_params& params,
+        error_code& err,
+        diagnostics& diag
+    )
     {
-        detail::close_statement_interface(channel_.get(), stmt, err, diag);
+        return detail::read_some_rows_dynamic_interface(impl_.get(), st, params, err, diag);
     }
 
-    /// \copydoc close_statement
-    void close_statement(const statement& stmt)
+    /// \copydoc read_some_rows(execution_state&,const batch_params&,error_code&,diagnostics&)
+    rows_view read_some_rows(execution_state& st, const batch_params& params)
     {
         error_code err;
         diagnostics diag;
-        close_statement(stmt, err, diag);
+        rows_view res = read_some_rows(st, params, err, diag);
         detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+        return res;
     }
 
     /**
-     * \copydoc close_statement
+     * \copydoc read_some_rows(execution_state&,const batch_params&,error_code&,diagnostics&)
      * \details
-     * \par Object lifetimes
-     * It is not required to keep `stmt` alive, as copies are made by the implementation as required.
-     *
      * \par Handler signature
-     * The handler signature for this operation is `void(boost::mysql::error_code)`.
+     * The handler signature for this operation is
+     * `void(boost::mysql::error_code, boost::mysql::rows_view)`.
      */
-    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::rows_view))
                   CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
-    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
-    async_close_statement(
-        const statement& stmt,
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, rows_view))
+    async_read_some_rows(
+        execution_state& st,
+        const batch_params& params,
         CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
     )
     {
-        return async_close_statement(stmt, shared_diag(), std::forward<CompletionToken>(token));
+        return async_read_some_rows(st, params, shared_diag(), std::forward<CompletionToken>(token));
     }
 
-    /// \copydoc async_close_statement
-    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+    /// \copydoc async_read_some_rows(execution_state&,const batch_params&,CompletionToken&&)
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::rows_view))
                   CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
-    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
-    async_close_statement(
-        const statement& stmt,
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, rows_view))
+    async_read_some_rows(
+        execution_state& st,
+        const batch_params& params,
         diagnostics& diag,
         CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
     )
     {
-        return detail::async_close_statement_interface(
-            channel_.get(),
-            stmt,
+        return detail::async_read_some_rows_dynamic_interface(
+            impl_.get(),
+            st,
+            params,
             diag,
             std::forward<CompletionToken>(token)
         );
     }
 
     /**
-     * \brief Reads a batch of rows.
+     * \brief Reads a single row, streaming its big fields.
      * \details
-     * The number of rows that will be read is unspecified. If the operation represented by `st`
-     * has still rows to read, at least one will be read. If there are no more rows, or
-     * `st.should_read_rows() == false`, returns an empty `rows_view`.
+     * Reads the next row of the operation represented by `st`. String and blob fields
+     * with at least `params.min_size()` bytes are not stored in the returned row. Instead, their
+     * contents are passed to the callback in `params` as they are read from the network,
+     * without assembling the row in memory. Streamed fields appear as empty strings or blobs
+     * in the returned row. This avoids growing the connection's read buffer to hold rows containing
+     * big values.
      * \n
-     * The number of rows that will be read depends on the input buffer size. The bigger the buffer,
-     * the greater the batch size (up to a maximum). You can set the initial buffer size in `connection`'s
-     * constructor, using \ref buffer_params::initial_read_size. The buffer may be
-     * grown bigger by other read operations, if required.
+     * If there are no more rows, or `st.should_read_rows() == false`, returns an empty `row_view`.
+     * \n
+     * If the callback reports an error, the rest of the row is read and discarded, and
+     * the operation fails with the reported error. The connection can still be used.
      * \n
      * The returned view points into memory owned by `*this`. It will be valid until
      * `*this` performs the next network operation or is destroyed.
+     *
+     * \par Object lifetimes
+     * `params` is passed by reference, and should be kept alive until the operation completes.
      */
-    rows_view read_some_rows(execution_state& st, error_code& err, diagnostics& diag)
+    row_view read_row_streamed(
+        execution_state& st,
+        field_stream_params& params,
+        error_code& err,
+        diagnostics& diag
+    )
     {
-        return detail::read_some_rows_dynamic_interface(channel_.get(), st, err, diag);
+        return detail::read_row_streamed_interface(impl_.get(), st, params, err, diag);
     }
 
-    /// \copydoc read_some_rows(execution_state&,error_code&,diagnostics&)
-    rows_view read_some_rows(execution_state& st)
+    /// \copydoc read_row_streamed(execution_state&,field_stream_params&,error_code&,diagnostics&)
+    row_view read_row_streamed(execution_state& st, field_stream_params& params)
     {
         error_code err;
         diagnostics diag;
-        rows_view res = read_some_rows(st, err, diag);
+        row_view res = read_row_streamed(st, params, err, diag);
         detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
         return res;
     }
 
     /**
-     * \copydoc read_some_rows(execution_state&,error_code&,diagnostics&)
+     * \copydoc read_row_streamed(execution_state&,field_stream_params&,error_code&,diagnostics&)
      * \details
      * \par Handler signature
      * The handler signature for this operation is
-     * `void(boost::mysql::error_code, boost::mysql::rows_view)`.
+     * `void(boost::mysql::error_code, boost::mysql::row_view)`.
      */
-    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::rows_view))
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::row_view))
                   CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
-    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, rows_view))
-    async_read_some_rows(
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, row_view))
+    async_read_row_streamed(
         execution_state& st,
+        field_stream_params& params,
         CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
     )
     {
-        return async_read_some_rows(st, shared_diag(), std::forward<CompletionToken>(token));
+        return async_read_row_streamed(st, params, shared_diag(), std::forward<CompletionToken>(token));
     }
 
-    /// \copydoc async_read_some_rows(execution_state&,CompletionToken&&)
-    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::rows_view))
+    /// \copydoc async_read_row_streamed(execution_state&,field_stream_params&,CompletionToken&&)
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::row_view))
                   CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
-    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, rows_view))
-    async_read_some_rows(
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, row_view))
+    async_read_row_streamed(
         execution_state& st,
+        field_stream_params& params,
         diagnostics& diag,
         CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
     )
     {
-        return detail::async_read_some_rows_dynamic_interface(
-            channel_.get(),
+        return detail::async_read_row_streamed_interface(
+            impl_.get(),
             st,
+            params,
             diag,
             std::forward<CompletionToken>(token)
         );
@@ -1227,7 +2051,7 @@ public:
         diagnostics& diag
     )
     {
-        return detail::read_some_rows_static_interface(channel_.get(), st, output, err, diag);
+        return detail::read_some_rows_static_interface(impl_.get(), st, output, batch_params(), err, diag);
     }
 
     /**
@@ -1364,9 +2188,101 @@ public:
     )
     {
         return detail::async_read_some_rows_static_interface(
-            channel_.get(),
+            impl_.get(),
+            st,
+            output,
+            batch_params(),
+            diag,
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /**
+     * \brief Reads a batch of rows, with a size target.
+     * \details
+     * Like \ref read_some_rows(static_execution_state<StaticRow...>&,span<SpanStaticRow>,error_code&,diagnostics&),
+     * but keeps reading from the server until the batch satisfies the limits specified by `params`,
+     * the span is full or the current resultset ends. Messages that don't fit into the batch
+     * are kept in the connection's read buffer, and are returned by subsequent `read_some_rows` calls.
+     * \n
+     * Returns the number of read rows. If the operation represented by `st` has still rows to read,
+     * and `output.size() > 0`, at least one row will be read.
+     * \n
+     * This function can report schema mismatches.
+     */
+    template <class SpanStaticRow, class... StaticRow>
+    std::size_t read_some_rows(
+        static_execution_state<StaticRow...>& st,
+        span<SpanStaticRow> output,
+        const batch_params& params,
+        error_code& err,
+        diagnostics& diag
+    )
+    {
+        return detail::read_some_rows_static_interface(impl_.get(), st, output, params, err, diag);
+    }
+
+    /// \copydoc read_some_rows(static_execution_state<StaticRow...>&,span<SpanStaticRow>,const batch_params&,error_code&,diagnostics&)
+    template <class SpanStaticRow, class... StaticRow>
+    std::size_t read_some_rows(
+        static_execution_state<StaticRow...>& st,
+        span<SpanStaticRow> output,
+        const batch_params& params
+    )
+    {
+        error_code err;
+        diagnostics diag;
+        std::size_t res = read_some_rows(st, output, params, err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+        return res;
+    }
+
+    /**
+     * \copydoc read_some_rows(static_execution_state<StaticRow...>&,span<SpanStaticRow>,const batch_params&,error_code&,diagnostics&)
+     * \details
+     * \par Handler signature
+     * The handler signature for this operation is
+     * `void(boost::mysql::error_code, std::size_t)`.
+     *
+     * \par Object lifetimes
+     * The storage that `output` references must be kept alive until the operation completes.
+     */
+    template <
+        class SpanStaticRow,
+        class... StaticRow,
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, std::size_t))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, std::size_t))
+    async_read_some_rows(
+        static_execution_state<StaticRow...>& st,
+        span<SpanStaticRow> output,
+        const batch_params& params,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return async_read_some_rows(st, output, params, shared_diag(), std::forward<CompletionToken>(token));
+    }
+
+    /// \copydoc async_read_some_rows(static_execution_state<StaticRow...>&,span<SpanStaticRow>,const batch_params&,CompletionToken&&)
+    template <
+        class SpanStaticRow,
+        class... StaticRow,
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, std::size_t))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, std::size_t))
+    async_read_some_rows(
+        static_execution_state<StaticRow...>& st,
+        span<SpanStaticRow> output,
+        const batch_params& params,
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return detail::async_read_some_rows_static_interface(
+            impl_.get(),
             st,
             output,
+            params,
             diag,
             std::forward<CompletionToken>(token)
         );
@@ -1395,7 +2311,7 @@ public:
     template <BOOST_MYSQL_EXECUTION_STATE_TYPE ExecutionStateType>
     void read_resultset_head(ExecutionStateType& st, error_code& err, diagnostics& diag)
     {
-        return detail::read_resultset_head_interface(channel_.get(), st, err, diag);
+        return detail::read_resultset_head_interface(impl_.get(), st, err, diag);
     }
 
     /// \copydoc read_resultset_head
@@ -1440,7 +2356,7 @@ public:
     )
     {
         return detail::async_read_resultset_head_interface(
-            channel_.get(),
+            impl_.get(),
             st,
             diag,
             std::forward<CompletionToken>(token)
@@ -1458,7 +2374,7 @@ public:
      * in a long-running query, the ping request won't be answered until the query is
      * finished.
      */
-    void ping(error_code& err, diagnostics& diag) { detail::ping_interface(channel_.get(), err, diag); }
+    void ping(error_code& err, diagnostics& diag) { detail::ping_interface(impl_.get(), err, diag); }
 
     /// \copydoc ping
     void ping()
@@ -1490,7 +2406,135 @@ public:
     BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
     async_ping(diagnostics& diag, CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type))
     {
-        return detail::async_ping_interface(channel_.get(), diag, std::forward<CompletionToken>(token));
+        return detail::async_ping_interface(impl_.get(), diag, std::forward<CompletionToken>(token));
+    }
+
+    /**
+     * \brief Resets the server-side session state.
+     * \details
+     * Sends a `COM_RESET_CONNECTION` command, which wipes all session state: user variables,
+     * temporary tables, session variables and transactions in progress are discarded, and
+     * all prepared statements are deallocated. The connection stays authenticated as the same user,
+     * and uses the same default database. This is cheaper than re-connecting.
+     * \n
+     * After this operation is started, any \ref statement prepared before it becomes stale.
+     * Attempting to execute it results in a \ref client_errc::stale_statement error,
+     * without contacting the server. Closing it is a no-op.
+     * \n
+     * Like session variables, the connection's character set may be reset by this operation.
+     * If you changed it using `SET NAMES`, you should issue this statement again.
+     */
+    void reset_connection(error_code& err, diagnostics& diag)
+    {
+        detail::reset_connection_interface(impl_.get(), err, diag);
+    }
+
+    /// \copydoc reset_connection
+    void reset_connection()
+    {
+        error_code err;
+        diagnostics diag;
+        reset_connection(err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+    }
+
+    /**
+     * \copydoc reset_connection
+     * \details
+     * \n
+     * \par Handler signature
+     * The handler signature for this operation is `void(boost::mysql::error_code)`.
+     */
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_reset_connection(CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type))
+    {
+        return async_reset_connection(shared_diag(), std::forward<CompletionToken>(token));
+    }
+
+    /// \copydoc async_reset_connection
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_reset_connection(
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return detail::async_reset_connection_interface(
+            impl_.get(),
+            diag,
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /**
+     * \brief Re-authenticates the connection as a different user.
+     * \details
+     * Sends a `COM_CHANGE_USER` command, authenticating as the user given by `params`
+     * without re-establishing the physical connection or the TLS session.
+     * Only \ref handshake_params::username, \ref handshake_params::password,
+     * \ref handshake_params::database and \ref handshake_params::connection_collation are used.
+     * The authentication plugin announced by the server in the initial handshake is used.
+     * \n
+     * Like \ref reset_connection, this wipes all session state. Statements prepared before
+     * this operation is started become stale: executing them results in a
+     * \ref client_errc::stale_statement error, and closing them is a no-op.
+     * \n
+     * If this operation fails, the session is left in an undefined state, and the connection
+     * should be closed.
+     */
+    void change_user(const handshake_params& params, error_code& err, diagnostics& diag)
+    {
+        detail::change_user_interface(impl_.get(), params, err, diag);
+    }
+
+    /// \copydoc change_user
+    void change_user(const handshake_params& params)
+    {
+        error_code err;
+        diagnostics diag;
+        change_user(params, err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+    }
+
+    /**
+     * \copydoc change_user
+     * \par Object lifetimes
+     * The strings pointed to by `params` should be kept alive by the caller
+     * until the operation completes, as no copy is made by the library.
+     *
+     * \par Handler signature
+     * The handler signature for this operation is `void(boost::mysql::error_code)`.
+     */
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_change_user(
+        const handshake_params& params,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return async_change_user(params, shared_diag(), std::forward<CompletionToken>(token));
+    }
+
+    /// \copydoc async_change_user
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_change_user(
+        const handshake_params& params,
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return detail::async_change_user_interface(
+            impl_.get(),
+            params,
+            diag,
+            std::forward<CompletionToken>(token)
+        );
     }
 
     /**
@@ -1507,7 +2551,7 @@ public:
             detail::is_socket_stream<Stream>::value,
             "close can only be used if Stream satisfies the SocketStream concept"
         );
-        detail::close_connection_interface(channel_.get(), err, diag);
+        detail::close_connection_interface(impl_.get(), err, diag);
     }
 
     /// \copydoc close
@@ -1552,7 +2596,7 @@ public:
             "async_close can only be used if Stream satisfies the SocketStream concept"
         );
         return detail::async_close_connection_interface(
-            channel_.get(),
+            impl_.get(),
             diag,
             std::forward<CompletionToken>(token)
         );
@@ -1570,7 +2614,7 @@ public:
      */
     void quit(error_code& err, diagnostics& diag)
     {
-        detail::quit_connection_interface(channel_.get(), err, diag);
+        detail::quit_connection_interface(impl_.get(), err, diag);
     }
 
     /// \copydoc quit
@@ -1603,7 +2647,7 @@ public:
     async_quit(diagnostics& diag, CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type))
     {
         return detail::async_quit_connection_interface(
-            channel_.get(),
+            impl_.get(),
             diag,
             std::forward<CompletionToken>(token)
         );
@@ -0,0 +1,180 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_CONNECTION_OBSERVER_HPP
+#define BOOST_MYSQL_CONNECTION_OBSERVER_HPP
+
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <cstddef>
+#include <cstdint>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief Identifies a network operation performed by a \ref connection.
+ * \details Used by \ref connection_observer.
+ */
+enum class operation_type
+{
+    /// \ref connection::connect and \ref connection::async_connect.
+    connect,
+
+    /// \ref connection::handshake and \ref connection::async_handshake.
+    handshake,
+
+    /// \ref connection::execute and \ref connection::async_execute.
+    execute,
+
+    /// \ref connection::start_execution and \ref connection::async_start_execution.
+    start_execution,
+
+    /// \ref connection::read_resultset_head and \ref connection::async_read_resultset_head.
+    read_resultset_head,
+
+    /// \ref connection::read_some_rows and \ref connection::async_read_some_rows.
+    read_some_rows,
+
+    /// \ref connection::read_row_streamed and \ref connection::async_read_row_streamed.
+    read_row_streamed,
+
+    /// \ref connection::execute_pipeline and \ref connection::async_execute_pipeline.
+    execute_pipeline,
+
+    /// \ref connection::execute_bulk and \ref connection::async_execute_bulk.
+    execute_bulk,
+
+    /// \ref connection::load_data_local and \ref connection::async_load_data_local.
+    load_data_local,
+
+    /// \ref connection::send_long_data and \ref connection::async_send_long_data.
+    send_long_data,
+
+    /// \ref connection::prepare_statement and \ref connection::async_prepare_statement.
+    prepare_statement,
+
+    /// \ref connection::close_statement and \ref connection::async_close_statement.
+    close_statement,
+
+    /// \ref connection::ping and \ref connection::async_ping.
+    ping,
+
+    /// \ref connection::reset_connection and \ref connection::async_reset_connection.
+    /// Also used by \ref connection_pool when returning connections.
+    reset_connection,
+
+    /// \ref connection::change_user and \ref connection::async_change_user.
+    change_user,
+
+    /// \ref connection::close and \ref connection::async_close.
+    close,
+
+    /// \ref connection::quit and \ref connection::async_quit.
+    quit,
+};
+
+/**
+ * \brief Describes a network operation performed by a \ref connection.
+ * \details Passed to \ref connection_observer::on_operation_start and
+ * \ref connection_observer::on_operation_finish.
+ *
+ * \par Object lifetimes
+ * `query` points to memory owned by the caller of the operation. It is only
+ * guaranteed to be valid until the observer function that received it returns.
+ * It's always empty in \ref connection_observer::on_operation_finish.
+ */
+struct operation_info
+{
+    /// The operation being performed.
+    operation_type type;
+
+    /// The SQL text, for operations executing text queries, preparing statements
+    /// or running `LOAD DATA LOCAL INFILE`. Empty otherwise.
+    string_view query;
+
+    /// The ID of the statement being executed or closed. Zero otherwise.
+    std::uint32_t statement_id{};
+};
+
+/**
+ * \brief Base class for objects receiving protocol-level events from a \ref connection.
+ * \details
+ * Install an observer using \ref connection::set_observer to get visibility into what
+ * a connection is doing: the high-level operations it performs and how long they take,
+ * the bytes it reads and writes, and the memory management performed by its read buffer.
+ * This information can be exported to metrics and tracing systems.
+ * \n
+ * Derive from this class and override the functions you're interested in.
+ * The default implementations do nothing. Observer functions are invoked synchronously,
+ * from within the connection's operations, and must not throw. If no observer is installed,
+ * the only overhead is a null pointer check at every notification point.
+ * \n
+ * Byte and message counts refer to the MySQL protocol layer: if the connection is
+ * using compression, they refer to uncompressed data.
+ */
+class connection_observer
+{
+public:
+    /// Destructor.
+    virtual ~connection_observer() {}
+
+    /**
+     * \brief Called when a network operation starts.
+     * \details Operations implemented in terms of others (e.g. `execute`, which reads the resultset
+     * head and rows) are reported as a single operation.
+     */
+    virtual void on_operation_start(const operation_info& info) { (void)info; }
+
+    /**
+     * \brief Called when a network operation finishes, either successfully or with an error.
+     * \details Not called if the operation exits with an exception other than an error
+     * reported by the server or the network (e.g. `std::bad_alloc`).
+     */
+    virtual void on_operation_finish(const operation_info& info, error_code err)
+    {
+        (void)info;
+        (void)err;
+    }
+
+    /// Called when bytes are read from the underlying stream.
+    virtual void on_bytes_read(std::size_t num_bytes) { (void)num_bytes; }
+
+    /// Called when bytes are written to the underlying stream, including frame headers.
+    virtual void on_bytes_written(std::size_t num_bytes) { (void)num_bytes; }
+
+    /**
+     * \brief Called when a complete message has been parsed from the bytes read.
+     * \details `size` excludes frame headers. Messages bigger than 16MB
+     * are split into several frames by the protocol.
+     */
+    virtual void on_message_read(std::size_t size, std::size_t num_frames)
+    {
+        (void)size;
+        (void)num_frames;
+    }
+
+    /// Called when the read buffer is reallocated, either to grow or to shrink it.
+    virtual void on_read_buffer_resize(std::size_t old_size, std::size_t new_size)
+    {
+        (void)old_size;
+        (void)new_size;
+    }
+
+    /**
+     * \brief Called when the read buffer discards already processed messages.
+     * \details This requires moving any unprocessed bytes to the beginning of the buffer.
+     * `bytes_moved` is the number of bytes moved.
+     */
+    virtual void on_read_buffer_compact(std::size_t bytes_moved) { (void)bytes_moved; }
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
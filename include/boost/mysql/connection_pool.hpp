@@ -0,0 +1,470 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_CONNECTION_POOL_HPP
+#define BOOST_MYSQL_CONNECTION_POOL_HPP
+
+#include <boost/mysql/connection.hpp>
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/handshake_params.hpp>
+#include <boost/mysql/pool_params.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+
+#include <boost/asio/any_completion_handler.hpp>
+#include <boost/asio/async_result.hpp>
+#include <boost/asio/basic_waitable_timer.hpp>
+#include <boost/asio/compose.hpp>
+#include <boost/assert.hpp>
+#include <boost/mp11/integer_sequence.hpp>
+
+#include <chrono>
+#include <cstddef>
+#include <deque>
+#include <functional>
+#include <list>
+#include <tuple>
+#include <type_traits>
+#include <utility>
+
+namespace boost {
+namespace mysql {
+
+template <class Stream>
+class connection_pool;
+
+namespace detail {
+
+enum class pool_node_state
+{
+    idle,     // connected and available
+    pending,  // being set up or checked by an operation
+    in_use,   // handed to the user
+};
+
+// A connection owned by the pool, plus bookkeeping information
+template <class Stream>
+struct pool_node
+{
+    connection<Stream> conn;
+    pool_node_state state{pool_node_state::pending};
+    bool connected{false};
+    bool needs_reset{false};
+    bool needs_new_stream{false};  // SSL streams can't be reused after a connect attempt
+    std::chrono::steady_clock::time_point last_used{};
+    std::chrono::steady_clock::time_point last_checked{};
+    diagnostics diag;
+
+    explicit pool_node(connection<Stream>&& c) : conn(std::move(c)) {}
+};
+
+// Stores the arguments used to create streams, so the pool can create connections on demand
+template <class Stream, class... StreamArgs>
+struct pool_connection_factory
+{
+    typename Stream::executor_type ex;
+    buffer_params buff_params;
+    std::tuple<StreamArgs...> args;
+
+    template <std::size_t... I>
+    connection<Stream> create(mp11::index_sequence<I...>) const
+    {
+        return connection<Stream>(buff_params, ex, std::get<I>(args)...);
+    }
+
+    connection<Stream> operator()() const { return create(mp11::index_sequence_for<StreamArgs...>()); }
+};
+
+template <class Stream>
+struct pool_get_connection_op;
+
+template <class Stream>
+struct pool_run_op;
+
+}  // namespace detail
+
+/**
+ * \brief A connection obtained from a \ref connection_pool.
+ * \details
+ * A RAII object that grants exclusive access to a \ref connection owned by a pool.
+ * When destroyed, the connection is returned to the pool, so it can be reused by other operations.
+ * Obtain objects of this class using \ref connection_pool::async_get_connection.
+ *\n
+ * If the pool is configured to reset connections (see \ref pool_params::reset_on_return),
+ * the session state of a returned connection is wiped before it's handed to another user.
+ * This deallocates any prepared statement created through it, so \ref statement objects
+ * must not outlive the `pooled_connection` they were prepared with.
+ *\n
+ * \par Object lifetimes
+ * The pool that created this object must be alive when this object is destroyed.
+ */
+template <class Stream>
+class pooled_connection
+{
+    using node_type = detail::pool_node<Stream>;
+
+    connection_pool<Stream>* pool_{};
+    node_type* node_{};
+
+    pooled_connection(connection_pool<Stream>& pool, node_type& node) noexcept : pool_(&pool), node_(&node) {}
+
+    void release() noexcept
+    {
+        if (node_)
+        {
+            pool_->on_returned(*node_);
+            pool_ = nullptr;
+            node_ = nullptr;
+        }
+    }
+
+#ifndef BOOST_MYSQL_DOXYGEN
+    friend struct detail::access;
+#endif
+
+public:
+    /**
+     * \brief Default constructor.
+     * \details
+     * Constructs an object that doesn't refer to any connection (`this->valid() == false`).
+     */
+    pooled_connection() = default;
+
+    /**
+     * \brief Move constructor.
+     * \details
+     * Transfers ownership of the connection to `*this`. `other` is left in an invalid state.
+     */
+    pooled_connection(pooled_connection&& other) noexcept : pool_(other.pool_), node_(other.node_)
+    {
+        other.pool_ = nullptr;
+        other.node_ = nullptr;
+    }
+
+    /**
+     * \brief Move assignment.
+     * \details
+     * If `*this` was valid, the connection it referred to is returned to the pool.
+     * Transfers ownership of the connection in `other` to `*this`.
+     */
+    pooled_connection& operator=(pooled_connection&& other) noexcept
+    {
+        if (this != &other)
+        {
+            release();
+            std::swap(pool_, other.pool_);
+            std::swap(node_, other.node_);
+        }
+        return *this;
+    }
+
+#ifndef BOOST_MYSQL_DOXYGEN
+    pooled_connection(const pooled_connection&) = delete;
+    pooled_connection& operator=(const pooled_connection&) = delete;
+#endif
+
+    /**
+     * \brief Destructor.
+     * \details
+     * If `this->valid()`, returns the connection to the pool.
+     */
+    ~pooled_connection() { release(); }
+
+    /// Returns whether this object refers to a connection.
+    bool valid() const noexcept { return node_ != nullptr; }
+
+    /**
+     * \brief Retrieves the underlying connection.
+     * \par Preconditions
+     * `this->valid() == true`
+     */
+    connection<Stream>& get() noexcept
+    {
+        BOOST_ASSERT(valid());
+        return node_->conn;
+    }
+
+    /// \copydoc get
+    const connection<Stream>& get() const noexcept
+    {
+        BOOST_ASSERT(valid());
+        return node_->conn;
+    }
+
+    /// \copydoc get
+    connection<Stream>& operator*() noexcept { return get(); }
+
+    /// \copydoc get
+    const connection<Stream>& operator*() const noexcept { return get(); }
+
+    /// \copydoc get
+    connection<Stream>* operator->() noexcept { return &get(); }
+
+    /// \copydoc get
+    const connection<Stream>* operator->() const noexcept { return &get(); }
+};
+
+/**
+ * \brief A pool of connections to a MySQL server.
+ * \details
+ * Keeps a set of established connections to the same server, creating them on demand.
+ * Connections are requested using \ref async_get_connection and returned automatically
+ * when the \ref pooled_connection object is destroyed.
+ *\n
+ * Before a connection is reused, its session state is reset (if \ref pool_params::reset_on_return
+ * is enabled), and its health is checked using \ref connection::async_ping if it has been idle for
+ * longer than \ref pool_params::ping_interval. Connections failing these steps are re-established
+ * transparently.
+ *\n
+ * Call \ref async_run to keep the pool at its minimum size, to close connections that have
+ * been idle for longer than \ref pool_params::idle_timeout and to periodically check
+ * idle connections. \ref cancel stops this operation.
+ *\n
+ * `Stream` must satisfy the `SocketStream` concept. All connections are created by invoking
+ * `Stream(ex, args...)`, where `ex` is the pool's executor and `args` are the extra arguments
+ * passed to the constructor (like a `boost::asio::ssl::context` wrapped in `std::ref`).
+ *\n
+ * \par Thread safety
+ * Distinct objects: safe. \n
+ * Shared objects: unsafe. \n
+ * This class is <b>not thread-safe</b>: all operations on a pool, including the destruction of
+ * \ref pooled_connection objects, must be performed from the same implicit or explicit strand.
+ *\n
+ * \par Object lifetimes
+ * The pool must outlive any \ref pooled_connection and any outstanding operation involving it.
+ */
+template <class Stream>
+class connection_pool
+{
+public:
+    /// The executor type associated to this object.
+    using executor_type = typename Stream::executor_type;
+
+    /// The type of the connections owned by this pool.
+    using connection_type = connection<Stream>;
+
+    /// The type of the endpoint that the pool connects to.
+    using endpoint_type = typename Stream::lowest_layer_type::endpoint_type;
+
+private:
+    using node_type = detail::pool_node<Stream>;
+    using wait_handler = asio::any_completion_handler<void(error_code, node_type*)>;
+    using timer_type = asio::basic_waitable_timer<
+        std::chrono::steady_clock,
+        asio::wait_traits<std::chrono::steady_clock>,
+        executor_type>;
+
+    executor_type ex_;
+    endpoint_type endpoint_;
+    pool_params params_;
+    handshake_params hparams_;
+    std::function<connection_type()> factory_;
+    std::list<node_type> nodes_;
+    std::deque<wait_handler> waiters_;
+    timer_type timer_;
+    bool cancelled_{false};
+    diagnostics shared_diag_;
+
+    friend class pooled_connection<Stream>;
+    friend struct detail::pool_get_connection_op<Stream>;
+    friend struct detail::pool_run_op<Stream>;
+
+    node_type& create_node()
+    {
+        nodes_.emplace_back(factory_());
+        return nodes_.back();
+    }
+
+    // Returns an idle connection or creates a new one, if possible. The node is marked as pending.
+    node_type* try_acquire();
+
+    // Hands the node to a waiter, or makes it available for future get operations
+    void make_available(node_type& node);
+
+    // Called when a pooled_connection is destroyed
+    void on_returned(node_type& node);
+
+    // Removes a node. Its connection must not have outstanding operations.
+    void discard(node_type& node);
+
+    // Returns an idle connection that should be closed or checked, if any, marking it as pending
+    node_type* find_maintenance_candidate(std::chrono::steady_clock::time_point now);
+
+    bool should_reap(const node_type& node, std::chrono::steady_clock::time_point now) const noexcept
+    {
+        return nodes_.size() > params_.min_size() && now - node.last_used >= params_.idle_timeout();
+    }
+
+    bool should_ping(const node_type& node, std::chrono::steady_clock::time_point now) const noexcept
+    {
+        return now - node.last_checked >= params_.ping_interval();
+    }
+
+    std::chrono::steady_clock::duration maintenance_interval() const noexcept;
+
+    template <class Handler>
+    void add_waiter(Handler&& handler)
+    {
+        waiters_.emplace_back(std::forward<Handler>(handler));
+    }
+
+    void notify_waiter(error_code ec, node_type* node);
+
+public:
+    /**
+     * \brief Constructor.
+     * \details
+     * No connection is established by the constructor.
+     *
+     * \par Exception safety
+     * Basic guarantee. Throws if memory allocation fails.
+     *
+     * \param ex The executor to be used by the pool and its connections.
+     * \param endpoint The endpoint of the server to connect to.
+     * \param params Configuration parameters.
+     * \param args Extra arguments to be passed to the `Stream` constructor, after the executor.
+     * They're copied into the pool. Use `std::ref` to pass objects by reference.
+     */
+    template <class... StreamArgs>
+    connection_pool(
+        const executor_type& ex,
+        const endpoint_type& endpoint,
+        pool_params params,
+        StreamArgs&&... args
+    )
+        : ex_(ex),
+          endpoint_(endpoint),
+          params_(std::move(params)),
+          hparams_(params_.hparams()),
+          factory_(
+              detail::pool_connection_factory<Stream, typename std::decay<StreamArgs>::type...>{
+                  ex,
+                  params_.buffer_config(),
+                  std::tuple<typename std::decay<StreamArgs>::type...>(std::forward<StreamArgs>(args)...)
+              }
+          ),
+          timer_(ex)
+    {
+    }
+
+#ifndef BOOST_MYSQL_DOXYGEN
+    connection_pool(const connection_pool&) = delete;
+    connection_pool(connection_pool&&) = delete;
+    connection_pool& operator=(const connection_pool&) = delete;
+    connection_pool& operator=(connection_pool&&) = delete;
+#endif
+
+    /// Retrieves the executor associated to this object.
+    executor_type get_executor() const { return ex_; }
+
+    /**
+     * \brief Retrieves the configuration parameters passed on construction.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    const pool_params& params() const noexcept { return params_; }
+
+    /**
+     * \brief Returns the number of connections owned by the pool, including the ones in use.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t size() const noexcept { return nodes_.size(); }
+
+    /**
+     * \brief Returns the number of idle connections that can be handed to users without creating new ones.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t num_idle() const noexcept;
+
+    /**
+     * \brief Retrieves a connection from the pool.
+     * \details
+     * If there is an idle connection, it's reset and checked as required and then returned.
+     * Otherwise, if the pool size is below \ref pool_params::max_size, a new connection is
+     * established. If none of the above is possible, the operation waits until a connection
+     * is returned to the pool.
+     * \n
+     * If establishing a connection fails, the operation completes with the relevant error code.
+     * After \ref cancel has been called, this operation fails with `boost::asio::error::operation_aborted`.
+     *
+     * \par Handler signature
+     * The handler signature for this operation is
+     * `void(boost::mysql::error_code, boost::mysql::pooled_connection<Stream>)`.
+     */
+    template <
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::pooled_connection<Stream>))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, pooled_connection<Stream>))
+    async_get_connection(CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type))
+    {
+        return async_get_connection(shared_diag_, std::forward<CompletionToken>(token));
+    }
+
+    /// \copydoc async_get_connection
+    template <
+        BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::pooled_connection<Stream>))
+            CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, pooled_connection<Stream>))
+    async_get_connection(
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return asio::async_compose<CompletionToken, void(error_code, pooled_connection<Stream>)>(
+            detail::pool_get_connection_op<Stream>(*this, diag),
+            token,
+            ex_
+        );
+    }
+
+    /**
+     * \brief Runs maintenance tasks until \ref cancel is called.
+     * \details
+     * Creates connections until the pool reaches \ref pool_params::min_size, closes connections
+     * that have been idle for longer than \ref pool_params::idle_timeout and pings idle connections
+     * every \ref pool_params::ping_interval, discarding the ones that fail. Errors establishing
+     * connections are not fatal: they're retried in the next maintenance cycle.
+     * \n
+     * The operation completes successfully once \ref cancel is called.
+     *
+     * \par Handler signature
+     * The handler signature for this operation is `void(boost::mysql::error_code)`.
+     */
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_run(CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type))
+    {
+        return asio::async_compose<CompletionToken, void(error_code)>(
+            detail::pool_run_op<Stream>(*this),
+            token,
+            ex_
+        );
+    }
+
+    /**
+     * \brief Stops the pool.
+     * \details
+     * Causes \ref async_run to complete, and any outstanding and future \ref async_get_connection
+     * operations waiting for a connection to fail with `boost::asio::error::operation_aborted`.
+     * Connections currently in use are not affected.
+     *
+     * \par Exception safety
+     * Basic guarantee. Memory allocations may throw.
+     */
+    void cancel();
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#include <boost/mysql/impl/connection_pool.hpp>
+
+#endif
@@ -0,0 +1,73 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_DEADLINE_PARAMS_HPP
+#define BOOST_MYSQL_DEADLINE_PARAMS_HPP
+
+#include <chrono>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief Deadline configuration parameters for a connection.
+ * \details
+ * When a timeout is set, every call to the asynchronous versions of \ref connection::connect,
+ * \ref connection::execute, \ref connection::start_execution and \ref connection::read_some_rows
+ * fails with \ref client_errc::deadline_exceeded if it doesn't complete within the timeout.
+ * Each operation gets its own deadline, computed when it's initiated.
+ * See \ref connection::set_deadlines for more info.
+ */
+class deadline_params
+{
+    std::chrono::steady_clock::duration timeout_{};
+    bool max_execution_time_hint_{false};
+
+public:
+    /**
+     * \brief Initializing constructor.
+     * \param timeout The maximum time each operation may take. Zero means no deadline (the default).
+     * \param max_execution_time_hint Whether to add `MAX_EXECUTION_TIME` hints to `SELECT` queries.
+     */
+    constexpr explicit deadline_params(
+        std::chrono::steady_clock::duration timeout = std::chrono::steady_clock::duration::zero(),
+        bool max_execution_time_hint = false
+    ) noexcept
+        : timeout_(timeout), max_execution_time_hint_(max_execution_time_hint)
+    {
+    }
+
+    /**
+     * \brief Gets the maximum time each operation may take.
+     * \details
+     * A zero or negative value disables deadlines. This is the default.
+     */
+    constexpr std::chrono::steady_clock::duration timeout() const noexcept { return timeout_; }
+
+    /// Sets the maximum time each operation may take.
+    void set_timeout(std::chrono::steady_clock::duration v) noexcept { timeout_ = v; }
+
+    /**
+     * \brief Gets whether to add `MAX_EXECUTION_TIME` optimizer hints to `SELECT` text queries.
+     * \details
+     * If enabled and a timeout is set, text queries starting with `SELECT` are sent with
+     * a `MAX_EXECUTION_TIME` hint equal to the timeout, so that the server stops
+     * them by itself. This applies to both sync and async functions.
+     * Only MySQL supports this hint, so it's not added when connected to MariaDB.
+     * Prepared statements and queries already containing the hint are never modified.
+     * Defaults to `false`.
+     */
+    constexpr bool max_execution_time_hint() const noexcept { return max_execution_time_hint_; }
+
+    /// Sets whether to add `MAX_EXECUTION_TIME` optimizer hints to `SELECT` text queries.
+    void set_max_execution_time_hint(bool v) noexcept { max_execution_time_hint_ = v; }
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
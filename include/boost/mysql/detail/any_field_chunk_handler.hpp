@@ -0,0 +1,44 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_DETAIL_ANY_FIELD_CHUNK_HANDLER_HPP
+#define BOOST_MYSQL_DETAIL_ANY_FIELD_CHUNK_HANDLER_HPP
+
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/field_chunk.hpp>
+
+#include <utility>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Type-erased receiver for the big fields streamed by read_row_streamed.
+// Always invoked synchronously, even from async operations
+class any_field_chunk_handler
+{
+public:
+    virtual ~any_field_chunk_handler() {}
+    virtual void on_chunk(const field_chunk& chunk, error_code& ec) = 0;
+};
+
+template <class Callback>
+class callback_field_chunk_handler final : public any_field_chunk_handler
+{
+    Callback cb_;
+
+public:
+    callback_field_chunk_handler(Callback&& cb) : cb_(std::move(cb)) {}
+
+    void on_chunk(const field_chunk& chunk, error_code& ec) override { cb_(chunk, ec); }
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
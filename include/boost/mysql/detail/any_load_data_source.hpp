@@ -0,0 +1,140 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_DETAIL_ANY_LOAD_DATA_SOURCE_HPP
+#define BOOST_MYSQL_DETAIL_ANY_LOAD_DATA_SOURCE_HPP
+
+#include <boost/mysql/error_code.hpp>
+
+#include <boost/asio/any_completion_handler.hpp>
+#include <boost/asio/buffer.hpp>
+#include <boost/assert.hpp>
+#include <boost/config.hpp>
+#include <boost/system/generic_category.hpp>
+
+#include <cerrno>
+#include <cstddef>
+#include <cstdio>
+#include <string>
+#include <utility>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Type-erased source of data for LOAD DATA LOCAL INFILE. A read returning
+// zero bytes without error (or asio::error::eof) signals the end of the data
+class any_load_data_source
+{
+public:
+    virtual ~any_load_data_source() {}
+
+    // Sources that don't support async reads are always read using read_some
+    virtual bool is_async() const noexcept = 0;
+
+    virtual std::size_t read_some(asio::mutable_buffer buff, error_code& ec) = 0;
+    virtual void async_read_some(
+        asio::mutable_buffer buff,
+        asio::any_completion_handler<void(error_code, std::size_t)> handler
+    ) = 0;
+};
+
+template <class Callback>
+class callback_load_data_source final : public any_load_data_source
+{
+    Callback cb_;
+
+public:
+    callback_load_data_source(Callback&& cb) : cb_(std::move(cb)) {}
+
+    bool is_async() const noexcept override { return false; }
+    std::size_t read_some(asio::mutable_buffer buff, error_code& ec) override { return cb_(buff, ec); }
+    void async_read_some(
+        asio::mutable_buffer,
+        asio::any_completion_handler<void(error_code, std::size_t)>
+    ) override
+    {
+        BOOST_ASSERT(false);
+    }
+};
+
+template <class Stream>
+class stream_load_data_source final : public any_load_data_source
+{
+    Stream& stream_;
+
+public:
+    stream_load_data_source(Stream& stream) noexcept : stream_(stream) {}
+
+    bool is_async() const noexcept override { return true; }
+    std::size_t read_some(asio::mutable_buffer buff, error_code& ec) override
+    {
+        return stream_.read_some(buff, ec);
+    }
+    void async_read_some(
+        asio::mutable_buffer buff,
+        asio::any_completion_handler<void(error_code, std::size_t)> handler
+    ) override
+    {
+        stream_.async_read_some(buff, std::move(handler));
+    }
+};
+
+class file_load_data_source final : public any_load_data_source
+{
+    std::FILE* f_{};
+    error_code open_err_;
+
+public:
+    file_load_data_source(const std::string& path) noexcept
+    {
+#ifdef BOOST_MSVC
+        int res = ::fopen_s(&f_, path.c_str(), "rb");
+        if (res != 0)
+            open_err_ = error_code(res, boost::system::generic_category());
+#else
+        f_ = std::fopen(path.c_str(), "rb");
+        if (!f_)
+            open_err_ = error_code(errno, boost::system::generic_category());
+#endif
+    }
+    file_load_data_source(const file_load_data_source&) = delete;
+    file_load_data_source& operator=(const file_load_data_source&) = delete;
+    ~file_load_data_source()
+    {
+        if (f_)
+            std::fclose(f_);
+    }
+
+    bool is_async() const noexcept override { return false; }
+    std::size_t read_some(asio::mutable_buffer buff, error_code& ec) override
+    {
+        // Errors opening the file are reported here, so they surface as the operation's result
+        if (!f_)
+        {
+            ec = open_err_;
+            return 0;
+        }
+        std::size_t res = std::fread(buff.data(), 1, buff.size(), f_);
+        if (res == 0 && std::ferror(f_))
+            ec = error_code(EIO, boost::system::generic_category());
+        return res;
+    }
+    void async_read_some(
+        asio::mutable_buffer,
+        asio::any_completion_handler<void(error_code, std::size_t)>
+    ) override
+    {
+        BOOST_ASSERT(false);
+    }
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
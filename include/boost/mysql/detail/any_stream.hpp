@@ -20,6 +20,8 @@ namespace boost {
 namespace mysql {
 namespace detail {
 
+class ssl_session_cache_impl;
+
 class any_stream
 {
 public:
@@ -46,9 +48,10 @@ public:
 
     virtual executor_type get_executor() = 0;
 
-    // SSL
-    virtual void handshake(error_code& ec) = 0;
-    virtual void async_handshake(asio::any_completion_handler<void(error_code)>) = 0;
+    // SSL. If sessions is not null, a session previously negotiated with the same server is offered
+    virtual void handshake(ssl_session_cache_impl* sessions, error_code& ec) = 0;
+    virtual void async_handshake(ssl_session_cache_impl* sessions, asio::any_completion_handler<void(error_code)>) = 0;
+    virtual void store_ssl_session(ssl_session_cache_impl& sessions) = 0;
     virtual void shutdown(error_code& ec) = 0;
     virtual void async_shutdown(asio::any_completion_handler<void(error_code)>) = 0;
 
@@ -60,6 +63,9 @@ public:
     virtual std::size_t write_some(asio::const_buffer, error_code& ec) = 0;
     virtual void async_write_some(asio::const_buffer, asio::any_completion_handler<void(error_code, std::size_t)>) = 0;
 
+    // Notifies that the next write starts a new request. Only relevant for compression
+    virtual void start_request() noexcept {}
+
     // Connect and close - these apply only to SocketStream's
     virtual void connect(const void* endpoint, error_code& ec) = 0;
     virtual void async_connect(const void* endpoint, asio::any_completion_handler<void(error_code)>) = 0;
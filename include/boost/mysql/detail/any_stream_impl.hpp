@@ -9,6 +9,7 @@
 #define BOOST_MYSQL_DETAIL_ANY_STREAM_IMPL_HPP
 
 #include <boost/mysql/error_code.hpp>
+#include <boost/mysql/ssl_session_cache.hpp>
 
 #include <boost/mysql/detail/any_stream.hpp>
 #include <boost/mysql/detail/config.hpp>
@@ -18,6 +19,8 @@
 #include <boost/asio/ssl/stream.hpp>
 #include <boost/config.hpp>
 
+#include <sstream>
+#include <string>
 #include <type_traits>
 
 namespace boost {
@@ -118,6 +121,42 @@ bool do_is_open(const Stream& stream) noexcept
     return do_is_open_impl(stream, is_socket_stream<Stream>{});
 }
 
+// TLS session resumption helpers
+template <class Stream>
+void append_remote_endpoint(const Stream&, std::string&, std::false_type)
+{
+}
+
+template <class Stream>
+void append_remote_endpoint(const Stream& stream, std::string& output, std::true_type)
+{
+    error_code ec;
+    auto ep = stream.lowest_layer().remote_endpoint(ec);
+    if (!ec)
+    {
+        std::ostringstream oss;
+        oss << ep;
+        output += oss.str();
+    }
+}
+
+// Identifies the server a SSL stream is connected to, for TLS session resumption.
+// Uses the SNI hostname, if any, and the remote endpoint, if Stream is a socket.
+// Returns an empty string if the server can't be identified
+template <class Stream>
+std::string ssl_server_id(asio::ssl::stream<Stream>& stream)
+{
+    std::string res;
+    const char* sni = SSL_get_servername(stream.native_handle(), TLSEXT_NAMETYPE_host_name);
+    if (sni)
+    {
+        res += sni;
+        res += '/';
+    }
+    append_remote_endpoint(stream.next_layer(), res, is_socket_stream<Stream>{});
+    return res;
+}
+
 template <class Stream>
 class any_stream_impl final : public any_stream
 {
@@ -135,11 +174,15 @@ public:
     executor_type get_executor() override final { return stream_.get_executor(); }
 
     // SSL
-    void handshake(error_code&) final override { BOOST_ASSERT(false); }
-    void async_handshake(asio::any_completion_handler<void(error_code)>) final override
+    void handshake(ssl_session_cache_impl*, error_code&) final override { BOOST_ASSERT(false); }
+    void async_handshake(
+        ssl_session_cache_impl*,
+        asio::any_completion_handler<void(error_code)>
+    ) final override
     {
         BOOST_ASSERT(false);
     }
+    void store_ssl_session(ssl_session_cache_impl&) final override { BOOST_ASSERT(false); }
     void shutdown(error_code&) final override { BOOST_ASSERT(false); }
     void async_shutdown(asio::any_completion_handler<void(error_code)>) final override
     {
@@ -200,16 +243,27 @@ public:
     executor_type get_executor() override final { return stream_.get_executor(); }
 
     // SSL
-    void handshake(error_code& ec) override final
+    void handshake(ssl_session_cache_impl* sessions, error_code& ec) override final
     {
         set_ssl_active();
+        if (sessions)
+            sessions->offer(stream_.native_handle(), ssl_server_id(stream_));
         stream_.handshake(boost::asio::ssl::stream_base::client, ec);
     }
-    void async_handshake(asio::any_completion_handler<void(error_code)> handler) override final
+    void async_handshake(
+        ssl_session_cache_impl* sessions,
+        asio::any_completion_handler<void(error_code)> handler
+    ) override final
     {
         set_ssl_active();
+        if (sessions)
+            sessions->offer(stream_.native_handle(), ssl_server_id(stream_));
         stream_.async_handshake(boost::asio::ssl::stream_base::client, std::move(handler));
     }
+    void store_ssl_session(ssl_session_cache_impl& sessions) override final
+    {
+        sessions.store(stream_.native_handle(), ssl_server_id(stream_));
+    }
     void shutdown(error_code& ec) override final { stream_.shutdown(ec); }
     void async_shutdown(asio::any_completion_handler<void(error_code)> handler) override final
     {
@@ -8,6 +8,10 @@
 #ifndef BOOST_MYSQL_DETAIL_CHANNEL_PTR_HPP
 #define BOOST_MYSQL_DETAIL_CHANNEL_PTR_HPP
 
+#include <boost/mysql/buffer_params.hpp>
+#include <boost/mysql/buffer_stats.hpp>
+#include <boost/mysql/connection_observer.hpp>
+#include <boost/mysql/deadline_params.hpp>
 #include <boost/mysql/diagnostics.hpp>
 #include <boost/mysql/field_view.hpp>
 #include <boost/mysql/metadata_mode.hpp>
@@ -17,6 +21,8 @@
 
 #include <boost/assert.hpp>
 
+#include <cstddef>
+#include <cstdint>
 #include <memory>
 
 namespace boost {
@@ -32,7 +38,7 @@ class channel_ptr
     BOOST_MYSQL_DECL any_stream& get_stream() const;
 
 public:
-    BOOST_MYSQL_DECL channel_ptr(std::size_t read_buff_size, std::unique_ptr<any_stream>);
+    BOOST_MYSQL_DECL channel_ptr(const buffer_params& buff_params, std::unique_ptr<any_stream>);
     channel_ptr(const channel_ptr&) = delete;
     BOOST_MYSQL_DECL channel_ptr(channel_ptr&&) noexcept;
     channel_ptr& operator=(const channel_ptr&) = delete;
@@ -56,6 +62,17 @@ public:
     BOOST_MYSQL_DECL metadata_mode meta_mode() const noexcept;
     BOOST_MYSQL_DECL void set_meta_mode(metadata_mode v) noexcept;
     BOOST_MYSQL_DECL diagnostics& shared_diag() noexcept;
+    BOOST_MYSQL_DECL bool uses_compression() const noexcept;
+    BOOST_MYSQL_DECL buffer_stats buffer_usage() const noexcept;
+    BOOST_MYSQL_DECL connection_observer* observer() const noexcept;
+    BOOST_MYSQL_DECL void set_observer(connection_observer* v) noexcept;
+    BOOST_MYSQL_DECL std::size_t statement_cache_capacity() const noexcept;
+    BOOST_MYSQL_DECL void set_statement_cache_capacity(std::size_t v) noexcept;
+    BOOST_MYSQL_DECL std::size_t num_cached_statements() const noexcept;
+    BOOST_MYSQL_DECL std::uint32_t connection_id() const noexcept;
+    BOOST_MYSQL_DECL deadline_params deadlines() const noexcept;
+    BOOST_MYSQL_DECL void set_deadlines(const deadline_params& v) noexcept;
+    BOOST_MYSQL_DECL void set_kill_channel(channel_ptr* v) noexcept;
 };
 
 BOOST_MYSQL_DECL std::vector<field_view>& get_shared_fields(channel&) noexcept;
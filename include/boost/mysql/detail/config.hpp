@@ -12,13 +12,16 @@
 
 // clang-format off
 
-// Concepts
+// Concepts and floating point std::from_chars
 #if defined(__has_include)
     #if __has_include(<version>)
         #include <version>
         #if defined(__cpp_concepts) && defined(__cpp_lib_concepts)
             #define BOOST_MYSQL_HAS_CONCEPTS
         #endif
+        #if defined(__cpp_lib_to_chars) && __cpp_lib_to_chars >= 201611L
+            #define BOOST_MYSQL_HAS_FROM_CHARS_FLOAT
+        #endif
     #endif
 #endif
 
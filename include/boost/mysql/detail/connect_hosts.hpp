@@ -0,0 +1,452 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_DETAIL_CONNECT_HOSTS_HPP
+#define BOOST_MYSQL_DETAIL_CONNECT_HOSTS_HPP
+
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/handshake_params.hpp>
+#include <boost/mysql/host_list.hpp>
+#include <boost/mysql/resolver_cache.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/network_algorithms.hpp>
+
+#include <boost/asio/basic_stream_socket.hpp>
+#include <boost/asio/basic_waitable_timer.hpp>
+#include <boost/asio/compose.hpp>
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/error.hpp>
+#include <boost/asio/ip/basic_resolver.hpp>
+#include <boost/asio/ip/tcp.hpp>
+#include <boost/asio/post.hpp>
+
+#include <algorithm>
+#include <chrono>
+#include <cstddef>
+#include <memory>
+#include <random>
+#include <string>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Sorts hosts by priority. Hosts with the same priority are shuffled
+// using their weights, like DNS SRV records (RFC 2782). Zero-weight hosts go last
+template <class Rng>
+std::vector<server_host> order_hosts(std::vector<server_host> hosts, Rng& rng)
+{
+    std::stable_sort(hosts.begin(), hosts.end(), [](const server_host& lhs, const server_host& rhs) {
+        return lhs.priority < rhs.priority;
+    });
+
+    auto group_first = hosts.begin();
+    while (group_first != hosts.end())
+    {
+        auto group_last = std::find_if(group_first, hosts.end(), [group_first](const server_host& h) {
+            return h.priority != group_first->priority;
+        });
+
+        // Weighted random selection without replacement
+        for (auto it = group_first; it != group_last; ++it)
+        {
+            unsigned long long total = 0;
+            for (auto it2 = it; it2 != group_last; ++it2)
+                total += it2->weight;
+            if (total == 0u)
+                break;  // only zero-weight hosts remain, keep them as they are
+
+            auto r = std::uniform_int_distribution<unsigned long long>(1u, total)(rng);
+            unsigned long long running_sum = 0;
+            auto selected = it;
+            for (; selected != group_last; ++selected)
+            {
+                running_sum += selected->weight;
+                if (running_sum >= r)
+                    break;
+            }
+            std::iter_swap(it, selected);
+        }
+
+        group_first = group_last;
+    }
+
+    return hosts;
+}
+
+inline std::vector<server_host> order_hosts(const std::vector<server_host>& hosts)
+{
+    std::minstd_rand rng(static_cast<std::minstd_rand::result_type>(
+        std::chrono::steady_clock::now().time_since_epoch().count()
+    ));
+    return order_hosts(hosts, rng);
+}
+
+// Appends the addresses of a host to output, alternating IPv6 and IPv4 addresses,
+// starting with the family of the first address (RFC 8305)
+template <class EndpointRange>
+void append_endpoints(const EndpointRange& input, std::vector<asio::ip::tcp::endpoint>& output)
+{
+    std::vector<asio::ip::tcp::endpoint> first_family, other_family;
+    for (const auto& entry : input)
+    {
+        asio::ip::tcp::endpoint ep = entry;
+        if (first_family.empty() || ep.protocol() == first_family.front().protocol())
+            first_family.push_back(ep);
+        else
+            other_family.push_back(ep);
+    }
+
+    for (std::size_t i = 0; i < first_family.size() || i < other_family.size(); ++i)
+    {
+        if (i < first_family.size())
+            output.push_back(first_family[i]);
+        if (i < other_family.size())
+            output.push_back(other_family[i]);
+    }
+}
+
+// Adds the results of resolving host to output, storing them in the cache, if any
+template <class ResolverResults>
+void on_host_resolved(
+    const server_host& host,
+    const ResolverResults& results,
+    resolver_cache* cache,
+    std::vector<asio::ip::tcp::endpoint>& output
+)
+{
+    std::vector<asio::ip::tcp::endpoint> endpoints;
+    append_endpoints(results, endpoints);
+    output.insert(output.end(), endpoints.begin(), endpoints.end());
+    if (cache)
+    {
+        access::get_impl(*cache).insert(
+            host.host,
+            host.port,
+            std::move(endpoints),
+            std::chrono::steady_clock::now()
+        );
+    }
+}
+
+// Adds the cached addresses for host to output, if any. Returns whether the cache had an entry
+inline bool use_cached_endpoints(
+    const server_host& host,
+    resolver_cache* cache,
+    std::vector<asio::ip::tcp::endpoint>& output
+)
+{
+    if (!cache)
+        return false;
+    auto* endpoints = access::get_impl(*cache).find(host.host, host.port, std::chrono::steady_clock::now());
+    if (!endpoints)
+        return false;
+    output.insert(output.end(), endpoints->begin(), endpoints->end());
+    return true;
+}
+
+template <class Stream>
+struct connect_hosts_types
+{
+    static_assert(
+        std::is_same<typename Stream::lowest_layer_type::protocol_type, asio::ip::tcp>::value,
+        "Connecting to a host_list requires a TCP-based stream"
+    );
+
+    using executor_type = typename Stream::lowest_layer_type::executor_type;
+    using socket_type = asio::basic_stream_socket<asio::ip::tcp, executor_type>;
+    using resolver_type = asio::ip::basic_resolver<asio::ip::tcp, executor_type>;
+    using timer_type = asio::basic_waitable_timer<
+        std::chrono::steady_clock,
+        asio::wait_traits<std::chrono::steady_clock>,
+        executor_type>;
+};
+
+// State shared between the connect operation and the connection attempts, which may
+// outlive the operation if they're cancelled
+template <class Stream>
+struct connect_hosts_state : connect_hosts_types<Stream>
+{
+    using types = connect_hosts_types<Stream>;
+    static constexpr std::size_t no_winner = static_cast<std::size_t>(-1);
+
+    std::vector<server_host> hosts;  // in the order they should be tried
+    std::chrono::steady_clock::duration attempt_delay;
+    resolver_cache* cache;
+    typename types::resolver_type resolver;
+    typename types::timer_type wake_timer;  // cancelled when an attempt finishes
+    std::vector<asio::ip::tcp::endpoint> endpoints;
+    std::vector<std::unique_ptr<typename types::socket_type>> sockets;  // one per started attempt
+    std::size_t pending{0};
+    std::size_t winner{no_winner};
+    error_code last_err;
+
+    connect_hosts_state(const host_list& list, typename types::executor_type ex)
+        : hosts(order_hosts(list.hosts())),
+          attempt_delay(list.attempt_delay()),
+          cache(list.cache()),
+          resolver(ex),
+          wake_timer(ex)
+    {
+    }
+
+    bool all_attempts_started() const noexcept { return sockets.size() == endpoints.size(); }
+};
+
+template <class Stream>
+struct connect_attempt_handler
+{
+    std::shared_ptr<connect_hosts_state<Stream>> st;
+    std::size_t index;
+
+    void operator()(error_code ec)
+    {
+        --st->pending;
+        if (ec)
+        {
+            st->last_err = ec;
+        }
+        else if (st->winner == connect_hosts_state<Stream>::no_winner)
+        {
+            st->winner = index;
+        }
+        else
+        {
+            // Another attempt was quicker
+            error_code ignored;
+            st->sockets[index]->close(ignored);
+        }
+        st->wake_timer.cancel();
+    }
+};
+
+template <class Stream>
+struct connect_hosts_op : boost::asio::coroutine
+{
+    using state_type = connect_hosts_state<Stream>;
+
+    channel& chan_;
+    Stream& stream_;
+    handshake_params params_;
+    diagnostics& diag_;
+    std::shared_ptr<state_type> st_;
+    std::size_t host_index_{0};
+
+    connect_hosts_op(
+        channel& chan,
+        Stream& stream,
+        const host_list& hosts,
+        const handshake_params& params,
+        diagnostics& diag
+    )
+        : chan_(chan),
+          stream_(stream),
+          params_(params),
+          diag_(diag),
+          st_(std::make_shared<state_type>(hosts, stream.lowest_layer().get_executor()))
+    {
+    }
+
+    void launch_attempt()
+    {
+        std::size_t index = st_->sockets.size();
+        st_->sockets.emplace_back(
+            new typename state_type::socket_type(stream_.lowest_layer().get_executor())
+        );
+        ++st_->pending;
+        st_->sockets.back()->async_connect(
+            st_->endpoints[index],
+            connect_attempt_handler<Stream>{st_, index}
+        );
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err, typename state_type::resolver_type::results_type results)
+    {
+        if (!err)
+            on_host_resolved(st_->hosts[host_index_], results, st_->cache, st_->endpoints);
+        (*this)(self, err);
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {})
+    {
+        error_code ignored;
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            diag_.clear();
+
+            // Resolve hostnames. Resolution errors cause the host to be skipped
+            for (; host_index_ < st_->hosts.size(); ++host_index_)
+            {
+                if (use_cached_endpoints(st_->hosts[host_index_], st_->cache, st_->endpoints))
+                    continue;
+                BOOST_ASIO_CORO_YIELD st_->resolver.async_resolve(
+                    st_->hosts[host_index_].host,
+                    std::to_string(st_->hosts[host_index_].port),
+                    asio::ip::resolver_base::numeric_service,
+                    std::move(self)
+                );
+                if (err)
+                    st_->last_err = err;
+            }
+
+            if (st_->endpoints.empty())
+            {
+                BOOST_ASIO_CORO_YIELD asio::post(stream_.get_executor(), std::move(self));
+                self.complete(st_->last_err ? st_->last_err : make_error_code(asio::error::host_not_found));
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            // Start staggered connection attempts until one succeeds. We're woken up
+            // when the attempt delay elapses or when an attempt finishes
+            st_->sockets.reserve(st_->endpoints.size());
+            while (st_->winner == state_type::no_winner)
+            {
+                if (!st_->all_attempts_started())
+                {
+                    launch_attempt();
+                }
+                else if (st_->pending == 0u)
+                {
+                    self.complete(st_->last_err);
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+
+                if (st_->all_attempts_started())
+                    st_->wake_timer.expires_at(state_type::timer_type::time_point::max());
+                else
+                    st_->wake_timer.expires_after(st_->attempt_delay);
+                BOOST_ASIO_CORO_YIELD st_->wake_timer.async_wait(std::move(self));
+            }
+
+            // Cancel the other attempts and use the winner
+            for (std::size_t i = 0; i < st_->sockets.size(); ++i)
+            {
+                if (i != st_->winner)
+                    st_->sockets[i]->close(ignored);
+            }
+            stream_.lowest_layer() = std::move(*st_->sockets[st_->winner]);
+
+            // Handshake
+            BOOST_ASIO_CORO_YIELD async_handshake_interface(chan_, params_, diag_, std::move(self));
+            if (err)
+                stream_.lowest_layer().close(ignored);
+            self.complete(err);
+        }
+    }
+};
+
+// External interface
+template <class Stream>
+void connect_hosts_interface(
+    channel& chan,
+    Stream& stream,
+    const host_list& hosts,
+    const handshake_params& params,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    using types = connect_hosts_types<Stream>;
+
+    err.clear();
+    diag.clear();
+
+    // Resolve hostnames. Resolution errors cause the host to be skipped
+    error_code last_err;
+    std::vector<asio::ip::tcp::endpoint> endpoints;
+    typename types::resolver_type resolver(stream.lowest_layer().get_executor());
+    for (const auto& host : order_hosts(hosts.hosts()))
+    {
+        if (use_cached_endpoints(host, hosts.cache(), endpoints))
+            continue;
+        auto results = resolver.resolve(
+            host.host,
+            std::to_string(host.port),
+            asio::ip::resolver_base::numeric_service,
+            err
+        );
+        if (err)
+            last_err = err;
+        else
+            on_host_resolved(host, results, hosts.cache(), endpoints);
+    }
+
+    // Sync operations can't run attempts in parallel, so try them one after another
+    error_code ignored;
+    for (const auto& ep : endpoints)
+    {
+        stream.lowest_layer().close(ignored);
+        stream.lowest_layer().connect(ep, err);
+        if (!err)
+        {
+            handshake_interface(chan, params, err, diag);
+            if (err)
+                stream.lowest_layer().close(ignored);
+            return;
+        }
+        last_err = err;
+    }
+
+    stream.lowest_layer().close(ignored);
+    err = last_err ? last_err : make_error_code(asio::error::host_not_found);
+}
+
+template <class Stream>
+struct connect_hosts_initiation
+{
+    template <class Handler>
+    void operator()(
+        Handler&& handler,
+        channel* chan,
+        Stream* stream,
+        const host_list& hosts,
+        handshake_params params,
+        diagnostics* diag
+    )
+    {
+        asio::async_compose<Handler, void(error_code)>(
+            connect_hosts_op<Stream>(*chan, *stream, hosts, params, *diag),
+            handler,
+            *stream
+        );
+    }
+};
+
+template <class Stream, class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_connect_hosts_interface(
+    channel& chan,
+    Stream& stream,
+    const host_list& hosts,
+    const handshake_params& params,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return asio::async_initiate<CompletionToken, void(error_code)>(
+        connect_hosts_initiation<Stream>(),
+        token,
+        &chan,
+        &stream,
+        hosts,
+        params,
+        &diag
+    );
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -29,6 +29,7 @@ class static_results;
 
 class execution_state;
 class results;
+class columnar_results;
 
 namespace detail {
 
@@ -58,7 +59,8 @@ struct is_static_results<static_results<T...>> : std::true_type
 };
 
 template <class T>
-concept results_type = std::is_same_v<T, results> || is_static_results<T>::value;
+concept results_type = std::is_same_v<T, results> || std::is_same_v<T, columnar_results> ||
+                       is_static_results<T>::value;
 
 // Execution request
 template <class T>
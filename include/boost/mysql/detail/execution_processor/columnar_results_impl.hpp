@@ -0,0 +1,191 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_DETAIL_EXECUTION_PROCESSOR_COLUMNAR_RESULTS_IMPL_HPP
+#define BOOST_MYSQL_DETAIL_EXECUTION_PROCESSOR_COLUMNAR_RESULTS_IMPL_HPP
+
+#include <boost/mysql/date.hpp>
+#include <boost/mysql/datetime.hpp>
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/field_kind.hpp>
+#include <boost/mysql/field_view.hpp>
+#include <boost/mysql/metadata.hpp>
+#include <boost/mysql/metadata_collection_view.hpp>
+#include <boost/mysql/string_view.hpp>
+#include <boost/mysql/time.hpp>
+
+#include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/execution_processor/execution_processor.hpp>
+#include <boost/mysql/detail/metadata_vector.hpp>
+#include <boost/mysql/detail/execution_processor/results_impl.hpp>
+
+#include <boost/assert.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Storage for a single column. Values are stored in a contiguous array of the
+// type given by kind. Only the vector matching kind is used. NULL values
+// are represented by a default-constructed value and a bit set in null_bitmap.
+// Strings and blobs are stored one after another in string_data, with
+// string_offsets holding num_rows + 1 entries.
+struct column_data
+{
+    field_kind kind{field_kind::null};     // The kind of non-NULL values. Determined by metadata
+    std::size_t num_rows{};                // Number of values in this column
+    std::size_t num_nulls{};               // Number of NULL values in this column
+    std::vector<std::uint8_t> null_bitmap;  // Bit i set => value i is NULL
+    std::vector<std::int64_t> int64_values;
+    std::vector<std::uint64_t> uint64_values;
+    std::vector<float> float_values;
+    std::vector<double> double_values;
+    std::vector<date> date_values;
+    std::vector<datetime> datetime_values;
+    std::vector<time> time_values;
+    std::vector<unsigned char> string_data;
+    std::vector<std::size_t> string_offsets;
+
+    bool is_null(std::size_t i) const noexcept
+    {
+        BOOST_ASSERT(i < num_rows);
+        return (null_bitmap[i / 8] >> (i % 8)) & 1u;
+    }
+
+    BOOST_MYSQL_DECL
+    error_code append(field_view value);
+
+    BOOST_MYSQL_DECL
+    field_view at(std::size_t i) const noexcept;
+};
+
+// The kind of the values a column with the given metadata will hold, as produced
+// by both the text and the binary protocol deserialization functions
+BOOST_MYSQL_DECL
+field_kind column_kind(const metadata& meta) noexcept;
+
+// Like results_impl, but storing data by columns. Rows are deserialized field by field,
+// and each field is appended to its column's storage. Strings and blobs are copied
+// into the column's storage immediately, so no work is required when a batch finishes.
+// Columns for all resultsets are stored in a single vector, parallel to the metadata vector.
+class columnar_results_impl final : public execution_processor
+{
+public:
+    columnar_results_impl() = default;
+
+    std::size_t num_resultsets() const noexcept { return per_result_.size(); }
+
+    std::size_t get_num_rows(std::size_t index) const noexcept { return get_resultset(index).num_rows; }
+
+    const column_data& get_column(std::size_t resultset_index, std::size_t column_index) const noexcept
+    {
+        const auto& resultset_data = get_resultset(resultset_index);
+        BOOST_ASSERT(column_index < resultset_data.num_columns);
+        return columns_[resultset_data.meta_offset + column_index];
+    }
+
+    metadata_collection_view get_meta(std::size_t index) const noexcept
+    {
+        const auto& resultset_data = get_resultset(index);
+        return metadata_collection_view(
+            meta_.data() + resultset_data.meta_offset,
+            resultset_data.num_columns
+        );
+    }
+
+    std::uint64_t get_affected_rows(std::size_t index) const noexcept
+    {
+        return get_resultset(index).affected_rows;
+    }
+
+    std::uint64_t get_last_insert_id(std::size_t index) const noexcept
+    {
+        return get_resultset(index).last_insert_id;
+    }
+
+    unsigned get_warning_count(std::size_t index) const noexcept { return get_resultset(index).warnings; }
+
+    string_view get_info(std::size_t index) const noexcept
+    {
+        const auto& resultset_data = get_resultset(index);
+        return string_view(info_.data() + resultset_data.info_offset, resultset_data.info_size);
+    }
+
+    bool get_is_out_params(std::size_t index) const noexcept { return get_resultset(index).is_out_params; }
+
+    columnar_results_impl& get_interface() noexcept { return *this; }
+
+private:
+    // Virtual impls
+    BOOST_MYSQL_DECL
+    void reset_impl() noexcept override final;
+
+    BOOST_MYSQL_DECL
+    void on_num_meta_impl(std::size_t num_columns) override final;
+
+    BOOST_MYSQL_DECL
+    error_code on_head_ok_packet_impl(const ok_view& pack, diagnostics&) override final;
+
+    BOOST_MYSQL_DECL
+    error_code on_meta_impl(const coldef_view&, bool, diagnostics&) override final;
+
+    BOOST_MYSQL_DECL
+    error_code on_row_impl(span<const std::uint8_t> msg, const output_ref&, std::vector<field_view>&)
+        override final;
+
+    BOOST_MYSQL_DECL
+    error_code on_row_ok_packet_impl(const ok_view& pack) override final;
+
+    void on_row_batch_start_impl() override final {}
+
+    void on_row_batch_finish_impl() override final {}
+
+    // Data
+    metadata_vector meta_;
+    std::vector<column_data> columns_;
+    resultset_container per_result_;
+    std::vector<char> info_;
+
+    // Auxiliar
+    per_resultset_data& current_resultset() noexcept
+    {
+        BOOST_ASSERT(!per_result_.empty());
+        return per_result_.back();
+    }
+
+    BOOST_MYSQL_DECL
+    per_resultset_data& add_resultset();
+
+    BOOST_MYSQL_DECL
+    void on_ok_packet_impl(const ok_view& pack);
+
+    const per_resultset_data& get_resultset(std::size_t index) const noexcept
+    {
+        BOOST_ASSERT(index < per_result_.size());
+        return per_result_[index];
+    }
+
+    metadata_collection_view current_resultset_meta() const noexcept
+    {
+        return get_meta(per_result_.size() - 1);
+    }
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#ifdef BOOST_MYSQL_HEADER_ONLY
+#include <boost/mysql/impl/columnar_results_impl.ipp>
+#endif
+
+#endif
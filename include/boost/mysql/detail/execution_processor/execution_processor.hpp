@@ -17,6 +17,7 @@
 
 #include <boost/mysql/detail/access.hpp>
 #include <boost/mysql/detail/coldef_view.hpp>
+#include <boost/mysql/detail/metadata_vector.hpp>
 #include <boost/mysql/detail/ok_view.hpp>
 #include <boost/mysql/detail/resultset_encoding.hpp>
 
@@ -81,6 +82,7 @@ public:
         mode_ = mode;
         seqnum_ = 0;
         remaining_meta_ = 0;
+        stmt_ = statement_state{};
         reset_impl();
     }
 
@@ -136,6 +138,46 @@ public:
         return err;
     }
 
+    // Server-side cursors. If fetch size is nonzero, statements are executed opening a read-only cursor,
+    // and rows are retrieved in batches of fetch size rows using COM_STMT_FETCH. Preserved by reset()
+    std::uint32_t cursor_fetch_size() const noexcept { return fetch_size_; }
+    void set_cursor_fetch_size(std::uint32_t v) noexcept { fetch_size_ = v; }
+
+    // Called when the execution request is a prepared statement execution
+    void on_statement_execution(std::uint32_t stmt_id) noexcept
+    {
+        stmt_.is_statement = true;
+        stmt_.id = stmt_id;
+    }
+
+    bool is_statement_execution() const noexcept { return stmt_.is_statement; }
+    std::uint32_t statement_id() const noexcept { return stmt_.id; }
+
+    // Called when the execution request asks the server to open a cursor
+    void on_cursor_requested() noexcept
+    {
+        BOOST_ASSERT(stmt_.is_statement);
+        stmt_.cursor_requested = true;
+    }
+
+    // Called when the server signals that it sent all rows in the current batch
+    // and more rows should be requested using COM_STMT_FETCH
+    void on_cursor_batch_end() noexcept
+    {
+        BOOST_ASSERT(is_reading_rows() && stmt_.cursor_requested);
+        stmt_.should_fetch = true;
+    }
+
+    // Called when COM_STMT_FETCH is sent
+    void on_cursor_fetch() noexcept
+    {
+        BOOST_ASSERT(stmt_.should_fetch);
+        stmt_.should_fetch = false;
+    }
+
+    bool cursor_requested() const noexcept { return stmt_.cursor_requested; }
+    bool should_fetch() const noexcept { return stmt_.should_fetch; }
+
     bool is_reading_first() const noexcept { return state_ == state_t::reading_first; }
     bool is_reading_first_subseq() const noexcept { return state_ == state_t::reading_first_subseq; }
     bool is_reading_head() const noexcept
@@ -164,9 +206,10 @@ protected:
     virtual void on_row_batch_start_impl() = 0;
     virtual void on_row_batch_finish_impl() = 0;
 
-    metadata create_meta(const coldef_view& coldef) const
+    // Adds a column to meta, storing its strings only if required by the metadata mode
+    void add_meta(metadata_vector& meta, const coldef_view& coldef) const
     {
-        return access::construct<metadata>(coldef, mode_ == metadata_mode::full);
+        meta.push_back(coldef, mode_ == metadata_mode::full);
     }
 
 private:
@@ -194,6 +237,16 @@ private:
     std::uint8_t seqnum_{};
     metadata_mode mode_{metadata_mode::minimal};
     std::size_t remaining_meta_{};
+    std::uint32_t fetch_size_{};
+
+    // The prepared statement being executed, if any
+    struct statement_state
+    {
+        bool is_statement{};
+        std::uint32_t id{};
+        bool cursor_requested{};
+        bool should_fetch{};
+    } stmt_;
 
     void set_state(state_t v) noexcept { state_ = v; }
 
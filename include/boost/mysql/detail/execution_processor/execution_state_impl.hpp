@@ -17,6 +17,7 @@
 
 #include <boost/mysql/detail/config.hpp>
 #include <boost/mysql/detail/execution_processor/execution_processor.hpp>
+#include <boost/mysql/detail/metadata_vector.hpp>
 
 #include <boost/assert.hpp>
 
@@ -37,7 +38,7 @@ class execution_state_impl final : public execution_processor
         bool is_out_params{false};       // Does this resultset contain OUT param information?
     };
 
-    std::vector<metadata> meta_;
+    metadata_vector meta_;
     ok_data eof_data_;
     std::vector<char> info_;
 
@@ -18,6 +18,7 @@
 
 #include <boost/mysql/detail/config.hpp>
 #include <boost/mysql/detail/execution_processor/execution_processor.hpp>
+#include <boost/mysql/detail/metadata_vector.hpp>
 #include <boost/mysql/detail/row_impl.hpp>
 
 #include <boost/assert.hpp>
@@ -164,7 +165,7 @@ private:
     void on_row_batch_finish_impl() override final;
 
     // Data
-    std::vector<metadata> meta_;
+    metadata_vector meta_;
     resultset_container per_result_;
     std::vector<char> info_;
     row_impl rows_;
@@ -20,6 +20,8 @@
 #include <boost/mysql/string_view.hpp>
 
 #include <boost/mysql/detail/execution_processor/execution_processor.hpp>
+#include <boost/mysql/detail/metadata_vector.hpp>
+#include <boost/mysql/detail/row_field_reader.hpp>
 #include <boost/mysql/detail/typing/get_type_index.hpp>
 #include <boost/mysql/detail/typing/row_traits.hpp>
 
@@ -35,6 +37,7 @@ namespace detail {
 
 using execst_parse_fn_t =
     error_code (*)(span<const std::size_t> pos_map, span<const field_view> from, const output_ref& ref);
+using execst_parse_direct_fn_t = error_code (*)(row_field_reader& reader, const output_ref& ref);
 
 struct execst_resultset_descriptor
 {
@@ -42,6 +45,7 @@ struct execst_resultset_descriptor
     name_table_t name_table;
     meta_check_fn_t meta_check;
     execst_parse_fn_t parse_fn;
+    execst_parse_direct_fn_t parse_direct_fn;
     std::size_t type_index;
 };
 
@@ -79,6 +83,11 @@ public:
         BOOST_ASSERT(idx < num_resultsets());
         return desc_[idx].parse_fn;
     }
+    execst_parse_direct_fn_t parse_direct_fn(std::size_t idx) const noexcept
+    {
+        BOOST_ASSERT(idx < num_resultsets());
+        return desc_[idx].parse_direct_fn;
+    }
     std::size_t type_index(std::size_t idx) const noexcept
     {
         BOOST_ASSERT(idx < num_resultsets());
@@ -150,7 +159,8 @@ private:
     std::size_t resultset_index_{};
     ok_packet_data ok_data_;
     std::vector<char> info_;
-    std::vector<metadata> meta_;
+    metadata_vector meta_;
+    bool direct_parse_{false};  // Can rows be parsed without the pos_map? Computed once per resultset
 
     // Virtual impls
     BOOST_MYSQL_DECL
@@ -206,6 +216,12 @@ static error_code execst_parse_fn(
     return parse(pos_map, from, ref.span_element<StaticRow>());
 }
 
+template <class StaticRow>
+static error_code execst_parse_direct_fn(row_field_reader& reader, const output_ref& ref)
+{
+    return parse_direct(reader, ref.span_element<StaticRow>());
+}
+
 template <class... StaticRow>
 constexpr std::array<execst_resultset_descriptor, sizeof...(StaticRow)> create_execst_resultset_descriptors()
 {
@@ -214,6 +230,7 @@ constexpr std::array<execst_resultset_descriptor, sizeof...(StaticRow)> create_e
         get_row_name_table<StaticRow>(),
         &meta_check<StaticRow>,
         &execst_parse_fn<StaticRow>,
+        &execst_parse_direct_fn<StaticRow>,
         get_type_index<StaticRow, StaticRow...>(),
     }...}};
 }
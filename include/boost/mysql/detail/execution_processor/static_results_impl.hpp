@@ -19,6 +19,8 @@
 #include <boost/mysql/string_view.hpp>
 
 #include <boost/mysql/detail/execution_processor/execution_processor.hpp>
+#include <boost/mysql/detail/metadata_vector.hpp>
+#include <boost/mysql/detail/row_field_reader.hpp>
 #include <boost/mysql/detail/typing/readable_field_traits.hpp>
 #include <boost/mysql/detail/typing/row_traits.hpp>
 
@@ -36,6 +38,7 @@ namespace detail {
 using results_reset_fn_t = void (*)(void*);
 using results_parse_fn_t =
     error_code (*)(span<const std::size_t> pos_map, span<const field_view> from, void* to);
+using results_parse_direct_fn_t = error_code (*)(row_field_reader& reader, void* to);
 
 struct results_resultset_descriptor
 {
@@ -43,6 +46,7 @@ struct results_resultset_descriptor
     name_table_t name_table;
     meta_check_fn_t meta_check;
     results_parse_fn_t parse_fn;
+    results_parse_direct_fn_t parse_direct_fn;
 };
 
 struct static_per_resultset_data
@@ -100,6 +104,11 @@ public:
         BOOST_ASSERT(idx < num_resultsets());
         return desc_[idx].parse_fn;
     }
+    results_parse_direct_fn_t parse_direct_fn(std::size_t idx) const noexcept
+    {
+        BOOST_ASSERT(idx < num_resultsets());
+        return desc_[idx].parse_direct_fn;
+    }
     results_reset_fn_t reset_fn() const noexcept { return reset_; }
     void* rows() const noexcept { return ptr_.rows; }
     span<std::size_t> pos_map(std::size_t idx) const noexcept
@@ -177,9 +186,10 @@ private:
 
     // Data
     results_external_data ext_;
-    std::vector<metadata> meta_;
+    metadata_vector meta_;
     std::vector<char> info_;
     std::size_t resultset_index_{0};
+    bool direct_parse_{false};  // Can rows be parsed without the pos_map? Computed once per resultset
 
     // Helpers
     span<std::size_t> current_pos_map() noexcept { return ext_.pos_map(resultset_index_ - 1); }
@@ -236,6 +246,14 @@ struct results_fns
         return parse(pos_map, from, v.back());
     }
 
+    template <std::size_t I>
+    static error_code do_parse_direct(row_field_reader& reader, void* to)
+    {
+        auto& v = std::get<I>(*static_cast<rows_t*>(to));
+        v.emplace_back();
+        return parse_direct(reader, v.back());
+    }
+
     template <std::size_t I>
     static constexpr results_resultset_descriptor create_descriptor()
     {
@@ -245,6 +263,7 @@ struct results_fns
             get_row_name_table<T>(),
             &meta_check<T>,
             &do_parse<I>,
+            &do_parse_direct<I>,
         };
     }
 
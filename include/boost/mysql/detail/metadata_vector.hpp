@@ -0,0 +1,97 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_DETAIL_METADATA_VECTOR_HPP
+#define BOOST_MYSQL_DETAIL_METADATA_VECTOR_HPP
+
+#include <boost/mysql/metadata.hpp>
+#include <boost/mysql/metadata_collection_view.hpp>
+
+#include <boost/mysql/detail/coldef_view.hpp>
+#include <boost/mysql/detail/config.hpp>
+
+#include <boost/assert.hpp>
+
+#include <cstddef>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// A metadata vector with strings pointing into a single character buffer.
+// Avoids allocating a string per column when using metadata_mode::full.
+// Used by execution processors and owning resultset types
+class metadata_vector
+{
+public:
+    metadata_vector() = default;
+
+    BOOST_MYSQL_DECL
+    metadata_vector(const metadata_vector&);
+
+    metadata_vector(metadata_vector&&) = default;
+
+    BOOST_MYSQL_DECL
+    metadata_vector& operator=(const metadata_vector&);
+
+    metadata_vector& operator=(metadata_vector&&) = default;
+
+    ~metadata_vector() = default;
+
+    // Copies the given collection into *this, used by resultset in assignment from view
+    BOOST_MYSQL_DECL
+    void assign(metadata_collection_view meta);
+
+    // Makes space for num_columns columns, in total
+    void reserve(std::size_t num_columns) { meta_.reserve(num_columns); }
+
+    // Adds a column. Strings are only stored if copy_strings is true (metadata_mode::full)
+    BOOST_MYSQL_DECL
+    void push_back(const coldef_view& coldef, bool copy_strings);
+
+    void clear() noexcept
+    {
+        meta_.clear();
+        strings_.clear();
+    }
+
+    std::size_t size() const noexcept { return meta_.size(); }
+    bool empty() const noexcept { return meta_.empty(); }
+    const metadata* data() const noexcept { return meta_.data(); }
+    const metadata& operator[](std::size_t i) const noexcept
+    {
+        BOOST_ASSERT(i < meta_.size());
+        return meta_[i];
+    }
+    const metadata& back() const noexcept
+    {
+        BOOST_ASSERT(!meta_.empty());
+        return meta_.back();
+    }
+
+    operator metadata_collection_view() const noexcept { return meta_; }
+
+private:
+    std::vector<metadata> meta_;
+    std::vector<char> strings_;
+
+    // Makes space for size more characters in strings_. If it needs to grow,
+    // the metadata objects are updated to point into the new buffer
+    BOOST_MYSQL_DECL
+    void reserve_strings(std::size_t size);
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#ifdef BOOST_MYSQL_HEADER_ONLY
+#include <boost/mysql/impl/metadata_vector.ipp>
+#endif
+
+#endif
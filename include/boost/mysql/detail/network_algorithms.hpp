@@ -8,27 +8,38 @@
 #ifndef BOOST_MYSQL_DETAIL_NETWORK_ALGORITHMS_HPP
 #define BOOST_MYSQL_DETAIL_NETWORK_ALGORITHMS_HPP
 
+#include <boost/mysql/batch_params.hpp>
+#include <boost/mysql/bulk_execution_result.hpp>
 #include <boost/mysql/diagnostics.hpp>
 #include <boost/mysql/error_code.hpp>
 #include <boost/mysql/execution_state.hpp>
+#include <boost/mysql/field_stream_params.hpp>
 #include <boost/mysql/field_view.hpp>
 #include <boost/mysql/handshake_params.hpp>
+#include <boost/mysql/load_data_source.hpp>
+#include <boost/mysql/row_view.hpp>
 #include <boost/mysql/rows_view.hpp>
 #include <boost/mysql/statement.hpp>
 #include <boost/mysql/string_view.hpp>
 
 #include <boost/mysql/detail/access.hpp>
 #include <boost/mysql/detail/any_execution_request.hpp>
+#include <boost/mysql/detail/any_field_chunk_handler.hpp>
+#include <boost/mysql/detail/any_load_data_source.hpp>
 #include <boost/mysql/detail/channel_ptr.hpp>
 #include <boost/mysql/detail/config.hpp>
 #include <boost/mysql/detail/execution_processor/execution_processor.hpp>
 #include <boost/mysql/detail/typing/get_type_index.hpp>
+#include <boost/mysql/detail/writable_field_traits.hpp>
 
 #include <boost/asio/any_completion_handler.hpp>
+#include <boost/assert.hpp>
 #include <boost/mp11/integer_sequence.hpp>
 
 #include <array>
 #include <cstddef>
+#include <memory>
+#include <vector>
 
 namespace boost {
 namespace mysql {
@@ -39,25 +50,14 @@ class static_execution_state;
 namespace detail {
 
 class channel;
+struct pipeline_request_impl;
+struct pipeline_response_item;
 
 template <class T>
 using any_handler = asio::any_completion_handler<void(error_code, T)>;
 
 using any_void_handler = asio::any_completion_handler<void(error_code)>;
 
-// execution helpers
-template <class... T, std::size_t... I>
-std::array<field_view, sizeof...(T)> tuple_to_array_impl(const std::tuple<T...>& t, mp11::index_sequence<I...>) noexcept
-{
-    return std::array<field_view, sizeof...(T)>{{to_field(std::get<I>(t))...}};
-}
-
-template <class... T>
-std::array<field_view, sizeof...(T)> tuple_to_array(const std::tuple<T...>& t) noexcept
-{
-    return tuple_to_array_impl(t, mp11::make_index_sequence<sizeof...(T)>());
-}
-
 struct query_request_getter
 {
     any_execution_request value;
@@ -294,6 +294,351 @@ async_execute_interface(
     );
 }
 
+//
+// execute_pipeline
+//
+BOOST_MYSQL_DECL
+void execute_pipeline_erased(
+    channel& chan,
+    const pipeline_request_impl& req,
+    std::vector<pipeline_response_item>& res,
+    error_code& err,
+    diagnostics& diag
+);
+
+BOOST_MYSQL_DECL void async_execute_pipeline_erased(
+    channel& chan,
+    const pipeline_request_impl& req,
+    std::vector<pipeline_response_item>& res,
+    diagnostics& diag,
+    any_void_handler handler
+);
+
+struct execute_pipeline_initiation
+{
+    template <class Handler>
+    void operator()(
+        Handler&& handler,
+        channel* chan,
+        const pipeline_request_impl* req,
+        std::vector<pipeline_response_item>* res,
+        diagnostics* diag
+    )
+    {
+        async_execute_pipeline_erased(*chan, *req, *res, *diag, std::forward<Handler>(handler));
+    }
+};
+
+template <class PipelineRequest, class PipelineResponse>
+void execute_pipeline_interface(
+    channel& chan,
+    const PipelineRequest& req,
+    PipelineResponse& res,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    execute_pipeline_erased(chan, access::get_impl(req), access::get_impl(res), err, diag);
+}
+
+template <class PipelineRequest, class PipelineResponse, class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_execute_pipeline_interface(
+    channel& chan,
+    const PipelineRequest& req,
+    PipelineResponse& res,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return asio::async_initiate<CompletionToken, void(error_code)>(
+        execute_pipeline_initiation(),
+        token,
+        &chan,
+        &access::get_impl(req),
+        &access::get_impl(res),
+        &diag
+    );
+}
+
+//
+// execute_bulk
+//
+struct bulk_execution_request
+{
+    statement stmt;
+    span<const field_view> params;  // The parameters for all rows, one row after another
+    std::size_t num_rows;
+};
+
+// Points into channel shared_fields()
+template <class WritableFieldTupleRange>
+bulk_execution_request make_bulk_request(
+    const statement& stmt,
+    const WritableFieldTupleRange& param_rows,
+    channel& chan
+)
+{
+    auto& shared_fields = get_shared_fields(chan);
+    shared_fields.clear();
+    std::size_t num_rows = 0;
+    for (const auto& row : param_rows)
+    {
+        auto row_fields = tuple_to_array(row);
+        shared_fields.insert(shared_fields.end(), row_fields.begin(), row_fields.end());
+        ++num_rows;
+    }
+    return {stmt, shared_fields, num_rows};
+}
+
+BOOST_MYSQL_DECL
+void execute_bulk_erased(
+    channel& chan,
+    const bulk_execution_request& req,
+    bulk_execution_result& result,
+    error_code& err,
+    diagnostics& diag
+);
+
+BOOST_MYSQL_DECL void async_execute_bulk_erased(
+    channel& chan,
+    const bulk_execution_request& req,
+    bulk_execution_result& result,
+    diagnostics& diag,
+    any_void_handler handler
+);
+
+struct execute_bulk_initiation
+{
+    template <class Handler, class WritableFieldTupleRange>
+    void operator()(
+        Handler&& handler,
+        channel* chan,
+        const statement& stmt,
+        const WritableFieldTupleRange* param_rows,
+        bulk_execution_result* result,
+        diagnostics* diag
+    )
+    {
+        async_execute_bulk_erased(
+            *chan,
+            make_bulk_request(stmt, *param_rows, *chan),
+            *result,
+            *diag,
+            std::forward<Handler>(handler)
+        );
+    }
+};
+
+template <class WritableFieldTupleRange>
+void execute_bulk_interface(
+    channel& chan,
+    const statement& stmt,
+    const WritableFieldTupleRange& param_rows,
+    bulk_execution_result& result,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    execute_bulk_erased(chan, make_bulk_request(stmt, param_rows, chan), result, err, diag);
+}
+
+template <class WritableFieldTupleRange, class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_execute_bulk_interface(
+    channel& chan,
+    const statement& stmt,
+    const WritableFieldTupleRange& param_rows,
+    bulk_execution_result& result,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return asio::async_initiate<CompletionToken, void(error_code)>(
+        execute_bulk_initiation(),
+        token,
+        &chan,
+        stmt,
+        &param_rows,
+        &result,
+        &diag
+    );
+}
+
+//
+// load_data_local
+//
+BOOST_MYSQL_DECL
+void load_data_local_erased(
+    channel& chan,
+    string_view query,
+    any_load_data_source& source,
+    execution_processor& proc,
+    error_code& err,
+    diagnostics& diag
+);
+
+BOOST_MYSQL_DECL
+void async_load_data_local_erased(
+    channel& chan,
+    string_view query,
+    std::unique_ptr<any_load_data_source> source,
+    execution_processor& proc,
+    diagnostics& diag,
+    any_void_handler handler
+);
+
+struct load_data_local_initiation
+{
+    template <class Handler>
+    void operator()(
+        Handler&& handler,
+        channel* chan,
+        string_view query,
+        load_data_source source,
+        execution_processor* proc,
+        diagnostics* diag
+    )
+    {
+        async_load_data_local_erased(
+            *chan,
+            query,
+            std::move(access::get_impl(source)),
+            *proc,
+            *diag,
+            std::forward<Handler>(handler)
+        );
+    }
+};
+
+template <class ResultsType>
+void load_data_local_interface(
+    channel& chan,
+    string_view query,
+    load_data_source& source,
+    ResultsType& result,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    BOOST_ASSERT(source.valid());
+    load_data_local_erased(
+        chan,
+        query,
+        *access::get_impl(source),
+        access::get_impl(result).get_interface(),
+        err,
+        diag
+    );
+}
+
+template <class ResultsType, class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_load_data_local_interface(
+    channel& chan,
+    string_view query,
+    load_data_source source,
+    ResultsType& result,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    BOOST_ASSERT(source.valid());
+    return asio::async_initiate<CompletionToken, void(error_code)>(
+        load_data_local_initiation(),
+        token,
+        &chan,
+        query,
+        std::move(source),
+        &access::get_impl(result).get_interface(),
+        &diag
+    );
+}
+
+//
+// send_long_data
+//
+BOOST_MYSQL_DECL
+void send_long_data_erased(
+    channel& chan,
+    const statement& stmt,
+    std::size_t param_index,
+    any_load_data_source& source,
+    error_code& err,
+    diagnostics& diag
+);
+
+BOOST_MYSQL_DECL
+void async_send_long_data_erased(
+    channel& chan,
+    const statement& stmt,
+    std::size_t param_index,
+    std::unique_ptr<any_load_data_source> source,
+    diagnostics& diag,
+    any_void_handler handler
+);
+
+struct send_long_data_initiation
+{
+    template <class Handler>
+    void operator()(
+        Handler&& handler,
+        channel* chan,
+        const statement& stmt,
+        std::size_t param_index,
+        load_data_source source,
+        diagnostics* diag
+    )
+    {
+        async_send_long_data_erased(
+            *chan,
+            stmt,
+            param_index,
+            std::move(access::get_impl(source)),
+            *diag,
+            std::forward<Handler>(handler)
+        );
+    }
+};
+
+inline void send_long_data_interface(
+    channel& chan,
+    const statement& stmt,
+    std::size_t param_index,
+    load_data_source& source,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    BOOST_ASSERT(source.valid());
+    BOOST_ASSERT(param_index < stmt.num_params());
+    send_long_data_erased(chan, stmt, param_index, *access::get_impl(source), err, diag);
+}
+
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_send_long_data_interface(
+    channel& chan,
+    const statement& stmt,
+    std::size_t param_index,
+    load_data_source source,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    BOOST_ASSERT(source.valid());
+    BOOST_ASSERT(param_index < stmt.num_params());
+    return asio::async_initiate<CompletionToken, void(error_code)>(
+        send_long_data_initiation(),
+        token,
+        &chan,
+        stmt,
+        param_index,
+        std::move(source),
+        &diag
+    );
+}
+
 //
 // start_execution
 //
@@ -467,6 +812,7 @@ BOOST_MYSQL_DECL
 rows_view read_some_rows_dynamic_erased(
     channel& chan,
     execution_state_impl& st,
+    const batch_params& params,
     error_code& err,
     diagnostics& diag
 );
@@ -474,6 +820,7 @@ rows_view read_some_rows_dynamic_erased(
 BOOST_MYSQL_DECL void async_read_some_rows_dynamic_erased(
     channel& chan,
     execution_state_impl& st,
+    const batch_params& params,
     diagnostics& diag,
     any_handler<rows_view> handler
 );
@@ -481,20 +828,27 @@ BOOST_MYSQL_DECL void async_read_some_rows_dynamic_erased(
 struct read_some_rows_dynamic_initiation
 {
     template <class Handler>
-    void operator()(Handler&& handler, channel* chan, execution_state_impl* st, diagnostics* diag)
+    void operator()(
+        Handler&& handler,
+        channel* chan,
+        execution_state_impl* st,
+        const batch_params& params,
+        diagnostics* diag
+    )
     {
-        async_read_some_rows_dynamic_erased(*chan, *st, *diag, std::forward<Handler>(handler));
+        async_read_some_rows_dynamic_erased(*chan, *st, params, *diag, std::forward<Handler>(handler));
     }
 };
 
 inline rows_view read_some_rows_dynamic_interface(
     channel& chan,
     execution_state& st,
+    const batch_params& params,
     error_code& err,
     diagnostics& diag
 )
 {
-    return read_some_rows_dynamic_erased(chan, access::get_impl(st), err, diag);
+    return read_some_rows_dynamic_erased(chan, access::get_impl(st), params, err, diag);
 }
 
 template <class CompletionToken>
@@ -502,6 +856,7 @@ BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, rows_view))
 async_read_some_rows_dynamic_interface(
     channel& chan,
     execution_state& st,
+    const batch_params& params,
     diagnostics& diag,
     CompletionToken&& token
 )
@@ -511,6 +866,91 @@ async_read_some_rows_dynamic_interface(
         token,
         &chan,
         &access::get_impl(st).get_interface(),
+        params,
+        &diag
+    );
+}
+
+//
+// read_row_streamed
+//
+BOOST_MYSQL_DECL
+row_view read_row_streamed_erased(
+    channel& chan,
+    execution_state_impl& st,
+    std::size_t min_size,
+    any_field_chunk_handler& handler,
+    error_code& err,
+    diagnostics& diag
+);
+
+BOOST_MYSQL_DECL void async_read_row_streamed_erased(
+    channel& chan,
+    execution_state_impl& st,
+    std::size_t min_size,
+    any_field_chunk_handler& chunk_handler,
+    diagnostics& diag,
+    any_handler<row_view> handler
+);
+
+struct read_row_streamed_initiation
+{
+    template <class Handler>
+    void operator()(
+        Handler&& handler,
+        channel* chan,
+        execution_state_impl* st,
+        std::size_t min_size,
+        any_field_chunk_handler* chunk_handler,
+        diagnostics* diag
+    )
+    {
+        async_read_row_streamed_erased(
+            *chan,
+            *st,
+            min_size,
+            *chunk_handler,
+            *diag,
+            std::forward<Handler>(handler)
+        );
+    }
+};
+
+inline row_view read_row_streamed_interface(
+    channel& chan,
+    execution_state& st,
+    field_stream_params& params,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    return read_row_streamed_erased(
+        chan,
+        access::get_impl(st),
+        params.min_size(),
+        *access::get_impl(params),
+        err,
+        diag
+    );
+}
+
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, row_view))
+async_read_row_streamed_interface(
+    channel& chan,
+    execution_state& st,
+    field_stream_params& params,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return asio::async_initiate<CompletionToken, void(error_code, row_view)>(
+        read_row_streamed_initiation(),
+        token,
+        &chan,
+        &access::get_impl(st).get_interface(),
+        params.min_size(),
+        access::get_impl(params).get(),
         &diag
     );
 }
@@ -523,6 +963,7 @@ std::size_t read_some_rows_static_erased(
     channel& chan,
     execution_processor& proc,
     const output_ref& output,
+    const batch_params& params,
     error_code& err,
     diagnostics& diag
 );
@@ -532,6 +973,7 @@ void async_read_some_rows_erased(
     channel& chan,
     execution_processor& proc,
     const output_ref& output,
+    const batch_params& params,
     diagnostics& diag,
     any_handler<std::size_t> handler
 );
@@ -541,6 +983,7 @@ std::size_t read_some_rows_static_interface(
     channel& chan,
     static_execution_state<RowType...>& st,
     span<SpanRowType> output,
+    const batch_params& params,
     error_code& err,
     diagnostics& diag
 )
@@ -552,6 +995,7 @@ std::size_t read_some_rows_static_interface(
         chan,
         access::get_impl(st).get_interface(),
         output_ref(output, index),
+        params,
         err,
         diag
     );
@@ -565,10 +1009,11 @@ struct read_some_rows_static_initiation
         channel* chan,
         execution_processor* proc,
         const output_ref& output,
+        const batch_params& params,
         diagnostics* diag
     )
     {
-        async_read_some_rows_erased(*chan, *proc, output, *diag, std::forward<Handler>(handler));
+        async_read_some_rows_erased(*chan, *proc, output, params, *diag, std::forward<Handler>(handler));
     }
 };
 
@@ -581,6 +1026,7 @@ async_read_some_rows_static_interface(
     channel& chan,
     static_execution_state<RowType...>& st,
     span<SpanRowType> output,
+    const batch_params& params,
     diagnostics& diag,
     CompletionToken&& token
 )
@@ -594,6 +1040,7 @@ async_read_some_rows_static_interface(
         &chan,
         &access::get_impl(st).get_interface(),
         output_ref(output, index),
+        params,
         &diag
     );
 }
@@ -685,6 +1132,92 @@ async_ping_interface(channel& chan, diagnostics& diag, CompletionToken&& token)
     return asio::async_initiate<CompletionToken, void(error_code)>(ping_initiation(), token, &chan, &diag);
 }
 
+//
+// reset connection
+//
+BOOST_MYSQL_DECL
+void reset_connection_erased(channel& chan, error_code& code, diagnostics& diag);
+
+BOOST_MYSQL_DECL
+void async_reset_connection_erased(channel& chan, diagnostics& diag, any_void_handler handler);
+
+struct reset_connection_initiation
+{
+    template <class Handler>
+    void operator()(Handler&& handler, channel* chan, diagnostics* diag)
+    {
+        async_reset_connection_erased(*chan, *diag, std::forward<Handler>(handler));
+    }
+};
+
+inline void reset_connection_interface(channel& chan, error_code& code, diagnostics& diag)
+{
+    reset_connection_erased(chan, code, diag);
+}
+
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_reset_connection_interface(channel& chan, diagnostics& diag, CompletionToken&& token)
+{
+    return asio::async_initiate<CompletionToken, void(error_code)>(
+        reset_connection_initiation(),
+        token,
+        &chan,
+        &diag
+    );
+}
+
+//
+// change user
+//
+BOOST_MYSQL_DECL
+void change_user_erased(channel& chan, const handshake_params& params, error_code& code, diagnostics& diag);
+
+BOOST_MYSQL_DECL
+void async_change_user_erased(
+    channel& chan,
+    const handshake_params& params,
+    diagnostics& diag,
+    any_void_handler handler
+);
+
+struct change_user_initiation
+{
+    template <class Handler>
+    void operator()(Handler&& handler, channel* chan, handshake_params params, diagnostics* diag)
+    {
+        async_change_user_erased(*chan, params, *diag, std::forward<Handler>(handler));
+    }
+};
+
+inline void change_user_interface(
+    channel& chan,
+    const handshake_params& params,
+    error_code& code,
+    diagnostics& diag
+)
+{
+    change_user_erased(chan, params, code, diag);
+}
+
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_change_user_interface(
+    channel& chan,
+    const handshake_params& params,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return asio::async_initiate<CompletionToken, void(error_code)>(
+        change_user_initiation(),
+        token,
+        &chan,
+        params,
+        &diag
+    );
+}
+
 //
 // close connection
 //
@@ -28,6 +28,8 @@ struct ok_view
 
     bool more_results() const noexcept { return status_flags & status_flags::more_results; }
     bool is_out_params() const noexcept { return status_flags & status_flags::out_params; }
+    bool cursor_exists() const noexcept { return status_flags & status_flags::cursor_exists; }
+    bool last_row_sent() const noexcept { return status_flags & status_flags::last_row_sent; }
 };
 
 }  // namespace detail
@@ -0,0 +1,76 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_DETAIL_ROW_FIELD_READER_HPP
+#define BOOST_MYSQL_DETAIL_ROW_FIELD_READER_HPP
+
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/field_view.hpp>
+#include <boost/mysql/metadata_collection_view.hpp>
+
+#include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/resultset_encoding.hpp>
+
+#include <boost/assert.hpp>
+#include <boost/core/span.hpp>
+
+#include <cstddef>
+#include <cstdint>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Deserializes the fields in a row message one by one, without requiring
+// storage for all of them. Strings in the output fields point into the message.
+// Usage: start(), then read_next() for as many fields as required, then finish(),
+// which validates the remaining fields and checks for extra bytes.
+// Results are equivalent to deserialize_row.
+class row_field_reader
+{
+    resultset_encoding encoding_;
+    const std::uint8_t* first_;
+    const std::uint8_t* last_;
+    metadata_collection_view meta_;
+    const std::uint8_t* null_bitmap_{};
+    std::size_t index_{0};
+
+public:
+    row_field_reader(
+        resultset_encoding encoding,
+        span<const std::uint8_t> message,
+        metadata_collection_view meta
+    ) noexcept
+        : encoding_(encoding), first_(message.data()), last_(message.data() + message.size()), meta_(meta)
+    {
+    }
+
+    // Number of fields that have not been read yet
+    std::size_t remaining() const noexcept { return meta_.size() - index_; }
+
+    // Reads any headers preceeding the actual fields
+    BOOST_MYSQL_DECL
+    error_code start() noexcept;
+
+    // Deserializes the next field. Requires remaining() > 0
+    BOOST_MYSQL_DECL
+    error_code read_next(field_view& output) noexcept;
+
+    // Deserializes (and discards) any remaining fields, and checks for extra bytes
+    BOOST_MYSQL_DECL
+    error_code finish() noexcept;
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#ifdef BOOST_MYSQL_HEADER_ONLY
+#include <boost/mysql/impl/internal/protocol/protocol.ipp>
+#endif
+
+#endif
@@ -30,6 +30,15 @@ inline span<field_view> add_fields(std::vector<field_view>& storage, std::size_t
     return span<field_view>(storage.data() + old_size, num_fields);
 }
 
+// Appends the strings in fields to buffer, replacing them by offsets into it.
+// The previous contents of buffer are preserved
+BOOST_MYSQL_DECL
+void copy_strings_as_offsets(span<field_view> fields, std::vector<unsigned char>& buffer);
+
+// Restores any offsets in fields into string views pointing into buffer_first
+BOOST_MYSQL_DECL
+void offsets_to_string_views(span<field_view> fields, const unsigned char* buffer_first) noexcept;
+
 // A field_view vector with strings pointing into a
 // single character buffer. Used to implement owning row types
 class row_impl
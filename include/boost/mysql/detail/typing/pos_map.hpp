@@ -65,6 +65,18 @@ inline void pos_map_add_field(
     }
 }
 
+// Returns true if every C++ field maps to the DB field in the same position.
+// Extra trailing DB fields are allowed. In this case, rows can be parsed without the pos_map
+inline bool pos_map_is_identity(span<const std::size_t> self) noexcept
+{
+    for (std::size_t i = 0; i < self.size(); ++i)
+    {
+        if (self[i] != i)
+            return false;
+    }
+    return true;
+}
+
 inline field_view map_field_view(
     span<const std::size_t> self,
     std::size_t cpp_index,
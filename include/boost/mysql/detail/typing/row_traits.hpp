@@ -21,6 +21,7 @@
 #include <boost/mysql/string_view.hpp>
 
 #include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/row_field_reader.hpp>
 #include <boost/mysql/detail/typing/meta_check_context.hpp>
 #include <boost/mysql/detail/typing/pos_map.hpp>
 #include <boost/mysql/detail/typing/readable_field_traits.hpp>
@@ -120,6 +121,42 @@ public:
     error_code error() const noexcept { return ec_; }
 };
 
+// Like parse_functor, but deserializes fields from the row message as they are needed,
+// rather than reading them from a field_view array. Requires fields to be in the same order
+// in the C++ type and in the message
+class direct_parse_functor
+{
+    row_field_reader& reader_;
+    error_code deserialize_ec_;
+    error_code parse_ec_;
+
+public:
+    direct_parse_functor(row_field_reader& reader) noexcept : reader_(reader) {}
+
+    template <class ReadableField>
+    void operator()(ReadableField& output)
+    {
+        // If the message is malformed, there is nothing else to do
+        if (deserialize_ec_)
+            return;
+        field_view fv;
+        deserialize_ec_ = reader_.read_next(fv);
+        if (deserialize_ec_)
+            return;
+        auto ec = readable_field_traits<ReadableField>::parse(fv, output);
+        if (!parse_ec_)
+            parse_ec_ = ec;
+    }
+
+    // Deserialization errors take precedence, as they do when deserializing the entire row at once
+    error_code error()
+    {
+        if (!deserialize_ec_)
+            deserialize_ec_ = reader_.finish();
+        return deserialize_ec_ ? deserialize_ec_ : parse_ec_;
+    }
+};
+
 // Base template
 template <class T, bool is_describe_struct = boost::describe::has_describe_members<T>::value>
 class row_traits;
@@ -171,7 +208,8 @@ public:
         return describe_names_storage<DescribeStruct>.span();
     }
 
-    static void parse(parse_functor& parser, DescribeStruct& to)
+    template <class ParseFunctor>
+    static void parse(ParseFunctor& parser, DescribeStruct& to)
     {
         boost::mp11::mp_for_each<members>([&](auto D) { parser(to.*D.pointer); });
     }
@@ -199,7 +237,11 @@ public:
     using types = field_types;
     static constexpr std::size_t size() noexcept { return std::tuple_size<tuple_type>::value; }
     static constexpr name_table_t name_table() noexcept { return name_table_t(); }
-    static void parse(parse_functor& parser, tuple_type& to) { boost::mp11::tuple_for_each(to, parser); }
+    template <class ParseFunctor>
+    static void parse(ParseFunctor& parser, tuple_type& to)
+    {
+        boost::mp11::tuple_for_each(to, parser);
+    }
 };
 
 // We want is_static_row to only inspect the shape of the row (i.e. it's a tuple vs. it's nothing we know),
@@ -253,6 +295,17 @@ error_code parse(span<const std::size_t> pos_map, span<const field_view> from, S
     return ctx.error();
 }
 
+// Parses the fields in a row message directly into the output object. Only valid
+// if the C++ fields are a prefix of the message fields (i.e. the pos_map is an identity)
+template <BOOST_MYSQL_STATIC_ROW StaticRow>
+error_code parse_direct(row_field_reader& reader, StaticRow& to)
+{
+    BOOST_ASSERT(reader.remaining() >= get_row_size<StaticRow>());
+    direct_parse_functor ctx(reader);
+    row_traits<StaticRow>::parse(ctx, to);
+    return ctx.error();
+}
+
 using meta_check_fn_t =
     error_code (*)(span<const std::size_t> field_map, metadata_collection_view meta, diagnostics& diag);
 
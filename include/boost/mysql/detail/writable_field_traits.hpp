@@ -12,6 +12,13 @@
 
 #include <boost/mysql/detail/config.hpp>
 
+#include <boost/mp11/integer_sequence.hpp>
+#include <boost/mp11/function.hpp>
+
+#include <array>
+#include <cstddef>
+#include <iterator>
+#include <tuple>
 #include <type_traits>
 
 namespace boost {
@@ -96,6 +103,19 @@ struct is_field_view_forward_iterator<
 > : std::true_type { };
 // clang-format on
 
+// Converts a tuple of writable fields into an array of field_view's
+template <class... T, std::size_t... I>
+std::array<field_view, sizeof...(T)> tuple_to_array_impl(const std::tuple<T...>& t, mp11::index_sequence<I...>) noexcept
+{
+    return std::array<field_view, sizeof...(T)>{{to_field(std::get<I>(t))...}};
+}
+
+template <class... T>
+std::array<field_view, sizeof...(T)> tuple_to_array(const std::tuple<T...>& t) noexcept
+{
+    return tuple_to_array_impl(t, mp11::make_index_sequence<sizeof...(T)>());
+}
+
 #ifdef BOOST_MYSQL_HAS_CONCEPTS
 
 template <class T>
@@ -139,6 +159,35 @@ concept writable_field_tuple = is_writable_field_tuple<T>::value;
 
 #endif  // BOOST_MYSQL_HAS_CONCEPTS
 
+// A range whose elements are WritableFieldTuple's
+template <class T, class = void>
+struct is_writable_field_tuple_range : std::false_type
+{
+};
+
+template <class T>
+struct is_writable_field_tuple_range<
+    T,
+    mp11::mp_void<
+        decltype(std::begin(std::declval<const T&>())),
+        decltype(std::end(std::declval<const T&>()))>>
+    : is_writable_field_tuple<decltype(*std::begin(std::declval<const T&>()))>
+{
+};
+
+#ifdef BOOST_MYSQL_HAS_CONCEPTS
+
+template <class T>
+concept writable_field_tuple_range = is_writable_field_tuple_range<T>::value;
+
+#define BOOST_MYSQL_WRITABLE_FIELD_TUPLE_RANGE ::boost::mysql::detail::writable_field_tuple_range
+
+#else  // BOOST_MYSQL_HAS_CONCEPTS
+
+#define BOOST_MYSQL_WRITABLE_FIELD_TUPLE_RANGE class
+
+#endif  // BOOST_MYSQL_HAS_CONCEPTS
+
 }  // namespace detail
 }  // namespace mysql
 }  // namespace boost
@@ -130,6 +130,34 @@ public:
      */
     bool complete() const noexcept { return impl_.is_complete(); }
 
+    /**
+     * \brief Returns the maximum number of rows retrieved per request when reading using a cursor.
+     * \details
+     * Zero means that cursors are not used. See \ref set_cursor_fetch_size.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::uint32_t cursor_fetch_size() const noexcept { return impl_.cursor_fetch_size(); }
+
+    /**
+     * \brief Makes subsequent prepared statement executions use a server-side, read-only cursor.
+     * \details
+     * If `v` is not zero, executing a prepared statement with \ref connection::start_execution
+     * and `*this` will ask the server to open a read-only cursor. Rows are then kept by the server
+     * until requested: \ref connection::read_some_rows retrieves them in batches of at most `v` rows,
+     * using the `COM_STMT_FETCH` command. This bounds the amount of data sent ahead by the server
+     * for big resultsets, at the cost of a round-trip per batch.
+     * \n
+     * Text queries and statements that don't generate rows are not affected.
+     * Setting `v` to zero (the default) disables cursors. The value is not modified
+     * by \ref connection::start_execution, and applies to executions started after calling this function.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_cursor_fetch_size(std::uint32_t v) noexcept { impl_.set_cursor_fetch_size(v); }
+
     /**
      * \brief Returns metadata about the columns in the query.
      * \details
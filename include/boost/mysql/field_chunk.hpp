@@ -0,0 +1,48 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_FIELD_CHUNK_HPP
+#define BOOST_MYSQL_FIELD_CHUNK_HPP
+
+#include <boost/core/span.hpp>
+
+#include <cstddef>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief A piece of a field value streamed by \ref connection::read_row_streamed.
+ * \details
+ * Big fields are delivered in one or more chunks, in order, as they are read from the network.
+ *
+ * \par Object lifetimes
+ * `data` points into the connection's internal read buffer, and is only valid
+ * until the callback that received it returns.
+ */
+struct field_chunk
+{
+    /// The position of the field's column in the resultset (zero-based).
+    std::size_t column_index;
+
+    /// The total size of the field value, in bytes.
+    std::size_t field_size;
+
+    /// The position of `data` within the field value.
+    std::size_t offset;
+
+    /// The chunk contents.
+    span<const unsigned char> data;
+
+    /// Returns whether this is the last chunk of the field.
+    bool is_last() const noexcept { return offset + data.size() == field_size; }
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
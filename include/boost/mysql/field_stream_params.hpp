@@ -0,0 +1,92 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_FIELD_STREAM_PARAMS_HPP
+#define BOOST_MYSQL_FIELD_STREAM_PARAMS_HPP
+
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/field_chunk.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/any_field_chunk_handler.hpp>
+
+#include <cstddef>
+#include <memory>
+#include <type_traits>
+#include <utility>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief Configures how \ref connection::read_row_streamed streams big fields.
+ * \details
+ * String and blob fields with at least \ref min_size bytes are not stored in memory.
+ * Their contents are passed to a callback in chunks, as they are read from the network.
+ * \n
+ * This is a move-only type.
+ */
+class field_stream_params
+{
+public:
+    /**
+     * \brief Initializing constructor.
+     * \details
+     * `cb` must be callable with the signature `void(const field_chunk&, error_code&)`.
+     * It's always invoked synchronously, even from async operations. Setting the error code
+     * stops the delivery of chunks: the rest of the row is read and discarded, and the
+     * operation fails with the same code.
+     *
+     * \par Exception safety
+     * Strong guarantee. Memory allocations may throw.
+     */
+    template <class Callback>
+    field_stream_params(std::size_t min_size, Callback&& cb)
+        : min_size_(min_size), impl_(make_handler(std::forward<Callback>(cb)))
+    {
+    }
+
+    /**
+     * \brief The size in bytes from which string and blob fields are streamed.
+     * \details Fields with fewer bytes are stored in the returned row, as usual.
+     */
+    std::size_t min_size() const noexcept { return min_size_; }
+
+    /// Sets the size in bytes from which string and blob fields are streamed.
+    void set_min_size(std::size_t v) noexcept { min_size_ = v; }
+
+private:
+    std::size_t min_size_;
+    std::unique_ptr<detail::any_field_chunk_handler> impl_;
+
+    template <class Callback>
+    static std::unique_ptr<detail::any_field_chunk_handler> make_handler(Callback&& cb)
+    {
+        using cb_type = typename std::decay<Callback>::type;
+        static_assert(
+            std::is_same<
+                decltype(std::declval<cb_type&>()(
+                    std::declval<const field_chunk&>(),
+                    std::declval<error_code&>()
+                )),
+                void>::value,
+            "Callback should be callable with signature void(const field_chunk&, error_code&)"
+        );
+        return std::unique_ptr<detail::any_field_chunk_handler>(
+            new detail::callback_field_chunk_handler<cb_type>(cb_type(std::forward<Callback>(cb)))
+        );
+    }
+
+#ifndef BOOST_MYSQL_DOXYGEN
+    friend struct detail::access;
+#endif
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
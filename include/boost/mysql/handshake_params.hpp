@@ -9,6 +9,7 @@
 #define BOOST_MYSQL_HANDSHAKE_PARAMS_HPP
 
 #include <boost/mysql/buffer_params.hpp>
+#include <boost/mysql/compression_mode.hpp>
 #include <boost/mysql/ssl_mode.hpp>
 #include <boost/mysql/string_view.hpp>
 
@@ -17,6 +18,8 @@
 namespace boost {
 namespace mysql {
 
+class ssl_session_cache;
+
 /**
  * \brief Parameters defining how to perform the handshake with a MySQL server.
  * \par Object lifetimes
@@ -31,6 +34,9 @@ class handshake_params
     std::uint16_t connection_collation_;
     ssl_mode ssl_;
     bool multi_queries_;
+    compression_mode compression_;
+    bool local_infile_;
+    ssl_session_cache* ssl_sessions_{nullptr};
 
 public:
     /// The default collation to use with the connection (`utf8mb4_general_ci` on both MySQL and MariaDB).
@@ -51,6 +57,9 @@ public:
      * the connection's `Stream` does not support SSL.
      * \param multi_queries Whether to enable support for executing semicolon-separated
      * queries using \ref connection::execute and \ref connection::start_execution. Disabled by default.
+     * \param compression The \ref compression_mode to use with this connection. Disabled by default.
+     * \param local_infile Whether to enable support for `LOAD DATA LOCAL INFILE` statements,
+     * using \ref connection::load_data_local. Disabled by default.
      */
     handshake_params(
         string_view username,
@@ -58,14 +67,18 @@ public:
         string_view db = "",
         std::uint16_t connection_col = default_collation,
         ssl_mode mode = ssl_mode::require,
-        bool multi_queries = false
+        bool multi_queries = false,
+        compression_mode compression = compression_mode::disable,
+        bool local_infile = false
     )
         : username_(username),
           password_(password),
           database_(db),
           connection_collation_(connection_col),
           ssl_(mode),
-          multi_queries_(multi_queries)
+          multi_queries_(multi_queries),
+          compression_(compression),
+          local_infile_(local_infile)
     {
     }
 
@@ -152,6 +165,60 @@ public:
      * No-throw guarantee.
      */
     void set_multi_queries(bool v) noexcept { multi_queries_ = v; }
+
+    /**
+     * \brief Retrieves the compression mode.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    compression_mode compression() const noexcept { return compression_; }
+
+    /**
+     * \brief Sets the compression mode.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_compression(compression_mode value) noexcept { compression_ = value; }
+
+    /**
+     * \brief Retrieves whether `LOAD DATA LOCAL INFILE` support is enabled.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool local_infile() const noexcept { return local_infile_; }
+
+    /**
+     * \brief Enables or disables support for `LOAD DATA LOCAL INFILE` statements.
+     * \details
+     * If enabled and the server supports it, the `CLIENT_LOCAL_FILES` capability is negotiated
+     * during the handshake. Such statements must be run using \ref connection::load_data_local.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_local_infile(bool v) noexcept { local_infile_ = v; }
+
+    /**
+     * \brief Retrieves the cache used to resume TLS sessions, or `nullptr` if there is none.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    ssl_session_cache* ssl_sessions() const noexcept { return ssl_sessions_; }
+
+    /**
+     * \brief Sets the cache used to resume TLS sessions.
+     * \details
+     * If not `nullptr` and the connection uses TLS, the handshake offers the session
+     * stored in the cache for the same server, if any, and stores the negotiated session
+     * after authentication succeeds. See \ref ssl_session_cache for more info.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The cache is not owned by this object, and must be kept alive until the handshake completes.
+     */
+    void set_ssl_sessions(ssl_session_cache* v) noexcept { ssl_sessions_ = v; }
 };
 
 }  // namespace mysql
@@ -0,0 +1,141 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_HOST_LIST_HPP
+#define BOOST_MYSQL_HOST_LIST_HPP
+
+#include <boost/mysql/string_view.hpp>
+
+#include <chrono>
+#include <cstdint>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+
+class resolver_cache;
+
+/**
+ * \brief A server that may be used by \ref connection::connect, with its selection criteria.
+ * \details
+ * Hosts are tried by increasing `priority`. Within hosts with the same priority,
+ * the order is random, with hosts with bigger `weight` being more likely to be tried first.
+ * This is the same selection algorithm used by DNS SRV records.
+ */
+struct server_host
+{
+    /// The hostname or IP address of the server.
+    std::string host;
+
+    /// The port where the server is listening. Defaults to 3306.
+    std::uint16_t port{3306};
+
+    /// The priority of this host. Lower values are tried first.
+    unsigned priority{0};
+
+    /// The weight of this host, relative to other hosts with the same priority.
+    unsigned weight{1};
+};
+
+/**
+ * \brief A list of servers to connect to, for \ref connection::connect.
+ * \details
+ * Hostnames are resolved and ordered according to their priority and weight.
+ * The async version of \ref connection::connect starts a TCP connection attempt to the first
+ * address and, if it doesn't complete within \ref attempt_delay, it starts another attempt to
+ * the next address, without cancelling the first one, and so on. The first attempt
+ * that succeeds is used to perform the handshake, and the others are cancelled.
+ * This avoids waiting for a full TCP timeout when a host is unreachable.
+ * \n
+ * Contrary to \ref handshake_params, this object owns copies of the strings passed to it.
+ */
+class host_list
+{
+    std::vector<server_host> hosts_;
+    std::chrono::steady_clock::duration attempt_delay_{std::chrono::milliseconds(250)};
+    resolver_cache* cache_{nullptr};
+
+public:
+    /**
+     * \brief Default constructor.
+     * \details Constructs an empty list.
+     */
+    host_list() = default;
+
+    /**
+     * \brief Constructs a list from a collection of hosts.
+     * \par Exception safety
+     * Strong guarantee. Throws if memory allocation fails.
+     */
+    explicit host_list(std::vector<server_host> hosts) : hosts_(std::move(hosts)) {}
+
+    /**
+     * \brief Adds a host to the list.
+     * \par Exception safety
+     * Strong guarantee. Throws if memory allocation fails.
+     */
+    void add(string_view host, std::uint16_t port = 3306, unsigned priority = 0, unsigned weight = 1)
+    {
+        server_host h;
+        h.host = std::string(host);
+        h.port = port;
+        h.priority = priority;
+        h.weight = weight;
+        hosts_.push_back(std::move(h));
+    }
+
+    /**
+     * \brief Retrieves the hosts in the list.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    const std::vector<server_host>& hosts() const noexcept { return hosts_; }
+
+    /**
+     * \brief Retrieves the time to wait before starting the next connection attempt.
+     * \details
+     * Defaults to 250 milliseconds. A failed attempt starts the next one immediately.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::chrono::steady_clock::duration attempt_delay() const noexcept { return attempt_delay_; }
+
+    /**
+     * \brief Sets the time to wait before starting the next connection attempt.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_attempt_delay(std::chrono::steady_clock::duration v) noexcept { attempt_delay_ = v; }
+
+    /**
+     * \brief Retrieves the cache used to store name resolution results, or `nullptr` if there is none.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    resolver_cache* cache() const noexcept { return cache_; }
+
+    /**
+     * \brief Sets the cache used to store name resolution results.
+     * \details
+     * If `nullptr` (the default), hostnames are resolved every time.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The list doesn't take ownership of the cache, which must be kept alive
+     * while it's used by any operation.
+     */
+    void set_cache(resolver_cache* v) noexcept { cache_ = v; }
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
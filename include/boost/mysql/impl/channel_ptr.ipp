@@ -14,8 +14,11 @@
 
 #include <boost/mysql/impl/internal/channel/channel.hpp>
 
-boost::mysql::detail::channel_ptr::channel_ptr(std::size_t read_buff_size, std::unique_ptr<any_stream> stream)
-    : chan_(new channel(read_buff_size, std::move(stream)))
+boost::mysql::detail::channel_ptr::channel_ptr(
+    const buffer_params& buff_params,
+    std::unique_ptr<any_stream> stream
+)
+    : chan_(new channel(buff_params, std::move(stream)))
 {
 }
 
@@ -46,6 +49,61 @@ boost::mysql::diagnostics& boost::mysql::detail::channel_ptr::shared_diag() noex
     return chan_->shared_diag();
 }
 
+bool boost::mysql::detail::channel_ptr::uses_compression() const noexcept
+{
+    return chan_->compression() != compression_algorithm::none;
+}
+
+boost::mysql::buffer_stats boost::mysql::detail::channel_ptr::buffer_usage() const noexcept
+{
+    return chan_->buffer_usage();
+}
+
+boost::mysql::connection_observer* boost::mysql::detail::channel_ptr::observer() const noexcept
+{
+    return chan_->observer();
+}
+
+void boost::mysql::detail::channel_ptr::set_observer(connection_observer* v) noexcept
+{
+    chan_->set_observer(v);
+}
+
+std::size_t boost::mysql::detail::channel_ptr::statement_cache_capacity() const noexcept
+{
+    return chan_->stmt_cache().capacity();
+}
+
+void boost::mysql::detail::channel_ptr::set_statement_cache_capacity(std::size_t v) noexcept
+{
+    chan_->stmt_cache().set_capacity(v);
+}
+
+std::size_t boost::mysql::detail::channel_ptr::num_cached_statements() const noexcept
+{
+    return chan_->stmt_cache().size();
+}
+
+std::uint32_t boost::mysql::detail::channel_ptr::connection_id() const noexcept
+{
+    return chan_->connection_id();
+}
+
+boost::mysql::deadline_params boost::mysql::detail::channel_ptr::deadlines() const noexcept
+{
+    return chan_->deadlines();
+}
+
+void boost::mysql::detail::channel_ptr::set_deadlines(const deadline_params& v) noexcept
+{
+    chan_->set_deadlines(v);
+}
+
+void boost::mysql::detail::channel_ptr::set_kill_channel(channel_ptr* v) noexcept
+{
+    chan_->set_kill_channel(v ? v->chan_.get() : nullptr);
+}
+
 std::vector<boost::mysql::field_view>& boost::mysql::detail::get_shared_fields(channel& chan) noexcept
 {
     return chan.shared_fields();
@@ -0,0 +1,234 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_COLUMNAR_RESULTS_IMPL_IPP
+#define BOOST_MYSQL_IMPL_COLUMNAR_RESULTS_IMPL_IPP
+
+#pragma once
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/column_type.hpp>
+
+#include <boost/mysql/detail/execution_processor/columnar_results_impl.hpp>
+#include <boost/mysql/detail/row_field_reader.hpp>
+
+#include <boost/mysql/impl/internal/protocol/protocol.hpp>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+inline void append_column_string(column_data& col, const unsigned char* data, std::size_t size)
+{
+    col.string_data.insert(col.string_data.end(), data, data + size);
+    col.string_offsets.push_back(col.string_data.size());
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+boost::mysql::field_kind boost::mysql::detail::column_kind(const metadata& meta) noexcept
+{
+    switch (meta.type())
+    {
+    case column_type::tinyint:
+    case column_type::smallint:
+    case column_type::mediumint:
+    case column_type::int_:
+    case column_type::bigint:
+    case column_type::year: return meta.is_unsigned() ? field_kind::uint64 : field_kind::int64;
+    case column_type::bit: return field_kind::uint64;
+    case column_type::float_: return field_kind::float_;
+    case column_type::double_: return field_kind::double_;
+    case column_type::timestamp:
+    case column_type::datetime: return field_kind::datetime;
+    case column_type::date: return field_kind::date;
+    case column_type::time: return field_kind::time;
+    case column_type::char_:
+    case column_type::varchar:
+    case column_type::text:
+    case column_type::enum_:
+    case column_type::set:
+    case column_type::decimal:
+    case column_type::json: return field_kind::string;
+    case column_type::binary:
+    case column_type::varbinary:
+    case column_type::blob:
+    case column_type::geometry:
+    default: return field_kind::blob;
+    }
+}
+
+boost::mysql::error_code boost::mysql::detail::column_data::append(field_view value)
+{
+    // Non-NULL values should always match the kind predicted by metadata
+    bool is_null_value = value.is_null();
+    if (!is_null_value && value.kind() != kind)
+        return client_errc::protocol_value_error;
+
+    // Update the NULL bitmap
+    if (num_rows % 8 == 0)
+        null_bitmap.push_back(0);
+    if (is_null_value)
+    {
+        null_bitmap.back() |= static_cast<std::uint8_t>(1u << (num_rows % 8));
+        ++num_nulls;
+    }
+
+    // Store the actual value
+    switch (kind)
+    {
+    case field_kind::int64: int64_values.push_back(is_null_value ? 0 : value.get_int64()); break;
+    case field_kind::uint64: uint64_values.push_back(is_null_value ? 0u : value.get_uint64()); break;
+    case field_kind::float_: float_values.push_back(is_null_value ? 0.0f : value.get_float()); break;
+    case field_kind::double_: double_values.push_back(is_null_value ? 0.0 : value.get_double()); break;
+    case field_kind::date: date_values.push_back(is_null_value ? date() : value.get_date()); break;
+    case field_kind::datetime:
+        datetime_values.push_back(is_null_value ? datetime() : value.get_datetime());
+        break;
+    case field_kind::time: time_values.push_back(is_null_value ? time() : value.get_time()); break;
+    case field_kind::string:
+    {
+        auto str = is_null_value ? string_view() : value.get_string();
+        append_column_string(*this, reinterpret_cast<const unsigned char*>(str.data()), str.size());
+        break;
+    }
+    case field_kind::blob:
+    {
+        auto blob = is_null_value ? blob_view() : value.get_blob();
+        append_column_string(*this, blob.data(), blob.size());
+        break;
+    }
+    default: BOOST_ASSERT(false);
+    }
+
+    ++num_rows;
+    return error_code();
+}
+
+boost::mysql::field_view boost::mysql::detail::column_data::at(std::size_t i) const noexcept
+{
+    if (is_null(i))
+        return field_view();
+    switch (kind)
+    {
+    case field_kind::int64: return field_view(int64_values[i]);
+    case field_kind::uint64: return field_view(uint64_values[i]);
+    case field_kind::float_: return field_view(float_values[i]);
+    case field_kind::double_: return field_view(double_values[i]);
+    case field_kind::date: return field_view(date_values[i]);
+    case field_kind::datetime: return field_view(datetime_values[i]);
+    case field_kind::time: return field_view(time_values[i]);
+    case field_kind::string:
+        return field_view(string_view(
+            reinterpret_cast<const char*>(string_data.data()) + string_offsets[i],
+            string_offsets[i + 1] - string_offsets[i]
+        ));
+    case field_kind::blob:
+        return field_view(
+            blob_view(string_data.data() + string_offsets[i], string_offsets[i + 1] - string_offsets[i])
+        );
+    default: BOOST_ASSERT(false); return field_view();
+    }
+}
+
+void boost::mysql::detail::columnar_results_impl::reset_impl() noexcept
+{
+    meta_.clear();
+    columns_.clear();
+    per_result_.clear();
+    info_.clear();
+}
+
+void boost::mysql::detail::columnar_results_impl::on_num_meta_impl(std::size_t num_columns)
+{
+    auto& resultset_data = add_resultset();
+    meta_.reserve(meta_.size() + num_columns);
+    columns_.reserve(columns_.size() + num_columns);
+    resultset_data.num_columns = num_columns;
+}
+
+boost::mysql::error_code boost::mysql::detail::columnar_results_impl::
+    on_head_ok_packet_impl(const ok_view& pack, diagnostics&)
+{
+    add_resultset();
+    on_ok_packet_impl(pack);
+    return error_code();
+}
+
+boost::mysql::error_code boost::mysql::detail::columnar_results_impl::
+    on_meta_impl(const coldef_view& coldef, bool, diagnostics&)
+{
+    add_meta(meta_, coldef);
+    columns_.emplace_back();
+    auto& col = columns_.back();
+    col.kind = column_kind(meta_.back());
+    if (col.kind == field_kind::string || col.kind == field_kind::blob)
+        col.string_offsets.push_back(0);
+    return error_code();
+}
+
+boost::mysql::error_code boost::mysql::detail::columnar_results_impl::
+    on_row_impl(span<const std::uint8_t> msg, const output_ref&, std::vector<field_view>&)
+{
+    auto& resultset_data = current_resultset();
+    column_data* cols = columns_.data() + resultset_data.meta_offset;
+
+    // Deserialize the row field by field, appending each value to its column.
+    // Strings point into msg, and are copied by append
+    row_field_reader reader(encoding(), msg, current_resultset_meta());
+    auto err = reader.start();
+    if (err)
+        return err;
+    for (std::size_t i = 0; i < resultset_data.num_columns; ++i)
+    {
+        field_view value;
+        err = reader.read_next(value);
+        if (err)
+            return err;
+        err = cols[i].append(value);
+        if (err)
+            return err;
+    }
+    err = reader.finish();
+    if (err)
+        return err;
+
+    ++resultset_data.num_rows;
+    return error_code();
+}
+
+boost::mysql::error_code boost::mysql::detail::columnar_results_impl::on_row_ok_packet_impl(
+    const ok_view& pack
+)
+{
+    on_ok_packet_impl(pack);
+    return error_code();
+}
+
+boost::mysql::detail::per_resultset_data& boost::mysql::detail::columnar_results_impl::add_resultset()
+{
+    auto& resultset_data = per_result_.emplace_back();
+    resultset_data.meta_offset = meta_.size();
+    resultset_data.info_offset = info_.size();
+    return resultset_data;
+}
+
+void boost::mysql::detail::columnar_results_impl::on_ok_packet_impl(const ok_view& pack)
+{
+    auto& resultset_data = current_resultset();
+    resultset_data.affected_rows = pack.affected_rows;
+    resultset_data.last_insert_id = pack.last_insert_id;
+    resultset_data.warnings = pack.warnings;
+    resultset_data.info_size = pack.info.size();
+    resultset_data.has_ok_packet_data = true;
+    resultset_data.is_out_params = pack.is_out_params();
+    info_.insert(info_.end(), pack.info.begin(), pack.info.end());
+}
+
+#endif
@@ -0,0 +1,339 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_CONNECTION_POOL_HPP
+#define BOOST_MYSQL_IMPL_CONNECTION_POOL_HPP
+
+#pragma once
+
+#include <boost/mysql/connection_pool.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/network_algorithms.hpp>
+
+#include <boost/asio/compose.hpp>
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/error.hpp>
+#include <boost/asio/post.hpp>
+
+#include <algorithm>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Invokes a waiter's handler through post
+template <class Stream>
+struct pool_wait_completion
+{
+    asio::any_completion_handler<void(error_code, pool_node<Stream>*)> handler;
+    error_code ec;
+    pool_node<Stream>* node;
+
+    void operator()() { std::move(handler)(ec, node); }
+};
+
+template <class Stream>
+struct pool_get_connection_op : boost::asio::coroutine
+{
+    using node_type = pool_node<Stream>;
+
+    connection_pool<Stream>& pool_;
+    diagnostics& diag_;
+    node_type* node_{};
+    bool started_{false};
+    bool resumed_{false};
+
+    pool_get_connection_op(connection_pool<Stream>& pool, diagnostics& diag) noexcept
+        : pool_(pool), diag_(diag)
+    {
+    }
+
+    template <class Self>
+    void complete_error(Self& self, error_code ec)
+    {
+        self.complete(ec, pooled_connection<Stream>());
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {}, node_type* node = nullptr)
+    {
+        // Any invocation other than the initiating one is the result of an async operation
+        resumed_ = started_;
+        started_ = true;
+
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            diag_.clear();
+
+            // Get a node, waiting if none is available
+            while ((node_ = pool_.try_acquire()) == nullptr)
+            {
+                if (pool_.cancelled_)
+                {
+                    BOOST_ASIO_CORO_YIELD boost::asio::post(pool_.get_executor(), std::move(self));
+                    complete_error(self, asio::error::operation_aborted);
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+
+                // A null node means that a connection was discarded, and we may create a new one
+                BOOST_ASIO_CORO_YIELD pool_.add_waiter(std::move(self));
+                if (err)
+                {
+                    complete_error(self, err);
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+                if (node)
+                {
+                    node_ = node;
+                    break;
+                }
+            }
+
+            // Wipe any session state left by the previous user
+            if (node_->connected && node_->needs_reset)
+            {
+                BOOST_ASIO_CORO_YIELD async_reset_connection_interface(
+                    access::get_impl(node_->conn).get(),
+                    node_->diag,
+                    std::move(self)
+                );
+                node_->needs_reset = false;
+                if (err)
+                    node_->connected = false;
+            }
+
+            // Health check
+            if (node_->connected && pool_.should_ping(*node_, std::chrono::steady_clock::now()))
+            {
+                BOOST_ASIO_CORO_YIELD node_->conn.async_ping(node_->diag, std::move(self));
+                if (err)
+                    node_->connected = false;
+                else
+                    node_->last_checked = std::chrono::steady_clock::now();
+            }
+
+            // Establish the connection, if required
+            if (!node_->connected)
+            {
+                if (node_->needs_new_stream)
+                    node_->conn = pool_.factory_();
+                node_->needs_new_stream = true;
+                BOOST_ASIO_CORO_YIELD node_->conn
+                    .async_connect(pool_.endpoint_, pool_.hparams_, diag_, std::move(self));
+                if (err)
+                {
+                    pool_.discard(*node_);
+                    complete_error(self, err);
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+                node_->connected = true;
+                node_->needs_reset = false;
+                node_->last_used = node_->last_checked = std::chrono::steady_clock::now();
+            }
+
+            // If we didn't perform any I/O, post to avoid completing inline
+            if (!resumed_)
+            {
+                BOOST_ASIO_CORO_YIELD boost::asio::post(pool_.get_executor(), std::move(self));
+            }
+
+            // Done
+            node_->state = pool_node_state::in_use;
+            self.complete(error_code(), access::construct<pooled_connection<Stream>>(pool_, *node_));
+        }
+    }
+};
+
+template <class Stream>
+struct pool_run_op : boost::asio::coroutine
+{
+    using node_type = pool_node<Stream>;
+
+    connection_pool<Stream>& pool_;
+    node_type* node_{};
+
+    pool_run_op(connection_pool<Stream>& pool) noexcept : pool_(pool) {}
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {})
+    {
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            while (!pool_.cancelled_)
+            {
+                // Grow the pool until it reaches the minimum size
+                while (!pool_.cancelled_ && pool_.nodes_.size() < pool_.params_.min_size())
+                {
+                    node_ = &pool_.create_node();
+                    node_->needs_new_stream = true;
+                    BOOST_ASIO_CORO_YIELD node_->conn
+                        .async_connect(pool_.endpoint_, pool_.hparams_, node_->diag, std::move(self));
+                    if (err)
+                    {
+                        // Retried in the next cycle
+                        pool_.discard(*node_);
+                        break;
+                    }
+                    node_->connected = true;
+                    node_->last_used = node_->last_checked = std::chrono::steady_clock::now();
+                    pool_.make_available(*node_);
+                }
+
+                // Close expired connections and check idle ones
+                while (!pool_.cancelled_ &&
+                       (node_ = pool_.find_maintenance_candidate(std::chrono::steady_clock::now())) !=
+                           nullptr)
+                {
+                    if (pool_.should_reap(*node_, std::chrono::steady_clock::now()))
+                    {
+                        BOOST_ASIO_CORO_YIELD node_->conn.async_close(node_->diag, std::move(self));
+                        pool_.discard(*node_);
+                    }
+                    else
+                    {
+                        BOOST_ASIO_CORO_YIELD node_->conn.async_ping(node_->diag, std::move(self));
+                        if (err)
+                        {
+                            pool_.discard(*node_);
+                        }
+                        else
+                        {
+                            node_->last_checked = std::chrono::steady_clock::now();
+                            pool_.make_available(*node_);
+                        }
+                    }
+                }
+
+                // Wait until the next cycle. Errors here mean that we've been cancelled
+                if (!pool_.cancelled_)
+                {
+                    pool_.timer_.expires_after(pool_.maintenance_interval());
+                    BOOST_ASIO_CORO_YIELD pool_.timer_.async_wait(std::move(self));
+                }
+            }
+
+            BOOST_ASIO_CORO_YIELD boost::asio::post(pool_.get_executor(), std::move(self));
+            self.complete(error_code());
+        }
+    }
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+template <class Stream>
+typename boost::mysql::connection_pool<Stream>::node_type* boost::mysql::connection_pool<
+    Stream>::try_acquire()
+{
+    if (cancelled_)
+        return nullptr;
+
+    // Reuse an idle connection, if any
+    for (auto& node : nodes_)
+    {
+        if (node.state == detail::pool_node_state::idle)
+        {
+            node.state = detail::pool_node_state::pending;
+            return &node;
+        }
+    }
+
+    // Create a new connection, if we're allowed to
+    if (nodes_.size() < params_.max_size())
+        return &create_node();
+
+    return nullptr;
+}
+
+template <class Stream>
+void boost::mysql::connection_pool<Stream>::make_available(node_type& node)
+{
+    if (!waiters_.empty())
+    {
+        node.state = detail::pool_node_state::pending;
+        notify_waiter(error_code(), &node);
+    }
+    else
+    {
+        node.state = detail::pool_node_state::idle;
+    }
+}
+
+template <class Stream>
+void boost::mysql::connection_pool<Stream>::on_returned(node_type& node)
+{
+    BOOST_ASSERT(node.state == detail::pool_node_state::in_use);
+    node.needs_reset = params_.reset_on_return();
+    node.last_used = node.last_checked = std::chrono::steady_clock::now();
+    make_available(node);
+}
+
+template <class Stream>
+void boost::mysql::connection_pool<Stream>::discard(node_type& node)
+{
+    auto it = std::find_if(nodes_.begin(), nodes_.end(), [&node](const node_type& n) { return &n == &node; });
+    BOOST_ASSERT(it != nodes_.end());
+    nodes_.erase(it);
+
+    // Room has been made for a new connection
+    if (!waiters_.empty())
+        notify_waiter(error_code(), nullptr);
+}
+
+template <class Stream>
+typename boost::mysql::connection_pool<Stream>::node_type* boost::mysql::connection_pool<
+    Stream>::find_maintenance_candidate(std::chrono::steady_clock::time_point now)
+{
+    for (auto& node : nodes_)
+    {
+        if (node.state == detail::pool_node_state::idle && (should_reap(node, now) || should_ping(node, now)))
+        {
+            node.state = detail::pool_node_state::pending;
+            return &node;
+        }
+    }
+    return nullptr;
+}
+
+template <class Stream>
+std::chrono::steady_clock::duration boost::mysql::connection_pool<
+    Stream>::maintenance_interval() const noexcept
+{
+    // Avoid spinning if the user configured zero intervals
+    auto res = (std::min)(params_.idle_timeout(), params_.ping_interval());
+    return (std::max)(res, std::chrono::steady_clock::duration(std::chrono::seconds(1)));
+}
+
+template <class Stream>
+void boost::mysql::connection_pool<Stream>::notify_waiter(error_code ec, node_type* node)
+{
+    BOOST_ASSERT(!waiters_.empty());
+    detail::pool_wait_completion<Stream> completion{std::move(waiters_.front()), ec, node};
+    waiters_.pop_front();
+    asio::post(ex_, std::move(completion));
+}
+
+template <class Stream>
+std::size_t boost::mysql::connection_pool<Stream>::num_idle() const noexcept
+{
+    return static_cast<std::size_t>(std::count_if(nodes_.begin(), nodes_.end(), [](const node_type& n) {
+        return n.state == detail::pool_node_state::idle;
+    }));
+}
+
+template <class Stream>
+void boost::mysql::connection_pool<Stream>::cancel()
+{
+    cancelled_ = true;
+    timer_.cancel();
+    while (!waiters_.empty())
+        notify_waiter(asio::error::operation_aborted, nullptr);
+}
+
+#endif
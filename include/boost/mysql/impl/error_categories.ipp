@@ -57,6 +57,22 @@ const char* error_to_string(client_errc error) noexcept
     case boost::mysql::client_errc::row_type_mismatch:
         return "The StaticRow type passed to read_some_rows does not correspond to the resultset type being "
                "read";
+    case boost::mysql::client_errc::unexpected_local_infile_request:
+        return "The server requested the contents of a file for a LOAD DATA LOCAL INFILE statement, but the "
+               "statement wasn't run using connection::load_data_local";
+    case boost::mysql::client_errc::max_buffer_size_exceeded:
+        return "Reading a message would require growing the read buffer past the maximum size configured "
+               "in buffer_params::max_read_size";
+    case boost::mysql::client_errc::metadata_unavailable:
+        return "The server omitted the metadata of a resultset, and the client doesn't have a copy of it";
+    case boost::mysql::client_errc::pending_long_data:
+        return "Values sent by connection::send_long_data are pending for the statement, which can't be "
+               "executed in a pipeline or with connection::execute_bulk";
+    case boost::mysql::client_errc::deadline_exceeded:
+        return "The operation didn't complete before the deadline configured by connection::set_deadlines";
+    case boost::mysql::client_errc::stale_statement:
+        return "The statement was prepared in a session that has since ended, so it doesn't exist in the "
+               "server anymore";
 
     default: return "<unknown MySQL client error>";
     }
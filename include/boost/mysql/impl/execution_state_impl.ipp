@@ -49,7 +49,7 @@ void boost::mysql::detail::execution_state_impl::on_num_meta_impl(std::size_t nu
 boost::mysql::error_code boost::mysql::detail::execution_state_impl::
     on_meta_impl(const coldef_view& coldef, bool, diagnostics&)
 {
-    meta_.push_back(create_meta(coldef));
+    add_meta(meta_, coldef);
     return error_code();
 }
 
@@ -0,0 +1,77 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_BOUND_PARAM_TYPES_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_BOUND_PARAM_TYPES_HPP
+
+#include <boost/mysql/field_kind.hpp>
+#include <boost/mysql/field_view.hpp>
+
+#include <boost/core/span.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <unordered_map>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// The server remembers the parameter types sent by the last COM_STMT_EXECUTE for each statement,
+// and clients may omit them (new_params_bind_flag = 0) if they don't change. This class tracks
+// the types sent for each statement. The types sent to the server are a function of the
+// parameters' field_kind, so we store these.
+class bound_param_types
+{
+    std::unordered_map<std::uint32_t, std::vector<field_kind>> types_;
+
+    static bool matches(const std::vector<field_kind>& types, span<const field_view> params) noexcept
+    {
+        if (types.size() != params.size())
+            return false;
+        for (std::size_t i = 0; i < params.size(); ++i)
+        {
+            if (types[i] != params[i].kind())
+                return false;
+        }
+        return true;
+    }
+
+public:
+    // Records the types of params as the ones bound to the statement. Returns true if they
+    // differ from the ones bound previously, and thus should be sent to the server
+    bool update(std::uint32_t stmt_id, span<const field_view> params)
+    {
+        // Statements without parameters don't send types
+        if (params.empty())
+            return true;
+
+        auto& types = types_[stmt_id];
+        if (matches(types, params))
+            return false;
+        types.resize(params.size());
+        for (std::size_t i = 0; i < params.size(); ++i)
+            types[i] = params[i].kind();
+        return true;
+    }
+
+    // The types bound to the statement are unknown (e.g. the statement was closed
+    // or the execution failed), so they must be sent in the next execution
+    void erase(std::uint32_t stmt_id) { types_.erase(stmt_id); }
+
+    // The types for all statements are unknown
+    void clear() noexcept { types_.clear(); }
+
+    std::size_t size() const noexcept { return types_.size(); }
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -8,17 +8,30 @@
 #ifndef BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_CHANNEL_HPP
 #define BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_CHANNEL_HPP
 
+#include <boost/mysql/buffer_params.hpp>
+#include <boost/mysql/buffer_stats.hpp>
+#include <boost/mysql/connection_observer.hpp>
+#include <boost/mysql/deadline_params.hpp>
 #include <boost/mysql/diagnostics.hpp>
 #include <boost/mysql/error_code.hpp>
 #include <boost/mysql/field_view.hpp>
 #include <boost/mysql/metadata_mode.hpp>
+#include <boost/mysql/statement.hpp>
+#include <boost/mysql/string_view.hpp>
 
+#include <boost/mysql/detail/access.hpp>
 #include <boost/mysql/detail/any_stream.hpp>
 
+#include <boost/mysql/impl/internal/channel/bound_param_types.hpp>
+#include <boost/mysql/impl/internal/channel/compressed_stream.hpp>
+#include <boost/mysql/impl/internal/channel/long_data_params.hpp>
 #include <boost/mysql/impl/internal/channel/message_reader.hpp>
 #include <boost/mysql/impl/internal/channel/message_writer.hpp>
+#include <boost/mysql/impl/internal/channel/statement_cache.hpp>
+#include <boost/mysql/impl/internal/channel/statement_metadata.hpp>
 #include <boost/mysql/impl/internal/channel/write_message.hpp>
 #include <boost/mysql/impl/internal/protocol/capabilities.hpp>
+#include <boost/mysql/impl/internal/protocol/constants.hpp>
 #include <boost/mysql/impl/internal/protocol/db_flavor.hpp>
 
 #include <boost/asio/any_io_executor.hpp>
@@ -26,6 +39,7 @@
 
 #include <cstddef>
 #include <memory>
+#include <string>
 #include <utility>
 #include <vector>
 
@@ -37,18 +51,42 @@ namespace detail {
 class channel
 {
     db_flavor flavor_{db_flavor::mysql};
+    std::uint32_t connection_id_{};
+    std::uint32_t session_id_{};                // incremented when the server discards the session
+    std::string auth_plugin_name_;              // sent by the server in the initial greeting
+    std::vector<std::uint8_t> auth_challenge_;  // idem, required to re-authenticate
     capabilities current_caps_;
+    capabilities mariadb_caps_;  // extended capabilities negotiated with MariaDB servers
     std::uint8_t shared_sequence_number_{};
     diagnostics shared_diag_;  // for async ops
     std::vector<field_view> shared_fields_;
+    std::vector<unsigned char> shared_strings_;  // strings for shared_fields_ spanning several reads
     metadata_mode meta_mode_{metadata_mode::minimal};
+    statement_cache stmt_cache_;
+    bound_param_types param_types_;
+    long_data_params long_data_;
+    statement_metadata stmt_meta_;
+    deadline_params deadlines_;
+    channel* kill_channel_{};
     message_reader reader_;
     message_writer writer_;
     std::unique_ptr<any_stream> stream_;
+    compressed_stream compressed_;
+
+    // The stream where reads and writes happen, with compression applied if required
+    any_stream& io_stream() noexcept
+    {
+        return compressed_.is_active() ? static_cast<any_stream&>(compressed_) : *stream_;
+    }
 
 public:
+    channel(const buffer_params& params, std::unique_ptr<any_stream> stream)
+        : reader_(params), stream_(std::move(stream)), compressed_(*stream_)
+    {
+    }
+
     channel(std::size_t read_buffer_size, std::unique_ptr<any_stream> stream)
-        : reader_(read_buffer_size), stream_(std::move(stream))
+        : channel(buffer_params(read_buffer_size), std::move(stream))
     {
     }
 
@@ -64,30 +102,61 @@ public:
         return reader_.get_next_message(seqnum, err);
     }
 
-    void read_some(error_code& code) { read_some_messages(*stream_, reader_, code); }
+    void read_some(error_code& code) { read_some_messages(io_stream(), reader_, code); }
 
     template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(error_code)) CompletionToken>
     BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
     async_read_some(CompletionToken&& token)
     {
-        return async_read_some_messages(*stream_, reader_, std::forward<CompletionToken>(token));
+        return async_read_some_messages(io_stream(), reader_, std::forward<CompletionToken>(token));
+    }
+
+    // Partial reads, for messages that shouldn't be assembled in memory (e.g. rows with big fields).
+    // See message_reader::read_some_partial
+    void read_some_partial(error_code& code) { reader_.read_some_partial(io_stream(), code); }
+
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(error_code)) CompletionToken>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_read_some_partial(CompletionToken&& token)
+    {
+        return reader_.async_read_some_partial(io_stream(), std::forward<CompletionToken>(token));
     }
 
+    span<const std::uint8_t> partial_read_message() const noexcept { return reader_.partial_message(); }
+    void consume_partial_read_message() noexcept { reader_.consume_partial_message(); }
+
     span<const std::uint8_t> read_one(std::uint8_t& seqnum, error_code& ec)
     {
-        return read_one_message(*stream_, reader_, seqnum, ec);
+        return read_one_message(io_stream(), reader_, seqnum, ec);
     }
 
     template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(error_code, span<const std::uint8_t>)) CompletionToken>
     BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, span<const std::uint8_t>))
     async_read_one(std::uint8_t& seqnum, CompletionToken&& token)
     {
-        return async_read_one_message(*stream_, reader_, seqnum, std::forward<CompletionToken>(token));
+        return async_read_one_message(io_stream(), reader_, seqnum, std::forward<CompletionToken>(token));
     }
 
     // Exposed for the sake of testing
     std::size_t read_buffer_size() const noexcept { return reader_.buffer().size(); }
 
+    // Observer. Notified of reads, writes and buffer operations by the channel,
+    // and of operation start and finish by the network algorithms. May be nullptr
+    connection_observer* observer() const noexcept { return reader_.observer(); }
+    void set_observer(connection_observer* v) noexcept
+    {
+        reader_.set_observer(v);
+        writer_.set_observer(v);
+    }
+
+    // Memory usage counters
+    buffer_stats buffer_usage() const noexcept
+    {
+        buffer_stats res = reader_.stats();
+        res.write_buffer_size = writer_.buffer_size();
+        return res;
+    }
+
     // Writing. serialize() gets all the required data into the write buffers so it can be written
     template <class Serializable>
     void serialize(const Serializable& message, std::uint8_t& sequence_number)
@@ -97,47 +166,172 @@ public:
         message.serialize(buff);
     }
 
+    // Like serialize(), but large fields are not copied into the write buffer. Instead, they are
+    // written in place, so they must be kept alive until the write completes (gather writes).
+    // The compressed stream compresses each write separately, and would copy the fields anyway,
+    // so gather writes are not used with compression
+    template <class Serializable>
+    void serialize_gather(const Serializable& message, std::uint8_t& sequence_number)
+    {
+        std::size_t external_size = message.get_external_size(gather_write_min_size);
+        if (external_size == 0u || compressed_.is_active())
+        {
+            serialize(message, sequence_number);
+            return;
+        }
+        std::size_t size = message.get_size();
+        auto buff = writer_.prepare_gather(size, size - external_size);
+        message.serialize(buff, gather_write_min_size, writer_.external_buffers());
+        writer_.finish_gather(sequence_number);
+    }
+
+    // Sets up requests that have been serialized in advance, including frame headers (e.g. pipelines).
+    // request_offsets contains where each request starts. Requests only need to be written
+    // separately with compression, since each one starts a new sequence of compressed frames
+    void serialize_framed(span<const std::uint8_t> frames, span<const std::size_t> request_offsets)
+    {
+        if (compressed_.is_active())
+            writer_.prepare_framed(frames, request_offsets);
+        else
+            writer_.prepare_framed(frames);
+    }
+
+    // Sets up raw payloads (e.g. LOAD DATA LOCAL INFILE contents). The caller places up to max_size
+    // bytes in the buffer returned by prepare_raw(), then calls serialize_raw() with the actual size
+    span<std::uint8_t> prepare_raw(std::size_t max_size) { return writer_.payload_buffer(max_size); }
+    void serialize_raw(std::size_t size, std::uint8_t& sequence_number)
+    {
+        writer_.prepare_buffer(size, sequence_number);
+    }
+
     // Writes what has been set up by serialize()
-    void write(error_code& code) { write_message(*stream_, writer_, code); }
+    void write(error_code& code) { write_message(io_stream(), writer_, code); }
 
     template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(error_code)) CompletionToken>
     BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
     async_write(CompletionToken&& token)
     {
-        return async_write_message(*stream_, writer_, std::forward<CompletionToken>(token));
+        return async_write_message(io_stream(), writer_, std::forward<CompletionToken>(token));
     }
 
     // Capabilities
     capabilities current_capabilities() const noexcept { return current_caps_; }
     void set_current_capabilities(capabilities value) noexcept { current_caps_ = value; }
+    capabilities mariadb_capabilities() const noexcept { return mariadb_caps_; }
+    void set_mariadb_capabilities(capabilities value) noexcept { mariadb_caps_ = value; }
+
+    // Whether the server may omit the metadata of resultsets. Resultset heads
+    // then contain a flag indicating whether the metadata follows
+    bool has_optional_metadata() const noexcept
+    {
+        return current_caps_.has(CLIENT_OPTIONAL_RESULTSET_METADATA) ||
+               mariadb_caps_.has(MARIADB_CLIENT_CACHE_METADATA);
+    }
 
     // DB flavor
     db_flavor flavor() const noexcept { return flavor_; }
     void set_flavor(db_flavor v) noexcept { flavor_ = v; }
 
+    // The server thread ID of the current session, zero if there is no session
+    std::uint32_t connection_id() const noexcept { return connection_id_; }
+    void set_connection_id(std::uint32_t v) noexcept { connection_id_ = v; }
+
+    // Identifies the current server session state. Statements prepared with a different
+    // session ID have been deallocated by the server
+    std::uint32_t session_id() const noexcept { return session_id_; }
+    bool is_current_session(const statement& stmt) const noexcept
+    {
+        return access::get_impl(stmt).session_id == session_id_;
+    }
+
+    // Called when the server discards the session state (e.g. after a handshake,
+    // COM_RESET_CONNECTION or COM_CHANGE_USER), which deallocates all prepared statements
+    void end_session()
+    {
+        ++session_id_;
+        stmt_cache_.clear();
+        param_types_.clear();
+        long_data_.clear();
+        stmt_meta_.clear();
+    }
+
+    // The authentication data sent by the server in the initial greeting
+    string_view auth_plugin_name() const noexcept { return auth_plugin_name_; }
+    span<const std::uint8_t> auth_challenge() const noexcept { return auth_challenge_; }
+    void set_auth_challenge(string_view plugin_name, span<const std::uint8_t> challenge)
+    {
+        auth_plugin_name_.assign(plugin_name.data(), plugin_name.size());
+        auth_challenge_.assign(challenge.begin(), challenge.end());
+    }
+
     void reset()
     {
         flavor_ = db_flavor::mysql;
+        connection_id_ = 0;
         current_caps_ = capabilities();
-        reset_sequence_number();
+        mariadb_caps_ = capabilities();
+        shared_sequence_number_ = 0;
         stream_->reset_ssl_active();
-        // Metadata mode does not get reset on handshake
+        set_compression(compression_algorithm::none);
+        // Statements belong to the previous session, if any. Cache capacity,
+        // metadata mode and deadlines do not get reset on handshake
+        end_session();
     }
 
     // Internal buffer, diagnostics and sequence_number to help async ops
     diagnostics& shared_diag() noexcept { return shared_diag_; }
     std::uint8_t& shared_sequence_number() noexcept { return shared_sequence_number_; }
-    std::uint8_t& reset_sequence_number() noexcept { return shared_sequence_number_ = 0; }
+    std::uint8_t& reset_sequence_number() noexcept { return reset_sequence_number(shared_sequence_number_); }
+
+    // Resets a sequence number to start a new request. Must be called before serializing
+    // the request, since it marks the next message as the start of a request
+    std::uint8_t& reset_sequence_number(std::uint8_t& seqnum) noexcept
+    {
+        writer_.start_request();
+        return seqnum = 0;
+    }
     std::vector<field_view>& shared_fields() noexcept { return shared_fields_; }
     const std::vector<field_view>& shared_fields() const noexcept { return shared_fields_; }
+    std::vector<unsigned char>& shared_strings() noexcept { return shared_strings_; }
 
     // Metadata mode
     metadata_mode meta_mode() const noexcept { return meta_mode_; }
     void set_meta_mode(metadata_mode v) noexcept { meta_mode_ = v; }
 
+    // Prepared statement cache
+    statement_cache& stmt_cache() noexcept { return stmt_cache_; }
+    const statement_cache& stmt_cache() const noexcept { return stmt_cache_; }
+
+    // Parameter types bound to each statement by the server
+    bound_param_types& param_types() noexcept { return param_types_; }
+    const bound_param_types& param_types() const noexcept { return param_types_; }
+
+    // Parameters with values sent by COM_STMT_SEND_LONG_DATA, for each statement
+    long_data_params& long_data() noexcept { return long_data_; }
+    const long_data_params& long_data() const noexcept { return long_data_; }
+
+    // Column definitions sent by the server for each statement, used when it omits them
+    statement_metadata& stmt_metadata() noexcept { return stmt_meta_; }
+    const statement_metadata& stmt_metadata() const noexcept { return stmt_meta_; }
+
+    // Deadlines. The kill channel is another connection's channel, used to issue
+    // KILL QUERY when a deadline expires. May be nullptr
+    const deadline_params& deadlines() const noexcept { return deadlines_; }
+    void set_deadlines(const deadline_params& v) noexcept { deadlines_ = v; }
+    channel* kill_channel() const noexcept { return kill_channel_; }
+    void set_kill_channel(channel* v) noexcept { kill_channel_ = v; }
+
     // SSL
     bool ssl_active() const noexcept { return stream_->ssl_active(); }
 
+    // Compression. Once enabled, all reads and writes go through the compressed protocol
+    compression_algorithm compression() const noexcept { return compressed_.algorithm(); }
+    void set_compression(compression_algorithm algo)
+    {
+        compressed_.reset(algo);
+        reader_.set_check_seqnums(algo == compression_algorithm::none);
+    }
+
     // Getting the underlying stream
     any_stream& stream() noexcept { return *stream_; }
     const any_stream& stream() const noexcept { return *stream_; }
@@ -0,0 +1,210 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_COMPRESSED_STREAM_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_COMPRESSED_STREAM_HPP
+
+#include <boost/mysql/compression_mode.hpp>
+#include <boost/mysql/error_code.hpp>
+
+#include <boost/mysql/detail/any_stream.hpp>
+#include <boost/mysql/detail/config.hpp>
+
+#include <boost/mysql/impl/internal/protocol/capabilities.hpp>
+
+#include <boost/asio/any_completion_handler.hpp>
+#include <boost/asio/buffer.hpp>
+#include <boost/core/ignore_unused.hpp>
+#include <boost/core/span.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <vector>
+
+#ifdef BOOST_MYSQL_ENABLE_ZSTD
+#include <zstd.h>
+#endif
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+enum class compression_algorithm
+{
+    none,
+    zlib,
+    zstd,
+};
+
+// The zstd compression level we request the server to use
+constexpr std::uint8_t zstd_compression_level = 3;
+
+// Messages smaller than this are sent uncompressed (same value as libmysqlclient)
+constexpr std::size_t min_compress_length = 50;
+
+// Compressed frames have a 3-byte compressed length, a sequence number and a 3-byte uncompressed length
+constexpr std::size_t compressed_header_size = 7;
+
+// The capabilities to request to the server, given the configured mode and what the server supports.
+// Only algorithms the library has been built with are considered. zstd is preferred over zlib.
+inline capabilities compression_capabilities(compression_mode mode, capabilities server_caps) noexcept
+{
+    if (mode == compression_mode::disable)
+        return capabilities();
+#ifdef BOOST_MYSQL_ENABLE_ZSTD
+    if (server_caps.has(CLIENT_ZSTD_COMPRESSION_ALGORITHM))
+        return capabilities(CLIENT_ZSTD_COMPRESSION_ALGORITHM);
+#endif
+#ifdef BOOST_MYSQL_ENABLE_ZLIB
+    if (server_caps.has(CLIENT_COMPRESS))
+        return capabilities(CLIENT_COMPRESS);
+#endif
+    ignore_unused(server_caps);
+    return capabilities();
+}
+
+inline compression_algorithm get_compression_algorithm(capabilities negotiated_caps) noexcept
+{
+    return negotiated_caps.has(CLIENT_ZSTD_COMPRESSION_ALGORITHM) ? compression_algorithm::zstd
+           : negotiated_caps.has(CLIENT_COMPRESS)                 ? compression_algorithm::zlib
+                                                                  : compression_algorithm::none;
+}
+
+// Implements the compressed packet layer. Wraps the stream where the actual I/O happens.
+// Bytes written to this stream are regular frames (as generated by message_writer), which get
+// compressed and sent with compressed frame headers. Bytes read from it are decompressed frames,
+// as expected by message_reader. Only reading and writing are transformed; everything else
+// is forwarded to the wrapped stream.
+class compressed_stream : public any_stream
+{
+public:
+    compressed_stream(any_stream& next) noexcept : any_stream(false), next_(next) {}
+
+    compression_algorithm algorithm() const noexcept { return algo_; }
+    bool is_active() const noexcept { return algo_ != compression_algorithm::none; }
+
+    // Activates the given algorithm (none deactivates compression), discarding any buffered data
+    BOOST_MYSQL_DECL void reset(compression_algorithm algo);
+
+    executor_type get_executor() override final { return next_.get_executor(); }
+
+    // SSL. Compression is applied on top of TLS, so these just forward to the wrapped stream
+    void handshake(ssl_session_cache_impl* sessions, error_code& ec) override final
+    {
+        next_.handshake(sessions, ec);
+    }
+    void async_handshake(
+        ssl_session_cache_impl* sessions,
+        asio::any_completion_handler<void(error_code)> handler
+    ) override final
+    {
+        next_.async_handshake(sessions, std::move(handler));
+    }
+    void store_ssl_session(ssl_session_cache_impl& sessions) override final
+    {
+        next_.store_ssl_session(sessions);
+    }
+    void shutdown(error_code& ec) override final { next_.shutdown(ec); }
+    void async_shutdown(asio::any_completion_handler<void(error_code)> handler) override final
+    {
+        next_.async_shutdown(std::move(handler));
+    }
+
+    // Reading
+    BOOST_MYSQL_DECL std::size_t read_some(asio::mutable_buffer buff, error_code& ec) override final;
+    BOOST_MYSQL_DECL void async_read_some(
+        asio::mutable_buffer buff,
+        asio::any_completion_handler<void(error_code, std::size_t)> handler
+    ) override final;
+
+    // Writing. Each write is compressed as a whole. Writes starting a request begin
+    // a new sequence of compressed frames, and other writes continue the current one
+    void start_request() noexcept override final { starts_request_ = true; }
+    BOOST_MYSQL_DECL std::size_t write_some(asio::const_buffer buff, error_code& ec) override final;
+    BOOST_MYSQL_DECL void async_write_some(
+        asio::const_buffer buff,
+        asio::any_completion_handler<void(error_code, std::size_t)> handler
+    ) override final;
+
+    // Connect and close
+    void connect(const void* endpoint, error_code& ec) override final { next_.connect(endpoint, ec); }
+    void async_connect(
+        const void* endpoint,
+        asio::any_completion_handler<void(error_code)> handler
+    ) override final
+    {
+        next_.async_connect(endpoint, std::move(handler));
+    }
+    void close(error_code& ec) override final { next_.close(ec); }
+    bool is_open() const noexcept override final { return next_.is_open(); }
+
+    // Exposed for the sake of testing
+    std::uint8_t sequence_number() const noexcept { return seqnum_; }
+
+private:
+    struct read_some_op;
+    struct write_some_op;
+
+#ifdef BOOST_MYSQL_ENABLE_ZSTD
+    struct zstd_deleter
+    {
+        void operator()(ZSTD_CCtx* ctx) const noexcept { ZSTD_freeCCtx(ctx); }
+        void operator()(ZSTD_DCtx* ctx) const noexcept { ZSTD_freeDCtx(ctx); }
+    };
+    std::unique_ptr<ZSTD_CCtx, zstd_deleter> zstd_cctx_;
+    std::unique_ptr<ZSTD_DCtx, zstd_deleter> zstd_dctx_;
+#endif
+
+    any_stream& next_;
+    compression_algorithm algo_{compression_algorithm::none};
+    std::uint8_t seqnum_{};
+    bool starts_request_{};
+
+    // Compressed frames read from next_, in the range [in_first_, in_last_)
+    std::vector<std::uint8_t> in_;
+    std::size_t in_first_{};
+    std::size_t in_last_{};
+
+    // Decompressed bytes that didn't fit in the user-supplied buffer, in the range [out_first_, out_last_)
+    std::vector<std::uint8_t> out_;
+    std::size_t out_first_{};
+    std::size_t out_last_{};
+
+    // Compressed frames pending to be written to next_, starting at write_first_
+    std::vector<std::uint8_t> write_buff_;
+    std::size_t write_first_{};
+
+    bool has_pending() const noexcept { return out_first_ != out_last_; }
+    BOOST_MYSQL_DECL std::size_t copy_pending(asio::mutable_buffer buff) noexcept;
+
+    BOOST_MYSQL_DECL bool has_frame() const noexcept;
+    BOOST_MYSQL_DECL asio::mutable_buffer prepare_read();
+    void on_read(std::size_t bytes_read) noexcept { in_last_ += bytes_read; }
+    BOOST_MYSQL_DECL std::size_t process_frame(asio::mutable_buffer buff, error_code& ec);
+
+    BOOST_MYSQL_DECL void compress_message(span<const std::uint8_t> msg);
+    BOOST_MYSQL_DECL std::size_t compress(const std::uint8_t* data, std::size_t size, std::uint8_t* to);
+    BOOST_MYSQL_DECL std::size_t compress_bound(std::size_t size) const noexcept;
+    BOOST_MYSQL_DECL error_code
+    decompress(const std::uint8_t* data, std::size_t size, std::uint8_t* to, std::size_t uncompressed_size);
+    bool write_done() const noexcept { return write_first_ == write_buff_.size(); }
+    asio::const_buffer write_area() const noexcept
+    {
+        return asio::buffer(write_buff_.data() + write_first_, write_buff_.size() - write_first_);
+    }
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#ifdef BOOST_MYSQL_HEADER_ONLY
+#include <boost/mysql/impl/internal/channel/compressed_stream.ipp>
+#endif
+
+#endif
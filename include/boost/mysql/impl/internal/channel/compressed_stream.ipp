@@ -0,0 +1,482 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_COMPRESSED_STREAM_IPP
+#define BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_COMPRESSED_STREAM_IPP
+
+#pragma once
+
+#include <boost/mysql/client_errc.hpp>
+
+#include <boost/mysql/impl/internal/channel/compressed_stream.hpp>
+#include <boost/mysql/impl/internal/protocol/constants.hpp>
+
+#include <boost/asio/compose.hpp>
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/post.hpp>
+#include <boost/assert.hpp>
+#include <boost/endian/conversion.hpp>
+
+#include <algorithm>
+#include <cstring>
+#include <new>
+
+#ifdef BOOST_MYSQL_ENABLE_ZLIB
+#include <zlib.h>
+#endif
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+struct compressed_frame_header
+{
+    std::size_t compressed_size;
+    std::uint8_t seqnum;
+    std::size_t uncompressed_size;  // zero if the payload is not compressed
+};
+
+inline compressed_frame_header deserialize_compressed_frame_header(const std::uint8_t* from) noexcept
+{
+    return {
+        endian::load_little_u24(from),
+        from[3],
+        endian::load_little_u24(from + 4),
+    };
+}
+
+inline void serialize_compressed_frame_header(
+    const compressed_frame_header& header,
+    std::uint8_t* to
+) noexcept
+{
+    BOOST_ASSERT(header.compressed_size <= MAX_PACKET_SIZE);
+    BOOST_ASSERT(header.uncompressed_size <= MAX_PACKET_SIZE);
+    endian::store_little_u24(to, static_cast<std::uint32_t>(header.compressed_size));
+    to[3] = header.seqnum;
+    endian::store_little_u24(to + 4, static_cast<std::uint32_t>(header.uncompressed_size));
+}
+
+// The size of the buffer used to read compressed frames, unless a bigger frame is received
+constexpr std::size_t compressed_read_buffer_size = 16 * 1024;
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+void boost::mysql::detail::compressed_stream::reset(compression_algorithm algo)
+{
+    algo_ = algo;
+    seqnum_ = 0;
+    starts_request_ = false;
+    in_first_ = in_last_ = 0;
+    out_first_ = out_last_ = 0;
+    write_buff_.clear();
+    write_first_ = 0;
+#ifdef BOOST_MYSQL_ENABLE_ZSTD
+    if (algo == compression_algorithm::zstd && !zstd_cctx_)
+    {
+        zstd_cctx_.reset(ZSTD_createCCtx());
+        zstd_dctx_.reset(ZSTD_createDCtx());
+        if (!zstd_cctx_ || !zstd_dctx_)
+            throw std::bad_alloc();
+    }
+#endif
+}
+
+std::size_t boost::mysql::detail::compressed_stream::copy_pending(asio::mutable_buffer buff) noexcept
+{
+    std::size_t size = (std::min)(buff.size(), out_last_ - out_first_);
+    std::memcpy(buff.data(), out_.data() + out_first_, size);
+    out_first_ += size;
+    return size;
+}
+
+bool boost::mysql::detail::compressed_stream::has_frame() const noexcept
+{
+    std::size_t size = in_last_ - in_first_;
+    return size >= compressed_header_size &&
+           size >= compressed_header_size + endian::load_little_u24(in_.data() + in_first_);
+}
+
+boost::asio::mutable_buffer boost::mysql::detail::compressed_stream::prepare_read()
+{
+    // Get the number of bytes required to complete the current frame
+    std::size_t size = in_last_ - in_first_;
+    std::size_t required_size = size < compressed_header_size
+                                    ? compressed_header_size
+                                    : compressed_header_size +
+                                          endian::load_little_u24(in_.data() + in_first_);
+
+    // Move the current frame to the beginning of the buffer, if it doesn't fit
+    if (in_.size() - in_first_ < required_size || in_last_ == in_.size())
+    {
+        if (size)
+            std::memmove(in_.data(), in_.data() + in_first_, size);
+        in_first_ = 0;
+        in_last_ = size;
+    }
+
+    // Grow the buffer, if required
+    if (in_.size() < required_size)
+        in_.resize((std::max)(required_size, compressed_read_buffer_size));
+
+    BOOST_ASSERT(in_last_ < in_.size());
+    return asio::buffer(in_.data() + in_last_, in_.size() - in_last_);
+}
+
+std::size_t boost::mysql::detail::compressed_stream::process_frame(asio::mutable_buffer buff, error_code& ec)
+{
+    BOOST_ASSERT(has_frame());
+    BOOST_ASSERT(!has_pending());
+
+    // Parse the header. Sequence numbers are not validated, since a single
+    // write may contain several pipelined requests, each one starting a new sequence
+    auto header = deserialize_compressed_frame_header(in_.data() + in_first_);
+    const std::uint8_t* payload = in_.data() + in_first_ + compressed_header_size;
+    in_first_ += compressed_header_size + header.compressed_size;
+    seqnum_ = static_cast<std::uint8_t>(header.seqnum + 1);
+    ec = error_code();
+
+    // An uncompressed size of zero means that the payload was sent uncompressed
+    bool is_raw = header.uncompressed_size == 0;
+    std::size_t size = is_raw ? header.compressed_size : header.uncompressed_size;
+
+    // If the user buffer is big enough, place the data there directly. Otherwise, use our buffer
+    bool direct = size <= buff.size();
+    std::uint8_t* to = static_cast<std::uint8_t*>(buff.data());
+    if (!direct)
+    {
+        out_.resize(size);
+        to = out_.data();
+        out_first_ = 0;
+        out_last_ = size;
+    }
+
+    if (is_raw)
+    {
+        if (size)
+            std::memcpy(to, payload, size);
+    }
+    else
+    {
+        ec = decompress(payload, header.compressed_size, to, size);
+        if (ec)
+        {
+            out_first_ = out_last_ = 0;
+            return 0;
+        }
+    }
+
+    return direct ? size : 0;
+}
+
+std::size_t boost::mysql::detail::compressed_stream::read_some(asio::mutable_buffer buff, error_code& ec)
+{
+    ec = error_code();
+    if (buff.size() == 0)
+        return 0;
+
+    while (true)
+    {
+        // Data decompressed by a previous frame that didn't fit in the user buffer
+        if (has_pending())
+            return copy_pending(buff);
+
+        // A complete frame has been read
+        if (has_frame())
+        {
+            std::size_t bytes_read = process_frame(buff, ec);
+            if (ec || bytes_read)
+                return bytes_read;
+            continue;
+        }
+
+        // Read more bytes
+        std::size_t bytes_read = next_.read_some(prepare_read(), ec);
+        if (ec)
+            return 0;
+        on_read(bytes_read);
+    }
+}
+
+struct boost::mysql::detail::compressed_stream::read_some_op : boost::asio::coroutine
+{
+    compressed_stream& stream_;
+    asio::mutable_buffer buff_;
+    std::size_t result_{};
+    error_code err_;
+    bool has_read_{false};
+
+    read_some_op(compressed_stream& stream, asio::mutable_buffer buff) noexcept : stream_(stream), buff_(buff)
+    {
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code ec = {}, std::size_t bytes_read = 0)
+    {
+        // Error handling
+        if (ec)
+        {
+            self.complete(ec, 0);
+            return;
+        }
+
+        // Non-error path
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            while (buff_.size() != 0)
+            {
+                // Data decompressed by a previous frame that didn't fit in the user buffer
+                if (stream_.has_pending())
+                {
+                    result_ = stream_.copy_pending(buff_);
+                    break;
+                }
+
+                // A complete frame has been read
+                if (stream_.has_frame())
+                {
+                    result_ = stream_.process_frame(buff_, err_);
+                    if (err_ || result_)
+                        break;
+                    continue;
+                }
+
+                // Read more bytes
+                has_read_ = true;
+                BOOST_ASIO_CORO_YIELD stream_.next_.async_read_some(stream_.prepare_read(), std::move(self));
+                stream_.on_read(bytes_read);
+            }
+
+            // If we didn't perform any I/O, we need to post to avoid completing inline
+            if (!has_read_)
+            {
+                BOOST_ASIO_CORO_YIELD asio::post(stream_.get_executor(), std::move(self));
+            }
+
+            self.complete(err_, result_);
+        }
+    }
+};
+
+void boost::mysql::detail::compressed_stream::async_read_some(
+    asio::mutable_buffer buff,
+    asio::any_completion_handler<void(error_code, std::size_t)> handler
+)
+{
+    asio::async_compose<
+        asio::any_completion_handler<void(error_code, std::size_t)>,
+        void(error_code, std::size_t)>(read_some_op(*this, buff), handler, *this);
+}
+
+void boost::mysql::detail::compressed_stream::compress_message(span<const std::uint8_t> msg)
+{
+    write_buff_.clear();
+    write_first_ = 0;
+
+    // Empty writes don't generate any compressed frame
+    if (msg.empty())
+        return;
+
+    // The compressed frames of a request start with a zero sequence number. Message contents
+    // are not inspected: message_writer tells us which writes start a request
+    std::uint8_t seqnum = starts_request_ ? 0 : seqnum_;
+    starts_request_ = false;
+    const std::uint8_t* data = msg.data();
+    std::size_t size = msg.size();
+
+    while (size)
+    {
+        std::size_t chunk_size = (std::min)(size, MAX_PACKET_SIZE);
+        std::size_t header_offset = write_buff_.size();
+
+        // Attempt to compress the chunk, if it's worth it. If the compressed
+        // version isn't smaller, send it uncompressed
+        std::size_t compressed_size = 0;
+        if (chunk_size >= min_compress_length)
+        {
+            write_buff_.resize(header_offset + compressed_header_size + compress_bound(chunk_size));
+            compressed_size = compress(
+                data,
+                chunk_size,
+                write_buff_.data() + header_offset + compressed_header_size
+            );
+            if (compressed_size >= chunk_size)
+                compressed_size = 0;
+        }
+
+        compressed_frame_header header{};
+        header.seqnum = seqnum++;
+        if (compressed_size)
+        {
+            write_buff_.resize(header_offset + compressed_header_size + compressed_size);
+            header.compressed_size = compressed_size;
+            header.uncompressed_size = chunk_size;
+        }
+        else
+        {
+            write_buff_.resize(header_offset + compressed_header_size + chunk_size);
+            std::memcpy(write_buff_.data() + header_offset + compressed_header_size, data, chunk_size);
+            header.compressed_size = chunk_size;
+            header.uncompressed_size = 0;
+        }
+        serialize_compressed_frame_header(header, write_buff_.data() + header_offset);
+
+        data += chunk_size;
+        size -= chunk_size;
+    }
+
+    seqnum_ = seqnum;
+}
+
+std::size_t boost::mysql::detail::compressed_stream::compress_bound(std::size_t size) const noexcept
+{
+    switch (algo_)
+    {
+#ifdef BOOST_MYSQL_ENABLE_ZLIB
+    case compression_algorithm::zlib: return ::compressBound(static_cast<uLong>(size));
+#endif
+#ifdef BOOST_MYSQL_ENABLE_ZSTD
+    case compression_algorithm::zstd: return ZSTD_compressBound(size);
+#endif
+    default: ignore_unused(size); return 0;
+    }
+}
+
+std::size_t boost::mysql::detail::compressed_stream::compress(
+    const std::uint8_t* data,
+    std::size_t size,
+    std::uint8_t* to
+)
+{
+    // Returns zero on failure, which causes the data to be sent uncompressed
+    switch (algo_)
+    {
+#ifdef BOOST_MYSQL_ENABLE_ZLIB
+    case compression_algorithm::zlib:
+    {
+        uLongf dest_size = ::compressBound(static_cast<uLong>(size));
+        int res = ::compress(to, &dest_size, data, static_cast<uLong>(size));
+        return res == Z_OK ? static_cast<std::size_t>(dest_size) : 0u;
+    }
+#endif
+#ifdef BOOST_MYSQL_ENABLE_ZSTD
+    case compression_algorithm::zstd:
+    {
+        std::size_t res = ZSTD_compressCCtx(
+            zstd_cctx_.get(),
+            to,
+            ZSTD_compressBound(size),
+            data,
+            size,
+            zstd_compression_level
+        );
+        return ZSTD_isError(res) ? 0u : res;
+    }
+#endif
+    default: ignore_unused(data, size, to); return 0;
+    }
+}
+
+boost::mysql::error_code boost::mysql::detail::compressed_stream::decompress(
+    const std::uint8_t* data,
+    std::size_t size,
+    std::uint8_t* to,
+    std::size_t uncompressed_size
+)
+{
+    switch (algo_)
+    {
+#ifdef BOOST_MYSQL_ENABLE_ZLIB
+    case compression_algorithm::zlib:
+    {
+        uLongf dest_size = static_cast<uLongf>(uncompressed_size);
+        int res = ::uncompress(to, &dest_size, data, static_cast<uLong>(size));
+        if (res != Z_OK || dest_size != uncompressed_size)
+            return client_errc::protocol_value_error;
+        return error_code();
+    }
+#endif
+#ifdef BOOST_MYSQL_ENABLE_ZSTD
+    case compression_algorithm::zstd:
+    {
+        std::size_t res = ZSTD_decompressDCtx(zstd_dctx_.get(), to, uncompressed_size, data, size);
+        if (ZSTD_isError(res) || res != uncompressed_size)
+            return client_errc::protocol_value_error;
+        return error_code();
+    }
+#endif
+    default: ignore_unused(data, size, to, uncompressed_size); return client_errc::protocol_value_error;
+    }
+}
+
+std::size_t boost::mysql::detail::compressed_stream::write_some(asio::const_buffer buff, error_code& ec)
+{
+    // We always write the entire buffer, since it's not possible to report
+    // partial writes in terms of uncompressed bytes
+    compress_message(span<const std::uint8_t>(static_cast<const std::uint8_t*>(buff.data()), buff.size()));
+    while (!write_done())
+    {
+        std::size_t bytes_written = next_.write_some(write_area(), ec);
+        if (ec)
+            return 0;
+        write_first_ += bytes_written;
+    }
+    ec = error_code();
+    return buff.size();
+}
+
+struct boost::mysql::detail::compressed_stream::write_some_op : boost::asio::coroutine
+{
+    compressed_stream& stream_;
+    std::size_t size_;
+
+    write_some_op(compressed_stream& stream, std::size_t size) noexcept : stream_(stream), size_(size) {}
+
+    template <class Self>
+    void operator()(Self& self, error_code ec = {}, std::size_t bytes_written = 0)
+    {
+        // Error handling
+        if (ec)
+        {
+            self.complete(ec, 0);
+            return;
+        }
+
+        // Non-error path
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            // Empty writes don't generate any compressed frame
+            if (stream_.write_done())
+            {
+                BOOST_ASIO_CORO_YIELD asio::post(stream_.get_executor(), std::move(self));
+            }
+
+            while (!stream_.write_done())
+            {
+                BOOST_ASIO_CORO_YIELD stream_.next_.async_write_some(stream_.write_area(), std::move(self));
+                stream_.write_first_ += bytes_written;
+            }
+
+            self.complete(error_code(), size_);
+        }
+    }
+};
+
+void boost::mysql::detail::compressed_stream::async_write_some(
+    asio::const_buffer buff,
+    asio::any_completion_handler<void(error_code, std::size_t)> handler
+)
+{
+    compress_message(span<const std::uint8_t>(static_cast<const std::uint8_t*>(buff.data()), buff.size()));
+    asio::async_compose<
+        asio::any_completion_handler<void(error_code, std::size_t)>,
+        void(error_code, std::size_t)>(write_some_op(*this, buff.size()), handler, *this);
+}
+
+#endif
@@ -0,0 +1,71 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_LONG_DATA_PARAMS_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_LONG_DATA_PARAMS_HPP
+
+#include <boost/assert.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <unordered_map>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Parameter values sent with COM_STMT_SEND_LONG_DATA are stored by the server until the
+// statement is executed or reset. COM_STMT_EXECUTE must then omit these values.
+// This class tracks which parameters have such pending values, for each statement.
+// Flags are stored as std::uint8_t to be passed as a span to execute_stmt_command.
+class long_data_params
+{
+    std::unordered_map<std::uint32_t, std::vector<std::uint8_t>> params_;
+
+public:
+    // Records that data has been sent for the given parameter
+    void add(std::uint32_t stmt_id, std::size_t num_params, std::size_t param_index)
+    {
+        BOOST_ASSERT(param_index < num_params);
+        auto& flags = params_[stmt_id];
+        flags.resize(num_params);
+        flags[param_index] = 1u;
+    }
+
+    // Whether data is pending for any parameter of the statement
+    bool has_pending(std::uint32_t stmt_id) const { return params_.find(stmt_id) != params_.end(); }
+
+    // Retrieves the flags for the statement, to be used in its next execution.
+    // The server discards the data after executing the statement, so flags are removed.
+    // Returns an empty vector if no data is pending
+    std::vector<std::uint8_t> consume(std::uint32_t stmt_id)
+    {
+        std::vector<std::uint8_t> res;
+        auto it = params_.find(stmt_id);
+        if (it != params_.end())
+        {
+            res = std::move(it->second);
+            params_.erase(it);
+        }
+        return res;
+    }
+
+    // The statement was closed or reset, discarding any pending data
+    void erase(std::uint32_t stmt_id) { params_.erase(stmt_id); }
+
+    // All statements were closed
+    void clear() noexcept { params_.clear(); }
+
+    std::size_t size() const noexcept { return params_.size(); }
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
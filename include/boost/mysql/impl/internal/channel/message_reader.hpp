@@ -8,7 +8,10 @@
 #ifndef BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_MESSAGE_READER_HPP
 #define BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_MESSAGE_READER_HPP
 
+#include <boost/mysql/buffer_params.hpp>
+#include <boost/mysql/buffer_stats.hpp>
 #include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/connection_observer.hpp>
 #include <boost/mysql/error_code.hpp>
 
 #include <boost/mysql/detail/any_stream.hpp>
@@ -25,6 +28,7 @@
 #include <boost/asio/post.hpp>
 #include <boost/assert.hpp>
 
+#include <algorithm>
 #include <cstddef>
 #include <cstdint>
 
@@ -35,8 +39,16 @@ namespace detail {
 class message_reader
 {
 public:
+    message_reader(const buffer_params& params, std::size_t max_frame_size = MAX_PACKET_SIZE)
+        : params_(params),
+          buffer_(params.initial_read_size()),
+          parser_(max_frame_size),
+          peak_buffer_size_(buffer_.size())
+    {
+    }
+
     message_reader(std::size_t initial_buffer_size, std::size_t max_frame_size = MAX_PACKET_SIZE)
-        : buffer_(initial_buffer_size), parser_(max_frame_size)
+        : message_reader(buffer_params(initial_buffer_size), max_frame_size)
     {
     }
 
@@ -46,16 +58,34 @@ public:
     {
         {
             BOOST_ASSERT(has_message());
-            if (result_.message.has_seqnum_mismatch || seqnum != result_.message.seqnum_first)
+            if (check_seqnums_)
             {
-                ec = make_error_code(client_errc::sequence_number_mismatch);
-                return {};
+                if (result_.message.has_seqnum_mismatch || seqnum != result_.message.seqnum_first)
+                {
+                    ec = make_error_code(client_errc::sequence_number_mismatch);
+                    return {};
+                }
+                seqnum = result_.message.seqnum_last + 1;
+            }
+            else
+            {
+                // Advance by the number of frames in the message
+                seqnum += static_cast<std::uint8_t>(
+                    result_.message.seqnum_last - result_.message.seqnum_first + 1
+                );
             }
-            seqnum = result_.message.seqnum_last + 1;
             span<const std::uint8_t> res(
                 buffer_.current_message_first() - result_.message.size,
                 result_.message.size
             );
+            if (observer_)
+            {
+                observer_->on_message_read(
+                    partial_bytes_ + result_.message.size,
+                    static_cast<std::uint8_t>(result_.message.seqnum_last - result_.message.seqnum_first) + 1u
+                );
+            }
+            partial_bytes_ = 0;
             parse_message();
             ec = error_code();
             return res;
@@ -67,62 +97,188 @@ public:
     // and get_next_message() returns the parsed message.
     // May relocate the buffer, modifying buffer_first().
     // The reserved area bytes will be removed before the actual read.
-    void read_some(any_stream& stream, error_code& ec)
+    void read_some(any_stream& stream, error_code& ec) { read_some_impl(stream, false, ec); }
+
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code)) CompletionToken>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_read_some(any_stream& stream, CompletionToken&& token)
+    {
+        return async_read_some_impl(stream, false, std::forward<CompletionToken>(token));
+    }
+
+    // Partial reads, to process big messages without assembling them in memory.
+    // Reads until there is a message or some bytes of the message being parsed.
+    // The buffer only grows as required to parse frame headers.
+    // If !has_message(), partial_message() contains the bytes read so far
+    void read_some_partial(any_stream& stream, error_code& ec) { read_some_impl(stream, true, ec); }
+
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code)) CompletionToken>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+    async_read_some_partial(any_stream& stream, CompletionToken&& token)
+    {
+        return async_read_some_impl(stream, true, std::forward<CompletionToken>(token));
+    }
+
+    // The payload bytes of the message being parsed that haven't been consumed yet.
+    // Frame headers have been stripped. Only meaningful if !has_message()
+    span<const std::uint8_t> partial_message() const noexcept { return buffer_.current_message(); }
+
+    // Marks the bytes returned by partial_message() as processed. Once the message is complete,
+    // get_next_message() only returns the bytes after the ones consumed. Sequence numbers
+    // are checked for the entire message, once it's complete
+    void consume_partial_message() noexcept
+    {
+        BOOST_ASSERT(!has_message());
+        partial_bytes_ += buffer_.current_message_size();
+        buffer_.move_to_reserved(buffer_.current_message_size());
+    }
+
+    // When using the compressed protocol, servers don't keep sequence numbers in
+    // regular frames consistent, so they shouldn't be checked
+    bool check_seqnums() const noexcept { return check_seqnums_; }
+    void set_check_seqnums(bool v) noexcept { check_seqnums_ = v; }
+
+    // Observer to notify of reads and buffer operations. May be nullptr
+    connection_observer* observer() const noexcept { return observer_; }
+    void set_observer(connection_observer* v) noexcept { observer_ = v; }
+
+    // Memory usage counters. The write buffer size is filled by the channel
+    buffer_stats stats() const noexcept
+    {
+        buffer_stats res;
+        res.read_buffer_size = buffer_.size();
+        res.peak_read_buffer_size = peak_buffer_size_;
+        res.num_read_buffer_grows = num_grows_;
+        res.num_read_buffer_shrinks = num_shrinks_;
+        return res;
+    }
+
+    // Exposed for the sake of testing
+    read_buffer& buffer() noexcept { return buffer_; }
+    const read_buffer& buffer() const noexcept { return buffer_; }
+
+private:
+    struct read_some_op;
+
+    buffer_params params_;
+    read_buffer buffer_;
+    message_parser parser_;
+    message_parser::result result_;
+    bool check_seqnums_{true};
+    connection_observer* observer_{};
+    std::size_t peak_buffer_size_;
+    std::size_t num_grows_{};
+    std::size_t num_shrinks_{};
+    std::size_t idle_reads_{};  // consecutive reads that fitted in the retained size
+    std::size_t partial_bytes_{};  // bytes of the current message consumed by consume_partial_message()
+
+    void parse_message() { parser_.parse_message(buffer_, result_); }
+
+    // Whether a read operation is done
+    bool is_read_complete(bool partial) const noexcept
+    {
+        return has_message() || (partial && buffer_.current_message_size() > 0u);
+    }
+
+    void read_some_impl(any_stream& stream, bool partial, error_code& ec)
     {
         // If we already have a message, complete immediately
-        if (has_message())
+        if (is_read_complete(partial))
         {
             ec = error_code();
             return;
         }
 
-        // Remove processed messages
-        buffer_.remove_reserved();
+        // Remove processed messages, releasing memory if required
+        remove_reserved();
+        maybe_shrink_buffer();
 
-        while (!has_message())
+        while (!is_read_complete(partial))
         {
             // If any previous process_message indicated that we need more
             // buffer space, resize the buffer now
-            maybe_resize_buffer();
+            ec = maybe_resize_buffer(partial);
+            if (ec)
+                return;
 
             // Actually read bytes
             std::size_t bytes_read = stream.read_some(free_area(), ec);
             if (ec)
-                break;
+                return;
             valgrind_make_mem_defined(buffer_.free_first(), bytes_read);
 
             // Process them
             on_read_bytes(bytes_read);
         }
+
+        on_read_complete();
     }
 
-    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code)) CompletionToken>
+    template <class CompletionToken>
     BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
-    async_read_some(any_stream& stream, CompletionToken&& token);
+    async_read_some_impl(any_stream& stream, bool partial, CompletionToken&& token);
 
-    // Exposed for the sake of testing
-    read_buffer& buffer() noexcept { return buffer_; }
-    const read_buffer& buffer() const noexcept { return buffer_; }
-
-private:
-    struct read_some_op;
-
-    read_buffer buffer_;
-    message_parser parser_;
-    message_parser::result result_;
-
-    void parse_message() { parser_.parse_message(buffer_, result_); }
-
-    void maybe_resize_buffer()
+    // Partial reads don't need the entire frame to fit in the buffer, just its header
+    error_code maybe_resize_buffer(bool partial)
     {
         if (!result_.has_message)
         {
-            buffer_.grow_to_fit(result_.required_size);
+            std::size_t required_size = partial ? (std::min)(result_.required_size, HEADER_SIZE)
+                                                : result_.required_size;
+            std::size_t old_size = buffer_.size();
+            if (!buffer_.grow_to_fit(required_size, params_.max_read_size(), params_.read_growth_factor()))
+            {
+                return client_errc::max_buffer_size_exceeded;
+            }
+            if (buffer_.size() != old_size)
+            {
+                ++num_grows_;
+                peak_buffer_size_ = (std::max)(peak_buffer_size_, buffer_.size());
+                if (observer_)
+                    observer_->on_read_buffer_resize(old_size, buffer_.size());
+            }
+        }
+        return error_code();
+    }
+
+    // If the buffer has grown past the retained size and hasn't needed the extra space
+    // for the configured number of reads, release the memory. Must be called
+    // after removing the reserved area
+    void maybe_shrink_buffer()
+    {
+        std::size_t retained_size = params_.max_retained_read_size();
+        if (buffer_.size() > retained_size && idle_reads_ >= params_.shrink_after_reads() &&
+            buffer_.current_message_size() + buffer_.pending_size() <= retained_size)
+        {
+            std::size_t old_size = buffer_.size();
+            buffer_.shrink_to(retained_size);
+            ++num_shrinks_;
+            idle_reads_ = 0;
+            if (observer_)
+                observer_->on_read_buffer_resize(old_size, buffer_.size());
         }
     }
 
+    void on_read_complete() noexcept
+    {
+        std::size_t used_size = buffer_.size() - buffer_.free_size();
+        if (used_size <= params_.max_retained_read_size())
+            ++idle_reads_;
+        else
+            idle_reads_ = 0;
+    }
+
+    void remove_reserved()
+    {
+        if (observer_ && buffer_.reserved_size() > 0)
+            observer_->on_read_buffer_compact(buffer_.current_message_size() + buffer_.pending_size());
+        buffer_.remove_reserved();
+    }
+
     void on_read_bytes(size_t num_bytes)
     {
+        if (observer_)
+            observer_->on_bytes_read(num_bytes);
         buffer_.move_to_pending(num_bytes);
         parse_message();
     }
@@ -138,8 +294,13 @@ struct boost::mysql::detail::message_reader::read_some_op : boost::asio::corouti
 {
     message_reader& reader_;
     any_stream& stream_;
+    bool partial_;
+    error_code stored_ec_;
 
-    read_some_op(message_reader& reader, any_stream& stream) noexcept : reader_(reader), stream_(stream) {}
+    read_some_op(message_reader& reader, any_stream& stream, bool partial) noexcept
+        : reader_(reader), stream_(stream), partial_(partial)
+    {
+    }
 
     template <class Self>
     void operator()(Self& self, error_code ec = {}, std::size_t bytes_read = 0)
@@ -155,21 +316,28 @@ struct boost::mysql::detail::message_reader::read_some_op : boost::asio::corouti
         BOOST_ASIO_CORO_REENTER(*this)
         {
             // If we already have a message, complete immediately
-            if (reader_.has_message())
+            if (reader_.is_read_complete(partial_))
             {
                 BOOST_ASIO_CORO_YIELD boost::asio::post(stream_.get_executor(), std::move(self));
                 self.complete(error_code());
                 BOOST_ASIO_CORO_YIELD break;
             }
 
-            // Remove processed messages
-            reader_.buffer_.remove_reserved();
+            // Remove processed messages, releasing memory if required
+            reader_.remove_reserved();
+            reader_.maybe_shrink_buffer();
 
-            while (!reader_.has_message())
+            while (!reader_.is_read_complete(partial_))
             {
                 // If any previous process_message indicated that we need more
                 // buffer space, resize the buffer now
-                reader_.maybe_resize_buffer();
+                stored_ec_ = reader_.maybe_resize_buffer(partial_);
+                if (stored_ec_)
+                {
+                    BOOST_ASIO_CORO_YIELD boost::asio::post(stream_.get_executor(), std::move(self));
+                    self.complete(stored_ec_);
+                    BOOST_ASIO_CORO_YIELD break;
+                }
 
                 // Actually read bytes
                 BOOST_ASIO_CORO_YIELD stream_.async_read_some(reader_.free_area(), std::move(self));
@@ -179,6 +347,7 @@ struct boost::mysql::detail::message_reader::read_some_op : boost::asio::corouti
                 reader_.on_read_bytes(bytes_read);
             }
 
+            reader_.on_read_complete();
             self.complete(error_code());
         }
     }
@@ -268,12 +437,16 @@ async_read_one_message(
 }  // namespace mysql
 }  // namespace boost
 
-template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code)) CompletionToken>
+template <class CompletionToken>
 BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(::boost::mysql::error_code))
-boost::mysql::detail::message_reader::async_read_some(any_stream& stream, CompletionToken&& token)
+boost::mysql::detail::message_reader::async_read_some_impl(
+    any_stream& stream,
+    bool partial,
+    CompletionToken&& token
+)
 {
     return boost::asio::async_compose<CompletionToken, void(error_code)>(
-        read_some_op{*this, stream},
+        read_some_op(*this, stream, partial),
         token,
         stream
     );
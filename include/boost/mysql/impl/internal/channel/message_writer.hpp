@@ -8,12 +8,17 @@
 #ifndef BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_MESSAGE_WRITER_HPP
 #define BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_MESSAGE_WRITER_HPP
 
+#include <boost/mysql/connection_observer.hpp>
+
 #include <boost/mysql/impl/internal/protocol/constants.hpp>
 #include <boost/mysql/impl/internal/protocol/protocol.hpp>
 
+#include <algorithm>
 #include <array>
 #include <cstddef>
 #include <cstdint>
+#include <cstring>
+#include <vector>
 
 namespace boost {
 namespace mysql {
@@ -53,12 +58,53 @@ class message_writer
     std::vector<std::uint8_t> buffer_;
     std::size_t max_frame_size_;
     std::uint8_t* seqnum_{nullptr};
+    connection_observer* observer_{nullptr};
 
     chunk_processor chunk_;
     std::size_t total_bytes_{};
     std::size_t total_bytes_written_{};
     bool should_send_empty_frame_{};
 
+    // Whether the current chunk is the first one of a request, and whether the next message
+    // set up starts a new request. Compressed streams start new sequence numbers for requests
+    bool starts_request_{};
+    bool next_starts_request_{};
+
+    // Gather writes. Chunks point either into buffer_ (if external is nullptr)
+    // or into memory owned by the caller, which is written in place
+    struct gather_chunk
+    {
+        const std::uint8_t* external;
+        std::size_t offset;  // into buffer_, if external is nullptr
+        std::size_t size;
+        bool starts_request;
+    };
+    std::vector<external_buffer> external_;
+    std::vector<gather_chunk> gather_chunks_;
+    std::size_t gather_index_{};
+    std::size_t gather_size_{};
+    span<const std::uint8_t> external_chunk_;
+
+    void reset_gather() noexcept
+    {
+        gather_chunks_.clear();
+        gather_index_ = 0;
+        external_chunk_ = {};
+    }
+
+    void add_inline_chunk(std::size_t first, std::size_t last, bool starts_request = false)
+    {
+        if (last > first)
+            gather_chunks_.push_back({nullptr, first, last - first, starts_request});
+    }
+
+    // Applies a previous start_request() call to the first chunk of the message being set up
+    void consume_request_start() noexcept
+    {
+        starts_request_ = next_starts_request_;
+        next_starts_request_ = false;
+    }
+
     void process_header_write(std::uint32_t size_to_write, std::uint8_t seqnum, std::size_t buff_offset)
     {
         serialize_frame_header(
@@ -71,7 +117,16 @@ class message_writer
 
     void prepare_next_chunk()
     {
-        if (should_send_empty_frame_)
+        if (gather_index_ < gather_chunks_.size())
+        {
+            const auto& chunk = gather_chunks_[gather_index_++];
+            starts_request_ = chunk.starts_request;
+            if (chunk.external)
+                external_chunk_ = {chunk.external, chunk.size};
+            else
+                chunk_.reset(chunk.offset, chunk.offset + chunk.size);
+        }
+        else if (should_send_empty_frame_)
         {
             process_header_write(0, next_seqnum(), 0);
             chunk_.reset(0, HEADER_SIZE);
@@ -102,39 +157,224 @@ public:
 
     span<std::uint8_t> prepare_buffer(std::size_t msg_size, std::uint8_t& seqnum)
     {
+        reset_gather();
         buffer_.resize(msg_size + HEADER_SIZE);
         total_bytes_ = msg_size;
         total_bytes_written_ = 0;
         should_send_empty_frame_ = msg_size == 0;
         seqnum_ = &seqnum;
         prepare_next_chunk();
+        consume_request_start();
         return {buffer_.data() + HEADER_SIZE, msg_size};
     }
 
-    bool done() const noexcept { return chunk_.done(); }
+    // Returns a buffer where the caller can place a message of up to max_size bytes, avoiding
+    // intermediate copies. prepare_buffer() must be called afterwards with the actual message size
+    span<std::uint8_t> payload_buffer(std::size_t max_size)
+    {
+        buffer_.resize(max_size + HEADER_SIZE);
+        return {buffer_.data() + HEADER_SIZE, max_size};
+    }
+
+    // Marks the next message set up by prepare_buffer() or finish_gather() as the start of a request
+    void start_request() noexcept { next_starts_request_ = true; }
+
+    // Sets up the writer to send a sequence of requests that already contain frame headers,
+    // as generated by serialize_framed(). request_offsets contains the offset of each request
+    // within frames, and each request is written as a separate chunk. Used by pipelines
+    void prepare_framed(span<const std::uint8_t> frames, span<const std::size_t> request_offsets)
+    {
+        BOOST_ASSERT(frames.empty() || (!request_offsets.empty() && request_offsets[0] == 0u));
+        reset_gather();
+        buffer_.assign(frames.begin(), frames.end());
+        total_bytes_ = 0;
+        total_bytes_written_ = 0;
+        should_send_empty_frame_ = false;
+        next_starts_request_ = false;
+        seqnum_ = nullptr;
+        for (std::size_t i = 0; i < request_offsets.size(); ++i)
+        {
+            std::size_t last = i + 1 < request_offsets.size() ? request_offsets[i + 1] : buffer_.size();
+            add_inline_chunk(request_offsets[i], last, true);
+        }
+        chunk_.reset();
+        prepare_next_chunk();
+    }
+
+    // Same as the above, but frames are written as a single request
+    void prepare_framed(span<const std::uint8_t> frames)
+    {
+        const std::size_t offset = 0;
+        prepare_framed(frames, {&offset, 1});
+    }
+
+    // Sets up the writer to send a message of msg_size bytes using gather writes. The caller serializes
+    // inline_size bytes into the returned buffer, and adds the rest of the message to external_buffers(),
+    // ordered by offset. Data in external buffers is written in place, and must be kept alive
+    // until the message has been written. finish_gather() must be called afterwards
+    span<std::uint8_t> prepare_gather(std::size_t msg_size, std::size_t inline_size)
+    {
+        BOOST_ASSERT(inline_size <= msg_size);
+        std::size_t headers_size = (msg_size / max_frame_size_ + 1) * HEADER_SIZE;
+        reset_gather();
+        external_.clear();
+        buffer_.resize(headers_size + inline_size);
+        gather_size_ = msg_size;
+        return {buffer_.data() + headers_size, inline_size};
+    }
+
+    std::vector<external_buffer>& external_buffers() noexcept { return external_; }
+
+    void finish_gather(std::uint8_t& seqnum)
+    {
+        // Space for all the frame headers is reserved before the inline bytes, and headers are
+        // placed as we go, proceeding from the front. Inline bytes are moved backwards to make room
+        // for headers, so dst never overtakes src
+        std::size_t num_frames = gather_size_ / max_frame_size_ + 1;
+        std::size_t payload_first = num_frames * HEADER_SIZE;
+        std::size_t src = payload_first;  // next inline byte to process
+        std::size_t dst = 0;              // where the next inline byte should go
+        std::size_t chunk_first = 0;      // first byte of the inline chunk being built
+        std::size_t ext_index = 0;
+        std::size_t ext_consumed = 0;
+
+        for (std::size_t i = 0; i < num_frames; ++i)
+        {
+            // An empty frame must be sent if the last frame has exactly max_frame_size bytes
+            std::size_t frame_size = (std::min)(max_frame_size_, gather_size_ - i * max_frame_size_);
+            process_header_write(static_cast<std::uint32_t>(frame_size), seqnum++, dst);
+            dst += HEADER_SIZE;
+
+            while (frame_size > 0u)
+            {
+                std::size_t inline_pos = src - payload_first;
+                if (ext_index < external_.size() && external_[ext_index].offset == inline_pos)
+                {
+                    // External data. Terminates the current inline chunk
+                    auto data = external_[ext_index].data;
+                    std::size_t n = (std::min)(frame_size, data.size() - ext_consumed);
+                    add_inline_chunk(chunk_first, dst);
+                    if (n)
+                        gather_chunks_.push_back({data.data() + ext_consumed, 0u, n, false});
+                    chunk_first = dst;
+                    frame_size -= n;
+                    ext_consumed += n;
+                    if (ext_consumed == data.size())
+                    {
+                        ++ext_index;
+                        ext_consumed = 0;
+                    }
+                }
+                else
+                {
+                    // Inline bytes, up to the next external buffer
+                    std::size_t next = ext_index < external_.size() ? external_[ext_index].offset
+                                                                    : buffer_.size() - payload_first;
+                    BOOST_ASSERT(next > inline_pos);
+                    std::size_t n = (std::min)(frame_size, next - inline_pos);
+                    if (src != dst)
+                        std::memmove(buffer_.data() + dst, buffer_.data() + src, n);
+                    src += n;
+                    dst += n;
+                    frame_size -= n;
+                }
+            }
+        }
+        add_inline_chunk(chunk_first, dst);
+        BOOST_ASSERT(src == buffer_.size());
+
+        // Set up the write
+        total_bytes_ = 0;
+        total_bytes_written_ = 0;
+        should_send_empty_frame_ = false;
+        seqnum_ = nullptr;
+        chunk_.reset();
+        prepare_next_chunk();
+        consume_request_start();
+    }
+
+    bool done() const noexcept { return chunk_.done() && external_chunk_.empty(); }
+
+    // The amount of memory held by the write buffer
+    std::size_t buffer_size() const noexcept { return buffer_.capacity(); }
+
+    // Observer to notify of writes. May be nullptr
+    void set_observer(connection_observer* v) noexcept { observer_ = v; }
 
     // This function returns an empty buffer to signal that we're done
     span<const std::uint8_t> next_chunk() const
     {
         BOOST_ASSERT(!done());
-        return chunk_.get_chunk(buffer_);
+        return external_chunk_.empty() ? chunk_.get_chunk(buffer_) : external_chunk_;
     }
 
+    // Whether the chunk returned by next_chunk() is the first one of a request
+    bool chunk_starts_request() const noexcept { return starts_request_; }
+
     void on_bytes_written(std::size_t n)
     {
         BOOST_ASSERT(!done());
 
         // Acknowledge the written bytes
-        chunk_.on_bytes_written(n);
+        if (external_chunk_.empty())
+        {
+            chunk_.on_bytes_written(n);
+        }
+        else
+        {
+            BOOST_ASSERT(external_chunk_.size() >= n);
+            external_chunk_ = external_chunk_.subspan(n);
+        }
+        starts_request_ = false;
+        if (observer_)
+            observer_->on_bytes_written(n);
 
         // Prepare the next chunk, if required
-        if (chunk_.done())
+        if (done())
         {
             prepare_next_chunk();
         }
     }
 };
 
+// Serializes a message and appends it to buff, including frame headers. Messages are split
+// in frames the same way message_writer does. Returns the sequence number the server response will have
+template <class Serializable>
+std::uint8_t serialize_framed(
+    const Serializable& message,
+    std::vector<std::uint8_t>& buff,
+    std::uint8_t seqnum = 0,
+    std::size_t max_frame_size = MAX_PACKET_SIZE
+)
+{
+    // An empty frame must be sent if the last frame has exactly max_frame_size bytes
+    std::size_t size = message.get_size();
+    std::size_t num_frames = size / max_frame_size + 1;
+
+    // Serialize the payload after the space reserved for headers
+    std::size_t offset = buff.size();
+    buff.resize(offset + size + num_frames * HEADER_SIZE);
+    std::size_t payload_offset = offset + num_frames * HEADER_SIZE;
+    message.serialize(span<std::uint8_t>(buff.data() + payload_offset, size));
+
+    // Move each frame into place and write its header. Frames never overlap their
+    // destination in a way that breaks memmove, since we proceed from the front
+    for (std::size_t i = 0; i < num_frames; ++i)
+    {
+        std::size_t frame_size = (std::min)(max_frame_size, size - i * max_frame_size);
+        std::size_t header_offset = offset + i * (max_frame_size + HEADER_SIZE);
+        std::size_t src_offset = payload_offset + i * max_frame_size;
+        if (frame_size && src_offset != header_offset + HEADER_SIZE)
+            std::memmove(buff.data() + header_offset + HEADER_SIZE, buff.data() + src_offset, frame_size);
+        serialize_frame_header(
+            frame_header{static_cast<std::uint32_t>(frame_size), seqnum++},
+            span<std::uint8_t, frame_header_size>(buff.data() + header_offset, frame_header_size)
+        );
+    }
+
+    return seqnum;
+}
+
 }  // namespace detail
 }  // namespace mysql
 }  // namespace boost
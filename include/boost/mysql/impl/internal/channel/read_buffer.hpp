@@ -11,6 +11,7 @@
 #include <boost/assert.hpp>
 #include <boost/core/span.hpp>
 
+#include <algorithm>
 #include <cstddef>
 #include <cstdint>
 #include <cstring>
@@ -115,14 +116,52 @@ public:
         }
     }
 
-    // Makes sure the free size is at least n bytes long; resizes the buffer if required
-    void grow_to_fit(std::size_t n)
+    // Makes sure the free size is at least n bytes long; resizes the buffer if required.
+    // The new size will be at least growth_factor times the current one, but never bigger than max_size.
+    // Returns false, without modifying the buffer, if fitting n bytes requires exceeding max_size
+    bool grow_to_fit(
+        std::size_t n,
+        std::size_t max_size = static_cast<std::size_t>(-1),
+        double growth_factor = 1.0
+    )
     {
-        if (free_size() < n)
+        if (free_size() >= n)
+            return true;
+
+        // Check that we can fit n bytes without exceeding the limit
+        if (n > max_size || free_offset_ > max_size - n)
+            return false;
+
+        // Compute the new size
+        std::size_t new_size = free_offset_ + n;
+        if (growth_factor > 1.0)
         {
-            buffer_.resize(buffer_.size() + n - free_size());
-            buffer_.resize(buffer_.capacity());
+            double geometric_size = static_cast<double>(buffer_.size()) * growth_factor;
+            if (geometric_size >= static_cast<double>(max_size))
+                new_size = max_size;
+            else if (geometric_size > static_cast<double>(new_size))
+                new_size = static_cast<std::size_t>(geometric_size);
         }
+
+        // Resize. Use any extra capacity the vector may have, as long as we don't exceed the limit
+        buffer_.resize(new_size);
+        buffer_.resize((std::min)(buffer_.capacity(), max_size));
+        return true;
+    }
+
+    // Reallocates the buffer to a smaller size, releasing memory. Used to avoid holding
+    // big buffers forever after reading big messages. The reserved area must be empty,
+    // and the current message and pending areas must fit in the new size
+    void shrink_to(std::size_t new_size)
+    {
+        BOOST_ASSERT(reserved_size() == 0);
+        BOOST_ASSERT(free_offset_ <= new_size);
+        if (new_size >= buffer_.size())
+            return;
+        std::vector<std::uint8_t> new_buffer(new_size, std::uint8_t(0));
+        if (free_offset_ > 0)
+            std::memcpy(new_buffer.data(), buffer_.data(), free_offset_);
+        buffer_.swap(new_buffer);
     }
 };
 
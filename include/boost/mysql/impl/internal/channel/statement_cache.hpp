@@ -0,0 +1,131 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_STATEMENT_CACHE_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_STATEMENT_CACHE_HPP
+
+#include <boost/mysql/statement.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/assert.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <iterator>
+#include <list>
+#include <map>
+#include <string>
+#include <unordered_map>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// A LRU cache of prepared statements, keyed by SQL text. The cache doesn't perform any I/O:
+// the network algorithms are responsible for closing the statements it evicts.
+// A capacity of zero means that caching is disabled.
+class statement_cache
+{
+    struct entry
+    {
+        std::string sql;
+        statement stmt;
+    };
+
+    // Most recently used first. List nodes are stable, so the indices below can point into them
+    using list_type = std::list<entry>;
+    list_type entries_;
+    std::map<string_view, list_type::iterator> by_sql_;
+    std::unordered_map<std::uint32_t, list_type::iterator> by_id_;
+    std::size_t capacity_{};
+
+    void erase(list_type::iterator it)
+    {
+        by_sql_.erase(it->sql);
+        by_id_.erase(it->stmt.id());
+        entries_.erase(it);
+    }
+
+public:
+    statement_cache() = default;
+    statement_cache(const statement_cache&) = delete;
+    statement_cache(statement_cache&&) = default;
+    statement_cache& operator=(const statement_cache&) = delete;
+    statement_cache& operator=(statement_cache&&) = default;
+
+    std::size_t capacity() const noexcept { return capacity_; }
+    void set_capacity(std::size_t v) noexcept { capacity_ = v; }
+    bool enabled() const noexcept { return capacity_ != 0; }
+    std::size_t size() const noexcept { return entries_.size(); }
+    bool empty() const noexcept { return entries_.empty(); }
+
+    // Returns the statement prepared for sql, marking it as recently used,
+    // or an invalid statement if there is none
+    statement find(string_view sql)
+    {
+        auto it = by_sql_.find(sql);
+        if (it == by_sql_.end())
+            return statement();
+        entries_.splice(entries_.begin(), entries_, it->second);
+        return it->second->stmt;
+    }
+
+    bool contains(std::uint32_t stmt_id) const { return by_id_.count(stmt_id) != 0u; }
+
+    // Whether pop_lru() should be called before inserting a new entry. If the cache
+    // has been disabled while holding statements, all of them should be evicted
+    bool needs_eviction() const noexcept
+    {
+        return capacity_ ? entries_.size() >= capacity_ : !entries_.empty();
+    }
+
+    // Removes the least recently used entry and returns it. The caller should close it
+    statement pop_lru()
+    {
+        BOOST_ASSERT(!entries_.empty());
+        auto it = std::prev(entries_.end());
+        statement res = it->stmt;
+        erase(it);
+        return res;
+    }
+
+    // Removes a statement from the cache, without closing it. Returns whether it was present
+    bool remove(std::uint32_t stmt_id)
+    {
+        auto it = by_id_.find(stmt_id);
+        if (it == by_id_.end())
+            return false;
+        erase(it->second);
+        return true;
+    }
+
+    // Adds a statement just prepared. Make room calling pop_lru() first
+    void insert(string_view sql, const statement& stmt)
+    {
+        BOOST_ASSERT(enabled());
+        BOOST_ASSERT(entries_.size() < capacity_);
+        BOOST_ASSERT(by_sql_.count(sql) == 0u);
+        entries_.push_front(entry{std::string(sql.data(), sql.size()), stmt});
+        auto it = entries_.begin();
+        by_sql_.emplace(string_view(it->sql), it);
+        by_id_.emplace(stmt.id(), it);
+    }
+
+    // Forgets all statements, without closing them. Used when the session they belong to ends
+    void clear() noexcept
+    {
+        by_sql_.clear();
+        by_id_.clear();
+        entries_.clear();
+    }
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
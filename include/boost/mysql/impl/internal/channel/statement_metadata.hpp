@@ -0,0 +1,135 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_STATEMENT_METADATA_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_CHANNEL_STATEMENT_METADATA_HPP
+
+#include <boost/mysql/error_code.hpp>
+
+#include <boost/mysql/detail/coldef_view.hpp>
+
+#include <boost/mysql/impl/internal/protocol/protocol.hpp>
+
+#include <boost/assert.hpp>
+#include <boost/core/span.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// If the client negotiated CLIENT_OPTIONAL_RESULTSET_METADATA (MySQL) or MARIADB_CLIENT_CACHE_METADATA
+// (MariaDB), servers may omit the column definitions of the resultsets produced by a statement.
+// Clients should then use the ones the server sent previously, when the statement was prepared
+// or executed. This class stores these for each statement. The network algorithms record
+// the column definition messages as they arrive, and they are parsed once recording is complete.
+class statement_metadata
+{
+    struct entry
+    {
+        std::vector<std::uint8_t> buffer;  // column definition messages, one after another
+        std::vector<coldef_view> columns;  // point into buffer
+    };
+
+    std::unordered_map<std::uint32_t, entry> entries_;
+
+    // The recording in progress, if any
+    bool recording_{};
+    std::uint32_t recording_id_{};
+    std::vector<std::uint8_t> recording_buffer_;
+    std::vector<std::size_t> recording_sizes_;
+
+public:
+    statement_metadata() = default;
+    statement_metadata(const statement_metadata&) = delete;
+    statement_metadata(statement_metadata&&) = default;
+    statement_metadata& operator=(const statement_metadata&) = delete;
+    statement_metadata& operator=(statement_metadata&&) = default;
+
+    // Starts recording the column definitions for a statement, discarding any recording in progress
+    void start_recording(std::uint32_t stmt_id)
+    {
+        discard_recording();
+        recording_ = true;
+        recording_id_ = stmt_id;
+    }
+
+    bool is_recording() const noexcept { return recording_; }
+
+    // Adds a column definition message to the recording in progress
+    void record(span<const std::uint8_t> msg)
+    {
+        BOOST_ASSERT(recording_);
+        recording_buffer_.insert(recording_buffer_.end(), msg.begin(), msg.end());
+        recording_sizes_.push_back(msg.size());
+    }
+
+    // Stores the recorded column definitions, replacing any previous ones for the statement
+    error_code finish_recording()
+    {
+        BOOST_ASSERT(recording_);
+        entry e{std::move(recording_buffer_), std::vector<coldef_view>(recording_sizes_.size())};
+        const std::uint8_t* first = e.buffer.data();
+        for (std::size_t i = 0; i < recording_sizes_.size(); ++i)
+        {
+            auto err = deserialize_column_definition({first, recording_sizes_[i]}, e.columns[i]);
+            if (err)
+            {
+                discard_recording();
+                return err;
+            }
+            first += recording_sizes_[i];
+        }
+
+        // Moving the buffer doesn't invalidate the views
+        entries_[recording_id_] = std::move(e);
+        discard_recording();
+        return error_code();
+    }
+
+    void discard_recording() noexcept
+    {
+        recording_ = false;
+        recording_buffer_.clear();
+        recording_sizes_.clear();
+    }
+
+    // Returns the column definitions stored for a statement, or nullptr if there are none
+    const std::vector<coldef_view>* find(std::uint32_t stmt_id) const noexcept
+    {
+        auto it = entries_.find(stmt_id);
+        return it == entries_.end() ? nullptr : &it->second.columns;
+    }
+
+    // The statement was closed
+    void erase(std::uint32_t stmt_id)
+    {
+        entries_.erase(stmt_id);
+        if (recording_ && recording_id_ == stmt_id)
+            discard_recording();
+    }
+
+    // All statements were closed
+    void clear() noexcept
+    {
+        entries_.clear();
+        discard_recording();
+    }
+
+    std::size_t size() const noexcept { return entries_.size(); }
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
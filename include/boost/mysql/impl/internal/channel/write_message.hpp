@@ -33,6 +33,8 @@ inline void write_message(any_stream& stream, message_writer& processor, error_c
 {
     while (!processor.done())
     {
+        if (processor.chunk_starts_request())
+            stream.start_request();
         std::size_t bytes_written = stream.write_some(asio::buffer(processor.next_chunk()), ec);
         if (ec)
             break;
@@ -67,6 +69,8 @@ struct write_message_op : boost::asio::coroutine
             BOOST_ASSERT(!processor_.done());
             while (!processor_.done())
             {
+                if (processor_.chunk_starts_request())
+                    stream_.start_request();
                 BOOST_ASIO_CORO_YIELD stream_.async_write_some(
                     asio::buffer(processor_.next_chunk()),
                     std::move(self)
@@ -0,0 +1,159 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_CHANGE_USER_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_CHANGE_USER_HPP
+
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/handshake_params.hpp>
+
+#include <boost/mysql/detail/config.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/handshake.hpp>
+
+#include <boost/asio/async_result.hpp>
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/post.hpp>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+struct change_user_op : boost::asio::coroutine
+{
+    handshake_processor processor_;
+
+    change_user_op(const handshake_params& params, diagnostics& diag, channel& chan)
+        : processor_(params, diag, chan)
+    {
+    }
+
+    channel& get_channel() noexcept { return processor_.get_channel(); }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {}, span<const std::uint8_t> read_msg = {})
+    {
+        // Error checking
+        if (err)
+        {
+            self.complete(err);
+            return;
+        }
+
+        // Non-error path
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            processor_.clear_diagnostics();
+
+            // Compose the request. This may fail if the auth plugin is unknown
+            err = processor_.compose_change_user_request();
+            if (err)
+            {
+                BOOST_ASIO_CORO_YIELD boost::asio::post(get_channel().get_executor(), std::move(self));
+                self.complete(err);
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            // Send it
+            BOOST_ASIO_CORO_YIELD get_channel().async_write(std::move(self));
+
+            // The server replies like to a login request
+            while (!processor_.auth_complete())
+            {
+                // Receive response
+                BOOST_ASIO_CORO_YIELD get_channel().async_read_one(
+                    get_channel().shared_sequence_number(),
+                    std::move(self)
+                );
+
+                // Process it
+                err = processor_.process_handshake_server_response(read_msg);
+                if (err)
+                {
+                    self.complete(err);
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+
+                // We received an auth switch response and we have the response ready to be sent
+                if (processor_.should_send_auth_switch_response())
+                {
+                    BOOST_ASIO_CORO_YIELD get_channel().async_write(std::move(self));
+                }
+            }
+
+            self.complete(error_code());
+        }
+    }
+};
+
+// External interface
+inline void change_user_impl(
+    channel& chan,
+    const handshake_params& params,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    err.clear();
+    diag.clear();
+
+    // Compose the request
+    handshake_processor processor(params, diag, chan);
+    err = processor.compose_change_user_request();
+    if (err)
+        return;
+
+    // Send it
+    chan.write(err);
+    if (err)
+        return;
+
+    while (!processor.auth_complete())
+    {
+        // Receive response
+        auto read_message = chan.read_one(chan.shared_sequence_number(), err);
+        if (err)
+            return;
+
+        // Process it
+        err = processor.process_handshake_server_response(read_message);
+        if (err)
+            return;
+
+        if (processor.should_send_auth_switch_response())
+        {
+            // We received an auth switch request and we have the response ready to be sent
+            chan.write(err);
+            if (err)
+                return;
+        }
+    }
+}
+
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_change_user_impl(
+    channel& chan,
+    const handshake_params& params,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return boost::asio::async_compose<CompletionToken, void(error_code)>(
+        change_user_op(params, diag, chan),
+        token,
+        chan
+    );
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
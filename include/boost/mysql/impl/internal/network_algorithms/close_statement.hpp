@@ -18,6 +18,9 @@
 #include <boost/mysql/impl/internal/protocol/protocol.hpp>
 
 #include <boost/asio/async_result.hpp>
+#include <boost/asio/compose.hpp>
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/post.hpp>
 
 namespace boost {
 namespace mysql {
@@ -25,14 +28,72 @@ namespace detail {
 
 inline void compose_close_statement(channel& chan, const statement& stmt)
 {
+    chan.param_types().erase(stmt.id());
+    chan.long_data().erase(stmt.id());
+    chan.stmt_metadata().erase(stmt.id());
     chan.serialize(close_stmt_command{stmt.id()}, chan.reset_sequence_number());
 }
 
+// Whether closing stmt doesn't require a COM_STMT_CLOSE. Statements prepared in a previous
+// session have already been deallocated by the server, and their IDs may have been reused.
+// Statements owned by the statement cache are kept open, so they can be reused.
+// If the cache has been disabled, they are removed from it and closed normally
+inline bool skip_close_statement(channel& chan, const statement& stmt)
+{
+    if (!chan.is_current_session(stmt))
+        return true;
+    auto& cache = chan.stmt_cache();
+    if (!cache.contains(stmt.id()))
+        return false;
+    if (cache.enabled())
+        return true;
+    cache.remove(stmt.id());
+    return false;
+}
+
+struct close_statement_op : boost::asio::coroutine
+{
+    channel& chan_;
+    statement stmt_;
+    diagnostics& diag_;
+
+    close_statement_op(channel& chan, const statement& stmt, diagnostics& diag) noexcept
+        : chan_(chan), stmt_(stmt), diag_(diag)
+    {
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {})
+    {
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            diag_.clear();
+
+            if (skip_close_statement(chan_, stmt_))
+            {
+                BOOST_ASIO_CORO_YIELD boost::asio::post(chan_.get_executor(), std::move(self));
+                self.complete(error_code());
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            // Serialize the close message
+            compose_close_statement(chan_, stmt_);
+
+            // Send it. No response is sent back
+            BOOST_ASIO_CORO_YIELD chan_.async_write(std::move(self));
+            self.complete(err);
+        }
+    }
+};
+
 inline void close_statement_impl(channel& chan, const statement& stmt, error_code& err, diagnostics& diag)
 {
     err.clear();
     diag.clear();
 
+    if (skip_close_statement(chan, stmt))
+        return;
+
     // Serialize the close message
     compose_close_statement(chan, stmt);
 
@@ -44,14 +105,11 @@ template <class CompletionToken>
 BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
 async_close_statement_impl(channel& chan, const statement& stmt, diagnostics& diag, CompletionToken&& token)
 {
-    // We can do this here because we know no deferred tokens reach this function (thanks to erasing)
-    diag.clear();
-
-    // Serialize the close message
-    compose_close_statement(chan, stmt);
-
-    // Send it. No response is sent back
-    return chan.async_write(std::forward<CompletionToken>(token));
+    return asio::async_compose<CompletionToken, void(error_code)>(
+        close_statement_op(chan, stmt, diag),
+        token,
+        chan
+    );
 }
 
 }  // namespace detail
@@ -0,0 +1,347 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_DEADLINE_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_DEADLINE_HPP
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/any_execution_request.hpp>
+#include <boost/mysql/detail/execution_processor/results_impl.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/execute.hpp>
+#include <boost/mysql/impl/internal/protocol/db_flavor.hpp>
+
+#include <boost/asio/associated_allocator.hpp>
+#include <boost/asio/associated_executor.hpp>
+#include <boost/asio/bind_executor.hpp>
+#include <boost/asio/compose.hpp>
+#include <boost/asio/steady_timer.hpp>
+#include <boost/mp11/integer_sequence.hpp>
+
+#include <chrono>
+#include <cstddef>
+#include <memory>
+#include <string>
+#include <tuple>
+#include <utility>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// MAX_EXECUTION_TIME optimizer hints
+inline bool is_space(char c) noexcept { return c == ' ' || (c >= '\t' && c <= '\r'); }
+
+inline bool is_identifier_char(char c) noexcept
+{
+    return (c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z') || (c >= '0' && c <= '9') || c == '_';
+}
+
+inline char ascii_to_upper(char c) noexcept { return (c >= 'a' && c <= 'z') ? static_cast<char>(c - 32) : c; }
+
+// Whether s starts with prefix at pos, ignoring case. prefix should be uppercase
+inline bool starts_with_nocase(string_view s, std::size_t pos, string_view prefix) noexcept
+{
+    if (pos + prefix.size() > s.size())
+        return false;
+    for (std::size_t i = 0; i < prefix.size(); ++i)
+    {
+        if (ascii_to_upper(s[pos + i]) != prefix[i])
+            return false;
+    }
+    return true;
+}
+
+inline bool contains_nocase(string_view s, string_view needle) noexcept
+{
+    for (std::size_t pos = 0; pos + needle.size() <= s.size(); ++pos)
+    {
+        if (starts_with_nocase(s, pos, needle))
+            return true;
+    }
+    return false;
+}
+
+inline std::size_t skip_spaces(string_view s, std::size_t pos) noexcept
+{
+    while (pos < s.size() && is_space(s[pos]))
+        ++pos;
+    return pos;
+}
+
+// The timeout, in milliseconds, rounded up
+inline std::chrono::milliseconds::rep timeout_millis(std::chrono::steady_clock::duration timeout)
+{
+    auto res = std::chrono::duration_cast<std::chrono::milliseconds>(timeout);
+    if (res < timeout)
+        ++res;
+    return res.count();
+}
+
+// If the connection is configured to do so, returns query with a MAX_EXECUTION_TIME hint
+// after the SELECT keyword. storage is used to hold the new query. Otherwise, returns query
+inline string_view add_max_execution_time_hint(const channel& chan, string_view query, std::string& storage)
+{
+    const auto& params = chan.deadlines();
+    bool enabled = params.max_execution_time_hint() &&
+                   params.timeout() > std::chrono::steady_clock::duration::zero() &&
+                   chan.flavor() == db_flavor::mysql;
+    if (!enabled)
+    {
+        return query;
+    }
+
+    // The query must start with the SELECT keyword
+    const string_view keyword = "SELECT";
+    std::size_t kw_end = skip_spaces(query, 0) + keyword.size();
+    if (!starts_with_nocase(query, kw_end - keyword.size(), keyword) ||
+        (kw_end < query.size() && is_identifier_char(query[kw_end])))
+    {
+        return query;
+    }
+
+    // Never override the user's hints
+    if (contains_nocase(query, "MAX_EXECUTION_TIME"))
+        return query;
+
+    // Only the first hint comment after the keyword is taken into account,
+    // so we add our hint to it, if present
+    std::size_t hint_pos = skip_spaces(query, kw_end);
+    bool has_hint_comment = query.substr(hint_pos, 3) == "/*+";
+
+    std::size_t insert_pos = has_hint_comment ? hint_pos + 3 : kw_end;
+    storage.assign(query.data(), insert_pos);
+    storage += has_hint_comment ? " MAX_EXECUTION_TIME(" : " /*+ MAX_EXECUTION_TIME(";
+    storage += std::to_string(timeout_millis(params.timeout()));
+    storage += has_hint_comment ? ")" : ") */";
+    storage.append(query.data() + insert_pos, query.size() - insert_pos);
+    return storage;
+}
+
+inline any_execution_request add_max_execution_time_hint(
+    const channel& chan,
+    const any_execution_request& req,
+    std::string& storage
+)
+{
+    return req.is_query ? any_execution_request(add_max_execution_time_hint(chan, req.data.query, storage))
+                        : req;
+}
+
+// State shared between an operation with a deadline, its timer and the KILL QUERY
+// issued when the deadline expires. Accessed only from the connection's executor
+struct deadline_state : std::enable_shared_from_this<deadline_state>
+{
+    channel& chan;
+    bool can_kill;                  // false for operations without a server session (e.g. connect)
+    asio::steady_timer timer;       // expires when the deadline is reached
+    asio::steady_timer kill_timer;  // cancelled when the KILL QUERY completes
+    bool op_done{false};            // the operation with the deadline has completed
+    bool expired{false};            // the deadline was reached before the operation completed
+    bool kill_in_progress{false};
+    std::string query_storage;  // the query with a MAX_EXECUTION_TIME hint, if any
+    std::string kill_query;
+    results_impl kill_result;
+    diagnostics kill_diag;
+
+    deadline_state(channel& chan, bool can_kill)
+        : chan(chan), can_kill(can_kill), timer(chan.get_executor()), kill_timer(chan.get_executor())
+    {
+    }
+
+    // Makes any outstanding I/O fail. The connection needs to be re-established after this
+    void close_stream()
+    {
+        error_code ignored;
+        chan.stream().close(ignored);
+    }
+
+    struct timer_handler
+    {
+        std::shared_ptr<deadline_state> st;
+        void operator()(error_code ec) { st->on_timer(ec); }
+    };
+
+    struct kill_handler
+    {
+        std::shared_ptr<deadline_state> st;
+        void operator()(error_code ec) { st->on_kill_finished(ec); }
+    };
+
+    void start_timer()
+    {
+        timer.expires_after(chan.deadlines().timeout());
+        timer.async_wait(timer_handler{shared_from_this()});
+    }
+
+    void on_timer(error_code ec)
+    {
+        // Cancelled, or the operation completed just before the deadline
+        if (ec || op_done)
+            return;
+        expired = true;
+
+        // Interrupt the query using the kill connection, if possible. The server will send
+        // an error for the interrupted query, which the operation will read, leaving
+        // the connection in a usable state. Otherwise, close the connection
+        channel* kill_chan = chan.kill_channel();
+        if (can_kill && kill_chan && chan.connection_id() != 0u)
+        {
+            kill_in_progress = true;
+            kill_query = "KILL QUERY " + std::to_string(chan.connection_id());
+            async_execute_impl(
+                *kill_chan,
+                any_execution_request(kill_query),
+                kill_result,
+                kill_diag,
+                asio::bind_executor(chan.get_executor(), kill_handler{shared_from_this()})
+            );
+        }
+        else
+        {
+            close_stream();
+        }
+    }
+
+    void on_kill_finished(error_code ec)
+    {
+        kill_in_progress = false;
+        kill_timer.cancel();
+
+        // If we couldn't kill the query, there is no other way to stop the operation
+        if (ec && !op_done)
+            close_stream();
+    }
+};
+
+// Completes an operation that was waiting for a KILL QUERY to finish.
+// Invokes the operation with dummy arguments, keeping the operation's associated executor and allocator
+template <class Self, class... Args>
+struct deadline_resume_handler
+{
+    Self self;
+
+    using executor_type = asio::associated_executor_t<Self>;
+    using allocator_type = asio::associated_allocator_t<Self>;
+    executor_type get_executor() const noexcept { return asio::get_associated_executor(self); }
+    allocator_type get_allocator() const noexcept { return asio::get_associated_allocator(self); }
+
+    void operator()(error_code) { self(error_code(), Args()...); }
+};
+
+// Runs an operation, enforcing the connection's deadline. Initiator is a callable that launches
+// the actual operation when invoked with a completion token. Args are the operation's
+// completion arguments, excluding the error code
+template <class Initiator, class... Args>
+struct deadline_op
+{
+    std::shared_ptr<deadline_state> st_;
+    Initiator initiator_;
+    bool waiting_kill_{false};
+    error_code err_;
+    std::tuple<Args...> result_;
+
+    deadline_op(std::shared_ptr<deadline_state> st, Initiator initiator)
+        : st_(std::move(st)), initiator_(std::move(initiator))
+    {
+    }
+
+    template <class Self>
+    void operator()(Self& self)
+    {
+        st_->start_timer();
+        initiator_(std::move(self));
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err, Args... args)
+    {
+        if (!waiting_kill_)
+        {
+            st_->op_done = true;
+            st_->timer.cancel();
+            err_ = (err && st_->expired) ? make_error_code(client_errc::deadline_exceeded) : err;
+            result_ = std::tuple<Args...>(std::move(args)...);
+
+            // Don't complete until the KILL QUERY is done, so it can't interfere
+            // with subsequent operations, and the kill connection can be reused
+            if (st_->kill_in_progress)
+            {
+                waiting_kill_ = true;
+                st_->kill_timer.expires_at(asio::steady_timer::time_point::max());
+                st_->kill_timer.async_wait(deadline_resume_handler<Self, Args...>{std::move(self)});
+                return;
+            }
+        }
+        complete(self, mp11::index_sequence_for<Args...>());
+    }
+
+    template <class Self, std::size_t... I>
+    void complete(Self& self, mp11::index_sequence<I...>)
+    {
+        self.complete(err_, std::move(std::get<I>(result_))...);
+    }
+};
+
+// Returns the state required to run an operation with a deadline,
+// or nullptr if the connection doesn't have deadlines enabled
+inline std::shared_ptr<deadline_state> make_deadline_state(channel& chan, bool can_kill)
+{
+    if (chan.deadlines().timeout() <= std::chrono::steady_clock::duration::zero())
+        return nullptr;
+    return std::make_shared<deadline_state>(chan, can_kill);
+}
+
+// An initiator that wraps the operation launched by Initiator with deadline_op.
+// If st is nullptr, launches the operation directly, so there is no overhead
+template <class Signature, class Initiator>
+struct deadline_initiator;
+
+template <class Initiator, class... Args>
+struct deadline_initiator<void(error_code, Args...), Initiator>
+{
+    std::shared_ptr<deadline_state> st;
+    Initiator initiator;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        if (st)
+        {
+            channel& chan = st->chan;
+            asio::async_compose<Handler, void(error_code, Args...)>(
+                deadline_op<Initiator, Args...>(std::move(st), std::move(initiator)),
+                handler,
+                chan
+            );
+        }
+        else
+        {
+            initiator(std::forward<Handler>(handler));
+        }
+    }
+};
+
+template <class Signature, class Initiator>
+deadline_initiator<Signature, Initiator> with_deadline(
+    std::shared_ptr<deadline_state> st,
+    Initiator initiator
+)
+{
+    return {std::move(st), std::move(initiator)};
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
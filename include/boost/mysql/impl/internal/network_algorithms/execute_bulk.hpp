@@ -0,0 +1,284 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_EXECUTE_BULK_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_EXECUTE_BULK_HPP
+
+#include <boost/mysql/bulk_execution_result.hpp>
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/field_kind.hpp>
+#include <boost/mysql/field_view.hpp>
+
+#include <boost/mysql/detail/any_execution_request.hpp>
+#include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/execution_processor/results_impl.hpp>
+#include <boost/mysql/detail/network_algorithms.hpp>
+#include <boost/mysql/detail/resultset_encoding.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/execute.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/read_resultset_head.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/read_some_rows.hpp>
+#include <boost/mysql/impl/internal/protocol/capabilities.hpp>
+#include <boost/mysql/impl/internal/protocol/db_flavor.hpp>
+#include <boost/mysql/impl/internal/protocol/protocol.hpp>
+
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/post.hpp>
+#include <boost/core/span.hpp>
+
+#include <cstddef>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// COM_STMT_BULK_EXECUTE sends a single type for each parameter, so all non-NULL
+// values passed for a parameter must have the same kind
+inline bool has_uniform_param_kinds(span<const field_view> params, std::size_t num_params) noexcept
+{
+    for (std::size_t col = 0; col < num_params; ++col)
+    {
+        field_kind kind = field_kind::null;
+        for (std::size_t i = col; i < params.size(); i += num_params)
+        {
+            field_kind current = params[i].kind();
+            if (current == field_kind::null)
+                continue;
+            else if (kind == field_kind::null)
+                kind = current;
+            else if (current != kind)
+                return false;
+        }
+    }
+    return true;
+}
+
+// Whether the request can be run with a single COM_STMT_BULK_EXECUTE.
+// Otherwise, we issue a COM_STMT_EXECUTE per row
+inline bool use_bulk_command(const channel& chan, const bulk_execution_request& req) noexcept
+{
+    std::size_t num_params = req.stmt.num_params();
+    return chan.flavor() == db_flavor::mariadb &&
+           chan.mariadb_capabilities().has(MARIADB_CLIENT_STMT_BULK_OPERATIONS) && num_params > 0u &&
+           has_uniform_param_kinds(req.params, num_params);
+}
+
+inline error_code check_client_errors(const channel& chan, const bulk_execution_request& req) noexcept
+{
+    if (!chan.is_current_session(req.stmt))
+        return client_errc::stale_statement;
+    // COM_STMT_BULK_EXECUTE can't omit parameters, and falling back to COM_STMT_EXECUTE
+    // would use the pending values for the first row only
+    if (chan.long_data().has_pending(req.stmt.id()))
+        return client_errc::pending_long_data;
+    return req.params.size() == req.num_rows * req.stmt.num_params() ? error_code()
+                                                                      : client_errc::wrong_num_params;
+}
+
+inline span<const field_view> get_row_params(const bulk_execution_request& req, std::size_t row) noexcept
+{
+    std::size_t num_params = req.stmt.num_params();
+    return req.params.subspan(row * num_params, num_params);
+}
+
+// The response to COM_STMT_BULK_EXECUTE is read like the one to COM_STMT_EXECUTE
+inline void serialize_bulk_request(
+    channel& chan,
+    const bulk_execution_request& req,
+    execution_processor& proc
+)
+{
+    proc.reset(resultset_encoding::binary, chan.meta_mode());
+    proc.on_statement_execution(req.stmt.id());
+
+    // The server stores the types we send, which may not match the ones in param_types()
+    chan.param_types().erase(req.stmt.id());
+    chan.serialize(
+        execute_stmt_bulk_command{req.stmt.id(), req.params, req.stmt.num_params()},
+        chan.reset_sequence_number(proc.sequence_number())
+    );
+}
+
+// Adds the outcome of an execution to the result. Used for the bulk command,
+// and for each row when falling back to COM_STMT_EXECUTE
+inline void accumulate_bulk_result(bulk_execution_result& result, const results_impl& row_result) noexcept
+{
+    std::size_t last = row_result.num_resultsets() - 1u;
+    result.affected_rows += row_result.get_affected_rows(last);
+    if (result.last_insert_id == 0u)
+        result.last_insert_id = row_result.get_last_insert_id(last);
+    result.warning_count += row_result.get_warning_count(last);
+}
+
+struct execute_bulk_op : boost::asio::coroutine
+{
+    channel& chan_;
+    bulk_execution_request req_;
+    bulk_execution_result& result_;
+    diagnostics& diag_;
+    results_impl row_result_;
+    std::size_t current_row_{};
+    error_code client_err_;  // keep it across posts
+
+    execute_bulk_op(
+        channel& chan,
+        const bulk_execution_request& req,
+        bulk_execution_result& result,
+        diagnostics& diag
+    )
+        : chan_(chan), req_(req), result_(result), diag_(diag)
+    {
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {}, std::size_t = 0)
+    {
+        // Error checking
+        if (err)
+        {
+            self.complete(err);
+            return;
+        }
+
+        // Normal path
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            diag_.clear();
+            result_ = bulk_execution_result();
+
+            // Check for errors
+            client_err_ = check_client_errors(chan_, req_);
+            if (client_err_ || req_.num_rows == 0u)
+            {
+                BOOST_ASIO_CORO_YIELD boost::asio::post(chan_.get_executor(), std::move(self));
+                self.complete(client_err_);
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            if (use_bulk_command(chan_, req_))
+            {
+                // All rows are sent in a single message
+                serialize_bulk_request(chan_, req_, row_result_);
+                BOOST_ASIO_CORO_YIELD chan_.async_write(std::move(self));
+
+                // Read the response. Statements like INSERT ... RETURNING send a resultset,
+                // which must be read entirely to keep the connection usable. Rows are discarded
+                while (!row_result_.is_complete())
+                {
+                    if (row_result_.is_reading_head())
+                    {
+                        BOOST_ASIO_CORO_YIELD
+                        async_read_resultset_head_impl(chan_, row_result_, diag_, std::move(self));
+                    }
+                    else if (row_result_.is_reading_rows())
+                    {
+                        BOOST_ASIO_CORO_YIELD
+                        async_read_some_rows_impl(chan_, row_result_, output_ref(), diag_, std::move(self));
+                    }
+                }
+                accumulate_bulk_result(result_, row_result_);
+                self.complete(error_code());
+            }
+            else
+            {
+                // Execute the statement once per row
+                for (; current_row_ < req_.num_rows; ++current_row_)
+                {
+                    BOOST_ASIO_CORO_YIELD async_execute_impl(
+                        chan_,
+                        any_execution_request(req_.stmt, get_row_params(req_, current_row_)),
+                        row_result_,
+                        diag_,
+                        std::move(self)
+                    );
+                    accumulate_bulk_result(result_, row_result_);
+                }
+                self.complete(error_code());
+            }
+        }
+    }
+};
+
+inline void execute_bulk_impl(
+    channel& chan,
+    const bulk_execution_request& req,
+    bulk_execution_result& result,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    err.clear();
+    diag.clear();
+    result = bulk_execution_result();
+
+    // Check for errors
+    err = check_client_errors(chan, req);
+    if (err || req.num_rows == 0u)
+        return;
+
+    if (use_bulk_command(chan, req))
+    {
+        // All rows are sent in a single message
+        results_impl response;
+        serialize_bulk_request(chan, req, response);
+        chan.write(err);
+        if (err)
+            return;
+
+        // Read the response. Statements like INSERT ... RETURNING send a resultset,
+        // which must be read entirely to keep the connection usable. Rows are discarded
+        while (!response.is_complete())
+        {
+            if (response.is_reading_head())
+                read_resultset_head_impl(chan, response, err, diag);
+            else if (response.is_reading_rows())
+                read_some_rows_impl(chan, response, output_ref(), err, diag);
+            if (err)
+                return;
+        }
+        accumulate_bulk_result(result, response);
+    }
+    else
+    {
+        // Execute the statement once per row
+        results_impl row_result;
+        for (std::size_t i = 0; i < req.num_rows; ++i)
+        {
+            any_execution_request row_req(req.stmt, get_row_params(req, i));
+            execute_impl(chan, row_req, row_result, err, diag);
+            if (err)
+                return;
+            accumulate_bulk_result(result, row_result);
+        }
+    }
+}
+
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_execute_bulk_impl(
+    channel& chan,
+    const bulk_execution_request& req,
+    bulk_execution_result& result,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return asio::async_compose<CompletionToken, void(error_code)>(
+        execute_bulk_op(chan, req, result, diag),
+        token,
+        chan
+    );
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -0,0 +1,343 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_EXECUTE_PIPELINE_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_EXECUTE_PIPELINE_HPP
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_categories.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/pipeline.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/execution_processor/execution_processor.hpp>
+#include <boost/mysql/detail/resultset_encoding.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/read_resultset_head.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/read_some_rows.hpp>
+
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/post.hpp>
+
+#include <cstddef>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Errors reported by the server (through an error packet) leave the connection
+// in a consistent state, so the next pipeline stage can be processed
+inline bool is_server_error(const error_code& err) noexcept
+{
+    const auto& cat = err.category();
+    return cat == get_common_server_category() || cat == get_mysql_server_category() ||
+           cat == get_mariadb_server_category();
+}
+
+inline execution_processor& get_processor(pipeline_response_item& item) noexcept
+{
+    return access::get_impl(item.result).get_interface();
+}
+
+// Fatal errors make it impossible to read any further response
+inline void pipeline_fail(
+    std::vector<pipeline_response_item>& res,
+    std::size_t first,
+    error_code err,
+    const diagnostics& diag
+)
+{
+    for (std::size_t i = first; i < res.size(); ++i)
+    {
+        if (!res[i].err)
+        {
+            res[i].err = err;
+            res[i].diag = diag;
+        }
+    }
+}
+
+// Pipeline requests are serialized in advance, including all parameter values, so
+// statements with values pending from send_long_data can't be executed
+inline error_code check_long_data(const channel& chan, const pipeline_request_impl& req)
+{
+    for (const auto& stage : req.stages)
+    {
+        if (!stage.err && stage.encoding == resultset_encoding::binary &&
+            chan.long_data().has_pending(stage.stmt_id))
+            return client_errc::pending_long_data;
+    }
+    return error_code();
+}
+
+// Prepares the response items and the channel write buffer. Returns whether there is anything to send.
+// If the pipeline can't be executed, err is set, all the items report it, and nothing is sent
+inline bool pipeline_setup(
+    channel& chan,
+    const pipeline_request_impl& req,
+    std::vector<pipeline_response_item>& res,
+    error_code& err
+)
+{
+    res.resize(req.stages.size());
+    for (std::size_t i = 0; i < req.stages.size(); ++i)
+    {
+        const auto& stage = req.stages[i];
+        auto& item = res[i];
+        item.err = stage.err;
+        item.diag.clear();
+        auto& proc = get_processor(item);
+        proc.reset(stage.encoding, chan.meta_mode());
+        proc.sequence_number() = stage.seqnum;
+        if (stage.encoding == resultset_encoding::binary)
+            proc.on_statement_execution(stage.stmt_id);
+    }
+
+    err = check_long_data(chan, req);
+    if (err)
+    {
+        pipeline_fail(res, 0, err, diagnostics());
+        return false;
+    }
+
+    // The pipeline sends parameter types for any statement it executes, and
+    // the executions may fail, so we no longer know the types bound by the server
+    chan.param_types().clear();
+    chan.serialize_framed(req.buffer, req.request_offsets);
+    return !req.buffer.empty();
+}
+
+// Reads the entire response to an execution request, including all resultsets
+struct read_execution_response_op : boost::asio::coroutine
+{
+    channel& chan_;
+    execution_processor& proc_;
+    diagnostics& diag_;
+
+    read_execution_response_op(channel& chan, execution_processor& proc, diagnostics& diag) noexcept
+        : chan_(chan), proc_(proc), diag_(diag)
+    {
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {}, std::size_t = 0)
+    {
+        // Error checking
+        if (err)
+        {
+            self.complete(err);
+            return;
+        }
+
+        // Normal path
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            while (!proc_.is_complete())
+            {
+                if (proc_.is_reading_head())
+                {
+                    BOOST_ASIO_CORO_YIELD
+                    async_read_resultset_head_impl(chan_, proc_, diag_, std::move(self));
+                }
+                else if (proc_.is_reading_rows())
+                {
+                    BOOST_ASIO_CORO_YIELD
+                    async_read_some_rows_impl(chan_, proc_, output_ref(), diag_, std::move(self));
+                }
+            }
+
+            self.complete(error_code());
+        }
+    }
+};
+
+inline void read_execution_response_impl(
+    channel& chan,
+    execution_processor& proc,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    while (!proc.is_complete())
+    {
+        if (proc.is_reading_head())
+        {
+            read_resultset_head_impl(chan, proc, err, diag);
+            if (err)
+                return;
+        }
+        else if (proc.is_reading_rows())
+        {
+            read_some_rows_impl(chan, proc, output_ref(), err, diag);
+            if (err)
+                return;
+        }
+    }
+}
+
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_read_execution_response_impl(
+    channel& chan,
+    execution_processor& proc,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return asio::async_compose<CompletionToken, void(error_code)>(
+        read_execution_response_op(chan, proc, diag),
+        token,
+        chan
+    );
+}
+
+struct execute_pipeline_op : boost::asio::coroutine
+{
+    channel& chan_;
+    const pipeline_request_impl& req_;
+    std::vector<pipeline_response_item>& res_;
+    diagnostics& diag_;
+    std::size_t current_{0};
+    error_code client_err_;  // keep it across posts
+
+    execute_pipeline_op(
+        channel& chan,
+        const pipeline_request_impl& req,
+        std::vector<pipeline_response_item>& res,
+        diagnostics& diag
+    ) noexcept
+        : chan_(chan), req_(req), res_(res), diag_(diag)
+    {
+    }
+
+    template <class Self>
+    void complete_fatal(Self& self, error_code err)
+    {
+        pipeline_fail(res_, current_, err, diag_);
+        self.complete(err);
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {}, std::size_t = 0)
+    {
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            diag_.clear();
+
+            // Setup. If all requests had client errors, there is nothing to send
+            if (!pipeline_setup(chan_, req_, res_, client_err_))
+            {
+                BOOST_ASIO_CORO_YIELD boost::asio::post(chan_.get_executor(), std::move(self));
+                self.complete(client_err_);
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            // Send all the requests at once
+            BOOST_ASIO_CORO_YIELD chan_.async_write(std::move(self));
+            if (err)
+            {
+                complete_fatal(self, err);
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            // Read the responses, in order
+            for (; current_ < res_.size(); ++current_)
+            {
+                if (res_[current_].err)
+                    continue;
+
+                BOOST_ASIO_CORO_YIELD async_read_execution_response_impl(
+                    chan_,
+                    get_processor(res_[current_]),
+                    res_[current_].diag,
+                    std::move(self)
+                );
+                if (err)
+                {
+                    res_[current_].err = err;
+                    if (!is_server_error(err))
+                    {
+                        diag_ = res_[current_].diag;
+                        complete_fatal(self, err);
+                        BOOST_ASIO_CORO_YIELD break;
+                    }
+                }
+            }
+
+            self.complete(error_code());
+        }
+    }
+};
+
+// External interface
+inline void execute_pipeline_impl(
+    channel& chan,
+    const pipeline_request_impl& req,
+    std::vector<pipeline_response_item>& res,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    err.clear();
+    diag.clear();
+
+    // Setup. If all requests had client errors, there is nothing to send
+    if (!pipeline_setup(chan, req, res, err))
+        return;
+
+    // Send all the requests at once
+    chan.write(err);
+    if (err)
+    {
+        pipeline_fail(res, 0, err, diag);
+        return;
+    }
+
+    // Read the responses, in order
+    for (std::size_t i = 0; i < res.size(); ++i)
+    {
+        auto& item = res[i];
+        if (item.err)
+            continue;
+
+        read_execution_response_impl(chan, get_processor(item), item.err, item.diag);
+        if (item.err && !is_server_error(item.err))
+        {
+            err = item.err;
+            diag = item.diag;
+            pipeline_fail(res, i + 1, err, diag);
+            return;
+        }
+    }
+}
+
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_execute_pipeline_impl(
+    channel& chan,
+    const pipeline_request_impl& req,
+    std::vector<pipeline_response_item>& res,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return asio::async_compose<CompletionToken, void(error_code)>(
+        execute_pipeline_op(chan, req, res, diag),
+        token,
+        chan
+    );
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
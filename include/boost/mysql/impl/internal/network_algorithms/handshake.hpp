@@ -12,11 +12,14 @@
 #include <boost/mysql/diagnostics.hpp>
 #include <boost/mysql/error_code.hpp>
 #include <boost/mysql/handshake_params.hpp>
+#include <boost/mysql/ssl_session_cache.hpp>
 
+#include <boost/mysql/detail/access.hpp>
 #include <boost/mysql/detail/config.hpp>
 
 #include <boost/mysql/impl/internal/auth/auth.hpp>
 #include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/channel/compressed_stream.hpp>
 #include <boost/mysql/impl/internal/protocol/capabilities.hpp>
 #include <boost/mysql/impl/internal/protocol/protocol.hpp>
 
@@ -57,7 +60,9 @@ inline error_code process_capabilities(
     }
     negotiated_caps = server_caps &
                       (required_caps | optional_capabilities |
-                       conditional_capability(ssl == ssl_mode::enable && is_ssl_stream, CLIENT_SSL));
+                       conditional_capability(ssl == ssl_mode::enable && is_ssl_stream, CLIENT_SSL) |
+                       conditional_capability(params.local_infile(), CLIENT_LOCAL_FILES) |
+                       compression_capabilities(params.compression(), server_caps));
     return error_code();
 }
 
@@ -97,6 +102,20 @@ public:
     // Once the handshake is processed, the capabilities are stored in the channel
     bool use_ssl() const noexcept { return channel_.current_capabilities().has(CLIENT_SSL); }
 
+    // TLS session resumption
+    ssl_session_cache_impl* ssl_sessions() const noexcept
+    {
+        return params_.ssl_sessions() ? &access::get_impl(*params_.ssl_sessions()) : nullptr;
+    }
+
+    // Stores the negotiated TLS session, if required. Done after authentication, since
+    // TLS 1.3 servers send session tickets after the TLS handshake is complete
+    void store_ssl_session()
+    {
+        if (use_ssl() && params_.ssl_sessions())
+            channel_.stream().store_ssl_session(access::get_impl(*params_.ssl_sessions()));
+    }
+
     // Initial greeting processing
     error_code process_handshake(span<const std::uint8_t> buffer, bool is_ssl_stream)
     {
@@ -114,7 +133,12 @@ public:
 
         // Set capabilities & db flavor
         channel_.set_current_capabilities(negotiated_caps);
+        channel_.set_mariadb_capabilities(hello.mariadb_capabilities & mariadb_optional_capabilities);
         channel_.set_flavor(hello.server);
+        channel_.set_connection_id(hello.connection_id);
+
+        // Required to re-authenticate using COM_CHANGE_USER
+        channel_.set_auth_challenge(hello.auth_plugin_name, hello.auth_plugin_data.to_span());
 
         // Compute auth response
         return compute_auth_response(
@@ -133,6 +157,7 @@ public:
             channel_.current_capabilities(),
             static_cast<std::uint32_t>(MAX_PACKET_SIZE),
             params_.connection_collation(),
+            channel_.mariadb_capabilities(),
         };
         channel_.serialize(sslreq, channel_.shared_sequence_number());
     }
@@ -148,12 +173,41 @@ public:
             auth_resp_.data,
             params_.database(),
             auth_resp_.plugin_name,
+            zstd_compression_level,
+            channel_.mariadb_capabilities(),
         };
 
         // Serialize
         channel_.serialize(response, channel_.shared_sequence_number());
     }
 
+    // COM_CHANGE_USER. Uses the challenge sent by the server in the initial greeting.
+    // The server discards the session state, including prepared statements
+    error_code compose_change_user_request()
+    {
+        auto err = compute_auth_response(
+            channel_.auth_plugin_name(),
+            params_.password(),
+            channel_.auth_challenge(),
+            use_ssl(),
+            auth_resp_
+        );
+        if (err)
+            return err;
+
+        change_user_command cmd{
+            params_.username(),
+            auth_resp_.data,
+            params_.database(),
+            params_.connection_collation(),
+            auth_resp_.plugin_name,
+        };
+        channel_.serialize(cmd, channel_.reset_sequence_number());
+        channel_.end_session();
+        auth_state_ = auth_state::send_more_data;
+        return error_code();
+    }
+
     // Server handshake response
     error_code process_handshake_server_response(span<const std::uint8_t> msg)
     {
@@ -164,8 +218,11 @@ public:
         switch (response.type)
         {
         case handhake_server_response::type_t::ok:
-            // Auth success
+            // Auth success. If negotiated, compression is used from now on.
+            // COM_CHANGE_USER doesn't renegotiate compression, so it must be left untouched
             auth_state_ = auth_state::complete;
+            if (channel_.compression() == compression_algorithm::none)
+                channel_.set_compression(get_compression_algorithm(channel_.current_capabilities()));
             return error_code();
         case handhake_server_response::type_t::error: return response.data.err;
         case handhake_server_response::type_t::auth_switch:
@@ -265,7 +322,10 @@ struct handshake_op : boost::asio::coroutine
                 BOOST_ASIO_CORO_YIELD get_channel().async_write(std::move(self));
 
                 // SSL handshake
-                BOOST_ASIO_CORO_YIELD get_channel().stream().async_handshake(std::move(self));
+                BOOST_ASIO_CORO_YIELD get_channel().stream().async_handshake(
+                    processor_.ssl_sessions(),
+                    std::move(self)
+                );
             }
 
             // Compose and send handshake response
@@ -295,6 +355,7 @@ struct handshake_op : boost::asio::coroutine
                 }
             }
 
+            processor_.store_ssl_session();
             self.complete(error_code());
         }
     }
@@ -335,7 +396,7 @@ inline void handshake_impl(
             return;
 
         // SSL handshake
-        channel.stream().handshake(err);
+        channel.stream().handshake(processor.ssl_sessions(), err);
         if (err)
             return;
     }
@@ -366,6 +427,8 @@ inline void handshake_impl(
                 return;
         }
     };
+
+    processor.store_ssl_session();
 }
 
 template <class CompletionToken>
@@ -0,0 +1,301 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_LOAD_DATA_LOCAL_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_LOAD_DATA_LOCAL_HPP
+
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/any_load_data_source.hpp>
+#include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/execution_processor/execution_processor.hpp>
+#include <boost/mysql/detail/resultset_encoding.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/read_resultset_head.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/read_some_rows.hpp>
+#include <boost/mysql/impl/internal/protocol/protocol.hpp>
+
+#include <boost/asio/buffer.hpp>
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/error.hpp>
+
+#include <cstddef>
+#include <memory>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Size of the chunks we read from the source. Each chunk is sent as a separate message
+constexpr std::size_t local_infile_chunk_size = 0x10000;
+
+inline void load_data_local_setup(channel& chan, string_view query, execution_processor& proc)
+{
+    proc.reset(resultset_encoding::text, chan.meta_mode());
+    chan.serialize(query_command{query}, chan.reset_sequence_number(proc.sequence_number()));
+}
+
+// Gets a buffer where the next chunk should be read into
+inline asio::mutable_buffer prepare_chunk(channel& chan)
+{
+    auto buff = chan.prepare_raw(local_infile_chunk_size);
+    return asio::buffer(buff.data(), buff.size());
+}
+
+// Sets up the next chunk to be written, given the result of reading from the source.
+// On error, or at the end of the data, an empty message is set up, which tells the server we're done.
+// Returns whether there is more data to send after this message.
+inline bool load_data_local_on_chunk_read(
+    channel& chan,
+    execution_processor& proc,
+    error_code source_err,
+    std::size_t bytes_read,
+    error_code& stored_source_err
+)
+{
+    if (source_err == asio::error::eof)
+        source_err = error_code();
+    if (source_err)
+    {
+        stored_source_err = source_err;
+        bytes_read = 0;
+    }
+    chan.serialize_raw(bytes_read, proc.sequence_number());
+    return bytes_read != 0;
+}
+
+struct load_data_local_op : boost::asio::coroutine
+{
+    channel& chan_;
+    string_view query_;
+    std::unique_ptr<any_load_data_source> source_owner_;
+    any_load_data_source& source_;  // a reference, so it's not affected by the op being moved
+    execution_processor& proc_;
+    diagnostics& diag_;
+    span<const std::uint8_t> response_;
+    error_code source_err_;
+    bool is_infile_request_{false};
+    bool reading_source_{false};
+    bool has_more_{true};
+
+    load_data_local_op(
+        channel& chan,
+        string_view query,
+        std::unique_ptr<any_load_data_source> source,
+        execution_processor& proc,
+        diagnostics& diag
+    ) noexcept
+        : chan_(chan),
+          query_(query),
+          source_owner_(std::move(source)),
+          source_(*source_owner_),
+          proc_(proc),
+          diag_(diag)
+    {
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err, span<const std::uint8_t> msg)
+    {
+        response_ = msg;
+        (*this)(self, err);
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {}, std::size_t bytes = 0)
+    {
+        // Error checking. Errors reading from the source don't abort the operation,
+        // since we must still tell the server that we're done. Errors talking to the server
+        // take precedence over source errors, since they may leave the connection unusable
+        if (err && !reading_source_)
+        {
+            self.complete(err);
+            return;
+        }
+
+        // Non-error path
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            diag_.clear();
+
+            // Send the query
+            load_data_local_setup(chan_, query_, proc_);
+            BOOST_ASIO_CORO_YIELD chan_.async_write(std::move(self));
+
+            // Read the response, which should be a request to send the file contents.
+            // It may also be a regular response (e.g. if the query wasn't a LOAD DATA statement)
+            BOOST_ASIO_CORO_YIELD chan_.async_read_one(proc_.sequence_number(), std::move(self));
+            {
+                auto response = deserialize_execute_response(chan_, response_, diag_);
+                is_infile_request_ = response.type == execute_response::type_t::local_infile;
+                if (!is_infile_request_)
+                    err = process_execution_response(chan_, proc_, response, diag_);
+            }
+            if (err)
+            {
+                self.complete(err);
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            if (is_infile_request_)
+            {
+                // Send the data, a chunk at a time
+                while (has_more_)
+                {
+                    if (source_.is_async())
+                    {
+                        reading_source_ = true;
+                        BOOST_ASIO_CORO_YIELD source_.async_read_some(prepare_chunk(chan_), std::move(self));
+                        reading_source_ = false;
+                    }
+                    else
+                    {
+                        bytes = source_.read_some(prepare_chunk(chan_), err);
+                    }
+                    has_more_ = load_data_local_on_chunk_read(chan_, proc_, err, bytes, source_err_);
+                    BOOST_ASIO_CORO_YIELD chan_.async_write(std::move(self));
+                }
+            }
+            else
+            {
+                // Read all of the field definitions
+                while (proc_.is_reading_meta())
+                {
+                    if (!chan_.has_read_messages())
+                    {
+                        BOOST_ASIO_CORO_YIELD chan_.async_read_some(std::move(self));
+                    }
+                    err = process_field_definition(chan_, proc_, diag_);
+                    if (err)
+                    {
+                        self.complete(err);
+                        BOOST_ASIO_CORO_YIELD break;
+                    }
+                }
+            }
+
+            // Read the server's response to the transfer, and anything else the query may have returned
+            while (!proc_.is_complete())
+            {
+                if (proc_.is_reading_head())
+                {
+                    BOOST_ASIO_CORO_YIELD
+                    async_read_resultset_head_impl(chan_, proc_, diag_, std::move(self));
+                }
+                else if (proc_.is_reading_rows())
+                {
+                    BOOST_ASIO_CORO_YIELD
+                    async_read_some_rows_impl(chan_, proc_, output_ref(), diag_, std::move(self));
+                }
+            }
+
+            self.complete(source_err_);
+        }
+    }
+};
+
+// External interface
+inline void load_data_local_impl(
+    channel& chan,
+    string_view query,
+    any_load_data_source& source,
+    execution_processor& proc,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    err.clear();
+    diag.clear();
+    error_code source_err;
+
+    // Send the query
+    load_data_local_setup(chan, query, proc);
+    chan.write(err);
+    if (err)
+        return;
+
+    // Read the response
+    auto msg = chan.read_one(proc.sequence_number(), err);
+    if (err)
+        return;
+    auto response = deserialize_execute_response(chan, msg, diag);
+    if (response.type == execute_response::type_t::local_infile)
+    {
+        // Send the data, a chunk at a time
+        bool has_more = true;
+        while (has_more)
+        {
+            error_code read_err;
+            std::size_t bytes = source.read_some(prepare_chunk(chan), read_err);
+            has_more = load_data_local_on_chunk_read(chan, proc, read_err, bytes, source_err);
+            chan.write(err);
+            if (err)
+                return;
+        }
+    }
+    else
+    {
+        err = process_execution_response(chan, proc, response, diag);
+        if (err)
+            return;
+
+        // Read all of the field definitions
+        while (proc.is_reading_meta())
+        {
+            if (!chan.has_read_messages())
+            {
+                chan.read_some(err);
+                if (err)
+                    return;
+            }
+            err = process_field_definition(chan, proc, diag);
+            if (err)
+                return;
+        }
+    }
+
+    // Read the server's response to the transfer, and anything else the query may have returned
+    while (!proc.is_complete())
+    {
+        if (proc.is_reading_head())
+            read_resultset_head_impl(chan, proc, err, diag);
+        else if (proc.is_reading_rows())
+            read_some_rows_impl(chan, proc, output_ref(), err, diag);
+        if (err)
+            return;
+    }
+
+    // Source errors are only reported if the exchange with the server succeeded
+    err = source_err;
+}
+
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_load_data_local_impl(
+    channel& chan,
+    string_view query,
+    std::unique_ptr<any_load_data_source> source,
+    execution_processor& proc,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return asio::async_compose<CompletionToken, void(error_code)>(
+        load_data_local_op(chan, query, std::move(source), proc, diag),
+        token,
+        chan
+    );
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
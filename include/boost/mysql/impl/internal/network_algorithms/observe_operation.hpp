@@ -0,0 +1,135 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_OBSERVE_OPERATION_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_OBSERVE_OPERATION_HPP
+
+#include <boost/mysql/connection_observer.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/statement.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/any_execution_request.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+
+#include <boost/asio/compose.hpp>
+
+#include <utility>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Helpers to create operation_info objects
+inline operation_info make_operation_info(operation_type type) noexcept
+{
+    operation_info res{};
+    res.type = type;
+    return res;
+}
+
+inline operation_info make_operation_info(operation_type type, string_view query) noexcept
+{
+    operation_info res{};
+    res.type = type;
+    res.query = query;
+    return res;
+}
+
+inline operation_info make_operation_info(operation_type type, const statement& stmt) noexcept
+{
+    operation_info res{};
+    res.type = type;
+    res.statement_id = stmt.valid() ? stmt.id() : 0u;
+    return res;
+}
+
+inline operation_info make_operation_info(operation_type type, const any_execution_request& req) noexcept
+{
+    return req.is_query ? make_operation_info(type, req.data.query)
+                        : make_operation_info(type, req.data.stmt.stmt);
+}
+
+// Notifications for sync operations
+inline void notify_operation_start(channel& chan, const operation_info& info)
+{
+    if (auto* obs = chan.observer())
+        obs->on_operation_start(info);
+}
+
+inline void notify_operation_finish(channel& chan, operation_info info, error_code err)
+{
+    if (auto* obs = chan.observer())
+    {
+        info.query = string_view();
+        obs->on_operation_finish(info, err);
+    }
+}
+
+// Wraps an async operation, notifying the observer when it starts and finishes.
+// Initiator is a callable that launches the actual operation when invoked with a completion token.
+// The query in operation_info may point to memory that doesn't outlive initiation,
+// so it's not reported on finish
+template <class Initiator>
+struct observed_op
+{
+    channel& chan_;
+    operation_info info_;
+    Initiator initiator_;
+
+    observed_op(channel& chan, const operation_info& info, Initiator initiator)
+        : chan_(chan), info_(info), initiator_(std::move(initiator))
+    {
+    }
+
+    template <class Self>
+    void operator()(Self& self)
+    {
+        chan_.observer()->on_operation_start(info_);
+        info_.query = string_view();
+        initiator_(std::move(self));
+    }
+
+    template <class Self, class... Args>
+    void operator()(Self& self, error_code err, Args... args)
+    {
+        if (auto* obs = chan_.observer())
+            obs->on_operation_finish(info_, err);
+        self.complete(err, std::move(args)...);
+    }
+};
+
+// If the channel has an observer, wraps the operation launched by initiator using observed_op.
+// Otherwise, launches it directly, so there is no overhead
+template <class Signature, class Initiator, class Handler>
+void async_observe_operation(
+    channel& chan,
+    const operation_info& info,
+    Initiator initiator,
+    Handler&& handler
+)
+{
+    if (chan.observer())
+    {
+        asio::async_compose<Handler, Signature>(
+            observed_op<Initiator>(chan, info, std::move(initiator)),
+            handler,
+            chan
+        );
+    }
+    else
+    {
+        initiator(std::forward<Handler>(handler));
+    }
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -8,6 +8,7 @@
 #ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_PREPARE_STATEMENT_HPP
 #define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_PREPARE_STATEMENT_HPP
 
+#include <boost/mysql/common_server_errc.hpp>
 #include <boost/mysql/diagnostics.hpp>
 #include <boost/mysql/error_code.hpp>
 #include <boost/mysql/statement.hpp>
@@ -17,9 +18,15 @@
 #include <boost/mysql/detail/config.hpp>
 
 #include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/channel/message_writer.hpp>
+#include <boost/mysql/impl/internal/protocol/capabilities.hpp>
 #include <boost/mysql/impl/internal/protocol/protocol.hpp>
 
+#include <boost/asio/post.hpp>
+
+#include <cstddef>
 #include <cstdint>
+#include <vector>
 
 namespace boost {
 namespace mysql {
@@ -31,7 +38,8 @@ class prepare_statement_processor
     string_view stmt_sql_;
     diagnostics& diag_;
     statement res_;
-    unsigned remaining_meta_{};
+    unsigned remaining_params_{};
+    unsigned remaining_columns_{};
 
 public:
     prepare_statement_processor(channel& chan, string_view stmt_sql, diagnostics& diag) noexcept
@@ -41,23 +49,116 @@ public:
 
     void clear_diag() noexcept { diag_.clear(); }
 
+    // If the statement cache is enabled and holds the statement, sets it as the result and returns true
+    bool lookup_cache()
+    {
+        auto& cache = channel_.stmt_cache();
+        if (cache.enabled())
+            res_ = cache.find(stmt_sql_);
+        return res_.valid();
+    }
+
     void process_request()
     {
-        channel_.serialize(prepare_stmt_command{stmt_sql_}, channel_.reset_sequence_number());
+        auto& cache = channel_.stmt_cache();
+        if (!cache.needs_eviction())
+        {
+            channel_.serialize(prepare_stmt_command{stmt_sql_}, channel_.reset_sequence_number());
+            return;
+        }
+
+        // Close the statements evicted from the cache in the same write as the prepare request.
+        // COM_STMT_CLOSE has no response
+        std::vector<std::uint8_t> buff;
+        std::vector<std::size_t> request_offsets;
+        while (cache.needs_eviction())
+        {
+            auto id = cache.pop_lru().id();
+            channel_.param_types().erase(id);
+            channel_.long_data().erase(id);
+            channel_.stmt_metadata().erase(id);
+            request_offsets.push_back(buff.size());
+            serialize_framed(close_stmt_command{id}, buff);
+        }
+        request_offsets.push_back(buff.size());
+        channel_.shared_sequence_number() = serialize_framed(prepare_stmt_command{stmt_sql_}, buff);
+        channel_.serialize_framed(buff, request_offsets);
     }
 
     void process_response(span<const std::uint8_t> message, error_code& err)
     {
         prepare_stmt_response response{};
-        err = deserialize_prepare_stmt_response(message, channel_.flavor(), response, diag_);
+        err = deserialize_prepare_stmt_response(
+            message,
+            channel_.flavor(),
+            response,
+            diag_,
+            channel_.current_capabilities().has(CLIENT_OPTIONAL_RESULTSET_METADATA)
+        );
         if (err)
             return;
-        res_ = access::construct<statement>(response.id, response.num_params);
-        remaining_meta_ = response.num_columns + response.num_params;
+        res_ = access::construct<statement>(response.id, response.num_params, channel_.session_id());
+
+        // If the server omits metadata, no parameter or column definitions follow
+        if (response.metadata_follows)
+        {
+            remaining_params_ = response.num_params;
+            remaining_columns_ = response.num_columns;
+        }
+
+        // Executions may omit the column definitions, so we store them
+        auto& stmt_meta = channel_.stmt_metadata();
+        stmt_meta.erase(response.id);
+        if (channel_.has_optional_metadata() && remaining_columns_ != 0u)
+            stmt_meta.start_recording(response.id);
+    }
+
+    // If the server limit on prepared statements was hit and the cache holds statements,
+    // shrinks the cache so that the next request makes room, and returns true
+    bool should_retry(error_code err)
+    {
+        auto& cache = channel_.stmt_cache();
+        if (err != common_server_errc::er_max_prepared_stmt_count_reached || cache.empty())
+            return false;
+        cache.set_capacity(cache.size());
+        diag_.clear();
+        return true;
+    }
+
+    bool has_remaining_meta() const noexcept { return remaining_params_ + remaining_columns_ != 0u; }
+
+    // The server sends a packet per parameter, followed by a packet per column.
+    // We only use the columns, and only if we may need them later
+    void on_meta_received(span<const std::uint8_t> message)
+    {
+        if (remaining_params_ != 0u)
+        {
+            --remaining_params_;
+            return;
+        }
+        --remaining_columns_;
+        auto& stmt_meta = channel_.stmt_metadata();
+        if (stmt_meta.is_recording())
+            stmt_meta.record(message);
+    }
+
+    // Stores the column definitions and adds the statement to the cache, if enabled
+    error_code on_complete()
+    {
+        auto& stmt_meta = channel_.stmt_metadata();
+        if (stmt_meta.is_recording())
+        {
+            auto err = stmt_meta.finish_recording();
+            if (err)
+                return err;
+        }
+
+        auto& cache = channel_.stmt_cache();
+        if (cache.enabled())
+            cache.insert(stmt_sql_, res_);
+        return error_code();
     }
 
-    bool has_remaining_meta() const noexcept { return remaining_meta_ != 0; }
-    void on_meta_received() noexcept { --remaining_meta_; }
     const statement& result() const noexcept { return res_; }
     channel& get_channel() noexcept { return channel_; }
 };
@@ -88,28 +189,40 @@ struct prepare_statement_op : boost::asio::coroutine
         {
             processor_.clear_diag();
 
-            // Serialize request
-            processor_.process_request();
-
-            // Write message
-            BOOST_ASIO_CORO_YIELD get_channel().async_write(std::move(self));
-
-            // Read response
-            BOOST_ASIO_CORO_YIELD get_channel().async_read_one(
-                get_channel().shared_sequence_number(),
-                std::move(self)
-            );
-
-            // Process response
-            processor_.process_response(read_message, err);
-            if (err)
+            // Statements in the cache don't require any I/O
+            if (processor_.lookup_cache())
             {
-                self.complete(err, statement());
+                BOOST_ASIO_CORO_YIELD boost::asio::post(get_channel().get_executor(), std::move(self));
+                self.complete(error_code(), processor_.result());
                 BOOST_ASIO_CORO_YIELD break;
             }
 
-            // Server sends now one packet per parameter and field.
-            // We ignore these for now.
+            while (true)
+            {
+                // Serialize request
+                processor_.process_request();
+
+                // Write message
+                BOOST_ASIO_CORO_YIELD get_channel().async_write(std::move(self));
+
+                // Read response
+                BOOST_ASIO_CORO_YIELD get_channel().async_read_one(
+                    get_channel().shared_sequence_number(),
+                    std::move(self)
+                );
+
+                // Process response
+                processor_.process_response(read_message, err);
+                if (!err)
+                    break;
+                if (!processor_.should_retry(err))
+                {
+                    self.complete(err, statement());
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+            }
+
+            // Server sends now one packet per parameter and field
             while (processor_.has_remaining_meta())
             {
                 // Read from the stream if necessary
@@ -126,12 +239,13 @@ struct prepare_statement_op : boost::asio::coroutine
                     BOOST_ASIO_CORO_YIELD break;
                 }
 
-                // Note it as processed
-                processor_.on_meta_received();
+                // Process it
+                processor_.on_meta_received(read_message);
             }
 
             // Complete
-            self.complete(error_code(), processor_.result());
+            err = processor_.on_complete();
+            self.complete(err, err ? statement() : processor_.result());
         }
     }
 };
@@ -149,26 +263,34 @@ inline statement prepare_statement_impl(
 
     prepare_statement_processor processor(channel, stmt_sql, diag);
 
-    // Prepare message
-    processor.process_request();
+    // Statements in the cache don't require any I/O
+    if (processor.lookup_cache())
+        return processor.result();
+
+    while (true)
+    {
+        // Prepare message
+        processor.process_request();
 
-    // Write message
-    channel.write(err);
-    if (err)
-        return statement();
+        // Write message
+        channel.write(err);
+        if (err)
+            return statement();
 
-    // Read response
-    auto read_buffer = channel.read_one(channel.shared_sequence_number(), err);
-    if (err)
-        return statement();
+        // Read response
+        auto read_buffer = channel.read_one(channel.shared_sequence_number(), err);
+        if (err)
+            return statement();
 
-    // Process response
-    processor.process_response(read_buffer, err);
-    if (err)
-        return statement();
+        // Process response
+        processor.process_response(read_buffer, err);
+        if (!err)
+            break;
+        if (!processor.should_retry(err))
+            return statement();
+    }
 
-    // Server sends now one packet per parameter and field.
-    // We ignore these for now.
+    // Server sends now one packet per parameter and field
     while (processor.has_remaining_meta())
     {
         // Read from the stream if necessary
@@ -179,16 +301,17 @@ inline statement prepare_statement_impl(
                 return statement();
         }
 
-        // Discard the message
-        channel.next_read_message(channel.shared_sequence_number(), err);
+        // Read the message
+        auto message = channel.next_read_message(channel.shared_sequence_number(), err);
         if (err)
             return statement();
 
-        // Update the processor state
-        processor.on_meta_received();
+        // Process it
+        processor.on_meta_received(message);
     }
 
-    return processor.result();
+    err = processor.on_complete();
+    return err ? statement() : processor.result();
 }
 
 template <class CompletionToken>
@@ -8,6 +8,7 @@
 #ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_READ_RESULTSET_HEAD_HPP
 #define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_READ_RESULTSET_HEAD_HPP
 
+#include <boost/mysql/client_errc.hpp>
 #include <boost/mysql/diagnostics.hpp>
 #include <boost/mysql/error_code.hpp>
 #include <boost/mysql/metadata.hpp>
@@ -17,23 +18,88 @@
 #include <boost/mysql/detail/execution_processor/execution_processor.hpp>
 
 #include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/protocol/capabilities.hpp>
+#include <boost/mysql/impl/internal/protocol/db_flavor.hpp>
 #include <boost/mysql/impl/internal/protocol/protocol.hpp>
 
 #include <boost/asio/coroutine.hpp>
 #include <boost/assert.hpp>
 
+#include <cstddef>
+#include <vector>
+
 namespace boost {
 namespace mysql {
 namespace detail {
 
+inline execute_response deserialize_execute_response(
+    channel& chan,
+    span<const std::uint8_t> msg,
+    diagnostics& diag
+)
+{
+    return deserialize_execute_response(
+        msg,
+        chan.flavor(),
+        diag,
+        chan.current_capabilities().has(CLIENT_LOCAL_FILES),
+        chan.has_optional_metadata()
+    );
+}
+
+// MariaDB only sends the metadata of a statement's resultsets if it changed since
+// the last time it was sent, so we must keep the latest one
+inline bool should_record_metadata(const channel& chan, const execution_processor& proc) noexcept
+{
+    return chan.flavor() == db_flavor::mariadb &&
+           chan.mariadb_capabilities().has(MARIADB_CLIENT_CACHE_METADATA) && proc.is_statement_execution();
+}
+
+// The server didn't send the resultset's metadata, so use the one we stored for the statement
+inline error_code process_omitted_metadata(
+    channel& chan,
+    execution_processor& proc,
+    std::size_t num_fields,
+    diagnostics& diag
+)
+{
+    const std::vector<coldef_view>* columns = proc.is_statement_execution()
+                                                  ? chan.stmt_metadata().find(proc.statement_id())
+                                                  : nullptr;
+    if (columns == nullptr || columns->size() != num_fields)
+        return client_errc::metadata_unavailable;
+    for (const auto& coldef : *columns)
+    {
+        auto err = proc.on_meta(coldef, diag);
+        if (err)
+            return err;
+    }
+    return error_code();
+}
+
+inline error_code process_num_fields(
+    channel& chan,
+    execution_processor& proc,
+    const execute_response& response,
+    diagnostics& diag
+)
+{
+    proc.on_num_meta(response.data.num_fields);
+    chan.stmt_metadata().discard_recording();
+    if (!response.metadata_follows)
+        return process_omitted_metadata(chan, proc, response.data.num_fields, diag);
+    if (should_record_metadata(chan, proc))
+        chan.stmt_metadata().start_recording(proc.statement_id());
+    return error_code();
+}
+
 inline error_code process_execution_response(
     channel& chan,
     execution_processor& proc,
-    span<const std::uint8_t> msg,
+    const execute_response& response,
     diagnostics& diag
 )
 {
-    auto response = deserialize_execute_response(msg, chan.flavor(), diag);
     error_code err;
     switch (response.type)
     {
@@ -41,11 +107,25 @@ inline error_code process_execution_response(
     case execute_response::type_t::ok_packet:
         err = proc.on_head_ok_packet(response.data.ok_pack, diag);
         break;
-    case execute_response::type_t::num_fields: proc.on_num_meta(response.data.num_fields); break;
+    case execute_response::type_t::num_fields: err = process_num_fields(chan, proc, response, diag); break;
+    case execute_response::type_t::local_infile:
+        // Only load_data_local knows how to respond to these
+        err = client_errc::unexpected_local_infile_request;
+        break;
     }
     return err;
 }
 
+inline error_code process_execution_response(
+    channel& chan,
+    execution_processor& proc,
+    span<const std::uint8_t> msg,
+    diagnostics& diag
+)
+{
+    return process_execution_response(chan, proc, deserialize_execute_response(chan, msg, diag), diag);
+}
+
 inline error_code process_field_definition(channel& chan, execution_processor& proc, diagnostics& diag)
 {
     // Read the field definition packet (it's cached at this point)
@@ -62,7 +142,19 @@ inline error_code process_field_definition(channel& chan, execution_processor& p
         return err;
 
     // Notify the processor
-    return proc.on_meta(coldef, diag);
+    err = proc.on_meta(coldef, diag);
+    if (err)
+        return err;
+
+    // Store it, if required
+    auto& stmt_meta = chan.stmt_metadata();
+    if (stmt_meta.is_recording())
+    {
+        stmt_meta.record(msg);
+        if (!proc.is_reading_meta())
+            err = stmt_meta.finish_recording();
+    }
+    return err;
 }
 
 struct read_resultset_head_op : boost::asio::coroutine
@@ -104,7 +196,7 @@ struct read_resultset_head_op : boost::asio::coroutine
             BOOST_ASIO_CORO_YIELD chan_.async_read_one(proc_.sequence_number(), std::move(self));
 
             // Response may be: ok_packet, err_packet, local infile request
-            // (not implemented), or response with fields
+            // (only valid for load_data_local), or response with fields
             err = process_execution_response(chan_, proc_, read_message, diag_);
             if (err)
             {
@@ -158,7 +250,7 @@ inline void read_resultset_head_impl(
         return;
 
     // Response may be: ok_packet, err_packet, local infile request
-    // (not implemented), or response with fields
+    // (only valid for load_data_local), or response with fields
     err = process_execution_response(chan, proc, msg, diag);
     if (err)
         return;
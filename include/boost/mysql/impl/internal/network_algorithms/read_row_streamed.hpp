@@ -0,0 +1,317 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_READ_ROW_STREAMED_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_READ_ROW_STREAMED_HPP
+
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/row_view.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/any_field_chunk_handler.hpp>
+#include <boost/mysql/detail/execution_processor/execution_state_impl.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/read_some_rows.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/read_some_rows_dynamic.hpp>
+#include <boost/mysql/impl/internal/protocol/protocol.hpp>
+#include <boost/mysql/impl/internal/protocol/streaming_row_parser.hpp>
+
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/post.hpp>
+
+#include <cstddef>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Whether the next message can be streamed. Requires at least one byte of it to have been read.
+// Messages that have been read entirely, OK packets (0xfe) and error packets (0xff)
+// are processed as regular messages
+inline bool can_stream_message(const channel& chan) noexcept
+{
+    if (chan.has_read_messages())
+        return false;
+    auto first = chan.partial_read_message()[0];
+    return first != 0xfe && first != 0xff;
+}
+
+inline row_view get_streamed_row(channel& chan, const execution_state_impl& st)
+{
+    return access::construct<row_view>(chan.shared_fields().data(), st.meta().size());
+}
+
+// Parses the last bytes of a row message, which may be the entire message.
+// The row without the streamed fields is stored in the channel's shared strings, and deserialized
+BOOST_ATTRIBUTE_NODISCARD inline error_code parse_row_tail(
+    channel& chan,
+    execution_state_impl& st,
+    streaming_row_parser& parser,
+    span<const std::uint8_t> buff
+)
+{
+    auto err = parser.parse(buff);
+    if (err)
+        return err;
+
+    // If the handler failed, the message has been entirely read, so the connection is still usable
+    err = parser.finish();
+    if (err)
+        return err;
+    return st.on_row(chan.shared_strings(), output_ref(), chan.shared_fields());
+}
+
+// Processes a message that has been read entirely (a row, OK or error packet).
+// Sets row_read to true if it was a row
+BOOST_ATTRIBUTE_NODISCARD inline error_code process_entire_message(
+    channel& chan,
+    execution_state_impl& st,
+    streaming_row_parser& parser,
+    bool& row_read,
+    diagnostics& diag
+)
+{
+    error_code err;
+    auto buff = chan.next_read_message(st.sequence_number(), err);
+    if (err)
+        return err;
+
+    auto res = deserialize_row_message(buff, chan.flavor(), diag);
+    if (res.type == row_message::type_t::error)
+    {
+        return res.data.err;
+    }
+    else if (res.type == row_message::type_t::row)
+    {
+        row_read = true;
+        return parse_row_tail(chan, st, parser, buff);
+    }
+    else if (is_cursor_batch_end(st, res.data.ok_pack))
+    {
+        st.on_cursor_batch_end();
+        return error_code();
+    }
+    else
+    {
+        return st.on_row_ok_packet(res.data.ok_pack);
+    }
+}
+
+// Parses the bytes of the current message read so far, making space for more
+BOOST_ATTRIBUTE_NODISCARD inline error_code parse_partial_message(channel& chan, streaming_row_parser& parser)
+{
+    auto err = parser.parse(chan.partial_read_message());
+    chan.consume_partial_read_message();
+    return err;
+}
+
+// Processes the message after parse_partial_message has been called until the message is complete
+BOOST_ATTRIBUTE_NODISCARD inline error_code finish_streamed_row(
+    channel& chan,
+    execution_state_impl& st,
+    streaming_row_parser& parser
+)
+{
+    error_code err;
+    auto buff = chan.next_read_message(st.sequence_number(), err);
+    if (err)
+        return err;
+    return parse_row_tail(chan, st, parser, buff);
+}
+
+struct read_row_streamed_op : boost::asio::coroutine
+{
+    channel& chan_;
+    diagnostics& diag_;
+    execution_state_impl& st_;
+    streaming_row_parser parser_;
+    bool row_read_{false};
+
+    read_row_streamed_op(
+        channel& chan,
+        diagnostics& diag,
+        execution_state_impl& st,
+        std::size_t min_size,
+        any_field_chunk_handler& handler
+    )
+        : chan_(chan),
+          diag_(diag),
+          st_(st),
+          parser_(st.encoding(), st.meta(), min_size, handler, chan.shared_strings())
+    {
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {}, std::size_t = 0)
+    {
+        // Error checking
+        if (err)
+        {
+            self.complete(err, row_view());
+            return;
+        }
+
+        // Normal path
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            diag_.clear();
+            clear_some_rows(chan_);
+
+            // If we are not reading rows, return
+            if (!st_.is_reading_rows())
+            {
+                BOOST_ASIO_CORO_YIELD boost::asio::post(chan_.get_executor(), std::move(self));
+                self.complete(error_code(), row_view());
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            while (true)
+            {
+                // If we're reading a cursor and the current batch is over, request more rows
+                if (st_.should_fetch())
+                {
+                    serialize_fetch_request(chan_, st_);
+                    BOOST_ASIO_CORO_YIELD chan_.async_write(std::move(self));
+                }
+
+                // Read until we know the message type
+                BOOST_ASIO_CORO_YIELD chan_.async_read_some_partial(std::move(self));
+
+                if (can_stream_message(chan_))
+                {
+                    // Parse the row as it's read
+                    while (!chan_.has_read_messages())
+                    {
+                        err = parse_partial_message(chan_, parser_);
+                        if (err)
+                        {
+                            self.complete(err, row_view());
+                            BOOST_ASIO_CORO_YIELD break;
+                        }
+                        BOOST_ASIO_CORO_YIELD chan_.async_read_some_partial(std::move(self));
+                    }
+                    row_read_ = true;
+                    err = finish_streamed_row(chan_, st_, parser_);
+                }
+                else
+                {
+                    BOOST_ASIO_CORO_YIELD chan_.async_read_some(std::move(self));
+                    err = process_entire_message(chan_, st_, parser_, row_read_, diag_);
+                }
+
+                if (err)
+                {
+                    self.complete(err, row_view());
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+
+                // Cursor batch ends don't contain rows, so keep reading
+                if (row_read_ || !st_.is_reading_rows())
+                {
+                    self.complete(error_code(), row_read_ ? get_streamed_row(chan_, st_) : row_view());
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+            }
+        }
+    }
+};
+
+// External interface
+inline row_view read_row_streamed_impl(
+    channel& chan,
+    execution_state_impl& st,
+    std::size_t min_size,
+    any_field_chunk_handler& handler,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    err.clear();
+    diag.clear();
+    clear_some_rows(chan);
+
+    // If we are not reading rows, just return
+    if (!st.is_reading_rows())
+        return row_view();
+
+    streaming_row_parser parser(st.encoding(), st.meta(), min_size, handler, chan.shared_strings());
+    bool row_read = false;
+    while (true)
+    {
+        // If we're reading a cursor and the current batch is over, request more rows
+        if (st.should_fetch())
+        {
+            serialize_fetch_request(chan, st);
+            chan.write(err);
+            if (err)
+                return row_view();
+        }
+
+        // Read until we know the message type
+        chan.read_some_partial(err);
+        if (err)
+            return row_view();
+
+        if (can_stream_message(chan))
+        {
+            // Parse the row as it's read
+            while (!chan.has_read_messages())
+            {
+                err = parse_partial_message(chan, parser);
+                if (err)
+                    return row_view();
+                chan.read_some_partial(err);
+                if (err)
+                    return row_view();
+            }
+            row_read = true;
+            err = finish_streamed_row(chan, st, parser);
+        }
+        else
+        {
+            chan.read_some(err);
+            if (err)
+                return row_view();
+            err = process_entire_message(chan, st, parser, row_read, diag);
+        }
+
+        if (err)
+            return row_view();
+
+        // Cursor batch ends don't contain rows, so keep reading
+        if (row_read)
+            return get_streamed_row(chan, st);
+        else if (!st.is_reading_rows())
+            return row_view();
+    }
+}
+
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, row_view))
+async_read_row_streamed_impl(
+    channel& chan,
+    execution_state_impl& st,
+    std::size_t min_size,
+    any_field_chunk_handler& handler,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return boost::asio::async_compose<CompletionToken, void(error_code, row_view)>(
+        read_row_streamed_op(chan, diag, st, min_size, handler),
+        token,
+        chan
+    );
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -8,38 +8,100 @@
 #ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_READ_SOME_ROWS_HPP
 #define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_READ_SOME_ROWS_HPP
 
+#include <boost/mysql/batch_params.hpp>
 #include <boost/mysql/diagnostics.hpp>
 #include <boost/mysql/error_code.hpp>
+#include <boost/mysql/field_view.hpp>
 
 #include <boost/mysql/detail/config.hpp>
 #include <boost/mysql/detail/execution_processor/execution_processor.hpp>
+#include <boost/mysql/detail/row_impl.hpp>
 
 #include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/protocol/protocol.hpp>
 
 #include <boost/asio/async_result.hpp>
 #include <boost/asio/coroutine.hpp>
 #include <boost/asio/post.hpp>
+#include <boost/core/span.hpp>
 
+#include <algorithm>
 #include <cstddef>
+#include <utility>
 
 namespace boost {
 namespace mysql {
 namespace detail {
 
+// When reading rows from a cursor, the server sends an EOF packet after each batch of rows
+// (and after the metadata), signaling that more rows can be retrieved using COM_STMT_FETCH
+inline bool is_cursor_batch_end(const execution_processor& proc, const ok_view& ok) noexcept
+{
+    return proc.cursor_requested() && ok.cursor_exists() && !ok.last_row_sent();
+}
+
+// Requests the next batch of rows from a cursor
+inline void serialize_fetch_request(channel& chan, execution_processor& proc)
+{
+    proc.on_cursor_fetch();
+    chan.serialize(
+        fetch_stmt_command{proc.statement_id(), proc.cursor_fetch_size()},
+        chan.reset_sequence_number(proc.sequence_number())
+    );
+}
+
+// The number of rows after which a batch is complete. If there are rows to read,
+// we always read at least one, unless the limits don't allow it
+inline std::size_t min_batch_rows(const batch_params& params, const output_ref& output) noexcept
+{
+    std::size_t min_rows = (std::max)(params.min_rows(), static_cast<std::size_t>(1u));
+    return (std::min)({min_rows, params.max_rows(), output.max_size()});
+}
+
+// Whether read_some_rows should stop reading
+inline bool is_batch_complete(
+    const execution_processor& proc,
+    const batch_params& params,
+    const output_ref& output,
+    std::size_t read_rows,
+    std::size_t read_bytes
+) noexcept
+{
+    return !proc.is_reading_rows() || read_rows >= min_batch_rows(params, output) ||
+           (read_rows != 0u && read_bytes >= params.max_bytes());
+}
+
+// Rows deserialized into the channel's shared fields point into the read buffer,
+// which may be compacted by the next read. Moves their strings to the channel's
+// shared strings, as offsets, so the batch can span several reads
+inline void detach_shared_fields(channel& chan, std::size_t& num_detached)
+{
+    auto& fields = chan.shared_fields();
+    copy_strings_as_offsets(
+        span<field_view>(fields.data() + num_detached, fields.size() - num_detached),
+        chan.shared_strings()
+    );
+    num_detached = fields.size();
+}
+
 BOOST_ATTRIBUTE_NODISCARD inline error_code process_some_rows(
     channel& chan,
     execution_processor& proc,
     output_ref output,
+    const batch_params& params,
     std::size_t& read_rows,
+    std::size_t& read_bytes,
     diagnostics& diag
 )
 {
-    // Process all read messages until they run out, an error happens
-    // or an EOF is received
-    read_rows = 0;
+    // Process all read messages until they run out, an error happens,
+    // an EOF is received or the batch limits are reached. read_rows and read_bytes
+    // accumulate across calls
+    std::size_t max_rows = (std::min)(params.max_rows(), output.max_size());
     error_code err;
     proc.on_row_batch_start();
-    while (chan.has_read_messages() && proc.is_reading_rows() && read_rows < output.max_size())
+    while (chan.has_read_messages() && proc.is_reading_rows() && !proc.should_fetch() &&
+           read_rows < max_rows && (read_rows == 0u || read_bytes < params.max_bytes()))
     {
         // Get the row message
         auto buff = chan.next_read_message(proc.sequence_number(), err);
@@ -57,7 +119,14 @@ BOOST_ATTRIBUTE_NODISCARD inline error_code process_some_rows(
             output.set_offset(read_rows);
             err = proc.on_row(res.data.row, output, chan.shared_fields());
             if (!err)
+            {
                 ++read_rows;
+                read_bytes += buff.size();
+            }
+        }
+        else if (is_cursor_batch_end(proc, res.data.ok_pack))
+        {
+            proc.on_cursor_batch_end();
         }
         else
         {
@@ -77,14 +146,26 @@ struct read_some_rows_impl_op : boost::asio::coroutine
     diagnostics& diag_;
     execution_processor& proc_;
     output_ref output_;
+    batch_params params_;
+    bool rows_in_shared_fields_;
+    std::size_t read_rows_{};
+    std::size_t read_bytes_{};
+    std::size_t num_detached_{};
 
     read_some_rows_impl_op(
         channel& chan,
         diagnostics& diag,
         execution_processor& proc,
-        output_ref output
+        output_ref output,
+        const batch_params& params,
+        bool rows_in_shared_fields
     ) noexcept
-        : chan_(chan), diag_(diag), proc_(proc), output_(output)
+        : chan_(chan),
+          diag_(diag),
+          proc_(proc),
+          output_(output),
+          params_(params),
+          rows_in_shared_fields_(rows_in_shared_fields)
     {
     }
 
@@ -99,7 +180,6 @@ struct read_some_rows_impl_op : boost::asio::coroutine
         }
 
         // Normal path
-        std::size_t read_rows = 0;
         BOOST_ASIO_CORO_REENTER(*this)
         {
             diag_.clear();
@@ -112,27 +192,51 @@ struct read_some_rows_impl_op : boost::asio::coroutine
                 BOOST_ASIO_CORO_YIELD break;
             }
 
-            // Read at least one message
-            BOOST_ASIO_CORO_YIELD chan_.async_read_some(std::move(self));
-
-            // Process messages
-            err = process_some_rows(chan_, proc_, output_, read_rows, diag_);
-            if (err)
+            while (true)
             {
-                self.complete(err, 0);
-                BOOST_ASIO_CORO_YIELD break;
-            }
+                // If we're reading a cursor and the current batch is over, request more rows
+                if (proc_.should_fetch())
+                {
+                    serialize_fetch_request(chan_, proc_);
+                    BOOST_ASIO_CORO_YIELD chan_.async_write(std::move(self));
+                }
+
+                // Keep the rows we already have valid before reading again
+                if (rows_in_shared_fields_ && read_rows_ != 0u)
+                    detach_shared_fields(chan_, num_detached_);
+
+                // Read at least one message
+                BOOST_ASIO_CORO_YIELD chan_.async_read_some(std::move(self));
 
-            self.complete(error_code(), read_rows);
+                // Process messages
+                err = process_some_rows(chan_, proc_, output_, params_, read_rows_, read_bytes_, diag_);
+                if (err)
+                {
+                    self.complete(err, 0);
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+
+                // Keep reading until the batch is complete. Cursor batches
+                // may not contain any row (e.g. the one sent with the metadata)
+                if (is_batch_complete(proc_, params_, output_, read_rows_, read_bytes_))
+                {
+                    self.complete(error_code(), read_rows_);
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+            }
         }
     }
 };
 
-// External interface
+// External interface.
+// If rows_in_shared_fields is true, rows are deserialized into the channel's shared fields,
+// and batches spanning several reads store their strings in the channel's shared strings, as offsets
 inline std::size_t read_some_rows_impl(
     channel& chan,
     execution_processor& proc,
     const output_ref& output,
+    const batch_params& params,
+    bool rows_in_shared_fields,
     error_code& err,
     diagnostics& diag
 )
@@ -146,18 +250,48 @@ inline std::size_t read_some_rows_impl(
         return 0;
     }
 
-    // Read from the stream until there is at least one message
-    chan.read_some(err);
-    if (err)
-        return 0;
+    std::size_t read_rows = 0, read_bytes = 0, num_detached = 0;
+    while (true)
+    {
+        // If we're reading a cursor and the current batch is over, request more rows
+        if (proc.should_fetch())
+        {
+            serialize_fetch_request(chan, proc);
+            chan.write(err);
+            if (err)
+                return 0;
+        }
 
-    // Process read messages
-    std::size_t read_rows = 0;
-    err = process_some_rows(chan, proc, output, read_rows, diag);
-    if (err)
-        return 0;
+        // Keep the rows we already have valid before reading again
+        if (rows_in_shared_fields && read_rows != 0u)
+            detach_shared_fields(chan, num_detached);
+
+        // Read from the stream until there is at least one message
+        chan.read_some(err);
+        if (err)
+            return 0;
+
+        // Process read messages
+        err = process_some_rows(chan, proc, output, params, read_rows, read_bytes, diag);
+        if (err)
+            return 0;
 
-    return read_rows;
+        // Keep reading until the batch is complete. Cursor batches
+        // may not contain any row (e.g. the one sent with the metadata)
+        if (is_batch_complete(proc, params, output, read_rows, read_bytes))
+            return read_rows;
+    }
+}
+
+inline std::size_t read_some_rows_impl(
+    channel& chan,
+    execution_processor& proc,
+    const output_ref& output,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    return read_some_rows_impl(chan, proc, output, batch_params(), false, err, diag);
 }
 
 template <class CompletionToken>
@@ -166,17 +300,40 @@ async_read_some_rows_impl(
     channel& chan,
     execution_processor& proc,
     const output_ref& output,
+    const batch_params& params,
+    bool rows_in_shared_fields,
     diagnostics& diag,
     CompletionToken&& token
 )
 {
     return asio::async_compose<CompletionToken, void(error_code, std::size_t)>(
-        read_some_rows_impl_op(chan, diag, proc, output),
+        read_some_rows_impl_op(chan, diag, proc, output, params, rows_in_shared_fields),
         token,
         chan
     );
 }
 
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, std::size_t))
+async_read_some_rows_impl(
+    channel& chan,
+    execution_processor& proc,
+    const output_ref& output,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return async_read_some_rows_impl(
+        chan,
+        proc,
+        output,
+        batch_params(),
+        false,
+        diag,
+        std::forward<CompletionToken>(token)
+    );
+}
+
 }  // namespace detail
 }  // namespace mysql
 }  // namespace boost
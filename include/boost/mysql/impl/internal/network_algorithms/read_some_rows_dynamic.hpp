@@ -8,12 +8,14 @@
 #ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_READ_SOME_ROWS_DYNAMIC_HPP
 #define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_READ_SOME_ROWS_DYNAMIC_HPP
 
+#include <boost/mysql/batch_params.hpp>
 #include <boost/mysql/diagnostics.hpp>
 #include <boost/mysql/error_code.hpp>
 #include <boost/mysql/rows_view.hpp>
 
 #include <boost/mysql/detail/config.hpp>
 #include <boost/mysql/detail/execution_processor/execution_state_impl.hpp>
+#include <boost/mysql/detail/row_impl.hpp>
 
 #include <boost/mysql/impl/internal/channel/channel.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/read_some_rows.hpp>
@@ -25,8 +27,18 @@ namespace boost {
 namespace mysql {
 namespace detail {
 
-inline rows_view get_some_rows(const channel& ch, const execution_state_impl& st)
+inline void clear_some_rows(channel& ch)
 {
+    ch.shared_fields().clear();
+    ch.shared_strings().clear();
+}
+
+inline rows_view get_some_rows(channel& ch, const execution_state_impl& st)
+{
+    // Batches spanning several reads store some of their strings as offsets.
+    // This is a no-op for fields pointing into the read buffer
+    offsets_to_string_views(ch.shared_fields(), ch.shared_strings().data());
+
     return access::construct<rows_view>(
         ch.shared_fields().data(),
         ch.shared_fields().size(),
@@ -39,9 +51,15 @@ struct read_some_rows_dynamic_op : boost::asio::coroutine
     channel& chan_;
     diagnostics& diag_;
     execution_state_impl& st_;
+    batch_params params_;
 
-    read_some_rows_dynamic_op(channel& chan, diagnostics& diag, execution_state_impl& st) noexcept
-        : chan_(chan), diag_(diag), st_(st)
+    read_some_rows_dynamic_op(
+        channel& chan,
+        diagnostics& diag,
+        execution_state_impl& st,
+        const batch_params& params
+    ) noexcept
+        : chan_(chan), diag_(diag), st_(st), params_(params)
     {
     }
 
@@ -58,8 +76,16 @@ struct read_some_rows_dynamic_op : boost::asio::coroutine
         // Normal path
         BOOST_ASIO_CORO_REENTER(*this)
         {
-            chan_.shared_fields().clear();
-            BOOST_ASIO_CORO_YIELD async_read_some_rows_impl(chan_, st_, output_ref(), diag_, std::move(self));
+            clear_some_rows(chan_);
+            BOOST_ASIO_CORO_YIELD async_read_some_rows_impl(
+                chan_,
+                st_,
+                output_ref(),
+                params_,
+                true,
+                diag_,
+                std::move(self)
+            );
             self.complete(error_code(), get_some_rows(chan_, st_));
         }
     }
@@ -69,14 +95,15 @@ struct read_some_rows_dynamic_op : boost::asio::coroutine
 inline rows_view read_some_rows_dynamic_impl(
     channel& channel,
     execution_state_impl& st,
+    const batch_params& params,
     error_code& err,
     diagnostics& diag
 )
 {
     err.clear();
     diag.clear();
-    channel.shared_fields().clear();
-    read_some_rows_impl(channel, st, output_ref(), err, diag);
+    clear_some_rows(channel);
+    read_some_rows_impl(channel, st, output_ref(), params, true, err, diag);
     if (err)
         return rows_view();
     return get_some_rows(channel, st);
@@ -87,12 +114,13 @@ BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, rows_view))
 async_read_some_rows_dynamic_impl(
     channel& channel,
     execution_state_impl& st,
+    const batch_params& params,
     diagnostics& diag,
     CompletionToken&& token
 )
 {
     return boost::asio::async_compose<CompletionToken, void(error_code, rows_view)>(
-        read_some_rows_dynamic_op(channel, diag, st),
+        read_some_rows_dynamic_op(channel, diag, st, params),
         token,
         channel
     );
@@ -0,0 +1,265 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_SEND_LONG_DATA_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_NETWORK_ALGORITHMS_SEND_LONG_DATA_HPP
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/statement.hpp>
+
+#include <boost/mysql/detail/any_load_data_source.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/protocol/protocol.hpp>
+
+#include <boost/asio/buffer.hpp>
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/error.hpp>
+#include <boost/asio/post.hpp>
+#include <boost/assert.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Size of the chunks we read from the source. Each chunk is sent as a separate
+// COM_STMT_SEND_LONG_DATA message. These have no response, so they are written back to back
+constexpr std::size_t long_data_chunk_size = 0x10000;
+
+// Gets a buffer where the next chunk should be read into. The message head is serialized
+// in front of it, so the chunk doesn't need to be copied
+inline asio::mutable_buffer prepare_long_data_chunk(
+    channel& chan,
+    std::uint32_t stmt_id,
+    std::size_t param_index
+)
+{
+    constexpr std::size_t head_size = send_long_data_command::head_size;
+    auto buff = chan.prepare_raw(head_size + long_data_chunk_size);
+    send_long_data_command{stmt_id, static_cast<std::uint16_t>(param_index), {}}.serialize_head(buff);
+    return asio::buffer(buff.data() + head_size, buff.size() - head_size);
+}
+
+// Processes the result of reading a chunk from the source. Returns true if a message containing
+// the chunk has been set up and should be written. The data ends when the source returns
+// zero bytes or asio::error::eof. If the data is empty, a single, empty chunk is sent,
+// so the parameter gets an empty value.
+inline bool send_long_data_on_chunk_read(
+    channel& chan,
+    error_code& source_err,
+    std::size_t bytes_read,
+    bool& is_first
+)
+{
+    if (source_err == asio::error::eof)
+        source_err = error_code();
+    if (source_err || (bytes_read == 0u && !is_first))
+        return false;
+    is_first = false;
+    chan.serialize_raw(send_long_data_command::head_size + bytes_read, chan.reset_sequence_number());
+    return true;
+}
+
+// If reading from the source failed, the server may have received part of the data.
+// COM_STMT_RESET discards it, together with any other data sent for the statement.
+// It doesn't affect the parameter types bound by the server, but we don't rely on that.
+inline void send_long_data_setup_reset(channel& chan, std::uint32_t stmt_id)
+{
+    chan.long_data().erase(stmt_id);
+    chan.param_types().erase(stmt_id);
+    chan.serialize(reset_stmt_command{stmt_id}, chan.reset_sequence_number());
+}
+
+struct send_long_data_op : boost::asio::coroutine
+{
+    channel& chan_;
+    std::uint32_t stmt_id_;
+    std::size_t num_params_;
+    bool is_current_session_;
+    std::size_t param_index_;
+    std::unique_ptr<any_load_data_source> source_owner_;
+    any_load_data_source& source_;  // a reference, so it's not affected by the op being moved
+    diagnostics& diag_;
+    error_code source_err_;
+    bool is_first_{true};
+    bool has_more_{true};
+    bool reading_source_{false};
+
+    send_long_data_op(
+        channel& chan,
+        const statement& stmt,
+        std::size_t param_index,
+        std::unique_ptr<any_load_data_source> source,
+        diagnostics& diag
+    ) noexcept
+        : chan_(chan),
+          stmt_id_(stmt.id()),
+          num_params_(stmt.num_params()),
+          is_current_session_(chan.is_current_session(stmt)),
+          param_index_(param_index),
+          source_owner_(std::move(source)),
+          source_(*source_owner_),
+          diag_(diag)
+    {
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err, span<const std::uint8_t> msg)
+    {
+        // Only the response to COM_STMT_RESET is read
+        if (!err)
+            err = deserialize_reset_stmt_response(msg, chan_.flavor(), diag_);
+        self.complete(source_err_ ? source_err_ : err);
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {}, std::size_t bytes = 0)
+    {
+        // Error checking. Errors reading from the source are handled by send_long_data_on_chunk_read
+        if (err && !reading_source_)
+        {
+            self.complete(source_err_ ? source_err_ : err);
+            return;
+        }
+
+        // Non-error path
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            diag_.clear();
+
+            // Statements from previous sessions don't exist in the server anymore
+            if (!is_current_session_)
+            {
+                BOOST_ASIO_CORO_YIELD boost::asio::post(chan_.get_executor(), std::move(self));
+                self.complete(client_errc::stale_statement);
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            // Send the data, a chunk at a time
+            while (has_more_)
+            {
+                if (source_.is_async())
+                {
+                    reading_source_ = true;
+                    BOOST_ASIO_CORO_YIELD source_.async_read_some(
+                        prepare_long_data_chunk(chan_, stmt_id_, param_index_),
+                        std::move(self)
+                    );
+                    reading_source_ = false;
+                }
+                else
+                {
+                    bytes = source_.read_some(prepare_long_data_chunk(chan_, stmt_id_, param_index_), err);
+                }
+                source_err_ = err;
+                if (!send_long_data_on_chunk_read(chan_, source_err_, bytes, is_first_))
+                    break;
+                has_more_ = bytes != 0u;
+                BOOST_ASIO_CORO_YIELD chan_.async_write(std::move(self));
+            }
+
+            if (!source_err_)
+            {
+                // The value will be used by the next execution of the statement
+                chan_.long_data().add(stmt_id_, num_params_, param_index_);
+                self.complete(error_code());
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            // Discard any data we may have sent. The response is handled by the other overload
+            send_long_data_setup_reset(chan_, stmt_id_);
+            BOOST_ASIO_CORO_YIELD chan_.async_write(std::move(self));
+            BOOST_ASIO_CORO_YIELD chan_.async_read_one(chan_.shared_sequence_number(), std::move(self));
+        }
+    }
+};
+
+// External interface
+inline void send_long_data_impl(
+    channel& chan,
+    const statement& stmt,
+    std::size_t param_index,
+    any_load_data_source& source,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    err.clear();
+    diag.clear();
+    error_code source_err;
+    bool is_first = true;
+
+    // Statements from previous sessions don't exist in the server anymore
+    if (!chan.is_current_session(stmt))
+    {
+        err = client_errc::stale_statement;
+        return;
+    }
+
+    // Send the data, a chunk at a time
+    while (true)
+    {
+        auto buff = prepare_long_data_chunk(chan, stmt.id(), param_index);
+        std::size_t bytes = source.read_some(buff, source_err);
+        if (!send_long_data_on_chunk_read(chan, source_err, bytes, is_first))
+            break;
+        chan.write(err);
+        if (err)
+            return;
+        if (bytes == 0u)
+            break;
+    }
+
+    if (!source_err)
+    {
+        // The value will be used by the next execution of the statement
+        chan.long_data().add(stmt.id(), stmt.num_params(), param_index);
+        return;
+    }
+
+    // Discard any data we may have sent. The source error takes precedence
+    // over any error resetting the statement, as in the async version
+    send_long_data_setup_reset(chan, stmt.id());
+    chan.write(err);
+    if (!err)
+    {
+        auto response = chan.read_one(chan.shared_sequence_number(), err);
+        if (!err)
+            err = deserialize_reset_stmt_response(response, chan.flavor(), diag);
+    }
+    err = source_err;
+}
+
+template <class CompletionToken>
+BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code))
+async_send_long_data_impl(
+    channel& chan,
+    const statement& stmt,
+    std::size_t param_index,
+    std::unique_ptr<any_load_data_source> source,
+    diagnostics& diag,
+    CompletionToken&& token
+)
+{
+    return asio::async_compose<CompletionToken, void(error_code)>(
+        send_long_data_op(chan, stmt, param_index, std::move(source), diag),
+        token,
+        chan
+    );
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
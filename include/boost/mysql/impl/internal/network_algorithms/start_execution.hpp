@@ -40,34 +40,71 @@ inline error_code check_client_errors(const any_execution_request& req)
                                                                           : client_errc::wrong_num_params;
 }
 
+// Statements prepared in a session that has since ended (e.g. by COM_RESET_CONNECTION) don't exist
+// in the server anymore. Their IDs may be reused by other statements, so they are never sent
+inline error_code check_client_errors(const channel& chan, const any_execution_request& req)
+{
+    if (!req.is_query && !chan.is_current_session(req.data.stmt.stmt))
+        return client_errc::stale_statement;
+    return check_client_errors(req);
+}
+
 inline resultset_encoding get_encoding(const any_execution_request& req)
 {
     return req.is_query ? resultset_encoding::text : resultset_encoding::binary;
 }
 
+// If gather_writes is true, large parameters are written in place, so their values must be
+// kept alive until the request is written. This is only the case for sync functions, since
+// async ones only require the request to be valid until the operation is initiated
 inline void serialize_execution_request(
     const any_execution_request& req,
     channel& chan,
-    std::uint8_t& sequence_number
+    execution_processor& proc,
+    bool gather_writes
 )
 {
     if (req.is_query)
     {
-        chan.serialize(query_command{req.data.query}, sequence_number);
+        chan.serialize(query_command{req.data.query}, chan.reset_sequence_number(proc.sequence_number()));
     }
     else
     {
-        chan.serialize(execute_stmt_command{req.data.stmt.stmt.id(), req.data.stmt.params}, sequence_number);
+        const auto& stmt = req.data.stmt;
+        bool send_types = chan.param_types().update(stmt.stmt.id(), stmt.params);
+        bool open_cursor = proc.cursor_fetch_size() != 0u;
+        proc.on_statement_execution(stmt.stmt.id());
+        if (open_cursor)
+            proc.on_cursor_requested();
+        // Values sent by send_long_data are used by this execution, and then discarded by the server
+        auto long_data = chan.long_data().consume(stmt.stmt.id());
+        execute_stmt_command cmd{stmt.stmt.id(), stmt.params, send_types, open_cursor, long_data};
+        if (gather_writes)
+            chan.serialize_gather(cmd, chan.reset_sequence_number(proc.sequence_number()));
+        else
+            chan.serialize(cmd, chan.reset_sequence_number(proc.sequence_number()));
     }
 }
 
-inline void execution_setup(const any_execution_request& req, channel& chan, execution_processor& proc)
+// If the execution fails, we can't know whether the server bound the parameter types we sent
+inline void on_execution_error(const any_execution_request& req, channel& chan)
+{
+    if (!req.is_query)
+        chan.param_types().erase(req.data.stmt.stmt.id());
+}
+
+inline void execution_setup(
+    const any_execution_request& req,
+    channel& chan,
+    execution_processor& proc,
+    bool gather_writes
+)
 {
     // Reeset the processor
     proc.reset(get_encoding(req), chan.meta_mode());
 
     // Serialize the execution request
-    serialize_execution_request(req, chan, proc.sequence_number());
+    serialize_execution_request(req, chan, proc, gather_writes);
 }
 
 struct start_execution_impl_op : boost::asio::coroutine
@@ -94,6 +131,7 @@ struct start_execution_impl_op : boost::asio::coroutine
         // Error checking
         if (err)
         {
+            on_execution_error(req_, chan_);
             self.complete(err);
             return;
         }
@@ -104,7 +142,7 @@ struct start_execution_impl_op : boost::asio::coroutine
             diag_.clear();
 
             // Check for errors
-            err = check_client_errors(req_);
+            err = check_client_errors(chan_, req_);
             if (err)
             {
                 client_err_ = err;
@@ -114,7 +152,7 @@ struct start_execution_impl_op : boost::asio::coroutine
             }
 
             // Setup
-            execution_setup(req_, chan_, proc_);
+            execution_setup(req_, chan_, proc_, false);
 
             // Send the execution request (serialized by setup)
             BOOST_ASIO_CORO_YIELD chan_.async_write(std::move(self));
@@ -141,22 +179,28 @@ inline void start_execution_impl(
     diag.clear();
 
     // Check for errors
-    err = check_client_errors(req);
+    err = check_client_errors(channel, req);
     if (err)
         return;
 
     // Setup
-    execution_setup(req, channel, proc);
+    execution_setup(req, channel, proc, true);
 
     // Send the execution request (serialized by setup)
     channel.write(err);
     if (err)
+    {
+        on_execution_error(req, channel);
         return;
+    }
 
     // Read the first resultset's head
     read_resultset_head_impl(channel, proc, err, diag);
     if (err)
+    {
+        on_execution_error(req, channel);
         return;
+    }
 }
 
 template <class CompletionToken>
@@ -43,6 +43,7 @@ constexpr std::uint32_t CLIENT_SESSION_TRACK = (1UL << 23); // Capable of handli
 constexpr std::uint32_t CLIENT_DEPRECATE_EOF = (1UL << 24); // Client no longer needs EOF_Packet and will use OK_Packet instead
 constexpr std::uint32_t CLIENT_SSL_VERIFY_SERVER_CERT = (1UL << 30); // Verify server certificate
 constexpr std::uint32_t CLIENT_OPTIONAL_RESULTSET_METADATA = (1UL << 25); // The client can handle optional metadata information in the resultset
+constexpr std::uint32_t CLIENT_ZSTD_COMPRESSION_ALGORITHM = (1UL << 26); // Compression protocol extended to support zstd
 constexpr std::uint32_t CLIENT_REMEMBER_OPTIONS = (1UL << 31); // Don't reset the options after an unsuccessful connect
 // clang-format on
 
@@ -77,9 +78,9 @@ public:
  * CLIENT_LONG_FLAG: unset //  Get all column flags
  * CLIENT_CONNECT_WITH_DB: optional //  Database (schema) name can be specified on connect in
  * Handshake Response Packet CLIENT_NO_SCHEMA: unset //  Don't allow database.table.column
- * CLIENT_COMPRESS: unset //  Compression protocol supported
+ * CLIENT_COMPRESS: optional (if compression_mode::enable) //  Compression protocol supported
  * CLIENT_ODBC: unset //  Special handling of ODBC behavior
- * CLIENT_LOCAL_FILES: unset //  Can use LOAD DATA LOCAL
+ * CLIENT_LOCAL_FILES: optional (if handshake_params::local_infile) //  Can use LOAD DATA LOCAL
  * CLIENT_IGNORE_SPACE: unset //  Ignore spaces before '('
  * CLIENT_PROTOCOL_41: mandatory //  New 4.1 protocol
  * CLIENT_INTERACTIVE: unset //  This is an interactive client
@@ -98,9 +99,10 @@ public:
  * for a user account with expired password CLIENT_SESSION_TRACK: unset //  Capable of handling
  * server state change information CLIENT_DEPRECATE_EOF: mandatory //  Client no longer needs
  * EOF_Packet and will use OK_Packet instead CLIENT_SSL_VERIFY_SERVER_CERT: unset //  Verify server
- * certificate CLIENT_OPTIONAL_RESULTSET_METADATA: unset //  The client can handle optional metadata
+ * certificate CLIENT_OPTIONAL_RESULTSET_METADATA: optional //  The client can handle optional metadata
  * information in the resultset CLIENT_REMEMBER_OPTIONS: unset //  Don't reset the options after an
  * unsuccessful connect
+ * CLIENT_ZSTD_COMPRESSION_ALGORITHM: optional (if compression_mode::enable and built with zstd)
  *
  * We pay attention to:
  * CLIENT_CONNECT_WITH_DB: optional //  Database (schema) name can be specified on connect in
@@ -109,6 +111,10 @@ public:
  * mandatory //  Enable authentication response packet to be larger than 255 bytes
  * CLIENT_DEPRECATE_EOF: mandatory //  Client no longer needs EOF_Packet and will use OK_Packet
  * instead
+ * CLIENT_COMPRESS, CLIENT_ZSTD_COMPRESSION_ALGORITHM: optional, depending on compression_mode
+ * CLIENT_LOCAL_FILES: optional, depending on handshake_params::local_infile
+ * CLIENT_OPTIONAL_RESULTSET_METADATA: optional. Resultsets may omit metadata if the
+ * resultset_metadata session variable is NONE. Statements reuse the metadata sent on prepare
  */
 
 // clang-format off
@@ -121,7 +127,23 @@ constexpr capabilities mandatory_capabilities{
 };
 // clang-format on
 
-constexpr capabilities optional_capabilities{CLIENT_MULTI_RESULTS | CLIENT_PS_MULTI_RESULTS};
+constexpr capabilities optional_capabilities{
+    CLIENT_MULTI_RESULTS | CLIENT_PS_MULTI_RESULTS | CLIENT_OPTIONAL_RESULTSET_METADATA
+};
+
+// MariaDB extended capabilities. MariaDB servers don't set CLIENT_LONG_PASSWORD (which MariaDB calls
+// CLIENT_MYSQL), and send these flags in the last 4 bytes of the server hello's reserved field.
+// Clients send theirs in the last 4 bytes of the login and SSL requests' filler.
+constexpr std::uint32_t MARIADB_CLIENT_PROGRESS = 1; // Client supports progress indicator
+constexpr std::uint32_t MARIADB_CLIENT_COM_MULTI = 2; // Permit COM_MULTI protocol
+constexpr std::uint32_t MARIADB_CLIENT_STMT_BULK_OPERATIONS = 4; // Permit bulk insert
+constexpr std::uint32_t MARIADB_CLIENT_EXTENDED_METADATA = 8; // Add extended metadata information
+constexpr std::uint32_t MARIADB_CLIENT_CACHE_METADATA = 16; // Skip statement metadata if unchanged
+
+// We only negotiate the ones we actually use
+constexpr capabilities mariadb_optional_capabilities{
+    MARIADB_CLIENT_STMT_BULK_OPERATIONS | MARIADB_CLIENT_CACHE_METADATA
+};
 
 }  // namespace detail
 }  // namespace mysql
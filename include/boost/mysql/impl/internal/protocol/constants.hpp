@@ -18,6 +18,10 @@ namespace detail {
 constexpr std::size_t MAX_PACKET_SIZE = 0xffffff;
 constexpr std::size_t HEADER_SIZE = 4;
 
+// Statement parameters at least this size are written in place, rather than
+// being copied into the write buffer (gather writes)
+constexpr std::size_t gather_write_min_size = 0x10000;
+
 // The binary collation number, used to distinguish blobs from strings
 constexpr std::uint16_t binary_collation = 63;
 
@@ -25,22 +25,24 @@
 #include <boost/mysql/impl/internal/protocol/serialization.hpp>
 
 #include <boost/assert.hpp>
-#include <boost/lexical_cast/try_lexical_convert.hpp>
 
 #include <cmath>
 #include <cstddef>
-#include <cstdlib>
+#include <cstdint>
+#include <limits>
 #include <type_traits>
 
+#ifdef BOOST_MYSQL_HAS_FROM_CHARS_FLOAT
+#include <charconv>
+#include <system_error>
+#else
+#include <boost/lexical_cast/try_lexical_convert.hpp>
+#endif
+
 namespace boost {
 namespace mysql {
 namespace detail {
 
-#ifdef BOOST_MSVC
-#pragma warning(push)
-#pragma warning(disable : 4996)  // MSVC doesn't like my sscanf's
-#endif
-
 // Constants
 BOOST_MYSQL_STATIC_IF_COMPILED constexpr unsigned max_decimals = 6u;
 
@@ -55,43 +57,142 @@ BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::size_t secs_sz = 2;
 BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::size_t date_sz = year_sz + month_sz + day_sz + 2;  // delimiters
 BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::size_t time_min_sz = hours_min_sz + mins_sz + secs_sz +
                                                                    2;  // delimiters
-BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::size_t time_max_sz = time_min_sz + max_decimals +
-                                                                   3;  // sign, period, hour extra character
 BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::size_t datetime_min_sz = date_sz + time_min_sz +
                                                                        1;  // delimiter
-BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::size_t datetime_max_sz = datetime_min_sz + max_decimals +
-                                                                       1;  // period
 
 BOOST_MYSQL_STATIC_IF_COMPILED constexpr unsigned time_max_hour = 838;
 }  // namespace textc
 
-// Integers
-template <class T>
-BOOST_MYSQL_STATIC_OR_INLINE deserialize_errc
-deserialize_text_value_int_impl(string_view from, field_view& to) noexcept
+// Digits
+// Parses exactly num_digits decimal digits, without signs or spaces.
+// Errors are accumulated rather than checked on each character, to avoid branches.
+BOOST_MYSQL_STATIC_OR_INLINE bool parse_text_digits(
+    const char* from,
+    std::size_t num_digits,
+    std::uint64_t& to
+) noexcept
 {
-    T v;
-    bool ok = boost::conversion::try_lexical_convert(from.data(), from.size(), v);
-    if (!ok)
-        return deserialize_errc::protocol_value_error;
-    to = field_view(v);
-    return deserialize_errc::ok;
+    std::uint64_t res = 0;
+    bool ok = true;
+    for (std::size_t i = 0; i < num_digits; ++i)
+    {
+        unsigned digit = static_cast<unsigned char>(from[i]) - static_cast<unsigned>('0');
+        ok &= digit <= 9u;
+        res = res * 10u + digit;
+    }
+    to = res;
+    return ok;
+}
+
+BOOST_MYSQL_STATIC_OR_INLINE
+bool parse_text_digits(const char* from, std::size_t num_digits, unsigned& to) noexcept
+{
+    BOOST_ASSERT(num_digits <= 9u);  // avoid overflow
+    std::uint64_t res = 0;
+    bool ok = parse_text_digits(from, num_digits, res);
+    to = static_cast<unsigned>(res);
+    return ok;
 }
 
+// Parses an unsigned decimal number of any length, detecting overflow
+BOOST_MYSQL_STATIC_OR_INLINE
+bool parse_text_uint(const char* first, const char* last, std::uint64_t& to) noexcept
+{
+    // 20 digits is enough for any 64-bit number. Leading zeros may make the string longer
+    constexpr std::size_t max_digits = 20;
+
+    if (first == last)
+        return false;
+    while (last - first > 1 && *first == '0')
+        ++first;
+    std::size_t size = static_cast<std::size_t>(last - first);
+    if (size > max_digits)
+        return false;
+
+    // Numbers with less than max_digits digits can't overflow
+    if (size < max_digits)
+        return parse_text_digits(first, size, to);
+
+    std::uint64_t head{};
+    if (!parse_text_digits(first, max_digits - 1, head))
+        return false;
+    unsigned digit = static_cast<unsigned char>(first[max_digits - 1]) - static_cast<unsigned>('0');
+    constexpr auto max_value = (std::numeric_limits<std::uint64_t>::max)();
+    if (digit > 9u || head > (max_value - digit) / 10u)
+        return false;
+    to = head * 10u + digit;
+    return true;
+}
+
+// Integers. We accept an optional sign, like the lexical_cast-based
+// implementation we used to have. Negative numbers are also accepted for unsigned
+// types, and wrap around, for the same reason.
 BOOST_MYSQL_STATIC_OR_INLINE deserialize_errc
 deserialize_text_value_int(string_view from, field_view& to, const metadata& meta) noexcept
 {
-    return meta.is_unsigned() ? deserialize_text_value_int_impl<std::uint64_t>(from, to)
-                              : deserialize_text_value_int_impl<std::int64_t>(from, to);
+    const char* first = from.data();
+    const char* last = first + from.size();
+
+    // Sign
+    bool is_negative = false;
+    if (first != last && (*first == '-' || *first == '+'))
+    {
+        is_negative = *first == '-';
+        ++first;
+    }
+
+    // Magnitude
+    std::uint64_t magnitude{};
+    if (!parse_text_uint(first, last, magnitude))
+        return deserialize_errc::protocol_value_error;
+
+    if (meta.is_unsigned())
+    {
+        to = field_view(is_negative ? 0u - magnitude : magnitude);
+    }
+    else
+    {
+        constexpr auto max_magnitude = static_cast<std::uint64_t>((std::numeric_limits<std::int64_t>::max)());
+        if (magnitude > max_magnitude + (is_negative ? 1u : 0u))
+            return deserialize_errc::protocol_value_error;
+        // Two's complement negation, computed in unsigned arithmetic to avoid overflow
+        to = field_view(
+            is_negative ? -static_cast<std::int64_t>(magnitude - 1u) - 1
+                        : static_cast<std::int64_t>(magnitude)
+        );
+    }
+    return deserialize_errc::ok;
 }
 
 // Floating points
+template <class T>
+BOOST_MYSQL_STATIC_OR_INLINE bool parse_text_float(string_view from, T& to) noexcept
+{
+#ifdef BOOST_MYSQL_HAS_FROM_CHARS_FLOAT
+    const char* first = from.data();
+    const char* last = first + from.size();
+
+    // from_chars doesn't accept a leading plus sign
+    if (first != last && *first == '+')
+    {
+        ++first;
+        if (first != last && *first == '-')
+            return false;
+    }
+
+    auto res = std::from_chars(first, last, to);
+    return res.ec == std::errc() && res.ptr == last;
+#else
+    return boost::conversion::try_lexical_convert(from.data(), from.size(), to);
+#endif
+}
+
 template <class T>
 BOOST_MYSQL_STATIC_OR_INLINE deserialize_errc
 deserialize_text_value_float(string_view from, field_view& to) noexcept
 {
     T val;
-    bool ok = boost::conversion::try_lexical_convert(from.data(), from.size(), val);
+    bool ok = parse_text_float(from, val);
     if (!ok || std::isnan(val) || std::isinf(val))  // SQL std forbids these values
         return deserialize_errc::protocol_value_error;
     to = field_view(val);
@@ -123,7 +224,41 @@ BOOST_MYSQL_STATIC_OR_INLINE unsigned sanitize_decimals(unsigned decimals) noexc
 // account decimals (85 with 2 decimals means 850000us)
 BOOST_MYSQL_STATIC_OR_INLINE unsigned compute_micros(unsigned parsed_micros, unsigned decimals) noexcept
 {
-    return parsed_micros * static_cast<unsigned>(std::pow(10, max_decimals - decimals));
+    BOOST_ASSERT(decimals <= max_decimals);
+    static constexpr unsigned multipliers[] = {1000000, 100000, 10000, 1000, 100, 10, 1};
+    return parsed_micros * multipliers[decimals];
+}
+
+// Parses hh:mm:ss[.uuuuuu], where hh has num_hour_digits digits and the fractional part
+// has decimals digits. The caller must have checked that from has the right size.
+BOOST_MYSQL_STATIC_OR_INLINE bool parse_text_hms(
+    const char* from,
+    std::size_t num_hour_digits,
+    unsigned decimals,
+    unsigned& hours,
+    unsigned& minutes,
+    unsigned& seconds,
+    unsigned& micros
+) noexcept
+{
+    using namespace textc;
+
+    bool ok = parse_text_digits(from, num_hour_digits, hours);
+    from += num_hour_digits;
+    ok &= *from++ == ':';
+    ok &= parse_text_digits(from, mins_sz, minutes);
+    from += mins_sz;
+    ok &= *from++ == ':';
+    ok &= parse_text_digits(from, secs_sz, seconds);
+    from += secs_sz;
+    micros = 0;
+    if (decimals)
+    {
+        ok &= *from++ == '.';
+        ok &= parse_text_digits(from, decimals, micros);
+        micros = compute_micros(micros, decimals);
+    }
+    return ok;
 }
 
 BOOST_MYSQL_STATIC_OR_INLINE deserialize_errc deserialize_text_ymd(string_view from, date& to)
@@ -134,15 +269,15 @@ BOOST_MYSQL_STATIC_OR_INLINE deserialize_errc deserialize_text_ymd(string_view f
     if (from.size() != date_sz)
         return deserialize_errc::protocol_value_error;
 
-    // Copy to a NULL-terminated buffer
-    char buffer[date_sz + 1]{};
-    std::memcpy(buffer, from.data(), from.size());
-
-    // Parse individual components
+    // Parse individual components. Each one has a fixed number of digits
+    const char* first = from.data();
     unsigned year, month, day;
-    char extra_char;
-    int parsed = sscanf(buffer, "%4u-%2u-%2u%c", &year, &month, &day, &extra_char);
-    if (parsed != 3)
+    bool ok = parse_text_digits(first, year_sz, year);
+    ok &= first[year_sz] == '-';
+    ok &= parse_text_digits(first + year_sz + 1, month_sz, month);
+    ok &= first[year_sz + month_sz + 1] == '-';
+    ok &= parse_text_digits(first + year_sz + month_sz + 2, day_sz, day);
+    if (!ok)
         return deserialize_errc::protocol_value_error;
 
     // Range check for individual components. MySQL doesn't allow invidiual components
@@ -188,27 +323,20 @@ deserialize_text_value_datetime(string_view from, field_view& to, const metadata
     if (err != deserialize_errc::ok)
         return err;
 
-    // Copy to NULL-terminated buffer
+    // Parse the time part. The date/time delimiter is not checked
     constexpr std::size_t datetime_time_first = date_sz + 1;  // date + space
-    char buffer[datetime_max_sz - datetime_time_first + 1]{};
-    std::memcpy(buffer, from.data() + datetime_time_first, from.size() - datetime_time_first);
-
-    // Parse
-    unsigned hours, minutes, seconds;
-    unsigned micros = 0;
-    char extra_char;
-    if (decimals)
+    unsigned hours, minutes, seconds, micros;
+    if (!parse_text_hms(
+            from.data() + datetime_time_first,
+            hours_min_sz,
+            decimals,
+            hours,
+            minutes,
+            seconds,
+            micros
+        ))
     {
-        int parsed = sscanf(buffer, "%2u:%2u:%2u.%6u%c", &hours, &minutes, &seconds, &micros, &extra_char);
-        if (parsed != 4)
-            return deserialize_errc::protocol_value_error;
-        micros = compute_micros(micros, decimals);
-    }
-    else
-    {
-        int parsed = sscanf(buffer, "%2u:%2u:%2u%c", &hours, &minutes, &seconds, &extra_char);
-        if (parsed != 3)
-            return deserialize_errc::protocol_value_error;
+        return deserialize_errc::protocol_value_error;
     }
 
     // Validity check. Although MySQL allows invalid and zero datetimes, it doesn't allow
@@ -239,38 +367,21 @@ deserialize_text_value_time(string_view from, field_view& to, const metadata& me
     // Sanitize decimals
     unsigned decimals = sanitize_decimals(meta.decimals());
 
-    // size check
-    std::size_t actual_min_size = time_min_sz + (decimals ? decimals + 1 : 0);
-    std::size_t actual_max_size = actual_min_size + 1 + 1;  // hour extra character and sign
-    BOOST_ASSERT(actual_max_size <= time_max_sz);
-    if (from.size() < actual_min_size || from.size() > actual_max_size)
-        return deserialize_errc::protocol_value_error;
-
-    // Copy to NULL-terminated buffer
-    char buffer[time_max_sz + 1]{};
-    memcpy(buffer, from.data(), from.size());
-
     // Sign
-    bool is_negative = from[0] == '-';
-    const char* first = is_negative ? buffer + 1 : buffer;
+    bool is_negative = !from.empty() && from[0] == '-';
+    if (is_negative)
+        from = from.substr(1);
+
+    // size check. Hours may have an extra character
+    std::size_t min_size = time_min_sz + (decimals ? decimals + 1 : 0);
+    if (from.size() != min_size && from.size() != min_size + 1)
+        return deserialize_errc::protocol_value_error;
+    std::size_t num_hour_digits = hours_min_sz + (from.size() - min_size);
 
     // Parse it
-    unsigned hours, minutes, seconds;
-    unsigned micros = 0;
-    char extra_char;
-    if (decimals)
-    {
-        int parsed = sscanf(first, "%3u:%2u:%2u.%6u%c", &hours, &minutes, &seconds, &micros, &extra_char);
-        if (parsed != 4)
-            return deserialize_errc::protocol_value_error;
-        micros = compute_micros(micros, decimals);
-    }
-    else
-    {
-        int parsed = sscanf(first, "%3u:%2u:%2u%c", &hours, &minutes, &seconds, &extra_char);
-        if (parsed != 3)
-            return deserialize_errc::protocol_value_error;
-    }
+    unsigned hours, minutes, seconds, micros;
+    if (!parse_text_hms(from.data(), num_hour_digits, decimals, hours, minutes, seconds, micros))
+        return deserialize_errc::protocol_value_error;
 
     // Range check
     if (hours > time_max_hour || minutes > max_min || seconds > max_sec || micros > max_micro)
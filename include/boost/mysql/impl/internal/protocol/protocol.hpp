@@ -31,6 +31,7 @@
 #include <cstddef>
 #include <cstdint>
 #include <type_traits>
+#include <vector>
 
 namespace boost {
 namespace mysql {
@@ -87,6 +88,28 @@ struct ping_command
 BOOST_ATTRIBUTE_NODISCARD BOOST_MYSQL_DECL error_code
 deserialize_ping_response(span<const std::uint8_t> message, db_flavor flavor, diagnostics& diag);
 
+// Reset connection
+struct reset_connection_command
+{
+    BOOST_MYSQL_DECL std::size_t get_size() const noexcept;
+    BOOST_MYSQL_DECL void serialize(span<std::uint8_t> buffer) const noexcept;
+};
+BOOST_ATTRIBUTE_NODISCARD BOOST_MYSQL_DECL error_code
+deserialize_reset_connection_response(span<const std::uint8_t> message, db_flavor flavor, diagnostics& diag);
+
+// Change user. The server responds like to a login request
+struct change_user_command
+{
+    string_view username;
+    span<const std::uint8_t> auth_response;  // at most 255 bytes
+    string_view database;
+    std::uint16_t collation_id;
+    string_view auth_plugin_name;
+
+    BOOST_MYSQL_DECL std::size_t get_size() const noexcept;
+    BOOST_MYSQL_DECL void serialize(span<std::uint8_t> buffer) const noexcept;
+};
+
 // Query
 struct query_command
 {
@@ -109,24 +132,71 @@ struct prepare_stmt_response
     std::uint32_t id;
     std::uint16_t num_columns;
     std::uint16_t num_params;
+    bool metadata_follows;  // if false, no parameter or column definitions follow
 };
+
+// optional_metadata should be true if CLIENT_OPTIONAL_RESULTSET_METADATA has been negotiated.
+// The response then contains a metadata_follows flag
 BOOST_ATTRIBUTE_NODISCARD BOOST_MYSQL_DECL error_code deserialize_prepare_stmt_response_impl(
     span<const std::uint8_t> message,
-    prepare_stmt_response& output
+    prepare_stmt_response& output,
+    bool optional_metadata = false
 ) noexcept;  // exposed for testing, doesn't take header into account
 
 BOOST_ATTRIBUTE_NODISCARD BOOST_MYSQL_DECL error_code deserialize_prepare_stmt_response(
     span<const std::uint8_t> message,
     db_flavor flavor,
     prepare_stmt_response& output,
-    diagnostics& diag
+    diagnostics& diag,
+    bool optional_metadata = false
 );
 
+// Gather writes. Data that is sent in place, rather than being copied into the write buffer.
+// offset is the position in the serialized (inline) bytes where data should be inserted
+struct external_buffer
+{
+    std::size_t offset;
+    span<const std::uint8_t> data;
+};
+
 // Execute statement
 struct execute_stmt_command
 {
     std::uint32_t statement_id;
     span<const field_view> params;
+    bool send_types;   // if false, the server uses the types sent by the previous execution
+    bool open_cursor;  // if true, opens a read-only cursor. Rows are then retrieved with COM_STMT_FETCH
+
+    // If not empty, has one element per parameter. Parameters with a non-zero element
+    // have been sent with COM_STMT_SEND_LONG_DATA, and only their type is serialized
+    span<const std::uint8_t> long_data;
+
+    bool is_long_data(std::size_t param_index) const noexcept
+    {
+        return !long_data.empty() && long_data[param_index] != 0u;
+    }
+
+    BOOST_MYSQL_DECL std::size_t get_size() const noexcept;
+    BOOST_MYSQL_DECL void serialize(span<std::uint8_t> buffer) const noexcept;
+
+    // Gather serialization. The contents of string and blob parameters with at least
+    // external_min_size bytes are not copied into buffer, but appended to external, in order.
+    // buffer should have get_size() - get_external_size(external_min_size) bytes
+    BOOST_MYSQL_DECL std::size_t get_external_size(std::size_t external_min_size) const noexcept;
+    BOOST_MYSQL_DECL void serialize(
+        span<std::uint8_t> buffer,
+        std::size_t external_min_size,
+        std::vector<external_buffer>& external
+    ) const;
+};
+
+// Execute statement in bulk (COM_STMT_BULK_EXECUTE, MariaDB only). Requires
+// MARIADB_CLIENT_STMT_BULK_OPERATIONS. Runs the statement once per row of parameters
+struct execute_stmt_bulk_command
+{
+    std::uint32_t statement_id;
+    span<const field_view> params;  // the parameters for all rows, one row after another
+    std::size_t num_params;         // per row, > 0. Non-NULL values in a column must have the same kind
 
     BOOST_MYSQL_DECL std::size_t get_size() const noexcept;
     BOOST_MYSQL_DECL void serialize(span<std::uint8_t> buffer) const noexcept;
@@ -144,36 +214,101 @@ struct close_stmt_command
     BOOST_MYSQL_DECL void serialize(span<std::uint8_t> buffer) const noexcept;
 };
 
+// Send a chunk of a statement parameter value (COM_STMT_SEND_LONG_DATA).
+// The server doesn't send any response to this command. The data is appended
+// to the parameter value until the statement is executed or reset
+struct send_long_data_command
+{
+    std::uint32_t statement_id;
+    std::uint16_t param_id;
+    span<const std::uint8_t> data;
+
+    // Size of the message, excluding data
+    static constexpr std::size_t head_size = 7u;
+
+    BOOST_MYSQL_DECL std::size_t get_size() const noexcept;
+    BOOST_MYSQL_DECL void serialize(span<std::uint8_t> buffer) const noexcept;
+
+    // Serializes the message head only. Data should be placed immediately after it
+    BOOST_MYSQL_DECL void serialize_head(span<std::uint8_t> buffer) const noexcept;
+};
+
+// Reset statement (COM_STMT_RESET). Discards any data sent by COM_STMT_SEND_LONG_DATA
+// and closes any open cursor. The response is an OK or error packet
+struct reset_stmt_command
+{
+    std::uint32_t statement_id;
+
+    BOOST_MYSQL_DECL std::size_t get_size() const noexcept;
+    BOOST_MYSQL_DECL void serialize(span<std::uint8_t> buffer) const noexcept;
+};
+BOOST_ATTRIBUTE_NODISCARD BOOST_MYSQL_DECL error_code
+deserialize_reset_stmt_response(span<const std::uint8_t> message, db_flavor flavor, diagnostics& diag);
+
+// Fetch rows from a cursor opened by an execute_stmt_command
+struct fetch_stmt_command
+{
+    std::uint32_t statement_id;
+    std::uint32_t num_rows;
+
+    BOOST_MYSQL_DECL std::size_t get_size() const noexcept;
+    BOOST_MYSQL_DECL void serialize(span<std::uint8_t> buffer) const noexcept;
+};
+
 // Execution messages
 static_assert(std::is_trivially_destructible<error_code>::value, "");
+struct local_infile_request
+{
+    string_view filename;
+};
+
 struct execute_response
 {
     enum class type_t
     {
         num_fields,
         ok_packet,
-        error
+        error,
+        local_infile
     } type;
     union data_t
     {
         std::size_t num_fields;
         ok_view ok_pack;
         error_code err;
+        local_infile_request infile;
 
         data_t(size_t v) noexcept : num_fields(v) {}
         data_t(const ok_view& v) noexcept : ok_pack(v) {}
         data_t(error_code v) noexcept : err(v) {}
+        data_t(local_infile_request v) noexcept : infile(v) {}
     } data;
 
-    execute_response(std::size_t v) noexcept : type(type_t::num_fields), data(v) {}
+    // Only meaningful for type_t::num_fields. If false, the server omitted the column definitions,
+    // and the ones it sent previously for the statement being executed should be used
+    bool metadata_follows{true};
+
+    execute_response(std::size_t v, bool metadata_follows = true) noexcept
+        : type(type_t::num_fields), data(v), metadata_follows(metadata_follows)
+    {
+    }
     execute_response(const ok_view& v) noexcept : type(type_t::ok_packet), data(v) {}
     execute_response(error_code v) noexcept : type(type_t::error), data(v) {}
+    execute_response(local_infile_request v) noexcept : type(type_t::local_infile), data(v) {}
 };
+
+// local_infile_enabled should be true if CLIENT_LOCAL_FILES has been negotiated.
+// Otherwise, 0xfb is a regular field count.
+// optional_metadata should be true if CLIENT_OPTIONAL_RESULTSET_METADATA (MySQL) or
+// MARIADB_CLIENT_CACHE_METADATA (MariaDB) have been negotiated. The field count is
+// then followed by a metadata_follows flag
 BOOST_MYSQL_DECL
 execute_response deserialize_execute_response(
     span<const std::uint8_t> msg,
     db_flavor flavor,
-    diagnostics& diag
+    diagnostics& diag,
+    bool local_infile_enabled = false,
+    bool optional_metadata = false
 ) noexcept;
 
 struct row_message
@@ -215,8 +350,10 @@ struct server_hello
 {
     using auth_buffer_type = static_buffer<8 + 0xff>;
     db_flavor server;
+    std::uint32_t connection_id{};  // the server thread ID, used by KILL
     auth_buffer_type auth_plugin_data;
     capabilities server_capabilities{};
+    capabilities mariadb_capabilities{};  // extended capabilities, only sent by MariaDB servers
     string_view auth_plugin_name;
 };
 BOOST_ATTRIBUTE_NODISCARD BOOST_MYSQL_DECL error_code deserialize_server_hello_impl(
@@ -237,6 +374,8 @@ struct login_request
     span<const std::uint8_t> auth_response;
     string_view database;
     string_view auth_plugin_name;
+    std::uint8_t zstd_compression_level;  // only sent if CLIENT_ZSTD_COMPRESSION_ALGORITHM
+    capabilities mariadb_capabilities;    // extended capabilities, zero for MySQL servers
 
     BOOST_MYSQL_DECL std::size_t get_size() const noexcept;
     BOOST_MYSQL_DECL void serialize(span<std::uint8_t> buffer) const noexcept;
@@ -247,6 +386,7 @@ struct ssl_request
     capabilities negotiated_capabilities;
     std::uint32_t max_packet_size;
     std::uint32_t collation_id;
+    capabilities mariadb_capabilities;  // extended capabilities, zero for MySQL servers
 
     BOOST_MYSQL_DECL std::size_t get_size() const noexcept;
     BOOST_MYSQL_DECL void serialize(span<std::uint8_t> buffer) const noexcept;
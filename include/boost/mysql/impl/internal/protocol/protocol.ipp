@@ -18,6 +18,7 @@
 #include <boost/mysql/string_view.hpp>
 
 #include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/row_field_reader.hpp>
 
 #include <boost/mysql/impl/internal/error/server_error_to_string.hpp>
 #include <boost/mysql/impl/internal/make_string_view.hpp>
@@ -46,8 +47,11 @@ BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint8_t handshake_protocol_version
 BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint8_t error_packet_header = 0xff;
 BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint8_t ok_packet_header = 0x00;
 BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint8_t eof_packet_header = 0xfe;
+BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint8_t local_infile_header = 0xfb;
 BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint8_t auth_switch_request_header = 0xfe;
 BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint8_t auth_more_data_header = 0x01;
+BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint8_t resultset_metadata_none = 0x00;
+BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint8_t resultset_metadata_full = 0x01;
 BOOST_MYSQL_STATIC_IF_COMPILED constexpr string_view fast_auth_complete_challenge = make_string_view("\3");
 
 // Helpers
@@ -64,6 +68,31 @@ struct frame_header_packet
     std::uint8_t sequence_number;
 };
 
+BOOST_MYSQL_STATIC_OR_INLINE
+bool is_valid_resultset_metadata(std::uint8_t v) noexcept
+{
+    return v == resultset_metadata_none || v == resultset_metadata_full;
+}
+
+// Servers may send old-style EOF packets even if CLIENT_DEPRECATE_EOF was negotiated
+// (e.g. after the metadata of a resultset read using a cursor). These contain just the
+// warning count and status flags, while an OK packet contains at least 6 bytes after its header
+BOOST_MYSQL_STATIC_OR_INLINE
+bool is_legacy_eof_packet(std::size_t size_without_header) noexcept { return size_without_header == 4u; }
+
+BOOST_MYSQL_STATIC_OR_INLINE
+error_code deserialize_legacy_eof_packet(span<const std::uint8_t> msg, ok_view& output) noexcept
+{
+    std::uint16_t warnings{};
+    std::uint16_t status_flags{};
+    deserialization_context ctx(msg);
+    auto err = deserialize(ctx, warnings, status_flags);
+    if (err != deserialize_errc::ok)
+        return to_error_code(err);
+    output = ok_view{0u, 0u, status_flags, warnings, string_view()};
+    return ctx.check_extra_bytes();
+}
+
 // Maps from an actual value to a protocol_field_type (for execute statement). Only value's type is used
 static protocol_field_type get_protocol_field_type(field_view input) noexcept
 {
@@ -336,6 +365,51 @@ boost::mysql::error_code boost::mysql::detail::deserialize_ping_response(
     }
 }
 
+// reset connection
+std::size_t boost::mysql::detail::reset_connection_command::get_size() const noexcept { return 1u; }
+void boost::mysql::detail::reset_connection_command::serialize(span<std::uint8_t> buff) const noexcept
+{
+    serialize_command_id(buff, 0x1f);
+}
+
+boost::mysql::error_code boost::mysql::detail::deserialize_reset_connection_response(
+    span<const std::uint8_t> message,
+    db_flavor flavor,
+    diagnostics& diag
+)
+{
+    // The server replies with either an OK or an error packet, exactly like for ping
+    return deserialize_ping_response(message, flavor, diag);
+}
+
+// change user
+std::size_t boost::mysql::detail::change_user_command::get_size() const noexcept
+{
+    return 1u +  // command ID
+           ::boost::mysql::detail::get_size(string_null{username}) + 1u + auth_response.size() +
+           ::boost::mysql::detail::get_size(string_null{database}) + 2u +
+           ::boost::mysql::detail::get_size(string_null{auth_plugin_name});
+}
+
+void boost::mysql::detail::change_user_command::serialize(span<std::uint8_t> buff) const noexcept
+{
+    constexpr std::uint8_t command_id = 0x11;
+
+    BOOST_ASSERT(buff.size() >= get_size());
+    BOOST_ASSERT(auth_response.size() <= 0xffu);
+    serialization_context ctx(buff.data());
+    ::boost::mysql::detail::serialize(
+        ctx,
+        command_id,
+        string_null{username},
+        static_cast<std::uint8_t>(auth_response.size()),
+        string_eof{to_string(auth_response)},
+        string_null{database},
+        collation_id,
+        string_null{auth_plugin_name}
+    );
+}
+
 // query
 std::size_t boost::mysql::detail::query_command::get_size() const noexcept
 {
@@ -366,7 +440,8 @@ void boost::mysql::detail::prepare_stmt_command::serialize(span<std::uint8_t> bu
 
 boost::mysql::error_code boost::mysql::detail::deserialize_prepare_stmt_response_impl(
     span<const std::uint8_t> message,
-    prepare_stmt_response& output
+    prepare_stmt_response& output,
+    bool optional_metadata
 ) noexcept
 {
     struct com_stmt_prepare_ok_packet
@@ -377,7 +452,7 @@ boost::mysql::error_code boost::mysql::detail::deserialize_prepare_stmt_response
         std::uint16_t num_params;
         std::uint8_t reserved_1;  // must be 0
         std::uint16_t warning_count;
-        // std::uint8_t metadata_follows when CLIENT_OPTIONAL_RESULTSET_METADATA: not implemented
+        std::uint8_t metadata_follows;  // only present if CLIENT_OPTIONAL_RESULTSET_METADATA
     } pack{};
 
     deserialization_context ctx(message);
@@ -393,10 +468,21 @@ boost::mysql::error_code boost::mysql::detail::deserialize_prepare_stmt_response
     if (err != deserialize_errc::ok)
         return to_error_code(err);
 
+    pack.metadata_follows = resultset_metadata_full;
+    if (optional_metadata)
+    {
+        err = deserialize(ctx, pack.metadata_follows);
+        if (err != deserialize_errc::ok)
+            return to_error_code(err);
+        if (!is_valid_resultset_metadata(pack.metadata_follows))
+            return client_errc::protocol_value_error;
+    }
+
     output = prepare_stmt_response{
         pack.statement_id,
         pack.num_columns,
         pack.num_params,
+        pack.metadata_follows == resultset_metadata_full,
     };
 
     return ctx.check_extra_bytes();
@@ -406,7 +492,8 @@ boost::mysql::error_code boost::mysql::detail::deserialize_prepare_stmt_response
     span<const std::uint8_t> message,
     db_flavor flavor,
     prepare_stmt_response& output,
-    diagnostics& diag
+    diagnostics& diag,
+    bool optional_metadata
 )
 {
     deserialization_context ctx(message);
@@ -425,7 +512,7 @@ boost::mysql::error_code boost::mysql::detail::deserialize_prepare_stmt_response
     }
     else
     {
-        return deserialize_prepare_stmt_response_impl(ctx.to_span(), output);
+        return deserialize_prepare_stmt_response_impl(ctx.to_span(), output, optional_metadata);
     }
 }
 
@@ -441,7 +528,7 @@ boost::mysql::error_code boost::mysql::detail::deserialize_prepare_stmt_response
 //      array<meta_packet, num_params> meta;
 //          protocol_field_type type;
 //          std::uint8_t unsigned_flag;
-//      array<field_view, num_params> params;
+//      array<field_view, num_params> params; // except the ones sent by COM_STMT_SEND_LONG_DATA
 std::size_t boost::mysql::detail::execute_stmt_command::get_size() const noexcept
 {
     constexpr std::size_t param_meta_packet_size = 2;           // type + unsigned flag
@@ -455,31 +542,62 @@ std::size_t boost::mysql::detail::execute_stmt_command::get_size() const noexcep
     {
         res += null_bitmap_traits(stmt_execute_null_bitmap_offset, num_params).byte_count();
         res += 1;  // new_params_bind_flag
-        res += param_meta_packet_size * num_params;
-        for (field_view param : params)
+        if (send_types)
+            res += param_meta_packet_size * num_params;
+        for (std::size_t i = 0; i < num_params; ++i)
         {
-            res += ::boost::mysql::detail::get_size(param);
+            if (!is_long_data(i))
+                res += ::boost::mysql::detail::get_size(params[i]);
         }
     }
 
     return res;
 }
 
-void boost::mysql::detail::execute_stmt_command::serialize(span<std::uint8_t> buff) const noexcept
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// The contents of string and blob parameters, which may be sent in place (gather writes)
+inline span<const std::uint8_t> get_string_bytes(field_view param) noexcept
+{
+    if (param.is_string())
+    {
+        string_view s = param.get_string();
+        return {reinterpret_cast<const std::uint8_t*>(s.data()), s.size()};
+    }
+    else if (param.is_blob())
+    {
+        blob_view b = param.get_blob();
+        return {b.data(), b.size()};
+    }
+    else
+    {
+        return {};
+    }
+}
+
+// If external is nullptr, all parameters are copied into buff
+inline void serialize_execute_stmt(
+    const execute_stmt_command& cmd,
+    span<std::uint8_t> buff,
+    std::size_t external_min_size,
+    std::vector<external_buffer>* external
+)
 {
     constexpr std::uint8_t command_id = 0x17;
 
     serialization_context ctx(buff.data());
-    BOOST_ASSERT(buff.size() >= get_size());
 
-    std::uint32_t statement_id = this->statement_id;
-    std::uint8_t flags = 0;
+    std::uint32_t statement_id = cmd.statement_id;
+    std::uint8_t flags = cmd.open_cursor ? cursor_types::read_only : cursor_types::no_cursor;
     std::uint32_t iteration_count = 1;
-    std::uint8_t new_params_bind_flag = 1;
+    std::uint8_t new_params_bind_flag = cmd.send_types ? 1 : 0;
 
     ::boost::mysql::detail::serialize(ctx, command_id, statement_id, flags, iteration_count);
 
     // Number of parameters
+    auto params = cmd.params;
     auto num_params = params.size();
 
     if (num_params > 0)
@@ -500,16 +618,155 @@ void boost::mysql::detail::execute_stmt_command::serialize(span<std::uint8_t> bu
         ::boost::mysql::detail::serialize(ctx, new_params_bind_flag);
 
         // value metadata
-        for (field_view param : params)
+        if (cmd.send_types)
+        {
+            for (field_view param : params)
+            {
+                protocol_field_type type = get_protocol_field_type(param);
+                std::uint8_t unsigned_flag = param.is_uint64() ? std::uint8_t(0x80) : std::uint8_t(0);
+                ::boost::mysql::detail::serialize(ctx, type, unsigned_flag);
+            }
+        }
+
+        // actual values. Large strings and blobs only get their length serialized here.
+        // Values sent with COM_STMT_SEND_LONG_DATA are omitted
+        for (std::size_t i = 0; i < num_params; ++i)
         {
-            protocol_field_type type = get_protocol_field_type(param);
-            std::uint8_t unsigned_flag = param.is_uint64() ? std::uint8_t(0x80) : std::uint8_t(0);
-            ::boost::mysql::detail::serialize(ctx, type, unsigned_flag);
+            if (cmd.is_long_data(i))
+                continue;
+            field_view param = params[i];
+            auto data = get_string_bytes(param);
+            if (external && data.size() >= external_min_size)
+            {
+                ::boost::mysql::detail::serialize(ctx, int_lenenc{data.size()});
+                external->push_back({static_cast<std::size_t>(ctx.first() - buff.data()), data});
+            }
+            else
+            {
+                ::boost::mysql::detail::serialize(ctx, param);
+            }
         }
+    }
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+void boost::mysql::detail::execute_stmt_command::serialize(span<std::uint8_t> buff) const noexcept
+{
+    BOOST_ASSERT(buff.size() >= get_size());
+    serialize_execute_stmt(*this, buff, 0u, nullptr);
+}
+
+std::size_t boost::mysql::detail::execute_stmt_command::get_external_size(
+    std::size_t external_min_size
+) const noexcept
+{
+    std::size_t res = 0;
+    for (std::size_t i = 0; i < params.size(); ++i)
+    {
+        if (is_long_data(i))
+            continue;
+        std::size_t size = get_string_bytes(params[i]).size();
+        if (size >= external_min_size)
+            res += size;
+    }
+    return res;
+}
+
+void boost::mysql::detail::execute_stmt_command::serialize(
+    span<std::uint8_t> buff,
+    std::size_t external_min_size,
+    std::vector<external_buffer>& external
+) const
+{
+    BOOST_ASSERT(buff.size() >= get_size() - get_external_size(external_min_size));
+    serialize_execute_stmt(*this, buff, external_min_size, &external);
+}
+
+// execute statement in bulk
+// The wire layout is as follows:
+//  command ID
+//  std::uint32_t statement_id;
+//  std::uint16_t flags; // we always send types
+//  array<meta_packet, num_params> meta;
+//      protocol_field_type type;
+//      std::uint8_t unsigned_flag;
+//  for each row, array<param, num_params> params;
+//      std::uint8_t indicator; // none or null
+//      field_view value; // only if indicator is none
+namespace boost {
+namespace mysql {
+namespace detail {
+
+BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint16_t stmt_bulk_send_types_flag = 128;
+BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint8_t stmt_bulk_indicator_none = 0;
+BOOST_MYSQL_STATIC_IF_COMPILED constexpr std::uint8_t stmt_bulk_indicator_null = 1;
+
+// The type sent for a column is the one of its first non-NULL value
+BOOST_MYSQL_STATIC_OR_INLINE
+field_view get_bulk_column_type(const execute_stmt_bulk_command& cmd, std::size_t column) noexcept
+{
+    for (std::size_t i = column; i < cmd.params.size(); i += cmd.num_params)
+    {
+        if (!cmd.params[i].is_null())
+            return cmd.params[i];
+    }
+    return field_view();
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+std::size_t boost::mysql::detail::execute_stmt_bulk_command::get_size() const noexcept
+{
+    constexpr std::size_t param_meta_packet_size = 2;        // type + unsigned flag
+    constexpr std::size_t stmt_bulk_packet_head_size = 1     // command ID
+                                                       + 4   // statement_id
+                                                       + 2;  // flags
+    std::size_t res = stmt_bulk_packet_head_size + param_meta_packet_size * num_params;
+    res += params.size();  // indicators
+    for (field_view param : params)
+    {
+        res += ::boost::mysql::detail::get_size(param);
+    }
+    return res;
+}
+
+void boost::mysql::detail::execute_stmt_bulk_command::serialize(span<std::uint8_t> buff) const noexcept
+{
+    constexpr std::uint8_t command_id = 0xfa;
+
+    serialization_context ctx(buff.data());
+    BOOST_ASSERT(buff.size() >= get_size());
+    BOOST_ASSERT(num_params > 0u);
+    BOOST_ASSERT(params.size() % num_params == 0u);
 
-        // actual values
-        for (field_view param : params)
+    std::uint32_t statement_id = this->statement_id;
+    std::uint16_t flags = stmt_bulk_send_types_flag;
+    ::boost::mysql::detail::serialize(ctx, command_id, statement_id, flags);
+
+    // value metadata
+    for (std::size_t i = 0; i < num_params; ++i)
+    {
+        field_view type_source = get_bulk_column_type(*this, i);
+        protocol_field_type type = get_protocol_field_type(type_source);
+        std::uint8_t unsigned_flag = type_source.is_uint64() ? std::uint8_t(0x80) : std::uint8_t(0);
+        ::boost::mysql::detail::serialize(ctx, type, unsigned_flag);
+    }
+
+    // actual values
+    for (field_view param : params)
+    {
+        if (param.is_null())
         {
+            ::boost::mysql::detail::serialize(ctx, stmt_bulk_indicator_null);
+        }
+        else
+        {
+            ::boost::mysql::detail::serialize(ctx, stmt_bulk_indicator_none);
             ::boost::mysql::detail::serialize(ctx, param);
         }
     }
@@ -528,14 +785,76 @@ void boost::mysql::detail::close_stmt_command::serialize(span<std::uint8_t> buff
     ::boost::mysql::detail::serialize(ctx, command_id, statement_id);
 }
 
+// send long data
+std::size_t boost::mysql::detail::send_long_data_command::get_size() const noexcept
+{
+    return head_size + data.size();
+}
+
+void boost::mysql::detail::send_long_data_command::serialize_head(span<std::uint8_t> buff) const noexcept
+{
+    constexpr std::uint8_t command_id = 0x18;
+
+    serialization_context ctx(buff.data());
+    BOOST_ASSERT(buff.size() >= head_size);
+
+    ::boost::mysql::detail::serialize(ctx, command_id, statement_id, param_id);
+}
+
+void boost::mysql::detail::send_long_data_command::serialize(span<std::uint8_t> buff) const noexcept
+{
+    BOOST_ASSERT(buff.size() >= get_size());
+    serialize_head(buff);
+    serialization_context ctx(buff.data() + head_size);
+    ctx.write(data.data(), data.size());
+}
+
+// reset statement
+std::size_t boost::mysql::detail::reset_stmt_command::get_size() const noexcept { return 5u; }
+
+void boost::mysql::detail::reset_stmt_command::serialize(span<std::uint8_t> buff) const noexcept
+{
+    constexpr std::uint8_t command_id = 0x1a;
+
+    serialization_context ctx(buff.data());
+    BOOST_ASSERT(buff.size() >= get_size());
+
+    ::boost::mysql::detail::serialize(ctx, command_id, statement_id);
+}
+
+boost::mysql::error_code boost::mysql::detail::deserialize_reset_stmt_response(
+    span<const std::uint8_t> message,
+    db_flavor flavor,
+    diagnostics& diag
+)
+{
+    // The server replies with either an OK or an error packet, exactly like for ping
+    return deserialize_ping_response(message, flavor, diag);
+}
+
+// fetch statement
+std::size_t boost::mysql::detail::fetch_stmt_command::get_size() const noexcept { return 9u; }
+
+void boost::mysql::detail::fetch_stmt_command::serialize(span<std::uint8_t> buff) const noexcept
+{
+    constexpr std::uint8_t command_id = 0x1c;
+
+    serialization_context ctx(buff.data());
+    BOOST_ASSERT(buff.size() >= get_size());
+
+    ::boost::mysql::detail::serialize(ctx, command_id, statement_id, num_rows);
+}
+
 // execute response
 boost::mysql::detail::execute_response boost::mysql::detail::deserialize_execute_response(
     span<const std::uint8_t> msg,
     db_flavor flavor,
-    diagnostics& diag
+    diagnostics& diag,
+    bool local_infile_enabled,
+    bool optional_metadata
 ) noexcept
 {
-    // Response may be: ok_packet, err_packet, local infile request (not implemented)
+    // Response may be: ok_packet, err_packet, local infile request
     // If it is none of this, then the message type itself is the beginning of
     // a length-encoded int containing the field count
     deserialization_context ctx(msg);
@@ -556,6 +875,15 @@ boost::mysql::detail::execute_response boost::mysql::detail::deserialize_execute
     {
         return process_error_packet(ctx.to_span(), flavor, diag);
     }
+    else if (msg_type == local_infile_header && local_infile_enabled)
+    {
+        // The rest of the message is the file name requested by the server
+        string_eof filename;
+        err = to_error_code(deserialize(ctx, filename));
+        if (err)
+            return err;
+        return local_infile_request{filename.value};
+    }
     else
     {
         // Resultset with metadata. First packet is an int_lenenc with
@@ -566,6 +894,18 @@ boost::mysql::detail::execute_response boost::mysql::detail::deserialize_execute
         err = to_error_code(deserialize(ctx, num_fields));
         if (err)
             return err;
+
+        // If the server may omit metadata, a flag tells us whether it did
+        std::uint8_t metadata_follows = resultset_metadata_full;
+        if (optional_metadata)
+        {
+            err = to_error_code(deserialize(ctx, metadata_follows));
+            if (err)
+                return err;
+            if (!is_valid_resultset_metadata(metadata_follows))
+                return make_error_code(client_errc::protocol_value_error);
+        }
+
         err = ctx.check_extra_bytes();
         if (err)
             return err;
@@ -578,7 +918,10 @@ boost::mysql::detail::execute_response boost::mysql::detail::deserialize_execute
             return make_error_code(client_errc::protocol_value_error);
         }
 
-        return static_cast<std::size_t>(num_fields.value);
+        return execute_response(
+            static_cast<std::size_t>(num_fields.value),
+            metadata_follows == resultset_metadata_full
+        );
     }
 }
 
@@ -601,7 +944,8 @@ boost::mysql::detail::row_message boost::mysql::detail::deserialize_row_message(
     {
         // end of resultset => this is a ok_packet, not a row
         ok_view ok{};
-        auto err = deserialize_ok_packet(ctx.to_span(), ok);
+        auto err = is_legacy_eof_packet(ctx.size()) ? deserialize_legacy_eof_packet(ctx.to_span(), ok)
+                                                     : deserialize_ok_packet(ctx.to_span(), ok);
         if (err)
             return err;
         return ok;
@@ -724,6 +1068,79 @@ boost::mysql::error_code boost::mysql::detail::deserialize_row(
                                                         : deserialize_binary_row(ctx, meta, output.data());
 }
 
+boost::mysql::error_code boost::mysql::detail::row_field_reader::start() noexcept
+{
+    if (encoding_ == resultset_encoding::text)
+        return error_code();
+
+    // Skip packet header. The caller will have checked we have this byte already for us
+    BOOST_ASSERT(first_ != last_);
+    ++first_;
+
+    // Null bitmap
+    null_bitmap_traits null_bitmap(binary_row_null_bitmap_offset, meta_.size());
+    if (static_cast<std::size_t>(last_ - first_) < null_bitmap.byte_count())
+        return client_errc::incomplete_message;
+    null_bitmap_ = first_;
+    first_ += null_bitmap.byte_count();
+    return error_code();
+}
+
+boost::mysql::error_code boost::mysql::detail::row_field_reader::read_next(field_view& output) noexcept
+{
+    BOOST_ASSERT(remaining() > 0u);
+    deserialization_context ctx(first_, static_cast<std::size_t>(last_ - first_));
+    std::size_t i = index_++;
+    if (encoding_ == resultset_encoding::text)
+    {
+        if (is_next_field_null(ctx))
+        {
+            ctx.advance(1);
+            output = field_view(nullptr);
+        }
+        else
+        {
+            string_lenenc value_str;
+            auto err = deserialize(ctx, value_str);
+            if (err != deserialize_errc::ok)
+                return to_error_code(err);
+            err = deserialize_text_field(value_str.value, meta_[i], output);
+            if (err != deserialize_errc::ok)
+                return to_error_code(err);
+        }
+    }
+    else
+    {
+        null_bitmap_traits null_bitmap(binary_row_null_bitmap_offset, meta_.size());
+        if (null_bitmap.is_null(null_bitmap_, i))
+        {
+            output = field_view(nullptr);
+        }
+        else
+        {
+            auto err = deserialize_binary_field(ctx, meta_[i], output);
+            if (err != deserialize_errc::ok)
+                return to_error_code(err);
+        }
+    }
+    first_ = ctx.first();
+    return error_code();
+}
+
+boost::mysql::error_code boost::mysql::detail::row_field_reader::finish() noexcept
+{
+    field_view unused;
+    while (remaining() > 0u)
+    {
+        auto err = read_next(unused);
+        if (err)
+            return err;
+    }
+    if (first_ != last_)
+        return client_errc::extra_bytes;
+    return error_code();
+}
+
 // Server hello
 namespace boost {
 namespace mysql {
@@ -769,7 +1186,8 @@ boost::mysql::error_code boost::mysql::detail::deserialize_server_hello_impl(
         std::uint16_t status_flags;  // server_status_flags
         string_fixed<2> capability_flags_high;
         std::uint8_t auth_plugin_data_len;
-        string_fixed<10> reserved;
+        string_fixed<6> reserved;
+        std::uint32_t mariadb_capabilities;  // reserved by MySQL
         // auth plugin data, 2nd part. This has a weird representation that doesn't fit any defined type
         string_null auth_plugin_name;
     } pack{};
@@ -798,7 +1216,7 @@ boost::mysql::error_code boost::mysql::detail::deserialize_server_hello_impl(
         return client_errc::server_unsupported;
 
     // Deserialize next fields
-    err = deserialize(ctx, pack.auth_plugin_data_len, pack.reserved);
+    err = deserialize(ctx, pack.auth_plugin_data_len, pack.reserved, pack.mariadb_capabilities);
     if (err != deserialize_errc::ok)
         return to_error_code(err);
 
@@ -818,7 +1236,11 @@ boost::mysql::error_code boost::mysql::detail::deserialize_server_hello_impl(
 
     // Compose output
     output.server = parse_db_version(pack.server_version.value);
+    output.connection_id = pack.connection_id;
     output.server_capabilities = cap;
+    output.mariadb_capabilities = capabilities(
+        cap.has(CLIENT_LONG_PASSWORD) ? 0u : pack.mariadb_capabilities
+    );
     output.auth_plugin_name = pack.auth_plugin_name.value;
 
     // Compose auth_plugin_data
@@ -877,13 +1299,15 @@ struct login_request_packet
 {
     std::uint32_t client_flag;  // capabilities
     std::uint32_t max_packet_size;
-    std::uint8_t character_set;  // collation ID first byte
-    string_fixed<23> filler;     //     All 0s.
+    std::uint8_t character_set;          // collation ID first byte
+    string_fixed<19> filler;             //     All 0s.
+    std::uint32_t mariadb_capabilities;  // reserved by MySQL
     string_null username;
     string_lenenc auth_response;     // we require CLIENT_PLUGIN_AUTH_LENENC_CLIENT_DATA
     string_null database;            // only to be serialized if CLIENT_CONNECT_WITH_DB
     string_null client_plugin_name;  // we require CLIENT_PLUGIN_AUTH
     // CLIENT_CONNECT_ATTRS: not implemented
+    std::uint8_t zstd_compression_level;  // only to be serialized if CLIENT_ZSTD_COMPRESSION_ALGORITHM
 };
 
 BOOST_MYSQL_STATIC_OR_INLINE
@@ -894,10 +1318,12 @@ login_request_packet to_packet(const login_request& req) noexcept
         req.max_packet_size,
         get_collation_first_byte(req.collation_id),
         {},
+        req.mariadb_capabilities.get(),
         string_null{req.username},
         string_lenenc{to_string(req.auth_response)},
         string_null{req.database},
         string_null{req.auth_plugin_name},
+        req.zstd_compression_level,
     };
 }
 
@@ -913,13 +1339,17 @@ std::size_t boost::mysql::detail::login_request::get_size() const noexcept
                pack.max_packet_size,
                pack.character_set,
                pack.filler,
+               pack.mariadb_capabilities,
                pack.username,
                pack.auth_response
            ) +
            (negotiated_capabilities.has(CLIENT_CONNECT_WITH_DB)
                 ? ::boost::mysql::detail::get_size(pack.database)
                 : 0) +
-           ::boost::mysql::detail::get_size(pack.client_plugin_name);
+           ::boost::mysql::detail::get_size(pack.client_plugin_name) +
+           (negotiated_capabilities.has(CLIENT_ZSTD_COMPRESSION_ALGORITHM)
+                ? ::boost::mysql::detail::get_size(pack.zstd_compression_level)
+                : 0);
 }
 
 void boost::mysql::detail::login_request::serialize(span<std::uint8_t> buff) const noexcept
@@ -934,6 +1364,7 @@ void boost::mysql::detail::login_request::serialize(span<std::uint8_t> buff) con
         pack.max_packet_size,
         pack.character_set,
         pack.filler,
+        pack.mariadb_capabilities,
         pack.username,
         pack.auth_response
     );
@@ -942,6 +1373,10 @@ void boost::mysql::detail::login_request::serialize(span<std::uint8_t> buff) con
         ::boost::mysql::detail::serialize(ctx, pack.database);
     }
     ::boost::mysql::detail::serialize(ctx, pack.client_plugin_name);
+    if (negotiated_capabilities.has(CLIENT_ZSTD_COMPRESSION_ALGORITHM))
+    {
+        ::boost::mysql::detail::serialize(ctx, pack.zstd_compression_level);
+    }
 }
 
 // ssl_request
@@ -957,12 +1392,14 @@ void boost::mysql::detail::ssl_request::serialize(span<std::uint8_t> buff) const
         std::uint32_t client_flag;
         std::uint32_t max_packet_size;
         std::uint8_t character_set;
-        string_fixed<23> filler;
+        string_fixed<19> filler;
+        std::uint32_t mariadb_capabilities;  // reserved by MySQL
     } pack{
         negotiated_capabilities.get(),
         max_packet_size,
         get_collation_first_byte(collation_id),
         {},
+        mariadb_capabilities.get(),
     };
 
     ::boost::mysql::detail::serialize(
@@ -970,7 +1407,8 @@ void boost::mysql::detail::ssl_request::serialize(span<std::uint8_t> buff) const
         pack.client_flag,
         pack.max_packet_size,
         pack.character_set,
-        pack.filler
+        pack.filler,
+        pack.mariadb_capabilities
     );
 }
 
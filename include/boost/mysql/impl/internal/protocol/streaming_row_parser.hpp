@@ -0,0 +1,95 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_PROTOCOL_STREAMING_ROW_PARSER_HPP
+#define BOOST_MYSQL_IMPL_INTERNAL_PROTOCOL_STREAMING_ROW_PARSER_HPP
+
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/metadata_collection_view.hpp>
+
+#include <boost/mysql/detail/any_field_chunk_handler.hpp>
+#include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/resultset_encoding.hpp>
+
+#include <boost/core/span.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Parses a row message as it's read from the network, in pieces, without
+// assembling it in memory. String and blob fields with at least min_size bytes
+// are passed to the handler as they are parsed. The rest of the message is copied
+// to output, replacing streamed fields by empty strings. output can then be
+// deserialized as a regular row message.
+class streaming_row_parser
+{
+public:
+    BOOST_MYSQL_DECL
+    streaming_row_parser(
+        resultset_encoding enc,
+        metadata_collection_view meta,
+        std::size_t min_size,
+        any_field_chunk_handler& handler,
+        std::vector<std::uint8_t>& output
+    );
+
+    // Parses the next piece of the message
+    BOOST_MYSQL_DECL error_code parse(span<const std::uint8_t> piece);
+
+    // To be called after parsing the last piece. Fails if the message is incomplete
+    // or the handler reported an error
+    BOOST_MYSQL_DECL error_code finish() const noexcept;
+
+private:
+    enum class state_t
+    {
+        header,       // binary rows: the packet header
+        null_bitmap,  // binary rows: the NULL bitmap
+        field_start,  // the first byte of a field
+        length,       // the rest of a length-encoded integer
+        copy,         // field bytes to be copied to the output
+        stream,       // field bytes to be passed to the handler
+        done,         // all fields have been parsed
+    };
+
+    resultset_encoding enc_;
+    metadata_collection_view meta_;
+    std::size_t min_size_;
+    any_field_chunk_handler& handler_;
+    std::vector<std::uint8_t>& output_;
+    state_t state_;
+    std::size_t field_index_{0};
+    std::size_t remaining_{0};  // bytes remaining for the current state
+    std::size_t field_size_{0};
+    std::uint8_t length_buff_[9]{};
+    std::size_t length_size_{0};
+    error_code handler_err_;
+
+    bool is_null(std::size_t field_index) const noexcept;
+    void on_field_start();
+    void on_field_end();
+    void on_length(std::size_t length);
+    error_code parse_field_start(std::uint8_t first);
+    void parse_length(std::uint8_t value);
+    std::size_t copy(const std::uint8_t* first, std::size_t size);
+    std::size_t stream(const std::uint8_t* first, std::size_t size);
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#ifdef BOOST_MYSQL_HEADER_ONLY
+#include <boost/mysql/impl/internal/protocol/streaming_row_parser.ipp>
+#endif
+
+#endif
@@ -0,0 +1,275 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_INTERNAL_PROTOCOL_STREAMING_ROW_PARSER_IPP
+#define BOOST_MYSQL_IMPL_INTERNAL_PROTOCOL_STREAMING_ROW_PARSER_IPP
+
+#pragma once
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/field_chunk.hpp>
+
+#include <boost/mysql/impl/internal/protocol/null_bitmap_traits.hpp>
+#include <boost/mysql/impl/internal/protocol/streaming_row_parser.hpp>
+
+#include <algorithm>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Only these types may be streamed. Other types are always small
+BOOST_MYSQL_STATIC_OR_INLINE
+bool is_streamable_type(column_type t) noexcept
+{
+    switch (t)
+    {
+    case column_type::char_:
+    case column_type::varchar:
+    case column_type::text:
+    case column_type::binary:
+    case column_type::varbinary:
+    case column_type::blob:
+    case column_type::json:
+    case column_type::geometry:
+    case column_type::unknown: return true;
+    default: return false;
+    }
+}
+
+// The number of bytes taken by a length-encoded integer, given its first byte.
+// Zero means that the integer is invalid
+BOOST_MYSQL_STATIC_OR_INLINE
+std::size_t lenenc_int_size(std::uint8_t first) noexcept
+{
+    if (first < 0xfb)
+        return 1;
+    switch (first)
+    {
+    case 0xfc: return 3;
+    case 0xfd: return 4;
+    case 0xfe: return 9;
+    default: return 0;
+    }
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+boost::mysql::detail::streaming_row_parser::streaming_row_parser(
+    resultset_encoding enc,
+    metadata_collection_view meta,
+    std::size_t min_size,
+    any_field_chunk_handler& handler,
+    std::vector<std::uint8_t>& output
+)
+    : enc_(enc),
+      meta_(meta),
+      min_size_(min_size),
+      handler_(handler),
+      output_(output),
+      state_(enc == resultset_encoding::binary ? state_t::header : state_t::field_start)
+{
+    if (enc == resultset_encoding::text)
+        on_field_start();
+}
+
+bool boost::mysql::detail::streaming_row_parser::is_null(std::size_t field_index) const noexcept
+{
+    // Text rows represent NULLs as a special value, instead of using a bitmap.
+    // The binary row header is stored at output_[0], and the bitmap follows it
+    return enc_ == resultset_encoding::binary &&
+           null_bitmap_traits(binary_row_null_bitmap_offset, meta_.size())
+               .is_null(output_.data() + 1, field_index);
+}
+
+void boost::mysql::detail::streaming_row_parser::on_field_start()
+{
+    // NULL fields in binary rows don't have any bytes, so skip them
+    while (field_index_ < meta_.size() && is_null(field_index_))
+        ++field_index_;
+    state_ = field_index_ == meta_.size() ? state_t::done : state_t::field_start;
+}
+
+void boost::mysql::detail::streaming_row_parser::on_field_end()
+{
+    ++field_index_;
+    on_field_start();
+}
+
+void boost::mysql::detail::streaming_row_parser::on_length(std::size_t length)
+{
+    if (length != 0u && length >= min_size_ && is_streamable_type(meta_[field_index_].type()))
+    {
+        // Streamed fields are replaced by empty strings
+        output_.push_back(0);
+        field_size_ = length;
+        remaining_ = length;
+        state_ = state_t::stream;
+    }
+    else
+    {
+        output_.insert(output_.end(), length_buff_, length_buff_ + length_size_);
+        remaining_ = length;
+        if (length == 0u)
+            on_field_end();
+        else
+            state_ = state_t::copy;
+    }
+}
+
+boost::mysql::error_code boost::mysql::detail::streaming_row_parser::parse_field_start(std::uint8_t first)
+{
+    // Fields with a fixed size or a 1-byte length are never streamed
+    std::size_t fixed_size = 0;
+    if (enc_ == resultset_encoding::text)
+    {
+        if (first == 0xfb)
+        {
+            // NULL
+            output_.push_back(first);
+            on_field_end();
+            return error_code();
+        }
+    }
+    else
+    {
+        switch (meta_[field_index_].type())
+        {
+        case column_type::tinyint: fixed_size = 1; break;
+        case column_type::smallint:
+        case column_type::year: fixed_size = 2; break;
+        case column_type::mediumint:
+        case column_type::int_:
+        case column_type::float_: fixed_size = 4; break;
+        case column_type::bigint:
+        case column_type::double_: fixed_size = 8; break;
+        case column_type::date:
+        case column_type::datetime:
+        case column_type::timestamp:
+        case column_type::time: fixed_size = 1u + first; break;
+        default: break;
+        }
+    }
+
+    if (fixed_size)
+    {
+        output_.push_back(first);
+        remaining_ = fixed_size - 1u;
+        if (remaining_ == 0u)
+            on_field_end();
+        else
+            state_ = state_t::copy;
+        return error_code();
+    }
+
+    // Length-encoded strings
+    std::size_t int_size = lenenc_int_size(first);
+    if (int_size == 0u)
+        return client_errc::protocol_value_error;
+    length_buff_[0] = first;
+    length_size_ = 1;
+    if (int_size == 1u)
+    {
+        on_length(first);
+    }
+    else
+    {
+        remaining_ = int_size - 1u;
+        state_ = state_t::length;
+    }
+    return error_code();
+}
+
+void boost::mysql::detail::streaming_row_parser::parse_length(std::uint8_t value)
+{
+    length_buff_[length_size_++] = value;
+    if (--remaining_ == 0u)
+    {
+        // Little endian, skipping the first byte
+        std::uint64_t length = 0;
+        for (std::size_t i = length_size_ - 1u; i > 0u; --i)
+            length = (length << 8) | length_buff_[i];
+        on_length(static_cast<std::size_t>(length));
+    }
+}
+
+std::size_t boost::mysql::detail::streaming_row_parser::copy(const std::uint8_t* first, std::size_t size)
+{
+    std::size_t n = (std::min)(size, remaining_);
+    output_.insert(output_.end(), first, first + n);
+    remaining_ -= n;
+    return n;
+}
+
+std::size_t boost::mysql::detail::streaming_row_parser::stream(const std::uint8_t* first, std::size_t size)
+{
+    std::size_t n = (std::min)(size, remaining_);
+
+    // Once the handler fails, the rest of the row is discarded
+    if (!handler_err_)
+    {
+        field_chunk chunk{field_index_, field_size_, field_size_ - remaining_, {first, n}};
+        handler_.on_chunk(chunk, handler_err_);
+    }
+    remaining_ -= n;
+    return n;
+}
+
+boost::mysql::error_code boost::mysql::detail::streaming_row_parser::parse(span<const std::uint8_t> piece)
+{
+    const std::uint8_t* first = piece.data();
+    const std::uint8_t* last = first + piece.size();
+    while (first != last)
+    {
+        std::size_t size = static_cast<std::size_t>(last - first);
+        switch (state_)
+        {
+        case state_t::header:
+            output_.push_back(*first++);
+            remaining_ = null_bitmap_traits(binary_row_null_bitmap_offset, meta_.size()).byte_count();
+            state_ = state_t::null_bitmap;
+            break;
+        case state_t::null_bitmap:
+            first += copy(first, size);
+            if (remaining_ == 0u)
+                on_field_start();
+            break;
+        case state_t::field_start:
+        {
+            auto err = parse_field_start(*first++);
+            if (err)
+                return err;
+            break;
+        }
+        case state_t::length: parse_length(*first++); break;
+        case state_t::copy:
+            first += copy(first, size);
+            if (remaining_ == 0u)
+                on_field_end();
+            break;
+        case state_t::stream:
+            first += stream(first, size);
+            if (remaining_ == 0u)
+                on_field_end();
+            break;
+        case state_t::done: return client_errc::extra_bytes;
+        }
+    }
+    return error_code();
+}
+
+boost::mysql::error_code boost::mysql::detail::streaming_row_parser::finish() const noexcept
+{
+    if (state_ != state_t::done)
+        return client_errc::incomplete_message;
+    return handler_err_;
+}
+
+#endif
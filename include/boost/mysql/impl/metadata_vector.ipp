@@ -0,0 +1,128 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_METADATA_VECTOR_IPP
+#define BOOST_MYSQL_IMPL_METADATA_VECTOR_IPP
+
+#pragma once
+
+#include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/metadata_vector.hpp>
+
+#include <algorithm>
+#include <cstring>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// The initial size of the string buffer, enough for a few columns
+BOOST_MYSQL_STATIC_IF_COMPILED
+constexpr std::size_t metadata_vector_initial_strings_size = 512;
+
+BOOST_MYSQL_STATIC_OR_INLINE
+char* copy_coldef_string(char* it, string_view str) noexcept
+{
+    if (!str.empty())
+        std::memcpy(it, str.data(), str.size());
+    return it + str.size();
+}
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+boost::mysql::detail::metadata_vector::metadata_vector(const metadata_vector& rhs) : strings_(rhs.strings_)
+{
+    meta_.reserve(rhs.meta_.size());
+    for (const auto& m : rhs.meta_)
+    {
+        const char* strings = m.strings_ ? strings_.data() + (m.strings_ - rhs.strings_.data()) : nullptr;
+        meta_.push_back(metadata(m, strings));
+    }
+}
+
+boost::mysql::detail::metadata_vector& boost::mysql::detail::metadata_vector::operator=(
+    const metadata_vector& rhs
+)
+{
+    if (this != &rhs)
+        *this = metadata_vector(rhs);
+    return *this;
+}
+
+void boost::mysql::detail::metadata_vector::assign(metadata_collection_view meta)
+{
+    // Protect against self-assignment
+    if (meta.data() == meta_.data())
+    {
+        BOOST_ASSERT(meta.size() == meta_.size());
+        return;
+    }
+
+    // Compute the required size, so we allocate once
+    std::size_t size = 0;
+    for (const auto& m : meta)
+        size += m.total_string_size();
+
+    clear();
+    meta_.reserve(meta.size());
+    strings_.reserve(size);
+    for (const auto& m : meta)
+    {
+        std::size_t offset = strings_.size();
+        strings_.insert(strings_.end(), m.strings_, m.strings_ + m.total_string_size());
+        meta_.push_back(metadata(m, m.strings_ ? strings_.data() + offset : nullptr));
+    }
+}
+
+void boost::mysql::detail::metadata_vector::push_back(const coldef_view& coldef, bool copy_strings)
+{
+    if (!copy_strings)
+    {
+        meta_.push_back(metadata(coldef, static_cast<const char*>(nullptr)));
+        return;
+    }
+
+    // Copy the strings to the buffer, contiguously
+    std::size_t size = coldef.database.size() + coldef.table.size() + coldef.org_table.size() +
+                       coldef.name.size() + coldef.org_name.size();
+    reserve_strings(size);
+    std::size_t offset = strings_.size();
+    strings_.resize(offset + size);
+    char* it = strings_.data() + offset;
+    it = copy_coldef_string(it, coldef.database);
+    it = copy_coldef_string(it, coldef.table);
+    it = copy_coldef_string(it, coldef.org_table);
+    it = copy_coldef_string(it, coldef.name);
+    it = copy_coldef_string(it, coldef.org_name);
+    BOOST_ASSERT(it == strings_.data() + strings_.size());
+
+    meta_.push_back(metadata(coldef, strings_.data() + offset));
+}
+
+void boost::mysql::detail::metadata_vector::reserve_strings(std::size_t size)
+{
+    if (strings_.capacity() - strings_.size() >= size)
+        return;
+
+    // Grow geometrically, and make the metadata objects point to the new buffer.
+    // This happens while the old buffer is still alive
+    std::vector<char> new_strings;
+    new_strings.reserve(
+        (std::max)({strings_.capacity() * 2u, strings_.size() + size, metadata_vector_initial_strings_size})
+    );
+    new_strings.assign(strings_.begin(), strings_.end());
+    for (auto& m : meta_)
+    {
+        if (m.strings_)
+            m.strings_ = new_strings.data() + (m.strings_ - strings_.data());
+    }
+    strings_.swap(new_strings);
+}
+
+#endif
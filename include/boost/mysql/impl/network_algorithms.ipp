@@ -12,19 +12,308 @@
 
 #include <boost/mysql/detail/network_algorithms.hpp>
 
+#include <boost/mysql/impl/internal/network_algorithms/change_user.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/close_connection.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/close_statement.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/connect.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/deadline.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/execute.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/execute_bulk.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/execute_pipeline.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/handshake.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/load_data_local.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/observe_operation.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/ping.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/prepare_statement.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/quit_connection.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/read_resultset_head.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/read_some_rows.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/read_row_streamed.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/read_some_rows_dynamic.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/reset_connection.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/send_long_data.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/start_execution.hpp>
 
+namespace boost {
+namespace mysql {
+namespace detail {
+
+// Initiators, to wrap async operations with observed_op
+struct connect_initiator
+{
+    channel& chan;
+    const void* endpoint;
+    handshake_params params;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_connect_impl(chan, endpoint, params, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct handshake_initiator
+{
+    channel& chan;
+    handshake_params params;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_handshake_impl(chan, params, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct execute_initiator
+{
+    channel& chan;
+    any_execution_request req;
+    execution_processor& proc;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_execute_impl(chan, req, proc, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct execute_pipeline_initiator
+{
+    channel& chan;
+    const pipeline_request_impl& req;
+    std::vector<pipeline_response_item>& res;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_execute_pipeline_impl(chan, req, res, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct execute_bulk_initiator
+{
+    channel& chan;
+    bulk_execution_request req;
+    bulk_execution_result& result;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_execute_bulk_impl(chan, req, result, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct load_data_local_initiator
+{
+    channel& chan;
+    string_view query;
+    std::unique_ptr<any_load_data_source> source;
+    execution_processor& proc;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_load_data_local_impl(
+            chan,
+            query,
+            std::move(source),
+            proc,
+            diag,
+            std::forward<Handler>(handler)
+        );
+    }
+};
+
+struct send_long_data_initiator
+{
+    channel& chan;
+    statement stmt;
+    std::size_t param_index;
+    std::unique_ptr<any_load_data_source> source;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_send_long_data_impl(
+            chan,
+            stmt,
+            param_index,
+            std::move(source),
+            diag,
+            std::forward<Handler>(handler)
+        );
+    }
+};
+
+struct start_execution_initiator
+{
+    channel& chan;
+    any_execution_request req;
+    execution_processor& proc;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_start_execution_impl(chan, req, proc, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct prepare_statement_initiator
+{
+    channel& chan;
+    string_view stmt;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_prepare_statement_impl(chan, stmt, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct close_statement_initiator
+{
+    channel& chan;
+    statement stmt;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_close_statement_impl(chan, stmt, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct read_some_rows_dynamic_initiator
+{
+    channel& chan;
+    execution_state_impl& st;
+    batch_params params;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_read_some_rows_dynamic_impl(chan, st, params, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct read_row_streamed_initiator
+{
+    channel& chan;
+    execution_state_impl& st;
+    std::size_t min_size;
+    any_field_chunk_handler& chunk_handler;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_read_row_streamed_impl(chan, st, min_size, chunk_handler, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct read_some_rows_initiator
+{
+    channel& chan;
+    execution_processor& proc;
+    output_ref output;
+    batch_params params;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_read_some_rows_impl(chan, proc, output, params, false, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct read_resultset_head_initiator
+{
+    channel& chan;
+    execution_processor& proc;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_read_resultset_head_impl(chan, proc, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct ping_initiator
+{
+    channel& chan;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_ping_impl(chan, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct reset_connection_initiator
+{
+    channel& chan;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_reset_connection_impl(chan, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct change_user_initiator
+{
+    channel& chan;
+    handshake_params params;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_change_user_impl(chan, params, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct close_connection_initiator
+{
+    channel& chan;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_close_connection_impl(chan, diag, std::forward<Handler>(handler));
+    }
+};
+
+struct quit_connection_initiator
+{
+    channel& chan;
+    diagnostics& diag;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        async_quit_connection_impl(chan, diag, std::forward<Handler>(handler));
+    }
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
 void boost::mysql::detail::connect_erased(
     channel& chan,
     const void* endpoint,
@@ -33,7 +322,10 @@ void boost::mysql::detail::connect_erased(
     diagnostics& diag
 )
 {
+    auto info = make_operation_info(operation_type::connect);
+    notify_operation_start(chan, info);
     connect_impl(chan, endpoint, params, err, diag);
+    notify_operation_finish(chan, info, err);
 }
 
 void boost::mysql::detail::async_connect_erased(
@@ -44,7 +336,16 @@ void boost::mysql::detail::async_connect_erased(
     any_void_handler handler
 )
 {
-    async_connect_impl(chan, endpoint, params, diag, std::move(handler));
+    // There is no session to kill while connecting, so the connection is closed on expiry
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::connect),
+        with_deadline<void(error_code)>(
+            make_deadline_state(chan, false),
+            connect_initiator{chan, endpoint, params, diag}
+        ),
+        std::move(handler)
+    );
 }
 
 void boost::mysql::detail::handshake_erased(
@@ -54,7 +355,10 @@ void boost::mysql::detail::handshake_erased(
     diagnostics& diag
 )
 {
+    auto info = make_operation_info(operation_type::handshake);
+    notify_operation_start(channel, info);
     handshake_impl(channel, params, err, diag);
+    notify_operation_finish(channel, info, err);
 }
 
 void boost::mysql::detail::async_handshake_erased(
@@ -64,7 +368,12 @@ void boost::mysql::detail::async_handshake_erased(
     any_void_handler handler
 )
 {
-    async_handshake_impl(chan, params, diag, std::move(handler));
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::handshake),
+        handshake_initiator{chan, params, diag},
+        std::move(handler)
+    );
 }
 
 void boost::mysql::detail::execute_erased(
@@ -75,7 +384,11 @@ void boost::mysql::detail::execute_erased(
     diagnostics& diag
 )
 {
-    execute_impl(channel, req, output, err, diag);
+    auto info = make_operation_info(operation_type::execute, req);
+    notify_operation_start(channel, info);
+    std::string query_storage;
+    execute_impl(channel, add_max_execution_time_hint(channel, req, query_storage), output, err, diag);
+    notify_operation_finish(channel, info, err);
 }
 
 void boost::mysql::detail::async_execute_erased(
@@ -86,7 +399,138 @@ void boost::mysql::detail::async_execute_erased(
     any_void_handler handler
 )
 {
-    async_execute_impl(chan, req, output, diag, std::move(handler));
+    auto st = make_deadline_state(chan, true);
+    auto actual_req = st ? add_max_execution_time_hint(chan, req, st->query_storage) : req;
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::execute, req),
+        with_deadline<void(error_code)>(std::move(st), execute_initiator{chan, actual_req, output, diag}),
+        std::move(handler)
+    );
+}
+
+void boost::mysql::detail::execute_pipeline_erased(
+    channel& chan,
+    const pipeline_request_impl& req,
+    std::vector<pipeline_response_item>& res,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    auto info = make_operation_info(operation_type::execute_pipeline);
+    notify_operation_start(chan, info);
+    execute_pipeline_impl(chan, req, res, err, diag);
+    notify_operation_finish(chan, info, err);
+}
+
+void boost::mysql::detail::async_execute_pipeline_erased(
+    channel& chan,
+    const pipeline_request_impl& req,
+    std::vector<pipeline_response_item>& res,
+    diagnostics& diag,
+    any_void_handler handler
+)
+{
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::execute_pipeline),
+        execute_pipeline_initiator{chan, req, res, diag},
+        std::move(handler)
+    );
+}
+
+void boost::mysql::detail::execute_bulk_erased(
+    channel& chan,
+    const bulk_execution_request& req,
+    bulk_execution_result& result,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    auto info = make_operation_info(operation_type::execute_bulk, req.stmt);
+    notify_operation_start(chan, info);
+    execute_bulk_impl(chan, req, result, err, diag);
+    notify_operation_finish(chan, info, err);
+}
+
+void boost::mysql::detail::async_execute_bulk_erased(
+    channel& chan,
+    const bulk_execution_request& req,
+    bulk_execution_result& result,
+    diagnostics& diag,
+    any_void_handler handler
+)
+{
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::execute_bulk, req.stmt),
+        execute_bulk_initiator{chan, req, result, diag},
+        std::move(handler)
+    );
+}
+
+void boost::mysql::detail::load_data_local_erased(
+    channel& chan,
+    string_view query,
+    any_load_data_source& source,
+    execution_processor& proc,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    auto info = make_operation_info(operation_type::load_data_local, query);
+    notify_operation_start(chan, info);
+    load_data_local_impl(chan, query, source, proc, err, diag);
+    notify_operation_finish(chan, info, err);
+}
+
+void boost::mysql::detail::async_load_data_local_erased(
+    channel& chan,
+    string_view query,
+    std::unique_ptr<any_load_data_source> source,
+    execution_processor& proc,
+    diagnostics& diag,
+    any_void_handler handler
+)
+{
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::load_data_local, query),
+        load_data_local_initiator{chan, query, std::move(source), proc, diag},
+        std::move(handler)
+    );
+}
+
+void boost::mysql::detail::send_long_data_erased(
+    channel& chan,
+    const statement& stmt,
+    std::size_t param_index,
+    any_load_data_source& source,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    auto info = make_operation_info(operation_type::send_long_data, stmt);
+    notify_operation_start(chan, info);
+    send_long_data_impl(chan, stmt, param_index, source, err, diag);
+    notify_operation_finish(chan, info, err);
+}
+
+void boost::mysql::detail::async_send_long_data_erased(
+    channel& chan,
+    const statement& stmt,
+    std::size_t param_index,
+    std::unique_ptr<any_load_data_source> source,
+    diagnostics& diag,
+    any_void_handler handler
+)
+{
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::send_long_data, stmt),
+        send_long_data_initiator{chan, stmt, param_index, std::move(source), diag},
+        std::move(handler)
+    );
 }
 
 void boost::mysql::detail::start_execution_erased(
@@ -97,7 +541,11 @@ void boost::mysql::detail::start_execution_erased(
     diagnostics& diag
 )
 {
-    start_execution_impl(channel, req, proc, err, diag);
+    auto info = make_operation_info(operation_type::start_execution, req);
+    notify_operation_start(channel, info);
+    std::string query_storage;
+    start_execution_impl(channel, add_max_execution_time_hint(channel, req, query_storage), proc, err, diag);
+    notify_operation_finish(channel, info, err);
 }
 
 void boost::mysql::detail::async_start_execution_erased(
@@ -108,7 +556,17 @@ void boost::mysql::detail::async_start_execution_erased(
     any_void_handler handler
 )
 {
-    async_start_execution_impl(channel, req, proc, diag, std::move(handler));
+    auto st = make_deadline_state(channel, true);
+    auto actual_req = st ? add_max_execution_time_hint(channel, req, st->query_storage) : req;
+    async_observe_operation<void(error_code)>(
+        channel,
+        make_operation_info(operation_type::start_execution, req),
+        with_deadline<void(error_code)>(
+            std::move(st),
+            start_execution_initiator{channel, actual_req, proc, diag}
+        ),
+        std::move(handler)
+    );
 }
 
 boost::mysql::statement boost::mysql::detail::prepare_statement_erased(
@@ -118,7 +576,12 @@ boost::mysql::statement boost::mysql::detail::prepare_statement_erased(
     diagnostics& diag
 )
 {
-    return prepare_statement_impl(chan, stmt, err, diag);
+    auto info = make_operation_info(operation_type::prepare_statement, stmt);
+    notify_operation_start(chan, info);
+    auto res = prepare_statement_impl(chan, stmt, err, diag);
+    info.statement_id = res.valid() ? res.id() : 0u;
+    notify_operation_finish(chan, info, err);
+    return res;
 }
 
 void boost::mysql::detail::async_prepare_statement_erased(
@@ -128,7 +591,12 @@ void boost::mysql::detail::async_prepare_statement_erased(
     any_handler<statement> handler
 )
 {
-    async_prepare_statement_impl(chan, stmt, diag, std::move(handler));
+    async_observe_operation<void(error_code, statement)>(
+        chan,
+        make_operation_info(operation_type::prepare_statement, stmt),
+        prepare_statement_initiator{chan, stmt, diag},
+        std::move(handler)
+    );
 }
 
 void boost::mysql::detail::close_statement_erased(
@@ -138,7 +606,10 @@ void boost::mysql::detail::close_statement_erased(
     diagnostics& diag
 )
 {
+    auto info = make_operation_info(operation_type::close_statement, stmt);
+    notify_operation_start(chan, info);
     close_statement_impl(chan, stmt, err, diag);
+    notify_operation_finish(chan, info, err);
 }
 
 void boost::mysql::detail::async_close_statement_erased(
@@ -148,49 +619,115 @@ void boost::mysql::detail::async_close_statement_erased(
     any_void_handler handler
 )
 {
-    async_close_statement_impl(chan, stmt, diag, std::move(handler));
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::close_statement, stmt),
+        close_statement_initiator{chan, stmt, diag},
+        std::move(handler)
+    );
 }
 
 boost::mysql::rows_view boost::mysql::detail::read_some_rows_dynamic_erased(
     channel& chan,
     execution_state_impl& st,
+    const batch_params& params,
     error_code& err,
     diagnostics& diag
 )
 {
-    return read_some_rows_dynamic_impl(chan, st, err, diag);
+    auto info = make_operation_info(operation_type::read_some_rows);
+    notify_operation_start(chan, info);
+    auto res = read_some_rows_dynamic_impl(chan, st, params, err, diag);
+    notify_operation_finish(chan, info, err);
+    return res;
 }
 
 void boost::mysql::detail::async_read_some_rows_dynamic_erased(
     channel& chan,
     execution_state_impl& st,
+    const batch_params& params,
     diagnostics& diag,
     any_handler<rows_view> handler
 )
 {
-    async_read_some_rows_dynamic_impl(chan, st, diag, std::move(handler));
+    async_observe_operation<void(error_code, rows_view)>(
+        chan,
+        make_operation_info(operation_type::read_some_rows),
+        with_deadline<void(error_code, rows_view)>(
+            make_deadline_state(chan, true),
+            read_some_rows_dynamic_initiator{chan, st, params, diag}
+        ),
+        std::move(handler)
+    );
+}
+
+boost::mysql::row_view boost::mysql::detail::read_row_streamed_erased(
+    channel& chan,
+    execution_state_impl& st,
+    std::size_t min_size,
+    any_field_chunk_handler& handler,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    auto info = make_operation_info(operation_type::read_row_streamed);
+    notify_operation_start(chan, info);
+    auto res = read_row_streamed_impl(chan, st, min_size, handler, err, diag);
+    notify_operation_finish(chan, info, err);
+    return res;
+}
+
+void boost::mysql::detail::async_read_row_streamed_erased(
+    channel& chan,
+    execution_state_impl& st,
+    std::size_t min_size,
+    any_field_chunk_handler& chunk_handler,
+    diagnostics& diag,
+    any_handler<row_view> handler
+)
+{
+    async_observe_operation<void(error_code, row_view)>(
+        chan,
+        make_operation_info(operation_type::read_row_streamed),
+        read_row_streamed_initiator{chan, st, min_size, chunk_handler, diag},
+        std::move(handler)
+    );
 }
 
 std::size_t boost::mysql::detail::read_some_rows_static_erased(
     channel& chan,
     execution_processor& proc,
     const output_ref& output,
+    const batch_params& params,
     error_code& err,
     diagnostics& diag
 )
 {
-    return read_some_rows_impl(chan, proc, output, err, diag);
+    auto info = make_operation_info(operation_type::read_some_rows);
+    notify_operation_start(chan, info);
+    auto res = read_some_rows_impl(chan, proc, output, params, false, err, diag);
+    notify_operation_finish(chan, info, err);
+    return res;
 }
 
 void boost::mysql::detail::async_read_some_rows_erased(
     channel& chan,
     execution_processor& proc,
     const output_ref& output,
+    const batch_params& params,
     diagnostics& diag,
     any_handler<std::size_t> handler
 )
 {
-    async_read_some_rows_impl(chan, proc, output, diag, std::move(handler));
+    async_observe_operation<void(error_code, std::size_t)>(
+        chan,
+        make_operation_info(operation_type::read_some_rows),
+        with_deadline<void(error_code, std::size_t)>(
+            make_deadline_state(chan, true),
+            read_some_rows_initiator{chan, proc, output, params, diag}
+        ),
+        std::move(handler)
+    );
 }
 
 void boost::mysql::detail::read_resultset_head_erased(
@@ -200,7 +737,10 @@ void boost::mysql::detail::read_resultset_head_erased(
     diagnostics& diag
 )
 {
+    auto info = make_operation_info(operation_type::read_resultset_head);
+    notify_operation_start(channel, info);
     read_resultset_head_impl(channel, proc, err, diag);
+    notify_operation_finish(channel, info, err);
 }
 
 void boost::mysql::detail::async_read_resultset_head_erased(
@@ -210,22 +750,88 @@ void boost::mysql::detail::async_read_resultset_head_erased(
     any_void_handler handler
 )
 {
-    async_read_resultset_head_impl(chan, proc, diag, std::move(handler));
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::read_resultset_head),
+        read_resultset_head_initiator{chan, proc, diag},
+        std::move(handler)
+    );
 }
 
 void boost::mysql::detail::ping_erased(channel& chan, error_code& code, diagnostics& diag)
 {
+    auto info = make_operation_info(operation_type::ping);
+    notify_operation_start(chan, info);
     ping_impl(chan, code, diag);
+    notify_operation_finish(chan, info, code);
 }
 
 void boost::mysql::detail::async_ping_erased(channel& chan, diagnostics& diag, any_void_handler handler)
 {
-    async_ping_impl(chan, diag, std::move(handler));
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::ping),
+        ping_initiator{chan, diag},
+        std::move(handler)
+    );
+}
+
+void boost::mysql::detail::reset_connection_erased(channel& chan, error_code& code, diagnostics& diag)
+{
+    auto info = make_operation_info(operation_type::reset_connection);
+    notify_operation_start(chan, info);
+    reset_connection_impl(chan, code, diag);
+    notify_operation_finish(chan, info, code);
+}
+
+void boost::mysql::detail::async_reset_connection_erased(
+    channel& chan,
+    diagnostics& diag,
+    any_void_handler handler
+)
+{
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::reset_connection),
+        reset_connection_initiator{chan, diag},
+        std::move(handler)
+    );
+}
+
+void boost::mysql::detail::change_user_erased(
+    channel& chan,
+    const handshake_params& params,
+    error_code& code,
+    diagnostics& diag
+)
+{
+    auto info = make_operation_info(operation_type::change_user);
+    notify_operation_start(chan, info);
+    change_user_impl(chan, params, code, diag);
+    notify_operation_finish(chan, info, code);
+}
+
+void boost::mysql::detail::async_change_user_erased(
+    channel& chan,
+    const handshake_params& params,
+    diagnostics& diag,
+    any_void_handler handler
+)
+{
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::change_user),
+        change_user_initiator{chan, params, diag},
+        std::move(handler)
+    );
 }
 
 void boost::mysql::detail::close_connection_erased(channel& chan, error_code& code, diagnostics& diag)
 {
+    auto info = make_operation_info(operation_type::close);
+    notify_operation_start(chan, info);
     close_connection_impl(chan, code, diag);
+    notify_operation_finish(chan, info, code);
 }
 
 void boost::mysql::detail::async_close_connection_erased(
@@ -234,12 +840,20 @@ void boost::mysql::detail::async_close_connection_erased(
     any_void_handler handler
 )
 {
-    async_close_connection_impl(chan, diag, std::move(handler));
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::close),
+        close_connection_initiator{chan, diag},
+        std::move(handler)
+    );
 }
 
 void boost::mysql::detail::quit_connection_erased(channel& chan, error_code& err, diagnostics& diag)
 {
+    auto info = make_operation_info(operation_type::quit);
+    notify_operation_start(chan, info);
     quit_connection_impl(chan, err, diag);
+    notify_operation_finish(chan, info, err);
 }
 
 void boost::mysql::detail::async_quit_connection_erased(
@@ -248,7 +862,12 @@ void boost::mysql::detail::async_quit_connection_erased(
     any_void_handler handler
 )
 {
-    async_quit_connection_impl(chan, diag, std::move(handler));
+    async_observe_operation<void(error_code)>(
+        chan,
+        make_operation_info(operation_type::quit),
+        quit_connection_initiator{chan, diag},
+        std::move(handler)
+    );
 }
 
 #endif
@@ -0,0 +1,50 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_PIPELINE_IPP
+#define BOOST_MYSQL_IMPL_PIPELINE_IPP
+
+#pragma once
+
+#include <boost/mysql/pipeline.hpp>
+
+#include <boost/mysql/impl/internal/channel/message_writer.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/start_execution.hpp>
+#include <boost/mysql/impl/internal/protocol/protocol.hpp>
+
+void boost::mysql::pipeline_request::add_impl(const detail::any_execution_request& req)
+{
+    detail::pipeline_stage stage{
+        detail::get_encoding(req),
+        0,
+        detail::check_client_errors(req),
+        req.is_query ? 0u : req.data.stmt.stmt.id(),
+    };
+
+    // Requests with client errors are not sent to the server. Pipelines are serialized
+    // independently of any connection, so parameter types are always sent
+    if (!stage.err)
+    {
+        impl_.request_offsets.push_back(impl_.buffer.size());
+        stage.seqnum = req.is_query
+                           ? detail::serialize_framed(detail::query_command{req.data.query}, impl_.buffer)
+                           : detail::serialize_framed(
+                                 detail::execute_stmt_command{
+                                     req.data.stmt.stmt.id(),
+                                     req.data.stmt.params,
+                                     true,
+                                     false,
+                                     {}
+                                 },
+                                 impl_.buffer
+                             );
+    }
+
+    impl_.stages.push_back(stage);
+}
+
+#endif
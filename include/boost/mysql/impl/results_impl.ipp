@@ -70,7 +70,7 @@ boost::mysql::error_code boost::mysql::detail::results_impl::
 boost::mysql::error_code boost::mysql::detail::results_impl::
     on_meta_impl(const coldef_view& coldef, bool, diagnostics&)
 {
-    meta_.push_back(create_meta(coldef));
+    add_meta(meta_, coldef);
     return error_code();
 }
 
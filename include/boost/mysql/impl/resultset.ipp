@@ -17,7 +17,7 @@ void boost::mysql::resultset::assign(resultset_view v)
     has_value_ = v.has_value();
     if (has_value_)
     {
-        meta_.assign(v.meta().begin(), v.meta().end());
+        meta_.assign(v.meta());
         rws_ = v.rows();
         affected_rows_ = v.affected_rows();
         last_insert_id_ = v.last_insert_id();
@@ -165,42 +165,60 @@ void boost::mysql::detail::row_impl::assign(const field_view* fields, std::size_
     }
 }
 
-void boost::mysql::detail::row_impl::copy_strings_as_offsets(std::size_t first, std::size_t num_fields)
+void boost::mysql::detail::copy_strings_as_offsets(
+    span<field_view> fields,
+    std::vector<unsigned char>& buffer
+)
 {
-    // Preconditions
-    BOOST_ASSERT(first <= fields_.size());
-    BOOST_ASSERT(first + num_fields <= fields_.size());
-
     // Calculate the required size for the new strings
     std::size_t size = 0;
-    for (std::size_t i = first; i < first + num_fields; ++i)
+    for (auto f : fields)
     {
-        size += get_string_size(fields_[i]);
+        size += get_string_size(f);
     }
 
     // Make space. The previous fields should be in offset form
-    std::size_t old_string_buffer_size = string_buffer_.size();
-    string_buffer_.resize(old_string_buffer_size + size);
+    std::size_t old_buffer_size = buffer.size();
+    buffer.resize(old_buffer_size + size);
 
     // Copy strings and blobs
-    std::size_t offset = old_string_buffer_size;
-    for (std::size_t i = first; i < first + num_fields; ++i)
+    std::size_t offset = old_buffer_size;
+    for (auto& f : fields)
     {
-        auto& f = fields_[i];
         switch (f.kind())
         {
-        case field_kind::string: offset += copy_string_as_offset(string_buffer_.data(), offset, f); break;
-        case field_kind::blob: offset += copy_blob_as_offset(string_buffer_.data(), offset, f); break;
+        case field_kind::string: offset += copy_string_as_offset(buffer.data(), offset, f); break;
+        case field_kind::blob: offset += copy_blob_as_offset(buffer.data(), offset, f); break;
         default: break;
         }
     }
-    BOOST_ASSERT(offset == string_buffer_.size());
+    BOOST_ASSERT(offset == buffer.size());
+}
+
+void boost::mysql::detail::offsets_to_string_views(
+    span<field_view> fields,
+    const unsigned char* buffer_first
+) noexcept
+{
+    for (auto& f : fields)
+        f = offset_to_string_view(f, buffer_first);
+}
+
+void boost::mysql::detail::row_impl::copy_strings_as_offsets(std::size_t first, std::size_t num_fields)
+{
+    // Preconditions
+    BOOST_ASSERT(first <= fields_.size());
+    BOOST_ASSERT(first + num_fields <= fields_.size());
+
+    ::boost::mysql::detail::copy_strings_as_offsets(
+        span<field_view>(fields_.data() + first, num_fields),
+        string_buffer_
+    );
 }
 
 void boost::mysql::detail::row_impl::offsets_to_string_views()
 {
-    for (auto& f : fields_)
-        f = offset_to_string_view(f, string_buffer_.data());
+    ::boost::mysql::detail::offsets_to_string_views(fields_, string_buffer_.data());
 }
 
 #endif
@@ -0,0 +1,147 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_IMPL_ROW_STREAM_HPP
+#define BOOST_MYSQL_IMPL_ROW_STREAM_HPP
+
+#pragma once
+
+#include <boost/mysql/row_stream.hpp>
+
+#include <boost/asio/compose.hpp>
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/post.hpp>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+template <class Stream>
+struct row_stream_read_next_op : boost::asio::coroutine
+{
+    row_stream<Stream>& stream_;
+    diagnostics& diag_;
+    bool did_io_{false};
+
+    row_stream_read_next_op(row_stream<Stream>& stream, diagnostics& diag) noexcept
+        : stream_(stream), diag_(diag)
+    {
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {}, rows_view batch = {})
+    {
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            diag_.clear();
+
+            // Serve buffered rows without I/O. Post to avoid completing inline
+            if (stream_.has_buffered_rows())
+            {
+                BOOST_ASIO_CORO_YIELD boost::asio::post(stream_.get_executor(), std::move(self));
+                self.complete(error_code(), stream_.next_buffered_row());
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            // Read batches until we get a row or the resultset ends.
+            // read_some_rows may return an empty batch if it only read the final OK packet
+            while (stream_.st_->should_read_rows())
+            {
+                BOOST_ASIO_CORO_YIELD stream_.conn_
+                    ->async_read_some_rows(*stream_.st_, diag_, std::move(self));
+                did_io_ = true;
+                if (err)
+                {
+                    self.complete(err, row_view());
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+                stream_.set_batch(batch);
+                if (stream_.has_buffered_rows())
+                {
+                    self.complete(error_code(), stream_.next_buffered_row());
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+            }
+
+            // End of the resultset. If we performed no I/O, post to avoid completing inline
+            if (!did_io_)
+            {
+                BOOST_ASIO_CORO_YIELD boost::asio::post(stream_.get_executor(), std::move(self));
+            }
+            self.complete(error_code(), row_view());
+        }
+    }
+};
+
+#ifdef BOOST_MYSQL_CXX14
+
+template <class Stream, class StaticRow, class... ResultsetRows>
+struct static_row_stream_read_next_op : boost::asio::coroutine
+{
+    static_row_stream<Stream, StaticRow, ResultsetRows...>& stream_;
+    diagnostics& diag_;
+    bool did_io_{false};
+
+    static_row_stream_read_next_op(
+        static_row_stream<Stream, StaticRow, ResultsetRows...>& stream,
+        diagnostics& diag
+    ) noexcept
+        : stream_(stream), diag_(diag)
+    {
+    }
+
+    template <class Self>
+    void operator()(Self& self, error_code err = {}, std::size_t num_rows = 0)
+    {
+        BOOST_ASIO_CORO_REENTER(*this)
+        {
+            diag_.clear();
+
+            // Serve buffered rows without I/O. Post to avoid completing inline
+            if (stream_.has_buffered_rows())
+            {
+                BOOST_ASIO_CORO_YIELD boost::asio::post(stream_.get_executor(), std::move(self));
+                self.complete(error_code(), stream_.next_buffered_row());
+                BOOST_ASIO_CORO_YIELD break;
+            }
+
+            // Read batches until we get a row or the resultset ends
+            while (stream_.st_->should_read_rows())
+            {
+                BOOST_ASIO_CORO_YIELD stream_.conn_
+                    ->async_read_some_rows(*stream_.st_, stream_.storage(), diag_, std::move(self));
+                did_io_ = true;
+                if (err)
+                {
+                    self.complete(err, nullptr);
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+                stream_.set_batch(num_rows);
+                if (stream_.has_buffered_rows())
+                {
+                    self.complete(error_code(), stream_.next_buffered_row());
+                    BOOST_ASIO_CORO_YIELD break;
+                }
+            }
+
+            // End of the resultset. If we performed no I/O, post to avoid completing inline
+            if (!did_io_)
+            {
+                BOOST_ASIO_CORO_YIELD boost::asio::post(stream_.get_executor(), std::move(self));
+            }
+            self.complete(error_code(), nullptr);
+        }
+    }
+};
+
+#endif  // BOOST_MYSQL_CXX14
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -22,6 +22,7 @@ void boost::mysql::detail::static_execution_state_erased_impl::reset_impl() noex
     ok_data_ = ok_packet_data();
     info_.clear();
     meta_.clear();
+    direct_parse_ = false;
 }
 
 boost::mysql::error_code boost::mysql::detail::static_execution_state_erased_impl::on_head_ok_packet_impl(
@@ -52,12 +53,15 @@ boost::mysql::error_code boost::mysql::detail::static_execution_state_erased_imp
     std::size_t meta_index = meta_.size();
 
     // Store the object
-    meta_.push_back(create_meta(coldef));
+    add_meta(meta_, coldef);
 
     // Record its position
     pos_map_add_field(current_pos_map(), current_name_table(), meta_index, coldef.name);
 
-    return is_last ? meta_check(diag) : error_code();
+    if (!is_last)
+        return error_code();
+    direct_parse_ = pos_map_is_identity(current_pos_map());
+    return meta_check(diag);
 }
 
 boost::mysql::error_code boost::mysql::detail::static_execution_state_erased_impl::on_row_impl(
@@ -71,6 +75,17 @@ boost::mysql::error_code boost::mysql::detail::static_execution_state_erased_imp
     if (ref.type_index() != ext_.type_index(resultset_index_ - 1))
         return client_errc::row_type_mismatch;
 
+    // If fields are in the same order in the row type and in the message, parse them
+    // directly into the output, without the intermediate field_view storage
+    if (direct_parse_)
+    {
+        row_field_reader reader(encoding(), msg, meta_);
+        auto err = reader.start();
+        if (err)
+            return err;
+        return ext_.parse_direct_fn(resultset_index_ - 1)(reader, ref);
+    }
+
     // Allocate temporary space
     fields.clear();
     span<field_view> storage = add_fields(fields, meta_.size());
@@ -101,6 +116,7 @@ void boost::mysql::detail::static_execution_state_erased_impl::on_new_resultset(
     ok_data_ = ok_packet_data{};
     info_.clear();
     meta_.clear();
+    direct_parse_ = false;
     pos_map_reset(current_pos_map());
 }
 
@@ -23,6 +23,7 @@ void boost::mysql::detail::static_results_erased_impl::reset_impl() noexcept
     info_.clear();
     meta_.clear();
     resultset_index_ = 0;
+    direct_parse_ = false;
 }
 
 boost::mysql::error_code boost::mysql::detail::static_results_erased_impl::on_head_ok_packet_impl(
@@ -54,12 +55,15 @@ boost::mysql::error_code boost::mysql::detail::static_results_erased_impl::on_me
     std::size_t meta_index = meta_.size() - current_resultset().meta_offset;
 
     // Store the new object
-    meta_.push_back(create_meta(coldef));
+    add_meta(meta_, coldef);
 
     // Fill the pos map entry for this field, if any
     pos_map_add_field(current_pos_map(), current_name_table(), meta_index, coldef.name);
 
-    return is_last ? meta_check(diag) : error_code();
+    if (!is_last)
+        return error_code();
+    direct_parse_ = pos_map_is_identity(current_pos_map());
+    return meta_check(diag);
 }
 
 boost::mysql::error_code boost::mysql::detail::static_results_erased_impl::on_row_impl(
@@ -71,6 +75,17 @@ boost::mysql::error_code boost::mysql::detail::static_results_erased_impl::on_ro
 {
     auto meta = current_resultset_meta();
 
+    // If fields are in the same order in the row type and in the message, parse them
+    // directly into the output, without the intermediate field_view storage
+    if (direct_parse_)
+    {
+        row_field_reader reader(encoding(), msg, meta);
+        auto err = reader.start();
+        if (err)
+            return err;
+        return ext_.parse_direct_fn(resultset_index_ - 1)(reader, ext_.rows());
+    }
+
     // Allocate temporary storage
     fields.clear();
     span<field_view> storage = add_fields(fields, meta.size());
@@ -99,6 +114,7 @@ boost::mysql::detail::static_per_resultset_data& boost::mysql::detail::static_re
     resultset_data = static_per_resultset_data();
     resultset_data.meta_offset = meta_.size();
     resultset_data.info_offset = info_.size();
+    direct_parse_ = false;
     pos_map_reset(current_pos_map());
     return resultset_data;
 }
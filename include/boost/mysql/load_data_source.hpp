@@ -0,0 +1,142 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_LOAD_DATA_SOURCE_HPP
+#define BOOST_MYSQL_LOAD_DATA_SOURCE_HPP
+
+#include <boost/mysql/error_code.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/any_load_data_source.hpp>
+
+#include <boost/asio/buffer.hpp>
+
+#include <cstddef>
+#include <memory>
+#include <string>
+#include <type_traits>
+#include <utility>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief The source of the data sent to the server by a `LOAD DATA LOCAL INFILE` statement.
+ * \details
+ * Passed to \ref connection::load_data_local. The connection reads chunks from the source
+ * and sends them to the server as they are read, so the data is never held in memory as a whole.
+ * Sources can also provide the value of a prepared statement parameter,
+ * using \ref connection::send_long_data.
+ * \n
+ * Create objects of this type using \ref from_callback, \ref from_stream or \ref from_file.
+ * \n
+ * The data sent is the one provided by the source, regardless of the file name
+ * present in the statement. A server can't make the client send arbitrary files.
+ * \n
+ * This is a move-only type. A default-constructed or moved-from object is invalid and
+ * can only be assigned to or destroyed.
+ */
+class load_data_source
+{
+public:
+    /**
+     * \brief Default constructor.
+     * \details Constructs an invalid object.
+     */
+    load_data_source() = default;
+
+    /**
+     * \brief Creates a source that invokes a callback to obtain the data.
+     * \details
+     * `cb` must be callable with the signature `std::size_t(asio::mutable_buffer, error_code&)`.
+     * It should place up to `buffer_size(buff)` bytes in the passed buffer and return the number of
+     * bytes placed. Returning zero without setting the error code signals the end of the data.
+     * Setting the error code aborts the transfer, making the operation fail with the same code.
+     * \n
+     * The callback is always invoked synchronously, even from async operations.
+     *
+     * \par Exception safety
+     * Strong guarantee. Memory allocations may throw.
+     */
+    template <class Callback>
+    static load_data_source from_callback(Callback&& cb)
+    {
+        using cb_type = typename std::decay<Callback>::type;
+        static_assert(
+            std::is_convertible<
+                decltype(std::declval<
+                         cb_type&>()(std::declval<asio::mutable_buffer>(), std::declval<error_code&>())),
+                std::size_t>::value,
+            "Callback should be callable with signature std::size_t(asio::mutable_buffer, error_code&)"
+        );
+        return load_data_source(
+            std::unique_ptr<detail::any_load_data_source>(
+                new detail::callback_load_data_source<cb_type>(cb_type(std::forward<Callback>(cb)))
+            )
+        );
+    }
+
+    /**
+     * \brief Creates a source that reads the data from a stream.
+     * \details
+     * `Stream` should satisfy both the `SyncReadStream` and `AsyncReadStream` concepts.
+     * Sync operations read the stream using `read_some`, while async ones use `async_read_some`.
+     * The data ends when the stream returns `asio::error::eof`. Any other error
+     * aborts the transfer, making the operation fail with the same code.
+     *
+     * \par Exception safety
+     * Strong guarantee. Memory allocations may throw.
+     *
+     * \par Object lifetimes
+     * The returned object holds a reference to `stream`, which must be kept alive
+     * until the operation using the source completes.
+     */
+    template <class Stream>
+    static load_data_source from_stream(Stream& stream)
+    {
+        return load_data_source(
+            std::unique_ptr<detail::any_load_data_source>(new detail::stream_load_data_source<Stream>(stream))
+        );
+    }
+
+    /**
+     * \brief Creates a source that reads the data from a file in the local filesystem.
+     * \details
+     * The file is opened by this function. If opening it fails, the error is reported
+     * when the source is used. Files are always read synchronously, even from async operations.
+     *
+     * \par Exception safety
+     * Strong guarantee. Memory allocations may throw.
+     */
+    static load_data_source from_file(const std::string& path)
+    {
+        return load_data_source(
+            std::unique_ptr<detail::any_load_data_source>(new detail::file_load_data_source(path))
+        );
+    }
+
+    /**
+     * \brief Returns whether the object is in a valid state.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool valid() const noexcept { return impl_ != nullptr; }
+
+private:
+    std::unique_ptr<detail::any_load_data_source> impl_;
+
+    load_data_source(std::unique_ptr<detail::any_load_data_source> impl) noexcept : impl_(std::move(impl)) {}
+
+#ifndef BOOST_MYSQL_DOXYGEN
+    friend struct detail::access;
+#endif
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -15,11 +15,20 @@
 #include <boost/mysql/detail/coldef_view.hpp>
 #include <boost/mysql/detail/flags.hpp>
 
+#include <cstddef>
+#include <cstdint>
 #include <string>
+#include <utility>
 
 namespace boost {
 namespace mysql {
 
+#ifndef BOOST_MYSQL_DOXYGEN
+namespace detail {
+class metadata_vector;
+}
+#endif
+
 /**
  * \brief Metadata about a column in a SQL query.
  * \details This is a regular, value type. Instances of this class are not created by the user
@@ -47,7 +56,7 @@ public:
      * \par Object lifetimes
      * `string_view`s obtained by calling accessor functions on `other` are invalidated.
      */
-    metadata(metadata&& other) = default;
+    metadata(metadata&& other) noexcept { move_from(other); }
 
     /**
      * \brief Copy constructor.
@@ -55,7 +64,7 @@ public:
      * \par Exception safety
      * Strong guarantee. Internal allocations may throw.
      */
-    metadata(const metadata& other) = default;
+    metadata(const metadata& other) { copy_from(other); }
 
     /**
      * \brief Move assignment.
@@ -67,7 +76,12 @@ public:
      * `string_view`s obtained by calling accessor functions on both `*this` and `other`
      * are invalidated.
      */
-    metadata& operator=(metadata&& other) = default;
+    metadata& operator=(metadata&& other) noexcept
+    {
+        if (this != &other)
+            move_from(other);
+        return *this;
+    }
 
     /**
      * \brief Copy assignment.
@@ -79,7 +93,12 @@ public:
      * `string_view`s obtained by calling accessor functions on `*this`
      * are invalidated.
      */
-    metadata& operator=(const metadata& other) = default;
+    metadata& operator=(const metadata& other)
+    {
+        if (this != &other)
+            copy_from(other);
+        return *this;
+    }
 
     /// Destructor.
     ~metadata() = default;
@@ -97,7 +116,7 @@ public:
      * The returned reference is valid as long as `*this` is alive and hasn't been
      * assigned to or moved from.
      */
-    string_view database() const noexcept { return schema_; }
+    string_view database() const noexcept { return get_string(schema_idx); }
 
     /**
      * \brief Returns the name of the virtual table the column belongs to.
@@ -114,7 +133,7 @@ public:
      * The returned reference is valid as long as `*this` is alive and hasn't been
      * assigned to or moved from.
      */
-    string_view table() const noexcept { return table_; }
+    string_view table() const noexcept { return get_string(table_idx); }
 
     /**
      * \brief Returns the name of the physical table the column belongs to.
@@ -131,7 +150,7 @@ public:
      * The returned reference is valid as long as `*this` is alive and hasn't been
      * assigned to or moved from.
      */
-    string_view original_table() const noexcept { return org_table_; }
+    string_view original_table() const noexcept { return get_string(org_table_idx); }
 
     /**
      * \brief Returns the actual name of the column.
@@ -149,7 +168,7 @@ public:
      * The returned reference is valid as long as `*this` is alive and hasn't been
      * assigned to or moved from.
      */
-    string_view column_name() const noexcept { return name_; }
+    string_view column_name() const noexcept { return get_string(name_idx); }
 
     /**
      * \brief Returns the original (physical) name of the column.
@@ -166,7 +185,7 @@ public:
      * The returned reference is valid as long as `*this` is alive and hasn't been
      * assigned to or moved from.
      */
-    string_view original_column_name() const noexcept { return org_name_; }
+    string_view original_column_name() const noexcept { return get_string(org_name_idx); }
 
     /**
      * \brief Returns the ID of the collation that fields belonging to this column use.
@@ -265,11 +284,23 @@ public:
     bool is_set_to_now_on_update() const noexcept { return flag_set(detail::column_flags::on_update_now); }
 
 private:
-    std::string schema_;
-    std::string table_;      // virtual table
-    std::string org_table_;  // physical table
-    std::string name_;       // virtual column name
-    std::string org_name_;   // physical column name
+    // The column's strings are stored contiguously, in this order
+    enum string_index : std::size_t
+    {
+        schema_idx = 0,
+        table_idx,      // virtual table
+        org_table_idx,  // physical table
+        name_idx,       // virtual column name
+        org_name_idx,   // physical column name
+        num_strings,
+    };
+
+    // Points either to owned_strings_, or to a buffer owned by the metadata_vector
+    // containing this object. The latter avoids allocating for every column
+    const char* strings_{};
+    std::size_t string_sizes_[num_strings]{};
+    std::string owned_strings_;
+
     std::uint16_t character_set_;
     std::uint32_t column_length_;  // maximum length of the field
     column_type type_;             // type of the column
@@ -277,24 +308,113 @@ private:
     std::uint8_t decimals_;        // max shown decimal digits. 0x00 for int/static strings; 0x1f for
                                    // dynamic strings, double, float
 
+    // Creates an object owning its strings
     metadata(const detail::coldef_view& coldef, bool copy_strings)
-        : schema_(copy_strings ? coldef.database : string_view()),
-          table_(copy_strings ? coldef.table : string_view()),
-          org_table_(copy_strings ? coldef.org_table : string_view()),
-          name_(copy_strings ? coldef.name : string_view()),
-          org_name_(copy_strings ? coldef.org_name : string_view()),
+        : metadata(coldef, static_cast<const char*>(nullptr))
+    {
+        if (copy_strings)
+        {
+            set_string_sizes(coldef);
+            owned_strings_.reserve(total_string_size());
+            owned_strings_.append(coldef.database.data(), coldef.database.size());
+            owned_strings_.append(coldef.table.data(), coldef.table.size());
+            owned_strings_.append(coldef.org_table.data(), coldef.org_table.size());
+            owned_strings_.append(coldef.name.data(), coldef.name.size());
+            owned_strings_.append(coldef.org_name.data(), coldef.org_name.size());
+            strings_ = owned_strings_.data();
+        }
+    }
+
+    // Creates an object whose strings are stored by a metadata_vector. If strings is nullptr,
+    // strings are not stored. Otherwise, they have been copied contiguously to strings
+    metadata(const detail::coldef_view& coldef, const char* strings) noexcept
+        : strings_(strings),
           character_set_(coldef.collation_id),
           column_length_(coldef.column_length),
           type_(coldef.type),
           flags_(coldef.flags),
           decimals_(coldef.decimals)
     {
+        if (strings)
+            set_string_sizes(coldef);
+    }
+
+    // Creates a copy of other whose strings are stored by a metadata_vector, at strings
+    metadata(const metadata& other, const char* strings) noexcept { copy_members(other, strings); }
+
+    void set_string_sizes(const detail::coldef_view& coldef) noexcept
+    {
+        string_sizes_[schema_idx] = coldef.database.size();
+        string_sizes_[table_idx] = coldef.table.size();
+        string_sizes_[org_table_idx] = coldef.org_table.size();
+        string_sizes_[name_idx] = coldef.name.size();
+        string_sizes_[org_name_idx] = coldef.org_name.size();
+    }
+
+    std::size_t total_string_size() const noexcept
+    {
+        std::size_t res = 0;
+        for (std::size_t size : string_sizes_)
+            res += size;
+        return res;
+    }
+
+    string_view get_string(string_index idx) const noexcept
+    {
+        std::size_t offset = 0;
+        for (std::size_t i = 0; i < idx; ++i)
+            offset += string_sizes_[i];
+        return string_sizes_[idx] ? string_view(strings_ + offset, string_sizes_[idx]) : string_view();
+    }
+
+    bool owns_strings() const noexcept { return strings_ == owned_strings_.data(); }
+
+    // Copies everything but owned_strings_
+    void copy_members(const metadata& other, const char* strings) noexcept
+    {
+        strings_ = strings;
+        for (std::size_t i = 0; i < num_strings; ++i)
+            string_sizes_[i] = other.string_sizes_[i];
+        character_set_ = other.character_set_;
+        column_length_ = other.column_length_;
+        type_ = other.type_;
+        flags_ = other.flags_;
+        decimals_ = other.decimals_;
+    }
+
+    // Copies always own their strings, so they can outlive the container holding other
+    void copy_from(const metadata& other)
+    {
+        std::size_t size = other.total_string_size();
+        if (size)
+            owned_strings_.assign(other.strings_, size);
+        else
+            owned_strings_.clear();
+        copy_members(other, owned_strings_.data());
+    }
+
+    void move_from(metadata& other) noexcept
+    {
+        if (other.owns_strings())
+        {
+            owned_strings_ = std::move(other.owned_strings_);
+            copy_members(other, owned_strings_.data());
+        }
+        else
+        {
+            owned_strings_.clear();
+            copy_members(other, other.strings_);
+        }
+        other.strings_ = nullptr;
+        for (std::size_t& size : other.string_sizes_)
+            size = 0;
     }
 
     bool flag_set(std::uint16_t flag) const noexcept { return flags_ & flag; }
 
 #ifndef BOOST_MYSQL_DOXYGEN
     friend struct detail::access;
+    friend class detail::metadata_vector;
 #endif
 };
 
@@ -19,8 +19,9 @@ enum class metadata_mode
     /// class empty.
     minimal,
 
-    /// Retain as much metadata as possible. All the fields in \ref metadata are usable,
-    /// but causes more allocations.
+    /// Retain as much metadata as possible. All the fields in \ref metadata are usable.
+    /// Strings for all the columns in a resultset are stored in a single buffer, so this
+    /// mode doesn't require allocations per column, but consumes more memory.
     full
 };
 
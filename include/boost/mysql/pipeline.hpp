@@ -0,0 +1,270 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_PIPELINE_HPP
+#define BOOST_MYSQL_PIPELINE_HPP
+
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/field_view.hpp>
+#include <boost/mysql/results.hpp>
+#include <boost/mysql/statement.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/any_execution_request.hpp>
+#include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/resultset_encoding.hpp>
+#include <boost/mysql/detail/writable_field_traits.hpp>
+
+#include <boost/assert.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+
+namespace detail {
+
+struct pipeline_stage
+{
+    resultset_encoding encoding;
+    std::uint8_t seqnum;    // the sequence number the response will start with
+    error_code err;         // client-side errors, detected before sending the request
+    std::uint32_t stmt_id;  // the statement being executed, if encoding is binary
+};
+
+struct pipeline_request_impl
+{
+    std::vector<std::uint8_t> buffer;          // serialized requests, with frame headers
+    std::vector<std::size_t> request_offsets;  // where each request starts in buffer
+    std::vector<pipeline_stage> stages;
+};
+
+struct pipeline_response_item
+{
+    error_code err;
+    diagnostics diag;
+    results result;
+};
+
+}  // namespace detail
+
+/**
+ * \brief A sequence of requests to be executed using pipelining.
+ * \details
+ * Contains several execution requests (text queries and prepared statement executions)
+ * that will be sent to the server in a single write by \ref connection::execute_pipeline
+ * or \ref connection::async_execute_pipeline. This avoids paying one round-trip per request.
+ * \n
+ * Requests are serialized when they are added, so this object does not keep any reference
+ * to the passed queries, statements or parameters. The same pipeline may be executed
+ * several times.
+ */
+class pipeline_request
+{
+public:
+    /**
+     * \brief Default constructor.
+     * \details Constructs an empty pipeline, with `this->size() == 0`.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    pipeline_request() = default;
+
+    /**
+     * \brief Adds a text query to the pipeline.
+     * \details
+     * Has the same effect as passing `query` to \ref connection::execute.
+     *
+     * \par Exception safety
+     * Basic guarantee. Memory allocations may throw.
+     */
+    void add(string_view query) { add_impl(detail::any_execution_request(query)); }
+
+    /**
+     * \brief Adds a prepared statement execution to the pipeline, with parameters as a tuple.
+     * \details
+     * Has the same effect as passing `req` to \ref connection::execute.
+     * If the number of parameters doesn't match the statement's, executing the pipeline
+     * will report \ref client_errc::wrong_num_params for this request, without sending it.
+     *
+     * \par Exception safety
+     * Basic guarantee. Memory allocations may throw.
+     */
+    template <BOOST_MYSQL_WRITABLE_FIELD_TUPLE WritableFieldTuple>
+    void add(const bound_statement_tuple<WritableFieldTuple>& req)
+    {
+        const auto& impl = detail::access::get_impl(req);
+        auto params = detail::tuple_to_array(impl.params);
+        add_impl(detail::any_execution_request(impl.stmt, params));
+    }
+
+    /**
+     * \brief Adds a prepared statement execution to the pipeline, with parameters as an iterator range.
+     * \details
+     * Has the same effect as passing `req` to \ref connection::execute.
+     * If the number of parameters doesn't match the statement's, executing the pipeline
+     * will report \ref client_errc::wrong_num_params for this request, without sending it.
+     *
+     * \par Exception safety
+     * Basic guarantee. Memory allocations may throw.
+     */
+    template <BOOST_MYSQL_FIELD_VIEW_FORWARD_ITERATOR FieldViewFwdIterator>
+    void add(const bound_statement_iterator_range<FieldViewFwdIterator>& req)
+    {
+        const auto& impl = detail::access::get_impl(req);
+        std::vector<field_view> params(impl.first, impl.last);
+        add_impl(detail::any_execution_request(impl.stmt, params));
+    }
+
+    /**
+     * \brief Returns the number of requests in the pipeline.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t size() const noexcept { return impl_.stages.size(); }
+
+    /**
+     * \brief Returns whether the pipeline contains no requests.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool empty() const noexcept { return impl_.stages.empty(); }
+
+    /**
+     * \brief Removes all requests from the pipeline.
+     * \details Memory is kept, so it can be reused by subsequent calls to \ref add.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void clear() noexcept
+    {
+        impl_.buffer.clear();
+        impl_.request_offsets.clear();
+        impl_.stages.clear();
+    }
+
+private:
+    detail::pipeline_request_impl impl_;
+
+    BOOST_MYSQL_DECL
+    void add_impl(const detail::any_execution_request& req);
+
+#ifndef BOOST_MYSQL_DOXYGEN
+    friend struct detail::access;
+#endif
+};
+
+/**
+ * \brief Holds the results of executing a \ref pipeline_request.
+ * \details
+ * Contains an item per request in the pipeline, in the same order as they were added.
+ * Each item holds an error code, diagnostics and a \ref results object.
+ * \n
+ * Errors are isolated per request: if the server reports an error for a request,
+ * subsequent requests are still executed, and their results are available here.
+ * If a fatal error occurs (like a network error), the operation fails and all
+ * requests that couldn't be completed report that error.
+ */
+class pipeline_response
+{
+public:
+    /**
+     * \brief Default constructor.
+     * \details Constructs an empty response, with `this->size() == 0`.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    pipeline_response() = default;
+
+    /**
+     * \brief Returns the number of items in the response.
+     * \details After a pipeline has been executed, equals the pipeline's size.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t size() const noexcept { return impl_.size(); }
+
+    /**
+     * \brief Returns the error code for the i-th request.
+     * \details A default-constructed error code indicates success.
+     *
+     * \par Preconditions
+     * `i < this->size()`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    error_code error(std::size_t i) const noexcept
+    {
+        BOOST_ASSERT(i < size());
+        return impl_[i].err;
+    }
+
+    /**
+     * \brief Returns the diagnostics for the i-th request.
+     * \details Contains additional information if \ref error returned a server error.
+     *
+     * \par Preconditions
+     * `i < this->size()`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The returned reference is valid as long as `*this` is alive and the pipeline
+     * is not executed again using `*this`.
+     */
+    const diagnostics& diag(std::size_t i) const noexcept
+    {
+        BOOST_ASSERT(i < size());
+        return impl_[i].diag;
+    }
+
+    /**
+     * \brief Returns the results for the i-th request.
+     * \details If \ref error returned an error, the returned object may not contain a value.
+     *
+     * \par Preconditions
+     * `i < this->size()`
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The returned reference is valid as long as `*this` is alive and the pipeline
+     * is not executed again using `*this`.
+     */
+    const results& result(std::size_t i) const noexcept
+    {
+        BOOST_ASSERT(i < size());
+        return impl_[i].result;
+    }
+
+private:
+    std::vector<detail::pipeline_response_item> impl_;
+
+#ifndef BOOST_MYSQL_DOXYGEN
+    friend struct detail::access;
+#endif
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#ifdef BOOST_MYSQL_HEADER_ONLY
+#include <boost/mysql/impl/pipeline.ipp>
+#endif
+
+#endif
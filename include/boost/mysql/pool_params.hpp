@@ -0,0 +1,342 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_POOL_PARAMS_HPP
+#define BOOST_MYSQL_POOL_PARAMS_HPP
+
+#include <boost/mysql/buffer_params.hpp>
+#include <boost/mysql/compression_mode.hpp>
+#include <boost/mysql/handshake_params.hpp>
+#include <boost/mysql/ssl_mode.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <string>
+
+namespace boost {
+namespace mysql {
+
+/**
+ * \brief Configuration parameters for \ref connection_pool.
+ * \details
+ * Contains the parameters used to establish the connections owned by the pool (like
+ * the username and password), as well as the parameters controlling the pool's size
+ * and maintenance operations.
+ *\n
+ * Contrary to \ref handshake_params, this object owns copies of the strings passed to it.
+ * This is required because the pool establishes connections at arbitrary points in time.
+ */
+class pool_params
+{
+    std::string username_;
+    std::string password_;
+    std::string database_;
+    std::uint16_t connection_collation_{handshake_params::default_collation};
+    ssl_mode ssl_{ssl_mode::require};
+    bool multi_queries_{false};
+    compression_mode compression_{compression_mode::disable};
+    bool local_infile_{false};
+    std::size_t min_size_{default_min_size};
+    std::size_t max_size_{default_max_size};
+    std::chrono::steady_clock::duration idle_timeout_{std::chrono::minutes(10)};
+    std::chrono::steady_clock::duration ping_interval_{std::chrono::minutes(1)};
+    bool reset_on_return_{true};
+    buffer_params buffer_config_;
+    ssl_session_cache* ssl_sessions_{nullptr};
+
+public:
+    /// The default value of \ref min_size.
+    static constexpr std::size_t default_min_size = 1;
+
+    /// The default value of \ref max_size.
+    static constexpr std::size_t default_max_size = 151;
+
+    /**
+     * \brief Initializing constructor.
+     * \par Exception safety
+     * Strong guarantee. Throws if memory allocation fails.
+     *
+     * \param username User name to authenticate as.
+     * \param password Password for that username, possibly empty.
+     * \param db Database name to use, or empty string for no database (this is the default).
+     */
+    pool_params(string_view username, string_view password, string_view db = "")
+        : username_(username), password_(password), database_(db)
+    {
+    }
+
+    /**
+     * \brief Retrieves the username.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    string_view username() const noexcept { return username_; }
+
+    /**
+     * \brief Sets the username.
+     * \par Exception safety
+     * Strong guarantee. Throws if memory allocation fails.
+     */
+    void set_username(string_view value) { username_ = std::string(value); }
+
+    /**
+     * \brief Retrieves the password.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    string_view password() const noexcept { return password_; }
+
+    /**
+     * \brief Sets the password.
+     * \par Exception safety
+     * Strong guarantee. Throws if memory allocation fails.
+     */
+    void set_password(string_view value) { password_ = std::string(value); }
+
+    /**
+     * \brief Retrieves the database name to use when connecting.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    string_view database() const noexcept { return database_; }
+
+    /**
+     * \brief Sets the database name to use when connecting.
+     * \par Exception safety
+     * Strong guarantee. Throws if memory allocation fails.
+     */
+    void set_database(string_view value) { database_ = std::string(value); }
+
+    /**
+     * \brief Retrieves the connection collation.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::uint16_t connection_collation() const noexcept { return connection_collation_; }
+
+    /**
+     * \brief Sets the connection collation.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_connection_collation(std::uint16_t value) noexcept { connection_collation_ = value; }
+
+    /**
+     * \brief Retrieves the SSL mode.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    ssl_mode ssl() const noexcept { return ssl_; }
+
+    /**
+     * \brief Sets the SSL mode.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_ssl(ssl_mode value) noexcept { ssl_ = value; }
+
+    /**
+     * \brief Retrieves whether multi-query support is enabled.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool multi_queries() const noexcept { return multi_queries_; }
+
+    /**
+     * \brief Enables or disables support for the multi-query feature.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_multi_queries(bool v) noexcept { multi_queries_ = v; }
+
+    /**
+     * \brief Retrieves the compression mode.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    compression_mode compression() const noexcept { return compression_; }
+
+    /**
+     * \brief Sets the compression mode.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_compression(compression_mode value) noexcept { compression_ = value; }
+
+    /**
+     * \brief Retrieves whether `LOAD DATA LOCAL INFILE` support is enabled.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool local_infile() const noexcept { return local_infile_; }
+
+    /**
+     * \brief Enables or disables support for `LOAD DATA LOCAL INFILE` statements.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_local_infile(bool v) noexcept { local_infile_ = v; }
+
+    /**
+     * \brief Retrieves the minimum number of connections the pool keeps.
+     * \details
+     * \ref connection_pool::async_run creates connections until this size is reached,
+     * and never closes idle connections if that would make the pool shrink below it.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t min_size() const noexcept { return min_size_; }
+
+    /**
+     * \brief Sets the minimum number of connections the pool keeps.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_min_size(std::size_t v) noexcept { min_size_ = v; }
+
+    /**
+     * \brief Retrieves the maximum number of connections the pool may create.
+     * \details
+     * Once this size is reached, \ref connection_pool::async_get_connection waits
+     * until a connection is returned to the pool.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t max_size() const noexcept { return max_size_; }
+
+    /**
+     * \brief Sets the maximum number of connections the pool may create.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_max_size(std::size_t v) noexcept { max_size_ = v; }
+
+    /**
+     * \brief Retrieves the idle timeout.
+     * \details
+     * Connections that haven't been used for longer than this value are closed
+     * by \ref connection_pool::async_run, as long as the pool size is above \ref min_size.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::chrono::steady_clock::duration idle_timeout() const noexcept { return idle_timeout_; }
+
+    /**
+     * \brief Sets the idle timeout.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_idle_timeout(std::chrono::steady_clock::duration v) noexcept { idle_timeout_ = v; }
+
+    /**
+     * \brief Retrieves the health check interval.
+     * \details
+     * Idle connections that haven't been used for longer than this value are checked
+     * using \ref connection::async_ping before being handed to users, and periodically
+     * by \ref connection_pool::async_run. Connections failing the check are re-established.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::chrono::steady_clock::duration ping_interval() const noexcept { return ping_interval_; }
+
+    /**
+     * \brief Sets the health check interval.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_ping_interval(std::chrono::steady_clock::duration v) noexcept { ping_interval_ = v; }
+
+    /**
+     * \brief Retrieves whether session state is reset before reusing a connection.
+     * \details
+     * If `true` (the default), connections returned to the pool are reset using
+     * `COM_RESET_CONNECTION` before being handed to another user. This wipes session variables,
+     * temporary tables and prepared statements.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool reset_on_return() const noexcept { return reset_on_return_; }
+
+    /**
+     * \brief Sets whether session state is reset before reusing a connection.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_reset_on_return(bool v) noexcept { reset_on_return_ = v; }
+
+    /**
+     * \brief Retrieves the buffer parameters used to create connections.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    const buffer_params& buffer_config() const noexcept { return buffer_config_; }
+
+    /**
+     * \brief Sets the buffer parameters used to create connections.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_buffer_config(const buffer_params& v) noexcept { buffer_config_ = v; }
+
+    /**
+     * \brief Retrieves the cache used to resume TLS sessions, or `nullptr` if there is none.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    ssl_session_cache* ssl_sessions() const noexcept { return ssl_sessions_; }
+
+    /**
+     * \brief Sets the cache used to resume TLS sessions when the pool establishes connections.
+     * \details
+     * See \ref handshake_params::set_ssl_sessions for more info. A single cache may be shared
+     * between several pools.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The cache is not owned by this object, and must outlive any pool using it.
+     */
+    void set_ssl_sessions(ssl_session_cache* v) noexcept { ssl_sessions_ = v; }
+
+    /**
+     * \brief Creates a \ref handshake_params object pointing to the values stored in `*this`.
+     * \par Exception safety
+     * No-throw guarantee.
+     *
+     * \par Object lifetimes
+     * The returned object points into `*this`, and is valid as long as `*this` is alive
+     * and its string members are not modified.
+     */
+    handshake_params hparams() const noexcept
+    {
+        handshake_params res(
+            username_,
+            password_,
+            database_,
+            connection_collation_,
+            ssl_,
+            multi_queries_,
+            compression_,
+            local_infile_
+        );
+        res.set_ssl_sessions(ssl_sessions_);
+        return res;
+    }
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
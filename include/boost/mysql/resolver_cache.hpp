@@ -0,0 +1,152 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_RESOLVER_CACHE_HPP
+#define BOOST_MYSQL_RESOLVER_CACHE_HPP
+
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+
+#include <boost/asio/ip/tcp.hpp>
+
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <map>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+class resolver_cache_impl
+{
+    struct entry
+    {
+        std::vector<asio::ip::tcp::endpoint> endpoints;
+        std::chrono::steady_clock::time_point expiry;
+    };
+
+    std::map<std::pair<std::string, std::uint16_t>, entry> entries_;
+    std::chrono::steady_clock::duration ttl_;
+
+public:
+    explicit resolver_cache_impl(std::chrono::steady_clock::duration ttl) noexcept : ttl_(ttl) {}
+
+    std::chrono::steady_clock::duration ttl() const noexcept { return ttl_; }
+    void set_ttl(std::chrono::steady_clock::duration v) noexcept { ttl_ = v; }
+    std::size_t size() const noexcept { return entries_.size(); }
+    void clear() noexcept { entries_.clear(); }
+
+    // Returns the cached endpoints for host and port, or nullptr if there are none or they expired.
+    // Expired entries are removed
+    const std::vector<asio::ip::tcp::endpoint>* find(
+        string_view host,
+        std::uint16_t port,
+        std::chrono::steady_clock::time_point now
+    )
+    {
+        auto it = entries_.find(std::make_pair(std::string(host), port));
+        if (it == entries_.end())
+            return nullptr;
+        if (it->second.expiry <= now)
+        {
+            entries_.erase(it);
+            return nullptr;
+        }
+        return &it->second.endpoints;
+    }
+
+    void insert(
+        string_view host,
+        std::uint16_t port,
+        std::vector<asio::ip::tcp::endpoint> endpoints,
+        std::chrono::steady_clock::time_point now
+    )
+    {
+        // Empty results are never cached
+        if (endpoints.empty() || ttl_ <= std::chrono::steady_clock::duration::zero())
+            return;
+        auto& e = entries_[std::make_pair(std::string(host), port)];
+        e.endpoints = std::move(endpoints);
+        e.expiry = now + ttl_;
+    }
+};
+
+}  // namespace detail
+
+/**
+ * \brief A cache for hostname resolution results.
+ * \details
+ * Used by \ref connection::connect when passed a \ref host_list, to avoid resolving hostnames
+ * every time a connection is established. Results are stored for \ref ttl,
+ * regardless of the TTL of the DNS records. Failed resolutions are not cached.
+ * \n
+ * A cache may be shared between several connections, as long as it's not accessed concurrently.
+ * That is, if connections run in different threads, accesses must be protected with a strand or
+ * similar mechanism.
+ */
+class resolver_cache
+{
+    detail::resolver_cache_impl impl_;
+
+#ifndef BOOST_MYSQL_DOXYGEN
+    friend struct detail::access;
+#endif
+
+public:
+    /**
+     * \brief Constructor.
+     * \param ttl The time that resolution results are kept for. Defaults to one minute.
+     */
+    explicit resolver_cache(std::chrono::steady_clock::duration ttl = std::chrono::minutes(1)) noexcept
+        : impl_(ttl)
+    {
+    }
+
+    /**
+     * \brief Retrieves the time that resolution results are kept for.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::chrono::steady_clock::duration ttl() const noexcept { return impl_.ttl(); }
+
+    /**
+     * \brief Sets the time that resolution results are kept for.
+     * \details
+     * Only affects results stored after the call. A zero or negative value disables caching.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void set_ttl(std::chrono::steady_clock::duration v) noexcept { impl_.set_ttl(v); }
+
+    /**
+     * \brief Returns the number of hosts with results stored in the cache.
+     * \details
+     * The count may include expired results that haven't been removed yet.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    std::size_t size() const noexcept { return impl_.size(); }
+
+    /**
+     * \brief Removes all the stored results.
+     * \details
+     * Use this function if you know that the addresses of your servers changed.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    void clear() noexcept { impl_.clear(); }
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -15,6 +15,7 @@
 #include <boost/mysql/rows.hpp>
 
 #include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/metadata_vector.hpp>
 
 #include <boost/assert.hpp>
 
@@ -282,7 +283,7 @@ public:
 
 private:
     bool has_value_{false};
-    std::vector<metadata> meta_;
+    detail::metadata_vector meta_;
     ::boost::mysql::rows rws_;
     std::uint64_t affected_rows_{};
     std::uint64_t last_insert_id_{};
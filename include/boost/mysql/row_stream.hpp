@@ -0,0 +1,467 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_ROW_STREAM_HPP
+#define BOOST_MYSQL_ROW_STREAM_HPP
+
+#include <boost/mysql/connection.hpp>
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/execution_state.hpp>
+#include <boost/mysql/row_view.hpp>
+#include <boost/mysql/rows_view.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/config.hpp>
+#include <boost/mysql/detail/throw_on_error_loc.hpp>
+
+#include <boost/asio/async_result.hpp>
+#include <boost/assert.hpp>
+
+#include <cstddef>
+#include <iterator>
+#include <utility>
+
+#ifdef BOOST_MYSQL_CXX14
+#include <boost/mysql/static_execution_state.hpp>
+
+#include <boost/core/span.hpp>
+
+#include <vector>
+#endif
+
+namespace boost {
+namespace mysql {
+
+template <class Stream>
+class row_stream;
+
+#ifdef BOOST_MYSQL_CXX14
+template <class Stream, class StaticRow, class... ResultsetRows>
+class static_row_stream;
+#endif
+
+namespace detail {
+
+template <class Stream>
+struct row_stream_read_next_op;
+
+#ifdef BOOST_MYSQL_CXX14
+template <class Stream, class StaticRow, class... ResultsetRows>
+struct static_row_stream_read_next_op;
+#endif
+
+}  // namespace detail
+
+/**
+ * \brief Reads the rows of a multi-function operation one at a time (dynamic interface).
+ * \details
+ * Adapts a \ref connection and an \ref execution_state into a sequence of rows. Rows are read
+ * from the server in batches using \ref connection::read_some_rows, and handed to the user
+ * one by one. Rows are never copied: the returned \ref row_view objects point into the
+ * connection's internal buffers, exactly as the `rows_view` returned by `read_some_rows` would.
+ * \n
+ * The sequence ends when the current resultset has been fully read. If `st.should_read_head()`
+ * returns `true` at that point, you can read the next resultset head using
+ * \ref connection::read_resultset_head and keep using this object to read the next resultset's rows.
+ * \n
+ * Rows can be read using \ref read_next, \ref async_read_next or by iterating over the stream
+ * using \ref begin and \ref end. `async_read_next` can be used with `boost::asio::use_awaitable`
+ * to write C++20 coroutine loops.
+ *
+ * \par Object lifetimes
+ * The connection and the execution state must outlive this object and any outstanding
+ * operation on it. A \ref row_view returned by this object is valid until the connection
+ * performs the next network operation. Reading the next row may perform such an operation
+ * when the current batch is exhausted. Use \ref buffered_rows to check whether this is the case.
+ *
+ * \par Thread safety
+ * Distinct objects: safe. \n
+ * Shared objects: unsafe.
+ */
+template <class Stream>
+class row_stream
+{
+    connection<Stream>* conn_;
+    execution_state* st_;
+    rows_view batch_;
+    std::size_t pos_{};
+
+    friend struct detail::row_stream_read_next_op<Stream>;
+
+    bool has_buffered_rows() const noexcept { return pos_ < batch_.size(); }
+    row_view next_buffered_row() noexcept { return batch_[pos_++]; }
+    void set_batch(rows_view batch) noexcept
+    {
+        batch_ = batch;
+        pos_ = 0;
+    }
+
+public:
+    /// The executor type associated to this object.
+    using executor_type = typename connection<Stream>::executor_type;
+
+    class iterator;
+
+    /**
+     * \brief Constructor.
+     * \details
+     * No network operation is performed. `st` should represent a multi-function operation
+     * started using \ref connection::start_execution on `conn`.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    row_stream(connection<Stream>& conn, execution_state& st) noexcept : conn_(&conn), st_(&st) {}
+
+    /// Retrieves the executor associated to this object.
+    executor_type get_executor() { return conn_->get_executor(); }
+
+    /**
+     * \brief Retrieves the connection this object reads from.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    connection<Stream>& get_connection() const noexcept { return *conn_; }
+
+    /**
+     * \brief Retrieves the execution state this object reads from.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    execution_state& get_execution_state() const noexcept { return *st_; }
+
+    /**
+     * \brief Returns the rows that have been read from the server but not yet returned.
+     * \details
+     * Reading any of these rows won't perform any network operation.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    rows_view buffered_rows() const noexcept
+    {
+        if (!has_buffered_rows())
+            return rows_view();
+        return detail::access::construct<rows_view>(
+            batch_[pos_].begin(),
+            (batch_.size() - pos_) * batch_.num_columns(),
+            batch_.num_columns()
+        );
+    }
+
+    /**
+     * \brief Returns whether all the rows of the current resultset have been returned.
+     * \details
+     * Equivalent to `buffered_rows().empty() && !get_execution_state().should_read_rows()`.
+     *
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool done() const noexcept { return !has_buffered_rows() && !st_->should_read_rows(); }
+
+    /**
+     * \brief Reads the next row of the current resultset.
+     * \details
+     * If there are buffered rows, returns the next one without performing any network operation.
+     * Otherwise, reads a new batch using \ref connection::read_some_rows.
+     * \n
+     * Returns an empty \ref row_view once the current resultset has been fully read.
+     */
+    row_view read_next(error_code& err, diagnostics& diag)
+    {
+        err.clear();
+        diag.clear();
+        if (has_buffered_rows())
+            return next_buffered_row();
+        while (st_->should_read_rows())
+        {
+            set_batch(conn_->read_some_rows(*st_, err, diag));
+            if (err)
+                return row_view();
+            if (has_buffered_rows())
+                return next_buffered_row();
+        }
+        return row_view();
+    }
+
+    /// \copydoc read_next(error_code&,diagnostics&)
+    row_view read_next()
+    {
+        error_code err;
+        diagnostics diag;
+        row_view res = read_next(err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+        return res;
+    }
+
+    /**
+     * \copydoc read_next(error_code&,diagnostics&)
+     * \details
+     * If a buffered row is available, the operation completes as if by `boost::asio::post`,
+     * without performing any network operation.
+     *
+     * \par Handler signature
+     * The handler signature for this operation is
+     * `void(boost::mysql::error_code, boost::mysql::row_view)`.
+     */
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::row_view))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, row_view))
+    async_read_next(CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type))
+    {
+        return async_read_next(
+            detail::access::get_impl(*conn_).shared_diag(),
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /// \copydoc async_read_next
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, ::boost::mysql::row_view))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, row_view))
+    async_read_next(
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return asio::async_compose<CompletionToken, void(error_code, row_view)>(
+            detail::row_stream_read_next_op<Stream>(*this, diag),
+            token,
+            conn_->get_executor()
+        );
+    }
+
+    /**
+     * \brief Returns an iterator to the next row of the current resultset.
+     * \details
+     * Reads the next row as per \ref read_next. Incrementing the returned iterator reads
+     * the following row. The iterator compares equal to \ref end once the current resultset
+     * has been fully read. This is a single-pass, input iterator.
+     * \n
+     * Errors are reported by throwing \ref error_with_diagnostics.
+     */
+    iterator begin() { return iterator(this, read_next()); }
+
+    /**
+     * \brief Returns an iterator marking the end of the current resultset.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    iterator end() noexcept { return iterator(); }
+};
+
+/**
+ * \brief Input iterator over a \ref row_stream.
+ * \details
+ * Dereferencing yields the current \ref row_view. Incrementing reads the next row using
+ * \ref row_stream::read_next, throwing \ref error_with_diagnostics on failure.
+ */
+template <class Stream>
+class row_stream<Stream>::iterator
+{
+    row_stream* stream_{};
+    row_view current_;
+
+    friend class row_stream;
+
+    iterator(row_stream* stream, row_view current) noexcept
+        : stream_(current.empty() ? nullptr : stream), current_(current)
+    {
+    }
+
+public:
+    using value_type = row_view;
+    using reference = const row_view&;
+    using pointer = const row_view*;
+    using difference_type = std::ptrdiff_t;
+    using iterator_category = std::input_iterator_tag;
+
+    /// Constructs an end iterator.
+    iterator() = default;
+
+    reference operator*() const noexcept { return current_; }
+    pointer operator->() const noexcept { return &current_; }
+
+    iterator& operator++()
+    {
+        current_ = stream_->read_next();
+        if (current_.empty())
+            stream_ = nullptr;
+        return *this;
+    }
+
+    void operator++(int) { ++*this; }
+
+    friend bool operator==(const iterator& lhs, const iterator& rhs) noexcept
+    {
+        return lhs.stream_ == rhs.stream_;
+    }
+
+    friend bool operator!=(const iterator& lhs, const iterator& rhs) noexcept { return !(lhs == rhs); }
+};
+
+#ifdef BOOST_MYSQL_CXX14
+
+/**
+ * \brief Reads the rows of a multi-function operation one at a time (static interface).
+ * \details
+ * Adapts a \ref connection and a \ref static_execution_state into a sequence of `StaticRow`
+ * objects. Rows are read in batches of up to `batch_size` rows using \ref connection::read_some_rows,
+ * into storage owned by this object that is reused across batches. Returned pointers point into
+ * this storage.
+ * \n
+ * `StaticRow` must be the row type of the resultset currently being processed by the execution
+ * state. The sequence ends when the current resultset has been fully read.
+ *
+ * \par Object lifetimes
+ * The connection and the execution state must outlive this object and any outstanding
+ * operation on it. A pointer returned by this object is valid until the next row is read or this
+ * object is destroyed.
+ *
+ * \par Thread safety
+ * Distinct objects: safe. \n
+ * Shared objects: unsafe.
+ */
+template <class Stream, class StaticRow, class... ResultsetRows>
+class static_row_stream
+{
+    connection<Stream>* conn_;
+    static_execution_state<ResultsetRows...>* st_;
+    std::vector<StaticRow> batch_;
+    std::size_t size_{};
+    std::size_t pos_{};
+
+    friend struct detail::static_row_stream_read_next_op<Stream, StaticRow, ResultsetRows...>;
+
+    bool has_buffered_rows() const noexcept { return pos_ < size_; }
+    StaticRow* next_buffered_row() noexcept { return &batch_[pos_++]; }
+    span<StaticRow> storage() noexcept { return span<StaticRow>(batch_.data(), batch_.size()); }
+    void set_batch(std::size_t size) noexcept
+    {
+        size_ = size;
+        pos_ = 0;
+    }
+
+public:
+    /// The executor type associated to this object.
+    using executor_type = typename connection<Stream>::executor_type;
+
+    /**
+     * \brief Constructor.
+     * \details
+     * No network operation is performed. Allocates storage for `batch_size` rows.
+     *
+     * \par Preconditions
+     * `batch_size > 0`
+     *
+     * \par Exception safety
+     * Strong guarantee. Throws if memory allocation fails.
+     */
+    static_row_stream(
+        connection<Stream>& conn,
+        static_execution_state<ResultsetRows...>& st,
+        std::size_t batch_size = 64
+    )
+        : conn_(&conn), st_(&st), batch_(batch_size)
+    {
+        BOOST_ASSERT(batch_size > 0u);
+    }
+
+    /// Retrieves the executor associated to this object.
+    executor_type get_executor() { return conn_->get_executor(); }
+
+    /**
+     * \brief Returns whether all the rows of the current resultset have been returned.
+     * \par Exception safety
+     * No-throw guarantee.
+     */
+    bool done() const noexcept { return !has_buffered_rows() && !st_->should_read_rows(); }
+
+    /**
+     * \brief Reads the next row of the current resultset.
+     * \details
+     * If there are buffered rows, returns the next one without performing any network operation.
+     * Otherwise, reads a new batch using \ref connection::read_some_rows.
+     * \n
+     * Returns `nullptr` once the current resultset has been fully read.
+     * \n
+     * This function can report schema mismatches.
+     */
+    StaticRow* read_next(error_code& err, diagnostics& diag)
+    {
+        err.clear();
+        diag.clear();
+        if (has_buffered_rows())
+            return next_buffered_row();
+        while (st_->should_read_rows())
+        {
+            set_batch(conn_->read_some_rows(*st_, storage(), err, diag));
+            if (err)
+                return nullptr;
+            if (has_buffered_rows())
+                return next_buffered_row();
+        }
+        return nullptr;
+    }
+
+    /// \copydoc read_next(error_code&,diagnostics&)
+    StaticRow* read_next()
+    {
+        error_code err;
+        diagnostics diag;
+        StaticRow* res = read_next(err, diag);
+        detail::throw_on_error_loc(err, diag, BOOST_CURRENT_LOCATION);
+        return res;
+    }
+
+    /**
+     * \copydoc read_next(error_code&,diagnostics&)
+     * \details
+     * If a buffered row is available, the operation completes as if by `boost::asio::post`,
+     * without performing any network operation.
+     *
+     * \par Handler signature
+     * The handler signature for this operation is
+     * `void(boost::mysql::error_code, StaticRow*)`.
+     */
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, StaticRow*))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, StaticRow*))
+    async_read_next(CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type))
+    {
+        return async_read_next(
+            detail::access::get_impl(*conn_).shared_diag(),
+            std::forward<CompletionToken>(token)
+        );
+    }
+
+    /// \copydoc async_read_next
+    template <BOOST_ASIO_COMPLETION_TOKEN_FOR(void(::boost::mysql::error_code, StaticRow*))
+                  CompletionToken BOOST_ASIO_DEFAULT_COMPLETION_TOKEN_TYPE(executor_type)>
+    BOOST_ASIO_INITFN_AUTO_RESULT_TYPE(CompletionToken, void(error_code, StaticRow*))
+    async_read_next(
+        diagnostics& diag,
+        CompletionToken&& token BOOST_ASIO_DEFAULT_COMPLETION_TOKEN(executor_type)
+    )
+    {
+        return asio::async_compose<CompletionToken, void(error_code, StaticRow*)>(
+            detail::static_row_stream_read_next_op<Stream, StaticRow, ResultsetRows...>(*this, diag),
+            token,
+            conn_->get_executor()
+        );
+    }
+};
+
+#endif  // BOOST_MYSQL_CXX14
+
+}  // namespace mysql
+}  // namespace boost
+
+#include <boost/mysql/impl/row_stream.hpp>
+
+#endif
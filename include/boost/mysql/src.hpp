@@ -21,6 +21,7 @@
 #include <boost/mysql/impl/any_stream_impl.ipp>
 #include <boost/mysql/impl/channel_ptr.ipp>
 #include <boost/mysql/impl/column_type.ipp>
+#include <boost/mysql/impl/columnar_results_impl.ipp>
 #include <boost/mysql/impl/date.ipp>
 #include <boost/mysql/impl/datetime.ipp>
 #include <boost/mysql/impl/error_categories.ipp>
@@ -29,6 +30,7 @@
 #include <boost/mysql/impl/field_kind.ipp>
 #include <boost/mysql/impl/field_view.ipp>
 #include <boost/mysql/impl/internal/auth/auth.ipp>
+#include <boost/mysql/impl/internal/channel/compressed_stream.ipp>
 #include <boost/mysql/impl/internal/channel/message_parser.ipp>
 #include <boost/mysql/impl/internal/error/server_error_to_string.ipp>
 #include <boost/mysql/impl/internal/protocol/binary_serialization.ipp>
@@ -36,8 +38,11 @@
 #include <boost/mysql/impl/internal/protocol/deserialize_text_field.ipp>
 #include <boost/mysql/impl/internal/protocol/protocol.ipp>
 #include <boost/mysql/impl/internal/protocol/protocol_field_type.ipp>
+#include <boost/mysql/impl/internal/protocol/streaming_row_parser.ipp>
 #include <boost/mysql/impl/meta_check_context.ipp>
+#include <boost/mysql/impl/metadata_vector.ipp>
 #include <boost/mysql/impl/network_algorithms.ipp>
+#include <boost/mysql/impl/pipeline.ipp>
 #include <boost/mysql/impl/results_impl.ipp>
 #include <boost/mysql/impl/resultset.ipp>
 #include <boost/mysql/impl/row_impl.ipp>
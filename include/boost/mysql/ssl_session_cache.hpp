@@ -0,0 +1,137 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#ifndef BOOST_MYSQL_SSL_SESSION_CACHE_HPP
+#define BOOST_MYSQL_SSL_SESSION_CACHE_HPP
+
+#include <boost/mysql/detail/access.hpp>
+
+#include <boost/asio/ssl/detail/openssl_types.hpp>
+
+#include <cstddef>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <utility>
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+class ssl_session_cache_impl
+{
+    struct session_deleter
+    {
+        void operator()(SSL_SESSION* s) const noexcept { SSL_SESSION_free(s); }
+    };
+    using session_ptr = std::unique_ptr<SSL_SESSION, session_deleter>;
+
+    // Sessions can only be resumed using the context that created them
+    using key_type = std::pair<const SSL_CTX*, std::string>;
+
+    mutable std::mutex mtx_;
+    std::map<key_type, session_ptr> sessions_;
+
+public:
+    std::size_t size() const
+    {
+        std::lock_guard<std::mutex> guard(mtx_);
+        return sessions_.size();
+    }
+
+    void clear()
+    {
+        std::lock_guard<std::mutex> guard(mtx_);
+        sessions_.clear();
+    }
+
+    // If there is a session for the server identified by server_id, sets it in ssl
+    // so it's offered in the next handshake. Returns whether a session was set
+    bool offer(SSL* ssl, const std::string& server_id) const
+    {
+        if (server_id.empty())
+            return false;
+        std::lock_guard<std::mutex> guard(mtx_);
+        auto it = sessions_.find(key_type(SSL_get_SSL_CTX(ssl), server_id));
+        return it != sessions_.end() && SSL_set_session(ssl, it->second.get()) == 1;
+    }
+
+    // Stores the session negotiated by ssl, replacing the previous one, if any.
+    // Sessions that can't be resumed are not stored
+    void store(SSL* ssl, const std::string& server_id)
+    {
+        if (server_id.empty())
+            return;
+        session_ptr session(SSL_get1_session(ssl));
+        if (!session)
+            return;
+#if OPENSSL_VERSION_NUMBER >= 0x10101000L
+        if (!SSL_SESSION_is_resumable(session.get()))
+            return;
+#endif
+        std::lock_guard<std::mutex> guard(mtx_);
+        sessions_[key_type(SSL_get_SSL_CTX(ssl), server_id)] = std::move(session);
+    }
+};
+
+}  // namespace detail
+
+/**
+ * \brief A cache of TLS sessions, used to resume them when reconnecting.
+ * \details
+ * Resuming a session avoids a full TLS handshake, saving CPU time and, in TLS 1.2, a network round-trip.
+ * To use it, set it in \ref handshake_params::set_ssl_sessions or \ref pool_params::set_ssl_sessions.
+ * After each successful handshake, the negotiated session is stored in the cache. Subsequent
+ * handshakes to the same server offer it, and the server may accept it or perform a full handshake.
+ * \n
+ * Servers are identified by the SNI hostname, if set (e.g. via `SSL_set_tlsext_host_name`),
+ * and the remote endpoint of the connection. Sessions are only offered to connections using
+ * the `ssl::context` that created them. Only sessions marked as resumable are stored,
+ * including TLS 1.3 session tickets.
+ * \n
+ * This object is thread-safe: it can be shared between connections and pools running in different threads.
+ */
+class ssl_session_cache
+{
+    detail::ssl_session_cache_impl impl_;
+
+#ifndef BOOST_MYSQL_DOXYGEN
+    friend struct detail::access;
+#endif
+
+public:
+    /**
+     * \brief Default constructor.
+     * \details Constructs an empty cache.
+     */
+    ssl_session_cache() = default;
+
+    ssl_session_cache(const ssl_session_cache&) = delete;
+    ssl_session_cache& operator=(const ssl_session_cache&) = delete;
+
+    /**
+     * \brief Returns the number of stored sessions.
+     * \par Exception safety
+     * Basic guarantee. Throws if the internal mutex can't be locked.
+     */
+    std::size_t size() const { return impl_.size(); }
+
+    /**
+     * \brief Removes all the stored sessions.
+     * \details
+     * Connections established after this call perform a full handshake.
+     * \par Exception safety
+     * Basic guarantee. Throws if the internal mutex can't be locked.
+     */
+    void clear() { impl_.clear(); }
+};
+
+}  // namespace mysql
+}  // namespace boost
+
+#endif
@@ -19,6 +19,17 @@
 
 namespace boost {
 namespace mysql {
+namespace detail {
+
+struct statement_impl
+{
+    bool valid{false};
+    std::uint32_t id{0};
+    std::uint16_t num_params{0};
+    std::uint32_t session_id{0};  // the channel session the statement was prepared in
+};
+
+}  // namespace detail
 
 /**
  * \brief A statement with bound parameters, represented as a `std::tuple`.
@@ -72,7 +83,7 @@ public:
      * \par Exception safety
      * No-throw guarantee.
      */
-    bool valid() const noexcept { return valid_; }
+    bool valid() const noexcept { return impl_.valid; }
 
     /**
      * \brief Returns a server-side identifier for the statement (unique in a per-connection basis).
@@ -87,7 +98,7 @@ public:
     std::uint32_t id() const noexcept
     {
         BOOST_ASSERT(valid());
-        return id_;
+        return impl_.id;
     }
 
     /**
@@ -101,7 +112,7 @@ public:
     unsigned num_params() const noexcept
     {
         BOOST_ASSERT(valid());
-        return num_params_;
+        return impl_.num_params;
     }
 
     /**
@@ -186,13 +197,14 @@ public:
     ) const;
 
 private:
-    bool valid_{false};
-    std::uint32_t id_{0};
-    std::uint16_t num_params_{0};
+    detail::statement_impl impl_;
 
-    statement(std::uint32_t id, std::uint16_t num_params) noexcept
-        : valid_(true), id_(id), num_params_(num_params)
+    statement(std::uint32_t id, std::uint16_t num_params, std::uint32_t session_id = 0) noexcept
     {
+        impl_.valid = true;
+        impl_.id = id;
+        impl_.num_params = num_params;
+        impl_.session_id = session_id;
     }
 
 #ifndef BOOST_MYSQL_DOXYGEN
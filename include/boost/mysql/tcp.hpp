@@ -9,6 +9,7 @@
 #define BOOST_MYSQL_TCP_HPP
 
 #include <boost/mysql/connection.hpp>
+#include <boost/mysql/connection_pool.hpp>
 
 #include <boost/asio/ip/tcp.hpp>
 
@@ -18,6 +19,9 @@ namespace mysql {
 /// A connection to MySQL over a TCP socket.
 using tcp_connection = connection<boost::asio::ip::tcp::socket>;
 
+/// A pool of connections to MySQL over a TCP socket.
+using tcp_connection_pool = connection_pool<boost::asio::ip::tcp::socket>;
+
 }  // namespace mysql
 }  // namespace boost
 
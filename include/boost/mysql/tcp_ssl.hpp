@@ -9,6 +9,7 @@
 #define BOOST_MYSQL_TCP_SSL_HPP
 
 #include <boost/mysql/connection.hpp>
+#include <boost/mysql/connection_pool.hpp>
 
 #include <boost/asio/ip/tcp.hpp>
 #include <boost/asio/ssl/stream.hpp>
@@ -19,6 +20,9 @@ namespace mysql {
 /// A connection to MySQL over a TCP socket using TLS.
 using tcp_ssl_connection = connection<boost::asio::ssl::stream<boost::asio::ip::tcp::socket>>;
 
+/// A pool of connections to MySQL over a TCP socket using TLS.
+using tcp_ssl_connection_pool = connection_pool<boost::asio::ssl::stream<boost::asio::ip::tcp::socket>>;
+
 }  // namespace mysql
 }  // namespace boost
 
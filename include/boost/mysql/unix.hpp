@@ -9,6 +9,7 @@
 #define BOOST_MYSQL_UNIX_HPP
 
 #include <boost/mysql/connection.hpp>
+#include <boost/mysql/connection_pool.hpp>
 
 #include <boost/asio/local/stream_protocol.hpp>
 
@@ -20,6 +21,9 @@ namespace mysql {
 /// A connection to MySQL over a UNIX domain socket.
 using unix_connection = connection<boost::asio::local::stream_protocol::socket>;
 
+/// A pool of connections to MySQL over a UNIX domain socket.
+using unix_connection_pool = connection_pool<boost::asio::local::stream_protocol::socket>;
+
 #endif
 
 }  // namespace mysql
@@ -9,6 +9,7 @@
 #define BOOST_MYSQL_UNIX_SSL_HPP
 
 #include <boost/mysql/connection.hpp>
+#include <boost/mysql/connection_pool.hpp>
 
 #include <boost/asio/local/stream_protocol.hpp>
 #include <boost/asio/ssl/stream.hpp>
@@ -21,6 +22,10 @@ namespace mysql {
 /// A connection to MySQL over a UNIX domain socket over TLS.
 using unix_ssl_connection = connection<boost::asio::ssl::stream<boost::asio::local::stream_protocol::socket>>;
 
+/// A pool of connections to MySQL over a UNIX domain socket using TLS.
+using unix_ssl_connection_pool = connection_pool<
+    boost::asio::ssl::stream<boost::asio::local::stream_protocol::socket>>;
+
 #endif
 
 }  // namespace mysql
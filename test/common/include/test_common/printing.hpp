@@ -10,6 +10,7 @@
 
 #include <boost/mysql/client_errc.hpp>
 #include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/connection_observer.hpp>
 #include <boost/mysql/diagnostics.hpp>
 #include <boost/mysql/field_view.hpp>
 #include <boost/mysql/metadata_mode.hpp>
@@ -64,6 +65,11 @@ inline std::ostream& operator<<(std::ostream& os, metadata_mode v)
     }
 }
 
+inline std::ostream& operator<<(std::ostream& os, operation_type v)
+{
+    return os << "operation_type(" << static_cast<int>(v) << ")";
+}
+
 }  // namespace mysql
 }  // namespace boost
 
@@ -0,0 +1,193 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/connection_pool.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/pool_params.hpp>
+#include <boost/mysql/results.hpp>
+#include <boost/mysql/tcp.hpp>
+#include <boost/mysql/tcp_ssl.hpp>
+
+#include <boost/asio/error.hpp>
+#include <boost/asio/io_context.hpp>
+#include <boost/test/unit_test.hpp>
+
+#include <functional>
+
+#include "test_integration/common.hpp"
+#include "test_integration/get_endpoint.hpp"
+#include "test_integration/streams.hpp"
+
+using namespace boost::mysql::test;
+using namespace boost::mysql;
+
+namespace {
+
+BOOST_AUTO_TEST_SUITE(test_connection_pool)
+
+struct pool_fixture : network_fixture_base
+{
+    pool_params pparams{"integ_user", "integ_password", "boost_mysql_integtests"};
+
+    template <class Stream>
+    pooled_connection<Stream> get_connection(connection_pool<Stream>& pool, error_code expected_err = {})
+    {
+        error_code err = client_errc::wrong_num_params;  // make sure the handler is called
+        pooled_connection<Stream> res;
+        pool.async_get_connection([&](error_code ec, pooled_connection<Stream> conn) {
+            err = ec;
+            res = std::move(conn);
+        });
+        ctx.restart();
+        ctx.run();
+        BOOST_TEST_REQUIRE(err == expected_err);
+        BOOST_TEST(res.valid() == !expected_err);
+        return res;
+    }
+};
+
+BOOST_FIXTURE_TEST_CASE(get_connection_success, pool_fixture)
+{
+    tcp_connection_pool pool(ctx.get_executor(), get_endpoint<tcp_socket>(), pparams);
+
+    // Get a connection. It should be usable
+    auto conn = get_connection(pool);
+    results result;
+    conn->execute("SELECT 1", result);
+    BOOST_TEST(result.rows().at(0).at(0).as_int64() == 1);
+    BOOST_TEST(pool.size() == 1u);
+    BOOST_TEST(pool.num_idle() == 0u);
+}
+
+BOOST_FIXTURE_TEST_CASE(connection_reused_and_reset, pool_fixture)
+{
+    tcp_connection_pool pool(ctx.get_executor(), get_endpoint<tcp_socket>(), pparams);
+
+    // Get a connection and modify session state
+    auto conn = get_connection(pool);
+    const tcp_connection* conn_addr = &conn.get();
+    results result;
+    conn->execute("SET @myvar = 42", result);
+
+    // Return it to the pool
+    conn = pooled_connection<tcp_socket>();
+    BOOST_TEST(pool.num_idle() == 1u);
+
+    // Get it again. Session state should have been reset
+    conn = get_connection(pool);
+    BOOST_TEST(&conn.get() == conn_addr);
+    BOOST_TEST(pool.size() == 1u);
+    conn->execute("SELECT @myvar", result);
+    BOOST_TEST(result.rows().at(0).at(0).is_null());
+}
+
+BOOST_FIXTURE_TEST_CASE(no_reset, pool_fixture)
+{
+    pparams.set_reset_on_return(false);
+    tcp_connection_pool pool(ctx.get_executor(), get_endpoint<tcp_socket>(), pparams);
+
+    // Get a connection, modify session state and return it
+    auto conn = get_connection(pool);
+    results result;
+    conn->execute("SET @myvar = 42", result);
+    conn = pooled_connection<tcp_socket>();
+
+    // Session state is kept
+    conn = get_connection(pool);
+    conn->execute("SELECT @myvar", result);
+    BOOST_TEST(result.rows().at(0).at(0).as_int64() == 42);
+}
+
+BOOST_FIXTURE_TEST_CASE(max_size, pool_fixture)
+{
+    pparams.set_max_size(1);
+    tcp_connection_pool pool(ctx.get_executor(), get_endpoint<tcp_socket>(), pparams);
+    auto conn = get_connection(pool);
+
+    // This operation needs to wait until conn is returned
+    bool called = false;
+    pooled_connection<tcp_socket> conn2;
+    pool.async_get_connection([&](error_code ec, pooled_connection<tcp_socket> c) {
+        BOOST_TEST(ec == error_code());
+        called = true;
+        conn2 = std::move(c);
+    });
+    ctx.restart();
+    ctx.poll();
+    BOOST_TEST(!called);
+
+    // Returning the connection unblocks the waiter
+    conn = pooled_connection<tcp_socket>();
+    ctx.restart();
+    ctx.run();
+    BOOST_TEST(called);
+    BOOST_TEST(conn2.valid());
+    BOOST_TEST(pool.size() == 1u);
+}
+
+BOOST_FIXTURE_TEST_CASE(cancel, pool_fixture)
+{
+    tcp_connection_pool pool(ctx.get_executor(), get_endpoint<tcp_socket>(), pparams);
+
+    // Run and cancel the pool
+    bool run_called = false;
+    pool.async_run([&](error_code ec) {
+        BOOST_TEST(ec == error_code());
+        run_called = true;
+    });
+    ctx.poll();
+    pool.cancel();
+    ctx.run();
+    BOOST_TEST(run_called);
+
+    // After cancel, getting connections fails
+    get_connection(pool, boost::asio::error::operation_aborted);
+}
+
+BOOST_FIXTURE_TEST_CASE(run_creates_min_size, pool_fixture)
+{
+    pparams.set_min_size(2);
+    tcp_connection_pool pool(ctx.get_executor(), get_endpoint<tcp_socket>(), pparams);
+
+    // Run until the pool has reached its minimum size
+    pool.async_run([](error_code) {});
+    while (pool.num_idle() < 2u)
+        ctx.run_one();
+    pool.cancel();
+    ctx.run();
+    BOOST_TEST(pool.size() == 2u);
+}
+
+BOOST_FIXTURE_TEST_CASE(connect_error, pool_fixture)
+{
+    pparams.set_password("bad_password");
+    tcp_connection_pool pool(ctx.get_executor(), get_endpoint<tcp_socket>(), pparams);
+
+    get_connection(pool, common_server_errc::er_access_denied_error);
+    BOOST_TEST(pool.size() == 0u);
+}
+
+BOOST_FIXTURE_TEST_CASE(ssl, pool_fixture)
+{
+    tcp_ssl_connection_pool pool(ctx.get_executor(), get_endpoint<tcp_socket>(), pparams, std::ref(ssl_ctx));
+
+    auto conn = get_connection(pool);
+    BOOST_TEST(conn->uses_ssl());
+    conn = pooled_connection<tcp_ssl_socket>();
+
+    // Reusing the connection works
+    conn = get_connection(pool);
+    results result;
+    conn->execute("SELECT 1", result);
+    BOOST_TEST(result.rows().at(0).at(0).as_int64() == 1);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
+
+}  // namespace
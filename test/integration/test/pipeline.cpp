@@ -0,0 +1,103 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/pipeline.hpp>
+#include <boost/mysql/statement.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include "test_common/printing.hpp"
+#include "test_integration/common.hpp"
+#include "test_integration/tcp_network_fixture.hpp"
+
+using namespace boost::mysql::test;
+using namespace boost::mysql;
+
+namespace {
+
+BOOST_AUTO_TEST_SUITE(test_pipeline)
+
+BOOST_FIXTURE_TEST_CASE(queries_and_statements, tcp_network_fixture)
+{
+    connect();
+    auto stmt = conn.prepare_statement("SELECT ?");
+
+    pipeline_request req;
+    req.add("SET @myvar = 42");
+    req.add(stmt.bind("abc"));
+    req.add("SELECT @myvar");
+
+    pipeline_response res;
+    conn.execute_pipeline(req, res);
+
+    BOOST_TEST_REQUIRE(res.size() == 3u);
+    BOOST_TEST(res.error(0) == error_code());
+    BOOST_TEST(res.result(0).rows().size() == 0u);
+    BOOST_TEST(res.error(1) == error_code());
+    BOOST_TEST(res.result(1).rows().at(0).at(0).as_string() == "abc");
+    BOOST_TEST(res.error(2) == error_code());
+    BOOST_TEST(res.result(2).rows().at(0).at(0).as_int64() == 42);
+}
+
+BOOST_FIXTURE_TEST_CASE(errors_isolated, tcp_network_fixture)
+{
+    connect();
+    auto stmt = conn.prepare_statement("SELECT ?");
+
+    pipeline_request req;
+    req.add("SELECT 1");
+    req.add("SELECT * FROM bad_table");
+    req.add(stmt.bind());  // wrong number of params
+    req.add("SELECT 2");
+
+    pipeline_response res;
+    conn.execute_pipeline(req, res);
+
+    BOOST_TEST_REQUIRE(res.size() == 4u);
+    BOOST_TEST(res.error(0) == error_code());
+    BOOST_TEST(res.result(0).rows().at(0).at(0).as_int64() == 1);
+    BOOST_TEST(res.error(1) == error_code(common_server_errc::er_no_such_table));
+    BOOST_TEST(res.diag(1).server_message() != "");
+    BOOST_TEST(res.error(2) == error_code(client_errc::wrong_num_params));
+    BOOST_TEST(res.error(3) == error_code());
+    BOOST_TEST(res.result(3).rows().at(0).at(0).as_int64() == 2);
+
+    // The connection is still usable
+    results result;
+    conn.execute("SELECT 3", result);
+    BOOST_TEST(result.rows().at(0).at(0).as_int64() == 3);
+}
+
+BOOST_FIXTURE_TEST_CASE(async_reuse, tcp_network_fixture)
+{
+    connect();
+
+    pipeline_request req;
+    req.add("SELECT 1");
+    req.add("SELECT 'abc'");
+
+    // The same request and response objects can be used several times
+    pipeline_response res;
+    for (int i = 0; i < 2; ++i)
+    {
+        error_code ec = client_errc::wrong_num_params;  // make sure the handler is called
+        conn.async_execute_pipeline(req, res, [&](error_code err) { ec = err; });
+        ctx.restart();
+        ctx.run();
+        BOOST_TEST_REQUIRE(ec == error_code());
+        BOOST_TEST_REQUIRE(res.size() == 2u);
+        BOOST_TEST(res.result(0).rows().at(0).at(0).as_int64() == 1);
+        BOOST_TEST(res.result(1).rows().at(0).at(0).as_string() == "abc");
+    }
+}
+
+BOOST_AUTO_TEST_SUITE_END()
+
+}  // namespace
@@ -61,6 +61,16 @@ public:
         flag(detail::status_flags::out_params, v);
         return *this;
     }
+    ok_builder& cursor_exists(bool v) noexcept
+    {
+        flag(detail::status_flags::cursor_exists, v);
+        return *this;
+    }
+    ok_builder& last_row_sent(bool v) noexcept
+    {
+        flag(detail::status_flags::last_row_sent, v);
+        return *this;
+    }
     ok_builder& info(string_view v) noexcept
     {
         ok_.info = v;
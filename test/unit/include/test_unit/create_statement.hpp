@@ -22,6 +22,7 @@ class statement_builder
 {
     std::uint32_t id_{};
     std::uint16_t num_params_{};
+    std::uint32_t session_id_{};
 
 public:
     statement_builder() = default;
@@ -35,7 +36,12 @@ public:
         num_params_ = v;
         return *this;
     }
-    statement build() { return detail::access::construct<statement>(id_, num_params_); }
+    statement_builder& session_id(std::uint32_t v) noexcept
+    {
+        session_id_ = v;
+        return *this;
+    }
+    statement build() { return detail::access::construct<statement>(id_, num_params_, session_id_); }
 };
 
 }  // namespace test
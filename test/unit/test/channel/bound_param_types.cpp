@@ -0,0 +1,84 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/field_view.hpp>
+
+#include <boost/mysql/impl/internal/channel/bound_param_types.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include <cstdint>
+
+#include "test_common/create_basic.hpp"
+
+using namespace boost::mysql;
+using namespace boost::mysql::test;
+using boost::mysql::detail::bound_param_types;
+
+BOOST_AUTO_TEST_SUITE(test_bound_param_types)
+
+BOOST_AUTO_TEST_CASE(same_types)
+{
+    bound_param_types types;
+    BOOST_TEST(types.update(1, make_fv_vector(42, "abc")));
+    BOOST_TEST(!types.update(1, make_fv_vector(10, "def")));
+    BOOST_TEST(!types.update(1, make_fv_vector(0, "")));
+}
+
+BOOST_AUTO_TEST_CASE(different_types)
+{
+    bound_param_types types;
+    BOOST_TEST(types.update(1, make_fv_vector(42, "abc")));
+
+    // Signed vs unsigned
+    BOOST_TEST(types.update(1, make_fv_vector(std::uint64_t(42), "abc")));
+    BOOST_TEST(!types.update(1, make_fv_vector(std::uint64_t(42), "abc")));
+
+    // NULLs are sent with their own type
+    BOOST_TEST(types.update(1, make_fv_vector(nullptr, "abc")));
+    BOOST_TEST(!types.update(1, make_fv_vector(nullptr, "abc")));
+    BOOST_TEST(types.update(1, make_fv_vector(nullptr, nullptr)));
+
+    // Different number of parameters
+    BOOST_TEST(types.update(1, make_fv_vector(nullptr)));
+}
+
+BOOST_AUTO_TEST_CASE(several_statements)
+{
+    bound_param_types types;
+    BOOST_TEST(types.update(1, make_fv_vector(42)));
+    BOOST_TEST(types.update(2, make_fv_vector(42)));
+    BOOST_TEST(!types.update(1, make_fv_vector(10)));
+    BOOST_TEST(types.update(2, make_fv_vector(4.2)));
+    BOOST_TEST(types.size() == 2u);
+}
+
+BOOST_AUTO_TEST_CASE(no_params)
+{
+    // Nothing is recorded
+    bound_param_types types;
+    BOOST_TEST(types.update(1, make_fv_vector()));
+    BOOST_TEST(types.update(1, make_fv_vector()));
+    BOOST_TEST(types.size() == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(erase_clear)
+{
+    bound_param_types types;
+    types.update(1, make_fv_vector(42));
+    types.update(2, make_fv_vector(42));
+
+    types.erase(1);
+    BOOST_TEST(types.update(1, make_fv_vector(42)));
+    BOOST_TEST(!types.update(2, make_fv_vector(42)));
+
+    types.clear();
+    BOOST_TEST(types.update(1, make_fv_vector(42)));
+    BOOST_TEST(types.update(2, make_fv_vector(42)));
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,665 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/compression_mode.hpp>
+#include <boost/mysql/error_code.hpp>
+
+#include <boost/mysql/detail/any_stream.hpp>
+
+#include <boost/mysql/impl/internal/channel/compressed_stream.hpp>
+#include <boost/mysql/impl/internal/channel/message_reader.hpp>
+#include <boost/mysql/impl/internal/channel/message_writer.hpp>
+#include <boost/mysql/impl/internal/channel/write_message.hpp>
+#include <boost/mysql/impl/internal/protocol/capabilities.hpp>
+
+#include <boost/core/span.hpp>
+#include <boost/test/unit_test.hpp>
+
+#include <cstdint>
+#include <vector>
+
+#include "test_common/assert_buffer_equals.hpp"
+#include "test_common/buffer_concat.hpp"
+#include "test_common/printing.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/test_stream.hpp"
+#include "test_unit/unit_netfun_maker.hpp"
+
+#ifdef BOOST_MYSQL_ENABLE_ZLIB
+#include <zlib.h>
+#endif
+
+using namespace boost::mysql::detail;
+using namespace boost::mysql::test;
+using boost::span;
+using boost::mysql::client_errc;
+using boost::mysql::compression_mode;
+using boost::mysql::error_code;
+
+BOOST_AUTO_TEST_SUITE(test_compressed_stream)
+
+BOOST_AUTO_TEST_CASE(compression_capabilities_disabled)
+{
+    capabilities server_caps(CLIENT_COMPRESS | CLIENT_ZSTD_COMPRESSION_ALGORITHM);
+    BOOST_TEST((compression_capabilities(compression_mode::disable, server_caps) == capabilities()));
+}
+
+BOOST_AUTO_TEST_CASE(compression_capabilities_server_unsupported)
+{
+    BOOST_TEST((compression_capabilities(compression_mode::enable, capabilities()) == capabilities()));
+}
+
+#ifdef BOOST_MYSQL_ENABLE_ZLIB
+BOOST_AUTO_TEST_CASE(compression_capabilities_zlib)
+{
+    BOOST_TEST(
+        (compression_capabilities(compression_mode::enable, capabilities(CLIENT_COMPRESS)) ==
+         capabilities(CLIENT_COMPRESS))
+    );
+}
+#endif
+
+#ifdef BOOST_MYSQL_ENABLE_ZSTD
+BOOST_AUTO_TEST_CASE(compression_capabilities_zstd_preferred)
+{
+    capabilities server_caps(CLIENT_COMPRESS | CLIENT_ZSTD_COMPRESSION_ALGORITHM);
+    BOOST_TEST(
+        (compression_capabilities(compression_mode::enable, server_caps) ==
+         capabilities(CLIENT_ZSTD_COMPRESSION_ALGORITHM))
+    );
+}
+#endif
+
+BOOST_AUTO_TEST_CASE(get_compression_algorithm_)
+{
+    BOOST_TEST((get_compression_algorithm(capabilities()) == compression_algorithm::none));
+    BOOST_TEST((get_compression_algorithm(capabilities(CLIENT_COMPRESS)) == compression_algorithm::zlib));
+    BOOST_TEST(
+        (get_compression_algorithm(capabilities(CLIENT_ZSTD_COMPRESSION_ALGORITHM)) ==
+         compression_algorithm::zstd)
+    );
+}
+
+#ifdef BOOST_MYSQL_ENABLE_ZLIB
+
+using netfun_maker_read = netfun_maker_fn<void, any_stream&, message_reader&>;
+using netfun_maker_write = netfun_maker_fn<void, any_stream&, message_writer&>;
+
+struct
+{
+    netfun_maker_read::signature read_some;
+    netfun_maker_write::signature write;
+    const char* name;
+} all_fns[] = {
+    {netfun_maker_read::sync_errc_noerrinfo(&read_some_messages),
+     netfun_maker_write::sync_errc_noerrinfo(&write_message),
+     "sync" },
+    {netfun_maker_read::async_noerrinfo(&async_read_some_messages),
+     netfun_maker_write::async_noerrinfo(&async_write_message),
+     "async"},
+};
+
+// A compressed frame containing payload. If compress is false, payload is sent uncompressed
+std::vector<std::uint8_t> create_compressed_frame(
+    std::uint8_t seqnum,
+    span<const std::uint8_t> payload,
+    bool compress = true
+)
+{
+    std::vector<std::uint8_t> body;
+    if (compress)
+    {
+        uLongf size = ::compressBound(static_cast<uLong>(payload.size()));
+        body.resize(size);
+        int res = ::compress(body.data(), &size, payload.data(), static_cast<uLong>(payload.size()));
+        BOOST_TEST_REQUIRE(res == Z_OK);
+        body.resize(size);
+    }
+    else
+    {
+        body.assign(payload.begin(), payload.end());
+    }
+
+    auto compressed_size = static_cast<std::uint32_t>(body.size());
+    auto uncompressed_size = static_cast<std::uint32_t>(compress ? payload.size() : 0u);
+    std::vector<std::uint8_t> res{
+        static_cast<std::uint8_t>(compressed_size),
+        static_cast<std::uint8_t>(compressed_size >> 8),
+        static_cast<std::uint8_t>(compressed_size >> 16),
+        seqnum,
+        static_cast<std::uint8_t>(uncompressed_size),
+        static_cast<std::uint8_t>(uncompressed_size >> 8),
+        static_cast<std::uint8_t>(uncompressed_size >> 16),
+    };
+    concat(res, body);
+    return res;
+}
+
+std::vector<std::uint8_t> create_compressed_frame(
+    std::uint8_t seqnum,
+    const std::vector<std::uint8_t>& payload,
+    bool compress = true
+)
+{
+    return create_compressed_frame(seqnum, span<const std::uint8_t>(payload), compress);
+}
+
+// A message that compresses well
+std::vector<std::uint8_t> create_compressible_message() { return std::vector<std::uint8_t>(100, 0x42); }
+
+// A message that doesn't get smaller when compressed
+std::vector<std::uint8_t> create_incompressible_message()
+{
+    std::vector<std::uint8_t> res;
+    std::uint32_t state = 0x12345678;
+    for (std::size_t i = 0; i < 100; ++i)
+    {
+        state = state * 1103515245u + 12345u;
+        res.push_back(static_cast<std::uint8_t>(state >> 16));
+    }
+    return res;
+}
+
+struct fixture
+{
+    test_any_stream stream;
+    compressed_stream comp{stream};
+
+    fixture() { comp.reset(compression_algorithm::zlib); }
+
+    test_stream& inner_stream() noexcept { return cast<test_stream>(stream); }
+
+    void write(
+        netfun_maker_write::signature& fn,
+        span<const std::uint8_t> msg,
+        std::uint8_t seqnum = 0,
+        bool starts_request = true
+    )
+    {
+        message_writer writer;
+        if (starts_request)
+            writer.start_request();
+        auto buff = writer.prepare_buffer(msg.size(), seqnum);
+        std::memcpy(buff.data(), msg.data(), msg.size());
+        fn(comp, writer).validate_no_error();
+    }
+};
+
+//
+// Reading
+//
+BOOST_AUTO_TEST_SUITE(read)
+
+BOOST_AUTO_TEST_CASE(uncompressed_payload)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            message_reader reader(512);
+            fix.inner_stream().add_bytes(
+                create_compressed_frame(2, create_frame(0, {0x01, 0x02, 0x03}), false)
+            );
+
+            fns.read_some(fix.comp, reader).validate_no_error();
+
+            BOOST_TEST_REQUIRE(reader.has_message());
+            std::uint8_t seqnum = 0;
+            error_code err;
+            auto msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, (std::vector<std::uint8_t>{0x01, 0x02, 0x03}));
+            BOOST_TEST(fix.comp.sequence_number() == 3u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(compressed_payload)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            message_reader reader(512);
+            auto body = create_compressible_message();
+            fix.inner_stream().add_bytes(create_compressed_frame(0, create_frame(1, body)));
+
+            fns.read_some(fix.comp, reader).validate_no_error();
+
+            BOOST_TEST_REQUIRE(reader.has_message());
+            std::uint8_t seqnum = 1;
+            error_code err;
+            auto msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, body);
+            BOOST_TEST(fix.comp.sequence_number() == 1u);
+            BOOST_TEST(fix.inner_stream().num_unread_bytes() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(short_reads)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            message_reader reader(512);
+            auto body = create_compressible_message();
+            fix.inner_stream()
+                .add_bytes(create_compressed_frame(0, create_frame(0, body)))
+                .add_break(3)    // in the middle of the header
+                .add_break(10);  // in the middle of the payload
+
+            fns.read_some(fix.comp, reader).validate_no_error();
+
+            BOOST_TEST_REQUIRE(reader.has_message());
+            std::uint8_t seqnum = 0;
+            error_code err;
+            auto msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, body);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(message_spans_several_frames)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            message_reader reader(512);
+            auto body = create_compressible_message();
+            auto frame = create_frame(0, body);
+            std::vector<std::uint8_t> part1(frame.begin(), frame.begin() + 60);
+            std::vector<std::uint8_t> part2(frame.begin() + 60, frame.end());
+            fix.inner_stream()
+                .add_bytes(create_compressed_frame(0, part1))
+                .add_bytes(create_compressed_frame(1, part2, false));
+
+            fns.read_some(fix.comp, reader).validate_no_error();
+
+            BOOST_TEST_REQUIRE(reader.has_message());
+            std::uint8_t seqnum = 0;
+            error_code err;
+            auto msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, body);
+            BOOST_TEST(fix.comp.sequence_number() == 2u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(several_messages_in_frame)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            message_reader reader(512);
+            auto body = create_compressible_message();
+            fix.inner_stream().add_bytes(
+                create_compressed_frame(0, concat_copy(create_frame(1, body), create_frame(2, {0x01, 0x02})))
+            );
+
+            fns.read_some(fix.comp, reader).validate_no_error();
+
+            std::uint8_t seqnum = 1;
+            error_code err;
+            BOOST_TEST_REQUIRE(reader.has_message());
+            auto msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, body);
+            BOOST_TEST_REQUIRE(reader.has_message());
+            msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, (std::vector<std::uint8_t>{0x01, 0x02}));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(frame_bigger_than_read_buffer)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // The decompressed frame doesn't fit in the reader's buffer, so it's kept by the stream
+            fixture fix;
+            message_reader reader(8);
+            auto body = create_compressible_message();
+            fix.inner_stream().add_bytes(create_compressed_frame(0, create_frame(0, body)));
+
+            fns.read_some(fix.comp, reader).validate_no_error();
+
+            BOOST_TEST_REQUIRE(reader.has_message());
+            std::uint8_t seqnum = 0;
+            error_code err;
+            auto msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, body);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error_corrupt_payload)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            message_reader reader(512);
+            fix.inner_stream().add_bytes(
+                {0x04, 0x00, 0x00, 0x00, 0x0a, 0x00, 0x00, 0x01, 0x02, 0x03, 0x04}  // bad zlib data
+            );
+
+            fns.read_some(fix.comp, reader).validate_error_exact(client_errc::protocol_value_error);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error_network)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            message_reader reader(512);
+            fix.inner_stream().set_fail_count(fail_count(0, client_errc::wrong_num_params));
+
+            fns.read_some(fix.comp, reader).validate_error_exact(client_errc::wrong_num_params);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_SUITE_END()
+
+//
+// Writing
+//
+BOOST_AUTO_TEST_SUITE(write)
+
+BOOST_AUTO_TEST_CASE(small_message)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // Small messages are not compressed
+            fixture fix;
+            const std::vector<std::uint8_t> msg{0x01, 0x02, 0x03};
+
+            fix.write(fns.write, msg);
+
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.inner_stream().bytes_written(),
+                create_compressed_frame(0, create_frame(0, msg), false)
+            );
+            BOOST_TEST(fix.comp.sequence_number() == 1u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(big_message)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            auto msg = create_compressible_message();
+
+            fix.write(fns.write, msg);
+
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.inner_stream().bytes_written(),
+                create_compressed_frame(0, create_frame(0, msg))
+            );
+            BOOST_TEST(fix.comp.sequence_number() == 1u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(incompressible_message)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // If compressing doesn't reduce size, the message is sent uncompressed
+            fixture fix;
+            auto msg = create_incompressible_message();
+
+            fix.write(fns.write, msg);
+
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.inner_stream().bytes_written(),
+                create_compressed_frame(0, create_frame(0, msg), false)
+            );
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(short_writes)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.inner_stream().set_write_break_size(2);
+            auto msg = create_compressible_message();
+
+            fix.write(fns.write, msg);
+
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.inner_stream().bytes_written(),
+                create_compressed_frame(0, create_frame(0, msg))
+            );
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(continues_sequence)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // A message that doesn't start a new request continues
+            // the sequence number of the last compressed frame read
+            fixture fix;
+            message_reader reader(512);
+            fix.inner_stream().add_bytes(create_compressed_frame(3, create_frame(1, {0x01}), false));
+            fns.read_some(fix.comp, reader).validate_no_error();
+            const std::vector<std::uint8_t> msg{0x05, 0x06};
+
+            fix.write(fns.write, msg, 2, false);
+
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.inner_stream().bytes_written(),
+                create_compressed_frame(4, create_frame(2, msg), false)
+            );
+            BOOST_TEST(fix.comp.sequence_number() == 5u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(continues_sequence_seqnum_zero)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // Frame sequence numbers wrap, so a message continuing a request may have a zero
+            // sequence number (e.g. the 256th chunk of a LOAD DATA LOCAL INFILE). It doesn't start a request
+            fixture fix;
+            message_reader reader(512);
+            fix.inner_stream().add_bytes(create_compressed_frame(9, create_frame(255, {0x01}), false));
+            fns.read_some(fix.comp, reader).validate_no_error();
+            const std::vector<std::uint8_t> msg{0x05, 0x06};
+
+            fix.write(fns.write, msg, 0, false);
+
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.inner_stream().bytes_written(),
+                create_compressed_frame(10, create_frame(0, msg), false)
+            );
+            BOOST_TEST(fix.comp.sequence_number() == 11u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(starts_request_after_read)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // A message starting a request resets the sequence number
+            fixture fix;
+            message_reader reader(512);
+            fix.inner_stream().add_bytes(create_compressed_frame(3, create_frame(1, {0x01}), false));
+            fns.read_some(fix.comp, reader).validate_no_error();
+            const std::vector<std::uint8_t> msg{0x05, 0x06};
+
+            fix.write(fns.write, msg);
+
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.inner_stream().bytes_written(),
+                create_compressed_frame(0, create_frame(0, msg), false)
+            );
+            BOOST_TEST(fix.comp.sequence_number() == 1u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(request_many_frames)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // A request with more than 256 frames, written at once. Some frames
+            // have a zero sequence number, but they don't start a new request
+            fixture fix;
+            std::vector<std::uint8_t> frames;
+            for (std::size_t i = 0; i < 300u; ++i)
+                concat(frames, create_frame(static_cast<std::uint8_t>(i), {0x42}));
+            message_writer writer;
+            writer.prepare_framed(frames);
+
+            fns.write(fix.comp, writer).validate_no_error();
+
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.inner_stream().bytes_written(),
+                create_compressed_frame(0, frames)
+            );
+            BOOST_TEST(fix.comp.sequence_number() == 1u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(pipeline)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // Each request in a pipeline starts a new sequence
+            fixture fix;
+            auto msg1 = create_frame(0, {0x01, 0x02});
+            auto msg2 = create_frame(0, create_compressible_message());
+            auto msg3 = create_frame(0, {0x03});
+            const std::size_t offsets[] = {0u, msg1.size(), msg1.size() + msg2.size()};
+            message_writer writer;
+            writer.prepare_framed(concat_copy(concat_copy(msg1, msg2), msg3), offsets);
+
+            fns.write(fix.comp, writer).validate_no_error();
+
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.inner_stream().bytes_written(),
+                concat_copy(
+                    concat_copy(create_compressed_frame(0, msg1, false), create_compressed_frame(0, msg2)),
+                    create_compressed_frame(0, msg3, false)
+                )
+            );
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error_network)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.inner_stream().set_fail_count(fail_count(0, client_errc::wrong_num_params));
+            std::uint8_t seqnum = 0;
+            message_writer writer;
+            writer.prepare_buffer(3, seqnum);
+
+            fns.write(fix.comp, writer).validate_error_exact(client_errc::wrong_num_params);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_SUITE_END()
+
+#endif  // BOOST_MYSQL_ENABLE_ZLIB
+
+#ifdef BOOST_MYSQL_ENABLE_ZSTD
+BOOST_AUTO_TEST_CASE(zstd_roundtrip)
+{
+    // Write a message with zstd, then read it back
+    test_any_stream stream;
+    compressed_stream comp{stream};
+    comp.reset(compression_algorithm::zstd);
+    std::vector<std::uint8_t> body(1000, 0x42);
+    std::uint8_t seqnum = 0;
+    message_writer writer;
+    writer.start_request();
+    auto buff = writer.prepare_buffer(body.size(), seqnum);
+    std::memcpy(buff.data(), body.data(), body.size());
+    error_code err;
+    write_message(comp, writer, err);
+    BOOST_TEST_REQUIRE(err == error_code());
+
+    // The message got compressed
+    const auto& written = cast<test_stream>(stream).bytes_written();
+    BOOST_TEST_REQUIRE(written.size() > 7u);
+    BOOST_TEST(written.size() < body.size());
+    BOOST_TEST(written[3] == 0u);                                      // seqnum
+    BOOST_TEST((written[4] | (written[5] << 8)) == body.size() + 4u);  // uncompressed size
+
+    // Read it back
+    test_any_stream read_stream;
+    compressed_stream read_comp{read_stream};
+    read_comp.reset(compression_algorithm::zstd);
+    cast<test_stream>(read_stream).add_bytes(written);
+    message_reader reader(512);
+    read_some_messages(read_comp, reader, err);
+    BOOST_TEST_REQUIRE(err == error_code());
+    BOOST_TEST_REQUIRE(reader.has_message());
+    seqnum = 0;
+    auto msg = reader.get_next_message(seqnum, err);
+    BOOST_TEST(err == error_code());
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, body);
+}
+#endif
+
+BOOST_AUTO_TEST_SUITE_END()
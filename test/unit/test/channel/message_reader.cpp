@@ -5,7 +5,9 @@
 // file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
 //
 
+#include <boost/mysql/buffer_params.hpp>
 #include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/connection_observer.hpp>
 #include <boost/mysql/error_code.hpp>
 
 #include <boost/mysql/detail/any_stream.hpp>
@@ -25,7 +27,9 @@
 using namespace boost::mysql::detail;
 using namespace boost::mysql::test;
 using boost::span;
+using boost::mysql::buffer_params;
 using boost::mysql::client_errc;
+using boost::mysql::connection_observer;
 using boost::mysql::error_code;
 
 BOOST_AUTO_TEST_SUITE(test_message_reader)
@@ -269,6 +273,165 @@ BOOST_AUTO_TEST_CASE(error)
 
 BOOST_AUTO_TEST_SUITE_END()
 
+// Partial reads, used to stream big messages
+BOOST_AUTO_TEST_SUITE(read_some_partial)
+
+void read_partial(any_stream& stream, message_reader& reader, error_code& err)
+{
+    reader.read_some_partial(stream, err);
+}
+
+void async_read_partial(any_stream& stream, message_reader& reader, as_network_result<void>&& tok)
+{
+    reader.async_read_some_partial(stream, std::move(tok));
+}
+
+struct
+{
+    netfun_maker_some::signature read_partial;
+    const char* name;
+} all_partial_fns[] = {
+    {netfun_maker_some::sync_errc_noerrinfo(&read_partial),  "sync" },
+    {netfun_maker_some::async_noerrinfo(&async_read_partial), "async"},
+};
+
+BOOST_AUTO_TEST_CASE(message_in_pieces)
+{
+    for (auto fn : all_partial_fns)
+    {
+        BOOST_TEST_CONTEXT(fn.name)
+        {
+            fixture fix;
+            message_reader reader(512);
+            std::uint8_t seqnum = 2;
+            fix.inner_stream()
+                .add_bytes(create_frame(seqnum, {0x01, 0x02, 0x03, 0x04, 0x05}))
+                .add_break(6)
+                .add_break(8);
+            error_code err(client_errc::server_unsupported);
+
+            // 1st piece
+            fn.read_partial(fix.stream, reader).validate_no_error();
+            BOOST_TEST_REQUIRE(!reader.has_message());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                reader.partial_message(),
+                (std::vector<std::uint8_t>{0x01, 0x02})
+            );
+            reader.consume_partial_message();
+
+            // 2nd piece
+            fn.read_partial(fix.stream, reader).validate_no_error();
+            BOOST_TEST_REQUIRE(!reader.has_message());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                reader.partial_message(),
+                (std::vector<std::uint8_t>{0x03, 0x04})
+            );
+            reader.consume_partial_message();
+
+            // The message completes, and only contains the bytes that haven't been consumed
+            fn.read_partial(fix.stream, reader).validate_no_error();
+            BOOST_TEST_REQUIRE(reader.has_message());
+            auto msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST_REQUIRE(err == error_code());
+            BOOST_TEST(seqnum == 3u);
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, (std::vector<std::uint8_t>{0x05}));
+            BOOST_TEST(fix.inner_stream().num_unread_bytes() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(complete_message)
+{
+    for (auto fn : all_partial_fns)
+    {
+        BOOST_TEST_CONTEXT(fn.name)
+        {
+            fixture fix;
+            message_reader reader(512);
+            std::uint8_t seqnum = 2;
+            fix.inner_stream().add_bytes(create_frame(seqnum, {0x01, 0x02, 0x03}));
+            error_code err(client_errc::server_unsupported);
+
+            // If all bytes are available, we get a complete message
+            fn.read_partial(fix.stream, reader).validate_no_error();
+            BOOST_TEST_REQUIRE(reader.has_message());
+            auto msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST_REQUIRE(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, (std::vector<std::uint8_t>{0x01, 0x02, 0x03}));
+
+            // Reading again doesn't need I/O if there is a message
+            fix.inner_stream().add_bytes(create_frame(3, {0x04}));
+            reader.read_some(fix.stream, err);
+            BOOST_TEST_REQUIRE(err == error_code());
+            fn.read_partial(fix.stream, reader).validate_no_error();
+            BOOST_TEST(reader.has_message());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(message_doesnt_fit_in_buffer)
+{
+    for (auto fn : all_partial_fns)
+    {
+        BOOST_TEST_CONTEXT(fn.name)
+        {
+            // The buffer doesn't need to grow to hold the message
+            fixture fix;
+            buffer_params params(16);
+            params.set_max_read_size(16);
+            message_reader reader(params, 32);  // frames are broken each 32 bytes
+            std::vector<std::uint8_t> body(100);
+            for (std::size_t i = 0; i < body.size(); ++i)
+                body[i] = static_cast<std::uint8_t>(i);
+            std::uint8_t seqnum = 0;
+            fix.inner_stream()
+                .add_bytes(create_frame(0, span<const std::uint8_t>(body.data(), 32)))
+                .add_bytes(create_frame(1, span<const std::uint8_t>(body.data() + 32, 32)))
+                .add_bytes(create_frame(2, span<const std::uint8_t>(body.data() + 64, 32)))
+                .add_bytes(create_frame(3, span<const std::uint8_t>(body.data() + 96, 4)));
+            error_code err(client_errc::server_unsupported);
+
+            // Read the message in pieces
+            std::vector<std::uint8_t> actual;
+            while (true)
+            {
+                fn.read_partial(fix.stream, reader).validate_no_error();
+                if (reader.has_message())
+                    break;
+                auto piece = reader.partial_message();
+                actual.insert(actual.end(), piece.begin(), piece.end());
+                reader.consume_partial_message();
+            }
+            auto msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST_REQUIRE(err == error_code());
+            actual.insert(actual.end(), msg.begin(), msg.end());
+
+            // Sequence numbers are checked for the entire message
+            BOOST_TEST(seqnum == 4u);
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(actual, body);
+            BOOST_TEST(reader.buffer().size() == 16u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error)
+{
+    for (auto fn : all_partial_fns)
+    {
+        BOOST_TEST_CONTEXT(fn.name)
+        {
+            fixture fix;
+            message_reader reader(512);
+            fix.inner_stream().set_fail_count(fail_count(0, client_errc::wrong_num_params));
+
+            fn.read_partial(fix.stream, reader).validate_error_exact(client_errc::wrong_num_params);
+            BOOST_TEST(!reader.has_message());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_SUITE_END()
+
 // Cases specific to get_next_message
 BOOST_AUTO_TEST_SUITE(get_next_message)
 
@@ -364,6 +527,53 @@ BOOST_AUTO_TEST_CASE(error_intermediate_frame_seqnum_mismatch)
     BOOST_TEST(seqnum == 2u);
 }
 
+BOOST_AUTO_TEST_CASE(seqnum_checks_disabled)
+{
+    fixture fix;
+    message_reader reader(512);
+    reader.set_check_seqnums(false);
+    fix.inner_stream().add_bytes(create_frame(2, {0x01, 0x02, 0x03}));
+    error_code err(client_errc::server_unsupported);
+
+    // Read succesfully
+    reader.read_some(fix.stream, err);
+    BOOST_TEST(err == error_code());
+    BOOST_TEST_REQUIRE(reader.has_message());
+
+    // The passed seqnum doesn't match, but this is not an error
+    std::uint8_t seqnum = 42;
+    auto msg = reader.get_next_message(seqnum, err);
+    BOOST_TEST(err == error_code());
+    BOOST_TEST(seqnum == 43u);
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, (std::vector<std::uint8_t>{0x01, 0x02, 0x03}));
+}
+
+BOOST_AUTO_TEST_CASE(seqnum_checks_disabled_intermediate_frame_mismatch)
+{
+    fixture fix;
+    message_reader reader(512, 8);  // frames are broken each 8 bytes
+    reader.set_check_seqnums(false);
+    fix.inner_stream()
+        .add_bytes(create_frame(2, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08}))
+        .add_bytes(create_frame(4, {0x11, 0x12, 0x13, 0x14}));  // the right seqnum would be 3
+    error_code err(client_errc::server_unsupported);
+
+    // Read succesfully
+    reader.read_some(fix.stream, err);
+    BOOST_TEST(err == error_code());
+    BOOST_TEST_REQUIRE(reader.has_message());
+
+    // The sequence number is advanced by the number of frames
+    std::uint8_t seqnum = 255;
+    auto msg = reader.get_next_message(seqnum, err);
+    BOOST_TEST(err == error_code());
+    BOOST_TEST(seqnum == 1u);
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+        msg,
+        (std::vector<std::uint8_t>{0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x11, 0x12, 0x13, 0x14})
+    );
+}
+
 BOOST_AUTO_TEST_SUITE_END()
 
 BOOST_AUTO_TEST_SUITE(read_one)
@@ -463,4 +673,208 @@ BOOST_AUTO_TEST_CASE(seqnum_mismatch)
 
 BOOST_AUTO_TEST_SUITE_END()
 
+BOOST_AUTO_TEST_SUITE(buffer_policy)
+
+BOOST_AUTO_TEST_CASE(max_size_exceeded)
+{
+    for (auto fn : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fn.name)
+        {
+            fixture fix;
+            buffer_params params(16);
+            params.set_max_read_size(32);
+            message_reader reader(params);
+            fix.inner_stream().add_bytes(create_frame(0, std::vector<std::uint8_t>(40, 0x01)));
+
+            fn.read_some(fix.stream, reader).validate_error_exact(client_errc::max_buffer_size_exceeded);
+            BOOST_TEST(reader.buffer().size() <= 32u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(max_size_not_exceeded)
+{
+    fixture fix;
+    buffer_params params(16);
+    params.set_max_read_size(44);
+    message_reader reader(params);
+    std::vector<std::uint8_t> msg_body(40, 0x01);
+    fix.inner_stream().add_bytes(create_frame(0, msg_body));
+    error_code err(client_errc::server_unsupported);
+
+    // The buffer may grow up to the max size, but not past it
+    reader.read_some(fix.stream, err);
+    BOOST_TEST(err == error_code());
+    BOOST_TEST(reader.buffer().size() == 44u);
+
+    std::uint8_t seqnum = 0;
+    auto msg = reader.get_next_message(seqnum, err);
+    BOOST_TEST_REQUIRE(err == error_code());
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, msg_body);
+}
+
+BOOST_AUTO_TEST_CASE(default_growth_exact)
+{
+    fixture fix;
+    message_reader reader(buffer_params(16));
+    std::vector<std::uint8_t> msg_body(40, 0x01);
+    fix.inner_stream().add_bytes(create_frame(0, msg_body));
+    error_code err(client_errc::server_unsupported);
+
+    // By default, the buffer grows to the required size only
+    reader.read_some(fix.stream, err);
+    BOOST_TEST(err == error_code());
+    BOOST_TEST(reader.buffer().size() == 44u);
+}
+
+BOOST_AUTO_TEST_CASE(geometric_growth)
+{
+    fixture fix;
+    buffer_params params(16);
+    params.set_read_growth_factor(4.0);
+    message_reader reader(params);
+    std::vector<std::uint8_t> msg_body(20, 0x01);
+    fix.inner_stream().add_bytes(create_frame(0, msg_body));
+    error_code err(client_errc::server_unsupported);
+
+    reader.read_some(fix.stream, err);
+    BOOST_TEST(err == error_code());
+    BOOST_TEST(reader.buffer().size() >= 64u);
+
+    auto stats = reader.stats();
+    BOOST_TEST(stats.read_buffer_size == reader.buffer().size());
+    BOOST_TEST(stats.peak_read_buffer_size == reader.buffer().size());
+    BOOST_TEST(stats.num_read_buffer_grows == 1u);
+    BOOST_TEST(stats.num_read_buffer_shrinks == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(shrink_after_idle)
+{
+    for (auto fn : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fn.name)
+        {
+            fixture fix;
+            buffer_params params(16);
+            params.set_max_retained_read_size(16);
+            params.set_shrink_after_reads(1);
+            message_reader reader(params);
+            std::uint8_t seqnum = 0;
+            std::vector<std::uint8_t> big_body(64, 0x01);
+            std::vector<std::uint8_t> small_body{0x01, 0x02, 0x03};
+            error_code err(client_errc::server_unsupported);
+
+            // A big message makes the buffer grow
+            fix.inner_stream().add_bytes(create_frame(0, big_body));
+            fn.read_some(fix.stream, reader).validate_no_error();
+            auto msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST_REQUIRE(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, big_body);
+            std::size_t peak_size = reader.buffer().size();
+            BOOST_TEST(peak_size > 64u);
+
+            // The buffer is not shrunk until it has been idle for the configured number of reads
+            fix.inner_stream().add_bytes(create_frame(1, small_body));
+            fn.read_some(fix.stream, reader).validate_no_error();
+            BOOST_TEST(reader.buffer().size() == peak_size);
+            msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST_REQUIRE(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, small_body);
+
+            // The buffer is now shrunk
+            fix.inner_stream().add_bytes(create_frame(2, small_body));
+            fn.read_some(fix.stream, reader).validate_no_error();
+            BOOST_TEST(reader.buffer().size() == 16u);
+            msg = reader.get_next_message(seqnum, err);
+            BOOST_TEST_REQUIRE(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(msg, small_body);
+
+            // Counters
+            auto stats = reader.stats();
+            BOOST_TEST(stats.read_buffer_size == 16u);
+            BOOST_TEST(stats.peak_read_buffer_size == peak_size);
+            BOOST_TEST(stats.num_read_buffer_grows >= 1u);
+            BOOST_TEST(stats.num_read_buffer_shrinks == 1u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(no_shrink_by_default)
+{
+    fixture fix;
+    message_reader reader(16);
+    std::uint8_t seqnum = 0;
+    error_code err(client_errc::server_unsupported);
+
+    // Big message
+    fix.inner_stream().add_bytes(create_frame(0, std::vector<std::uint8_t>(64, 0x01)));
+    reader.read_some(fix.stream, err);
+    BOOST_TEST_REQUIRE(err == error_code());
+    reader.get_next_message(seqnum, err);
+    std::size_t peak_size = reader.buffer().size();
+
+    // Several small messages don't cause the buffer to be shrunk
+    for (std::uint8_t i = 1; i < 20; ++i)
+    {
+        fix.inner_stream().add_bytes(create_frame(i, {0x01, 0x02}));
+        reader.read_some(fix.stream, err);
+        BOOST_TEST_REQUIRE(err == error_code());
+        reader.get_next_message(seqnum, err);
+        BOOST_TEST_REQUIRE(err == error_code());
+    }
+    BOOST_TEST(reader.buffer().size() == peak_size);
+    BOOST_TEST(reader.stats().num_read_buffer_shrinks == 0u);
+}
+
+struct buffer_observer : connection_observer
+{
+    std::size_t bytes_read{};
+    std::size_t num_messages{};
+    std::size_t num_frames{};
+    std::size_t num_resizes{};
+    std::size_t num_compacts{};
+
+    void on_bytes_read(std::size_t n) override { bytes_read += n; }
+    void on_message_read(std::size_t, std::size_t frames) override
+    {
+        ++num_messages;
+        num_frames += frames;
+    }
+    void on_read_buffer_resize(std::size_t, std::size_t) override { ++num_resizes; }
+    void on_read_buffer_compact(std::size_t) override { ++num_compacts; }
+};
+
+BOOST_AUTO_TEST_CASE(observer)
+{
+    fixture fix;
+    buffer_observer obs;
+    message_reader reader(0, 8);  // frames are broken each 8 bytes
+    reader.set_observer(&obs);
+    std::uint8_t seqnum = 2;
+    fix.inner_stream()
+        .add_bytes(create_frame(2, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08}))
+        .add_bytes(create_frame(3, {0x09, 0x0a}));
+    error_code err(client_errc::server_unsupported);
+
+    // Read a two-frame message. The buffer needs to grow
+    reader.read_some(fix.stream, err);
+    BOOST_TEST_REQUIRE(err == error_code());
+    reader.get_next_message(seqnum, err);
+    BOOST_TEST_REQUIRE(err == error_code());
+    BOOST_TEST(obs.bytes_read == 18u);
+    BOOST_TEST(obs.num_messages == 1u);
+    BOOST_TEST(obs.num_frames == 2u);
+    BOOST_TEST(obs.num_resizes > 0u);
+    BOOST_TEST(obs.num_compacts == 0u);
+
+    // Reading another message discards the previous one
+    fix.inner_stream().add_bytes(create_frame(4, {0x01}));
+    reader.read_some(fix.stream, err);
+    BOOST_TEST_REQUIRE(err == error_code());
+    BOOST_TEST(obs.num_compacts == 1u);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
+
 BOOST_AUTO_TEST_SUITE_END()
@@ -419,6 +419,311 @@ BOOST_AUTO_TEST_CASE(several_messages)
     BOOST_TEST(processor.done());
 }
 
+BOOST_AUTO_TEST_CASE(framed_messages)
+{
+    message_writer processor(8);
+    auto msg = buffer_builder()
+                   .add(create_frame(0, {0x01, 0x02, 0x03}))
+                   .add(create_frame(0, {0x04, 0x05}))
+                   .build();
+
+    // Operation start
+    processor.prepare_framed(msg);
+    BOOST_TEST(!processor.done());
+
+    // The entire buffer is written as a single chunk, as is
+    auto chunk = processor.next_chunk();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(chunk, msg);
+
+    // Short writes work
+    processor.on_bytes_written(5);
+    BOOST_TEST(!processor.done());
+    chunk = processor.next_chunk();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(chunk, span<const std::uint8_t>(msg.data() + 5, msg.size() - 5));
+
+    // Done
+    processor.on_bytes_written(msg.size() - 5);
+    BOOST_TEST(processor.done());
+}
+
+BOOST_AUTO_TEST_CASE(framed_messages_empty)
+{
+    message_writer processor(8);
+    processor.prepare_framed({});
+    BOOST_TEST(processor.done());
+}
+
+BOOST_AUTO_TEST_CASE(framed_messages_request_offsets)
+{
+    message_writer processor(8);
+    auto msg1 = create_frame(0, {0x01, 0x02, 0x03});
+    auto msg2 = create_frame(0, {0x04, 0x05});
+    auto msg = concat_copy(msg1, msg2);
+    const std::size_t offsets[] = {0u, msg1.size()};
+
+    // Operation start
+    processor.prepare_framed(msg, offsets);
+    BOOST_TEST(!processor.done());
+
+    // Each request is written as a separate chunk, starting a request
+    auto chunk = processor.next_chunk();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(chunk, msg1);
+    BOOST_TEST(processor.chunk_starts_request());
+
+    // Short writes don't start a request
+    processor.on_bytes_written(2);
+    chunk = processor.next_chunk();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(chunk, span<const std::uint8_t>(msg1.data() + 2, msg1.size() - 2));
+    BOOST_TEST(!processor.chunk_starts_request());
+
+    // Second request
+    processor.on_bytes_written(msg1.size() - 2);
+    chunk = processor.next_chunk();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(chunk, msg2);
+    BOOST_TEST(processor.chunk_starts_request());
+
+    // Done
+    processor.on_bytes_written(msg2.size());
+    BOOST_TEST(processor.done());
+}
+
+BOOST_AUTO_TEST_CASE(request_start)
+{
+    message_writer processor(8);
+    std::uint8_t seqnum = 0;
+    const std::vector<std::uint8_t> msg{0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09};
+
+    // Only the first chunk of a message marked by start_request() starts a request
+    processor.start_request();
+    copy(msg, processor.prepare_buffer(msg.size(), seqnum));
+    BOOST_TEST(processor.chunk_starts_request());
+    processor.on_bytes_written(12);
+    BOOST_TEST(!processor.chunk_starts_request());
+    processor.on_bytes_written(5);
+    BOOST_TEST(processor.done());
+
+    // Messages not marked continue the current request
+    copy(msg, processor.prepare_buffer(msg.size(), seqnum));
+    BOOST_TEST(!processor.chunk_starts_request());
+}
+
+// gather writes
+BOOST_AUTO_TEST_SUITE(gather_)
+
+// Writes all chunks, returning the written bytes and the number of chunks
+std::vector<std::uint8_t> write_all(message_writer& processor, std::size_t& num_chunks)
+{
+    std::vector<std::uint8_t> res;
+    num_chunks = 0;
+    while (!processor.done())
+    {
+        auto chunk = processor.next_chunk();
+        res.insert(res.end(), chunk.begin(), chunk.end());
+        processor.on_bytes_written(chunk.size());
+        ++num_chunks;
+    }
+    return res;
+}
+
+BOOST_AUTO_TEST_CASE(single_frame)
+{
+    message_writer processor(8);
+    const std::vector<std::uint8_t> external{0x11, 0x12, 0x13};
+    std::uint8_t seqnum = 2;
+
+    // Operation start
+    auto mutbuf = processor.prepare_gather(6, 3);
+    BOOST_TEST(mutbuf.size() == 3u);
+    copy(std::vector<std::uint8_t>{0x01, 0x02, 0x03}, mutbuf);
+    processor.external_buffers().push_back({2, external});
+    processor.finish_gather(seqnum);
+    BOOST_TEST(seqnum == 3u);
+
+    // First chunk: header and inline data
+    auto chunk = processor.next_chunk();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(chunk, std::vector<std::uint8_t>({0x06, 0x00, 0x00, 0x02, 0x01, 0x02}));
+    processor.on_bytes_written(6);
+
+    // Second chunk: external data, written in place. Short writes work
+    chunk = processor.next_chunk();
+    BOOST_TEST(chunk.data() == external.data());
+    BOOST_TEST(chunk.size() == 3u);
+    processor.on_bytes_written(1);
+    chunk = processor.next_chunk();
+    BOOST_TEST(chunk.data() == external.data() + 1);
+    BOOST_TEST(chunk.size() == 2u);
+    processor.on_bytes_written(2);
+
+    // Rest of inline data
+    chunk = processor.next_chunk();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(chunk, std::vector<std::uint8_t>{0x03});
+    processor.on_bytes_written(1);
+    BOOST_TEST(processor.done());
+}
+
+BOOST_AUTO_TEST_CASE(multiframe)
+{
+    message_writer processor(8);
+    const std::vector<std::uint8_t> external{0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18, 0x19, 0x1a};
+    std::uint8_t seqnum = 0xff;
+
+    // 3 inline bytes, 10 external bytes, 2 inline bytes
+    auto mutbuf = processor.prepare_gather(15, 5);
+    copy(std::vector<std::uint8_t>{0x01, 0x02, 0x03, 0x04, 0x05}, mutbuf);
+    processor.external_buffers().push_back({3, external});
+    processor.finish_gather(seqnum);
+    BOOST_TEST(seqnum == 1u);
+
+    // Frame boundaries fall within the external buffer
+    std::size_t num_chunks = 0;
+    auto written = write_all(processor, num_chunks);
+    auto expected = buffer_builder()
+                        .add(create_frame(0xff, {0x01, 0x02, 0x03, 0x11, 0x12, 0x13, 0x14, 0x15}))
+                        .add(create_frame(0, {0x16, 0x17, 0x18, 0x19, 0x1a, 0x04, 0x05}))
+                        .build();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(written, expected);
+    BOOST_TEST(num_chunks == 5u);
+}
+
+BOOST_AUTO_TEST_CASE(several_external)
+{
+    message_writer processor(8);
+    const std::vector<std::uint8_t> external_1{0x11, 0x12};
+    const std::vector<std::uint8_t> external_2{0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x29};
+    std::uint8_t seqnum = 0;
+
+    // external_2 spans a frame boundary
+    auto mutbuf = processor.prepare_gather(17, 6);
+    copy(std::vector<std::uint8_t>{0x01, 0x02, 0x03, 0x04, 0x05, 0x06}, mutbuf);
+    processor.external_buffers().push_back({2, external_1});
+    processor.external_buffers().push_back({4, external_2});
+    processor.finish_gather(seqnum);
+    BOOST_TEST(seqnum == 3u);
+
+    std::size_t num_chunks = 0;
+    auto written = write_all(processor, num_chunks);
+    auto expected = buffer_builder()
+                        .add(create_frame(0, {0x01, 0x02, 0x11, 0x12, 0x03, 0x04, 0x21, 0x22}))
+                        .add(create_frame(1, {0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x29, 0x05}))
+                        .add(create_frame(2, {0x06}))
+                        .build();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(written, expected);
+}
+
+BOOST_AUTO_TEST_CASE(max_frame_size)
+{
+    message_writer processor(8);
+    const std::vector<std::uint8_t> external{0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17};
+    std::uint8_t seqnum = 0;
+
+    // The message ends with external data and has exactly max_frame_size bytes
+    auto mutbuf = processor.prepare_gather(8, 1);
+    copy(std::vector<std::uint8_t>{0x01}, mutbuf);
+    processor.external_buffers().push_back({1, external});
+    processor.finish_gather(seqnum);
+    BOOST_TEST(seqnum == 2u);
+
+    std::size_t num_chunks = 0;
+    auto written = write_all(processor, num_chunks);
+    auto expected = buffer_builder()
+                        .add(create_frame(0, {0x01, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17}))
+                        .add(create_empty_frame(1))
+                        .build();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(written, expected);
+}
+
+BOOST_AUTO_TEST_CASE(regular_message_after_gather)
+{
+    message_writer processor(8);
+    const std::vector<std::uint8_t> external{0x11, 0x12};
+    std::vector<std::uint8_t> msg{0x01, 0x02};
+    std::uint8_t seqnum = 0;
+
+    // Gather message
+    processor.prepare_gather(2, 0);
+    processor.external_buffers().push_back({0, external});
+    processor.finish_gather(seqnum);
+    std::size_t num_chunks = 0;
+    write_all(processor, num_chunks);
+
+    // Regular message
+    copy(msg, processor.prepare_buffer(msg.size(), seqnum));
+    auto written = write_all(processor, num_chunks);
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(written, create_frame(1, msg));
+    BOOST_TEST(num_chunks == 1u);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
+
+// serialize_framed
+struct mock_message
+{
+    std::vector<std::uint8_t> body;
+
+    std::size_t get_size() const noexcept { return body.size(); }
+    void serialize(span<std::uint8_t> buff) const { copy(body, buff); }
+};
+
+BOOST_AUTO_TEST_SUITE(serialize_framed_)
+
+BOOST_AUTO_TEST_CASE(single_frame)
+{
+    std::vector<std::uint8_t> buff{0xaa, 0xbb};
+    auto seqnum = serialize_framed(
+        mock_message{
+            {0x01, 0x02, 0x03}
+    },
+        buff,
+        2,
+        8
+    );
+
+    auto expected = buffer_builder().add({0xaa, 0xbb}).add(create_frame(2, {0x01, 0x02, 0x03})).build();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(buff, expected);
+    BOOST_TEST(seqnum == 3u);
+}
+
+BOOST_AUTO_TEST_CASE(empty_message)
+{
+    std::vector<std::uint8_t> buff;
+    auto seqnum = serialize_framed(mock_message{}, buff, 0, 8);
+
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(buff, create_empty_frame(0));
+    BOOST_TEST(seqnum == 1u);
+}
+
+BOOST_AUTO_TEST_CASE(max_frame_size)
+{
+    std::vector<std::uint8_t> buff;
+    std::vector<std::uint8_t> body{0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08};
+    auto seqnum = serialize_framed(mock_message{body}, buff, 0, 8);
+
+    auto expected = buffer_builder().add(create_frame(0, body)).add(create_empty_frame(1)).build();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(buff, expected);
+    BOOST_TEST(seqnum == 2u);
+}
+
+BOOST_AUTO_TEST_CASE(multiframe)
+{
+    std::vector<std::uint8_t> buff{0xaa};
+    std::vector<std::uint8_t> frame_1{0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08};
+    std::vector<std::uint8_t> frame_2{0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x18};
+    std::vector<std::uint8_t> frame_3{0x21};
+    auto body = buffer_builder().add(frame_1).add(frame_2).add(frame_3).build();
+    auto seqnum = serialize_framed(mock_message{body}, buff, 0xfe, 8);
+
+    auto expected = buffer_builder()
+                        .add({0xaa})
+                        .add(create_frame(0xfe, frame_1))
+                        .add(create_frame(0xff, frame_2))
+                        .add(create_frame(0, frame_3))
+                        .build();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(buff, expected);
+    BOOST_TEST(seqnum == 1u);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
+
 BOOST_AUTO_TEST_SUITE_END()
 
 }  // namespace
@@ -467,6 +467,119 @@ BOOST_AUTO_TEST_CASE(zero_bytes)
     checker.check_stability();
 }
 
+BOOST_AUTO_TEST_CASE(growth_factor)
+{
+    read_buffer buff(16);
+    stability_checker checker(buff);
+    copy_to_free_area(buff, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08});
+    buff.move_to_pending(8);
+    buff.move_to_current_message(6);
+    std::size_t old_size = buff.size();
+
+    // Only one byte is required, but the buffer grows geometrically
+    bool ok = buff.grow_to_fit(old_size - 8 + 1, static_cast<std::size_t>(-1), 2.0);
+
+    BOOST_TEST(ok);
+    BOOST_TEST(buff.size() >= 2 * old_size);
+    check_buffer(buff, {}, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06}, {0x07, 0x08});
+    checker.check_reallocation();
+}
+
+BOOST_AUTO_TEST_CASE(growth_factor_capped_by_max_size)
+{
+    read_buffer buff(16);
+    stability_checker checker(buff);
+    copy_to_free_area(buff, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08});
+    buff.move_to_pending(8);
+    buff.move_to_current_message(6);
+    std::size_t max_size = buff.size() + 2;
+
+    bool ok = buff.grow_to_fit(buff.free_size() + 1, max_size, 2.0);
+
+    BOOST_TEST(ok);
+    BOOST_TEST(buff.size() == max_size);
+    check_buffer(buff, {}, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06}, {0x07, 0x08});
+    checker.check_reallocation();
+}
+
+BOOST_AUTO_TEST_CASE(max_size_exceeded)
+{
+    read_buffer buff(16);
+    stability_checker checker(buff);
+    copy_to_free_area(buff, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08});
+    buff.move_to_pending(8);
+    buff.move_to_current_message(6);
+
+    // The buffer is left untouched
+    bool ok = buff.grow_to_fit(100, 107);
+
+    BOOST_TEST(!ok);
+    check_buffer(buff, {}, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06}, {0x07, 0x08});
+    checker.check_stability();
+}
+
+BOOST_AUTO_TEST_CASE(max_size_exactly_reached)
+{
+    read_buffer buff(16);
+    copy_to_free_area(buff, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08});
+    buff.move_to_pending(8);
+    buff.move_to_current_message(6);
+
+    bool ok = buff.grow_to_fit(100, 108);
+
+    BOOST_TEST(ok);
+    BOOST_TEST(buff.size() == 108u);
+    check_buffer(buff, {}, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06}, {0x07, 0x08});
+}
+
+BOOST_AUTO_TEST_SUITE_END()
+
+BOOST_AUTO_TEST_SUITE(shrink_to)
+
+BOOST_AUTO_TEST_CASE(with_other_areas)
+{
+    read_buffer buff(16);
+    copy_to_free_area(buff, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08});
+    buff.move_to_pending(8);
+    buff.move_to_current_message(6);
+    buff.grow_to_fit(200);
+
+    buff.shrink_to(10);
+
+    BOOST_TEST(buff.size() == 10u);
+    check_buffer(buff, {}, {0x01, 0x02, 0x03, 0x04, 0x05, 0x06}, {0x07, 0x08});
+}
+
+BOOST_AUTO_TEST_CASE(without_other_areas)
+{
+    read_buffer buff(200);
+
+    buff.shrink_to(16);
+
+    BOOST_TEST(buff.size() == 16u);
+    check_buffer(buff, {}, {}, {});
+}
+
+BOOST_AUTO_TEST_CASE(zero_bytes)
+{
+    read_buffer buff(200);
+
+    buff.shrink_to(0);
+
+    check_empty_buffer(buff);
+}
+
+BOOST_AUTO_TEST_CASE(bigger_size)
+{
+    // Shrinking to a bigger size is a no-op
+    read_buffer buff(16);
+    stability_checker checker(buff);
+
+    buff.shrink_to(100);
+
+    checker.check_stability();
+}
+
 BOOST_AUTO_TEST_SUITE_END()
 
 BOOST_AUTO_TEST_SUITE_END()
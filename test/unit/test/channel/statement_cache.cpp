@@ -0,0 +1,145 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/statement.hpp>
+
+#include <boost/mysql/impl/internal/channel/statement_cache.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include <string>
+
+#include "test_unit/create_statement.hpp"
+
+using namespace boost::mysql;
+using namespace boost::mysql::test;
+using boost::mysql::detail::statement_cache;
+
+BOOST_AUTO_TEST_SUITE(test_statement_cache)
+
+BOOST_AUTO_TEST_CASE(default_ctor)
+{
+    statement_cache cache;
+    BOOST_TEST(!cache.enabled());
+    BOOST_TEST(cache.capacity() == 0u);
+    BOOST_TEST(cache.empty());
+    BOOST_TEST(!cache.needs_eviction());
+}
+
+BOOST_AUTO_TEST_CASE(find)
+{
+    statement_cache cache;
+    cache.set_capacity(2);
+    cache.insert("SELECT 1", statement_builder().id(1).num_params(0).build());
+    cache.insert("SELECT ?", statement_builder().id(2).num_params(1).build());
+
+    // Hits
+    auto stmt = cache.find("SELECT ?");
+    BOOST_TEST(stmt.valid());
+    BOOST_TEST(stmt.id() == 2u);
+    BOOST_TEST(stmt.num_params() == 1u);
+    BOOST_TEST(cache.find("SELECT 1").id() == 1u);
+
+    // Misses
+    BOOST_TEST(!cache.find("SELECT 2").valid());
+    BOOST_TEST(!cache.find("").valid());
+
+    // Lookup doesn't require the key to outlive the call
+    std::string key = "SELECT 1";
+    BOOST_TEST(cache.find(key).id() == 1u);
+    key = "SELECT 2";
+    BOOST_TEST(!cache.find(key).valid());
+    BOOST_TEST(cache.contains(1));
+    BOOST_TEST(cache.contains(2));
+    BOOST_TEST(!cache.contains(3));
+}
+
+BOOST_AUTO_TEST_CASE(lru_eviction)
+{
+    statement_cache cache;
+    cache.set_capacity(2);
+    cache.insert("SELECT 1", statement_builder().id(1).build());
+    BOOST_TEST(!cache.needs_eviction());
+    cache.insert("SELECT 2", statement_builder().id(2).build());
+    BOOST_TEST(cache.needs_eviction());
+
+    // Using the 1st statement makes the 2nd one the least recently used
+    cache.find("SELECT 1");
+    BOOST_TEST(cache.pop_lru().id() == 2u);
+    BOOST_TEST(cache.size() == 1u);
+    BOOST_TEST(!cache.contains(2));
+    BOOST_TEST(!cache.find("SELECT 2").valid());
+    BOOST_TEST(!cache.needs_eviction());
+
+    // The SQL text can be cached again
+    cache.insert("SELECT 2", statement_builder().id(3).build());
+    BOOST_TEST(cache.pop_lru().id() == 1u);
+    BOOST_TEST(cache.pop_lru().id() == 3u);
+    BOOST_TEST(cache.empty());
+}
+
+BOOST_AUTO_TEST_CASE(capacity_decreased)
+{
+    statement_cache cache;
+    cache.set_capacity(3);
+    cache.insert("SELECT 1", statement_builder().id(1).build());
+    cache.insert("SELECT 2", statement_builder().id(2).build());
+    cache.insert("SELECT 3", statement_builder().id(3).build());
+
+    // Making room for a new statement requires evicting two
+    cache.set_capacity(2);
+    BOOST_TEST(cache.needs_eviction());
+    BOOST_TEST(cache.pop_lru().id() == 1u);
+    BOOST_TEST(cache.needs_eviction());
+    BOOST_TEST(cache.pop_lru().id() == 2u);
+    BOOST_TEST(!cache.needs_eviction());
+}
+
+BOOST_AUTO_TEST_CASE(disabled_with_entries)
+{
+    statement_cache cache;
+    cache.set_capacity(2);
+    cache.insert("SELECT 1", statement_builder().id(1).build());
+
+    // All remaining statements should be evicted
+    cache.set_capacity(0);
+    BOOST_TEST(!cache.enabled());
+    BOOST_TEST(cache.needs_eviction());
+    BOOST_TEST(cache.pop_lru().id() == 1u);
+    BOOST_TEST(!cache.needs_eviction());
+}
+
+BOOST_AUTO_TEST_CASE(remove)
+{
+    statement_cache cache;
+    cache.set_capacity(2);
+    cache.insert("SELECT 1", statement_builder().id(1).build());
+    cache.insert("SELECT 2", statement_builder().id(2).build());
+
+    BOOST_TEST(cache.remove(1));
+    BOOST_TEST(!cache.remove(1));
+    BOOST_TEST(!cache.remove(42));
+    BOOST_TEST(cache.size() == 1u);
+    BOOST_TEST(!cache.find("SELECT 1").valid());
+    BOOST_TEST(cache.find("SELECT 2").id() == 2u);
+}
+
+BOOST_AUTO_TEST_CASE(clear)
+{
+    statement_cache cache;
+    cache.set_capacity(2);
+    cache.insert("SELECT 1", statement_builder().id(1).build());
+    cache.insert("SELECT 2", statement_builder().id(2).build());
+
+    cache.clear();
+    BOOST_TEST(cache.empty());
+    BOOST_TEST(cache.capacity() == 2u);
+    BOOST_TEST(!cache.contains(1));
+    BOOST_TEST(!cache.find("SELECT 2").valid());
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,122 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/error_code.hpp>
+
+#include <boost/mysql/impl/internal/channel/statement_metadata.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include <cstdint>
+#include <vector>
+
+#include "test_unit/create_coldef_frame.hpp"
+#include "test_unit/create_meta.hpp"
+
+using namespace boost::mysql;
+using namespace boost::mysql::test;
+using boost::mysql::detail::statement_metadata;
+
+BOOST_AUTO_TEST_SUITE(test_statement_metadata)
+
+std::vector<std::uint8_t> create_coldef(const char* name)
+{
+    return create_coldef_body(meta_builder().type(column_type::varchar).name(name).build_coldef());
+}
+
+BOOST_AUTO_TEST_CASE(record)
+{
+    statement_metadata meta;
+    auto f1 = create_coldef("f1");
+    auto f2 = create_coldef("f2");
+
+    meta.start_recording(1);
+    BOOST_TEST(meta.is_recording());
+    meta.record(f1);
+    meta.record(f2);
+    BOOST_TEST(meta.find(1) == nullptr);
+    BOOST_TEST(meta.finish_recording() == error_code());
+
+    // The recorded columns are available
+    BOOST_TEST(!meta.is_recording());
+    BOOST_TEST(meta.size() == 1u);
+    const auto* cols = meta.find(1);
+    BOOST_TEST_REQUIRE(cols != nullptr);
+    BOOST_TEST_REQUIRE(cols->size() == 2u);
+    BOOST_TEST(cols->at(0).name == "f1");
+    BOOST_TEST(cols->at(1).name == "f2");
+    BOOST_TEST(meta.find(2) == nullptr);
+}
+
+BOOST_AUTO_TEST_CASE(record_replaces)
+{
+    statement_metadata meta;
+    auto f1 = create_coldef("f1");
+    auto f2 = create_coldef("f2");
+    meta.start_recording(1);
+    meta.record(f1);
+    BOOST_TEST(meta.finish_recording() == error_code());
+
+    // Recording again for the same statement replaces the columns
+    meta.start_recording(1);
+    meta.record(f2);
+    BOOST_TEST(meta.finish_recording() == error_code());
+    BOOST_TEST(meta.size() == 1u);
+    BOOST_TEST_REQUIRE(meta.find(1)->size() == 1u);
+    BOOST_TEST(meta.find(1)->at(0).name == "f2");
+}
+
+BOOST_AUTO_TEST_CASE(record_error)
+{
+    statement_metadata meta;
+    std::vector<std::uint8_t> bad_coldef{0x08, 0x03};
+    meta.start_recording(1);
+    meta.record(bad_coldef);
+    BOOST_TEST(meta.finish_recording() == error_code(client_errc::incomplete_message));
+    BOOST_TEST(!meta.is_recording());
+    BOOST_TEST(meta.size() == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(discard)
+{
+    statement_metadata meta;
+    auto f1 = create_coldef("f1");
+    meta.start_recording(1);
+    meta.record(f1);
+    meta.discard_recording();
+    BOOST_TEST(!meta.is_recording());
+    BOOST_TEST(meta.size() == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(erase_clear)
+{
+    statement_metadata meta;
+    auto f1 = create_coldef("f1");
+    for (std::uint32_t id : {1u, 2u, 3u})
+    {
+        meta.start_recording(id);
+        meta.record(f1);
+        BOOST_TEST(meta.finish_recording() == error_code());
+    }
+
+    meta.erase(2);
+    BOOST_TEST(meta.size() == 2u);
+    BOOST_TEST(meta.find(2) == nullptr);
+    BOOST_TEST(meta.find(1) != nullptr);
+
+    // Erasing the statement being recorded discards the recording
+    meta.start_recording(1);
+    meta.erase(1);
+    BOOST_TEST(!meta.is_recording());
+
+    meta.clear();
+    BOOST_TEST(meta.size() == 0u);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,161 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/bad_field_access.hpp>
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/column_view.hpp>
+#include <boost/mysql/columnar_results.hpp>
+#include <boost/mysql/columnar_resultset_view.hpp>
+#include <boost/mysql/field_kind.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include <cstdint>
+#include <stdexcept>
+#include <vector>
+
+#include "test_common/check_meta.hpp"
+#include "test_common/create_basic.hpp"
+#include "test_common/printing.hpp"
+#include "test_unit/create_execution_processor.hpp"
+#include "test_unit/create_meta.hpp"
+#include "test_unit/create_ok.hpp"
+
+using namespace boost::mysql;
+using namespace boost::mysql::test;
+
+BOOST_AUTO_TEST_SUITE(test_columnar_results)
+
+columnar_results create_initial_results()
+{
+    columnar_results res;
+    exec_access(get_iface(res))
+        .meta({
+            meta_builder().type(column_type::bigint).build_coldef(),
+            meta_builder().type(column_type::varchar).build_coldef(),
+        })
+        .row(10, "abc")
+        .row(nullptr, nullptr)
+        .row(30, "defg")
+        .ok(ok_builder().affected_rows(1).last_insert_id(2).warnings(3).info("1st").more_results(true).build()
+        )
+        .meta({meta_builder().type(column_type::double_).build_coldef()})
+        .row(4.5)
+        .ok(ok_builder()
+                .affected_rows(4)
+                .last_insert_id(5)
+                .warnings(6)
+                .info("2nd")
+                .out_params(true)
+                .build());
+    return res;
+}
+
+struct fixture
+{
+    columnar_results result{create_initial_results()};
+};
+
+BOOST_AUTO_TEST_CASE(has_value)
+{
+    // Default construction
+    columnar_results result;
+    BOOST_TEST_REQUIRE(!result.has_value());
+
+    // With value
+    result = create_initial_results();
+    BOOST_TEST_REQUIRE(result.has_value());
+}
+
+BOOST_FIXTURE_TEST_CASE(first_resultset_accessors, fixture)
+{
+    BOOST_TEST(result.size() == 2u);
+    BOOST_TEST(result.num_rows() == 3u);
+    check_meta(result.meta(), {column_type::bigint, column_type::varchar});
+    BOOST_TEST(result.affected_rows() == 1u);
+    BOOST_TEST(result.last_insert_id() == 2u);
+    BOOST_TEST(result.warning_count() == 3u);
+    BOOST_TEST(result.info() == "1st");
+    BOOST_TEST(result.column(0).size() == 3u);
+}
+
+BOOST_FIXTURE_TEST_CASE(resultset_view_accessors, fixture)
+{
+    auto rs = result.at(1);
+    BOOST_TEST_REQUIRE(rs.has_value());
+    BOOST_TEST(rs.num_rows() == 1u);
+    BOOST_TEST(rs.num_columns() == 1u);
+    check_meta(rs.meta(), {column_type::double_});
+    BOOST_TEST(rs.affected_rows() == 4u);
+    BOOST_TEST(rs.last_insert_id() == 5u);
+    BOOST_TEST(rs.warning_count() == 6u);
+    BOOST_TEST(rs.info() == "2nd");
+    BOOST_TEST(rs.is_out_params());
+    BOOST_TEST(rs.column_at(0).as_double()[0] == 4.5);
+    BOOST_CHECK_THROW(rs.column_at(1), std::out_of_range);
+
+    BOOST_TEST(result.front().info() == "1st");
+    BOOST_TEST(result.back().info() == "2nd");
+    BOOST_TEST(result[0].info() == "1st");
+    BOOST_CHECK_THROW(result.at(2), std::out_of_range);
+    BOOST_TEST(!columnar_resultset_view().has_value());
+}
+
+BOOST_FIXTURE_TEST_CASE(column_view_int, fixture)
+{
+    auto col = result.column(0);
+    BOOST_TEST(col.kind() == field_kind::int64);
+    BOOST_TEST(col.size() == 3u);
+    BOOST_TEST(!col.empty());
+    BOOST_TEST(col.null_count() == 1u);
+    BOOST_TEST(!col.is_null(0));
+    BOOST_TEST(col.is_null(1));
+    BOOST_TEST(col.null_bitmap().size() == 1u);
+    BOOST_TEST(col.null_bitmap()[0] == 0x02u);
+
+    auto values = col.as_int64();
+    std::vector<std::int64_t> actual(values.begin(), values.end());
+    std::vector<std::int64_t> expected{10, 0, 30};
+    BOOST_TEST(actual == expected, boost::test_tools::per_element());
+    BOOST_TEST(col.get_int64().data() == values.data());
+
+    // Generic access
+    BOOST_TEST(col[0] == field_view(10));
+    BOOST_TEST(col[1] == field_view());
+    BOOST_TEST(col.at(2) == field_view(30));
+    BOOST_CHECK_THROW(col.at(3), std::out_of_range);
+
+    // Accessing with the wrong type throws
+    BOOST_CHECK_THROW(col.as_uint64(), bad_field_access);
+    BOOST_CHECK_THROW(col.as_double(), bad_field_access);
+    BOOST_CHECK_THROW(col.as_string(0), bad_field_access);
+}
+
+BOOST_FIXTURE_TEST_CASE(column_view_string, fixture)
+{
+    auto col = result.column(1);
+    BOOST_TEST(col.kind() == field_kind::string);
+    BOOST_TEST(col.size() == 3u);
+    BOOST_TEST(col.null_count() == 1u);
+    BOOST_TEST(col.as_string(0) == "abc");
+    BOOST_TEST(col.as_string(1) == "");
+    BOOST_TEST(col.get_string(2) == "defg");
+    BOOST_TEST(col[1] == field_view());
+    BOOST_TEST(col[2] == field_view("defg"));
+    BOOST_CHECK_THROW(col.as_blob(0), bad_field_access);
+    BOOST_CHECK_THROW(col.as_int64(), bad_field_access);
+}
+
+BOOST_AUTO_TEST_CASE(views_survive_move)
+{
+    auto result = create_initial_results();
+    auto col = result.column(1);
+    columnar_results result2(std::move(result));
+    BOOST_TEST(col.as_string(2) == "defg");
+}
+
+BOOST_AUTO_TEST_SUITE_END()
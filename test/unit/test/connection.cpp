@@ -6,7 +6,10 @@
 //
 
 #include <boost/mysql/buffer_params.hpp>
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/common_server_errc.hpp>
 #include <boost/mysql/connection.hpp>
+#include <boost/mysql/connection_observer.hpp>
 #include <boost/mysql/metadata_mode.hpp>
 #include <boost/mysql/results.hpp>
 #include <boost/mysql/tcp.hpp>
@@ -16,7 +19,11 @@
 #include <boost/asio/strand.hpp>
 #include <boost/test/unit_test.hpp>
 
+#include <string>
+#include <vector>
+
 #include "test_common/printing.hpp"
+#include "test_unit/create_err.hpp"
 #include "test_unit/create_ok.hpp"
 #include "test_unit/create_ok_frame.hpp"
 #include "test_unit/test_stream.hpp"
@@ -159,6 +166,109 @@ BOOST_AUTO_TEST_CASE(set_meta_mode)
     BOOST_TEST(conn.meta_mode() == metadata_mode::full);
 }
 
+// observer
+struct recording_observer : connection_observer
+{
+    std::vector<operation_type> started;
+    std::vector<operation_type> finished;
+    std::vector<std::string> queries;
+    error_code last_error{client_errc::wrong_num_params};
+    std::size_t bytes_read{};
+    std::size_t bytes_written{};
+    std::size_t messages_read{};
+
+    void on_operation_start(const operation_info& info) override
+    {
+        started.push_back(info.type);
+        queries.emplace_back(info.query);
+    }
+    void on_operation_finish(const operation_info& info, error_code err) override
+    {
+        finished.push_back(info.type);
+        last_error = err;
+    }
+    void on_bytes_read(std::size_t n) override { bytes_read += n; }
+    void on_bytes_written(std::size_t n) override { bytes_written += n; }
+    void on_message_read(std::size_t, std::size_t) override { ++messages_read; }
+};
+
+BOOST_AUTO_TEST_CASE(observer_default)
+{
+    test_connection conn;
+    BOOST_TEST(conn.observer() == nullptr);
+}
+
+BOOST_AUTO_TEST_CASE(observer_success)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            test_connection conn;
+            recording_observer obs;
+            conn.set_observer(&obs);
+            BOOST_TEST(conn.observer() == &obs);
+            auto ok_frame = create_ok_frame(1, ok_builder().build());
+            conn.stream().add_bytes(ok_frame);
+            results result;
+
+            fns.query(conn, "SELECT 1", result).validate_no_error();
+
+            // Operation events
+            const std::vector<operation_type> expected{operation_type::execute};
+            BOOST_TEST(obs.started == expected, boost::test_tools::per_element());
+            BOOST_TEST(obs.finished == expected, boost::test_tools::per_element());
+            BOOST_TEST_REQUIRE(obs.queries.size() == 1u);
+            BOOST_TEST(obs.queries[0] == "SELECT 1");
+            BOOST_TEST(obs.last_error == error_code());
+
+            // I/O events. The query is a frame header, the command byte and the query text
+            BOOST_TEST(obs.bytes_written == 13u);
+            BOOST_TEST(obs.bytes_read == ok_frame.size());
+            BOOST_TEST(obs.messages_read == 1u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(observer_error)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            test_connection conn;
+            recording_observer obs;
+            conn.set_observer(&obs);
+            conn.stream().add_bytes(
+                err_builder().seqnum(1).code(common_server_errc::er_bad_db_error).build_frame()
+            );
+            results result;
+
+            fns.query(conn, "SELECT 1", result).validate_error_exact(common_server_errc::er_bad_db_error);
+
+            const std::vector<operation_type> expected{operation_type::execute};
+            BOOST_TEST(obs.started == expected, boost::test_tools::per_element());
+            BOOST_TEST(obs.finished == expected, boost::test_tools::per_element());
+            BOOST_TEST(obs.last_error == common_server_errc::er_bad_db_error);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(observer_removed)
+{
+    test_connection conn;
+    recording_observer obs;
+    conn.set_observer(&obs);
+    conn.set_observer(nullptr);
+    conn.stream().add_bytes(create_ok_frame(1, ok_builder().build()));
+    results result;
+
+    conn.execute("SELECT 1", result);
+
+    BOOST_TEST(obs.started.empty());
+    BOOST_TEST(obs.bytes_written == 0u);
+}
+
 // rebind_executor
 using other_exec = net::strand<net::any_io_executor>;
 static_assert(
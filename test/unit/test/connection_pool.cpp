@@ -0,0 +1,641 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/connection_pool.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/pool_params.hpp>
+
+#include <boost/mysql/detail/socket_stream.hpp>
+
+#include <boost/asio/any_completion_handler.hpp>
+#include <boost/asio/any_io_executor.hpp>
+#include <boost/asio/buffer.hpp>
+#include <boost/asio/compose.hpp>
+#include <boost/asio/coroutine.hpp>
+#include <boost/asio/error.hpp>
+#include <boost/asio/post.hpp>
+#include <boost/asio/socket_base.hpp>
+#include <boost/test/unit_test.hpp>
+
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <deque>
+#include <thread>
+#include <type_traits>
+#include <vector>
+
+#include "test_common/assert_buffer_equals.hpp"
+#include "test_common/netfun_helpers.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/create_ok.hpp"
+#include "test_unit/create_ok_frame.hpp"
+#include "test_unit/test_stream.hpp"
+
+using namespace boost::mysql;
+using namespace boost::mysql::test;
+namespace asio = boost::asio;
+
+namespace {
+
+// A physical connection, as seen by the server. Bytes sent by the server
+// and bytes written by the client are held by a test_stream
+struct server_connection
+{
+    test_stream stream;
+    error_code connect_err;  // result of the physical connect
+    bool open{false};
+};
+
+// Holds the connections that the pool will open, in order
+struct fake_server
+{
+    std::deque<server_connection> conns;
+    std::size_t num_opened{0};
+
+    // Adds a connection that will complete the handshake successfully
+    server_connection& add_connection()
+    {
+        // Server hello for mysql_native_password, with the capabilities we require
+        const std::vector<std::uint8_t> hello{
+            0x35, 0x2e, 0x37, 0x2e, 0x32, 0x37, 0x2d, 0x30, 0x75, 0x62, 0x75, 0x6e, 0x74, 0x75, 0x30,
+            0x2e, 0x31, 0x39, 0x2e, 0x30, 0x34, 0x2e, 0x31, 0x00, 0x02, 0x00, 0x00, 0x00, 0x52, 0x1a,
+            0x50, 0x3a, 0x4b, 0x12, 0x70, 0x2f, 0x00, 0xff, 0xf7, 0x08, 0x02, 0x00, 0xff, 0x81, 0x15,
+            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x5a, 0x74, 0x05, 0x28,
+            0x2b, 0x7f, 0x21, 0x43, 0x4a, 0x21, 0x62, 0x00, 0x6d, 0x79, 0x73, 0x71, 0x6c, 0x5f, 0x6e,
+            0x61, 0x74, 0x69, 0x76, 0x65, 0x5f, 0x70, 0x61, 0x73, 0x73, 0x77, 0x6f, 0x72, 0x64, 0x00};
+
+        conns.emplace_back();
+        auto& res = conns.back();
+        res.stream.add_bytes(create_frame(0, hello)).add_bytes(create_ok_frame(2, ok_builder().build()));
+        return res;
+    }
+
+    // Adds a connection whose physical connect fails
+    server_connection& add_failed_connection(error_code ec)
+    {
+        conns.emplace_back();
+        auto& res = conns.back();
+        res.connect_err = ec;
+        return res;
+    }
+
+    server_connection& next()
+    {
+        BOOST_TEST_REQUIRE(num_opened < conns.size());
+        return conns[num_opened++];
+    }
+};
+
+struct pool_endpoint
+{
+};
+
+// A socket-like stream, so the pool can connect and close connections.
+// Each stream takes the next connection from the server
+class pool_stream
+{
+    asio::any_io_executor ex_;
+    server_connection* conn_;
+
+    struct connect_op : asio::coroutine
+    {
+        pool_stream& stream_;
+
+        connect_op(pool_stream& stream) noexcept : stream_(stream) {}
+
+        template <class Self>
+        void operator()(Self& self)
+        {
+            BOOST_ASIO_CORO_REENTER(*this)
+            {
+                BOOST_ASIO_CORO_YIELD asio::post(stream_.get_executor(), std::move(self));
+                self.complete(stream_.do_connect());
+            }
+        }
+    };
+
+    error_code do_connect()
+    {
+        conn_->open = !conn_->connect_err;
+        return conn_->connect_err;
+    }
+
+public:
+    pool_stream(asio::any_io_executor ex, fake_server* server) : ex_(std::move(ex)), conn_(&server->next())
+    {
+    }
+
+    // Support the layered stream model
+    using lowest_layer_type = pool_stream;
+    using endpoint_type = pool_endpoint;
+    lowest_layer_type& lowest_layer() noexcept { return *this; }
+    const lowest_layer_type& lowest_layer() const noexcept { return *this; }
+
+    // Executor
+    using executor_type = asio::any_io_executor;
+    executor_type get_executor() { return ex_; }
+
+    // Reading and writing
+    std::size_t read_some(asio::mutable_buffer buff, error_code& ec)
+    {
+        return conn_->stream.read_some(buff, ec);
+    }
+    void async_read_some(
+        asio::mutable_buffer buff,
+        asio::any_completion_handler<void(error_code, std::size_t)> handler
+    )
+    {
+        conn_->stream.async_read_some(buff, std::move(handler));
+    }
+    std::size_t write_some(asio::const_buffer buff, error_code& ec)
+    {
+        return conn_->stream.write_some(buff, ec);
+    }
+    void async_write_some(
+        asio::const_buffer buff,
+        asio::any_completion_handler<void(error_code, std::size_t)> handler
+    )
+    {
+        conn_->stream.async_write_some(buff, std::move(handler));
+    }
+
+    // Connecting and closing
+    void connect(const endpoint_type&, error_code& ec) { ec = do_connect(); }
+    void async_connect(const endpoint_type&, asio::any_completion_handler<void(error_code)> handler)
+    {
+        asio::async_compose<asio::any_completion_handler<void(error_code)>, void(error_code)>(
+            connect_op(*this),
+            handler,
+            get_executor()
+        );
+    }
+    void shutdown(asio::socket_base::shutdown_type, error_code& ec) { ec = error_code(); }
+    void close(error_code& ec)
+    {
+        conn_->open = false;
+        ec = error_code();
+    }
+    bool is_open() const noexcept { return conn_->open; }
+};
+
+}  // namespace
+
+namespace boost {
+namespace mysql {
+namespace detail {
+
+template <>
+struct is_socket<pool_stream> : std::true_type
+{
+};
+
+}  // namespace detail
+}  // namespace mysql
+}  // namespace boost
+
+namespace {
+
+using test_pool = connection_pool<pool_stream>;
+using test_pooled_connection = pooled_connection<pool_stream>;
+
+struct get_connection_result
+{
+    bool done{false};
+    error_code ec;
+    test_pooled_connection conn;
+};
+
+void start_get_connection(test_pool& pool, get_connection_result& res)
+{
+    pool.async_get_connection([&res](error_code ec, test_pooled_connection conn) {
+        res.done = true;
+        res.ec = ec;
+        res.conn = std::move(conn);
+    });
+}
+
+// The last n bytes written by the client to a connection
+std::vector<std::uint8_t> last_bytes_written(const server_connection& conn, std::size_t n)
+{
+    const auto& written = conn.stream.bytes_written();
+    BOOST_TEST_REQUIRE(written.size() >= n);
+    return std::vector<std::uint8_t>(written.end() - n, written.end());
+}
+
+const std::vector<std::uint8_t> ping_msg{0x01, 0x00, 0x00, 0x00, 0x0e};
+const std::vector<std::uint8_t> reset_msg{0x01, 0x00, 0x00, 0x00, 0x1f};
+const std::vector<std::uint8_t> quit_msg{0x01, 0x00, 0x00, 0x00, 0x01};
+
+struct fixture
+{
+    fake_server server;
+    test_stream executor_source;
+    asio::any_io_executor ex{executor_source.get_executor()};
+    pool_params params{"user", "pass"};
+
+    fixture()
+    {
+        // No I/O unless a test requests it
+        params.set_min_size(0);
+        params.set_ping_interval(std::chrono::hours(1));
+        params.set_reset_on_return(false);
+    }
+
+    // Runs all ready handlers. Pool maintenance waits for at least one second
+    // between cycles, so this never runs more than a cycle
+    void poll()
+    {
+        auto& ctx = get_context(ex);
+        ctx.restart();
+        ctx.poll();
+    }
+};
+
+}  // namespace
+
+BOOST_AUTO_TEST_SUITE(test_connection_pool)
+
+BOOST_FIXTURE_TEST_CASE(get_connection_creates_connection, fixture)
+{
+    server.add_connection();
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res;
+
+    start_get_connection(pool, res);
+    poll();
+
+    BOOST_TEST_REQUIRE(res.done);
+    BOOST_TEST(res.ec == error_code());
+    BOOST_TEST(res.conn.valid());
+    BOOST_TEST(server.num_opened == 1u);
+    BOOST_TEST(server.conns[0].open);
+    BOOST_TEST(pool.size() == 1u);
+    BOOST_TEST(pool.num_idle() == 0u);
+}
+
+BOOST_FIXTURE_TEST_CASE(returned_connection_is_reused, fixture)
+{
+    server.add_connection();
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res1, res2;
+
+    start_get_connection(pool, res1);
+    poll();
+    BOOST_TEST_REQUIRE(res1.done);
+    auto* conn = &res1.conn.get();
+
+    // Returning makes the connection idle
+    res1.conn = test_pooled_connection();
+    BOOST_TEST(pool.num_idle() == 1u);
+
+    // No I/O is required to get it again
+    start_get_connection(pool, res2);
+    poll();
+    BOOST_TEST_REQUIRE(res2.done);
+    BOOST_TEST(res2.ec == error_code());
+    BOOST_TEST(&res2.conn.get() == conn);
+    BOOST_TEST(server.num_opened == 1u);
+    BOOST_TEST(server.conns[0].stream.num_unread_bytes() == 0u);
+}
+
+BOOST_FIXTURE_TEST_CASE(max_size, fixture)
+{
+    server.add_connection();
+    server.add_connection();
+    params.set_max_size(2);
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res1, res2, res3;
+
+    start_get_connection(pool, res1);
+    start_get_connection(pool, res2);
+    start_get_connection(pool, res3);
+    poll();
+
+    // No more than max_size connections are created. The third request waits
+    BOOST_TEST(res1.done);
+    BOOST_TEST(res2.done);
+    BOOST_TEST(!res3.done);
+    BOOST_TEST(pool.size() == 2u);
+    BOOST_TEST(server.num_opened == 2u);
+
+    // Returning a connection serves the waiter
+    auto* conn = &res2.conn.get();
+    res2.conn = test_pooled_connection();
+    poll();
+    BOOST_TEST_REQUIRE(res3.done);
+    BOOST_TEST(res3.ec == error_code());
+    BOOST_TEST(&res3.conn.get() == conn);
+    BOOST_TEST(pool.size() == 2u);
+}
+
+BOOST_FIXTURE_TEST_CASE(waiters_served_in_order, fixture)
+{
+    server.add_connection();
+    params.set_max_size(1);
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res1, res2, res3;
+
+    start_get_connection(pool, res1);
+    poll();
+    BOOST_TEST_REQUIRE(res1.done);
+
+    start_get_connection(pool, res2);
+    start_get_connection(pool, res3);
+    poll();
+    BOOST_TEST(!res2.done);
+    BOOST_TEST(!res3.done);
+
+    // The first waiter gets the connection
+    res1.conn = test_pooled_connection();
+    poll();
+    BOOST_TEST_REQUIRE(res2.done);
+    BOOST_TEST(res2.ec == error_code());
+    BOOST_TEST(!res3.done);
+
+    // Then the second one
+    res2.conn = test_pooled_connection();
+    poll();
+    BOOST_TEST_REQUIRE(res3.done);
+    BOOST_TEST(res3.ec == error_code());
+    BOOST_TEST(res3.conn.valid());
+    BOOST_TEST(server.num_opened == 1u);
+}
+
+BOOST_FIXTURE_TEST_CASE(connect_error, fixture)
+{
+    server.add_failed_connection(asio::error::connection_refused);
+    server.add_connection();
+    params.set_max_size(1);
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res1, res2;
+
+    // The failed connection is discarded, making room for the waiter
+    start_get_connection(pool, res1);
+    start_get_connection(pool, res2);
+    poll();
+
+    BOOST_TEST_REQUIRE(res1.done);
+    BOOST_TEST(res1.ec == asio::error::connection_refused);
+    BOOST_TEST(!res1.conn.valid());
+    BOOST_TEST_REQUIRE(res2.done);
+    BOOST_TEST(res2.ec == error_code());
+    BOOST_TEST(server.num_opened == 2u);
+    BOOST_TEST(pool.size() == 1u);
+}
+
+BOOST_FIXTURE_TEST_CASE(cancel_pending_get_connection, fixture)
+{
+    server.add_connection();
+    params.set_max_size(1);
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res1, res2, res3;
+
+    start_get_connection(pool, res1);
+    start_get_connection(pool, res2);
+    poll();
+    BOOST_TEST_REQUIRE(res1.done);
+    BOOST_TEST(!res2.done);
+
+    // Waiters are aborted
+    pool.cancel();
+    poll();
+    BOOST_TEST_REQUIRE(res2.done);
+    BOOST_TEST(res2.ec == asio::error::operation_aborted);
+    BOOST_TEST(!res2.conn.valid());
+
+    // Connections handed out are not affected
+    BOOST_TEST(res1.ec == error_code());
+    BOOST_TEST(res1.conn.valid());
+
+    // Further requests fail, even if connections are available
+    res1.conn = test_pooled_connection();
+    start_get_connection(pool, res3);
+    poll();
+    BOOST_TEST_REQUIRE(res3.done);
+    BOOST_TEST(res3.ec == asio::error::operation_aborted);
+    BOOST_TEST(!res3.conn.valid());
+}
+
+BOOST_FIXTURE_TEST_CASE(reset_and_ping, fixture)
+{
+    // Responses to the reset and the ping
+    auto& conn = server.add_connection();
+    conn.stream.add_bytes(create_ok_frame(1, ok_builder().build()))
+        .add_bytes(create_ok_frame(1, ok_builder().build()));
+    params.set_reset_on_return(true);
+    params.set_ping_interval(std::chrono::seconds(0));
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res1, res2;
+
+    // A new connection is neither reset nor pinged
+    start_get_connection(pool, res1);
+    poll();
+    BOOST_TEST_REQUIRE(res1.done);
+    auto* c = &res1.conn.get();
+    res1.conn = test_pooled_connection();
+
+    // The session is reset and the connection checked before handing it out again
+    start_get_connection(pool, res2);
+    poll();
+    BOOST_TEST_REQUIRE(res2.done);
+    BOOST_TEST(res2.ec == error_code());
+    BOOST_TEST(&res2.conn.get() == c);
+    BOOST_TEST(server.num_opened == 1u);
+    BOOST_TEST(conn.stream.num_unread_bytes() == 0u);
+    std::vector<std::uint8_t> expected(reset_msg);
+    expected.insert(expected.end(), ping_msg.begin(), ping_msg.end());
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(last_bytes_written(conn, expected.size()), expected);
+}
+
+BOOST_FIXTURE_TEST_CASE(reset_error_reconnects, fixture)
+{
+    // The first connection fails the reset, since the server doesn't send anything
+    auto& conn1 = server.add_connection();
+    auto& conn2 = server.add_connection();
+    params.set_reset_on_return(true);
+    params.set_ping_interval(std::chrono::seconds(0));
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res1, res2;
+
+    start_get_connection(pool, res1);
+    poll();
+    BOOST_TEST_REQUIRE(res1.done);
+    res1.conn = test_pooled_connection();
+
+    // A connection that failed the reset is not pinged, but reconnected
+    start_get_connection(pool, res2);
+    poll();
+    BOOST_TEST_REQUIRE(res2.done);
+    BOOST_TEST(res2.ec == error_code());
+    BOOST_TEST(res2.conn.valid());
+    BOOST_TEST(server.num_opened == 2u);
+    BOOST_TEST(conn2.open);
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(last_bytes_written(conn1, reset_msg.size()), reset_msg);
+    BOOST_TEST(pool.size() == 1u);
+}
+
+BOOST_FIXTURE_TEST_CASE(ping_error_reconnects, fixture)
+{
+    // The first connection fails the ping, since the server doesn't send anything
+    auto& conn1 = server.add_connection();
+    auto& conn2 = server.add_connection();
+    params.set_ping_interval(std::chrono::seconds(0));
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res1, res2;
+
+    start_get_connection(pool, res1);
+    poll();
+    BOOST_TEST_REQUIRE(res1.done);
+    res1.conn = test_pooled_connection();
+
+    start_get_connection(pool, res2);
+    poll();
+    BOOST_TEST_REQUIRE(res2.done);
+    BOOST_TEST(res2.ec == error_code());
+    BOOST_TEST(res2.conn.valid());
+    BOOST_TEST(server.num_opened == 2u);
+    BOOST_TEST(conn2.open);
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(last_bytes_written(conn1, ping_msg.size()), ping_msg);
+    BOOST_TEST(pool.size() == 1u);
+}
+
+BOOST_FIXTURE_TEST_CASE(reconnect_error, fixture)
+{
+    server.add_connection();
+    server.add_failed_connection(asio::error::connection_refused);
+    params.set_ping_interval(std::chrono::seconds(0));
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res1, res2;
+
+    start_get_connection(pool, res1);
+    poll();
+    BOOST_TEST_REQUIRE(res1.done);
+    res1.conn = test_pooled_connection();
+
+    // The ping fails, and so does reconnecting. The connection is discarded
+    start_get_connection(pool, res2);
+    poll();
+    BOOST_TEST_REQUIRE(res2.done);
+    BOOST_TEST(res2.ec == asio::error::connection_refused);
+    BOOST_TEST(!res2.conn.valid());
+    BOOST_TEST(server.num_opened == 2u);
+    BOOST_TEST(pool.size() == 0u);
+}
+
+BOOST_FIXTURE_TEST_CASE(run_creates_min_size, fixture)
+{
+    server.add_connection();
+    server.add_connection();
+    params.set_min_size(2);
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    bool run_done = false;
+
+    pool.async_run([&run_done](error_code ec) {
+        BOOST_TEST(ec == error_code());
+        run_done = true;
+    });
+    poll();
+    BOOST_TEST(!run_done);
+    BOOST_TEST(pool.size() == 2u);
+    BOOST_TEST(pool.num_idle() == 2u);
+    BOOST_TEST(server.num_opened == 2u);
+
+    // Cancelling finishes the run operation
+    pool.cancel();
+    poll();
+    BOOST_TEST(run_done);
+}
+
+BOOST_FIXTURE_TEST_CASE(run_reaps_idle_connections, fixture)
+{
+    auto& conn1 = server.add_connection();
+    auto& conn2 = server.add_connection();
+    params.set_min_size(1);
+    params.set_idle_timeout(std::chrono::seconds(0));
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res1, res2;
+    bool run_done = false;
+
+    // Create two connections and return them
+    start_get_connection(pool, res1);
+    start_get_connection(pool, res2);
+    poll();
+    BOOST_TEST_REQUIRE(res1.done);
+    BOOST_TEST_REQUIRE(res2.done);
+    res1.conn = test_pooled_connection();
+    res2.conn = test_pooled_connection();
+    BOOST_TEST(pool.num_idle() == 2u);
+
+    // Idle connections are closed, keeping at least min_size
+    pool.async_run([&run_done](error_code) { run_done = true; });
+    poll();
+    BOOST_TEST(pool.size() == 1u);
+    BOOST_TEST(pool.num_idle() == 1u);
+    BOOST_TEST(!conn1.open);
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(last_bytes_written(conn1, quit_msg.size()), quit_msg);
+    BOOST_TEST(conn2.open);
+    BOOST_TEST(server.num_opened == 2u);
+
+    pool.cancel();
+    poll();
+    BOOST_TEST(run_done);
+}
+
+BOOST_FIXTURE_TEST_CASE(run_pings_idle_connections, fixture)
+{
+    auto& conn = server.add_connection();
+    conn.stream.add_bytes(create_ok_frame(1, ok_builder().build()));
+    params.set_ping_interval(std::chrono::milliseconds(200));
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res;
+    bool run_done = false;
+
+    start_get_connection(pool, res);
+    poll();
+    BOOST_TEST_REQUIRE(res.done);
+    res.conn = test_pooled_connection();
+
+    // A successful ping makes the connection available again
+    std::this_thread::sleep_for(std::chrono::milliseconds(300));
+    pool.async_run([&run_done](error_code) { run_done = true; });
+    poll();
+    BOOST_TEST(pool.size() == 1u);
+    BOOST_TEST(pool.num_idle() == 1u);
+    BOOST_TEST(conn.stream.num_unread_bytes() == 0u);
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(last_bytes_written(conn, ping_msg.size()), ping_msg);
+
+    pool.cancel();
+    poll();
+    BOOST_TEST(run_done);
+}
+
+BOOST_FIXTURE_TEST_CASE(run_discards_broken_connections, fixture)
+{
+    // The ping fails, since the server doesn't send anything
+    auto& conn = server.add_connection();
+    params.set_ping_interval(std::chrono::seconds(0));
+    test_pool pool(ex, pool_endpoint(), params, &server);
+    get_connection_result res;
+    bool run_done = false;
+
+    start_get_connection(pool, res);
+    poll();
+    BOOST_TEST_REQUIRE(res.done);
+    res.conn = test_pooled_connection();
+
+    pool.async_run([&run_done](error_code) { run_done = true; });
+    poll();
+    BOOST_TEST(pool.size() == 0u);
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(last_bytes_written(conn, ping_msg.size()), ping_msg);
+
+    pool.cancel();
+    poll();
+    BOOST_TEST(run_done);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
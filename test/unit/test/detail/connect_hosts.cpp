@@ -0,0 +1,184 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/host_list.hpp>
+#include <boost/mysql/resolver_cache.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/connect_hosts.hpp>
+
+#include <boost/asio/ip/address.hpp>
+#include <boost/asio/ip/tcp.hpp>
+#include <boost/test/unit_test.hpp>
+
+#include <chrono>
+#include <random>
+#include <string>
+#include <vector>
+
+using namespace boost::mysql;
+using boost::asio::ip::make_address;
+using boost::asio::ip::tcp;
+using boost::mysql::detail::append_endpoints;
+using boost::mysql::detail::order_hosts;
+using boost::mysql::detail::use_cached_endpoints;
+
+BOOST_AUTO_TEST_SUITE(test_connect_hosts)
+
+static server_host make_host(std::string name, unsigned priority, unsigned weight)
+{
+    server_host res;
+    res.host = std::move(name);
+    res.priority = priority;
+    res.weight = weight;
+    return res;
+}
+
+static std::vector<std::string> host_names(const std::vector<server_host>& hosts)
+{
+    std::vector<std::string> res;
+    for (const auto& h : hosts)
+        res.push_back(h.host);
+    return res;
+}
+
+BOOST_AUTO_TEST_SUITE(order_hosts_)
+BOOST_AUTO_TEST_CASE(empty)
+{
+    std::minstd_rand rng;
+    BOOST_TEST(order_hosts(std::vector<server_host>{}, rng).empty());
+}
+
+BOOST_AUTO_TEST_CASE(by_priority)
+{
+    std::minstd_rand rng;
+    std::vector<server_host> hosts{
+        make_host("h2", 2, 1),
+        make_host("h0", 0, 1),
+        make_host("h1", 1, 1),
+    };
+    std::vector<std::string> expected{"h0", "h1", "h2"};
+    BOOST_TEST(host_names(order_hosts(hosts, rng)) == expected);
+}
+
+BOOST_AUTO_TEST_CASE(zero_weight_last)
+{
+    // Hosts with zero weight are only selected when no other host remains
+    std::vector<server_host> hosts{
+        make_host("zero1", 0, 0),
+        make_host("h1", 0, 1),
+        make_host("zero2", 0, 0),
+        make_host("h2", 0, 1),
+        make_host("other_priority", 1, 1),
+    };
+    for (unsigned seed = 1; seed < 50u; ++seed)
+    {
+        std::minstd_rand rng(seed);
+        auto res = order_hosts(hosts, rng);
+        BOOST_TEST_REQUIRE(res.size() == 5u);
+        BOOST_TEST((res[0].host == "h1" || res[0].host == "h2"));
+        BOOST_TEST((res[1].host == "h1" || res[1].host == "h2"));
+        BOOST_TEST((res[2].host == "zero1" || res[2].host == "zero2"));
+        BOOST_TEST((res[3].host == "zero1" || res[3].host == "zero2"));
+        BOOST_TEST(res[4].host == "other_priority");
+    }
+}
+
+BOOST_AUTO_TEST_CASE(all_zero_weight)
+{
+    std::minstd_rand rng;
+    std::vector<server_host> hosts{make_host("h1", 0, 0), make_host("h2", 0, 0)};
+    std::vector<std::string> expected{"h1", "h2"};
+    BOOST_TEST(host_names(order_hosts(hosts, rng)) == expected);
+}
+
+BOOST_AUTO_TEST_CASE(weights)
+{
+    // The host with the bigger weight should be selected first most of the time
+    std::vector<server_host> hosts{make_host("light", 0, 1), make_host("heavy", 0, 99)};
+    std::minstd_rand rng(42);
+    int heavy_first = 0;
+    for (int i = 0; i < 1000; ++i)
+    {
+        auto res = order_hosts(hosts, rng);
+        BOOST_TEST_REQUIRE(res.size() == 2u);
+        if (res[0].host == "heavy")
+            ++heavy_first;
+    }
+    BOOST_TEST(heavy_first > 900);
+    BOOST_TEST(heavy_first < 1000);
+}
+BOOST_AUTO_TEST_SUITE_END()
+
+BOOST_AUTO_TEST_SUITE(append_endpoints_)
+BOOST_AUTO_TEST_CASE(interleaves_families)
+{
+    std::vector<tcp::endpoint> input{
+        tcp::endpoint(make_address("::1"), 3306),
+        tcp::endpoint(make_address("fe80::1"), 3306),
+        tcp::endpoint(make_address("fe80::2"), 3306),
+        tcp::endpoint(make_address("127.0.0.1"), 3306),
+        tcp::endpoint(make_address("127.0.0.2"), 3306),
+    };
+    std::vector<tcp::endpoint> expected{
+        tcp::endpoint(make_address("::1"), 3306),
+        tcp::endpoint(make_address("127.0.0.1"), 3306),
+        tcp::endpoint(make_address("fe80::1"), 3306),
+        tcp::endpoint(make_address("127.0.0.2"), 3306),
+        tcp::endpoint(make_address("fe80::2"), 3306),
+    };
+    std::vector<tcp::endpoint> output;
+    append_endpoints(input, output);
+    BOOST_TEST(output == expected);
+}
+
+BOOST_AUTO_TEST_CASE(single_family)
+{
+    std::vector<tcp::endpoint> input{
+        tcp::endpoint(make_address("127.0.0.1"), 3306),
+        tcp::endpoint(make_address("127.0.0.2"), 3306),
+    };
+    std::vector<tcp::endpoint> output{tcp::endpoint(make_address("10.0.0.1"), 3306)};
+    append_endpoints(input, output);
+    std::vector<tcp::endpoint> expected{
+        tcp::endpoint(make_address("10.0.0.1"), 3306),
+        tcp::endpoint(make_address("127.0.0.1"), 3306),
+        tcp::endpoint(make_address("127.0.0.2"), 3306),
+    };
+    BOOST_TEST(output == expected);
+}
+BOOST_AUTO_TEST_SUITE_END()
+
+BOOST_AUTO_TEST_SUITE(use_cached_endpoints_)
+BOOST_AUTO_TEST_CASE(no_cache)
+{
+    std::vector<tcp::endpoint> output;
+    BOOST_TEST(!use_cached_endpoints(make_host("localhost", 0, 1), nullptr, output));
+    BOOST_TEST(output.empty());
+}
+
+BOOST_AUTO_TEST_CASE(miss)
+{
+    resolver_cache cache;
+    std::vector<tcp::endpoint> output;
+    BOOST_TEST(!use_cached_endpoints(make_host("localhost", 0, 1), &cache, output));
+    BOOST_TEST(output.empty());
+}
+
+BOOST_AUTO_TEST_CASE(hit)
+{
+    resolver_cache cache;
+    std::vector<tcp::endpoint> endpoints{tcp::endpoint(make_address("127.0.0.1"), 3306)};
+    detail::access::get_impl(cache).insert("localhost", 3306, endpoints, std::chrono::steady_clock::now());
+
+    std::vector<tcp::endpoint> output;
+    BOOST_TEST(use_cached_endpoints(make_host("localhost", 0, 1), &cache, output));
+    BOOST_TEST(output == endpoints);
+}
+BOOST_AUTO_TEST_SUITE_END()
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,205 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/metadata.hpp>
+#include <boost/mysql/metadata_collection_view.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/coldef_view.hpp>
+#include <boost/mysql/detail/metadata_vector.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include <cstddef>
+#include <memory>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include "test_unit/create_meta.hpp"
+
+using namespace boost::mysql::test;
+using namespace boost::mysql;
+using boost::mysql::detail::metadata_vector;
+
+BOOST_AUTO_TEST_SUITE(test_metadata_vector)
+
+detail::coldef_view create_coldef(string_view name)
+{
+    return meta_builder()
+        .database("db")
+        .table("tab")
+        .org_table("org_tab")
+        .name(name)
+        .org_name("org_name")
+        .type(column_type::varchar)
+        .build_coldef();
+}
+
+void check_meta(const metadata& meta, string_view name)
+{
+    BOOST_TEST(meta.database() == "db");
+    BOOST_TEST(meta.table() == "tab");
+    BOOST_TEST(meta.original_table() == "org_tab");
+    BOOST_TEST(meta.column_name() == name);
+    BOOST_TEST(meta.original_column_name() == "org_name");
+    BOOST_TEST(meta.type() == column_type::varchar);
+}
+
+// Columns with different names, so that the string buffer needs to grow
+std::vector<std::string> create_names(std::size_t num_columns)
+{
+    std::vector<std::string> res;
+    for (std::size_t i = 0; i < num_columns; ++i)
+        res.push_back("column_with_a_long_name_" + std::to_string(i));
+    return res;
+}
+
+void check_metas(metadata_collection_view meta, const std::vector<std::string>& names)
+{
+    BOOST_TEST_REQUIRE(meta.size() == names.size());
+    for (std::size_t i = 0; i < names.size(); ++i)
+        check_meta(meta[i], names[i]);
+}
+
+BOOST_AUTO_TEST_CASE(push_back_copy_strings)
+{
+    // Enough columns to make the string buffer grow several times.
+    // Previous columns should remain valid
+    auto names = create_names(100);
+    metadata_vector meta;
+    for (const auto& name : names)
+        meta.push_back(create_coldef(name), true);
+    check_metas(meta, names);
+}
+
+BOOST_AUTO_TEST_CASE(push_back_no_copy_strings)
+{
+    metadata_vector meta;
+    meta.push_back(create_coldef("col1"), false);
+    BOOST_TEST_REQUIRE(meta.size() == 1u);
+    BOOST_TEST(meta[0].database() == "");
+    BOOST_TEST(meta[0].table() == "");
+    BOOST_TEST(meta[0].original_table() == "");
+    BOOST_TEST(meta[0].column_name() == "");
+    BOOST_TEST(meta[0].original_column_name() == "");
+    BOOST_TEST(meta[0].type() == column_type::varchar);
+}
+
+BOOST_AUTO_TEST_CASE(push_back_empty_strings)
+{
+    metadata_vector meta;
+    meta.push_back(meta_builder().type(column_type::int_).build_coldef(), true);
+    meta.push_back(create_coldef("col1"), true);
+    BOOST_TEST_REQUIRE(meta.size() == 2u);
+    BOOST_TEST(meta[0].column_name() == "");
+    BOOST_TEST(meta[0].type() == column_type::int_);
+    check_meta(meta[1], "col1");
+}
+
+BOOST_AUTO_TEST_CASE(clear)
+{
+    metadata_vector meta;
+    meta.push_back(create_coldef("col1"), true);
+    meta.clear();
+    BOOST_TEST(meta.empty());
+
+    // The object can be reused
+    meta.push_back(create_coldef("col2"), true);
+    BOOST_TEST_REQUIRE(meta.size() == 1u);
+    check_meta(meta[0], "col2");
+}
+
+BOOST_AUTO_TEST_CASE(copy_ctor)
+{
+    auto names = create_names(20);
+    std::unique_ptr<metadata_vector> source{new metadata_vector};
+    for (const auto& name : names)
+        source->push_back(create_coldef(name), true);
+    source->push_back(create_coldef("col"), false);
+    names.push_back("col");
+
+    metadata_vector copy{*source};
+    source.reset();
+
+    // The copy doesn't reference the source
+    BOOST_TEST_REQUIRE(copy.size() == 21u);
+    for (std::size_t i = 0; i < 20u; ++i)
+        check_meta(copy[i], names[i]);
+    BOOST_TEST(copy[20].column_name() == "");
+}
+
+BOOST_AUTO_TEST_CASE(copy_assignment)
+{
+    auto names = create_names(20);
+    std::unique_ptr<metadata_vector> source{new metadata_vector};
+    for (const auto& name : names)
+        source->push_back(create_coldef(name), true);
+
+    metadata_vector copy;
+    copy.push_back(create_coldef("other"), true);
+    copy = *source;
+    source.reset();
+    check_metas(copy, names);
+
+    // Self-assignment
+    const auto& ref = copy;
+    copy = ref;
+    check_metas(copy, names);
+}
+
+BOOST_AUTO_TEST_CASE(move)
+{
+    auto names = create_names(20);
+    metadata_vector source;
+    for (const auto& name : names)
+        source.push_back(create_coldef(name), true);
+
+    metadata_vector moved{std::move(source)};
+    check_metas(moved, names);
+
+    metadata_vector assigned;
+    assigned = std::move(moved);
+    check_metas(assigned, names);
+}
+
+BOOST_AUTO_TEST_CASE(assign)
+{
+    // Objects owning their strings, as in a user-created vector
+    auto names = create_names(20);
+    std::vector<metadata> source;
+    for (const auto& name : names)
+        source.push_back(detail::access::construct<metadata>(create_coldef(name), true));
+
+    metadata_vector meta;
+    meta.push_back(create_coldef("other"), true);
+    meta.assign(source);
+    source.clear();
+    check_metas(meta, names);
+
+    // Self-assignment
+    meta.assign(meta);
+    check_metas(meta, names);
+
+    // Empty
+    meta.assign(metadata_collection_view());
+    BOOST_TEST(meta.empty());
+}
+
+// Copying a metadata object from a vector yields an object owning its strings
+BOOST_AUTO_TEST_CASE(element_copy)
+{
+    std::unique_ptr<metadata_vector> source{new metadata_vector};
+    source->push_back(create_coldef("col1"), true);
+    metadata copy = (*source)[0];
+    source.reset();
+    check_meta(copy, "col1");
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -26,6 +26,7 @@ using boost::mysql::detail::map_metadata;
 using boost::mysql::detail::name_table_t;
 using boost::mysql::detail::pos_absent;
 using boost::mysql::detail::pos_map_add_field;
+using boost::mysql::detail::pos_map_is_identity;
 using boost::mysql::detail::pos_map_reset;
 
 BOOST_AUTO_TEST_SUITE(test_post_map)
@@ -128,6 +129,17 @@ BOOST_AUTO_TEST_CASE(add_field_named)
     BOOST_TEST(map[3] == 1u);
 }
 
+BOOST_AUTO_TEST_CASE(is_identity)
+{
+    const std::size_t identity[] = {0, 1, 2};
+    const std::size_t reordered[] = {1, 0, 2};
+    const std::size_t absent[] = {0, pos_absent};
+    BOOST_TEST(pos_map_is_identity(span<const std::size_t>()));
+    BOOST_TEST(pos_map_is_identity(identity));
+    BOOST_TEST(!pos_map_is_identity(reordered));
+    BOOST_TEST(!pos_map_is_identity(absent));
+}
+
 BOOST_AUTO_TEST_CASE(map_metadata_)
 {
     const std::array<std::size_t, 3> map{
@@ -16,6 +16,8 @@
 #include <boost/mysql/metadata_collection_view.hpp>
 #include <boost/mysql/string_view.hpp>
 
+#include <boost/mysql/detail/resultset_encoding.hpp>
+#include <boost/mysql/detail/row_field_reader.hpp>
 #include <boost/mysql/detail/typing/pos_map.hpp>
 #include <boost/mysql/detail/typing/row_traits.hpp>
 
@@ -28,6 +30,7 @@
 #include "test_common/create_basic.hpp"
 #include "test_common/printing.hpp"
 #include "test_unit/create_meta.hpp"
+#include "test_unit/create_row_message.hpp"
 
 using namespace boost::mysql;
 using namespace boost::mysql::test;
@@ -38,6 +41,9 @@ using boost::mysql::detail::is_static_row;
 using boost::mysql::detail::meta_check;
 using boost::mysql::detail::name_table_t;
 using boost::mysql::detail::parse;
+using boost::mysql::detail::parse_direct;
+using boost::mysql::detail::resultset_encoding;
+using boost::mysql::detail::row_field_reader;
 
 BOOST_AUTO_TEST_SUITE(test_row_traits)
 
@@ -323,6 +329,138 @@ BOOST_AUTO_TEST_CASE(parse_empty_tuple)
 
 BOOST_AUTO_TEST_SUITE_END()
 
+// Parsing directly from the row message, without a field_view array
+BOOST_AUTO_TEST_SUITE(parse_direct_)
+
+struct fixture
+{
+    std::vector<metadata> meta{
+        meta_builder().type(column_type::int_).nullable(false).build(),
+        meta_builder().type(column_type::float_).nullable(false).build(),
+    };
+
+    error_code do_parse_direct(resultset_encoding enc, span<const std::uint8_t> msg, s2& to)
+    {
+        row_field_reader reader(enc, msg, meta);
+        auto err = reader.start();
+        return err ? err : parse_direct(reader, to);
+    }
+
+    error_code do_parse_direct(span<const std::uint8_t> msg, t2& to)
+    {
+        row_field_reader reader(resultset_encoding::text, msg, meta);
+        auto err = reader.start();
+        return err ? err : parse_direct(reader, to);
+    }
+};
+
+BOOST_FIXTURE_TEST_CASE(success_text, fixture)
+{
+    auto msg = create_text_row_body(42, 4.5f);
+    s2 value;
+    auto err = do_parse_direct(resultset_encoding::text, msg, value);
+    BOOST_TEST(err == error_code());
+    BOOST_TEST(value.i == 42);
+    BOOST_TEST(value.f == 4.5f);
+}
+
+BOOST_FIXTURE_TEST_CASE(success_binary, fixture)
+{
+    // header, null bitmap, int32 42, float 4.5
+    const std::uint8_t msg[] = {0x00, 0x00, 0x2a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x90, 0x40};
+    s2 value;
+    auto err = do_parse_direct(resultset_encoding::binary, msg, value);
+    BOOST_TEST(err == error_code());
+    BOOST_TEST(value.i == 42);
+    BOOST_TEST(value.f == 4.5f);
+}
+
+BOOST_FIXTURE_TEST_CASE(success_tuple, fixture)
+{
+    auto msg = create_text_row_body(42, 4.5f);
+    t2 value;
+    auto err = do_parse_direct(msg, value);
+    BOOST_TEST(err == error_code());
+    BOOST_TEST(std::get<0>(value) == 42);
+    BOOST_TEST(std::get<1>(value) == 4.5f);
+}
+
+BOOST_FIXTURE_TEST_CASE(extra_fields, fixture)
+{
+    // Trailing fields are not parsed, but are still validated
+    meta.push_back(meta_builder().type(column_type::varchar).build());
+    auto msg = create_text_row_body(42, 4.5f, "abc");
+    t2 value;
+    auto err = do_parse_direct(msg, value);
+    BOOST_TEST(err == error_code());
+    BOOST_TEST(std::get<0>(value) == 42);
+    BOOST_TEST(std::get<1>(value) == 4.5f);
+}
+
+BOOST_FIXTURE_TEST_CASE(empty_tuple, fixture)
+{
+    auto msg = create_text_row_body(42, 4.5f);
+    row_field_reader reader(resultset_encoding::text, msg, meta);
+    BOOST_TEST_REQUIRE(reader.start() == error_code());
+    tempty value;
+    auto err = parse_direct(reader, value);
+    BOOST_TEST(err == error_code());
+}
+
+BOOST_FIXTURE_TEST_CASE(error_parsing, fixture)
+{
+    auto msg = create_text_row_body(nullptr, 4.5f);
+    t2 value;
+    auto err = do_parse_direct(msg, value);
+    BOOST_TEST(err == client_errc::static_row_parsing_error);
+}
+
+BOOST_FIXTURE_TEST_CASE(error_deserializing, fixture)
+{
+    auto msg = create_text_row_body(42, "abc");
+    t2 value;
+    auto err = do_parse_direct(msg, value);
+    BOOST_TEST(err == client_errc::protocol_value_error);
+}
+
+BOOST_FIXTURE_TEST_CASE(error_deserializing_extra_field, fixture)
+{
+    // Deserialization errors take precedence over parsing errors,
+    // even if they happen in fields that are not parsed
+    meta.push_back(meta_builder().type(column_type::int_).build());
+    auto msg = create_text_row_body(nullptr, 4.5f, "abc");
+    t2 value;
+    auto err = do_parse_direct(msg, value);
+    BOOST_TEST(err == client_errc::protocol_value_error);
+}
+
+BOOST_FIXTURE_TEST_CASE(error_extra_bytes, fixture)
+{
+    auto msg = create_text_row_body(42, 4.5f);
+    msg.push_back(0x01);
+    t2 value;
+    auto err = do_parse_direct(msg, value);
+    BOOST_TEST(err == client_errc::extra_bytes);
+}
+
+BOOST_FIXTURE_TEST_CASE(error_incomplete_message, fixture)
+{
+    auto msg = create_text_row_body(42);
+    t2 value;
+    auto err = do_parse_direct(msg, value);
+    BOOST_TEST(err == client_errc::incomplete_message);
+}
+
+BOOST_FIXTURE_TEST_CASE(error_null_bitmap_binary, fixture)
+{
+    const std::uint8_t msg[] = {0x00};
+    s2 value;
+    auto err = do_parse_direct(resultset_encoding::binary, msg, value);
+    BOOST_TEST(err == client_errc::incomplete_message);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
+
 BOOST_AUTO_TEST_SUITE_END()
 
 #endif
@@ -0,0 +1,309 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/date.hpp>
+#include <boost/mysql/datetime.hpp>
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/field_kind.hpp>
+#include <boost/mysql/field_view.hpp>
+#include <boost/mysql/metadata_mode.hpp>
+#include <boost/mysql/string_view.hpp>
+#include <boost/mysql/throw_on_error.hpp>
+
+#include <boost/mysql/detail/execution_processor/columnar_results_impl.hpp>
+#include <boost/mysql/detail/execution_processor/execution_processor.hpp>
+#include <boost/mysql/detail/resultset_encoding.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include <cstdint>
+#include <vector>
+
+#include "execution_processor_helpers.hpp"
+#include "test_common/create_basic.hpp"
+#include "test_common/printing.hpp"
+#include "test_unit/create_execution_processor.hpp"
+#include "test_unit/create_meta.hpp"
+#include "test_unit/create_ok.hpp"
+#include "test_unit/create_row_message.hpp"
+#include "test_unit/printing.hpp"
+
+using namespace boost::mysql;
+using namespace boost::mysql::test;
+using boost::mysql::detail::column_data;
+using boost::mysql::detail::columnar_results_impl;
+using boost::mysql::detail::output_ref;
+using boost::mysql::detail::resultset_encoding;
+
+namespace {
+
+BOOST_AUTO_TEST_SUITE(test_columnar_results_impl)
+
+// Collects a column's values as field_views, to ease comparisons
+std::vector<field_view> column_values(const column_data& col)
+{
+    std::vector<field_view> res;
+    for (std::size_t i = 0; i < col.num_rows; ++i)
+        res.push_back(col.at(i));
+    return res;
+}
+
+BOOST_AUTO_TEST_CASE(column_kind)
+{
+    struct
+    {
+        column_type type;
+        bool is_unsigned;
+        field_kind expected;
+    } test_cases[] = {
+        {column_type::tinyint,   false, field_kind::int64   },
+        {column_type::smallint,  true,  field_kind::uint64  },
+        {column_type::bigint,    false, field_kind::int64   },
+        {column_type::bigint,    true,  field_kind::uint64  },
+        {column_type::year,      true,  field_kind::uint64  },
+        {column_type::bit,       true,  field_kind::uint64  },
+        {column_type::float_,    false, field_kind::float_  },
+        {column_type::double_,   false, field_kind::double_ },
+        {column_type::decimal,   false, field_kind::string  },
+        {column_type::varchar,   false, field_kind::string  },
+        {column_type::json,      false, field_kind::string  },
+        {column_type::blob,      false, field_kind::blob    },
+        {column_type::geometry,  false, field_kind::blob    },
+        {column_type::unknown,   false, field_kind::blob    },
+        {column_type::date,      false, field_kind::date    },
+        {column_type::datetime,  false, field_kind::datetime},
+        {column_type::timestamp, false, field_kind::datetime},
+        {column_type::time,      false, field_kind::time    },
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        BOOST_TEST_CONTEXT(tc.type)
+        {
+            auto meta = meta_builder().type(tc.type).unsigned_flag(tc.is_unsigned).build();
+            BOOST_TEST(detail::column_kind(meta) == tc.expected);
+        }
+    }
+}
+
+struct fixture
+{
+    diagnostics diag;
+    std::vector<field_view> fields;
+    columnar_results_impl r;
+};
+
+BOOST_FIXTURE_TEST_CASE(one_resultset_data, fixture)
+{
+    // Initial. Check that we reset any previous state
+    exec_access(r)
+        .meta({column_type::geometry})
+        .row(makebv("\0\0"))
+        .ok(ok_builder().affected_rows(40).info("some_info").more_results(true).build());
+    r.reset(resultset_encoding::text, metadata_mode::minimal);
+    BOOST_TEST(r.is_reading_first());
+
+    // Meta
+    add_meta(r, create_meta_r1());
+    BOOST_TEST(r.is_reading_rows());
+
+    // Rows
+    auto r1 = create_text_row_body(42, "abc");
+    auto r2 = create_text_row_body(-1, "");
+    r.on_row_batch_start();
+    auto err = r.on_row(r1, output_ref(), fields);
+    throw_on_error(err, diag);
+    err = r.on_row(r2, output_ref(), fields);
+    throw_on_error(err, diag);
+
+    // End of resultset
+    err = r.on_row_ok_packet(create_ok_r1());
+    throw_on_error(err, diag);
+    r.on_row_batch_finish();
+
+    // Verify
+    BOOST_TEST(r.is_complete());
+    BOOST_TEST(r.num_resultsets() == 1u);
+    check_meta_r1(r.get_meta(0));
+    BOOST_TEST(r.get_affected_rows(0) == 1u);
+    BOOST_TEST(r.get_info(0) == "Information");
+    BOOST_TEST(r.get_num_rows(0) == 2u);
+
+    const auto& col0 = r.get_column(0, 0);
+    BOOST_TEST(col0.kind == field_kind::int64);
+    BOOST_TEST(col0.int64_values == (std::vector<std::int64_t>{42, -1}));
+    BOOST_TEST(col0.num_nulls == 0u);
+
+    const auto& col1 = r.get_column(0, 1);
+    BOOST_TEST(col1.kind == field_kind::string);
+    BOOST_TEST(col1.string_offsets == (std::vector<std::size_t>{0, 3, 3}));
+    BOOST_TEST(column_values(col1) == make_fv_vector("abc", ""));
+    BOOST_TEST(fields.empty());  // unused
+}
+
+BOOST_FIXTURE_TEST_CASE(nulls, fixture)
+{
+    // 10 rows, to check that the bitmap grows correctly
+    add_meta(r, create_meta_r3());
+    exec_access(r)
+        .row(1.0f, nullptr, 1)
+        .row(nullptr, 2.0, nullptr)
+        .row(3.0f, 3.0, 3)
+        .row(4.0f, 4.0, 4)
+        .row(5.0f, 5.0, 5)
+        .row(6.0f, 6.0, 6)
+        .row(7.0f, 7.0, 7)
+        .row(8.0f, 8.0, 8)
+        .row(nullptr, nullptr, nullptr)
+        .row(10.0f, 10.0, 10)
+        .ok(create_ok_r3());
+
+    BOOST_TEST(r.is_complete());
+    BOOST_TEST(r.get_num_rows(0) == 10u);
+
+    // float column
+    const auto& col0 = r.get_column(0, 0);
+    BOOST_TEST(col0.num_nulls == 2u);
+    BOOST_TEST(col0.null_bitmap == (std::vector<std::uint8_t>{0x02, 0x01}));
+    BOOST_TEST(col0.float_values.size() == 10u);
+    BOOST_TEST(col0.float_values[1] == 0.0f);  // NULLs hold a default value
+    BOOST_TEST(col0.float_values[9] == 10.0f);
+    BOOST_TEST(!col0.is_null(0));
+    BOOST_TEST(col0.is_null(1));
+    BOOST_TEST(col0.is_null(8));
+    BOOST_TEST(col0.at(1) == field_view());
+
+    // double column
+    const auto& col1 = r.get_column(0, 1);
+    BOOST_TEST(col1.num_nulls == 2u);
+    BOOST_TEST(col1.null_bitmap == (std::vector<std::uint8_t>{0x01, 0x01}));
+    BOOST_TEST(col1.double_values[1] == 2.0);
+
+    // int column
+    const auto& col2 = r.get_column(0, 2);
+    BOOST_TEST(col2.num_nulls == 2u);
+    BOOST_TEST(col2.null_bitmap == (std::vector<std::uint8_t>{0x02, 0x01}));
+    BOOST_TEST(
+        col2.int64_values == (std::vector<std::int64_t>{1, 0, 3, 4, 5, 6, 7, 8, 0, 10}),
+        boost::test_tools::per_element()
+    );
+}
+
+BOOST_FIXTURE_TEST_CASE(types, fixture)
+{
+    exec_access(r)
+        .meta({
+            meta_builder().type(column_type::bigint).unsigned_flag(true).build_coldef(),
+            meta_builder().type(column_type::date).build_coldef(),
+            meta_builder().type(column_type::datetime).build_coldef(),
+            meta_builder().type(column_type::time).build_coldef(),
+            meta_builder().type(column_type::blob).collation_id(63).build_coldef(),
+            meta_builder().type(column_type::text).build_coldef(),
+        })
+        .row(42u, "2020-01-02", "2021-03-04 05:06:07", "01:02:03", makebv("\0\1"), nullptr)
+        .row(nullptr, "2022-02-03", nullptr, "-01:00:00", makebv(""), "abc")
+        .ok(create_ok_r1());
+
+    BOOST_TEST(r.get_column(0, 0).uint64_values == (std::vector<std::uint64_t>{42u, 0u}));
+    BOOST_TEST(column_values(r.get_column(0, 1)) == make_fv_vector(date(2020, 1, 2), date(2022, 2, 3)));
+    BOOST_TEST(column_values(r.get_column(0, 2)) == make_fv_vector(datetime(2021, 3, 4, 5, 6, 7), nullptr));
+    BOOST_TEST(column_values(r.get_column(0, 3)) == make_fv_vector(maket(1, 2, 3), maket(-1, 0, 0)));
+    BOOST_TEST(column_values(r.get_column(0, 4)) == make_fv_vector(makebv("\0\1"), makebv("")));
+    BOOST_TEST(column_values(r.get_column(0, 5)) == make_fv_vector(nullptr, "abc"));
+}
+
+BOOST_FIXTURE_TEST_CASE(binary_protocol, fixture)
+{
+    exec_access(r).reset(resultset_encoding::binary).meta(create_meta_r1());
+
+    // null bitmap (2 bytes with offset), tinyint 42, varchar "abc"
+    const std::uint8_t row[] = {0x00, 0x00, 42, 0x03, 'a', 'b', 'c'};
+    r.on_row_batch_start();
+    auto err = r.on_row(row, output_ref(), fields);
+    throw_on_error(err, diag);
+    err = r.on_row_ok_packet(create_ok_r1());
+    throw_on_error(err, diag);
+    r.on_row_batch_finish();
+
+    BOOST_TEST(r.is_complete());
+    BOOST_TEST(column_values(r.get_column(0, 0)) == make_fv_vector(42));
+    BOOST_TEST(column_values(r.get_column(0, 1)) == make_fv_vector("abc"));
+}
+
+BOOST_FIXTURE_TEST_CASE(three_resultsets, fixture)
+{
+    exec_access(r)
+        .meta(create_meta_r1())
+        .row(42, "abc")
+        .row(50, "def")
+        .ok(create_ok_r1(true))
+        .ok(create_ok_r2(true))
+        .meta(create_meta_r3())
+        .row(4.2f, 5.0, 8)
+        .ok(create_ok_r3());
+
+    BOOST_TEST(r.is_complete());
+    BOOST_TEST(r.num_resultsets() == 3u);
+    check_meta_r1(r.get_meta(0));
+    check_meta_empty(r.get_meta(1));
+    check_meta_r3(r.get_meta(2));
+    BOOST_TEST(r.get_num_rows(0) == 2u);
+    BOOST_TEST(r.get_num_rows(1) == 0u);
+    BOOST_TEST(r.get_num_rows(2) == 1u);
+    BOOST_TEST(r.get_is_out_params(1) == true);
+    BOOST_TEST(r.get_info(2) == "");
+
+    // Columns are sliced correctly
+    BOOST_TEST(column_values(r.get_column(0, 0)) == make_fv_vector(42, 50));
+    BOOST_TEST(column_values(r.get_column(0, 1)) == make_fv_vector("abc", "def"));
+    BOOST_TEST(column_values(r.get_column(2, 0)) == make_fv_vector(4.2f));
+    BOOST_TEST(column_values(r.get_column(2, 1)) == make_fv_vector(5.0));
+    BOOST_TEST(column_values(r.get_column(2, 2)) == make_fv_vector(8));
+}
+
+BOOST_FIXTURE_TEST_CASE(strings_dont_point_into_message, fixture)
+{
+    add_meta(r, create_meta_r1());
+
+    auto r1 = create_text_row_body(42, "abc");
+    r.on_row_batch_start();
+    auto err = r.on_row(r1, output_ref(), fields);
+    throw_on_error(err, diag);
+    r1 = create_text_row_body(0, "xyz");  // overwrite the message
+    err = r.on_row_ok_packet(create_ok_r1());
+    throw_on_error(err, diag);
+    r.on_row_batch_finish();
+
+    BOOST_TEST(column_values(r.get_column(0, 1)) == make_fv_vector("abc"));
+}
+
+BOOST_FIXTURE_TEST_CASE(error_deserializing_row, fixture)
+{
+    add_meta(r, create_meta_r1());
+    auto bad_row = create_text_row_body(42, "abc");
+    bad_row.push_back(0xff);
+
+    r.on_row_batch_start();
+    auto err = r.on_row(bad_row, output_ref(), fields);
+    r.on_row_batch_finish();
+
+    BOOST_TEST(err == client_errc::extra_bytes);
+}
+
+BOOST_FIXTURE_TEST_CASE(error_kind_mismatch, fixture)
+{
+    column_data col;
+    col.kind = field_kind::int64;
+    BOOST_TEST(col.append(field_view("abc")) == client_errc::protocol_value_error);
+    BOOST_TEST(col.num_rows == 0u);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
+
+}  // namespace
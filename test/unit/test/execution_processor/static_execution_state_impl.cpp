@@ -501,6 +501,32 @@ BOOST_FIXTURE_TEST_CASE(error_parsing_row, fixture)
     BOOST_TEST(err == client_errc::static_row_parsing_error);
 }
 
+// Fields in the same order as in the row type are parsed directly from the message
+BOOST_FIXTURE_TEST_CASE(error_deserializing_row_direct, fixture)
+{
+    static_execution_state_impl<row1_tuple> stp;
+    auto& st = stp.get_interface();
+    add_meta(st, create_meta_r1());
+    auto bad_row = create_text_row_body(42, "abc");
+    bad_row.push_back(0xff);
+
+    row1_tuple storage[1]{};
+    auto err = st.on_row(bad_row, create_ref<row1_tuple>(span<row1_tuple>(storage), 0), fields);
+    BOOST_TEST(err == client_errc::extra_bytes);
+}
+
+BOOST_FIXTURE_TEST_CASE(error_parsing_row_direct, fixture)
+{
+    static_execution_state_impl<row1_tuple> stp;
+    auto& st = stp.get_interface();
+    add_meta(st, create_meta_r1());
+    auto bad_row = create_text_row_body(nullptr, "abc");  // should not be NULL
+
+    row1_tuple storage[1]{};
+    auto err = st.on_row(bad_row, create_ref<row1_tuple>(span<row1_tuple>(storage), 0), fields);
+    BOOST_TEST(err == client_errc::static_row_parsing_error);
+}
+
 BOOST_FIXTURE_TEST_CASE(error_type_index_mismatch, fixture)
 {
     static_execution_state_impl<row1, row2> stp;
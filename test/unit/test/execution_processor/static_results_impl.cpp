@@ -553,6 +553,20 @@ BOOST_FIXTURE_TEST_CASE(error_deserializing_row, fixture)
     BOOST_TEST(err == client_errc::extra_bytes);
 }
 
+// Fields in the same order as in the row type are parsed directly from the message
+BOOST_FIXTURE_TEST_CASE(error_deserializing_row_direct, fixture)
+{
+    static_results_impl<row1_tuple> rt;
+    auto& r = rt.get_interface();
+    add_meta(r, create_meta_r1());
+    auto bad_row = create_text_row_body(42, "abc");
+    bad_row.push_back(0xff);
+
+    auto err = r.on_row(bad_row, output_ref(), fields);
+
+    BOOST_TEST(err == client_errc::extra_bytes);
+}
+
 BOOST_FIXTURE_TEST_CASE(error_parsing_row, fixture)
 {
     static_results_impl<row1> rt;
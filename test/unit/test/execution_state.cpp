@@ -119,6 +119,17 @@ std::unique_ptr<execution_state> create_heap_state()
 }
 
 // Verify that the lifetime guarantees we make are correct
+BOOST_AUTO_TEST_CASE(cursor_fetch_size)
+{
+    execution_state st;
+    BOOST_TEST(st.cursor_fetch_size() == 0u);
+
+    // The setting survives resets
+    st.set_cursor_fetch_size(100);
+    get_iface(st).reset(detail::resultset_encoding::binary, metadata_mode::minimal);
+    BOOST_TEST(st.cursor_fetch_size() == 100u);
+}
+
 BOOST_AUTO_TEST_CASE(move_constructor)
 {
     // Having this in heap helps detect lifetime issues
@@ -12,6 +12,8 @@
 #include <boost/mysql/detail/access.hpp>
 #include <boost/mysql/detail/coldef_view.hpp>
 
+#include <utility>
+
 #include "test_common/printing.hpp"
 #include "test_unit/create_meta.hpp"
 
@@ -179,4 +181,66 @@ BOOST_AUTO_TEST_CASE(string_ownership)
     // TODO: the other strings
 }
 
+// Short strings are stored inline by std::string. Long ones aren't
+const detail::coldef_view short_coldef = meta_builder().database("db").table("t").name("c").build_coldef();
+const detail::coldef_view long_coldef = meta_builder()
+                                            .database("a_database_with_a_long_name")
+                                            .table("a_table_with_a_long_name")
+                                            .name("a_column_with_a_long_name")
+                                            .build_coldef();
+
+void check_strings(const metadata& meta, const detail::coldef_view& expected)
+{
+    BOOST_TEST(meta.database() == expected.database);
+    BOOST_TEST(meta.table() == expected.table);
+    BOOST_TEST(meta.original_table() == expected.org_table);
+    BOOST_TEST(meta.column_name() == expected.name);
+    BOOST_TEST(meta.original_column_name() == expected.org_name);
+}
+
+BOOST_AUTO_TEST_CASE(copy_move)
+{
+    for (const auto& coldef : {short_coldef, long_coldef})
+    {
+        BOOST_TEST_CONTEXT(coldef.name)
+        {
+            auto meta = detail::access::construct<metadata>(coldef, true);
+
+            // Copy construction
+            metadata copy{meta};
+            check_strings(copy, coldef);
+
+            // Move construction
+            metadata moved{std::move(copy)};
+            check_strings(moved, coldef);
+
+            // Copy assignment
+            metadata copy_assigned = detail::access::construct<metadata>(long_coldef, false);
+            copy_assigned = moved;
+            check_strings(copy_assigned, coldef);
+
+            // Move assignment
+            metadata move_assigned = detail::access::construct<metadata>(long_coldef, true);
+            move_assigned = std::move(copy_assigned);
+            check_strings(move_assigned, coldef);
+
+            // Self-assignment
+            const auto& ref = move_assigned;
+            move_assigned = ref;
+            check_strings(move_assigned, coldef);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(default_constructed)
+{
+    metadata meta;
+    BOOST_TEST(meta.database() == "");
+    BOOST_TEST(meta.column_name() == "");
+
+    metadata copy{meta};
+    BOOST_TEST(copy.database() == "");
+    BOOST_TEST(copy.original_column_name() == "");
+}
+
 BOOST_AUTO_TEST_SUITE_END()  // test_metadata
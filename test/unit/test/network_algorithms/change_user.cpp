@@ -0,0 +1,209 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/handshake_params.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/change_user.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include <cstdint>
+#include <vector>
+
+#include "test_common/assert_buffer_equals.hpp"
+#include "test_common/buffer_concat.hpp"
+#include "test_unit/create_channel.hpp"
+#include "test_unit/create_err.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/create_ok.hpp"
+#include "test_unit/create_ok_frame.hpp"
+#include "test_unit/create_statement.hpp"
+#include "test_unit/test_stream.hpp"
+#include "test_unit/unit_netfun_maker.hpp"
+
+using namespace boost::mysql::test;
+using namespace boost::mysql;
+using boost::mysql::detail::channel;
+
+BOOST_AUTO_TEST_SUITE(test_change_user)
+
+using netfun_maker = netfun_maker_fn<void, channel&, const handshake_params&>;
+
+struct
+{
+    netfun_maker::signature change_user;
+    const char* name;
+} all_fns[] = {
+    {netfun_maker::sync_errc(&detail::change_user_impl),           "sync" },
+    {netfun_maker::async_errinfo(&detail::async_change_user_impl), "async"},
+};
+
+// Values from the mysql_native_password auth tests, using "root" as password
+const std::vector<std::uint8_t> challenge{
+    0x79, 0x64, 0x3d, 0x12, 0x1d, 0x71, 0x74, 0x47, 0x5f, 0x48,
+    0x3e, 0x3e, 0x0b, 0x62, 0x0a, 0x03, 0x3d, 0x27, 0x3a, 0x4c,
+};
+const std::vector<std::uint8_t> auth_response{
+    0xf1, 0xb2, 0xfb, 0x1c, 0x8d, 0xe7, 0x5d, 0xb8, 0xeb, 0xa8,
+    0x12, 0x6a, 0xd1, 0x0f, 0xe9, 0xb1, 0x10, 0x50, 0xd4, 0x28,
+};
+
+// COM_CHANGE_USER with user "root", database "db", collation 33 and mysql_native_password
+const std::vector<std::uint8_t> expected_message = create_frame(
+    0,
+    buffer_builder()
+        .add({0x11, 0x72, 0x6f, 0x6f, 0x74, 0x00, 0x14})
+        .add(auth_response)
+        .add({0x64, 0x62, 0x00, 0x21, 0x00, 0x6d, 0x79, 0x73, 0x71, 0x6c, 0x5f, 0x6e, 0x61, 0x74,
+              0x69, 0x76, 0x65, 0x5f, 0x70, 0x61, 0x73, 0x73, 0x77, 0x6f, 0x72, 0x64, 0x00})
+        .build()
+);
+
+struct fixture
+{
+    channel chan{create_channel()};
+    handshake_params params{"root", "root", "db", 33};
+
+    fixture() { chan.set_auth_challenge("mysql_native_password", challenge); }
+
+    test_stream& stream() noexcept { return get_stream(chan); }
+};
+
+BOOST_AUTO_TEST_CASE(success)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().add_bytes(create_ok_frame(1, ok_builder().build()));
+
+            // Call the function
+            fns.change_user(fix.chan, fix.params).validate_no_error();
+
+            // Verify the message we sent
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_message);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(success_auth_switch)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.set_auth_challenge("caching_sha2_password", challenge);
+            auto auth_switch = buffer_builder()
+                                   .add({0xfe, 0x6d, 0x79, 0x73, 0x71, 0x6c, 0x5f, 0x6e, 0x61, 0x74, 0x69, 0x76,
+                                         0x65, 0x5f, 0x70, 0x61, 0x73, 0x73, 0x77, 0x6f, 0x72, 0x64, 0x00})
+                                   .add(challenge)
+                                   .add({0x00})
+                                   .build();
+            fix.stream()
+                .add_bytes(create_frame(1, auth_switch))
+                .add_bytes(create_ok_frame(3, ok_builder().build()));
+
+            // Call the function
+            fns.change_user(fix.chan, fix.params).validate_no_error();
+
+            // We sent the request, followed by the response to the auth switch
+            const auto& written = fix.stream().bytes_written();
+            auto switch_response = create_frame(2, auth_response);
+            BOOST_TEST_REQUIRE(written.size() > switch_response.size());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                boost::span<const std::uint8_t>(written).subspan(written.size() - switch_response.size()),
+                switch_response
+            );
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(statements_invalidated)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            auto stmt = statement_builder().id(1).session_id(fix.chan.session_id()).build();
+            fix.chan.stmt_cache().set_capacity(4);
+            fix.chan.stmt_cache().insert("SELECT 1", stmt);
+            fix.stream().add_bytes(create_ok_frame(1, ok_builder().build()));
+
+            // Changing the user deallocates prepared statements
+            fns.change_user(fix.chan, fix.params).validate_no_error();
+            BOOST_TEST(fix.chan.stmt_cache().empty());
+            BOOST_TEST(!fix.chan.is_current_session(stmt));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error_unknown_auth_plugin)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.set_auth_challenge("unknown_plugin", challenge);
+
+            // Call the function. Nothing is sent
+            fns.change_user(fix.chan, fix.params).validate_error_exact(client_errc::unknown_auth_plugin);
+            BOOST_TEST(fix.stream().bytes_written().size() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error_network)
+{
+    for (auto fns : all_fns)
+    {
+        for (int i = 0; i <= 1; ++i)
+        {
+            BOOST_TEST_CONTEXT(fns.name << " in network transfer " << i)
+            {
+                fixture fix;
+                fix.stream().set_fail_count(fail_count(i, common_server_errc::er_aborting_connection));
+
+                // Call the function
+                fns.change_user(fix.chan, fix.params)
+                    .validate_error_exact(common_server_errc::er_aborting_connection);
+            }
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error_response)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().add_bytes(
+                err_builder()
+                    .seqnum(1)
+                    .code(common_server_errc::er_access_denied_error)
+                    .message("Access denied")
+                    .build_frame()
+            );
+
+            // Call the function
+            fns.change_user(fix.chan, fix.params)
+                .validate_error_exact(common_server_errc::er_access_denied_error, "Access denied");
+        }
+    }
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -81,4 +81,57 @@ BOOST_AUTO_TEST_CASE(error_network)
     }
 }
 
+BOOST_AUTO_TEST_CASE(cached)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.stmt_cache().set_capacity(4);
+            fix.chan.stmt_cache().insert("SELECT 1", fix.stmt);
+
+            // Statements in the cache are kept open
+            fns.close_statement(fix.chan, fix.stmt).validate_no_error();
+            BOOST_TEST(fix.stream().bytes_written().size() == 0u);
+            BOOST_TEST(fix.chan.stmt_cache().contains(3));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(cached_cache_disabled)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.stmt_cache().set_capacity(4);
+            fix.chan.stmt_cache().insert("SELECT 1", fix.stmt);
+            fix.chan.stmt_cache().set_capacity(0);
+
+            // The statement is removed from the cache and closed
+            fns.close_statement(fix.chan, fix.stmt).validate_no_error();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_message);
+            BOOST_TEST(fix.chan.stmt_cache().empty());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(stale)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.end_session();
+
+            // The server already deallocated the statement, so nothing is sent
+            fns.close_statement(fix.chan, fix.stmt).validate_no_error();
+            BOOST_TEST(fix.stream().bytes_written().size() == 0u);
+        }
+    }
+}
+
 BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,384 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/deadline_params.hpp>
+#include <boost/mysql/statement.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/any_execution_request.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/deadline.hpp>
+#include <boost/mysql/impl/internal/protocol/db_flavor.hpp>
+
+#include <boost/asio/any_completion_handler.hpp>
+#include <boost/test/unit_test.hpp>
+
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "test_common/assert_buffer_equals.hpp"
+#include "test_common/netfun_helpers.hpp"
+#include "test_unit/create_channel.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/create_ok.hpp"
+#include "test_unit/create_ok_frame.hpp"
+#include "test_unit/create_statement.hpp"
+#include "test_unit/printing.hpp"
+#include "test_unit/test_stream.hpp"
+
+using namespace boost::mysql::test;
+using namespace boost::mysql;
+using boost::mysql::detail::any_execution_request;
+using boost::mysql::detail::channel;
+using boost::mysql::detail::db_flavor;
+using boost::mysql::detail::deadline_state;
+using boost::mysql::detail::make_deadline_state;
+using boost::mysql::detail::with_deadline;
+
+BOOST_AUTO_TEST_SUITE(test_deadline)
+
+//
+// MAX_EXECUTION_TIME hints
+//
+struct hint_fixture
+{
+    channel chan{create_channel()};
+    std::string storage;
+
+    hint_fixture() { chan.set_deadlines(deadline_params(std::chrono::seconds(2), true)); }
+
+    string_view add_hint(string_view query)
+    {
+        return detail::add_max_execution_time_hint(chan, query, storage);
+    }
+};
+
+BOOST_AUTO_TEST_CASE(hint_added)
+{
+    struct
+    {
+        string_view name;
+        string_view query;
+        string_view expected;
+    } test_cases[] = {
+        {"regular",    "SELECT 1",               "SELECT /*+ MAX_EXECUTION_TIME(2000) */ 1"        },
+        {"lowercase",  "select * from t",        "select /*+ MAX_EXECUTION_TIME(2000) */ * from t" },
+        {"whitespace", " \n\tSELECT\n1",         " \n\tSELECT /*+ MAX_EXECUTION_TIME(2000) */\n1"  },
+        {"only_kw",    "SELECT",                 "SELECT /*+ MAX_EXECUTION_TIME(2000) */"          },
+        {"parens",     "SELECT(1)",              "SELECT /*+ MAX_EXECUTION_TIME(2000) */(1)"       },
+        {"other_hint", "SELECT /*+ BKA(t) */ 1", "SELECT /*+ MAX_EXECUTION_TIME(2000) BKA(t) */ 1" },
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        BOOST_TEST_CONTEXT(tc.name)
+        {
+            hint_fixture fix;
+            BOOST_TEST(fix.add_hint(tc.query) == tc.expected);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(hint_not_added)
+{
+    struct
+    {
+        string_view name;
+        string_view query;
+    } test_cases[] = {
+        {"empty",          ""                                      },
+        {"whitespace",     "   "                                   },
+        {"update",         "UPDATE t SET f = 1"                    },
+        {"identifier",     "SELECTED"                              },
+        {"prefix",         "SELEC"                                 },
+        {"comment_first",  "/* comment */ SELECT 1"                },
+        {"existing_hint",  "SELECT /*+ MAX_EXECUTION_TIME(10) */ 1"},
+        {"existing_lower", "SELECT /*+ max_execution_time(10) */ 1"},
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        BOOST_TEST_CONTEXT(tc.name)
+        {
+            hint_fixture fix;
+            BOOST_TEST(fix.add_hint(tc.query) == tc.query);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(hint_disabled)
+{
+    // Hint not enabled
+    hint_fixture fix;
+    fix.chan.set_deadlines(deadline_params(std::chrono::seconds(2), false));
+    BOOST_TEST(fix.add_hint("SELECT 1") == "SELECT 1");
+
+    // No timeout
+    fix.chan.set_deadlines(deadline_params(std::chrono::seconds(0), true));
+    BOOST_TEST(fix.add_hint("SELECT 1") == "SELECT 1");
+
+    // MariaDB doesn't support the hint
+    fix.chan.set_deadlines(deadline_params(std::chrono::seconds(2), true));
+    fix.chan.set_flavor(db_flavor::mariadb);
+    BOOST_TEST(fix.add_hint("SELECT 1") == "SELECT 1");
+}
+
+BOOST_AUTO_TEST_CASE(hint_timeout_rounded_up)
+{
+    hint_fixture fix;
+    fix.chan.set_deadlines(deadline_params(std::chrono::microseconds(1500), true));
+    BOOST_TEST(fix.add_hint("SELECT 1") == "SELECT /*+ MAX_EXECUTION_TIME(2) */ 1");
+}
+
+BOOST_AUTO_TEST_CASE(hint_execution_request)
+{
+    // Queries get the hint
+    hint_fixture fix;
+    auto req = detail::add_max_execution_time_hint(fix.chan, any_execution_request("SELECT 1"), fix.storage);
+    BOOST_TEST_REQUIRE(req.is_query);
+    BOOST_TEST(req.data.query == "SELECT /*+ MAX_EXECUTION_TIME(2000) */ 1");
+
+    // Statements are left untouched
+    auto stmt = statement_builder().id(3).num_params(0).build();
+    req = detail::add_max_execution_time_hint(fix.chan, any_execution_request(stmt, {}), fix.storage);
+    BOOST_TEST_REQUIRE(!req.is_query);
+    BOOST_TEST(req.data.stmt.stmt.id() == 3u);
+}
+
+//
+// Deadline enforcement. The operation is simulated by an initiator that stores
+// the completion handler, and the deadline is expired by hand
+//
+using stored_handler = boost::asio::any_completion_handler<void(error_code, std::size_t)>;
+
+struct storing_initiator
+{
+    stored_handler* output;
+
+    template <class Handler>
+    void operator()(Handler&& handler)
+    {
+        *output = stored_handler(std::move(handler));
+    }
+};
+
+struct deadline_fixture
+{
+    channel chan{create_channel()};
+    channel kill_chan{create_channel()};
+    stored_handler handler;
+    std::shared_ptr<deadline_state> st;
+    error_code final_err;
+    std::size_t final_value{};
+    std::size_t num_calls{};
+
+    deadline_fixture()
+    {
+        chan.set_deadlines(deadline_params(std::chrono::hours(1)));
+        chan.set_connection_id(42);
+        chan.set_kill_channel(&kill_chan);
+    }
+
+    // Launches the simulated operation
+    void launch(bool can_kill = true)
+    {
+        st = make_deadline_state(chan, can_kill);
+        BOOST_TEST_REQUIRE(st != nullptr);
+        with_deadline<void(error_code, std::size_t)>(st, storing_initiator{&handler}
+        )([this](error_code ec, std::size_t value) {
+            final_err = ec;
+            final_value = value;
+            ++num_calls;
+        });
+        BOOST_TEST_REQUIRE(static_cast<bool>(handler));
+    }
+
+    // Makes the simulated operation complete
+    void complete_op(error_code ec, std::size_t value) { std::move(handler)(ec, value); }
+
+    void run() { run_until_completion(chan.get_executor()); }
+
+    test_stream& kill_stream() noexcept { return get_stream(kill_chan); }
+};
+
+std::vector<std::uint8_t> create_kill_frame(string_view query)
+{
+    std::vector<std::uint8_t> body{0x03};
+    body.insert(body.end(), query.begin(), query.end());
+    return create_frame(0, body);
+}
+
+BOOST_AUTO_TEST_CASE(no_deadline)
+{
+    // Without a timeout, no state is created and the operation runs directly
+    channel chan{create_channel()};
+    BOOST_TEST(make_deadline_state(chan, true) == nullptr);
+
+    stored_handler handler;
+    std::size_t num_calls = 0;
+    with_deadline<void(error_code, std::size_t)>(nullptr, storing_initiator{&handler}
+    )([&num_calls](error_code, std::size_t) { ++num_calls; });
+    std::move(handler)(error_code(), 0u);
+    BOOST_TEST(num_calls == 1u);
+}
+
+BOOST_AUTO_TEST_CASE(not_expired)
+{
+    deadline_fixture fix;
+    fix.launch();
+    fix.complete_op(error_code(), 10u);
+    fix.run();
+
+    BOOST_TEST(fix.num_calls == 1u);
+    BOOST_TEST(fix.final_err == error_code());
+    BOOST_TEST(fix.final_value == 10u);
+    BOOST_TEST(fix.kill_stream().bytes_written().empty());
+}
+
+BOOST_AUTO_TEST_CASE(not_expired_error)
+{
+    // Errors are passed through
+    deadline_fixture fix;
+    fix.launch();
+    fix.complete_op(client_errc::incomplete_message, 0u);
+    fix.run();
+
+    BOOST_TEST(fix.num_calls == 1u);
+    BOOST_TEST(fix.final_err == error_code(client_errc::incomplete_message));
+    BOOST_TEST(fix.kill_stream().bytes_written().empty());
+}
+
+BOOST_AUTO_TEST_CASE(expired_kill)
+{
+    deadline_fixture fix;
+    fix.kill_stream().add_bytes(create_ok_frame(1, ok_builder().build()));
+    fix.launch();
+
+    // Expire the deadline. This issues the KILL QUERY
+    fix.st->on_timer(error_code());
+    BOOST_TEST(fix.st->expired);
+    BOOST_TEST(fix.st->kill_in_progress);
+
+    // The server interrupts the query. We wait for KILL QUERY to complete
+    fix.complete_op(common_server_errc::er_query_interrupted, 0u);
+    BOOST_TEST(fix.num_calls == 0u);
+    fix.run();
+
+    BOOST_TEST(fix.num_calls == 1u);
+    BOOST_TEST(fix.final_err == error_code(client_errc::deadline_exceeded));
+    BOOST_TEST(!fix.st->kill_in_progress);
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.kill_stream().bytes_written(), create_kill_frame("KILL QUERY 42"));
+}
+
+BOOST_AUTO_TEST_CASE(expired_kill_finishes_first)
+{
+    deadline_fixture fix;
+    fix.kill_stream().add_bytes(create_ok_frame(1, ok_builder().build()));
+    fix.launch();
+
+    // Expire the deadline and let KILL QUERY complete
+    fix.st->on_timer(error_code());
+    get_context(fix.chan.get_executor()).restart();
+    get_context(fix.chan.get_executor()).poll();
+    BOOST_TEST(!fix.st->kill_in_progress);
+
+    // The operation finishes afterwards
+    fix.complete_op(common_server_errc::er_query_interrupted, 0u);
+    fix.run();
+
+    BOOST_TEST(fix.num_calls == 1u);
+    BOOST_TEST(fix.final_err == error_code(client_errc::deadline_exceeded));
+}
+
+BOOST_AUTO_TEST_CASE(expired_op_succeeds)
+{
+    // The operation completed successfully before KILL QUERY had any effect
+    deadline_fixture fix;
+    fix.kill_stream().add_bytes(create_ok_frame(1, ok_builder().build()));
+    fix.launch();
+    fix.st->on_timer(error_code());
+    fix.complete_op(error_code(), 5u);
+    fix.run();
+
+    BOOST_TEST(fix.num_calls == 1u);
+    BOOST_TEST(fix.final_err == error_code());
+    BOOST_TEST(fix.final_value == 5u);
+}
+
+BOOST_AUTO_TEST_CASE(expired_kill_error)
+{
+    // KILL QUERY fails. The main connection is closed
+    deadline_fixture fix;
+    fix.launch();
+    fix.st->on_timer(error_code());
+    fix.complete_op(boost::asio::error::operation_aborted, 0u);
+    fix.run();
+
+    BOOST_TEST(fix.num_calls == 1u);
+    BOOST_TEST(fix.final_err == error_code(client_errc::deadline_exceeded));
+}
+
+BOOST_AUTO_TEST_CASE(expired_no_kill_channel)
+{
+    // Without a kill connection, the stream is closed
+    deadline_fixture fix;
+    fix.chan.set_kill_channel(nullptr);
+    fix.launch();
+    fix.st->on_timer(error_code());
+    BOOST_TEST(fix.st->expired);
+    BOOST_TEST(!fix.st->kill_in_progress);
+    fix.complete_op(boost::asio::error::operation_aborted, 0u);
+    fix.run();
+
+    BOOST_TEST(fix.num_calls == 1u);
+    BOOST_TEST(fix.final_err == error_code(client_errc::deadline_exceeded));
+}
+
+BOOST_AUTO_TEST_CASE(expired_cant_kill)
+{
+    // Operations without a session (e.g. connect) and sessions without an ID are never killed
+    for (bool can_kill : {false, true})
+    {
+        BOOST_TEST_CONTEXT(can_kill)
+        {
+            deadline_fixture fix;
+            if (can_kill)
+                fix.chan.set_connection_id(0);
+            fix.launch(can_kill);
+            fix.st->on_timer(error_code());
+            BOOST_TEST(!fix.st->kill_in_progress);
+            fix.complete_op(boost::asio::error::operation_aborted, 0u);
+            fix.run();
+
+            BOOST_TEST(fix.final_err == error_code(client_errc::deadline_exceeded));
+            BOOST_TEST(fix.kill_stream().bytes_written().empty());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(timer_after_completion)
+{
+    // The timer fired, but the operation had already completed
+    deadline_fixture fix;
+    fix.launch();
+    fix.complete_op(error_code(), 0u);
+    fix.st->on_timer(error_code());
+    fix.run();
+
+    BOOST_TEST(!fix.st->expired);
+    BOOST_TEST(fix.final_err == error_code());
+    BOOST_TEST(fix.kill_stream().bytes_written().empty());
+}
+
+BOOST_AUTO_TEST_SUITE_END()
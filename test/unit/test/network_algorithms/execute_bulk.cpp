@@ -0,0 +1,381 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/bulk_execution_result.hpp>
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/field_view.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/network_algorithms.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/execute_bulk.hpp>
+#include <boost/mysql/impl/internal/protocol/capabilities.hpp>
+#include <boost/mysql/impl/internal/protocol/db_flavor.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include <cstdint>
+#include <tuple>
+#include <vector>
+
+#include "test_common/assert_buffer_equals.hpp"
+#include "test_common/buffer_concat.hpp"
+#include "test_common/create_basic.hpp"
+#include "test_unit/create_channel.hpp"
+#include "test_unit/create_coldef_frame.hpp"
+#include "test_unit/create_err.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/create_meta.hpp"
+#include "test_unit/create_ok.hpp"
+#include "test_unit/create_ok_frame.hpp"
+#include "test_unit/create_statement.hpp"
+#include "test_unit/printing.hpp"
+#include "test_unit/test_stream.hpp"
+#include "test_unit/unit_netfun_maker.hpp"
+
+using namespace boost::mysql::test;
+using namespace boost::mysql;
+using boost::mysql::detail::bulk_execution_request;
+using boost::mysql::detail::capabilities;
+using boost::mysql::detail::channel;
+using boost::mysql::detail::db_flavor;
+
+BOOST_AUTO_TEST_SUITE(test_execute_bulk)
+
+using netfun_maker = netfun_maker_fn<void, channel&, const bulk_execution_request&, bulk_execution_result&>;
+
+struct
+{
+    typename netfun_maker::signature execute_bulk;
+    const char* name;
+} all_fns[] = {
+    {netfun_maker::sync_errc(&detail::execute_bulk_impl),           "sync" },
+    {netfun_maker::async_errinfo(&detail::async_execute_bulk_impl), "async"}
+};
+
+struct fixture
+{
+    channel chan{create_channel()};
+    statement stmt{statement_builder().id(1).num_params(1).build()};
+    bulk_execution_result result;
+
+    fixture()
+    {
+        // Make sure that the fields are updated
+        result.affected_rows = 0xffff;
+        result.last_insert_id = 0xffff;
+        result.warning_count = 0xffff;
+    }
+
+    test_stream& stream() noexcept { return get_stream(chan); }
+
+    // As if we had connected to a MariaDB server supporting bulk operations
+    void enable_bulk()
+    {
+        chan.set_flavor(db_flavor::mariadb);
+        chan.set_mariadb_capabilities(capabilities(detail::MARIADB_CLIENT_STMT_BULK_OPERATIONS));
+    }
+};
+
+// COM_STMT_BULK_EXECUTE for statement 1, with one integer parameter and two rows: 42 and 43
+const std::vector<std::uint8_t> bulk_42_43{
+    0xfa, 0x01, 0x00, 0x00, 0x00, 0x80, 0x00, 0x08, 0x00, 0x00, 0x2a, 0x00, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x2b, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+};
+
+// COM_STMT_EXECUTE for statement 1 with param 42, sending types
+const std::vector<std::uint8_t> execute_42{
+    0x17, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01,
+    0x08, 0x00, 0x2a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+};
+
+// COM_STMT_EXECUTE for statement 1 with param 43, omitting types because they didn't change
+const std::vector<std::uint8_t> execute_43{
+    0x17, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00,
+    0x00, 0x2b, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+};
+
+BOOST_AUTO_TEST_CASE(bulk_success)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.enable_bulk();
+            fix.chan.param_types().update(1, make_fv_arr(42));
+            auto params = make_fv_vector(42, 43);
+            fix.stream().add_bytes(
+                create_ok_frame(1, ok_builder().affected_rows(2).last_insert_id(10).warnings(1).build())
+            );
+
+            // Call the function
+            fns.execute_bulk(fix.chan, bulk_execution_request{fix.stmt, params, 2}, fix.result)
+                .validate_no_error();
+
+            // A single message was written
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), create_frame(0, bulk_42_43));
+            BOOST_TEST(fix.result.affected_rows == 2u);
+            BOOST_TEST(fix.result.last_insert_id == 10u);
+            BOOST_TEST(fix.result.warning_count == 1u);
+
+            // The types bound by the server may have changed
+            BOOST_TEST(fix.chan.param_types().size() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(bulk_resultset)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.enable_bulk();
+            auto params = make_fv_vector(42, 43);
+            fix.stream()
+                .add_bytes(create_frame(1, {0x01}))  // 1 column
+                .add_bytes(create_coldef_frame(2, meta_builder().type(column_type::bigint).build_coldef()))
+                .add_bytes(create_frame(3, {0x00, 0x00, 0x2a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00}))
+                .add_bytes(create_frame(4, {0x00, 0x00, 0x2b, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00}))
+                .add_bytes(
+                    create_eof_frame(5, ok_builder().affected_rows(2).last_insert_id(10).warnings(1).build())
+                )
+                .add_bytes(create_ok_frame(1, ok_builder().build()));  // don't read any further
+
+            // Statements like INSERT ... RETURNING send a resultset. It's read entirely,
+            // so the connection can be used afterwards
+            fns.execute_bulk(fix.chan, bulk_execution_request{fix.stmt, params, 2}, fix.result)
+                .validate_no_error();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), create_frame(0, bulk_42_43));
+            BOOST_TEST(fix.result.affected_rows == 2u);
+            BOOST_TEST(fix.result.last_insert_id == 10u);
+            BOOST_TEST(fix.result.warning_count == 1u);
+            BOOST_TEST(fix.stream().num_unread_bytes() == create_ok_frame(1, ok_builder().build()).size());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(bulk_error)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.enable_bulk();
+            auto params = make_fv_vector(42, 43);
+            fix.stream().add_bytes(err_builder()
+                                       .seqnum(1)
+                                       .code(common_server_errc::er_dup_entry)
+                                       .message("Duplicate entry")
+                                       .build_frame());
+
+            // Call the function
+            fns.execute_bulk(fix.chan, bulk_execution_request{fix.stmt, params, 2}, fix.result)
+                .validate_error_exact(common_server_errc::er_dup_entry, "Duplicate entry");
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), create_frame(0, bulk_42_43));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(fallback_mysql)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            auto params = make_fv_vector(42, 43);
+            fix.stream()
+                .add_bytes(
+                    create_ok_frame(1, ok_builder().affected_rows(1).last_insert_id(10).warnings(1).build())
+                )
+                .add_bytes(
+                    create_ok_frame(1, ok_builder().affected_rows(1).last_insert_id(11).warnings(2).build())
+                );
+
+            // Call the function
+            fns.execute_bulk(fix.chan, bulk_execution_request{fix.stmt, params, 2}, fix.result)
+                .validate_no_error();
+
+            // One execution per row
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.stream().bytes_written(),
+                concat_copy(create_frame(0, execute_42), create_frame(0, execute_43))
+            );
+            BOOST_TEST(fix.result.affected_rows == 2u);
+            BOOST_TEST(fix.result.last_insert_id == 10u);
+            BOOST_TEST(fix.result.warning_count == 3u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(fallback_mixed_kinds)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.enable_bulk();
+            auto params = make_fv_vector(42, nullptr, string_view("abc"));
+            fix.stream()
+                .add_bytes(create_ok_frame(1, ok_builder().affected_rows(1).build()))
+                .add_bytes(create_ok_frame(1, ok_builder().affected_rows(1).build()))
+                .add_bytes(create_ok_frame(1, ok_builder().affected_rows(1).build()));
+
+            // The parameter has values with different types, so a single type
+            // can't be sent for it. The statement is executed once per row
+            fns.execute_bulk(fix.chan, bulk_execution_request{fix.stmt, params, 3}, fix.result)
+                .validate_no_error();
+            BOOST_TEST(fix.result.affected_rows == 3u);
+            BOOST_TEST(fix.stream().bytes_written().at(4) == 0x17);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(fallback_no_params)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.enable_bulk();
+            fix.stmt = statement_builder().id(1).num_params(0).build();
+            fix.stream()
+                .add_bytes(create_ok_frame(1, ok_builder().affected_rows(1).build()))
+                .add_bytes(create_ok_frame(1, ok_builder().affected_rows(1).build()));
+
+            // COM_STMT_BULK_EXECUTE requires parameters
+            fns.execute_bulk(fix.chan, bulk_execution_request{fix.stmt, {}, 2}, fix.result)
+                .validate_no_error();
+            BOOST_TEST(fix.result.affected_rows == 2u);
+            BOOST_TEST(fix.stream().bytes_written().at(4) == 0x17);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(fallback_error)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            auto params = make_fv_vector(42, 43, 44);
+            fix.stream()
+                .add_bytes(create_ok_frame(1, ok_builder().affected_rows(1).build()))
+                .add_bytes(err_builder()
+                               .seqnum(1)
+                               .code(common_server_errc::er_dup_entry)
+                               .message("Duplicate entry")
+                               .build_frame());
+
+            // Processing stops at the first error
+            fns.execute_bulk(fix.chan, bulk_execution_request{fix.stmt, params, 3}, fix.result)
+                .validate_error_exact(common_server_errc::er_dup_entry, "Duplicate entry");
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.stream().bytes_written(),
+                concat_copy(create_frame(0, execute_42), create_frame(0, execute_43))
+            );
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(wrong_num_params)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.enable_bulk();
+            auto params = make_fv_vector(42, 43, 44);
+
+            // Call the function
+            fns.execute_bulk(fix.chan, bulk_execution_request{fix.stmt, params, 2}, fix.result)
+                .validate_error_exact(client_errc::wrong_num_params);
+
+            // Nothing was written
+            BOOST_TEST(fix.stream().bytes_written().size() == 0u);
+        }
+    }
+}
+
+// Values sent by send_long_data can't be used, either by the bulk command or the fallback
+BOOST_AUTO_TEST_CASE(pending_long_data)
+{
+    for (const auto& fns : all_fns)
+    {
+        for (bool bulk : {false, true})
+        {
+            BOOST_TEST_CONTEXT(fns.name << ", bulk=" << bulk)
+            {
+                fixture fix;
+                if (bulk)
+                    fix.enable_bulk();
+                fix.chan.long_data().add(1, 1, 0);
+                auto params = make_fv_vector(42, 43);
+
+                // Call the function
+                fns.execute_bulk(fix.chan, bulk_execution_request{fix.stmt, params, 2}, fix.result)
+                    .validate_error_exact(client_errc::pending_long_data);
+
+                // Nothing was written, and the values are still pending
+                BOOST_TEST(fix.stream().bytes_written().size() == 0u);
+                BOOST_TEST(fix.chan.long_data().has_pending(1));
+            }
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(empty)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.enable_bulk();
+
+            // Call the function
+            fns.execute_bulk(fix.chan, bulk_execution_request{fix.stmt, {}, 0}, fix.result)
+                .validate_no_error();
+
+            // Nothing was written
+            BOOST_TEST(fix.stream().bytes_written().size() == 0u);
+            BOOST_TEST(fix.result.affected_rows == 0u);
+            BOOST_TEST(fix.result.last_insert_id == 0u);
+            BOOST_TEST(fix.result.warning_count == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(make_bulk_request_)
+{
+    channel chan{create_channel()};
+    auto stmt = statement_builder().id(1).num_params(2).build();
+    std::vector<std::tuple<int, string_view>> rows{
+        {1, "abc"},
+        {2, "def"},
+    };
+
+    auto req = detail::make_bulk_request(stmt, rows, chan);
+
+    BOOST_TEST(req.stmt.id() == 1u);
+    BOOST_TEST(req.num_rows == 2u);
+    std::vector<field_view> actual(req.params.begin(), req.params.end());
+    BOOST_TEST(actual == make_fv_vector(1, "abc", 2, "def"), boost::test_tools::per_element());
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,371 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/pipeline.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/resultset_encoding.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/execute_pipeline.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include <vector>
+
+#include "test_common/assert_buffer_equals.hpp"
+#include "test_common/buffer_concat.hpp"
+#include "test_common/check_meta.hpp"
+#include "test_unit/create_channel.hpp"
+#include "test_unit/create_coldef_frame.hpp"
+#include "test_unit/create_err.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/create_meta.hpp"
+#include "test_unit/create_ok.hpp"
+#include "test_unit/create_ok_frame.hpp"
+#include "test_unit/create_row_message.hpp"
+#include "test_unit/create_statement.hpp"
+#include "test_unit/printing.hpp"
+#include "test_unit/test_stream.hpp"
+#include "test_unit/unit_netfun_maker.hpp"
+
+using namespace boost::mysql::test;
+using namespace boost::mysql;
+using boost::mysql::detail::channel;
+using boost::mysql::detail::pipeline_request_impl;
+using boost::mysql::detail::pipeline_response_item;
+
+BOOST_AUTO_TEST_SUITE(test_execute_pipeline)
+
+using netfun_maker = netfun_maker_fn<
+    void,
+    channel&,
+    const pipeline_request_impl&,
+    std::vector<pipeline_response_item>&>;
+
+struct
+{
+    typename netfun_maker::signature execute_pipeline;
+    const char* name;
+} all_fns[] = {
+    {netfun_maker::sync_errc(&detail::execute_pipeline_impl),           "sync" },
+    {netfun_maker::async_errinfo(&detail::async_execute_pipeline_impl), "async"}
+};
+
+struct fixture
+{
+    channel chan{create_channel()};
+    pipeline_request req;
+    std::vector<pipeline_response_item> res;
+
+    test_stream& stream() noexcept { return get_stream(chan); }
+    const pipeline_request_impl& req_impl() const noexcept { return detail::access::get_impl(req); }
+};
+
+// The serialized form of SELECT 1 and SELECT 2 query requests
+constexpr std::uint8_t serialized_select_1[] = {0x03, 0x53, 0x45, 0x4c, 0x45, 0x43, 0x54, 0x20, 0x31};
+constexpr std::uint8_t serialized_select_2[] = {0x03, 0x53, 0x45, 0x4c, 0x45, 0x43, 0x54, 0x20, 0x32};
+
+BOOST_AUTO_TEST_CASE(request_serialization)
+{
+    pipeline_request req;
+    BOOST_TEST(req.size() == 0u);
+    BOOST_TEST(req.empty());
+
+    // Add a query and statements with the right and wrong number of params
+    auto stmt = statement_builder().id(1).num_params(1).build();
+    field_view params[] = {field_view(42)};
+    req.add("SELECT 1");
+    req.add(stmt.bind(42));
+    req.add(stmt.bind(std::begin(params), std::end(params)));
+    req.add(stmt.bind());
+    BOOST_TEST(req.size() == 4u);
+    BOOST_TEST(!req.empty());
+
+    // Check the stages
+    const auto& impl = detail::access::get_impl(req);
+    BOOST_TEST_REQUIRE(impl.stages.size() == 4u);
+    BOOST_TEST((impl.stages[0].encoding == detail::resultset_encoding::text));
+    BOOST_TEST(impl.stages[0].seqnum == 1u);
+    BOOST_TEST(impl.stages[0].err == error_code());
+    BOOST_TEST((impl.stages[1].encoding == detail::resultset_encoding::binary));
+    BOOST_TEST(impl.stages[1].seqnum == 1u);
+    BOOST_TEST(impl.stages[1].err == error_code());
+    BOOST_TEST(impl.stages[1].stmt_id == 1u);
+    BOOST_TEST((impl.stages[2].encoding == detail::resultset_encoding::binary));
+    BOOST_TEST(impl.stages[2].seqnum == 1u);
+    BOOST_TEST(impl.stages[2].err == error_code());
+    BOOST_TEST(impl.stages[2].stmt_id == 1u);
+    BOOST_TEST(impl.stages[3].err == error_code(client_errc::wrong_num_params));
+
+    // Check the serialized messages. Requests with errors are not serialized
+    const std::uint8_t serialized_exec[] = {
+        0x17, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00,
+        0x01, 0x08, 0x00, 0x2a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    };
+    auto expected = buffer_builder()
+                        .add(create_frame(0, serialized_select_1))
+                        .add(create_frame(0, serialized_exec))
+                        .add(create_frame(0, serialized_exec))
+                        .build();
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(impl.buffer, expected);
+
+    // Clearing works
+    req.clear();
+    BOOST_TEST(req.size() == 0u);
+    BOOST_TEST(impl.buffer.empty());
+}
+
+BOOST_AUTO_TEST_CASE(success)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.req.add("SELECT 1");
+            fix.req.add("SELECT 2");
+            fix.stream()
+                .add_bytes(create_frame(1, {0x01}))  // 1 column
+                .add_bytes(create_coldef_frame(2, meta_builder().type(column_type::bigint).build_coldef()))
+                .add_bytes(create_text_row_message(3, 42))
+                .add_bytes(create_eof_frame(4, ok_builder().affected_rows(10u).info("1st").build()))
+                .add_bytes(create_ok_frame(1, ok_builder().affected_rows(20u).info("2nd").build()));
+
+            // Call the function
+            fns.execute_pipeline(fix.chan, fix.req_impl(), fix.res).validate_no_error();
+
+            // We've written both requests at once
+            auto expected_msg = buffer_builder()
+                                    .add(create_frame(0, serialized_select_1))
+                                    .add(create_frame(0, serialized_select_2))
+                                    .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+
+            // We've read both responses
+            BOOST_TEST_REQUIRE(fix.res.size() == 2u);
+            BOOST_TEST(fix.res[0].err == error_code());
+            BOOST_TEST(fix.res[0].result.has_value());
+            check_meta(fix.res[0].result.meta(), {column_type::bigint});
+            BOOST_TEST(fix.res[0].result.rows().size() == 1u);
+            BOOST_TEST(fix.res[0].result.rows().at(0).at(0) == field_view(42));
+            BOOST_TEST(fix.res[0].result.affected_rows() == 10u);
+            BOOST_TEST(fix.res[0].result.info() == "1st");
+            BOOST_TEST(fix.res[1].err == error_code());
+            BOOST_TEST(fix.res[1].result.has_value());
+            BOOST_TEST(fix.res[1].result.affected_rows() == 20u);
+            BOOST_TEST(fix.res[1].result.info() == "2nd");
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(empty_pipeline)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.res.resize(3);  // previous contents are discarded
+
+            // Call the function
+            fns.execute_pipeline(fix.chan, fix.req_impl(), fix.res).validate_no_error();
+
+            // Nothing was written
+            BOOST_TEST(fix.stream().bytes_written().size() == 0u);
+            BOOST_TEST(fix.res.size() == 0u);
+        }
+    }
+}
+
+// Server errors don't prevent subsequent requests from being processed
+BOOST_AUTO_TEST_CASE(error_server)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.req.add("SELECT 1");
+            fix.req.add("SELECT 2");
+            fix.req.add("SELECT 1");
+            fix.stream()
+                .add_bytes(create_ok_frame(1, ok_builder().affected_rows(10u).build()))
+                .add_bytes(
+                    err_builder()
+                        .seqnum(1)
+                        .code(common_server_errc::er_bad_db_error)
+                        .message("my_message")
+                        .build_frame()
+                )
+                .add_bytes(create_ok_frame(1, ok_builder().affected_rows(30u).build()));
+
+            // Call the function
+            fns.execute_pipeline(fix.chan, fix.req_impl(), fix.res).validate_no_error();
+
+            // Check results
+            BOOST_TEST_REQUIRE(fix.res.size() == 3u);
+            BOOST_TEST(fix.res[0].err == error_code());
+            BOOST_TEST(fix.res[0].result.affected_rows() == 10u);
+            BOOST_TEST(fix.res[1].err == error_code(common_server_errc::er_bad_db_error));
+            BOOST_TEST(fix.res[1].diag.server_message() == "my_message");
+            BOOST_TEST(fix.res[2].err == error_code());
+            BOOST_TEST(fix.res[2].diag.server_message() == "");
+            BOOST_TEST(fix.res[2].result.affected_rows() == 30u);
+        }
+    }
+}
+
+// Requests with client errors are not sent
+BOOST_AUTO_TEST_CASE(error_client)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            auto stmt = statement_builder().id(1).num_params(2).build();
+            fix.req.add(stmt.bind(42));
+            fix.req.add("SELECT 1");
+            fix.stream().add_bytes(create_ok_frame(1, ok_builder().affected_rows(10u).build()));
+
+            // Call the function
+            fns.execute_pipeline(fix.chan, fix.req_impl(), fix.res).validate_no_error();
+
+            // Only the valid request was written
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.stream().bytes_written(),
+                create_frame(0, serialized_select_1)
+            );
+
+            // Check results
+            BOOST_TEST_REQUIRE(fix.res.size() == 2u);
+            BOOST_TEST(fix.res[0].err == error_code(client_errc::wrong_num_params));
+            BOOST_TEST(!fix.res[0].result.has_value());
+            BOOST_TEST(fix.res[1].err == error_code());
+            BOOST_TEST(fix.res[1].result.affected_rows() == 10u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error_client_all_requests)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            auto stmt = statement_builder().id(1).num_params(2).build();
+            fix.req.add(stmt.bind(42));
+
+            // Call the function
+            fns.execute_pipeline(fix.chan, fix.req_impl(), fix.res).validate_no_error();
+
+            // Nothing was written
+            BOOST_TEST(fix.stream().bytes_written().size() == 0u);
+            BOOST_TEST_REQUIRE(fix.res.size() == 1u);
+            BOOST_TEST(fix.res[0].err == error_code(client_errc::wrong_num_params));
+        }
+    }
+}
+
+// Pipelines can't use values sent by send_long_data, so nothing is sent
+BOOST_AUTO_TEST_CASE(error_pending_long_data)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            auto stmt = statement_builder().id(1).num_params(1).build();
+            fix.req.add("SELECT 1");
+            fix.req.add(stmt.bind(42));
+            fix.req.add(stmt.bind());
+            fix.chan.long_data().add(1, 1, 0);
+
+            // Call the function
+            fns.execute_pipeline(fix.chan, fix.req_impl(), fix.res)
+                .validate_error_exact(client_errc::pending_long_data);
+
+            // Nothing was written. Client errors detected when adding the requests are kept
+            BOOST_TEST(fix.stream().bytes_written().size() == 0u);
+            BOOST_TEST_REQUIRE(fix.res.size() == 3u);
+            BOOST_TEST(fix.res[0].err == error_code(client_errc::pending_long_data));
+            BOOST_TEST(fix.res[1].err == error_code(client_errc::pending_long_data));
+            BOOST_TEST(fix.res[2].err == error_code(client_errc::wrong_num_params));
+        }
+    }
+}
+
+// Network errors are fatal. Tests errors on write, and reading each response
+BOOST_AUTO_TEST_CASE(error_network)
+{
+    const error_code expected_err = make_error_code(std::errc::io_error);
+
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            for (std::size_t i = 1; i <= 3; ++i)
+            {
+                BOOST_TEST_CONTEXT("i=" << i)
+                {
+                    fixture fix;
+                    fix.req.add("SELECT 1");
+                    fix.req.add("SELECT 2");
+                    fix.stream()
+                        .add_bytes(create_ok_frame(1, ok_builder().build()))
+                        .add_break()
+                        .add_bytes(create_ok_frame(1, ok_builder().build()))
+                        .set_fail_count(fail_count(i, expected_err));
+
+                    // Call the function
+                    fns.execute_pipeline(fix.chan, fix.req_impl(), fix.res)
+                        .validate_error_exact(expected_err);
+
+                    // Requests that didn't complete report the error
+                    BOOST_TEST_REQUIRE(fix.res.size() == 2u);
+                    BOOST_TEST(fix.res[0].err == (i == 3 ? error_code() : expected_err));
+                    BOOST_TEST(fix.res[1].err == expected_err);
+                }
+            }
+        }
+    }
+}
+
+// Protocol errors are also fatal
+BOOST_AUTO_TEST_CASE(error_protocol)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.req.add("SELECT 1");
+            fix.req.add("SELECT 2");
+            fix.req.add("SELECT 1");
+            fix.stream()
+                .add_bytes(create_ok_frame(1, ok_builder().build()))
+                .add_bytes(create_ok_frame(2, ok_builder().build()));  // bad sequence number
+
+            // Call the function
+            fns.execute_pipeline(fix.chan, fix.req_impl(), fix.res)
+                .validate_error_exact(client_errc::sequence_number_mismatch);
+
+            // Check results
+            BOOST_TEST_REQUIRE(fix.res.size() == 3u);
+            BOOST_TEST(fix.res[0].err == error_code());
+            BOOST_TEST(fix.res[1].err == error_code(client_errc::sequence_number_mismatch));
+            BOOST_TEST(fix.res[2].err == error_code(client_errc::sequence_number_mismatch));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,510 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/load_data_source.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+#include <boost/mysql/detail/execution_processor/execution_processor.hpp>
+#include <boost/mysql/detail/resultset_encoding.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/load_data_local.hpp>
+#include <boost/mysql/impl/internal/protocol/capabilities.hpp>
+
+#include <boost/asio/buffer.hpp>
+#include <boost/system/errc.hpp>
+#include <boost/test/unit_test.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <vector>
+
+#include "test_common/assert_buffer_equals.hpp"
+#include "test_common/buffer_concat.hpp"
+#include "test_common/check_meta.hpp"
+#include "test_unit/create_channel.hpp"
+#include "test_unit/create_coldef_frame.hpp"
+#include "test_unit/create_err.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/create_meta.hpp"
+#include "test_unit/create_ok.hpp"
+#include "test_unit/create_ok_frame.hpp"
+#include "test_unit/create_row_message.hpp"
+#include "test_unit/mock_execution_processor.hpp"
+#include "test_unit/printing.hpp"
+#include "test_unit/test_stream.hpp"
+#include "test_unit/unit_netfun_maker.hpp"
+
+using namespace boost::mysql::test;
+using namespace boost::mysql;
+using boost::asio::mutable_buffer;
+using boost::mysql::detail::channel;
+using boost::mysql::detail::execution_processor;
+using boost::mysql::detail::resultset_encoding;
+
+BOOST_AUTO_TEST_SUITE(test_load_data_local)
+
+void load_data_local_sync(
+    channel& chan,
+    string_view query,
+    load_data_source& source,
+    execution_processor& proc,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    detail::load_data_local_impl(chan, query, *detail::access::get_impl(source), proc, err, diag);
+}
+
+void load_data_local_async(
+    channel& chan,
+    string_view query,
+    load_data_source& source,
+    execution_processor& proc,
+    diagnostics& diag,
+    as_network_result<void>&& token
+)
+{
+    detail::async_load_data_local_impl(
+        chan,
+        query,
+        std::move(detail::access::get_impl(source)),
+        proc,
+        diag,
+        std::move(token)
+    );
+}
+
+using netfun_maker = netfun_maker_fn<void, channel&, string_view, load_data_source&, execution_processor&>;
+
+struct
+{
+    typename netfun_maker::signature load_data_local;
+    const char* name;
+} all_fns[] = {
+    {netfun_maker::sync_errc(&load_data_local_sync),      "sync" },
+    {netfun_maker::async_errinfo(&load_data_local_async), "async"},
+};
+
+struct fixture
+{
+    mock_execution_processor proc;
+    channel chan{create_channel()};
+
+    fixture() { chan.set_current_capabilities(detail::capabilities(detail::CLIENT_LOCAL_FILES)); }
+
+    test_stream& stream() noexcept { return get_stream(chan); }
+};
+
+// The query we use in the tests, and its serialized form
+constexpr const char* query = "LOAD";
+constexpr std::uint8_t serialized_query[] = {0x03, 0x4c, 0x4f, 0x41, 0x44};
+
+// A request from the server to send the contents of "f.csv"
+std::vector<std::uint8_t> create_infile_request_frame(std::uint8_t seqnum)
+{
+    return create_frame(seqnum, {0xfb, 0x66, 0x2e, 0x63, 0x73, 0x76});
+}
+
+// A callback source that returns the given chunks, in order, and then signals EOF
+struct chunks_callback
+{
+    std::vector<std::vector<std::uint8_t>> chunks;
+    std::size_t index;
+
+    chunks_callback(std::vector<std::vector<std::uint8_t>> chunks = {}) : chunks(std::move(chunks)), index(0)
+    {
+    }
+
+    std::size_t operator()(mutable_buffer buff, error_code&)
+    {
+        if (index == chunks.size())
+            return 0;
+        const auto& chunk = chunks[index++];
+        BOOST_TEST_REQUIRE(buff.size() >= chunk.size());
+        if (!chunk.empty())
+            std::memcpy(buff.data(), chunk.data(), chunk.size());
+        return chunk.size();
+    }
+};
+
+BOOST_AUTO_TEST_CASE(success_callback)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_infile_request_frame(1))
+                .add_bytes(create_ok_frame(5, ok_builder().affected_rows(2u).info("Records: 2").build()));
+            auto source = load_data_source::from_callback(
+                chunks_callback{
+                    {{0x61, 0x62, 0x63}, {0x64, 0x65}}
+            }
+            );
+
+            // Call the function
+            fns.load_data_local(fix.chan, query, source, fix.proc).validate_no_error();
+
+            // We've written the query, the chunks and an empty message to signal EOF
+            auto expected_msg = buffer_builder()
+                                    .add(create_frame(0, serialized_query))
+                                    .add(create_frame(2, {0x61, 0x62, 0x63}))
+                                    .add(create_frame(3, {0x64, 0x65}))
+                                    .add(create_empty_frame(4))
+                                    .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+
+            // We've read the response into the processor
+            fix.proc.num_calls().reset(1).on_head_ok_packet(1).validate();
+            BOOST_TEST(fix.proc.encoding() == resultset_encoding::text);
+            BOOST_TEST(fix.proc.affected_rows() == 2u);
+            BOOST_TEST(fix.proc.info() == "Records: 2");
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(success_stream)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_infile_request_frame(1))
+                .add_bytes(create_ok_frame(5, ok_builder().affected_rows(2u).build()));
+            test_stream source_stream;
+            source_stream.add_bytes(std::vector<std::uint8_t>{0x61, 0x62, 0x63, 0x64, 0x65}).add_break(3);
+            auto source = load_data_source::from_stream(source_stream);
+
+            // Call the function
+            fns.load_data_local(fix.chan, query, source, fix.proc).validate_no_error();
+
+            // Each read generates a message. The stream's EOF generates the final empty message
+            auto expected_msg = buffer_builder()
+                                    .add(create_frame(0, serialized_query))
+                                    .add(create_frame(2, {0x61, 0x62, 0x63}))
+                                    .add(create_frame(3, {0x64, 0x65}))
+                                    .add(create_empty_frame(4))
+                                    .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+            fix.proc.num_calls().reset(1).on_head_ok_packet(1).validate();
+            BOOST_TEST(fix.proc.affected_rows() == 2u);
+            BOOST_TEST(source_stream.num_unread_bytes() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(empty_source)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_infile_request_frame(1))
+                .add_bytes(create_ok_frame(3, ok_builder().build()));
+            auto source = load_data_source::from_callback(chunks_callback());
+
+            // Call the function
+            fns.load_data_local(fix.chan, query, source, fix.proc).validate_no_error();
+
+            // Only the empty message is sent
+            auto expected_msg = buffer_builder()
+                                    .add(create_frame(0, serialized_query))
+                                    .add(create_empty_frame(2))
+                                    .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+            fix.proc.num_calls().reset(1).on_head_ok_packet(1).validate();
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(chunks_use_all_buffer_space)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_infile_request_frame(1))
+                .add_bytes(create_ok_frame(5, ok_builder().build()));
+            fix.stream().set_write_break_size(0x100000);
+
+            // Fills all the space it's offered the first time
+            std::size_t num_calls = 0;
+            auto source = load_data_source::from_callback(
+                [&num_calls](mutable_buffer buff, error_code&) -> std::size_t {
+                    ++num_calls;
+                    if (num_calls == 1)
+                    {
+                        std::memset(buff.data(), 0x61, buff.size());
+                        return buff.size();
+                    }
+                    return num_calls == 2 ? 1 : 0;
+                }
+            );
+
+            // Call the function
+            fns.load_data_local(fix.chan, query, source, fix.proc).validate_no_error();
+
+            // Check the written messages
+            std::vector<std::uint8_t> big_chunk(detail::local_infile_chunk_size, 0x61);
+            auto expected_msg = buffer_builder()
+                                    .add(create_frame(0, serialized_query))
+                                    .add(create_frame(2, big_chunk))
+                                    .add(create_frame(3, {0x61}))
+                                    .add(create_empty_frame(4))
+                                    .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+            BOOST_TEST(num_calls == 3u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(source_error)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_infile_request_frame(1))
+                .add_bytes(create_ok_frame(4, ok_builder().affected_rows(1u).build()));
+            std::size_t num_calls = 0;
+            auto source = load_data_source::from_callback(
+                [&num_calls](mutable_buffer buff, error_code& ec) -> std::size_t {
+                    if (num_calls++ == 0)
+                    {
+                        std::memset(buff.data(), 0x61, 2);
+                        return 2;
+                    }
+                    ec = client_errc::wrong_num_params;
+                    return 0;
+                }
+            );
+
+            // The source error is reported
+            fns.load_data_local(fix.chan, query, source, fix.proc)
+                .validate_error_exact(client_errc::wrong_num_params);
+
+            // We terminated the transfer and read the server response, so the connection is usable
+            auto expected_msg = buffer_builder()
+                                    .add(create_frame(0, serialized_query))
+                                    .add(create_frame(2, {0x61, 0x61}))
+                                    .add(create_empty_frame(3))
+                                    .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+            BOOST_TEST(fix.stream().num_unread_bytes() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(source_error_server_error)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_infile_request_frame(1))
+                .add_bytes(
+                    err_builder()
+                        .seqnum(3)
+                        .code(common_server_errc::er_bad_null_error)
+                        .message("Bad null")
+                        .build_frame()
+                );
+            auto source = load_data_source::from_callback([](mutable_buffer, error_code& ec) {
+                ec = client_errc::wrong_num_params;
+                return std::size_t(0);
+            });
+
+            // The server error takes precedence
+            fns.load_data_local(fix.chan, query, source, fix.proc)
+                .validate_error_exact(common_server_errc::er_bad_null_error, "Bad null");
+            BOOST_TEST(fix.stream().num_unread_bytes() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(source_error_network_error)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_infile_request_frame(1))
+                .set_fail_count(fail_count(4, common_server_errc::er_aborting_connection));
+            auto source = load_data_source::from_callback([](mutable_buffer, error_code& ec) {
+                ec = client_errc::wrong_num_params;
+                return std::size_t(0);
+            });
+
+            // Reading the server response fails. The network error is reported,
+            // since the connection can't be used anymore
+            fns.load_data_local(fix.chan, query, source, fix.proc)
+                .validate_error_exact(common_server_errc::er_aborting_connection);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(file_not_found)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_infile_request_frame(1))
+                .add_bytes(create_ok_frame(3, ok_builder().build()));
+            auto source = load_data_source::from_file("/this/file/does/not/exist.csv");
+
+            // The error is reported after terminating the transfer
+            fns.load_data_local(fix.chan, query, source, fix.proc)
+                .validate_error_exact(
+                    boost::system::errc::make_error_code(boost::system::errc::no_such_file_or_directory)
+                );
+            auto expected_msg = buffer_builder()
+                                    .add(create_frame(0, serialized_query))
+                                    .add(create_empty_frame(2))
+                                    .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(server_error_after_transfer)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_infile_request_frame(1))
+                .add_bytes(
+                    err_builder()
+                        .seqnum(4)
+                        .code(common_server_errc::er_bad_null_error)
+                        .message("Bad null")
+                        .build_frame()
+                );
+            auto source = load_data_source::from_callback(chunks_callback{{{0x61}}});
+
+            // Call the function
+            fns.load_data_local(fix.chan, query, source, fix.proc)
+                .validate_error_exact(common_server_errc::er_bad_null_error, "Bad null");
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(server_error_no_transfer)
+{
+    // e.g. local_infile is disabled in the server
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().add_bytes(
+                err_builder()
+                    .seqnum(1)
+                    .code(common_server_errc::er_not_allowed_command)
+                    .message("abc")
+                    .build_frame()
+            );
+            auto source = load_data_source::from_callback(chunks_callback{{{0x61}}});
+
+            // Call the function
+            fns.load_data_local(fix.chan, query, source, fix.proc)
+                .validate_error_exact(common_server_errc::er_not_allowed_command, "abc");
+
+            // The source wasn't read
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), create_frame(0, serialized_query));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(no_transfer_resultset)
+{
+    // The query is not a LOAD DATA statement. Behaves like execute
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_frame(1, {0x01}))  // 1 column
+                .add_bytes(create_coldef_frame(2, meta_builder().type(column_type::bigint).build_coldef()))
+                .add_bytes(create_text_row_message(3, 42))
+                .add_bytes(create_eof_frame(4, ok_builder().info("1st").build()));
+            auto source = load_data_source::from_callback(chunks_callback{{{0x61}}});
+
+            // Call the function
+            fns.load_data_local(fix.chan, query, source, fix.proc).validate_no_error();
+
+            // Check
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), create_frame(0, serialized_query));
+            fix.proc.num_calls()
+                .reset(1)
+                .on_num_meta(1)
+                .on_meta(1)
+                .on_row_batch_start(1)
+                .on_row(1)
+                .on_row_batch_finish(1)
+                .on_row_ok_packet(1)
+                .validate();
+            check_meta(fix.proc.meta(), {column_type::bigint});
+            BOOST_TEST(fix.proc.info() == "1st");
+        }
+    }
+}
+
+// Error writing the query, reading the infile request, writing data and reading the final response
+BOOST_AUTO_TEST_CASE(error_network_error)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            for (std::size_t i = 0; i <= 3; ++i)
+            {
+                BOOST_TEST_CONTEXT("i=" << i)
+                {
+                    fixture fix;
+                    fix.stream()
+                        .add_bytes(create_infile_request_frame(1))
+                        .add_break()
+                        .add_bytes(create_ok_frame(4, ok_builder().build()))
+                        .set_fail_count(fail_count(i, client_errc::wrong_num_params));
+                    auto source = load_data_source::from_callback(chunks_callback{{{0x61}}});
+
+                    // Call the function
+                    fns.load_data_local(fix.chan, query, source, fix.proc)
+                        .validate_error_exact(client_errc::wrong_num_params);
+                }
+            }
+        }
+    }
+}
+
+BOOST_AUTO_TEST_SUITE_END()
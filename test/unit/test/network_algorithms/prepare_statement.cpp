@@ -0,0 +1,373 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/diagnostics.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/statement.hpp>
+#include <boost/mysql/string_view.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/prepare_statement.hpp>
+#include <boost/mysql/impl/internal/protocol/capabilities.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include <cstdint>
+#include <vector>
+
+#include "test_common/assert_buffer_equals.hpp"
+#include "test_common/buffer_concat.hpp"
+#include "test_unit/create_channel.hpp"
+#include "test_unit/create_coldef_frame.hpp"
+#include "test_unit/create_err.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/create_meta.hpp"
+#include "test_unit/create_statement.hpp"
+#include "test_unit/test_stream.hpp"
+#include "test_unit/unit_netfun_maker.hpp"
+
+using namespace boost::mysql::test;
+using namespace boost::mysql;
+using boost::mysql::detail::channel;
+
+BOOST_AUTO_TEST_SUITE(test_prepare_statement)
+
+using netfun_maker = netfun_maker_fn<statement, channel&, string_view>;
+
+struct
+{
+    netfun_maker::signature prepare_statement;
+    const char* name;
+} all_fns[] = {
+    {netfun_maker::sync_errc(&detail::prepare_statement_impl),           "sync" },
+    {netfun_maker::async_errinfo(&detail::async_prepare_statement_impl), "async"},
+};
+
+// A COM_STMT_PREPARE_OK response for a statement without params or columns
+std::vector<std::uint8_t> create_prepare_ok_frame(std::uint8_t seqnum, std::uint8_t stmt_id)
+{
+    return create_frame(seqnum, {0x00, stmt_id, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00});
+}
+
+// COM_STMT_PREPARE for "SELECT <digit>"
+std::vector<std::uint8_t> create_prepare_select(char digit)
+{
+    return {0x09, 0x00, 0x00, 0x00, 0x16, 0x53, 0x45, 0x4c, 0x45, 0x43, 0x54, 0x20,
+            static_cast<std::uint8_t>(digit)};
+}
+
+const std::vector<std::uint8_t> close_stmt_1{0x05, 0x00, 0x00, 0x00, 0x19, 0x01, 0x00, 0x00, 0x00};
+
+struct fixture
+{
+    channel chan{create_channel()};
+
+    test_stream& stream() noexcept { return get_stream(chan); }
+};
+
+BOOST_AUTO_TEST_CASE(success)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().add_bytes(create_frame(
+                1,
+                {0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00}
+            ));
+            fix.stream().add_bytes(create_frame(2, {0x01}));  // param meta, ignored
+            fix.stream().add_bytes(create_frame(3, {0x02}));  // column meta, ignored
+
+            // Call the function
+            statement stmt = fns.prepare_statement(fix.chan, "SELECT 1").get();
+
+            // Check
+            BOOST_TEST(stmt.valid());
+            BOOST_TEST(stmt.id() == 1u);
+            BOOST_TEST(stmt.num_params() == 1u);
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), create_prepare_select('1'));
+            BOOST_TEST(fix.chan.stmt_cache().empty());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.stmt_cache().set_capacity(4);
+            fix.stream().add_bytes(err_builder()
+                                       .seqnum(1)
+                                       .code(common_server_errc::er_no_such_table)
+                                       .message("abc")
+                                       .build_frame());
+
+            // Call the function
+            fns.prepare_statement(fix.chan, "SELECT 1")
+                .validate_error_exact(common_server_errc::er_no_such_table, "abc");
+
+            // Nothing was cached
+            BOOST_TEST(fix.chan.stmt_cache().empty());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(cache_miss_hit)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.stmt_cache().set_capacity(4);
+            fix.stream().add_bytes(create_prepare_ok_frame(1, 1));
+
+            // Miss: the statement is prepared and cached
+            statement stmt = fns.prepare_statement(fix.chan, "SELECT 1").get();
+            BOOST_TEST(stmt.id() == 1u);
+            BOOST_TEST(fix.chan.stmt_cache().size() == 1u);
+
+            // Hit: no network transfer happens
+            stmt = fns.prepare_statement(fix.chan, "SELECT 1").get();
+            BOOST_TEST(stmt.id() == 1u);
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), create_prepare_select('1'));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(cache_eviction)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.stmt_cache().set_capacity(1);
+            fix.chan.stmt_cache().insert("SELECT 1", statement_builder().id(1).build());
+            fix.stream().add_bytes(create_prepare_ok_frame(1, 2));
+
+            // The evicted statement is closed in the same write as the prepare request
+            statement stmt = fns.prepare_statement(fix.chan, "SELECT 2").get();
+            BOOST_TEST(stmt.id() == 2u);
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.stream().bytes_written(),
+                concat_copy(close_stmt_1, create_prepare_select('2'))
+            );
+            BOOST_TEST(fix.chan.stmt_cache().size() == 1u);
+            BOOST_TEST(!fix.chan.stmt_cache().contains(1));
+            BOOST_TEST(fix.chan.stmt_cache().contains(2));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(cache_disabled_with_entries)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.stmt_cache().set_capacity(1);
+            fix.chan.stmt_cache().insert("SELECT 1", statement_builder().id(1).build());
+            fix.chan.stmt_cache().set_capacity(0);
+            fix.stream().add_bytes(create_prepare_ok_frame(1, 2));
+
+            // Cached statements are closed and the new one is not cached
+            statement stmt = fns.prepare_statement(fix.chan, "SELECT 1").get();
+            BOOST_TEST(stmt.id() == 2u);
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.stream().bytes_written(),
+                concat_copy(close_stmt_1, create_prepare_select('1'))
+            );
+            BOOST_TEST(fix.chan.stmt_cache().empty());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(cache_max_prepared_stmt_count)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.stmt_cache().set_capacity(10);
+            fix.chan.stmt_cache().insert("SELECT 1", statement_builder().id(1).build());
+            fix.chan.stmt_cache().insert("SELECT 2", statement_builder().id(2).build());
+            fix.stream()
+                .add_bytes(err_builder()
+                               .seqnum(1)
+                               .code(common_server_errc::er_max_prepared_stmt_count_reached)
+                               .build_frame())
+                .add_bytes(create_prepare_ok_frame(1, 3));
+
+            // The server limit is hit, so the cache shrinks and the operation is retried
+            statement stmt = fns.prepare_statement(fix.chan, "SELECT 3").get();
+            BOOST_TEST(stmt.id() == 3u);
+            auto prepare_select_3 = create_prepare_select('3');
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.stream().bytes_written(),
+                concat_copy(prepare_select_3, concat_copy(close_stmt_1, prepare_select_3))
+            );
+            BOOST_TEST(fix.chan.stmt_cache().capacity() == 2u);
+            BOOST_TEST(fix.chan.stmt_cache().size() == 2u);
+            BOOST_TEST(fix.chan.stmt_cache().contains(2));
+            BOOST_TEST(fix.chan.stmt_cache().contains(3));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(cache_max_prepared_stmt_count_empty)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.stmt_cache().set_capacity(10);
+            fix.stream().add_bytes(err_builder()
+                                       .seqnum(1)
+                                       .code(common_server_errc::er_max_prepared_stmt_count_reached)
+                                       .build_frame());
+
+            // Nothing can be evicted, so the error is reported
+            fns.prepare_statement(fix.chan, "SELECT 1")
+                .validate_error_exact(common_server_errc::er_max_prepared_stmt_count_reached);
+            BOOST_TEST(fix.chan.stmt_cache().capacity() == 10u);
+        }
+    }
+}
+
+// If the server may omit metadata in executions, the column definitions are stored
+BOOST_AUTO_TEST_CASE(metadata_stored)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.set_current_capabilities(
+                detail::capabilities(detail::CLIENT_OPTIONAL_RESULTSET_METADATA)
+            );
+            fix.stream()
+                .add_bytes(create_frame(
+                    1,
+                    {0x00, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01}
+                ))
+                .add_bytes(create_frame(2, {0x01}))  // param meta, ignored
+                .add_bytes(create_coldef_frame(
+                    3,
+                    meta_builder().type(column_type::varchar).name("f1").build_coldef()
+                ))
+                .add_break()
+                .add_bytes(create_coldef_frame(
+                    4,
+                    meta_builder().type(column_type::tinyint).name("f2").build_coldef()
+                ));
+
+            // Call the function
+            statement stmt = fns.prepare_statement(fix.chan, "SELECT 1").get();
+            BOOST_TEST(stmt.id() == 1u);
+
+            // Check
+            const auto* cols = fix.chan.stmt_metadata().find(1);
+            BOOST_TEST_REQUIRE(cols != nullptr);
+            BOOST_TEST_REQUIRE(cols->size() == 2u);
+            BOOST_TEST(cols->at(0).name == "f1");
+            BOOST_TEST(cols->at(1).name == "f2");
+        }
+    }
+}
+
+// resultset_metadata = NONE: no parameter or column definitions are sent
+BOOST_AUTO_TEST_CASE(metadata_omitted)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.set_current_capabilities(
+                detail::capabilities(detail::CLIENT_OPTIONAL_RESULTSET_METADATA)
+            );
+            fix.stream().add_bytes(create_frame(
+                1,
+                {0x00, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00}
+            ));
+
+            // Call the function
+            statement stmt = fns.prepare_statement(fix.chan, "SELECT 1").get();
+            BOOST_TEST(stmt.id() == 1u);
+            BOOST_TEST(stmt.num_params() == 1u);
+            BOOST_TEST(fix.chan.stmt_metadata().size() == 0u);
+        }
+    }
+}
+
+// Servers not omitting metadata don't require storing it
+BOOST_AUTO_TEST_CASE(metadata_not_stored)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_frame(
+                    1,
+                    {0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00}
+                ))
+                .add_bytes(create_coldef_frame(2, meta_builder().type(column_type::varchar).build_coldef()));
+
+            // Call the function
+            fns.prepare_statement(fix.chan, "SELECT 1").get();
+            BOOST_TEST(fix.chan.stmt_metadata().size() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(metadata_erased_on_eviction)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.stmt_cache().set_capacity(1);
+            fix.chan.stmt_cache().insert("SELECT 1", statement_builder().id(1).build());
+            auto coldef = create_coldef_body(meta_builder().type(column_type::varchar).build_coldef());
+            fix.chan.stmt_metadata().start_recording(1);
+            fix.chan.stmt_metadata().record(coldef);
+            BOOST_TEST_REQUIRE(fix.chan.stmt_metadata().finish_recording() == error_code());
+            fix.stream().add_bytes(create_prepare_ok_frame(1, 2));
+
+            // Call the function
+            fns.prepare_statement(fix.chan, "SELECT 2").get();
+            BOOST_TEST(fix.chan.stmt_metadata().find(1) == nullptr);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(cache_cleared_on_reset)
+{
+    fixture fix;
+    fix.chan.stmt_cache().set_capacity(10);
+    fix.chan.stmt_cache().insert("SELECT 1", statement_builder().id(1).build());
+
+    // Happens on handshake
+    fix.chan.reset();
+    BOOST_TEST(fix.chan.stmt_cache().empty());
+    BOOST_TEST(fix.chan.stmt_cache().capacity() == 10u);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -14,9 +14,13 @@
 
 #include <boost/mysql/impl/internal/channel/channel.hpp>
 #include <boost/mysql/impl/internal/network_algorithms/read_resultset_head.hpp>
+#include <boost/mysql/impl/internal/protocol/capabilities.hpp>
+#include <boost/mysql/impl/internal/protocol/db_flavor.hpp>
 
 #include <boost/test/unit_test.hpp>
 
+#include <cstdint>
+
 #include "test_common/check_meta.hpp"
 #include "test_common/create_diagnostics.hpp"
 #include "test_unit/create_channel.hpp"
@@ -34,6 +38,7 @@
 using namespace boost::mysql;
 using namespace boost::mysql::test;
 using boost::mysql::detail::channel;
+using boost::mysql::detail::db_flavor;
 using boost::mysql::detail::execution_processor;
 
 namespace {
@@ -65,6 +70,18 @@ struct fixture
     }
 
     test_stream& stream() noexcept { return get_stream(chan); }
+
+    // Stores the column definitions for a statement, as if it had been prepared
+    void store_metadata(std::uint32_t stmt_id, const char* col_name)
+    {
+        auto coldef = create_coldef_body(
+            meta_builder().type(column_type::varchar).name(col_name).build_coldef()
+        );
+        auto& stmt_meta = chan.stmt_metadata();
+        stmt_meta.start_recording(stmt_id);
+        stmt_meta.record(coldef);
+        BOOST_TEST_REQUIRE(stmt_meta.finish_recording() == error_code());
+    }
 };
 
 BOOST_AUTO_TEST_CASE(success_meta)
@@ -320,6 +337,24 @@ BOOST_AUTO_TEST_CASE(error_deserialize_execution_response)
     }
 }
 
+// Only load_data_local can handle LOAD DATA LOCAL INFILE requests
+BOOST_AUTO_TEST_CASE(error_unexpected_local_infile_request)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.set_current_capabilities(detail::capabilities(detail::CLIENT_LOCAL_FILES));
+            fix.stream().add_bytes(create_frame(1, {0xfb, 0x61}));
+
+            // Call the function
+            fns.read_resultset_head(fix.chan, fix.st)
+                .validate_error_exact(client_errc::unexpected_local_infile_request);
+        }
+    }
+}
+
 BOOST_AUTO_TEST_CASE(error_deserialize_metadata)
 {
     for (auto fns : all_fns)
@@ -381,6 +416,136 @@ BOOST_AUTO_TEST_CASE(error_on_meta)
         }
     }
 }
+
+// The server may omit the metadata if CLIENT_OPTIONAL_RESULTSET_METADATA was negotiated.
+// We use the one we stored for the statement
+BOOST_AUTO_TEST_CASE(metadata_omitted)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.set_current_capabilities(
+                detail::capabilities(detail::CLIENT_OPTIONAL_RESULTSET_METADATA)
+            );
+            fix.store_metadata(1, "f1");
+            fix.st.on_statement_execution(1);
+            fix.stream().add_bytes(create_frame(1, {0x01, 0x00}));
+
+            // Call the function
+            fns.read_resultset_head(fix.chan, fix.st).validate_no_error();
+
+            // We've read the response
+            fix.st.num_calls().on_num_meta(1).on_meta(1).validate();
+            BOOST_TEST(fix.st.is_reading_rows());
+            BOOST_TEST(fix.st.sequence_number() == 2u);
+            check_meta(fix.st.meta(), {std::make_pair(column_type::varchar, "f1")});
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(metadata_follows_optional)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.set_current_capabilities(
+                detail::capabilities(detail::CLIENT_OPTIONAL_RESULTSET_METADATA)
+            );
+            fix.store_metadata(1, "f1");
+            fix.st.on_statement_execution(1);
+            fix.stream()
+                .add_bytes(create_frame(1, {0x01, 0x01}))
+                .add_bytes(create_coldef_frame(
+                    2,
+                    meta_builder().type(column_type::tinyint).name("f2").build_coldef()
+                ));
+
+            // Call the function
+            fns.read_resultset_head(fix.chan, fix.st).validate_no_error();
+
+            // The metadata sent by the server is used
+            fix.st.num_calls().on_num_meta(1).on_meta(1).validate();
+            BOOST_TEST(fix.st.sequence_number() == 3u);
+            check_meta(fix.st.meta(), {std::make_pair(column_type::tinyint, "f2")});
+        }
+    }
+}
+
+// MariaDB omits the metadata unless it changed since the last time it was sent,
+// so we store the metadata sent in executions
+BOOST_AUTO_TEST_CASE(metadata_mariadb_updated)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.set_flavor(db_flavor::mariadb);
+            fix.chan.set_mariadb_capabilities(detail::capabilities(detail::MARIADB_CLIENT_CACHE_METADATA));
+            fix.store_metadata(1, "f1");
+            fix.st.on_statement_execution(1);
+            fix.stream()
+                .add_bytes(create_frame(1, {0x01, 0x01}))
+                .add_bytes(create_coldef_frame(
+                    2,
+                    meta_builder().type(column_type::tinyint).name("f2").build_coldef()
+                ));
+
+            // Call the function
+            fns.read_resultset_head(fix.chan, fix.st).validate_no_error();
+
+            // The new metadata was stored
+            check_meta(fix.st.meta(), {std::make_pair(column_type::tinyint, "f2")});
+            const auto* cols = fix.chan.stmt_metadata().find(1);
+            BOOST_TEST_REQUIRE(cols != nullptr);
+            BOOST_TEST_REQUIRE(cols->size() == 1u);
+            BOOST_TEST(cols->at(0).name == "f2");
+            BOOST_TEST(!fix.chan.stmt_metadata().is_recording());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error_metadata_unavailable)
+{
+    struct
+    {
+        const char* name;
+        std::uint32_t stored_stmt_id;
+        std::uint8_t num_fields;
+        bool is_statement;
+    } test_cases[] = {
+        {"no_metadata",         2, 1, true },
+        {"num_fields_mismatch", 1, 2, true },
+        {"text_query",          1, 1, false},
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        for (auto fns : all_fns)
+        {
+            BOOST_TEST_CONTEXT(tc.name << ", " << fns.name)
+            {
+                fixture fix;
+                fix.chan.set_current_capabilities(
+                    detail::capabilities(detail::CLIENT_OPTIONAL_RESULTSET_METADATA)
+                );
+                fix.store_metadata(tc.stored_stmt_id, "f1");
+                if (tc.is_statement)
+                    fix.st.on_statement_execution(1);
+                fix.stream().add_bytes(create_frame(1, {tc.num_fields, 0x00}));
+
+                // Call the function
+                fns.read_resultset_head(fix.chan, fix.st)
+                    .validate_error_exact(client_errc::metadata_unavailable);
+            }
+        }
+    }
+}
+
 BOOST_AUTO_TEST_SUITE_END()
 
 BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,268 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/field_chunk.hpp>
+
+#include <boost/mysql/detail/any_field_chunk_handler.hpp>
+#include <boost/mysql/detail/execution_processor/execution_state_impl.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/read_row_streamed.hpp>
+
+#include <boost/test/unit_test.hpp>
+
+#include <string>
+
+#include "test_unit/create_channel.hpp"
+#include "test_unit/create_err.hpp"
+#include "test_unit/create_execution_processor.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/create_meta.hpp"
+#include "test_unit/create_ok.hpp"
+#include "test_unit/create_ok_frame.hpp"
+#include "test_unit/create_row_message.hpp"
+#include "test_unit/test_stream.hpp"
+#include "test_unit/unit_netfun_maker.hpp"
+
+using namespace boost::mysql::test;
+using namespace boost::mysql;
+using boost::mysql::detail::any_field_chunk_handler;
+using boost::mysql::detail::channel;
+using boost::mysql::detail::execution_state_impl;
+
+BOOST_AUTO_TEST_SUITE(test_read_row_streamed)
+
+using netfun_maker = netfun_maker_fn<
+    row_view,
+    channel&,
+    execution_state_impl&,
+    std::size_t,
+    any_field_chunk_handler&>;
+
+struct
+{
+    typename netfun_maker::signature read_row_streamed;
+    const char* name;
+} all_fns[] = {
+    {netfun_maker::sync_errc(&detail::read_row_streamed_impl),           "sync" },
+    {netfun_maker::async_errinfo(&detail::async_read_row_streamed_impl), "async"},
+};
+
+// Concatenates all the chunks it receives
+struct string_handler final : any_field_chunk_handler
+{
+    std::string value;
+    std::size_t num_chunks{};
+    error_code err_to_set;
+
+    void on_chunk(const field_chunk& chunk, error_code& ec) override
+    {
+        BOOST_TEST(chunk.column_index == 1u);
+        BOOST_TEST(chunk.offset == value.size());
+        value.append(reinterpret_cast<const char*>(chunk.data.data()), chunk.data.size());
+        ++num_chunks;
+        ec = err_to_set;
+    }
+};
+
+// Fields with 5 bytes or more are streamed
+constexpr std::size_t min_size = 5;
+
+struct fixture
+{
+    execution_state_impl st;
+    channel chan{create_channel(16)};
+    string_handler handler;
+
+    fixture()
+    {
+        // Prepare the state, such that it's ready to read rows
+        add_meta(
+            st,
+            {
+                meta_builder().type(column_type::varchar).build_coldef(),
+                meta_builder().type(column_type::blob).build_coldef(),
+            }
+        );
+        st.sequence_number() = 42;
+
+        // Put something in shared_fields, simulating a previous read
+        chan.shared_fields().push_back(field_view("prev"));
+    }
+
+    test_stream& stream() noexcept { return get_stream(chan); }
+};
+
+BOOST_AUTO_TEST_CASE(eof)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().add_bytes(create_eof_frame(42, ok_builder().affected_rows(1).info("1st").build()));
+
+            row_view rv = fns.read_row_streamed(fix.chan, fix.st, min_size, fix.handler).get();
+            BOOST_TEST(rv.empty());
+            BOOST_TEST_REQUIRE(fix.st.is_complete());
+            BOOST_TEST(fix.st.get_affected_rows() == 1u);
+            BOOST_TEST(fix.st.get_info() == "1st");
+            BOOST_TEST(fix.handler.num_chunks == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(row_in_pieces)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // The row doesn't fit in the 16 byte buffer
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc", makebv("0123456789abcdefghijklmn")))
+                .add_break(10)
+                .add_break(20);
+
+            row_view rv = fns.read_row_streamed(fix.chan, fix.st, min_size, fix.handler).get();
+            BOOST_TEST(rv == makerow("abc", makebv("")));
+            BOOST_TEST(fix.handler.value == "0123456789abcdefghijklmn");
+            BOOST_TEST(fix.handler.num_chunks > 1u);
+            BOOST_TEST(fix.st.is_reading_rows());
+            BOOST_TEST(fix.st.sequence_number() == 43u);
+            BOOST_TEST(fix.stream().num_unread_bytes() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(several_rows)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // Rows already read entirely and small fields are handled, too
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "a", makebv("0123456")))
+                .add_bytes(create_text_row_message(43, "b", makebv("xy")))
+                .add_bytes(create_eof_frame(44, ok_builder().build()));
+
+            row_view rv = fns.read_row_streamed(fix.chan, fix.st, min_size, fix.handler).get();
+            BOOST_TEST(rv == makerow("a", makebv("")));
+            BOOST_TEST(fix.handler.value == "0123456");
+
+            fix.handler.value.clear();
+            rv = fns.read_row_streamed(fix.chan, fix.st, min_size, fix.handler).get();
+            BOOST_TEST(rv == makerow("b", makebv("xy")));
+            BOOST_TEST(fix.handler.value == "");
+
+            rv = fns.read_row_streamed(fix.chan, fix.st, min_size, fix.handler).get();
+            BOOST_TEST(rv.empty());
+            BOOST_TEST(fix.st.is_complete());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(not_reading_rows)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // Reading when the resultset is complete is a no-op
+            fixture fix;
+            auto err = fix.st.on_row_ok_packet(ok_builder().build());
+            BOOST_TEST_REQUIRE(err == error_code());
+
+            row_view rv = fns.read_row_streamed(fix.chan, fix.st, min_size, fix.handler).get();
+            BOOST_TEST(rv.empty());
+            BOOST_TEST(fix.stream().bytes_written().empty());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(handler_error)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.handler.err_to_set = client_errc::wrong_num_params;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc", makebv("0123456789abcdefghijklmn")))
+                .add_bytes(create_text_row_message(43, "def", makebv("xy")));
+
+            // The handler only gets the first chunk
+            fns.read_row_streamed(fix.chan, fix.st, min_size, fix.handler)
+                .validate_error_exact(client_errc::wrong_num_params);
+            BOOST_TEST(fix.handler.num_chunks == 1u);
+
+            // The failed row was read entirely, so we can keep reading
+            row_view rv = fns.read_row_streamed(fix.chan, fix.st, min_size, fix.handler).get();
+            BOOST_TEST(rv == makerow("def", makebv("xy")));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error_packet)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().add_bytes(err_builder()
+                                       .seqnum(42)
+                                       .code(common_server_errc::er_bad_db_error)
+                                       .message("my_message")
+                                       .build_frame());
+
+            fns.read_row_streamed(fix.chan, fix.st, min_size, fix.handler)
+                .validate_error_exact(common_server_errc::er_bad_db_error, "my_message");
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error_invalid_row)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().add_bytes(create_frame(42, {0x02, 'a', 'b', 0x06, 'a'}));
+
+            fns.read_row_streamed(fix.chan, fix.st, min_size, fix.handler)
+                .validate_error_exact(client_errc::incomplete_message);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error_network)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            // The first read succeeds, getting part of the row
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc", makebv("0123456789abcdefghijklmn")))
+                .set_fail_count(fail_count(2, client_errc::wrong_num_params));
+
+            fns.read_row_streamed(fix.chan, fix.st, min_size, fix.handler)
+                .validate_error_exact(client_errc::wrong_num_params);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -5,6 +5,7 @@
 // file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
 //
 
+#include <boost/mysql/batch_params.hpp>
 #include <boost/mysql/client_errc.hpp>
 #include <boost/mysql/common_server_errc.hpp>
 
@@ -16,6 +17,7 @@
 
 #include <cstddef>
 
+#include "test_common/assert_buffer_equals.hpp"
 #include "test_unit/create_channel.hpp"
 #include "test_unit/create_err.hpp"
 #include "test_unit/create_execution_processor.hpp"
@@ -229,6 +231,101 @@ BOOST_AUTO_TEST_CASE(batch_with_rows_out_of_span_space)
     }
 }
 
+BOOST_AUTO_TEST_CASE(cursor_fetch)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.proc.set_cursor_fetch_size(2);
+            fix.proc.on_statement_execution(1);
+            fix.proc.on_cursor_requested();
+            fix.stream()
+                .add_bytes(create_eof_frame(42, ok_builder().cursor_exists(true).build()))
+                .add_break()
+                .add_bytes(create_text_row_message(1, "abc"))
+                .add_bytes(create_text_row_message(2, "von"))
+                .add_bytes(create_eof_frame(3, ok_builder().cursor_exists(true).build()));
+
+            // The EOF sent after the metadata doesn't contain rows, so they are requested
+            std::size_t num_rows = fns.read_some_rows_impl(fix.chan, fix.proc, fix.ref()).get();
+            BOOST_TEST(num_rows == 2u);
+            fix.validate_refs(2);
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.stream().bytes_written(),
+                create_frame(0, {0x1c, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00})
+            );
+
+            // The batch is over, so the next call will fetch more rows
+            BOOST_TEST(fix.proc.is_reading_rows());
+            BOOST_TEST(fix.proc.should_fetch());
+            BOOST_TEST(fix.proc.sequence_number() == 4u);
+            fix.proc.num_calls()
+                .on_num_meta(1)
+                .on_meta(1)
+                .on_row_batch_start(2)
+                .on_row(2)
+                .on_row_batch_finish(2)
+                .validate();
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(cursor_last_batch)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.proc.set_cursor_fetch_size(2);
+            fix.proc.on_statement_execution(1);
+            fix.proc.on_cursor_requested();
+            fix.proc.on_cursor_batch_end();
+            fix.stream()
+                .add_bytes(create_text_row_message(1, "abc"))
+                .add_bytes(create_eof_frame(2, ok_builder().cursor_exists(true).last_row_sent(true).build()));
+
+            // The server signals that the cursor has been exhausted
+            std::size_t num_rows = fns.read_some_rows_impl(fix.chan, fix.proc, fix.ref()).get();
+            BOOST_TEST(num_rows == 1u);
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(
+                fix.stream().bytes_written(),
+                create_frame(0, {0x1c, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00})
+            );
+            BOOST_TEST(fix.proc.is_complete());
+            BOOST_TEST(!fix.proc.should_fetch());
+            fix.proc.num_calls()
+                .on_num_meta(1)
+                .on_meta(1)
+                .on_row_batch_start(1)
+                .on_row(1)
+                .on_row_ok_packet(1)
+                .on_row_batch_finish(1)
+                .validate();
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(cursor_not_requested)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().add_bytes(create_eof_frame(42, ok_builder().cursor_exists(true).build()));
+
+            // Without a cursor, EOF packets always end the resultset
+            std::size_t num_rows = fns.read_some_rows_impl(fix.chan, fix.proc, fix.ref()).get();
+            BOOST_TEST(num_rows == 0u);
+            BOOST_TEST(fix.proc.is_complete());
+            BOOST_TEST(fix.stream().bytes_written().size() == 0u);
+        }
+    }
+}
+
 // read_some_rows is a no-op if !st.should_read_rows()
 BOOST_AUTO_TEST_CASE(state_complete)
 {
@@ -362,4 +459,149 @@ BOOST_AUTO_TEST_CASE(error_seqnum_mismatch)
     }
 }
 
+// Batch size targets
+using batch_netfun_maker = netfun_maker_fn<
+    std::size_t,
+    channel&,
+    execution_processor&,
+    const output_ref&,
+    const batch_params&,
+    bool>;
+
+struct
+{
+    typename batch_netfun_maker::signature read_some_rows_impl;
+    const char* name;
+} all_batch_fns[] = {
+    {batch_netfun_maker::sync_errc(&detail::read_some_rows_impl),           "sync" },
+    {batch_netfun_maker::async_errinfo(&detail::async_read_some_rows_impl), "async"},
+};
+
+BOOST_AUTO_TEST_CASE(min_rows_several_reads)
+{
+    for (const auto& fns : all_batch_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc"))
+                .add_break()
+                .add_bytes(create_text_row_message(43, "von"))
+                .add_break()
+                .add_bytes(create_text_row_message(44, "other"));
+
+            // We keep reading until we get 2 rows
+            batch_params params(2);
+            std::size_t num_rows = fns.read_some_rows_impl(fix.chan, fix.proc, fix.ref(), params, false)
+                                       .get();
+            BOOST_TEST(num_rows == 2u);
+            BOOST_TEST(fix.proc.is_reading_rows());
+            fix.validate_refs(2);
+            fix.proc.num_calls()
+                .on_num_meta(1)
+                .on_meta(1)
+                .on_row_batch_start(2)
+                .on_row(2)
+                .on_row_batch_finish(2)
+                .validate();
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(min_rows_eof)
+{
+    for (const auto& fns : all_batch_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc"))
+                .add_break()
+                .add_bytes(create_eof_frame(43, ok_builder().affected_rows(1).build()));
+
+            // The resultset ends before the batch reaches min_rows
+            batch_params params(3);
+            std::size_t num_rows = fns.read_some_rows_impl(fix.chan, fix.proc, fix.ref(), params, false)
+                                       .get();
+            BOOST_TEST(num_rows == 1u);
+            BOOST_TEST(fix.proc.is_complete());
+            BOOST_TEST(fix.proc.affected_rows() == 1u);
+            fix.validate_refs(1);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(max_rows)
+{
+    for (const auto& fns : all_batch_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc"))
+                .add_bytes(create_text_row_message(43, "von"))
+                .add_bytes(create_text_row_message(44, "other"));
+            batch_params params(3);
+            params.set_max_rows(2);
+
+            // max_rows takes precedence over min_rows
+            std::size_t num_rows = fns.read_some_rows_impl(fix.chan, fix.proc, fix.ref(), params, false)
+                                       .get();
+            BOOST_TEST(num_rows == 2u);
+            BOOST_TEST(fix.proc.is_reading_rows());
+            BOOST_TEST(fix.chan.has_read_messages());
+            fix.validate_refs(2);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(max_bytes)
+{
+    for (const auto& fns : all_batch_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc"))  // 4 bytes
+                .add_bytes(create_text_row_message(43, "von"))
+                .add_bytes(create_text_row_message(44, "other"));
+            batch_params params(3);
+            params.set_max_bytes(5);
+
+            // We stop as soon as the limit is exceeded
+            std::size_t num_rows = fns.read_some_rows_impl(fix.chan, fix.proc, fix.ref(), params, false)
+                                       .get();
+            BOOST_TEST(num_rows == 2u);
+            BOOST_TEST(fix.proc.is_reading_rows());
+            BOOST_TEST(fix.chan.has_read_messages());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(max_bytes_single_row)
+{
+    for (const auto& fns : all_batch_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc"))
+                .add_bytes(create_text_row_message(43, "von"));
+            batch_params params;
+            params.set_max_bytes(1);
+
+            // We always read at least one row
+            std::size_t num_rows = fns.read_some_rows_impl(fix.chan, fix.proc, fix.ref(), params, false)
+                                       .get();
+            BOOST_TEST(num_rows == 1u);
+            BOOST_TEST(fix.proc.is_reading_rows());
+        }
+    }
+}
+
 BOOST_AUTO_TEST_SUITE_END()
@@ -5,6 +5,7 @@
 // file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
 //
 
+#include <boost/mysql/batch_params.hpp>
 #include <boost/mysql/client_errc.hpp>
 
 #include <boost/mysql/detail/execution_processor/execution_state_impl.hpp>
@@ -31,7 +32,7 @@ using boost::mysql::detail::execution_state_impl;
 
 BOOST_AUTO_TEST_SUITE(test_read_some_rows_dynamic)
 
-using netfun_maker = netfun_maker_fn<rows_view, channel&, execution_state_impl&>;
+using netfun_maker = netfun_maker_fn<rows_view, channel&, execution_state_impl&, const batch_params&>;
 
 struct
 {
@@ -69,7 +70,7 @@ BOOST_AUTO_TEST_CASE(eof)
             fixture fix;
             fix.stream().add_bytes(create_eof_frame(42, ok_builder().affected_rows(1).info("1st").build()));
 
-            rows_view rv = fns.read_some_rows_dynamic(fix.chan, fix.st).get();
+            rows_view rv = fns.read_some_rows_dynamic(fix.chan, fix.st, batch_params()).get();
             BOOST_TEST(rv == makerows(1));
             BOOST_TEST_REQUIRE(fix.st.is_complete());
             BOOST_TEST(fix.st.get_affected_rows() == 1u);
@@ -92,7 +93,7 @@ BOOST_AUTO_TEST_CASE(batch_with_rows)
                 .add_break()
                 .add_bytes(create_text_row_message(44, "other"));  // only a single read should be issued
 
-            rows_view rv = fns.read_some_rows_dynamic(fix.chan, fix.st).get();
+            rows_view rv = fns.read_some_rows_dynamic(fix.chan, fix.st, batch_params()).get();
             BOOST_TEST(rv == makerows(1, "abc", "von"));
             BOOST_TEST(fix.st.is_reading_rows());
             BOOST_TEST(fix.chan.shared_sequence_number() == 0u);  // not used
@@ -112,7 +113,7 @@ BOOST_AUTO_TEST_CASE(batch_with_rows_eof)
                 .add_bytes(create_text_row_message(43, "von"))
                 .add_bytes(create_eof_frame(44, ok_builder().affected_rows(1).info("1st").build()));
 
-            rows_view rv = fns.read_some_rows_dynamic(fix.chan, fix.st).get();
+            rows_view rv = fns.read_some_rows_dynamic(fix.chan, fix.st, batch_params()).get();
             BOOST_TEST(rv == makerows(1, "abc", "von"));
             BOOST_TEST_REQUIRE(fix.st.is_complete());
             BOOST_TEST(fix.st.get_affected_rows() == 1u);
@@ -134,10 +135,108 @@ BOOST_AUTO_TEST_CASE(error)
             // invalid row
             fix.stream().add_bytes(create_frame(42, {0x02, 0xff}));
 
-            fns.read_some_rows_dynamic(fix.chan, fix.st)
+            fns.read_some_rows_dynamic(fix.chan, fix.st, batch_params())
                 .validate_error_exact(client_errc::incomplete_message);
         }
     }
 }
 
+// Rows read before the last read must remain valid, even if the buffer was reused
+BOOST_AUTO_TEST_CASE(min_rows_several_reads)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc"))
+                .add_break()
+                .add_bytes(create_text_row_message(43, "von"))
+                .add_bytes(create_text_row_message(44, ""))
+                .add_break()
+                .add_bytes(create_text_row_message(45, "other"))
+                .add_bytes(create_text_row_message(46, "last"));
+
+            rows_view rv = fns.read_some_rows_dynamic(fix.chan, fix.st, batch_params(4)).get();
+            BOOST_TEST(rv == makerows(1, "abc", "von", "", "other", "last"));
+            BOOST_TEST(fix.st.is_reading_rows());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(min_rows_eof)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc"))
+                .add_break()
+                .add_bytes(create_text_row_message(43, "von"))
+                .add_bytes(create_eof_frame(44, ok_builder().affected_rows(1).info("1st").build()));
+
+            rows_view rv = fns.read_some_rows_dynamic(fix.chan, fix.st, batch_params(10)).get();
+            BOOST_TEST(rv == makerows(1, "abc", "von"));
+            BOOST_TEST_REQUIRE(fix.st.is_complete());
+            BOOST_TEST(fix.st.get_info() == "1st");
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(max_rows)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc"))
+                .add_bytes(create_text_row_message(43, "von"))
+                .add_bytes(create_text_row_message(44, "other"))
+                .add_bytes(create_eof_frame(45, ok_builder().build()));
+            batch_params params;
+            params.set_max_rows(2);
+
+            rows_view rv = fns.read_some_rows_dynamic(fix.chan, fix.st, params).get();
+            BOOST_TEST(rv == makerows(1, "abc", "von"));
+            BOOST_TEST(fix.st.is_reading_rows());
+
+            // The remaining messages are processed by the next call
+            rv = fns.read_some_rows_dynamic(fix.chan, fix.st, params).get();
+            BOOST_TEST(rv == makerows(1, "other"));
+            BOOST_TEST(fix.st.is_complete());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(max_bytes)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_text_row_message(42, "abc"))  // 4 bytes
+                .add_bytes(create_text_row_message(43, "von"))
+                .add_bytes(create_text_row_message(44, "other"));
+            batch_params params(10);
+            params.set_max_bytes(5);
+
+            // We stop after exceeding max_bytes, even if min_rows was not reached
+            rows_view rv = fns.read_some_rows_dynamic(fix.chan, fix.st, params).get();
+            BOOST_TEST(rv == makerows(1, "abc", "von"));
+
+            // At least one row is read, even if it exceeds the limit
+            params.set_max_bytes(1);
+            rv = fns.read_some_rows_dynamic(fix.chan, fix.st, params).get();
+            BOOST_TEST(rv == makerows(1, "other"));
+        }
+    }
+}
+
 BOOST_AUTO_TEST_SUITE_END()
@@ -9,6 +9,7 @@
 
 #ifdef BOOST_MYSQL_CXX14
 
+#include <boost/mysql/batch_params.hpp>
 #include <boost/mysql/client_errc.hpp>
 #include <boost/mysql/static_execution_state.hpp>
 
@@ -38,8 +39,8 @@ using row1 = std::tuple<int, float>;
 using row2 = std::tuple<double>;
 
 using state_t = static_execution_state<row1, row1, row2, row1, row2>;
-using netfun_maker_row1 = netfun_maker_fn<std::size_t, channel&, state_t&, span<row1> >;
-using netfun_maker_row2 = netfun_maker_fn<std::size_t, channel&, state_t&, span<row2> >;
+using netfun_maker_row1 = netfun_maker_fn<std::size_t, channel&, state_t&, span<row1>, const batch_params&>;
+using netfun_maker_row2 = netfun_maker_fn<std::size_t, channel&, state_t&, span<row2>, const batch_params&>;
 
 struct
 {
@@ -102,7 +103,8 @@ BOOST_AUTO_TEST_CASE(repeated_row_types)
                 .add_bytes(create_text_row_message(0, 10, 4.2f))
                 .add_bytes(create_text_row_message(1, 11, 4.3f));
 
-            std::size_t num_rows = fns.read_some_rows_row1(fix.chan, fix.st, fix.storage1).get();
+            std::size_t num_rows = fns.read_some_rows_row1(fix.chan, fix.st, fix.storage1, batch_params())
+                                       .get();
             BOOST_TEST_REQUIRE(num_rows == 2u);
             BOOST_TEST((fix.storage1[0] == row1{10, 4.2f}));
             BOOST_TEST((fix.storage1[1] == row1{11, 4.3f}));
@@ -114,7 +116,7 @@ BOOST_AUTO_TEST_CASE(repeated_row_types)
 
             // 2nd resultset: row1 again
             fix.stream().add_bytes(create_text_row_message(2, 13, 0.2f));
-            num_rows = fns.read_some_rows_row1(fix.chan, fix.st, fix.storage1).get();
+            num_rows = fns.read_some_rows_row1(fix.chan, fix.st, fix.storage1, batch_params()).get();
             BOOST_TEST_REQUIRE(num_rows == 1u);
             BOOST_TEST((fix.storage1[0] == row1{13, 0.2f}));
 
@@ -125,7 +127,7 @@ BOOST_AUTO_TEST_CASE(repeated_row_types)
 
             // 3rd resultset: row2
             fix.stream().add_bytes(create_text_row_message(3, 9.1));
-            num_rows = fns.read_some_rows_row2(fix.chan, fix.st, fix.storage2).get();
+            num_rows = fns.read_some_rows_row2(fix.chan, fix.st, fix.storage2, batch_params()).get();
             BOOST_TEST_REQUIRE(num_rows == 1u);
             BOOST_TEST((fix.storage2[0] == row2{9.1}));
 
@@ -136,7 +138,7 @@ BOOST_AUTO_TEST_CASE(repeated_row_types)
 
             // 4th resultset: row1
             fix.stream().add_bytes(create_text_row_message(4, 43, 0.7f));
-            num_rows = fns.read_some_rows_row1(fix.chan, fix.st, fix.storage1).get();
+            num_rows = fns.read_some_rows_row1(fix.chan, fix.st, fix.storage1, batch_params()).get();
             BOOST_TEST_REQUIRE(num_rows == 1u);
             BOOST_TEST((fix.storage1[0] == row1{43, 0.7f}));
 
@@ -147,7 +149,7 @@ BOOST_AUTO_TEST_CASE(repeated_row_types)
 
             // 5th resultset: row2
             fix.stream().add_bytes(create_text_row_message(5, 99.9));
-            num_rows = fns.read_some_rows_row2(fix.chan, fix.st, fix.storage2).get();
+            num_rows = fns.read_some_rows_row2(fix.chan, fix.st, fix.storage2, batch_params()).get();
             BOOST_TEST_REQUIRE(num_rows == 1u);
             BOOST_TEST((fix.storage2[0] == row2{99.9}));
         }
@@ -165,7 +167,7 @@ BOOST_AUTO_TEST_CASE(error_row_type_mismatch)
 
             // 1st resultset: row1. Note that this will consume the message
             fix.stream().add_bytes(create_text_row_message(0, 10, 4.2f));
-            fns.read_some_rows_row2(fix.chan, fix.st, fix.storage2)
+            fns.read_some_rows_row2(fix.chan, fix.st, fix.storage2, batch_params())
                 .validate_error_exact(client_errc::row_type_mismatch);
 
             // Advance resultset
@@ -177,12 +179,44 @@ BOOST_AUTO_TEST_CASE(error_row_type_mismatch)
 
             // 3rd resultset: row2
             fix.stream().add_bytes(create_text_row_message(1, 9.1));
-            fns.read_some_rows_row1(fix.chan, fix.st, fix.storage1)
+            fns.read_some_rows_row1(fix.chan, fix.st, fix.storage1, batch_params())
                 .validate_error_exact(client_errc::row_type_mismatch);
         }
     }
 }
 
+BOOST_AUTO_TEST_CASE(min_rows_several_reads)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.add_meta_row1();
+            fix.stream()
+                .add_bytes(create_text_row_message(0, 10, 4.2f))
+                .add_break()
+                .add_bytes(create_text_row_message(1, 11, 4.3f))
+                .add_break()
+                .add_bytes(create_text_row_message(2, 12, 4.4f))
+                .add_bytes(create_text_row_message(3, 13, 4.5f));
+
+            // We read until the span is full, even if min_rows is bigger
+            std::size_t num_rows = fns.read_some_rows_row1(fix.chan, fix.st, fix.storage1, batch_params(5))
+                                       .get();
+            BOOST_TEST_REQUIRE(num_rows == 3u);
+            BOOST_TEST((fix.storage1[0] == row1{10, 4.2f}));
+            BOOST_TEST((fix.storage1[1] == row1{11, 4.3f}));
+            BOOST_TEST((fix.storage1[2] == row1{12, 4.4f}));
+
+            // The remaining row is served from the buffer
+            num_rows = fns.read_some_rows_row1(fix.chan, fix.st, fix.storage1, batch_params()).get();
+            BOOST_TEST_REQUIRE(num_rows == 1u);
+            BOOST_TEST((fix.storage1[0] == row1{13, 4.5f}));
+        }
+    }
+}
+
 BOOST_AUTO_TEST_SUITE_END()
 
 #endif
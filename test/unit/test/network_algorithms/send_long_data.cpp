@@ -0,0 +1,332 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/load_data_source.hpp>
+#include <boost/mysql/statement.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+
+#include <boost/mysql/impl/internal/channel/channel.hpp>
+#include <boost/mysql/impl/internal/network_algorithms/send_long_data.hpp>
+
+#include <boost/asio/buffer.hpp>
+#include <boost/test/unit_test.hpp>
+
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <vector>
+
+#include "test_common/assert_buffer_equals.hpp"
+#include "test_common/buffer_concat.hpp"
+#include "test_unit/create_channel.hpp"
+#include "test_unit/create_err.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/create_ok.hpp"
+#include "test_unit/create_ok_frame.hpp"
+#include "test_unit/create_statement.hpp"
+#include "test_unit/test_stream.hpp"
+#include "test_unit/unit_netfun_maker.hpp"
+
+using namespace boost::mysql::test;
+using namespace boost::mysql;
+using boost::asio::mutable_buffer;
+using boost::mysql::detail::channel;
+
+BOOST_AUTO_TEST_SUITE(test_send_long_data)
+
+void send_long_data_sync(
+    channel& chan,
+    const statement& stmt,
+    std::size_t param_index,
+    load_data_source& source,
+    error_code& err,
+    diagnostics& diag
+)
+{
+    detail::send_long_data_impl(chan, stmt, param_index, *detail::access::get_impl(source), err, diag);
+}
+
+void send_long_data_async(
+    channel& chan,
+    const statement& stmt,
+    std::size_t param_index,
+    load_data_source& source,
+    diagnostics& diag,
+    as_network_result<void>&& token
+)
+{
+    detail::async_send_long_data_impl(
+        chan,
+        stmt,
+        param_index,
+        std::move(detail::access::get_impl(source)),
+        diag,
+        std::move(token)
+    );
+}
+
+using netfun_maker = netfun_maker_fn<void, channel&, const statement&, std::size_t, load_data_source&>;
+
+struct
+{
+    typename netfun_maker::signature send_long_data;
+    const char* name;
+} all_fns[] = {
+    {netfun_maker::sync_errc(&send_long_data_sync),      "sync" },
+    {netfun_maker::async_errinfo(&send_long_data_async), "async"},
+};
+
+struct fixture
+{
+    channel chan{create_channel()};
+    statement stmt{statement_builder().id(3).num_params(2).build()};
+
+    test_stream& stream() noexcept { return get_stream(chan); }
+};
+
+// A COM_STMT_SEND_LONG_DATA message for statement 3 and parameter 1
+constexpr std::uint8_t serialized_long_data_head[] = {0x18, 0x03, 0x00, 0x00, 0x00, 0x01, 0x00};
+
+std::vector<std::uint8_t> create_long_data_frame(const std::vector<std::uint8_t>& data)
+{
+    return create_frame(0, buffer_builder().add(serialized_long_data_head).add(data).build());
+}
+
+// A COM_STMT_RESET message for statement 3
+constexpr std::uint8_t serialized_reset[] = {0x1a, 0x03, 0x00, 0x00, 0x00};
+
+// A callback source that returns the given chunks, in order, and then signals EOF
+struct chunks_callback
+{
+    std::vector<std::vector<std::uint8_t>> chunks;
+    std::size_t index;
+
+    chunks_callback(std::vector<std::vector<std::uint8_t>> chunks = {}) : chunks(std::move(chunks)), index(0)
+    {
+    }
+
+    std::size_t operator()(mutable_buffer buff, error_code&)
+    {
+        if (index == chunks.size())
+            return 0;
+        const auto& chunk = chunks[index++];
+        BOOST_TEST_REQUIRE(buff.size() >= chunk.size());
+        if (!chunk.empty())
+            std::memcpy(buff.data(), chunk.data(), chunk.size());
+        return chunk.size();
+    }
+};
+
+BOOST_AUTO_TEST_CASE(success_callback)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            auto source = load_data_source::from_callback(
+                chunks_callback{
+                    {{0x61, 0x62, 0x63}, {0x64, 0x65}}
+            }
+            );
+
+            // Call the function
+            fns.send_long_data(fix.chan, fix.stmt, 1, source).validate_no_error();
+
+            // Each chunk is a separate message. There is no response, so nothing is read
+            auto expected_msg = buffer_builder()
+                                    .add(create_long_data_frame({0x61, 0x62, 0x63}))
+                                    .add(create_long_data_frame({0x64, 0x65}))
+                                    .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+
+            // The parameter is used by the next execution
+            BOOST_TEST(fix.chan.long_data().size() == 1u);
+            auto flags = fix.chan.long_data().consume(3);
+            BOOST_TEST(flags == (std::vector<std::uint8_t>{0, 1}), boost::test_tools::per_element());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(success_stream)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            test_stream source_stream;
+            source_stream.add_bytes(std::vector<std::uint8_t>{0x61, 0x62, 0x63, 0x64, 0x65}).add_break(3);
+            auto source = load_data_source::from_stream(source_stream);
+
+            // Call the function
+            fns.send_long_data(fix.chan, fix.stmt, 1, source).validate_no_error();
+
+            // Each read generates a message
+            auto expected_msg = buffer_builder()
+                                    .add(create_long_data_frame({0x61, 0x62, 0x63}))
+                                    .add(create_long_data_frame({0x64, 0x65}))
+                                    .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+            BOOST_TEST(source_stream.num_unread_bytes() == 0u);
+            BOOST_TEST(fix.chan.long_data().size() == 1u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(empty_source)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            std::size_t num_calls = 0;
+            auto source = load_data_source::from_callback([&num_calls](mutable_buffer, error_code&) {
+                ++num_calls;
+                return std::size_t(0);
+            });
+
+            // Call the function
+            fns.send_long_data(fix.chan, fix.stmt, 1, source).validate_no_error();
+
+            // A single empty chunk is sent, so the parameter gets an empty value.
+            // The source is not read again after it signals EOF
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), create_long_data_frame({}));
+            BOOST_TEST(num_calls == 1u);
+            BOOST_TEST(fix.chan.long_data().size() == 1u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(chunks_use_all_buffer_space)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().set_write_break_size(0x100000);
+
+            // Fills all the space it's offered the first time
+            std::size_t num_calls = 0;
+            auto source = load_data_source::from_callback(
+                [&num_calls](mutable_buffer buff, error_code&) -> std::size_t {
+                    ++num_calls;
+                    if (num_calls == 1)
+                    {
+                        std::memset(buff.data(), 0x61, buff.size());
+                        return buff.size();
+                    }
+                    return num_calls == 2 ? 1 : 0;
+                }
+            );
+
+            // Call the function
+            fns.send_long_data(fix.chan, fix.stmt, 1, source).validate_no_error();
+
+            // Check the written messages
+            std::vector<std::uint8_t> big_chunk(detail::long_data_chunk_size, 0x61);
+            auto expected_msg = buffer_builder()
+                                    .add(create_long_data_frame(big_chunk))
+                                    .add(create_long_data_frame({0x61}))
+                                    .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+            BOOST_TEST(num_calls == 3u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(source_error)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().add_bytes(create_ok_frame(1, ok_builder().build()));
+            fix.chan.long_data().add(3, 2, 0);  // data sent previously for another parameter
+            std::size_t num_calls = 0;
+            auto source = load_data_source::from_callback(
+                [&num_calls](mutable_buffer buff, error_code& ec) -> std::size_t {
+                    if (num_calls++ == 0)
+                    {
+                        std::memset(buff.data(), 0x61, 2);
+                        return 2;
+                    }
+                    ec = client_errc::wrong_num_params;
+                    return 0;
+                }
+            );
+
+            // The source error is reported
+            fns.send_long_data(fix.chan, fix.stmt, 1, source)
+                .validate_error_exact(client_errc::wrong_num_params);
+
+            // We reset the statement, discarding the data sent for all parameters,
+            // and read the response, so the connection is usable
+            auto expected_msg = buffer_builder()
+                                    .add(create_long_data_frame({0x61, 0x61}))
+                                    .add(create_frame(0, serialized_reset))
+                                    .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+            BOOST_TEST(fix.stream().num_unread_bytes() == 0u);
+            BOOST_TEST(fix.chan.long_data().size() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(source_error_first_chunk)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().add_bytes(
+                err_builder()
+                    .seqnum(1)
+                    .code(common_server_errc::er_unknown_stmt_handler)
+                    .message("Unknown statement")
+                    .build_frame()
+            );
+            auto source = load_data_source::from_callback([](mutable_buffer, error_code& ec) {
+                ec = client_errc::wrong_num_params;
+                return std::size_t(0);
+            });
+
+            // No data is sent. The source error takes precedence over the reset error
+            auto res = fns.send_long_data(fix.chan, fix.stmt, 1, source);
+            BOOST_TEST(res.err == error_code(client_errc::wrong_num_params));
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), create_frame(0, serialized_reset));
+            BOOST_TEST(fix.stream().num_unread_bytes() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(network_error)
+{
+    for (const auto& fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream().set_fail_count(fail_count(0, client_errc::wrong_num_params));
+            auto source = load_data_source::from_callback(chunks_callback{{{0x61}}});
+
+            // The error is reported, and the parameter is not recorded
+            fns.send_long_data(fix.chan, fix.stmt, 1, source)
+                .validate_error_exact(client_errc::wrong_num_params);
+            BOOST_TEST(fix.chan.long_data().size() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_SUITE_END()
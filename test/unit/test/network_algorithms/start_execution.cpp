@@ -7,6 +7,7 @@
 
 #include <boost/mysql/client_errc.hpp>
 #include <boost/mysql/column_type.hpp>
+#include <boost/mysql/common_server_errc.hpp>
 #include <boost/mysql/error_code.hpp>
 #include <boost/mysql/metadata_mode.hpp>
 
@@ -18,11 +19,17 @@
 
 #include <boost/test/unit_test.hpp>
 
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
 #include "test_common/assert_buffer_equals.hpp"
+#include "test_common/buffer_concat.hpp"
 #include "test_common/check_meta.hpp"
 #include "test_common/create_basic.hpp"
 #include "test_unit/create_channel.hpp"
 #include "test_unit/create_coldef_frame.hpp"
+#include "test_unit/create_err.hpp"
 #include "test_unit/create_frame.hpp"
 #include "test_unit/create_meta.hpp"
 #include "test_unit/create_statement.hpp"
@@ -31,8 +38,13 @@
 #include "test_unit/test_stream.hpp"
 #include "test_unit/unit_netfun_maker.hpp"
 
+#ifdef BOOST_MYSQL_ENABLE_ZLIB
+#include <zlib.h>
+#endif
+
 using namespace boost::mysql;
 using namespace boost::mysql::test;
+using boost::span;
 using boost::mysql::detail::any_execution_request;
 using boost::mysql::detail::channel;
 using boost::mysql::detail::execution_processor;
@@ -59,6 +71,13 @@ struct fixture
     fixture() { chan.shared_sequence_number() = 42; }
 
     test_stream& stream() { return get_stream(chan); }
+
+    // The bytes written by the stream, skipping the first offset ones
+    std::vector<std::uint8_t> bytes_written_since(std::size_t offset)
+    {
+        const auto& bytes = stream().bytes_written();
+        return std::vector<std::uint8_t>(bytes.begin() + offset, bytes.end());
+    }
 };
 
 BOOST_AUTO_TEST_CASE(text_query)
@@ -129,6 +148,285 @@ BOOST_AUTO_TEST_CASE(prepared_statement)
     }
 }
 
+BOOST_AUTO_TEST_CASE(prepared_statement_cursor)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.st.set_cursor_fetch_size(10);
+            fix.stream()
+                .add_bytes(create_frame(1, {0x01}))
+                .add_bytes(create_coldef_frame(2, meta_builder().type(column_type::varchar).build_coldef()));
+            auto stmt = statement_builder().id(1).num_params(0).build();
+
+            // Call the function
+            fns.start_execution(fix.chan, any_execution_request(stmt, {}), fix.st).validate_no_error();
+
+            // We've asked the server to open a read-only cursor
+            auto expected_msg = create_frame(0, {0x17, 0x01, 0x00, 0x00, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00});
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), expected_msg);
+
+            // We've read the response. Rows will be requested by read_some_rows
+            BOOST_TEST(fix.st.is_reading_rows());
+            BOOST_TEST(fix.st.cursor_requested());
+            BOOST_TEST(fix.st.statement_id() == 1u);
+            BOOST_TEST(!fix.st.should_fetch());
+            BOOST_TEST(fix.st.cursor_fetch_size() == 10u);  // preserved by reset
+            fix.st.num_calls().reset(1).on_num_meta(1).on_meta(1).validate();
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(text_query_cursor)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.st.set_cursor_fetch_size(10);
+            fix.stream()
+                .add_bytes(create_frame(1, {0x01}))
+                .add_bytes(create_coldef_frame(2, meta_builder().type(column_type::varchar).build_coldef()));
+
+            // Text queries can't use cursors
+            fns.start_execution(fix.chan, any_execution_request("SELECT 1"), fix.st).validate_no_error();
+            BOOST_TEST(fix.stream().bytes_written().at(4) == 0x03);
+            BOOST_TEST(!fix.st.cursor_requested());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(prepared_statement_types_unchanged)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            auto stmt = statement_builder().id(1).num_params(2).build();
+            const auto params = make_fv_arr("test", nullptr);
+            const auto params2 = make_fv_arr("abc", nullptr);
+            const auto params3 = make_fv_arr(42, nullptr);
+            const auto response = create_frame(1, {0x01});
+            const auto coldef = create_coldef_frame(
+                2,
+                meta_builder().type(column_type::varchar).build_coldef()
+            );
+
+            // First execution: types are sent
+            fix.stream().add_bytes(response).add_bytes(coldef);
+            fns.start_execution(fix.chan, any_execution_request(stmt, params), fix.st).validate_no_error();
+
+            // Second execution, same types: types are not sent
+            auto offset = fix.stream().bytes_written().size();
+            fix.stream().add_bytes(response).add_bytes(coldef);
+            fns.start_execution(fix.chan, any_execution_request(stmt, params2), fix.st).validate_no_error();
+            constexpr std::uint8_t body2[] = {
+                0x17, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x03, 0x61, 0x62, 0x63,
+            };
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.bytes_written_since(offset), create_frame(0, body2));
+
+            // Third execution, different types: types are sent again
+            offset = fix.stream().bytes_written().size();
+            fix.stream().add_bytes(response).add_bytes(coldef);
+            fns.start_execution(fix.chan, any_execution_request(stmt, params3), fix.st).validate_no_error();
+            constexpr std::uint8_t body3[] = {
+                0x17, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x02, 0x01, 0x08, 0x00,
+                0x06, 0x00, 0x2a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+            };
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.bytes_written_since(offset), create_frame(0, body3));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(prepared_statement_types_error)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            auto stmt = statement_builder().id(1).num_params(1).build();
+            const auto params = make_fv_arr("test");
+
+            // The execution fails
+            fix.stream().add_bytes(
+                err_builder().seqnum(1).code(common_server_errc::er_bad_db_error).build_frame()
+            );
+            fns.start_execution(fix.chan, any_execution_request(stmt, params), fix.st)
+                .validate_error_exact(common_server_errc::er_bad_db_error);
+
+            // Types are sent again, since we don't know whether the server bound them
+            auto offset = fix.stream().bytes_written().size();
+            fix.stream()
+                .add_bytes(create_frame(1, {0x01}))
+                .add_bytes(create_coldef_frame(2, meta_builder().type(column_type::varchar).build_coldef()));
+            fns.start_execution(fix.chan, any_execution_request(stmt, params), fix.st).validate_no_error();
+            constexpr std::uint8_t body[] = {
+                0x17, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00,
+                0x00, 0x01, 0xfe, 0x00, 0x04, 0x74, 0x65, 0x73, 0x74,
+            };
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.bytes_written_since(offset), create_frame(0, body));
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(prepared_statement_stale)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            auto stmt = statement_builder().id(1).num_params(1).build();
+            const auto params = make_fv_arr("test");
+            fix.chan.end_session();
+
+            // The statement doesn't exist in the server anymore, so nothing is sent
+            fns.start_execution(fix.chan, any_execution_request(stmt, params), fix.st)
+                .validate_error_exact(client_errc::stale_statement);
+            BOOST_TEST(fix.stream().bytes_written().size() == 0u);
+        }
+    }
+}
+
+// Large parameters are written in place by sync functions, and copied by async ones.
+// The result is the same
+BOOST_AUTO_TEST_CASE(prepared_statement_large_param)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_frame(1, {0x01}))
+                .add_bytes(create_coldef_frame(2, meta_builder().type(column_type::varchar).build_coldef()));
+            auto stmt = statement_builder().id(1).num_params(2).build();
+            const std::vector<std::uint8_t> blob(70000, 0xab);
+            const auto params = make_fv_arr(span<const std::uint8_t>(blob), 42);
+
+            // Call the function
+            fns.start_execution(fix.chan, any_execution_request(stmt, params), fix.st).validate_no_error();
+
+            // We've written the request message
+            auto body = buffer_builder()
+                            .add({0x17, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01,
+                                  0xfc, 0x00, 0x08, 0x00, 0xfd, 0x70, 0x11, 0x01})
+                            .add(blob)
+                            .add({0x2a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00})
+                            .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), create_frame(0, body));
+            BOOST_TEST(fix.st.sequence_number() == 3u);
+        }
+    }
+}
+
+// Values sent by send_long_data are omitted, and only used by one execution
+BOOST_AUTO_TEST_CASE(prepared_statement_long_data)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.stream()
+                .add_bytes(create_frame(1, {0x01}))
+                .add_bytes(create_coldef_frame(2, meta_builder().type(column_type::varchar).build_coldef()));
+            auto stmt = statement_builder().id(1).num_params(2).build();
+            const auto params = make_fv_arr("", 42);
+            fix.chan.long_data().add(1, 2, 0);
+
+            // Call the function
+            fns.start_execution(fix.chan, any_execution_request(stmt, params), fix.st).validate_no_error();
+
+            // The type of the 1st parameter is sent, but not its value
+            const std::uint8_t expected_message[] = {
+                0x17, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01,
+                0xfe, 0x00, 0x08, 0x00, 0x2a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+            };
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.stream().bytes_written(), create_frame(0, expected_message));
+            BOOST_TEST(fix.chan.long_data().size() == 0u);
+        }
+    }
+}
+
+#ifdef BOOST_MYSQL_ENABLE_ZLIB
+// A compressed frame with an uncompressed payload
+std::vector<std::uint8_t> create_raw_compressed_frame(
+    std::uint8_t seqnum,
+    const std::vector<std::uint8_t>& payload
+)
+{
+    auto size = static_cast<std::uint32_t>(payload.size());
+    std::vector<std::uint8_t> res{
+        static_cast<std::uint8_t>(size),
+        static_cast<std::uint8_t>(size >> 8),
+        static_cast<std::uint8_t>(size >> 16),
+        seqnum,
+        0,
+        0,
+        0,
+    };
+    concat(res, payload);
+    return res;
+}
+
+// With compression, large parameters are always copied, so the request is compressed as a whole
+BOOST_AUTO_TEST_CASE(prepared_statement_large_param_compression)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            fixture fix;
+            fix.chan.set_compression(boost::mysql::detail::compression_algorithm::zlib);
+            fix.stream().add_bytes(create_raw_compressed_frame(
+                1,
+                concat_copy(
+                    create_frame(1, {0x01}),
+                    create_coldef_frame(2, meta_builder().type(column_type::varchar).build_coldef())
+                )
+            ));
+            auto stmt = statement_builder().id(1).num_params(2).build();
+            const std::vector<std::uint8_t> blob(70000, 0xab);
+            const auto params = make_fv_arr(span<const std::uint8_t>(blob), 42);
+
+            // Call the function
+            fns.start_execution(fix.chan, any_execution_request(stmt, params), fix.st).validate_no_error();
+
+            // We've written a single compressed frame, starting a new sequence
+            const auto& written = fix.stream().bytes_written();
+            BOOST_TEST_REQUIRE(written.size() > 7u);
+            std::size_t compressed_size = written[0] | (written[1] << 8) | (written[2] << 16);
+            uLongf uncompressed_size = written[4] | (written[5] << 8) | (written[6] << 16);
+            BOOST_TEST(written.size() == compressed_size + 7u);
+            BOOST_TEST(written[3] == 0u);
+
+            // It contains the request message
+            std::vector<std::uint8_t> uncompressed(uncompressed_size);
+            int res = ::uncompress(
+                uncompressed.data(),
+                &uncompressed_size,
+                written.data() + 7,
+                static_cast<uLong>(compressed_size)
+            );
+            BOOST_TEST_REQUIRE(res == Z_OK);
+            auto body = buffer_builder()
+                            .add({0x17, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01,
+                                  0xfc, 0x00, 0x08, 0x00, 0xfd, 0x70, 0x11, 0x01})
+                            .add(blob)
+                            .add({0x2a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00})
+                            .build();
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(uncompressed, create_frame(0, body));
+        }
+    }
+}
+#endif
+
 BOOST_AUTO_TEST_CASE(error_num_params)
 {
     for (auto fns : all_fns)
@@ -116,6 +116,7 @@ void add_int_samples_helper(
         unsigned_max_b, meta_builder().type(type).unsigned_flag(true).build());
     output.emplace_back("unsigned_zerofill", std::move(zerofill_s),
         zerofill_b, meta_builder().type(type).unsigned_flag(true).zerofill(true).build());
+    output.emplace_back("signed_plus", "+20", std::int64_t(20), create_meta(type));
 }
 
 void add_int_samples(std::vector<success_sample>& output)
@@ -480,6 +481,7 @@ void add_int_samples(
     output.emplace_back("unsigned_exp", "2e10", meta_unsigned);
     output.emplace_back("unsigned_lt_min", "-18446744073709551616", meta_unsigned);
     output.emplace_back("unsigned_gt_max", "18446744073709551616", meta_unsigned);
+    output.emplace_back("unsigned_gt_max_zeros", "0018446744073709551616", meta_unsigned);
 }
 
 void add_bit_samples(
@@ -531,6 +533,8 @@ void add_date_samples(std::vector<error_sample>& output)
     output.emplace_back("invalid_day",      "2010-05-32", meta);
     output.emplace_back("invalid_day_max",  "2010-05-99", meta);
     output.emplace_back("negative_day",     "2010-05--2", meta);
+    output.emplace_back("space_day",        "2010-05- 2", meta);
+    output.emplace_back("plus_month",       "2010-+5-02", meta);
 }
 
 void add_datetime_samples(
@@ -663,6 +667,9 @@ void add_time_samples(std::vector<error_sample>& output)
     output.emplace_back("trailing_5",      "22:06:01.12345k", meta_5decimals);
     output.emplace_back("trailing_6",      "22:06:01.123456k", meta_6decimals);
     output.emplace_back("double_sign",     "--22:06:01.123456", meta_6decimals);
+    output.emplace_back("plus_sign",       "+22:06:01", meta_0decimals);
+    output.emplace_back("space_hour",      " 2:06:01", meta_0decimals);
+    output.emplace_back("space_micro",     "22:06:01. 2", meta_2decimals);
 }
 
 std::vector<error_sample> make_all_samples()
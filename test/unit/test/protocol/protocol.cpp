@@ -27,6 +27,7 @@
 #include <boost/test/unit_test.hpp>
 
 #include <array>
+#include <vector>
 
 #include "operators.hpp"
 #include "serialization_test.hpp"
@@ -698,6 +699,70 @@ BOOST_AUTO_TEST_CASE(deserialize_ping_response_)
     }
 }
 
+//
+// reset connection
+//
+BOOST_AUTO_TEST_CASE(reset_connection_serialization)
+{
+    reset_connection_command cmd;
+    const std::uint8_t serialized[] = {0x1f};
+    do_serialize_toplevel_test(cmd, serialized);
+}
+
+BOOST_AUTO_TEST_CASE(deserialize_reset_connection_response_)
+{
+    struct
+    {
+        const char* name;
+        deserialization_buffer message;
+        error_code expected_err;
+        const char* expected_msg;
+    } test_cases[] = {
+        {"success",              create_ok_body(ok_builder().build()),                        error_code(),                      ""},
+        {"empty_message",        {},                                                          client_errc::incomplete_message,   ""},
+        {"invalid_message_type", {0xab},                                                      client_errc::protocol_value_error, ""},
+        {"err_packet",
+         err_builder().code(common_server_errc::er_bad_db_error).message("abc").build_body(),
+         common_server_errc::er_bad_db_error,
+         "abc"                                                                                                                     },
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        BOOST_TEST_CONTEXT(tc.name)
+        {
+            diagnostics diag;
+            auto err = deserialize_reset_connection_response(tc.message, db_flavor::mysql, diag);
+
+            BOOST_TEST(err == tc.expected_err);
+            BOOST_TEST(diag.server_message() == tc.expected_msg);
+        }
+    }
+}
+
+//
+// change user
+//
+BOOST_AUTO_TEST_CASE(change_user_serialization)
+{
+    constexpr std::uint8_t auth_data[] = {0x01, 0x02, 0x03};
+    change_user_command cmd{"root", auth_data, "db", 33, "mysql_native_password"};
+    const std::uint8_t serialized[] = {0x11, 0x72, 0x6f, 0x6f, 0x74, 0x00, 0x03, 0x01, 0x02, 0x03, 0x64,
+                                       0x62, 0x00, 0x21, 0x00, 0x6d, 0x79, 0x73, 0x71, 0x6c, 0x5f, 0x6e,
+                                       0x61, 0x74, 0x69, 0x76, 0x65, 0x5f, 0x70, 0x61, 0x73, 0x73, 0x77,
+                                       0x6f, 0x72, 0x64, 0x00};
+    do_serialize_toplevel_test(cmd, serialized);
+}
+
+BOOST_AUTO_TEST_CASE(change_user_serialization_empty)
+{
+    change_user_command cmd{"root", {}, "", 45, "caching_sha2_password"};
+    const std::uint8_t serialized[] = {0x11, 0x72, 0x6f, 0x6f, 0x74, 0x00, 0x00, 0x00, 0x2d, 0x00, 0x63,
+                                       0x61, 0x63, 0x68, 0x69, 0x6e, 0x67, 0x5f, 0x73, 0x68, 0x61, 0x32,
+                                       0x5f, 0x70, 0x61, 0x73, 0x73, 0x77, 0x6f, 0x72, 0x64, 0x00};
+    do_serialize_toplevel_test(cmd, serialized);
+}
+
 //
 // query
 //
@@ -725,7 +790,7 @@ BOOST_AUTO_TEST_CASE(prepare_statement_serialization)
 BOOST_AUTO_TEST_CASE(deserialize_prepare_stmt_response_impl_success)
 {
     // Data (statement_id, num fields, num params)
-    prepare_stmt_response expected{1, 2, 3};
+    prepare_stmt_response expected{1, 2, 3, true};
     deserialization_buffer serialized{0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00};
     prepare_stmt_response actual{};
     auto err = deserialize_prepare_stmt_response_impl(serialized, actual);
@@ -737,6 +802,65 @@ BOOST_AUTO_TEST_CASE(deserialize_prepare_stmt_response_impl_success)
     BOOST_TEST(actual.id == expected.id);
     BOOST_TEST(actual.num_columns == expected.num_columns);
     BOOST_TEST(actual.num_params == expected.num_params);
+    BOOST_TEST(actual.metadata_follows == expected.metadata_follows);
+}
+
+BOOST_AUTO_TEST_CASE(deserialize_prepare_stmt_response_impl_optional_metadata)
+{
+    struct
+    {
+        const char* name;
+        deserialization_buffer serialized;
+        bool metadata_follows;
+    } test_cases[] = {
+        {"none", {0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00}, false},
+        {"full", {0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01}, true },
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        BOOST_TEST_CONTEXT(tc.name)
+        {
+            prepare_stmt_response actual{};
+            auto err = deserialize_prepare_stmt_response_impl(tc.serialized, actual, true);
+
+            BOOST_TEST_REQUIRE(err == error_code());
+            BOOST_TEST(actual.id == 1u);
+            BOOST_TEST(actual.num_columns == 2u);
+            BOOST_TEST(actual.num_params == 3u);
+            BOOST_TEST(actual.metadata_follows == tc.metadata_follows);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(deserialize_prepare_stmt_response_impl_optional_metadata_error)
+{
+    struct
+    {
+        const char* name;
+        error_code expected_err;
+        deserialization_buffer serialized;
+    } test_cases[] = {
+        {"missing",
+         client_errc::incomplete_message,
+         {0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x03, 0x00, 0x00, 0x00}            },
+        {"invalid",
+         client_errc::protocol_value_error,
+         {0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x03, 0x00, 0x00, 0x00, 0x02}      },
+        {"extra_bytes",
+         client_errc::extra_bytes,
+         {0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0xff}},
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        BOOST_TEST_CONTEXT(tc.name)
+        {
+            prepare_stmt_response output{};
+            auto err = deserialize_prepare_stmt_response_impl(tc.serialized, output, true);
+            BOOST_TEST(err == tc.expected_err);
+        }
+    }
 }
 
 BOOST_AUTO_TEST_CASE(deserialize_prepare_stmt_response_impl_error)
@@ -774,7 +898,7 @@ BOOST_AUTO_TEST_CASE(deserialize_prepare_stmt_response_impl_error)
 BOOST_AUTO_TEST_CASE(deserialize_prepare_stmt_response_success)
 {
     // Data (statement_id, num fields, num params)
-    prepare_stmt_response expected{1, 2, 3};
+    prepare_stmt_response expected{1, 2, 3, true};
     deserialization_buffer serialized{0x00, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00};
     prepare_stmt_response actual{};
     diagnostics diag;
@@ -965,7 +1089,125 @@ BOOST_AUTO_TEST_CASE(execute_statement_serialization)
     {
         BOOST_TEST_CONTEXT(tc.name)
         {
-            execute_stmt_command cmd{tc.stmt_id, tc.params};
+            execute_stmt_command cmd{tc.stmt_id, tc.params, true, false, {}};
+            do_serialize_toplevel_test(cmd, tc.serialized);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(execute_statement_serialization_no_types)
+{
+    // new_params_bind_flag is zero and types are omitted
+    const auto params = make_fv_vector(string_view("test"), nullptr);
+    execute_stmt_command cmd{2, params, false, false, {}};
+    const std::uint8_t serialized[] = {
+        0x17, 0x02, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x04, 0x74, 0x65, 0x73, 0x74,
+    };
+    do_serialize_toplevel_test(cmd, serialized);
+}
+
+BOOST_AUTO_TEST_CASE(execute_statement_serialization_cursor)
+{
+    // flags is CURSOR_TYPE_READ_ONLY
+    execute_stmt_command cmd{1, {}, true, true, {}};
+    const std::uint8_t serialized[] = {0x17, 0x01, 0x00, 0x00, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00};
+    do_serialize_toplevel_test(cmd, serialized);
+}
+
+BOOST_AUTO_TEST_CASE(execute_statement_serialization_long_data)
+{
+    // The 1st parameter was sent with COM_STMT_SEND_LONG_DATA. Its type is sent, but not its value
+    const auto params = make_fv_vector(string_view("test"), 42);
+    const std::uint8_t long_data[] = {1, 0};
+    execute_stmt_command cmd{2, params, true, false, long_data};
+    const std::uint8_t serialized[] = {
+        0x17, 0x02, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x01, 0xfe,
+        0x00, 0x08, 0x00, 0x2a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    };
+    do_serialize_toplevel_test(cmd, serialized);
+    BOOST_TEST(cmd.get_external_size(1) == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(execute_statement_serialization_gather)
+{
+    // Strings and blobs with at least 3 bytes are not copied
+    constexpr std::uint8_t blob_buffer[] = {0x70, 0x00, 0x01, 0xff};
+    const auto params = make_fv_vector(
+        string_view("test"),
+        42,
+        string_view("ab"),
+        span<const std::uint8_t>(blob_buffer)
+    );
+    execute_stmt_command cmd{2, params, false, false, {}};
+    BOOST_TEST(cmd.get_size() == 33u);
+    BOOST_TEST(cmd.get_external_size(3) == 8u);
+
+    // Serialize
+    std::vector<external_buffer> external;
+    serialization_buffer buffer(25);
+    cmd.serialize(buffer, 3, external);
+
+    // Only the lengths of external parameters are serialized
+    const std::uint8_t serialized[] = {
+        0x17, 0x02, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04,
+        0x2a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x61, 0x62, 0x04,
+    };
+    buffer.check(serialized);
+
+    // External parameters are referenced in place
+    BOOST_TEST_REQUIRE(external.size() == 2u);
+    BOOST_TEST(external[0].offset == 13u);
+    const void* str_data = params[0].get_string().data();
+    BOOST_TEST(static_cast<const void*>(external[0].data.data()) == str_data);
+    BOOST_TEST(external[0].data.size() == 4u);
+    BOOST_TEST(external[1].offset == 25u);
+    BOOST_TEST(external[1].data.data() == blob_buffer);
+    BOOST_TEST(external[1].data.size() == 4u);
+}
+
+//
+// execute statement in bulk
+//
+BOOST_AUTO_TEST_CASE(execute_statement_bulk_serialization)
+{
+    struct
+    {
+        const char* name;
+        std::vector<field_view> params;
+        std::size_t num_params;
+        std::vector<std::uint8_t> serialized;
+    } test_cases[] = {
+  // clang-format off
+        {
+            "one_param",
+            make_fv_vector(42, 43),
+            1,
+            {0xfa, 0x02, 0x00, 0x00, 0x00, 0x80, 0x00, 0x08, 0x00,
+             0x00, 0x2a, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+             0x00, 0x2b, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00}
+        },
+        {
+            "nulls",
+            make_fv_vector(string_view("test"), nullptr, nullptr, std::uint64_t(3)),
+            2,
+            {0xfa, 0x02, 0x00, 0x00, 0x00, 0x80, 0x00, 0xfe, 0x00, 0x08, 0x80,
+             0x00, 0x04, 0x74, 0x65, 0x73, 0x74, 0x01,
+             0x01, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00}
+        },
+        {
+            "all_nulls",
+            make_fv_vector(nullptr, nullptr),
+            1,
+            {0xfa, 0x02, 0x00, 0x00, 0x00, 0x80, 0x00, 0x06, 0x00, 0x01, 0x01}
+        },
+  // clang-format on
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        BOOST_TEST_CONTEXT(tc.name)
+        {
+            execute_stmt_bulk_command cmd{2, tc.params, tc.num_params};
             do_serialize_toplevel_test(cmd, tc.serialized);
         }
     }
@@ -981,6 +1223,78 @@ BOOST_AUTO_TEST_CASE(close_statement_serialization)
     do_serialize_toplevel_test(cmd, serialized);
 }
 
+//
+// send long data
+//
+BOOST_AUTO_TEST_CASE(send_long_data_serialization)
+{
+    const std::uint8_t data[] = {0x61, 0x62, 0x63};
+    send_long_data_command cmd{1, 2, data};
+    const std::uint8_t serialized[] = {0x18, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x61, 0x62, 0x63};
+    do_serialize_toplevel_test(cmd, serialized);
+}
+
+BOOST_AUTO_TEST_CASE(send_long_data_serialization_head)
+{
+    // Only the head is written, so data can be placed after it without copies
+    send_long_data_command cmd{0x0a0b0c0d, 0x0102, {}};
+    const std::uint8_t serialized[] = {0x18, 0x0d, 0x0c, 0x0b, 0x0a, 0x02, 0x01};
+    serialization_buffer buffer(send_long_data_command::head_size);
+    cmd.serialize_head(buffer);
+    buffer.check(serialized);
+}
+
+//
+// reset statement
+//
+BOOST_AUTO_TEST_CASE(reset_statement_serialization)
+{
+    reset_stmt_command cmd{1};
+    const std::uint8_t serialized[] = {0x1a, 0x01, 0x00, 0x00, 0x00};
+    do_serialize_toplevel_test(cmd, serialized);
+}
+
+BOOST_AUTO_TEST_CASE(deserialize_reset_statement_response_)
+{
+    struct
+    {
+        const char* name;
+        deserialization_buffer message;
+        error_code expected_err;
+        const char* expected_msg;
+    } test_cases[] = {
+        {"success",              create_ok_body(ok_builder().build()),                        error_code(),                      ""},
+        {"empty_message",        {},                                                          client_errc::incomplete_message,   ""},
+        {"invalid_message_type", {0xab},                                                      client_errc::protocol_value_error, ""},
+        {"err_packet",
+         err_builder().code(common_server_errc::er_unknown_stmt_handler).message("abc").build_body(),
+         common_server_errc::er_unknown_stmt_handler,
+         "abc"                                                                                                                     },
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        BOOST_TEST_CONTEXT(tc.name)
+        {
+            diagnostics diag;
+            auto err = deserialize_reset_stmt_response(tc.message, db_flavor::mysql, diag);
+
+            BOOST_TEST(err == tc.expected_err);
+            BOOST_TEST(diag.server_message() == tc.expected_msg);
+        }
+    }
+}
+
+//
+// fetch statement
+//
+BOOST_AUTO_TEST_CASE(fetch_statement_serialization)
+{
+    fetch_stmt_command cmd{1, 0x1020};
+    const std::uint8_t serialized[] = {0x1c, 0x01, 0x00, 0x00, 0x00, 0x20, 0x10, 0x00, 0x00};
+    do_serialize_toplevel_test(cmd, serialized);
+}
+
 //
 // execute response
 //
@@ -1023,11 +1337,91 @@ BOOST_AUTO_TEST_CASE(deserialize_execute_response_num_fields)
 
             BOOST_TEST_REQUIRE(response.type == execute_response::type_t::num_fields);
             BOOST_TEST(response.data.num_fields == tc.num_fields);
+            BOOST_TEST(response.metadata_follows);
             BOOST_TEST(diag.server_message() == "");
         }
     }
 }
 
+BOOST_AUTO_TEST_CASE(deserialize_execute_response_optional_metadata)
+{
+    struct
+    {
+        const char* name;
+        deserialization_buffer serialized;
+        std::size_t num_fields;
+        bool metadata_follows;
+    } test_cases[] = {
+        {"none",        {0x01, 0x00},             1,      false},
+        {"full",        {0x01, 0x01},             1,      true },
+        {"lenenc_none", {0xfc, 0xff, 0x01, 0x00}, 0x01ff, false},
+        {"lenenc_full", {0xfc, 0xff, 0x01, 0x01}, 0x01ff, true },
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        BOOST_TEST_CONTEXT(tc.name)
+        {
+            diagnostics diag;
+
+            auto response = deserialize_execute_response(tc.serialized, db_flavor::mysql, diag, false, true);
+
+            BOOST_TEST_REQUIRE(response.type == execute_response::type_t::num_fields);
+            BOOST_TEST(response.data.num_fields == tc.num_fields);
+            BOOST_TEST(response.metadata_follows == tc.metadata_follows);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(deserialize_execute_response_optional_metadata_error)
+{
+    struct
+    {
+        const char* name;
+        deserialization_buffer serialized;
+        error_code err;
+    } test_cases[] = {
+        {"missing",     {0x01},             client_errc::incomplete_message  },
+        {"invalid",     {0x01, 0x02},       client_errc::protocol_value_error},
+        {"extra_bytes", {0x01, 0x01, 0x00}, client_errc::extra_bytes         },
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        BOOST_TEST_CONTEXT(tc.name)
+        {
+            diagnostics diag;
+
+            auto response = deserialize_execute_response(tc.serialized, db_flavor::mysql, diag, false, true);
+
+            BOOST_TEST_REQUIRE(response.type == execute_response::type_t::error);
+            BOOST_TEST(response.data.err == tc.err);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(deserialize_execute_response_local_infile)
+{
+    deserialization_buffer serialized{0xfb, 0x66, 0x2e, 0x63, 0x73, 0x76};
+    diagnostics diag;
+
+    auto response = deserialize_execute_response(serialized, db_flavor::mysql, diag, true);
+
+    BOOST_TEST_REQUIRE(response.type == execute_response::type_t::local_infile);
+    BOOST_TEST(response.data.infile.filename == "f.csv");
+}
+
+BOOST_AUTO_TEST_CASE(deserialize_execute_response_local_infile_empty_filename)
+{
+    deserialization_buffer serialized{0xfb};
+    diagnostics diag;
+
+    auto response = deserialize_execute_response(serialized, db_flavor::mysql, diag, true);
+
+    BOOST_TEST_REQUIRE(response.type == execute_response::type_t::local_infile);
+    BOOST_TEST(response.data.infile.filename == "");
+}
+
 BOOST_AUTO_TEST_CASE(deserialize_execute_response_error)
 {
     struct
@@ -1098,6 +1492,24 @@ BOOST_AUTO_TEST_CASE(deserialize_row_message_ok_packet)
     BOOST_TEST(response.data.ok_pack.info == "abc");
 }
 
+BOOST_AUTO_TEST_CASE(deserialize_row_message_legacy_eof_packet)
+{
+    // Sent after the metadata of a resultset read using a cursor
+    deserialization_buffer serialized{0xfe, 0x01, 0x00, 0x42, 0x00};
+    diagnostics diag;
+
+    auto response = deserialize_row_message(serialized, db_flavor::mysql, diag);
+
+    BOOST_TEST_REQUIRE(response.type == row_message::type_t::ok_packet);
+    BOOST_TEST(response.data.ok_pack.affected_rows == 0u);
+    BOOST_TEST(response.data.ok_pack.last_insert_id == 0u);
+    BOOST_TEST(response.data.ok_pack.warnings == 1u);
+    BOOST_TEST(response.data.ok_pack.status_flags == 0x42u);
+    BOOST_TEST(response.data.ok_pack.cursor_exists());
+    BOOST_TEST(!response.data.ok_pack.last_row_sent());
+    BOOST_TEST(response.data.ok_pack.info == "");
+}
+
 BOOST_AUTO_TEST_CASE(deserialize_row_message_error)
 {
     struct
@@ -1480,13 +1892,51 @@ BOOST_AUTO_TEST_CASE(deserialize_server_hello_impl_success)
 
     // Actual value
     BOOST_TEST(actual.server == db_flavor::mysql);
+    BOOST_TEST(actual.connection_id == 2u);
     BOOST_MYSQL_ASSERT_BUFFER_EQUALS(actual.auth_plugin_data.to_span(), auth_plugin_data);
     BOOST_TEST(actual.server_capabilities == capabilities(caps));
+    BOOST_TEST(actual.mariadb_capabilities == capabilities());
     BOOST_TEST(actual.auth_plugin_name == "mysql_native_password");
 
     // TODO: mysql8, mariadb, edge case where auth plugin length is < 13
 }
 
+BOOST_AUTO_TEST_CASE(deserialize_server_hello_impl_mariadb_capabilities)
+{
+    // Same as above, but without CLIENT_LONG_PASSWORD and with extended capabilities
+    // in the last 4 bytes of the reserved field, as MariaDB servers do
+    struct
+    {
+        const char* name;
+        std::uint8_t capability_flags_first_byte;
+        capabilities expected;
+    } test_cases[] = {
+        {"mariadb", 0xfe, capabilities(MARIADB_CLIENT_STMT_BULK_OPERATIONS | MARIADB_CLIENT_PROGRESS)},
+        {"mysql",   0xff, capabilities()                                                           },
+    };
+
+    for (const auto& tc : test_cases)
+    {
+        BOOST_TEST_CONTEXT(tc.name)
+        {
+            deserialization_buffer serialized{
+                0x35, 0x2e, 0x37, 0x2e, 0x32, 0x37, 0x2d, 0x30, 0x75, 0x62, 0x75, 0x6e, 0x74, 0x75, 0x30,
+                0x2e, 0x31, 0x39, 0x2e, 0x30, 0x34, 0x2e, 0x31, 0x00, 0x02, 0x00, 0x00, 0x00, 0x52, 0x1a,
+                0x50, 0x3a, 0x4b, 0x12, 0x70, 0x2f, 0x00, tc.capability_flags_first_byte,
+                0xf7, 0x08, 0x02, 0x00, 0xff, 0x81, 0x15, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+                0x05, 0x00, 0x00, 0x00, 0x03, 0x5a, 0x74, 0x05, 0x28, 0x2b, 0x7f, 0x21, 0x43, 0x4a,
+                0x21, 0x62, 0x00, 0x6d, 0x79, 0x73, 0x71, 0x6c, 0x5f, 0x6e, 0x61, 0x74, 0x69, 0x76,
+                0x65, 0x5f, 0x70, 0x61, 0x73, 0x73, 0x77, 0x6f, 0x72, 0x64, 0x00};
+
+            server_hello actual{};
+            auto err = deserialize_server_hello_impl(serialized, actual);
+
+            BOOST_TEST_REQUIRE(err == error_code());
+            BOOST_TEST(actual.mariadb_capabilities == tc.expected);
+        }
+    }
+}
+
 BOOST_AUTO_TEST_CASE(deserialize_server_hello_impl_error)
 {
     struct
@@ -1673,6 +2123,8 @@ BOOST_AUTO_TEST_CASE(login_request_serialization)
                 auth_data,
                 "",                       // database; irrelevant, not using connect with DB capability
                 "mysql_native_password",  // auth plugin name
+                0,                        // zstd level; irrelevant, not using zstd compression
+                capabilities(),           // MariaDB capabilities
             },
             {0x85, 0xa6, 0xff, 0x01, 0x00, 0x00, 0x00, 0x01, 0x21, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
              0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -1690,6 +2142,8 @@ BOOST_AUTO_TEST_CASE(login_request_serialization)
                 auth_data,
                 "database",               // DB name
                 "mysql_native_password",  // auth plugin name
+                0,                        // zstd level; irrelevant, not using zstd compression
+                capabilities(),           // MariaDB capabilities
             },
             {0x8d, 0xa6, 0xff, 0x01, 0x00, 0x00, 0x00, 0x01, 0x21, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
              0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
@@ -1698,6 +2152,45 @@ BOOST_AUTO_TEST_CASE(login_request_serialization)
              0x74, 0x61, 0x62, 0x61, 0x73, 0x65, 0x00, 0x6d, 0x79, 0x73, 0x71, 0x6c, 0x5f, 0x6e, 0x61,
              0x74, 0x69, 0x76, 0x65, 0x5f, 0x70, 0x61, 0x73, 0x73, 0x77, 0x6f, 0x72, 0x64, 0x00},
         },
+        {
+            "with_zstd",
+            {
+                capabilities(caps | CLIENT_ZSTD_COMPRESSION_ALGORITHM),
+                16777216,  // max packet size
+                collations::utf8_general_ci,
+                "root",  // username
+                auth_data,
+                "",                       // database; irrelevant, not using connect with DB capability
+                "mysql_native_password",  // auth plugin name
+                3,                        // zstd level
+                capabilities(),           // MariaDB capabilities
+            },
+            {0x85, 0xa6, 0xff, 0x05, 0x00, 0x00, 0x00, 0x01, 0x21, 0x00, 0x00, 0x00, 0x00, 0x00,
+             0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+             0x00, 0x00, 0x00, 0x00, 0x72, 0x6f, 0x6f, 0x74, 0x00, 0x14, 0xfe, 0xc6, 0x2c, 0x9f,
+             0xab, 0x43, 0x69, 0x46, 0xc5, 0x51, 0x35, 0xa5, 0xff, 0xdb, 0x3f, 0x48, 0xe6, 0xfc,
+             0x34, 0xc9, 0x6d, 0x79, 0x73, 0x71, 0x6c, 0x5f, 0x6e, 0x61, 0x74, 0x69, 0x76, 0x65,
+             0x5f, 0x70, 0x61, 0x73, 0x73, 0x77, 0x6f, 0x72, 0x64, 0x00, 0x03},
+        },
+        {
+            "with_mariadb_capabilities",
+            {
+                capabilities(caps & ~CLIENT_LONG_PASSWORD),
+                16777216,  // max packet size
+                collations::utf8_general_ci,
+                "root",  // username
+                auth_data,
+                "",                       // database; irrelevant, not using connect with DB capability
+                "mysql_native_password",  // auth plugin name
+                0,                        // zstd level; irrelevant, not using zstd compression
+                capabilities(MARIADB_CLIENT_STMT_BULK_OPERATIONS),
+            },
+            {0x84, 0xa6, 0xff, 0x01, 0x00, 0x00, 0x00, 0x01, 0x21, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+             0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00,
+             0x72, 0x6f, 0x6f, 0x74, 0x00, 0x14, 0xfe, 0xc6, 0x2c, 0x9f, 0xab, 0x43, 0x69, 0x46, 0xc5, 0x51,
+             0x35, 0xa5, 0xff, 0xdb, 0x3f, 0x48, 0xe6, 0xfc, 0x34, 0xc9, 0x6d, 0x79, 0x73, 0x71, 0x6c, 0x5f,
+             0x6e, 0x61, 0x74, 0x69, 0x76, 0x65, 0x5f, 0x70, 0x61, 0x73, 0x73, 0x77, 0x6f, 0x72, 0x64, 0x00},
+        },
     };
 
     // TODO: test case with collation > 0xff
@@ -1723,6 +2216,7 @@ BOOST_AUTO_TEST_CASE(ssl_request_serialization)
         capabilities(caps),
         0x1000000,  // max packet size
         collations::utf8mb4_general_ci,
+        capabilities(),  // MariaDB capabilities
     };
 
     const std::uint8_t serialized[] = {0x84, 0xae, 0x9f, 0x20, 0x00, 0x00, 0x00, 0x01, 0x2d, 0x00, 0x00,
@@ -1734,6 +2228,29 @@ BOOST_AUTO_TEST_CASE(ssl_request_serialization)
     // TODO: test case with collation > 0xff
 }
 
+BOOST_AUTO_TEST_CASE(ssl_request_serialization_mariadb_capabilities)
+{
+    constexpr std::uint32_t caps = CLIENT_LONG_FLAG | CLIENT_LOCAL_FILES | CLIENT_PROTOCOL_41 |
+                                   CLIENT_INTERACTIVE | CLIENT_SSL | CLIENT_TRANSACTIONS |
+                                   CLIENT_SECURE_CONNECTION | CLIENT_MULTI_STATEMENTS | CLIENT_MULTI_RESULTS |
+                                   CLIENT_PS_MULTI_RESULTS | CLIENT_PLUGIN_AUTH | CLIENT_CONNECT_ATTRS |
+                                   CLIENT_SESSION_TRACK | (1UL << 29);
+
+    // Data
+    ssl_request value{
+        capabilities(caps),
+        0x1000000,  // max packet size
+        collations::utf8mb4_general_ci,
+        capabilities(MARIADB_CLIENT_STMT_BULK_OPERATIONS),
+    };
+
+    const std::uint8_t serialized[] = {0x84, 0xae, 0x9f, 0x20, 0x00, 0x00, 0x00, 0x01, 0x2d, 0x00, 0x00,
+                                       0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+                                       0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00};
+
+    do_serialize_toplevel_test(value, serialized);
+}
+
 //
 // auth switch
 //
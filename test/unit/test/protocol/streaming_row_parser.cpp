@@ -0,0 +1,286 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/client_errc.hpp>
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/error_code.hpp>
+#include <boost/mysql/field_chunk.hpp>
+#include <boost/mysql/metadata.hpp>
+
+#include <boost/mysql/detail/any_field_chunk_handler.hpp>
+#include <boost/mysql/detail/resultset_encoding.hpp>
+
+#include <boost/mysql/impl/internal/protocol/streaming_row_parser.hpp>
+
+#include <boost/core/span.hpp>
+#include <boost/test/unit_test.hpp>
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+#include "test_common/assert_buffer_equals.hpp"
+#include "test_common/printing.hpp"
+#include "test_unit/create_meta.hpp"
+
+using namespace boost::mysql::detail;
+using namespace boost::mysql::test;
+using boost::span;
+using boost::mysql::client_errc;
+using boost::mysql::column_type;
+using boost::mysql::error_code;
+using boost::mysql::field_chunk;
+using boost::mysql::metadata;
+
+BOOST_AUTO_TEST_SUITE(test_streaming_row_parser)
+
+// Records the chunks it receives, concatenating the ones belonging to the same field
+struct chunk_collector final : any_field_chunk_handler
+{
+    struct streamed_field
+    {
+        std::size_t column_index;
+        std::size_t field_size;
+        std::vector<std::uint8_t> data;
+        bool last_received;
+    };
+
+    std::vector<streamed_field> fields;
+    std::size_t num_chunks{};
+    error_code err_to_set;
+
+    void on_chunk(const field_chunk& chunk, error_code& ec) override
+    {
+        ++num_chunks;
+        if (chunk.offset == 0u)
+            fields.push_back(streamed_field{chunk.column_index, chunk.field_size, {}, false});
+        auto& f = fields.back();
+        BOOST_TEST(chunk.column_index == f.column_index);
+        BOOST_TEST(chunk.offset == f.data.size());
+        BOOST_TEST(!f.last_received);
+        f.data.insert(f.data.end(), chunk.data.begin(), chunk.data.end());
+        f.last_received = chunk.is_last();
+        ec = err_to_set;
+    }
+};
+
+struct fixture
+{
+    std::vector<metadata> meta;
+    chunk_collector handler;
+    std::vector<std::uint8_t> output;
+
+    fixture(const std::vector<column_type>& types) : meta(create_metas(types)) {}
+
+    // Parses msg in pieces of piece_size bytes
+    error_code parse(
+        resultset_encoding enc,
+        std::size_t min_size,
+        span<const std::uint8_t> msg,
+        std::size_t piece_size
+    )
+    {
+        handler.fields.clear();
+        output.clear();
+        streaming_row_parser parser(enc, meta, min_size, handler, output);
+        for (std::size_t offset = 0; offset < msg.size(); offset += piece_size)
+        {
+            std::size_t size = (std::min)(piece_size, msg.size() - offset);
+            auto err = parser.parse(msg.subspan(offset, size));
+            if (err)
+                return err;
+        }
+        return parser.finish();
+    }
+};
+
+BOOST_AUTO_TEST_CASE(text_not_streamed)
+{
+    fixture fix({column_type::varchar, column_type::int_});
+    const std::vector<std::uint8_t> msg{0x03, 'a', 'b', 'c', 0x02, '4', '2'};
+
+    for (std::size_t piece_size = 1; piece_size <= msg.size(); ++piece_size)
+    {
+        BOOST_TEST_CONTEXT(piece_size)
+        {
+            auto err = fix.parse(resultset_encoding::text, 4, msg, piece_size);
+            BOOST_TEST(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.output, msg);
+            BOOST_TEST(fix.handler.fields.size() == 0u);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(text_streamed)
+{
+    fixture fix({column_type::varchar, column_type::blob, column_type::varchar, column_type::text});
+    const std::vector<std::uint8_t> msg{
+        0x02, 'a',  'b',                                           // varchar, too small
+        0x0a, '0',  '1', '2', '3', '4', '5', '6', '7', '8', '9',  // blob, streamed
+        0xfb,                                                      // NULL
+        0x05, 'v',  'w', 'x', 'y', 'z',                            // text, streamed
+    };
+    const std::vector<std::uint8_t> expected_output{0x02, 'a', 'b', 0x00, 0xfb, 0x00};
+    const std::vector<std::uint8_t> expected_blob{'0', '1', '2', '3', '4', '5', '6', '7', '8', '9'};
+    const std::vector<std::uint8_t> expected_text{'v', 'w', 'x', 'y', 'z'};
+
+    for (std::size_t piece_size = 1; piece_size <= msg.size(); ++piece_size)
+    {
+        BOOST_TEST_CONTEXT(piece_size)
+        {
+            auto err = fix.parse(resultset_encoding::text, 5, msg, piece_size);
+            BOOST_TEST(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.output, expected_output);
+            BOOST_TEST_REQUIRE(fix.handler.fields.size() == 2u);
+            BOOST_TEST(fix.handler.fields[0].column_index == 1u);
+            BOOST_TEST(fix.handler.fields[0].field_size == 10u);
+            BOOST_TEST(fix.handler.fields[0].last_received);
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.handler.fields[0].data, expected_blob);
+            BOOST_TEST(fix.handler.fields[1].column_index == 3u);
+            BOOST_TEST(fix.handler.fields[1].field_size == 5u);
+            BOOST_TEST(fix.handler.fields[1].last_received);
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.handler.fields[1].data, expected_text);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(text_multibyte_length)
+{
+    fixture fix({column_type::blob});
+    std::vector<std::uint8_t> value(300, 0x42);
+    std::vector<std::uint8_t> msg{0xfc, 0x2c, 0x01};
+    msg.insert(msg.end(), value.begin(), value.end());
+
+    // Streamed
+    auto err = fix.parse(resultset_encoding::text, 300, msg, 7);
+    BOOST_TEST(err == error_code());
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.output, (std::vector<std::uint8_t>{0x00}));
+    BOOST_TEST_REQUIRE(fix.handler.fields.size() == 1u);
+    BOOST_TEST(fix.handler.fields[0].field_size == 300u);
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.handler.fields[0].data, value);
+
+    // Not streamed
+    err = fix.parse(resultset_encoding::text, 301, msg, 7);
+    BOOST_TEST(err == error_code());
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.output, msg);
+    BOOST_TEST(fix.handler.fields.size() == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(text_type_not_streamable)
+{
+    // Only string and blob types are streamed
+    fixture fix({column_type::decimal, column_type::datetime});
+    const std::vector<std::uint8_t> msg{
+        0x04, '1', '.', '2', '3',
+        0x0a, '2', '0', '2', '3', '-', '0', '1', '-', '0', '1',
+    };
+
+    auto err = fix.parse(resultset_encoding::text, 1, msg, 3);
+    BOOST_TEST(err == error_code());
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.output, msg);
+    BOOST_TEST(fix.handler.fields.size() == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(binary)
+{
+    fixture fix({
+        column_type::tinyint,
+        column_type::bigint,
+        column_type::datetime,
+        column_type::blob,
+        column_type::varchar,
+        column_type::double_,
+        column_type::date,
+    });
+    const std::vector<std::uint8_t> msg{
+        0x00,                                            // header
+        0x40, 0x00,                                      // null bitmap: the varchar is NULL
+        0x05,                                            // tinyint
+        0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08,  // bigint
+        0x04, 0xe7, 0x07, 0x01, 0x02,                    // datetime
+        0x06, 'a',  'b',  'c',  'd',  'e',  'f',         // blob, streamed
+        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xf0, 0x3f,  // double
+        0x00,                                            // date (zero)
+    };
+    const std::vector<std::uint8_t> expected_output{
+        0x00, 0x40, 0x00, 0x05, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x04, 0xe7, 0x07, 0x01,
+        0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xf0, 0x3f, 0x00,
+    };
+    const std::vector<std::uint8_t> expected_blob{'a', 'b', 'c', 'd', 'e', 'f'};
+
+    for (std::size_t piece_size = 1; piece_size <= msg.size(); ++piece_size)
+    {
+        BOOST_TEST_CONTEXT(piece_size)
+        {
+            auto err = fix.parse(resultset_encoding::binary, 4, msg, piece_size);
+            BOOST_TEST(err == error_code());
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.output, expected_output);
+            BOOST_TEST_REQUIRE(fix.handler.fields.size() == 1u);
+            BOOST_TEST(fix.handler.fields[0].column_index == 3u);
+            BOOST_TEST(fix.handler.fields[0].last_received);
+            BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.handler.fields[0].data, expected_blob);
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(binary_trailing_nulls)
+{
+    fixture fix({column_type::varchar, column_type::blob});
+    const std::vector<std::uint8_t> msg{0x00, 0x0c};  // both fields are NULL
+
+    auto err = fix.parse(resultset_encoding::binary, 1, msg, 1);
+    BOOST_TEST(err == error_code());
+    BOOST_MYSQL_ASSERT_BUFFER_EQUALS(fix.output, msg);
+    BOOST_TEST(fix.handler.fields.size() == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(handler_error)
+{
+    // The handler stops receiving chunks after reporting an error,
+    // but the rest of the message is parsed
+    fixture fix({column_type::blob, column_type::blob});
+    fix.handler.err_to_set = client_errc::wrong_num_params;
+    const std::vector<std::uint8_t> msg{0x03, 'a', 'b', 'c', 0x02, 'd', 'e'};
+
+    auto err = fix.parse(resultset_encoding::text, 1, msg, 2);
+    BOOST_TEST(err == client_errc::wrong_num_params);
+    BOOST_TEST(fix.handler.num_chunks == 1u);
+}
+
+BOOST_AUTO_TEST_CASE(error_extra_bytes)
+{
+    fixture fix({column_type::varchar});
+    const std::vector<std::uint8_t> msg{0x01, 'a', 0x00};
+
+    auto err = fix.parse(resultset_encoding::text, 1, msg, 3);
+    BOOST_TEST(err == client_errc::extra_bytes);
+}
+
+BOOST_AUTO_TEST_CASE(error_incomplete_message)
+{
+    fixture fix({column_type::varchar, column_type::varchar});
+
+    // Message ends in the middle of a field
+    const std::vector<std::uint8_t> msg1{0x01, 'a', 0x03, 'b'};
+    BOOST_TEST(fix.parse(resultset_encoding::text, 1, msg1, 2) == client_errc::incomplete_message);
+
+    // Message ends in the middle of a length
+    const std::vector<std::uint8_t> msg2{0x01, 'a', 0xfc, 0x01};
+    BOOST_TEST(fix.parse(resultset_encoding::text, 1, msg2, 2) == client_errc::incomplete_message);
+}
+
+BOOST_AUTO_TEST_CASE(error_invalid_length)
+{
+    fixture fix({column_type::varchar});
+    const std::vector<std::uint8_t> msg{0xff, 0x00};
+
+    auto err = fix.parse(resultset_encoding::text, 1, msg, 2);
+    BOOST_TEST(err == client_errc::protocol_value_error);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,109 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/resolver_cache.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+
+#include <boost/asio/ip/address.hpp>
+#include <boost/asio/ip/tcp.hpp>
+#include <boost/test/unit_test.hpp>
+
+#include <chrono>
+#include <vector>
+
+using namespace boost::mysql;
+using boost::asio::ip::make_address;
+using boost::asio::ip::tcp;
+using std::chrono::seconds;
+
+BOOST_AUTO_TEST_SUITE(test_resolver_cache)
+
+const std::chrono::steady_clock::time_point t0{};
+const std::vector<tcp::endpoint> endpoints{tcp::endpoint(make_address("127.0.0.1"), 3306)};
+
+BOOST_AUTO_TEST_CASE(default_ctor)
+{
+    resolver_cache cache;
+    BOOST_TEST((cache.ttl() == std::chrono::minutes(1)));
+    BOOST_TEST(cache.size() == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(set_ttl)
+{
+    resolver_cache cache(seconds(10));
+    BOOST_TEST((cache.ttl() == seconds(10)));
+    cache.set_ttl(seconds(20));
+    BOOST_TEST((cache.ttl() == seconds(20)));
+}
+
+BOOST_AUTO_TEST_CASE(find_insert)
+{
+    resolver_cache cache(seconds(10));
+    auto& impl = detail::access::get_impl(cache);
+
+    impl.insert("localhost", 3306, endpoints, t0);
+    BOOST_TEST(cache.size() == 1u);
+
+    // Found before the ttl elapses
+    auto* res = impl.find("localhost", 3306, t0 + seconds(9));
+    BOOST_TEST_REQUIRE(res != nullptr);
+    BOOST_TEST(*res == endpoints);
+
+    // Host and port are both part of the key
+    BOOST_TEST(impl.find("localhost", 3307, t0) == nullptr);
+    BOOST_TEST(impl.find("otherhost", 3306, t0) == nullptr);
+
+    // Expired entries are removed
+    BOOST_TEST(impl.find("localhost", 3306, t0 + seconds(10)) == nullptr);
+    BOOST_TEST(cache.size() == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(insert_replaces)
+{
+    resolver_cache cache(seconds(10));
+    auto& impl = detail::access::get_impl(cache);
+    std::vector<tcp::endpoint> other{tcp::endpoint(make_address("10.0.0.1"), 3306)};
+
+    impl.insert("localhost", 3306, endpoints, t0);
+    impl.insert("localhost", 3306, other, t0 + seconds(5));
+    BOOST_TEST(cache.size() == 1u);
+
+    // The expiry time is also updated
+    auto* res = impl.find("localhost", 3306, t0 + seconds(14));
+    BOOST_TEST_REQUIRE(res != nullptr);
+    BOOST_TEST(*res == other);
+}
+
+BOOST_AUTO_TEST_CASE(empty_results_not_cached)
+{
+    resolver_cache cache;
+    detail::access::get_impl(cache).insert("localhost", 3306, {}, t0);
+    BOOST_TEST(cache.size() == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(zero_ttl)
+{
+    resolver_cache cache(seconds(0));
+    detail::access::get_impl(cache).insert("localhost", 3306, endpoints, t0);
+    BOOST_TEST(cache.size() == 0u);
+}
+
+BOOST_AUTO_TEST_CASE(clear)
+{
+    resolver_cache cache;
+    auto& impl = detail::access::get_impl(cache);
+    impl.insert("localhost", 3306, endpoints, t0);
+    impl.insert("otherhost", 3306, endpoints, t0);
+    BOOST_TEST(cache.size() == 2u);
+
+    cache.clear();
+    BOOST_TEST(cache.size() == 0u);
+    BOOST_TEST(impl.find("localhost", 3306, t0) == nullptr);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -0,0 +1,315 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/column_type.hpp>
+#include <boost/mysql/common_server_errc.hpp>
+#include <boost/mysql/connection.hpp>
+#include <boost/mysql/error_with_diagnostics.hpp>
+#include <boost/mysql/execution_state.hpp>
+#include <boost/mysql/row_stream.hpp>
+#include <boost/mysql/row_view.hpp>
+
+#include <boost/mysql/detail/config.hpp>
+
+#include <boost/asio/use_awaitable.hpp>
+#include <boost/test/unit_test.hpp>
+
+#include <string>
+#include <tuple>
+#include <vector>
+
+#include "test_common/create_basic.hpp"
+#include "test_unit/create_coldef_frame.hpp"
+#include "test_unit/create_err.hpp"
+#include "test_unit/create_frame.hpp"
+#include "test_unit/create_meta.hpp"
+#include "test_unit/create_ok.hpp"
+#include "test_unit/create_ok_frame.hpp"
+#include "test_unit/create_row_message.hpp"
+#include "test_unit/run_coroutine.hpp"
+#include "test_unit/test_stream.hpp"
+#include "test_unit/unit_netfun_maker.hpp"
+
+using namespace boost::mysql;
+using namespace boost::mysql::test;
+
+BOOST_AUTO_TEST_SUITE(test_row_stream)
+
+using test_connection = connection<test_stream>;
+using test_row_stream = row_stream<test_stream>;
+using read_next_netm = netfun_maker_mem<row_view, test_row_stream>;
+
+struct
+{
+    read_next_netm::signature read_next;
+    const char* name;
+} all_fns[] = {
+    {read_next_netm::sync_errc(&test_row_stream::read_next),        "sync" },
+    {read_next_netm::async_errinfo(&test_row_stream::async_read_next), "async"},
+};
+
+// Adds the head of a resultset with a single varchar column
+void add_head(test_stream& stream, std::uint8_t seqnum)
+{
+    stream.add_bytes(create_frame(seqnum, {0x01}))
+        .add_bytes(create_coldef_frame(
+            static_cast<std::uint8_t>(seqnum + 1),
+            meta_builder().type(column_type::varchar).nullable(false).build_coldef()
+        ));
+}
+
+BOOST_AUTO_TEST_CASE(several_batches)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            execution_state st;
+            test_connection conn;
+            add_head(conn.stream(), 1);
+            conn.stream().add_break();
+            conn.stream()
+                .add_bytes(create_text_row_message(3, "abc"))
+                .add_bytes(create_text_row_message(4, "def"))
+                .add_break()
+                .add_bytes(create_text_row_message(5, "ghi"))
+                .add_break()
+                .add_bytes(create_eof_frame(6, ok_builder().affected_rows(10u).build()));
+            conn.start_execution("SELECT 1", st);
+            test_row_stream stream(conn, st);
+            BOOST_TEST(!stream.done());
+
+            // 1st batch, read from the server
+            auto r = fns.read_next(stream).get();
+            BOOST_TEST(r == makerow("abc"));
+            BOOST_TEST(stream.buffered_rows() == makerows(1, "def"));
+
+            // 1st batch, buffered
+            r = fns.read_next(stream).get();
+            BOOST_TEST(r == makerow("def"));
+            BOOST_TEST(stream.buffered_rows().empty());
+
+            // 2nd batch
+            r = fns.read_next(stream).get();
+            BOOST_TEST(r == makerow("ghi"));
+
+            // The 3rd batch is empty because it only contains the OK packet
+            r = fns.read_next(stream).get();
+            BOOST_TEST(r.empty());
+            BOOST_TEST(stream.done());
+            BOOST_TEST(st.complete());
+            BOOST_TEST(st.affected_rows() == 10u);
+
+            // Reading again is well-defined
+            r = fns.read_next(stream).get();
+            BOOST_TEST(r.empty());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(empty_resultset)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            execution_state st;
+            test_connection conn;
+            conn.stream().add_bytes(create_ok_frame(1, ok_builder().affected_rows(4u).build()));
+            conn.start_execution("DELETE FROM t", st);
+            test_row_stream stream(conn, st);
+            BOOST_TEST(stream.done());
+
+            auto r = fns.read_next(stream).get();
+            BOOST_TEST(r.empty());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(multiple_resultsets)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            execution_state st;
+            test_connection conn;
+            add_head(conn.stream(), 1);
+            conn.stream()
+                .add_bytes(create_text_row_message(3, "abc"))
+                .add_bytes(create_eof_frame(4, ok_builder().more_results(true).build()));
+            add_head(conn.stream(), 5);
+            conn.stream()
+                .add_bytes(create_text_row_message(7, "def"))
+                .add_bytes(create_eof_frame(8, ok_builder().build()));
+            conn.start_execution("CALL sp()", st);
+            test_row_stream stream(conn, st);
+
+            // 1st resultset
+            BOOST_TEST(fns.read_next(stream).get() == makerow("abc"));
+            BOOST_TEST(fns.read_next(stream).get().empty());
+            BOOST_TEST_REQUIRE(st.should_read_head());
+
+            // 2nd resultset
+            conn.read_resultset_head(st);
+            BOOST_TEST(!stream.done());
+            BOOST_TEST(fns.read_next(stream).get() == makerow("def"));
+            BOOST_TEST(fns.read_next(stream).get().empty());
+            BOOST_TEST(st.complete());
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(error)
+{
+    for (auto fns : all_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            execution_state st;
+            test_connection conn;
+            add_head(conn.stream(), 1);
+            conn.stream().add_bytes(err_builder()
+                                        .seqnum(3)
+                                        .code(common_server_errc::er_bad_db_error)
+                                        .message("my_message")
+                                        .build_frame());
+            conn.start_execution("SELECT 1", st);
+            test_row_stream stream(conn, st);
+
+            fns.read_next(stream).validate_error_exact(common_server_errc::er_bad_db_error, "my_message");
+        }
+    }
+}
+
+BOOST_AUTO_TEST_CASE(iterator_range)
+{
+    execution_state st;
+    test_connection conn;
+    add_head(conn.stream(), 1);
+    conn.stream()
+        .add_bytes(create_text_row_message(3, "abc"))
+        .add_break()
+        .add_bytes(create_text_row_message(4, "def"))
+        .add_bytes(create_eof_frame(5, ok_builder().build()));
+    conn.start_execution("SELECT 1", st);
+    test_row_stream stream(conn, st);
+
+    std::vector<row> rws;
+    for (row_view r : stream)
+        rws.emplace_back(r);
+
+    BOOST_TEST_REQUIRE(rws.size() == 2u);
+    BOOST_TEST(rws[0] == makerow("abc"));
+    BOOST_TEST(rws[1] == makerow("def"));
+    BOOST_TEST(st.complete());
+    BOOST_TEST((stream.begin() == stream.end()));
+}
+
+BOOST_AUTO_TEST_CASE(iterator_range_error)
+{
+    execution_state st;
+    test_connection conn;
+    add_head(conn.stream(), 1);
+    conn.stream().add_bytes(
+        err_builder().seqnum(3).code(common_server_errc::er_bad_db_error).message("my_message").build_frame()
+    );
+    conn.start_execution("SELECT 1", st);
+    test_row_stream stream(conn, st);
+
+    BOOST_CHECK_THROW(stream.begin(), error_with_diagnostics);
+}
+
+#ifdef BOOST_ASIO_HAS_CO_AWAIT
+BOOST_AUTO_TEST_CASE(coroutine_loop)
+{
+    execution_state st;
+    test_connection conn;
+    add_head(conn.stream(), 1);
+    conn.stream()
+        .add_bytes(create_text_row_message(3, "abc"))
+        .add_bytes(create_text_row_message(4, "def"))
+        .add_break()
+        .add_bytes(create_text_row_message(5, "ghi"))
+        .add_bytes(create_eof_frame(6, ok_builder().build()));
+    conn.start_execution("SELECT 1", st);
+    test_row_stream stream(conn, st);
+    std::vector<row> rws;
+
+    run_coroutine(conn.get_executor(), [&]() -> boost::asio::awaitable<void> {
+        for (;;)
+        {
+            row_view r = co_await stream.async_read_next(boost::asio::use_awaitable);
+            if (r.empty())
+                break;
+            rws.emplace_back(r);
+        }
+    });
+
+    BOOST_TEST_REQUIRE(rws.size() == 3u);
+    BOOST_TEST(rws[0] == makerow("abc"));
+    BOOST_TEST(rws[1] == makerow("def"));
+    BOOST_TEST(rws[2] == makerow("ghi"));
+    BOOST_TEST(st.complete());
+}
+#endif
+
+#ifdef BOOST_MYSQL_CXX14
+using static_row = std::tuple<std::string>;
+using test_static_row_stream = static_row_stream<test_stream, static_row, static_row>;
+using static_read_next_netm = netfun_maker_mem<static_row*, test_static_row_stream>;
+
+struct
+{
+    static_read_next_netm::signature read_next;
+    const char* name;
+} all_static_fns[] = {
+    {static_read_next_netm::sync_errc(&test_static_row_stream::read_next),        "sync" },
+    {static_read_next_netm::async_errinfo(&test_static_row_stream::async_read_next), "async"},
+};
+
+BOOST_AUTO_TEST_CASE(static_several_batches)
+{
+    for (auto fns : all_static_fns)
+    {
+        BOOST_TEST_CONTEXT(fns.name)
+        {
+            static_execution_state<static_row> st;
+            test_connection conn;
+            add_head(conn.stream(), 1);
+            conn.stream()
+                .add_bytes(create_text_row_message(3, "abc"))
+                .add_bytes(create_text_row_message(4, "def"))
+                .add_bytes(create_text_row_message(5, "ghi"))
+                .add_bytes(create_eof_frame(6, ok_builder().build()));
+            conn.start_execution("SELECT 1", st);
+
+            // A batch size of 2 forces two reads
+            test_static_row_stream stream(conn, st, 2);
+
+            auto r = fns.read_next(stream).get();
+            BOOST_TEST_REQUIRE(r != nullptr);
+            BOOST_TEST(std::get<0>(*r) == "abc");
+
+            r = fns.read_next(stream).get();
+            BOOST_TEST_REQUIRE(r != nullptr);
+            BOOST_TEST(std::get<0>(*r) == "def");
+
+            r = fns.read_next(stream).get();
+            BOOST_TEST_REQUIRE(r != nullptr);
+            BOOST_TEST(std::get<0>(*r) == "ghi");
+
+            r = fns.read_next(stream).get();
+            BOOST_TEST(r == nullptr);
+            BOOST_TEST(stream.done());
+            BOOST_TEST(st.complete());
+        }
+    }
+}
+#endif
+
+BOOST_AUTO_TEST_SUITE_END()
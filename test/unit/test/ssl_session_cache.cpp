@@ -0,0 +1,144 @@
+//
+// Copyright (c) 2019-2023 Ruben Perez Hidalgo (rubenperez038 at gmail dot com)
+//
+// Distributed under the Boost Software License, Version 1.0. (See accompanying
+// file LICENSE_1_0.txt or copy at http://www.boost.org/LICENSE_1_0.txt)
+//
+
+#include <boost/mysql/handshake_params.hpp>
+#include <boost/mysql/pool_params.hpp>
+#include <boost/mysql/ssl_session_cache.hpp>
+
+#include <boost/mysql/detail/access.hpp>
+
+#include <boost/asio/ssl/context.hpp>
+#include <boost/test/unit_test.hpp>
+
+#include <memory>
+
+using namespace boost::mysql;
+namespace net = boost::asio;
+
+BOOST_AUTO_TEST_SUITE(test_ssl_session_cache)
+
+struct ssl_deleter
+{
+    void operator()(SSL* ssl) const noexcept { SSL_free(ssl); }
+};
+using ssl_ptr = std::unique_ptr<SSL, ssl_deleter>;
+
+struct fixture
+{
+    net::ssl::context ctx{net::ssl::context::tls_client};
+    ssl_session_cache cache;
+    detail::ssl_session_cache_impl& impl{detail::access::get_impl(cache)};
+
+    ssl_ptr create_ssl() { return ssl_ptr(SSL_new(ctx.native_handle())); }
+
+    // Creates a SSL object with a session that can be resumed
+    ssl_ptr create_ssl_with_session(unsigned char id)
+    {
+        auto res = create_ssl();
+        SSL_SESSION* session = SSL_SESSION_new();
+        const unsigned char session_id[] = {id, 2, 3, 4};
+        BOOST_TEST_REQUIRE(SSL_SESSION_set1_id(session, session_id, sizeof(session_id)) == 1);
+        BOOST_TEST_REQUIRE(SSL_SESSION_set_protocol_version(session, TLS1_2_VERSION) == 1);
+        BOOST_TEST_REQUIRE(SSL_set_session(res.get(), session) == 1);
+        SSL_SESSION_free(session);
+        return res;
+    }
+
+    // Returns the first byte of the session ID offered by ssl
+    static unsigned char session_id(SSL* ssl)
+    {
+        unsigned int len = 0;
+        const unsigned char* id = SSL_SESSION_get_id(SSL_get_session(ssl), &len);
+        BOOST_TEST_REQUIRE(len > 0u);
+        return id[0];
+    }
+};
+
+BOOST_FIXTURE_TEST_CASE(default_ctor, fixture) { BOOST_TEST(cache.size() == 0u); }
+
+BOOST_FIXTURE_TEST_CASE(store_offer, fixture)
+{
+    impl.store(create_ssl_with_session(1).get(), "host:3306");
+    BOOST_TEST(cache.size() == 1u);
+
+    // Offered to the same server
+    auto ssl = create_ssl();
+    BOOST_TEST(impl.offer(ssl.get(), "host:3306"));
+    BOOST_TEST(session_id(ssl.get()) == 1u);
+
+    // Not offered to other servers
+    auto other = create_ssl();
+    BOOST_TEST(!impl.offer(other.get(), "host:3307"));
+    BOOST_TEST(SSL_get_session(other.get()) == nullptr);
+}
+
+BOOST_FIXTURE_TEST_CASE(store_replaces, fixture)
+{
+    impl.store(create_ssl_with_session(1).get(), "host:3306");
+    impl.store(create_ssl_with_session(2).get(), "host:3306");
+    BOOST_TEST(cache.size() == 1u);
+
+    auto ssl = create_ssl();
+    BOOST_TEST(impl.offer(ssl.get(), "host:3306"));
+    BOOST_TEST(session_id(ssl.get()) == 2u);
+}
+
+BOOST_FIXTURE_TEST_CASE(other_context, fixture)
+{
+    // Sessions are not offered to SSL objects created by other contexts
+    impl.store(create_ssl_with_session(1).get(), "host:3306");
+    net::ssl::context other_ctx{net::ssl::context::tls_client};
+    ssl_ptr ssl(SSL_new(other_ctx.native_handle()));
+    BOOST_TEST(!impl.offer(ssl.get(), "host:3306"));
+}
+
+BOOST_FIXTURE_TEST_CASE(no_session, fixture)
+{
+    // SSL objects without a negotiated session don't modify the cache
+    impl.store(create_ssl().get(), "host:3306");
+    BOOST_TEST(cache.size() == 0u);
+}
+
+BOOST_FIXTURE_TEST_CASE(empty_server_id, fixture)
+{
+    // If the server can't be identified, no session is stored or offered
+    impl.store(create_ssl_with_session(1).get(), "");
+    BOOST_TEST(cache.size() == 0u);
+    auto ssl = create_ssl();
+    BOOST_TEST(!impl.offer(ssl.get(), ""));
+}
+
+BOOST_FIXTURE_TEST_CASE(clear, fixture)
+{
+    impl.store(create_ssl_with_session(1).get(), "host:3306");
+    impl.store(create_ssl_with_session(2).get(), "other:3306");
+    BOOST_TEST(cache.size() == 2u);
+
+    cache.clear();
+    BOOST_TEST(cache.size() == 0u);
+    auto ssl = create_ssl();
+    BOOST_TEST(!impl.offer(ssl.get(), "host:3306"));
+}
+
+BOOST_AUTO_TEST_CASE(params)
+{
+    ssl_session_cache cache;
+
+    handshake_params hparams("user", "pass");
+    BOOST_TEST(hparams.ssl_sessions() == nullptr);
+    hparams.set_ssl_sessions(&cache);
+    BOOST_TEST(hparams.ssl_sessions() == &cache);
+
+    // Pools forward the cache to the connections they create
+    pool_params pparams("user", "pass");
+    BOOST_TEST(pparams.ssl_sessions() == nullptr);
+    pparams.set_ssl_sessions(&cache);
+    BOOST_TEST(pparams.ssl_sessions() == &cache);
+    BOOST_TEST(pparams.hparams().ssl_sessions() == &cache);
+}
+
+BOOST_AUTO_TEST_SUITE_END()
@@ -219,7 +219,8 @@ def _b2_build(
         '-j4',
         'libs/mysql/test',
         'libs/mysql/test/integration//boost_mysql_integrationtests',
-        'libs/mysql/example'
+        'libs/mysql/example',
+        'libs/mysql/bench'
     ])
 
 
@@ -318,6 +319,7 @@ def _cmake_build(
             '-DBOOST_MYSQL_INTEGRATION_TESTS=ON',
             '-DBOOST_MYSQL_VALGRIND_TESTS={}'.format(_cmake_bool(valgrind)),
             '-DBOOST_MYSQL_COVERAGE={}'.format(_cmake_bool(coverage)),
+            '-DBOOST_MYSQL_BENCH=ON',
             '-G',
             generator,
             '..'